@@ -36,21 +36,6 @@ export const APP_SPEC: AppSpec = {
         "no_op": "CALL"
       }
     },
-    "create()bool": {
-      "call_config": {
-        "no_op": "ALL"
-      }
-    },
-    "update()bool": {
-      "call_config": {
-        "update_application": "CALL"
-      }
-    },
-    "delete()bool": {
-      "call_config": {
-        "delete_application": "CALL"
-      }
-    },
     "set_service_contract_address(address)bool": {
       "call_config": {
         "no_op": "CALL"
@@ -66,7 +51,7 @@ export const APP_SPEC: AppSpec = {
         "no_op": "CALL"
       }
     },
-    "fund_pool(uint64,application,axfer)(uint64,uint64,bool)": {
+    "fund_pool(uint64,axfer)(uint64,uint64,bool)": {
       "call_config": {
         "no_op": "CALL"
       },
@@ -90,7 +75,7 @@ export const APP_SPEC: AppSpec = {
         }
       }
     },
-    "approve_pool_vote(axfer)(uint64,string)": {
+    "approve_pool_vote(uint64,bool,axfer)(uint64,string)": {
       "call_config": {
         "no_op": "CALL"
       },
@@ -110,6 +95,64 @@ export const APP_SPEC: AppSpec = {
         }
       }
     },
+    "get_vote_tallies(uint64[])(uint64,uint64,uint64)[]": {
+      "read_only": true,
+      "call_config": {
+        "no_op": "CALL"
+      }
+    },
+    "get_pool_totals(uint64[])(uint64,uint64)[]": {
+      "read_only": true,
+      "call_config": {
+        "no_op": "CALL"
+      }
+    },
+    "get_pool_deposits(account,uint64[])uint64[]": {
+      "read_only": true,
+      "call_config": {
+        "no_op": "CALL"
+      }
+    },
+    "create()bool": {
+      "call_config": {
+        "no_op": "ALL"
+      }
+    },
+    "update()bool": {
+      "call_config": {
+        "update_application": "CALL"
+      }
+    },
+    "delete()bool": {
+      "call_config": {
+        "delete_application": "CALL"
+      }
+    },
+    "add_admin(account)bool": {
+      "call_config": {
+        "no_op": "CALL"
+      }
+    },
+    "remove_admin(account)bool": {
+      "call_config": {
+        "no_op": "CALL"
+      }
+    },
+    "migrate_legacy_admins()uint64": {
+      "call_config": {
+        "no_op": "CALL"
+      }
+    },
+    "set_price_oracle(application,uint64)bool": {
+      "call_config": {
+        "no_op": "CALL"
+      }
+    },
+    "refresh_asset_prices(uint64[])bool": {
+      "call_config": {
+        "no_op": "CALL"
+      }
+    },
     "opt_contract_into_asset(asset)bool": {
       "call_config": {
         "no_op": "CALL"
@@ -122,12 +165,12 @@ export const APP_SPEC: AppSpec = {
     }
   },
   "source": {
-    "approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzbWFydF9jb250cmFjdHMuemFpYmF0c3VfYXV0aF9hbmRfZGFvLmNvbnRyYWN0LlphaWJhdHN1QXV0aEFuZERhby5hcHByb3ZhbF9wcm9ncmFtOgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2VudHJ5cG9pbnRAMgogICAgY2FsbHN1YiBfX2luaXRfXwoKbWFpbl9lbnRyeXBvaW50QDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjEzCiAgICAvLyBjbGFzcyBaYWliYXRzdUF1dGhBbmREYW8oWmFpYmF0c3VCYXNlKToKICAgIG1ldGhvZCAiaGVsbG8oc3RyaW5nKXN0cmluZyIKICAgIG1ldGhvZCAiY3JlYXRlKClib29sIgogICAgbWV0aG9kICJ1cGRhdGUoKWJvb2wiCiAgICBtZXRob2QgImRlbGV0ZSgpYm9vbCIKICAgIG1ldGhvZCAic2V0X3NlcnZpY2VfY29udHJhY3RfYWRkcmVzcyhhZGRyZXNzKWJvb2wiCiAgICBtZXRob2QgImNyZWF0ZV96YWliYXRzdV90b2tlbigpdWludDY0IgogICAgbWV0aG9kICJ0cmFuc2Zlcl96YWkoYWRkcmVzcyx1aW50NjQsc3RyaW5nKWJvb2wiCiAgICBtZXRob2QgImZ1bmRfcG9vbCh1aW50NjQsYXBwbGljYXRpb24sYXhmZXIpKHVpbnQ2NCx1aW50NjQsYm9vbCkiCiAgICBtZXRob2QgImFwcHJvdmVfcG9vbF92b3RlKGF4ZmVyKSh1aW50NjQsc3RyaW5nKSIKICAgIG1ldGhvZCAib3B0X2NvbnRyYWN0X2ludG9fYXNzZXQoYXNzZXQpYm9vbCIKICAgIG1ldGhvZCAidHJhbnNmZXJfYXNzZXQoYXNzZXQsdWludDY0LGFjY291bnQpYm9vbCIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIG1haW5faGVsbG9fcm91dGVAMyBtYWluX2NyZWF0ZV9yb3V0ZUA0IG1haW5fdXBkYXRlX3JvdXRlQDUgbWFpbl9kZWxldGVfcm91dGVANiBtYWluX3NldF9zZXJ2aWNlX2NvbnRyYWN0X2FkZHJlc3Nfcm91dGVANyBtYWluX2NyZWF0ZV96YWliYXRzdV90b2tlbl9yb3V0ZUA4IG1haW5fdHJhbnNmZXJfemFpX3JvdXRlQDkgbWFpbl9mdW5kX3Bvb2xfcm91dGVAMTAgbWFpbl9hcHByb3ZlX3Bvb2xfdm90ZV9yb3V0ZUAxMSBtYWluX29wdF9jb250cmFjdF9pbnRvX2Fzc2V0X3JvdXRlQDEyIG1haW5fdHJhbnNmZXJfYXNzZXRfcm91dGVAMTMKICAgIGVyciAvLyByZWplY3QgdHJhbnNhY3Rpb24KCm1haW5faGVsbG9fcm91dGVAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MTcKICAgIC8vIEBhNC5hYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToxMwogICAgLy8gY2xhc3MgWmFpYmF0c3VBdXRoQW5kRGFvKFphaWJhdHN1QmFzZSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjE3CiAgICAvLyBAYTQuYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgaGVsbG8KICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fY3JlYXRlX3JvdXRlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjIxCiAgICAvLyBAYTQuYWJpbWV0aG9kKGNyZWF0ZT0iYWxsb3ciKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICBjYWxsc3ViIGNyZWF0ZQogICAgYnl0ZSAweDAwCiAgICBpbnQgMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fdXBkYXRlX3JvdXRlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjI2CiAgICAvLyBAYTQuYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJVcGRhdGVBcHBsaWNhdGlvbiJdKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgaW50IFVwZGF0ZUFwcGxpY2F0aW9uCiAgICA9PQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBVcGRhdGVBcHBsaWNhdGlvbgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgdXBkYXRlCiAgICBieXRlIDB4MDAKICAgIGludCAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgYnl0ZSAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9kZWxldGVfcm91dGVANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MzUKICAgIC8vIEBhNC5hYmltZXRob2QoYWxsb3dfYWN0aW9ucz1bIkRlbGV0ZUFwcGxpY2F0aW9uIl0pCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBpbnQgRGVsZXRlQXBwbGljYXRpb24KICAgID09CiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIERlbGV0ZUFwcGxpY2F0aW9uCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBkZWxldGUKICAgIGJ5dGUgMHgwMAogICAgaW50IDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBieXRlIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX3NldF9zZXJ2aWNlX2NvbnRyYWN0X2FkZHJlc3Nfcm91dGVANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6NDEKICAgIC8vIEBhNC5hYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToxMwogICAgLy8gY2xhc3MgWmFpYmF0c3VBdXRoQW5kRGFvKFphaWJhdHN1QmFzZSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjQxCiAgICAvLyBAYTQuYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgc2V0X3NlcnZpY2VfY29udHJhY3RfYWRkcmVzcwogICAgYnl0ZSAweDAwCiAgICBpbnQgMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fY3JlYXRlX3phaWJhdHN1X3Rva2VuX3JvdXRlQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjQ3CiAgICAvLyBAYTQuYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgY3JlYXRlX3phaWJhdHN1X3Rva2VuCiAgICBieXRlIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX3RyYW5zZmVyX3phaV9yb3V0ZUA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weTo1MgogICAgLy8gQGE0LmFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjEzCiAgICAvLyBjbGFzcyBaYWliYXRzdUF1dGhBbmREYW8oWmFpYmF0c3VCYXNlKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6NTIKICAgIC8vIEBhNC5hYmltZXRob2QoKQogICAgY2FsbHN1YiB0cmFuc2Zlcl96YWkKICAgIGJ5dGUgMHgwMAogICAgaW50IDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBieXRlIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX2Z1bmRfcG9vbF9yb3V0ZUAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6NjgKICAgIC8vIEBhNC5hYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToxMwogICAgLy8gY2xhc3MgWmFpYmF0c3VBdXRoQW5kRGFvKFphaWJhdHN1QmFzZSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBidG9pCiAgICB0eG5hcyBBcHBsaWNhdGlvbnMKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnQgMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50IGF4ZmVyCiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgYXhmZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6NjgKICAgIC8vIEBhNC5hYmltZXRob2QoKQogICAgY2FsbHN1YiBmdW5kX3Bvb2wKICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fYXBwcm92ZV9wb29sX3ZvdGVfcm91dGVAMTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5Ojk1CiAgICAvLyBAYTQuYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MTMKICAgIC8vIGNsYXNzIFphaWJhdHN1QXV0aEFuZERhbyhaYWliYXRzdUJhc2UpOgogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludCAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnQgYXhmZXIKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBheGZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weTo5NQogICAgLy8gQGE0LmFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGFwcHJvdmVfcG9vbF92b3RlCiAgICBieXRlIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX29wdF9jb250cmFjdF9pbnRvX2Fzc2V0X3JvdXRlQDEyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MzYKICAgIC8vIEBhNC5hYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToxMwogICAgLy8gY2xhc3MgWmFpYmF0c3VBdXRoQW5kRGFvKFphaWJhdHN1QmFzZSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hcyBBc3NldHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjM2CiAgICAvLyBAYTQuYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgb3B0X2NvbnRyYWN0X2ludG9fYXNzZXQKICAgIGJ5dGUgMHgwMAogICAgaW50IDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBieXRlIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX3RyYW5zZmVyX2Fzc2V0X3JvdXRlQDEzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6NDEKICAgIC8vIEBhNC5hYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToxMwogICAgLy8gY2xhc3MgWmFpYmF0c3VBdXRoQW5kRGFvKFphaWJhdHN1QmFzZSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hcyBBc3NldHMKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGJ0b2kKICAgIHR4bmFzIEFjY291bnRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo0MQogICAgLy8gQGE0LmFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIHRyYW5zZmVyX2Fzc2V0CiAgICBieXRlIDB4MDAKICAgIGludCAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgYnl0ZSAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50IDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9hdXRoX2FuZF9kYW8uY29udHJhY3QuWmFpYmF0c3VBdXRoQW5kRGFvLmhlbGxvKG5hbWU6IGJ5dGVzKSAtPiBieXRlczoKaGVsbG86CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjE3LTE4CiAgICAvLyBAYTQuYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBoZWxsbyhzZWxmLCBuYW1lOiBhNC5TdHJpbmcpIC0+IGE0LlN0cmluZzoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToxOQogICAgLy8gcmV0dXJuICJIZWxsbywgIiArIG5hbWUKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAyIDAKICAgIGJ5dGUgMHg0ODY1NmM2YzZmMmMyMAogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2F1dGhfYW5kX2Rhby5jb250cmFjdC5aYWliYXRzdUF1dGhBbmREYW8uY3JlYXRlKCkgLT4gdWludDY0OgpjcmVhdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjIxLTIyCiAgICAvLyBAYTQuYWJpbWV0aG9kKGNyZWF0ZT0iYWxsb3ciKQogICAgLy8gZGVmIGNyZWF0ZShzZWxmKSAtPiBib29sOgogICAgcHJvdG8gMCAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjIzCiAgICAvLyBzZWxmLmFkbWlucy5hcHBlbmQoYTQuQWRkcmVzcyhhcC5UeG4uc2VuZGVyKSkKICAgIGludCAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToxMwogICAgLy8gc2VsZi5hZG1pbnM6IEFkZHJlc3NBcnJheSA9IEFkZHJlc3NBcnJheSgpCiAgICBieXRlICJhZG1pbnMiCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjIzCiAgICAvLyBzZWxmLmFkbWlucy5hcHBlbmQoYTQuQWRkcmVzcyhhcC5UeG4uc2VuZGVyKSkKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hZG1pbnMgZXhpc3RzCiAgICBleHRyYWN0IDIgMAogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBkdXAKICAgIGxlbgogICAgaW50IDMyCiAgICAvCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToxMwogICAgLy8gc2VsZi5hZG1pbnM6IEFkZHJlc3NBcnJheSA9IEFkZHJlc3NBcnJheSgpCiAgICBieXRlICJhZG1pbnMiCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjIzCiAgICAvLyBzZWxmLmFkbWlucy5hcHBlbmQoYTQuQWRkcmVzcyhhcC5UeG4uc2VuZGVyKSkKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjI0CiAgICAvLyByZXR1cm4gVHJ1ZQogICAgaW50IDEKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9hdXRoX2FuZF9kYW8uY29udHJhY3QuWmFpYmF0c3VBdXRoQW5kRGFvLnVwZGF0ZSgpIC0+IHVpbnQ2NDoKdXBkYXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToyNi0yNwogICAgLy8gQGE0LmFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiVXBkYXRlQXBwbGljYXRpb24iXSkKICAgIC8vIGRlZiB1cGRhdGUoc2VsZikgLT4gYm9vbDoKICAgIHByb3RvIDAgMQogICAgYnl0ZSAiIgogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjI4CiAgICAvLyBpZiBhcC5UeG4uc2VuZGVyID09IG9wLkdsb2JhbC5jcmVhdG9yX2FkZHJlc3M6CiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBieiB1cGRhdGVfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjI5CiAgICAvLyByZXR1cm4gVHJ1ZQogICAgaW50IDEKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgp1cGRhdGVfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weTozMAogICAgLy8gZm9yIGluZGV4IGluIGFwLnVyYW5nZShzZWxmLmFkbWlucy5sZW5ndGgpOgogICAgaW50IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjEzCiAgICAvLyBzZWxmLmFkbWluczogQWRkcmVzc0FycmF5ID0gQWRkcmVzc0FycmF5KCkKICAgIGJ5dGUgImFkbWlucyIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MzAKICAgIC8vIGZvciBpbmRleCBpbiBhcC51cmFuZ2Uoc2VsZi5hZG1pbnMubGVuZ3RoKToKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hZG1pbnMgZXhpc3RzCiAgICBpbnQgMAogICAgZXh0cmFjdF91aW50MTYKICAgIGZyYW1lX2J1cnkgMQogICAgaW50IDAKICAgIGZyYW1lX2J1cnkgMAoKdXBkYXRlX2Zvcl9oZWFkZXJAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MzAKICAgIC8vIGZvciBpbmRleCBpbiBhcC51cmFuZ2Uoc2VsZi5hZG1pbnMubGVuZ3RoKToKICAgIGZyYW1lX2RpZyAwCiAgICBmcmFtZV9kaWcgMQogICAgPAogICAgYnogdXBkYXRlX2FmdGVyX2ZvckA5CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjMxCiAgICAvLyBpZiBzZWxmLmFkbWluc1tpbmRleF0gPT0gYXAuVHhuLnNlbmRlcjoKICAgIGludCAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToxMwogICAgLy8gc2VsZi5hZG1pbnM6IEFkZHJlc3NBcnJheSA9IEFkZHJlc3NBcnJheSgpCiAgICBieXRlICJhZG1pbnMiCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjMxCiAgICAvLyBpZiBzZWxmLmFkbWluc1tpbmRleF0gPT0gYXAuVHhuLnNlbmRlcjoKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hZG1pbnMgZXhpc3RzCiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDAKICAgIGludCAzMgogICAgKgogICAgaW50IDMyCiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIHR4biBTZW5kZXIKICAgID09CiAgICBieiB1cGRhdGVfYWZ0ZXJfaWZfZWxzZUA2CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjMyCiAgICAvLyByZXR1cm4gVHJ1ZQogICAgaW50IDEKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgp1cGRhdGVfYWZ0ZXJfaWZfZWxzZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weTozMAogICAgLy8gZm9yIGluZGV4IGluIGFwLnVyYW5nZShzZWxmLmFkbWlucy5sZW5ndGgpOgogICAgZnJhbWVfZGlnIDAKICAgIGludCAxCiAgICArCiAgICBmcmFtZV9idXJ5IDAKICAgIGIgdXBkYXRlX2Zvcl9oZWFkZXJAMwoKdXBkYXRlX2FmdGVyX2ZvckA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weTozMwogICAgLy8gcmV0dXJuIEZhbHNlCiAgICBpbnQgMAogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfYXV0aF9hbmRfZGFvLmNvbnRyYWN0LlphaWJhdHN1QXV0aEFuZERhby5kZWxldGUoKSAtPiB1aW50NjQ6CmRlbGV0ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MzUtMzYKICAgIC8vIEBhNC5hYmltZXRob2QoYWxsb3dfYWN0aW9ucz1bIkRlbGV0ZUFwcGxpY2F0aW9uIl0pCiAgICAvLyBkZWYgZGVsZXRlKHNlbGYpIC0+IGJvb2w6CiAgICBwcm90byAwIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MzcKICAgIC8vIGlmIGFwLlR4bi5zZW5kZXIgPT0gb3AuR2xvYmFsLmNyZWF0b3JfYWRkcmVzczoKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIGJ6IGRlbGV0ZV9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MzgKICAgIC8vIHJldHVybiBUcnVlCiAgICBpbnQgMQogICAgcmV0c3ViCgpkZWxldGVfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weTozOQogICAgLy8gcmV0dXJuIEZhbHNlCiAgICBpbnQgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2F1dGhfYW5kX2Rhby5jb250cmFjdC5aYWliYXRzdUF1dGhBbmREYW8uc2V0X3NlcnZpY2VfY29udHJhY3RfYWRkcmVzcyhhZGRyZXNzOiBieXRlcykgLT4gdWludDY0OgpzZXRfc2VydmljZV9jb250cmFjdF9hZGRyZXNzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weTo0MS00MgogICAgLy8gQGE0LmFiaW1ldGhvZCgpCiAgICAvLyBkZWYgc2V0X3NlcnZpY2VfY29udHJhY3RfYWRkcmVzcyhzZWxmLCBhZGRyZXNzOiBhNC5BZGRyZXNzKSAtPiBib29sOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjQzCiAgICAvLyBzZWxmLmF1dGhvcmlzZV90eG4oKQogICAgY2FsbHN1YiBhdXRob3Jpc2VfdHhuCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjQ0CiAgICAvLyBzZWxmLnNlcnZpY2VfY29udHJhY3RfYWRkcmVzcyA9IGFkZHJlc3MKICAgIGJ5dGUgInNlcnZpY2VfY29udHJhY3RfYWRkcmVzcyIKICAgIGZyYW1lX2RpZyAtMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6NDUKICAgIC8vIHJldHVybiBUcnVlCiAgICBpbnQgMQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2Jhc2UuY29udHJhY3QuWmFpYmF0c3VCYXNlLmF1dGhvcmlzZV90eG4oKSAtPiB2b2lkOgphdXRob3Jpc2VfdHhuOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6NjgtNjkKICAgIC8vIEBhcC5zdWJyb3V0aW5lCiAgICAvLyBkZWYgYXV0aG9yaXNlX3R4bihzZWxmKSAtPiBOb25lOgogICAgcHJvdG8gMCAwCiAgICBieXRlICIiCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjcwCiAgICAvLyBpc19hdXRob3Jpc2VkID0gYTQuQm9vbCgpCiAgICBieXRlIDB4MDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjcxCiAgICAvLyBpZiBhcC5UeG4uc2VuZGVyID09IG9wLkdsb2JhbC5jcmVhdG9yX2FkZHJlc3M6CiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBieiBhdXRob3Jpc2VfdHhuX2Vsc2VfYm9keUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo3MgogICAgLy8gaXNfYXV0aG9yaXNlZCA9IGE0LkJvb2woVHJ1ZSkgICMgbm9xYTogRkJUMDAzCiAgICBieXRlIDB4ODAKICAgIGZyYW1lX2J1cnkgMgogICAgYiBhdXRob3Jpc2VfdHhuX2FmdGVyX2lmX2Vsc2VAMTAKCmF1dGhvcmlzZV90eG5fZWxzZV9ib2R5QDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo3NAogICAgLy8gZm9yIGluZGV4IGluIGFwLnVyYW5nZShzZWxmLmFkbWlucy5sZW5ndGgpOgogICAgaW50IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjEzCiAgICAvLyBzZWxmLmFkbWluczogQWRkcmVzc0FycmF5ID0gQWRkcmVzc0FycmF5KCkKICAgIGJ5dGUgImFkbWlucyIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5Ojc0CiAgICAvLyBmb3IgaW5kZXggaW4gYXAudXJhbmdlKHNlbGYuYWRtaW5zLmxlbmd0aCk6CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWRtaW5zIGV4aXN0cwogICAgaW50IDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBmcmFtZV9idXJ5IDEKICAgIGludCAwCiAgICBmcmFtZV9idXJ5IDAKCmF1dGhvcmlzZV90eG5fZm9yX2hlYWRlckAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6NzQKICAgIC8vIGZvciBpbmRleCBpbiBhcC51cmFuZ2Uoc2VsZi5hZG1pbnMubGVuZ3RoKToKICAgIGZyYW1lX2RpZyAwCiAgICBmcmFtZV9kaWcgMQogICAgPAogICAgYnogYXV0aG9yaXNlX3R4bl9hZnRlcl9pZl9lbHNlQDEwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo3NQogICAgLy8gaWYgc2VsZi5hZG1pbnNbaW5kZXhdID09IGFwLlR4bi5zZW5kZXI6CiAgICBpbnQgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTMKICAgIC8vIHNlbGYuYWRtaW5zOiBBZGRyZXNzQXJyYXkgPSBBZGRyZXNzQXJyYXkoKQogICAgYnl0ZSAiYWRtaW5zIgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6NzUKICAgIC8vIGlmIHNlbGYuYWRtaW5zW2luZGV4XSA9PSBhcC5UeG4uc2VuZGVyOgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFkbWlucyBleGlzdHMKICAgIGV4dHJhY3QgMiAwCiAgICBmcmFtZV9kaWcgMAogICAgaW50IDMyCiAgICAqCiAgICBpbnQgMzIKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgdHhuIFNlbmRlcgogICAgPT0KICAgIGJ6IGF1dGhvcmlzZV90eG5fYWZ0ZXJfaWZfZWxzZUA2CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo3NgogICAgLy8gaXNfYXV0aG9yaXNlZCA9IGE0LkJvb2woVHJ1ZSkgICMgbm9xYTogRkJUMDAzCiAgICBieXRlIDB4ODAKICAgIGZyYW1lX2J1cnkgMgoKYXV0aG9yaXNlX3R4bl9hZnRlcl9pZl9lbHNlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo3NAogICAgLy8gZm9yIGluZGV4IGluIGFwLnVyYW5nZShzZWxmLmFkbWlucy5sZW5ndGgpOgogICAgZnJhbWVfZGlnIDAKICAgIGludCAxCiAgICArCiAgICBmcmFtZV9idXJ5IDAKICAgIGIgYXV0aG9yaXNlX3R4bl9mb3JfaGVhZGVyQDMKCmF1dGhvcmlzZV90eG5fYWZ0ZXJfaWZfZWxzZUAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5Ojc3CiAgICAvLyBhc3NlcnQgaXNfYXV0aG9yaXNlZCwgIllvdSBhcmUgbm90IGF1dGhvcmlzZWQgdG8gcGVyZm9ybSB0aGlzIGFjdGlvbiIKICAgIGZyYW1lX2RpZyAyCiAgICBieXRlIDB4MDAKICAgICE9CiAgICBhc3NlcnQgLy8gWW91IGFyZSBub3QgYXV0aG9yaXNlZCB0byBwZXJmb3JtIHRoaXMgYWN0aW9uCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfYXV0aF9hbmRfZGFvLmNvbnRyYWN0LlphaWJhdHN1QXV0aEFuZERhby5jcmVhdGVfemFpYmF0c3VfdG9rZW4oKSAtPiBieXRlczoKY3JlYXRlX3phaWJhdHN1X3Rva2VuOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weTo0Ny00OAogICAgLy8gQGE0LmFiaW1ldGhvZCgpCiAgICAvLyBkZWYgY3JlYXRlX3phaWJhdHN1X3Rva2VuKHNlbGYpIC0+IGE0LlVJbnQ2NDoKICAgIHByb3RvIDAgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weTo0OQogICAgLy8gc2VsZi5oYW5kbGVfY3JlYXRlX3phaV90b2tlbigpCiAgICBjYWxsc3ViIGhhbmRsZV9jcmVhdGVfemFpX3Rva2VuCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjUwCiAgICAvLyByZXR1cm4gc2VsZi5nZXRfemFpX3Rva2VuKCkKICAgIGNhbGxzdWIgZ2V0X3phaV90b2tlbgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2F1dGhfYW5kX2Rhby5jb250cmFjdC5aYWliYXRzdUF1dGhBbmREYW8uaGFuZGxlX2NyZWF0ZV96YWlfdG9rZW4oKSAtPiB2b2lkOgpoYW5kbGVfY3JlYXRlX3phaV90b2tlbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MTExLTExMgogICAgLy8gQGFwLnN1YnJvdXRpbmUKICAgIC8vIGRlZiBoYW5kbGVfY3JlYXRlX3phaV90b2tlbihzZWxmKSAtPiBOb25lOgogICAgcHJvdG8gMCAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjExMwogICAgLy8gYm94ID0gb3AuQm94LmdldChiIlpBSSIpCiAgICBieXRlIDB4NWE0MTQ5CiAgICBib3hfZ2V0CiAgICBidXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MTE0CiAgICAvLyBpZiBub3QgYm94WzFdOgogICAgYm56IGhhbmRsZV9jcmVhdGVfemFpX3Rva2VuX2FmdGVyX2lmX2Vsc2VAMwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToxMjIKICAgIC8vIG1hbmFnZXI9YXAuR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjEyMy0xMjUKICAgIC8vIHJlc2VydmU9YXAuR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vIGZyZWV6ZT1hcC5HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gY2xhd2JhY2s9YXAuR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGR1cG4gMwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToxMjcKICAgIC8vIGFzc2V0X3R4bi5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgaXR4bl9maWVsZCBDb25maWdBc3NldENsYXdiYWNrCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0RnJlZXplCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0UmVzZXJ2ZQogICAgaXR4bl9maWVsZCBDb25maWdBc3NldE1hbmFnZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MTIxCiAgICAvLyBhc3NldF9uYW1lPSJaQUkiLAogICAgYnl0ZSAiWkFJIgogICAgaXR4bl9maWVsZCBDb25maWdBc3NldE5hbWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MTIwCiAgICAvLyB1bml0X25hbWU9IlpBSSIsCiAgICBieXRlICJaQUkiCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0VW5pdE5hbWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MTE5CiAgICAvLyB1cmw9Imh0dHBzOi8vcmVzLmNsb3VkaW5hcnkuY29tL2Rldi1tZWRpYS9pbWFnZS91cGxvYWQvdjE3MjIwMTE4NjcvWmFpYmF0c3Vfel8xMjM0X0NpcmNsZV95anQ0OWMucG5nIiwKICAgIGJ5dGUgImh0dHBzOi8vcmVzLmNsb3VkaW5hcnkuY29tL2Rldi1tZWRpYS9pbWFnZS91cGxvYWQvdjE3MjIwMTE4NjcvWmFpYmF0c3Vfel8xMjM0X0NpcmNsZV95anQ0OWMucG5nIgogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFVSTAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToxMTgKICAgIC8vIHRvdGFsPTFfMDAwXzAwMF8wMDBfMDAwLAogICAgaW50IDEwMDAwMDAwMDAwMDAKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRUb3RhbAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToxMTcKICAgIC8vIGRlY2ltYWxzPTYsCiAgICBpbnQgNgogICAgaXR4bl9maWVsZCBDb25maWdBc3NldERlY2ltYWxzCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjExNQogICAgLy8gYXNzZXRfdHhuID0gYXAuaXR4bi5Bc3NldENvbmZpZygKICAgIGludCBhY2ZnCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjExNgogICAgLy8gZmVlPTEwMDAsCiAgICBpbnQgMTAwMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MTI3CiAgICAvLyBhc3NldF90eG4uc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjEyOAogICAgLy8gYXNzZXRfaWQgPSBvcC5JVHhuLmNyZWF0ZWRfYXNzZXRfaWQoKS5pZAogICAgaXR4biBDcmVhdGVkQXNzZXRJRAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToxMjkKICAgIC8vIG9wLkJveC5wdXQoYiJaQUkiLCBhNC5VSW50NjQoYXNzZXRfaWQpLmJ5dGVzKQogICAgaXRvYgogICAgYnl0ZSAweDVhNDE0OQogICAgc3dhcAogICAgYm94X3B1dAoKaGFuZGxlX2NyZWF0ZV96YWlfdG9rZW5fYWZ0ZXJfaWZfZWxzZUAzOgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2F1dGhfYW5kX2Rhby5jb250cmFjdC5aYWliYXRzdUF1dGhBbmREYW8uZ2V0X3phaV90b2tlbigpIC0+IGJ5dGVzOgpnZXRfemFpX3Rva2VuOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToxMzEtMTMyCiAgICAvLyBAYXAuc3Vicm91dGluZQogICAgLy8gZGVmIGdldF96YWlfdG9rZW4oc2VsZikgLT4gYTQuVUludDY0OgogICAgcHJvdG8gMCAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjEzMwogICAgLy8gYm94X2RhdGEsIGV4aXN0cyA9IG9wLkJveC5nZXQoYiJaQUkiKQogICAgYnl0ZSAweDVhNDE0OQogICAgYm94X2dldAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToxMzUKICAgIC8vIGlmIG5vdCBleGlzdHM6CiAgICBibnogZ2V0X3phaV90b2tlbl9lbHNlX2JvZHlAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToxMzYKICAgIC8vIHNlbGYuaGFuZGxlX2NyZWF0ZV96YWlfdG9rZW4oKQogICAgY2FsbHN1YiBoYW5kbGVfY3JlYXRlX3phaV90b2tlbgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToxMzcKICAgIC8vIGJveF9kYXRhLCBleGlzdHMgPSBvcC5Cb3guZ2V0KGIiWkFJIikKICAgIGJ5dGUgMHg1YTQxNDkKICAgIGJveF9nZXQKICAgIHBvcAogICAgYiBnZXRfemFpX3Rva2VuX2FmdGVyX2lmX2Vsc2VAMwoKZ2V0X3phaV90b2tlbl9lbHNlX2JvZHlAMjoKICAgIGZyYW1lX2RpZyAwCgpnZXRfemFpX3Rva2VuX2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MTQxCiAgICAvLyByZXR1cm4gemFpX2Fzc2V0X2lkCiAgICBzd2FwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfYXV0aF9hbmRfZGFvLmNvbnRyYWN0LlphaWJhdHN1QXV0aEFuZERhby50cmFuc2Zlcl96YWkodG86IGJ5dGVzLCBhc3NldF9hbW91bnQ6IGJ5dGVzLCBub3RlOiBieXRlcykgLT4gdWludDY0Ogp0cmFuc2Zlcl96YWk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjUyLTU1CiAgICAvLyBAYTQuYWJpbWV0aG9kKCkKICAgIC8vIGRlZiB0cmFuc2Zlcl96YWkoCiAgICAvLyAgICAgc2VsZiwgdG86IGE0LkFkZHJlc3MsIGFzc2V0X2Ftb3VudDogYTQuVUludDY0LCBub3RlOiBhNC5TdHJpbmcKICAgIC8vICkgLT4gYm9vbDoKICAgIHByb3RvIDMgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weTo1NgogICAgLy8gc2VsZi5hdXRob3Jpc2VfdHhuKCkKICAgIGNhbGxzdWIgYXV0aG9yaXNlX3R4bgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weTo1NwogICAgLy8gemFpX2Fzc2V0X2lkID0gc2VsZi5nZXRfemFpX3Rva2VuKCkKICAgIGNhbGxzdWIgZ2V0X3phaV90b2tlbgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weTo2MQogICAgLy8gYXNzZXRfYW1vdW50PWFzc2V0X2Ftb3VudC5uYXRpdmUsCiAgICBmcmFtZV9kaWcgLTIKICAgIGJ0b2kKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6NjIKICAgIC8vIHhmZXJfYXNzZXQ9emFpX2Fzc2V0X2lkLm5hdGl2ZSwKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6NjMKICAgIC8vIG5vdGU9bm90ZS5uYXRpdmUsCiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjY1CiAgICAvLyB0eG4uc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIGl0eG5fZmllbGQgTm90ZQogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIGl0eG5fZmllbGQgQXNzZXRBbW91bnQKICAgIGZyYW1lX2RpZyAtMwogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjU4CiAgICAvLyB0eG4gPSBhcC5pdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBpbnQgYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6NTkKICAgIC8vIGZlZT0xMDAwLAogICAgaW50IDEwMDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjY1CiAgICAvLyB0eG4uc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjY2CiAgICAvLyByZXR1cm4gVHJ1ZQogICAgaW50IDEKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9hdXRoX2FuZF9kYW8uY29udHJhY3QuWmFpYmF0c3VBdXRoQW5kRGFvLmZ1bmRfcG9vbChmdW5kX2Ftb3VudDogdWludDY0LCBmb2xrc19mZWVkX29yYWNsZTogdWludDY0LCB0eG46IHVpbnQ2NCkgLT4gYnl0ZXM6CmZ1bmRfcG9vbDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6NjgtNzQKICAgIC8vIEBhNC5hYmltZXRob2QoKQogICAgLy8gZGVmIGZ1bmRfcG9vbCgKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIGZ1bmRfYW1vdW50OiBhcC5VSW50NjQsCiAgICAvLyAgICAgZm9sa3NfZmVlZF9vcmFjbGU6IGFwLkFwcGxpY2F0aW9uLAogICAgLy8gICAgIHR4bjogZ3R4bi5Bc3NldFRyYW5zZmVyVHJhbnNhY3Rpb24sCiAgICAvLyApIC0+IFBvb2xGdW5kUmVzcG9uc2U6CiAgICBwcm90byAzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6NzYKICAgIC8vIGFzc2V0X2RvbGxhcl9wcmljZSA9IHNlbGYuZ2V0X2Fzc2V0X3ByaWNlKGZvbGtzX2ZlZWRfb3JhY2xlLCB0eG4ueGZlcl9hc3NldCkKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgWGZlckFzc2V0CiAgICBmcmFtZV9kaWcgLTIKICAgIHN3YXAKICAgIGNhbGxzdWIgZ2V0X2Fzc2V0X3ByaWNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5Ojc4CiAgICAvLyB0eG4uYXNzZXRfcmVjZWl2ZXIgPT0gc2VsZi5zZXJ2aWNlX2NvbnRyYWN0X2FkZHJlc3MubmF0aXZlCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIEFzc2V0UmVjZWl2ZXIKICAgIGludCAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjQ0CiAgICAvLyBzZWxmLnNlcnZpY2VfY29udHJhY3RfYWRkcmVzcyA9IGFkZHJlc3MKICAgIGJ5dGUgInNlcnZpY2VfY29udHJhY3RfYWRkcmVzcyIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6NzgKICAgIC8vIHR4bi5hc3NldF9yZWNlaXZlciA9PSBzZWxmLnNlcnZpY2VfY29udHJhY3RfYWRkcmVzcy5uYXRpdmUKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zZXJ2aWNlX2NvbnRyYWN0X2FkZHJlc3MgZXhpc3RzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weTo3Ny03OQogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICB0eG4uYXNzZXRfcmVjZWl2ZXIgPT0gc2VsZi5zZXJ2aWNlX2NvbnRyYWN0X2FkZHJlc3MubmF0aXZlCiAgICAvLyApLCAiVGhlIGFzc2V0X3JlY2VpdmVyIG11dCBiZSB0aGUgWmFpYmF0c3VTZXJ2aWNlIGFjY291bnQiCiAgICBhc3NlcnQgLy8gVGhlIGFzc2V0X3JlY2VpdmVyIG11dCBiZSB0aGUgWmFpYmF0c3VTZXJ2aWNlIGFjY291bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6ODEtODMKICAgIC8vIGFtb3VudF9wbHVzX3RyYW5zYWN0aW9uX2ZlZSA9IHNlbGYuY2FsY3VsYXRlX2FtdF9wbHVzX2ZlZSgKICAgIC8vICAgICBmdW5kX2Ftb3VudCwgYXAuVUludDY0KDEpCiAgICAvLyApCiAgICBmcmFtZV9kaWcgLTMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6ODIKICAgIC8vIGZ1bmRfYW1vdW50LCBhcC5VSW50NjQoMSkKICAgIGludCAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjgxLTgzCiAgICAvLyBhbW91bnRfcGx1c190cmFuc2FjdGlvbl9mZWUgPSBzZWxmLmNhbGN1bGF0ZV9hbXRfcGx1c19mZWUoCiAgICAvLyAgICAgZnVuZF9hbW91bnQsIGFwLlVJbnQ2NCgxKQogICAgLy8gKQogICAgY2FsbHN1YiBjYWxjdWxhdGVfYW10X3BsdXNfZmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5Ojg1CiAgICAvLyB0eG4uYXNzZXRfYW1vdW50ID49IGFtb3VudF9wbHVzX3RyYW5zYWN0aW9uX2ZlZQogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBBc3NldEFtb3VudAogICAgPD0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6ODQtODYKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgdHhuLmFzc2V0X2Ftb3VudCA+PSBhbW91bnRfcGx1c190cmFuc2FjdGlvbl9mZWUKICAgIC8vICksICJUaGUgdHhuIGFtb3VudCBpcyBpbnN1ZmZpY2llbnQiCiAgICBhc3NlcnQgLy8gVGhlIHR4biBhbW91bnQgaXMgaW5zdWZmaWNpZW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5Ojg5CiAgICAvLyBhbW91bnQ9YTQuVUludDY0KGZ1bmRfYW1vdW50KSwKICAgIGZyYW1lX2RpZyAtMwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weTo5MQogICAgLy8gYXNzZXRfcHJpY2U9YTQuVUludDY0KGFzc2V0X2RvbGxhcl9wcmljZSksCiAgICBzd2FwCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5Ojg4LTkyCiAgICAvLyByZXNwb25zZSA9IFBvb2xGdW5kUmVzcG9uc2UoCiAgICAvLyAgICAgYW1vdW50PWE0LlVJbnQ2NChmdW5kX2Ftb3VudCksCiAgICAvLyAgICAgc3VjY2Vzcz1hNC5Cb29sKFRydWUpLCAgIyBub3FhOiBGQlQwMDMKICAgIC8vICAgICBhc3NldF9wcmljZT1hNC5VSW50NjQoYXNzZXRfZG9sbGFyX3ByaWNlKSwKICAgIC8vICkKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weTo5MAogICAgLy8gc3VjY2Vzcz1hNC5Cb29sKFRydWUpLCAgIyBub3FhOiBGQlQwMDMKICAgIGJ5dGUgMHg4MAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weTo4OC05MgogICAgLy8gcmVzcG9uc2UgPSBQb29sRnVuZFJlc3BvbnNlKAogICAgLy8gICAgIGFtb3VudD1hNC5VSW50NjQoZnVuZF9hbW91bnQpLAogICAgLy8gICAgIHN1Y2Nlc3M9YTQuQm9vbChUcnVlKSwgICMgbm9xYTogRkJUMDAzCiAgICAvLyAgICAgYXNzZXRfcHJpY2U9YTQuVUludDY0KGFzc2V0X2RvbGxhcl9wcmljZSksCiAgICAvLyApCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6OTMKICAgIC8vIHJldHVybiByZXNwb25zZQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2Jhc2UuY29udHJhY3QuWmFpYmF0c3VCYXNlLmdldF9hc3NldF9wcmljZShmb2xrc19mZWVkX29yYWNsZTogdWludDY0LCBhc2E6IHVpbnQ2NCkgLT4gdWludDY0OgpnZXRfYXNzZXRfcHJpY2U6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToxMjAtMTIzCiAgICAvLyBAYXAuc3Vicm91dGluZQogICAgLy8gZGVmIGdldF9hc3NldF9wcmljZSgKICAgIC8vICAgICBzZWxmLCBmb2xrc19mZWVkX29yYWNsZTogYXAuQXBwbGljYXRpb24sIGFzYTogYXAuQXNzZXQKICAgIC8vICkgLT4gYXAuVUludDY0OgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToxMjQKICAgIC8vIFt2YWx1ZSwgZXhpc3RzXSA9IG9wLkFwcEdsb2JhbC5nZXRfZXhfYnl0ZXMoZm9sa3NfZmVlZF9vcmFjbGUsIG9wLml0b2IoYXNhLmlkKSkKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgZnJhbWVfZGlnIC0yCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTI1CiAgICAvLyBhc3NlcnQgZXhpc3RzLCAiVGhpcyBhc2V0IGlzIG5vdCBzdXBwb3J0ZWQiCiAgICBhc3NlcnQgLy8gVGhpcyBhc2V0IGlzIG5vdCBzdXBwb3J0ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjEyNgogICAgLy8gcmV0dXJuIG9wLmV4dHJhY3RfdWludDY0KHZhbHVlLCBhcC5VSW50NjQoMCkpCiAgICBpbnQgMAogICAgZXh0cmFjdF91aW50NjQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9iYXNlLmNvbnRyYWN0LlphaWJhdHN1QmFzZS5jYWxjdWxhdGVfYW10X3BsdXNfZmVlKGFtdDogdWludDY0LCBtdWx0aXBsZXM6IHVpbnQ2NCkgLT4gdWludDY0OgpjYWxjdWxhdGVfYW10X3BsdXNfZmVlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTEzLTExNAogICAgLy8gQGFwLnN1YnJvdXRpbmUKICAgIC8vIGRlZiBjYWxjdWxhdGVfYW10X3BsdXNfZmVlKHNlbGYsIGFtdDogYXAuVUludDY0LCBtdWx0aXBsZXM6IGFwLlVJbnQ2NCkgLT4gYXAuVUludDY0OgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToxMTUKICAgIC8vIGZlZV9wZXJjZW50YWdlID0gYXAuVUludDY0KDEwKSAqIG11bHRpcGxlcwogICAgaW50IDEwCiAgICBmcmFtZV9kaWcgLTEKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjExNgogICAgLy8gbXVsdGlwbGllZCA9IGZlZV9wZXJjZW50YWdlICogYW10CiAgICBmcmFtZV9kaWcgLTIKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjExNwogICAgLy8gaGFsZl9wZXJjZW50ID0gbXVsdGlwbGllZCAvLyAxMDAwCiAgICBpbnQgMTAwMAogICAgLwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTE4CiAgICAvLyByZXR1cm4gaGFsZl9wZXJjZW50CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfYXV0aF9hbmRfZGFvLmNvbnRyYWN0LlphaWJhdHN1QXV0aEFuZERhby5hcHByb3ZlX3Bvb2xfdm90ZSh0eG46IHVpbnQ2NCkgLT4gYnl0ZXM6CmFwcHJvdmVfcG9vbF92b3RlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weTo5NS05OQogICAgLy8gQGE0LmFiaW1ldGhvZCgpCiAgICAvLyBkZWYgYXBwcm92ZV9wb29sX3ZvdGUoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICB0eG46IGd0eG4uQXNzZXRUcmFuc2ZlclRyYW5zYWN0aW9uLAogICAgLy8gKSAtPiBQb29sVm90ZUFwcHJvdmFsUmVzcG9uc2U6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MTAwCiAgICAvLyB6YWlfYXNzZXRfaWQgPSBzZWxmLmdldF96YWlfdG9rZW4oKQogICAgY2FsbHN1YiBnZXRfemFpX3Rva2VuCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjEwMgogICAgLy8gdHhuLnhmZXJfYXNzZXQuaWQgPT0gemFpX2Fzc2V0X2lkLm5hdGl2ZQogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBYZmVyQXNzZXQKICAgIHN3YXAKICAgIGJ0b2kKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjEwMS0xMDMKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgdHhuLnhmZXJfYXNzZXQuaWQgPT0gemFpX2Fzc2V0X2lkLm5hdGl2ZQogICAgLy8gKSwgIlRoZSBhc3NldCB0cmFuc2ZlcmVkIG11c3QgYmUgdGhlIHBvb2wgdG9rZW4iCiAgICBhc3NlcnQgLy8gVGhlIGFzc2V0IHRyYW5zZmVyZWQgbXVzdCBiZSB0aGUgcG9vbCB0b2tlbgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToxMDYKICAgIC8vIG11bHRpcGxpZXI9YTQuVUludDY0KHR4bi5hc3NldF9hbW91bnQpLAogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBBc3NldEFtb3VudAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToxMDcKICAgIC8vIHR4bl9pZD1hNC5TdHJpbmcuZnJvbV9ieXRlcyh0eG4udHhuX2lkKSwKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgVHhJRAogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToxMDUtMTA4CiAgICAvLyByZXNwb25zZSA9IFBvb2xWb3RlQXBwcm92YWxSZXNwb25zZSgKICAgIC8vICAgICBtdWx0aXBsaWVyPWE0LlVJbnQ2NCh0eG4uYXNzZXRfYW1vdW50KSwKICAgIC8vICAgICB0eG5faWQ9YTQuU3RyaW5nLmZyb21fYnl0ZXModHhuLnR4bl9pZCksCiAgICAvLyApCiAgICBieXRlIDB4MDAwYQogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MTA5CiAgICAvLyByZXR1cm4gcmVzcG9uc2UKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9iYXNlLmNvbnRyYWN0LlphaWJhdHN1QmFzZS5vcHRfY29udHJhY3RfaW50b19hc3NldChhc3NldDogdWludDY0KSAtPiB1aW50NjQ6Cm9wdF9jb250cmFjdF9pbnRvX2Fzc2V0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MzYtMzcKICAgIC8vIEBhNC5hYmltZXRob2QoKQogICAgLy8gZGVmIG9wdF9jb250cmFjdF9pbnRvX2Fzc2V0KHNlbGYsIGFzc2V0OiBhcC5Bc3NldCkgLT4gYm9vbDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MzgKICAgIC8vIHNlbGYub3B0X2FwcF9pbnRvX2Fzc2V0KGFzc2V0KQogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIG9wdF9hcHBfaW50b19hc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MzkKICAgIC8vIHJldHVybiBUcnVlCiAgICBpbnQgMQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2Jhc2UuY29udHJhY3QuWmFpYmF0c3VCYXNlLm9wdF9hcHBfaW50b19hc3NldChhc3NldDogdWludDY0KSAtPiB2b2lkOgpvcHRfYXBwX2ludG9fYXNzZXQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo1NS01OQogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjICAgU3Vicm91dGluZXMgICAgIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQGFwLnN1YnJvdXRpbmUKICAgIC8vIGRlZiBvcHRfYXBwX2ludG9fYXNzZXQoc2VsZiwgYXNzZXQ6IGFwLkFzc2V0KSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo2NAogICAgLy8gYXNzZXRfcmVjZWl2ZXI9YXAuR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo2NgogICAgLy8gdHhuLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIGZyYW1lX2RpZyAtMQogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjYxCiAgICAvLyBhc3NldF9hbW91bnQ9MCwKICAgIGludCAwCiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo2MAogICAgLy8gdHhuID0gYXAuaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgaW50IGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo2MgogICAgLy8gZmVlPTEwMDAsCiAgICBpbnQgMTAwMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjY2CiAgICAvLyB0eG4uc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfYmFzZS5jb250cmFjdC5aYWliYXRzdUJhc2UudHJhbnNmZXJfYXNzZXQoYXNzZXQ6IHVpbnQ2NCwgYXNzZXRfYW1vdW50OiB1aW50NjQsIHJlY2lwaWVudDogYnl0ZXMpIC0+IHVpbnQ2NDoKdHJhbnNmZXJfYXNzZXQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo0MS00NAogICAgLy8gQGE0LmFiaW1ldGhvZCgpCiAgICAvLyBkZWYgdHJhbnNmZXJfYXNzZXQoCiAgICAvLyAgICAgc2VsZiwgYXNzZXQ6IGFwLkFzc2V0LCBhc3NldF9hbW91bnQ6IGFwLlVJbnQ2NCwgcmVjaXBpZW50OiBhcC5BY2NvdW50CiAgICAvLyApIC0+IGJvb2w6CiAgICBwcm90byAzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjQ1CiAgICAvLyBzZWxmLmF1dGhvcmlzZV90eG4oKQogICAgY2FsbHN1YiBhdXRob3Jpc2VfdHhuCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo1MgogICAgLy8gdHhuLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0eG5fZmllbGQgQXNzZXRBbW91bnQKICAgIGZyYW1lX2RpZyAtMQogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICBmcmFtZV9kaWcgLTMKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo0NgogICAgLy8gdHhuID0gYXAuaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgaW50IGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo0NwogICAgLy8gZmVlPTEwMDAsCiAgICBpbnQgMTAwMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjUyCiAgICAvLyB0eG4uc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo1MwogICAgLy8gcmV0dXJuIFRydWUKICAgIGludCAxCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfYXV0aF9hbmRfZGFvLmNvbnRyYWN0LlphaWJhdHN1QXV0aEFuZERhby5fX2luaXRfXygpIC0+IHZvaWQ6Cl9faW5pdF9fOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToxNAogICAgLy8gZGVmIF9faW5pdF9fKHNlbGYpIC0+IE5vbmU6CiAgICBwcm90byAwIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MTUKICAgIC8vIHNlbGYuemFpX3Rva2VuX2Fzc2V0X2lkOiBhNC5VSW50NjQgPSBhNC5VSW50NjQoKQogICAgYnl0ZSAiemFpX3Rva2VuX2Fzc2V0X2lkIgogICAgYnl0ZSAweDAwMDAwMDAwMDAwMDAwMDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIK",
-    "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzbWFydF9jb250cmFjdHMuemFpYmF0c3VfYXV0aF9hbmRfZGFvLmNvbnRyYWN0LlphaWJhdHN1QXV0aEFuZERhby5jbGVhcl9zdGF0ZV9wcm9ncmFtOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToxMwogICAgLy8gY2xhc3MgWmFpYmF0c3VBdXRoQW5kRGFvKFphaWJhdHN1QmFzZSk6CiAgICBpbnQgMQogICAgcmV0dXJuCg=="
+    "approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzbWFydF9jb250cmFjdHMuemFpYmF0c3VfYXV0aF9hbmRfZGFvLmNvbnRyYWN0LlphaWJhdHN1QXV0aEFuZERhby5hcHByb3ZhbF9wcm9ncmFtOgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2VudHJ5cG9pbnRAMgogICAgY2FsbHN1YiBfX2luaXRfXwoKbWFpbl9lbnRyeXBvaW50QDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjI2CiAgICAvLyBjbGFzcyBaYWliYXRzdUF1dGhBbmREYW8oWmFpYmF0c3VCYXNlKToKICAgIG1ldGhvZCAiaGVsbG8oc3RyaW5nKXN0cmluZyIKICAgIG1ldGhvZCAic2V0X3NlcnZpY2VfY29udHJhY3RfYWRkcmVzcyhhZGRyZXNzKWJvb2wiCiAgICBtZXRob2QgImNyZWF0ZV96YWliYXRzdV90b2tlbigpdWludDY0IgogICAgbWV0aG9kICJ0cmFuc2Zlcl96YWkoYWRkcmVzcyx1aW50NjQsc3RyaW5nKWJvb2wiCiAgICBtZXRob2QgImZ1bmRfcG9vbCh1aW50NjQsYXhmZXIpKHVpbnQ2NCx1aW50NjQsYm9vbCkiCiAgICBtZXRob2QgImFwcHJvdmVfcG9vbF92b3RlKHVpbnQ2NCxib29sLGF4ZmVyKSh1aW50NjQsc3RyaW5nKSIKICAgIG1ldGhvZCAiZ2V0X3ZvdGVfdGFsbGllcyh1aW50NjRbXSkodWludDY0LHVpbnQ2NCx1aW50NjQpW10iCiAgICBtZXRob2QgImdldF9wb29sX3RvdGFscyh1aW50NjRbXSkodWludDY0LHVpbnQ2NClbXSIKICAgIG1ldGhvZCAiZ2V0X3Bvb2xfZGVwb3NpdHMoYWNjb3VudCx1aW50NjRbXSl1aW50NjRbXSIKICAgIG1ldGhvZCAiY3JlYXRlKClib29sIgogICAgbWV0aG9kICJ1cGRhdGUoKWJvb2wiCiAgICBtZXRob2QgImRlbGV0ZSgpYm9vbCIKICAgIG1ldGhvZCAiYWRkX2FkbWluKGFjY291bnQpYm9vbCIKICAgIG1ldGhvZCAicmVtb3ZlX2FkbWluKGFjY291bnQpYm9vbCIKICAgIG1ldGhvZCAibWlncmF0ZV9sZWdhY3lfYWRtaW5zKCl1aW50NjQiCiAgICBtZXRob2QgInNldF9wcmljZV9vcmFjbGUoYXBwbGljYXRpb24sdWludDY0KWJvb2wiCiAgICBtZXRob2QgInJlZnJlc2hfYXNzZXRfcHJpY2VzKHVpbnQ2NFtdKWJvb2wiCiAgICBtZXRob2QgIm9wdF9jb250cmFjdF9pbnRvX2Fzc2V0KGFzc2V0KWJvb2wiCiAgICBtZXRob2QgInRyYW5zZmVyX2Fzc2V0KGFzc2V0LHVpbnQ2NCxhY2NvdW50KWJvb2wiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtYWluX2hlbGxvX3JvdXRlQDMgbWFpbl9zZXRfc2VydmljZV9jb250cmFjdF9hZGRyZXNzX3JvdXRlQDQgbWFpbl9jcmVhdGVfemFpYmF0c3VfdG9rZW5fcm91dGVANSBtYWluX3RyYW5zZmVyX3phaV9yb3V0ZUA2IG1haW5fZnVuZF9wb29sX3JvdXRlQDcgbWFpbl9hcHByb3ZlX3Bvb2xfdm90ZV9yb3V0ZUA4IG1haW5fZ2V0X3ZvdGVfdGFsbGllc19yb3V0ZUA5IG1haW5fZ2V0X3Bvb2xfdG90YWxzX3JvdXRlQDEwIG1haW5fZ2V0X3Bvb2xfZGVwb3NpdHNfcm91dGVAMTEgbWFpbl9jcmVhdGVfcm91dGVAMTIgbWFpbl91cGRhdGVfcm91dGVAMTMgbWFpbl9kZWxldGVfcm91dGVAMTQgbWFpbl9hZGRfYWRtaW5fcm91dGVAMTUgbWFpbl9yZW1vdmVfYWRtaW5fcm91dGVAMTYgbWFpbl9taWdyYXRlX2xlZ2FjeV9hZG1pbnNfcm91dGVAMTcgbWFpbl9zZXRfcHJpY2Vfb3JhY2xlX3JvdXRlQDE4IG1haW5fcmVmcmVzaF9hc3NldF9wcmljZXNfcm91dGVAMTkgbWFpbl9vcHRfY29udHJhY3RfaW50b19hc3NldF9yb3V0ZUAyMCBtYWluX3RyYW5zZmVyX2Fzc2V0X3JvdXRlQDIxCiAgICBlcnIgLy8gcmVqZWN0IHRyYW5zYWN0aW9uCgptYWluX2hlbGxvX3JvdXRlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjMxCiAgICAvLyBAYTQuYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MjYKICAgIC8vIGNsYXNzIFphaWJhdHN1QXV0aEFuZERhbyhaYWliYXRzdUJhc2UpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weTozMQogICAgLy8gQGE0LmFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGhlbGxvCiAgICBieXRlIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX3NldF9zZXJ2aWNlX2NvbnRyYWN0X2FkZHJlc3Nfcm91dGVANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MzUKICAgIC8vIEBhNC5hYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToyNgogICAgLy8gY2xhc3MgWmFpYmF0c3VBdXRoQW5kRGFvKFphaWJhdHN1QmFzZSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjM1CiAgICAvLyBAYTQuYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgc2V0X3NlcnZpY2VfY29udHJhY3RfYWRkcmVzcwogICAgYnl0ZSAweDAwCiAgICBpbnQgMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fY3JlYXRlX3phaWJhdHN1X3Rva2VuX3JvdXRlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjQxCiAgICAvLyBAYTQuYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgY3JlYXRlX3phaWJhdHN1X3Rva2VuCiAgICBieXRlIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX3RyYW5zZmVyX3phaV9yb3V0ZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weTo1MgogICAgLy8gQGE0LmFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjI2CiAgICAvLyBjbGFzcyBaYWliYXRzdUF1dGhBbmREYW8oWmFpYmF0c3VCYXNlKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6NTIKICAgIC8vIEBhNC5hYmltZXRob2QoKQogICAgY2FsbHN1YiB0cmFuc2Zlcl96YWkKICAgIGJ5dGUgMHgwMAogICAgaW50IDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBieXRlIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX2Z1bmRfcG9vbF9yb3V0ZUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weTo2OAogICAgLy8gQGE0LmFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjI2CiAgICAvLyBjbGFzcyBaYWliYXRzdUF1dGhBbmREYW8oWmFpYmF0c3VCYXNlKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnQgMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50IGF4ZmVyCiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgYXhmZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6NjgKICAgIC8vIEBhNC5hYmltZXRob2QoKQogICAgY2FsbHN1YiBmdW5kX3Bvb2wKICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fYXBwcm92ZV9wb29sX3ZvdGVfcm91dGVAODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MTIwCiAgICAvLyBAYTQuYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MjYKICAgIC8vIGNsYXNzIFphaWJhdHN1QXV0aEFuZERhbyhaYWliYXRzdUJhc2UpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgaW50IDAKICAgIGdldGJpdAogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludCAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnQgYXhmZXIKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBheGZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToxMjAKICAgIC8vIEBhNC5hYmltZXRob2QoKQogICAgY2FsbHN1YiBhcHByb3ZlX3Bvb2xfdm90ZQogICAgYnl0ZSAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9nZXRfdm90ZV90YWxsaWVzX3JvdXRlQDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjE2NAogICAgLy8gQGE0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToyNgogICAgLy8gY2xhc3MgWmFpYmF0c3VBdXRoQW5kRGFvKFphaWJhdHN1QmFzZSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjE2NAogICAgLy8gQGE0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfdm90ZV90YWxsaWVzCiAgICBieXRlIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX2dldF9wb29sX3RvdGFsc19yb3V0ZUAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MTc4CiAgICAvLyBAYTQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjI2CiAgICAvLyBjbGFzcyBaYWliYXRzdUF1dGhBbmREYW8oWmFpYmF0c3VCYXNlKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MTc4CiAgICAvLyBAYTQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGdldF9wb29sX3RvdGFscwogICAgYnl0ZSAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9nZXRfcG9vbF9kZXBvc2l0c19yb3V0ZUAxMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MTkyCiAgICAvLyBAYTQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjI2CiAgICAvLyBjbGFzcyBaYWliYXRzdUF1dGhBbmREYW8oWmFpYmF0c3VCYXNlKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmFzIEFjY291bnRzCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjE5MgogICAgLy8gQGE0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfcG9vbF9kZXBvc2l0cwogICAgYnl0ZSAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9jcmVhdGVfcm91dGVAMTI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToyNgogICAgLy8gQGE0LmFiaW1ldGhvZChjcmVhdGU9ImFsbG93IikKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgY2FsbHN1YiBjcmVhdGUKICAgIGJ5dGUgMHgwMAogICAgaW50IDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBieXRlIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX3VwZGF0ZV9yb3V0ZUAxMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjMwCiAgICAvLyBAYTQuYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJVcGRhdGVBcHBsaWNhdGlvbiJdKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgaW50IFVwZGF0ZUFwcGxpY2F0aW9uCiAgICA9PQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBVcGRhdGVBcHBsaWNhdGlvbgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgdXBkYXRlCiAgICBieXRlIDB4MDAKICAgIGludCAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgYnl0ZSAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9kZWxldGVfcm91dGVAMTQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTozNAogICAgLy8gQGE0LmFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiRGVsZXRlQXBwbGljYXRpb24iXSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIGludCBEZWxldGVBcHBsaWNhdGlvbgogICAgPT0KICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgRGVsZXRlQXBwbGljYXRpb24KICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIGRlbGV0ZQogICAgYnl0ZSAweDAwCiAgICBpbnQgMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fYWRkX2FkbWluX3JvdXRlQDE1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6NDAKICAgIC8vIEBhNC5hYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToyNgogICAgLy8gY2xhc3MgWmFpYmF0c3VBdXRoQW5kRGFvKFphaWJhdHN1QmFzZSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hcyBBY2NvdW50cwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6NDAKICAgIC8vIEBhNC5hYmltZXRob2QoKQogICAgY2FsbHN1YiBhZGRfYWRtaW4KICAgIGJ5dGUgMHgwMAogICAgaW50IDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBieXRlIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX3JlbW92ZV9hZG1pbl9yb3V0ZUAxNjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjQ5CiAgICAvLyBAYTQuYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MjYKICAgIC8vIGNsYXNzIFphaWJhdHN1QXV0aEFuZERhbyhaYWliYXRzdUJhc2UpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYXMgQWNjb3VudHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjQ5CiAgICAvLyBAYTQuYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgcmVtb3ZlX2FkbWluCiAgICBieXRlIDB4MDAKICAgIGludCAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgYnl0ZSAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9taWdyYXRlX2xlZ2FjeV9hZG1pbnNfcm91dGVAMTc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo1NAogICAgLy8gQGE0LmFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIG1pZ3JhdGVfbGVnYWN5X2FkbWlucwogICAgaXRvYgogICAgYnl0ZSAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9zZXRfcHJpY2Vfb3JhY2xlX3JvdXRlQDE4OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6NzgKICAgIC8vIEBhNC5hYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToyNgogICAgLy8gY2xhc3MgWmFpYmF0c3VBdXRoQW5kRGFvKFphaWJhdHN1QmFzZSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hcyBBcHBsaWNhdGlvbnMKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5Ojc4CiAgICAvLyBAYTQuYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgc2V0X3ByaWNlX29yYWNsZQogICAgYnl0ZSAweDAwCiAgICBpbnQgMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fcmVmcmVzaF9hc3NldF9wcmljZXNfcm91dGVAMTk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo5MwogICAgLy8gQGE0LmFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjI2CiAgICAvLyBjbGFzcyBaYWliYXRzdUF1dGhBbmREYW8oWmFpYmF0c3VCYXNlKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjkzCiAgICAvLyBAYTQuYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgcmVmcmVzaF9hc3NldF9wcmljZXMKICAgIGJ5dGUgMHgwMAogICAgaW50IDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBieXRlIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX29wdF9jb250cmFjdF9pbnRvX2Fzc2V0X3JvdXRlQDIwOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTA2CiAgICAvLyBAYTQuYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MjYKICAgIC8vIGNsYXNzIFphaWJhdHN1QXV0aEFuZERhbyhaYWliYXRzdUJhc2UpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYXMgQXNzZXRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToxMDYKICAgIC8vIEBhNC5hYmltZXRob2QoKQogICAgY2FsbHN1YiBvcHRfY29udHJhY3RfaW50b19hc3NldAogICAgYnl0ZSAweDAwCiAgICBpbnQgMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fdHJhbnNmZXJfYXNzZXRfcm91dGVAMjE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToxMTEKICAgIC8vIEBhNC5hYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToyNgogICAgLy8gY2xhc3MgWmFpYmF0c3VBdXRoQW5kRGFvKFphaWJhdHN1QmFzZSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hcyBBc3NldHMKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGJ0b2kKICAgIHR4bmFzIEFjY291bnRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToxMTEKICAgIC8vIEBhNC5hYmltZXRob2QoKQogICAgY2FsbHN1YiB0cmFuc2Zlcl9hc3NldAogICAgYnl0ZSAweDAwCiAgICBpbnQgMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfYXV0aF9hbmRfZGFvLmNvbnRyYWN0LlphaWJhdHN1QXV0aEFuZERhby5oZWxsbyhuYW1lOiBieXRlcykgLT4gYnl0ZXM6CmhlbGxvOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weTozMS0zMgogICAgLy8gQGE0LmFiaW1ldGhvZCgpCiAgICAvLyBkZWYgaGVsbG8oc2VsZiwgbmFtZTogYTQuU3RyaW5nKSAtPiBhNC5TdHJpbmc6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MzMKICAgIC8vIHJldHVybiAiSGVsbG8sICIgKyBuYW1lCiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgMiAwCiAgICBieXRlIDB4NDg2NTZjNmM2ZjJjMjAKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9hdXRoX2FuZF9kYW8uY29udHJhY3QuWmFpYmF0c3VBdXRoQW5kRGFvLnNldF9zZXJ2aWNlX2NvbnRyYWN0X2FkZHJlc3MoYWRkcmVzczogYnl0ZXMpIC0+IHVpbnQ2NDoKc2V0X3NlcnZpY2VfY29udHJhY3RfYWRkcmVzczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MzUtMzYKICAgIC8vIEBhNC5hYmltZXRob2QoKQogICAgLy8gZGVmIHNldF9zZXJ2aWNlX2NvbnRyYWN0X2FkZHJlc3Moc2VsZiwgYWRkcmVzczogYTQuQWRkcmVzcykgLT4gYm9vbDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weTozNwogICAgLy8gc2VsZi5hdXRob3Jpc2VfdHhuKCkKICAgIGNhbGxzdWIgYXV0aG9yaXNlX3R4bgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weTozOAogICAgLy8gc2VsZi5zZXJ2aWNlX2NvbnRyYWN0X2FkZHJlc3MgPSBhZGRyZXNzCiAgICBieXRlICJzZXJ2aWNlX2NvbnRyYWN0X2FkZHJlc3MiCiAgICBmcmFtZV9kaWcgLTEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjM5CiAgICAvLyByZXR1cm4gVHJ1ZQogICAgaW50IDEKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9iYXNlLmNvbnRyYWN0LlphaWJhdHN1QmFzZS5hdXRob3Jpc2VfdHhuKCkgLT4gdm9pZDoKYXV0aG9yaXNlX3R4bjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjEzOC0xMzkKICAgIC8vIEBhcC5zdWJyb3V0aW5lCiAgICAvLyBkZWYgYXV0aG9yaXNlX3R4bihzZWxmKSAtPiBOb25lOgogICAgcHJvdG8gMCAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToxNDEKICAgIC8vIGFwLlR4bi5zZW5kZXIKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjE0MC0xNDIKICAgIC8vIGFzc2VydCBzZWxmLmlzX2FkbWluKAogICAgLy8gICAgIGFwLlR4bi5zZW5kZXIKICAgIC8vICksICJZb3UgYXJlIG5vdCBhdXRob3Jpc2VkIHRvIHBlcmZvcm0gdGhpcyBhY3Rpb24iCiAgICBjYWxsc3ViIGlzX2FkbWluCiAgICBhc3NlcnQgLy8gWW91IGFyZSBub3QgYXV0aG9yaXNlZCB0byBwZXJmb3JtIHRoaXMgYWN0aW9uCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfYmFzZS5jb250cmFjdC5aYWliYXRzdUJhc2UuaXNfYWRtaW4oYWNjb3VudDogYnl0ZXMpIC0+IHVpbnQ2NDoKaXNfYWRtaW46CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToxNDgtMTQ5CiAgICAvLyBAYXAuc3Vicm91dGluZQogICAgLy8gZGVmIGlzX2FkbWluKHNlbGYsIGFjY291bnQ6IGFwLkFjY291bnQpIC0+IGJvb2w6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjE1MAogICAgLy8gaWYgYWNjb3VudCA9PSBvcC5HbG9iYWwuY3JlYXRvcl9hZGRyZXNzOgogICAgZnJhbWVfZGlnIC0xCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBieiBpc19hZG1pbl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjE1MQogICAgLy8gcmV0dXJuIFRydWUKICAgIGludCAxCiAgICByZXRzdWIKCmlzX2FkbWluX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjE1MgogICAgLy8gX2xlbmd0aCwgZXhpc3RzID0gb3AuQm94Lmxlbmd0aChzZWxmLmFkbWluX2tleShhY2NvdW50KSkKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBhZG1pbl9rZXkKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTUzCiAgICAvLyByZXR1cm4gZXhpc3RzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfYmFzZS5jb250cmFjdC5aYWliYXRzdUJhc2UuYWRtaW5fa2V5KGFjY291bnQ6IGJ5dGVzKSAtPiBieXRlczoKYWRtaW5fa2V5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTQ0LTE0NQogICAgLy8gQGFwLnN1YnJvdXRpbmUKICAgIC8vIGRlZiBhZG1pbl9rZXkoc2VsZiwgYWNjb3VudDogYXAuQWNjb3VudCkgLT4gYXAuQnl0ZXM6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjE0NgogICAgLy8gcmV0dXJuIG9wLmNvbmNhdChBRE1JTl9LRVlfUFJFRklYLCBhY2NvdW50LmJ5dGVzKQogICAgYnl0ZSAweDQxCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2F1dGhfYW5kX2Rhby5jb250cmFjdC5aYWliYXRzdUF1dGhBbmREYW8uY3JlYXRlX3phaWJhdHN1X3Rva2VuKCkgLT4gYnl0ZXM6CmNyZWF0ZV96YWliYXRzdV90b2tlbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6NDEtNDIKICAgIC8vIEBhNC5hYmltZXRob2QoKQogICAgLy8gZGVmIGNyZWF0ZV96YWliYXRzdV90b2tlbihzZWxmKSAtPiBhNC5VSW50NjQ6CiAgICBwcm90byAwIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6NDkKICAgIC8vIHNlbGYuaGFuZGxlX2NyZWF0ZV96YWlfdG9rZW4oKQogICAgY2FsbHN1YiBoYW5kbGVfY3JlYXRlX3phaV90b2tlbgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weTo1MAogICAgLy8gcmV0dXJuIHNlbGYuZ2V0X3phaV90b2tlbigpCiAgICBjYWxsc3ViIGdldF96YWlfdG9rZW4KICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9hdXRoX2FuZF9kYW8uY29udHJhY3QuWmFpYmF0c3VBdXRoQW5kRGFvLmhhbmRsZV9jcmVhdGVfemFpX3Rva2VuKCkgLT4gdm9pZDoKaGFuZGxlX2NyZWF0ZV96YWlfdG9rZW46CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjI0Ny0yNDgKICAgIC8vIEBhcC5zdWJyb3V0aW5lCiAgICAvLyBkZWYgaGFuZGxlX2NyZWF0ZV96YWlfdG9rZW4oc2VsZikgLT4gTm9uZToKICAgIHByb3RvIDAgMAogICAgaW50IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MjQ5CiAgICAvLyBpZiBzZWxmLnphaV90b2tlbl9hc3NldF9pZC5uYXRpdmU6CiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MjkKICAgIC8vIHNlbGYuemFpX3Rva2VuX2Fzc2V0X2lkOiBhNC5VSW50NjQgPSBhNC5VSW50NjQoKQogICAgYnl0ZSAiemFpX3Rva2VuX2Fzc2V0X2lkIgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToyNDkKICAgIC8vIGlmIHNlbGYuemFpX3Rva2VuX2Fzc2V0X2lkLm5hdGl2ZToKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi56YWlfdG9rZW5fYXNzZXRfaWQgZXhpc3RzCiAgICBidG9pCiAgICBieiBoYW5kbGVfY3JlYXRlX3phaV90b2tlbl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MjUwCiAgICAvLyByZXR1cm4KICAgIHJldHN1YgoKaGFuZGxlX2NyZWF0ZV96YWlfdG9rZW5fYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToyNTEKICAgIC8vIFtib3hfZGF0YSwgZXhpc3RzXSA9IG9wLkJveC5nZXQoTEVHQUNZX1pBSV9UT0tFTl9LRVkpCiAgICBieXRlIDB4NWE0MTQ5CiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MjUyCiAgICAvLyBpZiBleGlzdHM6CiAgICBieiBoYW5kbGVfY3JlYXRlX3phaV90b2tlbl9lbHNlX2JvZHlANAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToyOQogICAgLy8gc2VsZi56YWlfdG9rZW5fYXNzZXRfaWQ6IGE0LlVJbnQ2NCA9IGE0LlVJbnQ2NCgpCiAgICBieXRlICJ6YWlfdG9rZW5fYXNzZXRfaWQiCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjI1MwogICAgLy8gc2VsZi56YWlfdG9rZW5fYXNzZXRfaWQgPSBhNC5VSW50NjQuZnJvbV9ieXRlcyhib3hfZGF0YSkKICAgIGZyYW1lX2RpZyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToyNTQKICAgIC8vIG9wLkJveC5kZWxldGUoTEVHQUNZX1pBSV9UT0tFTl9LRVkpCiAgICBieXRlIDB4NWE0MTQ5CiAgICBib3hfZGVsCiAgICBwb3AKICAgIGIgaGFuZGxlX2NyZWF0ZV96YWlfdG9rZW5fYWZ0ZXJfaWZfZWxzZUA2CgpoYW5kbGVfY3JlYXRlX3phaV90b2tlbl9lbHNlX2JvZHlANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MjYzCiAgICAvLyBtYW5hZ2VyPWFwLkdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToyNjQtMjY2CiAgICAvLyByZXNlcnZlPWFwLkdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyBmcmVlemU9YXAuR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vIGNsYXdiYWNrPWFwLkdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICBkdXBuIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MjY4CiAgICAvLyBhc3NldF90eG4uc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRDbGF3YmFjawogICAgaXR4bl9maWVsZCBDb25maWdBc3NldEZyZWV6ZQogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFJlc2VydmUKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRNYW5hZ2VyCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjI2MgogICAgLy8gYXNzZXRfbmFtZT0iWkFJIiwKICAgIGJ5dGUgIlpBSSIKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXROYW1lCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjI2MQogICAgLy8gdW5pdF9uYW1lPSJaQUkiLAogICAgYnl0ZSAiWkFJIgogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFVuaXROYW1lCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjI2MAogICAgLy8gdXJsPSJodHRwczovL3Jlcy5jbG91ZGluYXJ5LmNvbS9kZXYtbWVkaWEvaW1hZ2UvdXBsb2FkL3YxNzIyMDExODY3L1phaWJhdHN1X3pfMTIzNF9DaXJjbGVfeWp0NDljLnBuZyIsCiAgICBieXRlICJodHRwczovL3Jlcy5jbG91ZGluYXJ5LmNvbS9kZXYtbWVkaWEvaW1hZ2UvdXBsb2FkL3YxNzIyMDExODY3L1phaWJhdHN1X3pfMTIzNF9DaXJjbGVfeWp0NDljLnBuZyIKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRVUkwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MjU5CiAgICAvLyB0b3RhbD0xXzAwMF8wMDBfMDAwXzAwMCwKICAgIGludCAxMDAwMDAwMDAwMDAwCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0VG90YWwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MjU4CiAgICAvLyBkZWNpbWFscz02LAogICAgaW50IDYKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXREZWNpbWFscwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToyNTYKICAgIC8vIGFzc2V0X3R4biA9IGFwLml0eG4uQXNzZXRDb25maWcoCiAgICBpbnQgYWNmZwogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToyNTcKICAgIC8vIGZlZT0wLAogICAgaW50IDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjI2OAogICAgLy8gYXNzZXRfdHhuLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToyNjkKICAgIC8vIGFzc2V0X2lkID0gb3AuSVR4bi5jcmVhdGVkX2Fzc2V0X2lkKCkuaWQKICAgIGl0eG4gQ3JlYXRlZEFzc2V0SUQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MjcwCiAgICAvLyBzZWxmLnphaV90b2tlbl9hc3NldF9pZCA9IGE0LlVJbnQ2NChhc3NldF9pZCkKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MjkKICAgIC8vIHNlbGYuemFpX3Rva2VuX2Fzc2V0X2lkOiBhNC5VSW50NjQgPSBhNC5VSW50NjQoKQogICAgYnl0ZSAiemFpX3Rva2VuX2Fzc2V0X2lkIgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToyNzAKICAgIC8vIHNlbGYuemFpX3Rva2VuX2Fzc2V0X2lkID0gYTQuVUludDY0KGFzc2V0X2lkKQogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKCmhhbmRsZV9jcmVhdGVfemFpX3Rva2VuX2FmdGVyX2lmX2Vsc2VANjoKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9hdXRoX2FuZF9kYW8uY29udHJhY3QuWmFpYmF0c3VBdXRoQW5kRGFvLmdldF96YWlfdG9rZW4oKSAtPiBieXRlczoKZ2V0X3phaV90b2tlbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MjcyLTI3MwogICAgLy8gQGFwLnN1YnJvdXRpbmUKICAgIC8vIGRlZiBnZXRfemFpX3Rva2VuKHNlbGYpIC0+IGE0LlVJbnQ2NDoKICAgIHByb3RvIDAgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToyNzUKICAgIC8vIHNlbGYuemFpX3Rva2VuX2Fzc2V0X2lkLm5hdGl2ZQogICAgaW50IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MjkKICAgIC8vIHNlbGYuemFpX3Rva2VuX2Fzc2V0X2lkOiBhNC5VSW50NjQgPSBhNC5VSW50NjQoKQogICAgYnl0ZSAiemFpX3Rva2VuX2Fzc2V0X2lkIgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToyNzUKICAgIC8vIHNlbGYuemFpX3Rva2VuX2Fzc2V0X2lkLm5hdGl2ZQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnphaV90b2tlbl9hc3NldF9pZCBleGlzdHMKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6Mjc0LTI3NgogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBzZWxmLnphaV90b2tlbl9hc3NldF9pZC5uYXRpdmUKICAgIC8vICksICJUaGUgWkFJIHRva2VuIGhhcyBub3QgYmVlbiBjcmVhdGVkLCBjYWxsIGNyZWF0ZV96YWliYXRzdV90b2tlbiIKICAgIGFzc2VydCAvLyBUaGUgWkFJIHRva2VuIGhhcyBub3QgYmVlbiBjcmVhdGVkLCBjYWxsIGNyZWF0ZV96YWliYXRzdV90b2tlbgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToyNzcKICAgIC8vIHJldHVybiBzZWxmLnphaV90b2tlbl9hc3NldF9pZAogICAgaW50IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MjkKICAgIC8vIHNlbGYuemFpX3Rva2VuX2Fzc2V0X2lkOiBhNC5VSW50NjQgPSBhNC5VSW50NjQoKQogICAgYnl0ZSAiemFpX3Rva2VuX2Fzc2V0X2lkIgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToyNzcKICAgIC8vIHJldHVybiBzZWxmLnphaV90b2tlbl9hc3NldF9pZAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnphaV90b2tlbl9hc3NldF9pZCBleGlzdHMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9hdXRoX2FuZF9kYW8uY29udHJhY3QuWmFpYmF0c3VBdXRoQW5kRGFvLnRyYW5zZmVyX3phaSh0bzogYnl0ZXMsIGFzc2V0X2Ftb3VudDogYnl0ZXMsIG5vdGU6IGJ5dGVzKSAtPiB1aW50NjQ6CnRyYW5zZmVyX3phaToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6NTItNTUKICAgIC8vIEBhNC5hYmltZXRob2QoKQogICAgLy8gZGVmIHRyYW5zZmVyX3phaSgKICAgIC8vICAgICBzZWxmLCB0bzogYTQuQWRkcmVzcywgYXNzZXRfYW1vdW50OiBhNC5VSW50NjQsIG5vdGU6IGE0LlN0cmluZwogICAgLy8gKSAtPiBib29sOgogICAgcHJvdG8gMyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjU2CiAgICAvLyBzZWxmLmF1dGhvcmlzZV90eG4oKQogICAgY2FsbHN1YiBhdXRob3Jpc2VfdHhuCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjU3CiAgICAvLyB6YWlfYXNzZXRfaWQgPSBzZWxmLmdldF96YWlfdG9rZW4oKQogICAgY2FsbHN1YiBnZXRfemFpX3Rva2VuCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjYxCiAgICAvLyBhc3NldF9hbW91bnQ9YXNzZXRfYW1vdW50Lm5hdGl2ZSwKICAgIGZyYW1lX2RpZyAtMgogICAgYnRvaQogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weTo2MgogICAgLy8geGZlcl9hc3NldD16YWlfYXNzZXRfaWQubmF0aXZlLAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weTo2MwogICAgLy8gbm90ZT1ub3RlLm5hdGl2ZSwKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6NjUKICAgIC8vIHR4bi5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgaXR4bl9maWVsZCBOb3RlCiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgZnJhbWVfZGlnIC0zCiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6NTgKICAgIC8vIHR4biA9IGFwLml0eG4uQXNzZXRUcmFuc2ZlcigKICAgIGludCBheGZlcgogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weTo1OQogICAgLy8gZmVlPTAsCiAgICBpbnQgMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6NjUKICAgIC8vIHR4bi5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6NjYKICAgIC8vIHJldHVybiBUcnVlCiAgICBpbnQgMQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2F1dGhfYW5kX2Rhby5jb250cmFjdC5aYWliYXRzdUF1dGhBbmREYW8uZnVuZF9wb29sKGZ1bmRfYW1vdW50OiB1aW50NjQsIHR4bjogdWludDY0KSAtPiBieXRlczoKZnVuZF9wb29sOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weTo2OC03MwogICAgLy8gQGE0LmFiaW1ldGhvZCgpCiAgICAvLyBkZWYgZnVuZF9wb29sKAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgZnVuZF9hbW91bnQ6IGFwLlVJbnQ2NCwKICAgIC8vICAgICB0eG46IGd0eG4uQXNzZXRUcmFuc2ZlclRyYW5zYWN0aW9uLAogICAgLy8gKSAtPiBQb29sRnVuZFJlc3BvbnNlOgogICAgcHJvdG8gMiAxCiAgICBpbnQgMAogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjgxCiAgICAvLyBhc3NldF9kb2xsYXJfcHJpY2UgPSBzZWxmLmdldF9hc3NldF9wcmljZSh0eG4ueGZlcl9hc3NldCkKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgWGZlckFzc2V0CiAgICBkdXBuIDIKICAgIGNhbGxzdWIgZ2V0X2Fzc2V0X3ByaWNlCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjgzCiAgICAvLyB0eG4uYXNzZXRfcmVjZWl2ZXIgPT0gc2VsZi5zZXJ2aWNlX2NvbnRyYWN0X2FkZHJlc3MubmF0aXZlCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIEFzc2V0UmVjZWl2ZXIKICAgIGludCAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjM4CiAgICAvLyBzZWxmLnNlcnZpY2VfY29udHJhY3RfYWRkcmVzcyA9IGFkZHJlc3MKICAgIGJ5dGUgInNlcnZpY2VfY29udHJhY3RfYWRkcmVzcyIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6ODMKICAgIC8vIHR4bi5hc3NldF9yZWNlaXZlciA9PSBzZWxmLnNlcnZpY2VfY29udHJhY3RfYWRkcmVzcy5uYXRpdmUKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5zZXJ2aWNlX2NvbnRyYWN0X2FkZHJlc3MgZXhpc3RzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weTo4Mi04NAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICB0eG4uYXNzZXRfcmVjZWl2ZXIgPT0gc2VsZi5zZXJ2aWNlX2NvbnRyYWN0X2FkZHJlc3MubmF0aXZlCiAgICAvLyApLCAiVGhlIGFzc2V0X3JlY2VpdmVyIG11dCBiZSB0aGUgWmFpYmF0c3VTZXJ2aWNlIGFjY291bnQiCiAgICBhc3NlcnQgLy8gVGhlIGFzc2V0X3JlY2VpdmVyIG11dCBiZSB0aGUgWmFpYmF0c3VTZXJ2aWNlIGFjY291bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6ODYtODgKICAgIC8vIGFtb3VudF9wbHVzX3RyYW5zYWN0aW9uX2ZlZSA9IHNlbGYuY2FsY3VsYXRlX2FtdF9wbHVzX2ZlZSgKICAgIC8vICAgICBmdW5kX2Ftb3VudCwgYXAuVUludDY0KDEpCiAgICAvLyApCiAgICBmcmFtZV9kaWcgLTIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6ODcKICAgIC8vIGZ1bmRfYW1vdW50LCBhcC5VSW50NjQoMSkKICAgIGludCAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5Ojg2LTg4CiAgICAvLyBhbW91bnRfcGx1c190cmFuc2FjdGlvbl9mZWUgPSBzZWxmLmNhbGN1bGF0ZV9hbXRfcGx1c19mZWUoCiAgICAvLyAgICAgZnVuZF9hbW91bnQsIGFwLlVJbnQ2NCgxKQogICAgLy8gKQogICAgY2FsbHN1YiBjYWxjdWxhdGVfYW10X3BsdXNfZmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjkwCiAgICAvLyB0eG4uYXNzZXRfYW1vdW50ID09IGFtb3VudF9wbHVzX3RyYW5zYWN0aW9uX2ZlZQogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBBc3NldEFtb3VudAogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6ODktOTEKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgdHhuLmFzc2V0X2Ftb3VudCA9PSBhbW91bnRfcGx1c190cmFuc2FjdGlvbl9mZWUKICAgIC8vICksICJUaGUgdHhuIGFtb3VudCBtdXN0IGJlIGZ1bmRfYW1vdW50IHBsdXMgdGhlIHRyYW5zYWN0aW9uIGZlZSIKICAgIGFzc2VydCAvLyBUaGUgdHhuIGFtb3VudCBtdXN0IGJlIGZ1bmRfYW1vdW50IHBsdXMgdGhlIHRyYW5zYWN0aW9uIGZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weTo5MwogICAgLy8gZGVwb3NpdF9rZXkgPSBzZWxmLnBvb2xfZGVwb3NpdF9rZXkodHhuLnhmZXJfYXNzZXQuaWQsIHR4bi5zZW5kZXIpCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIFNlbmRlcgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBjYWxsc3ViIHBvb2xfZGVwb3NpdF9rZXkKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weTo5NAogICAgLy8gW2RlcG9zaXRfYnl0ZXMsIGlzX2RlcG9zaXRvcl0gPSBvcC5Cb3guZ2V0KGRlcG9zaXRfa2V5KQogICAgYm94X2dldAogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6OTUKICAgIC8vIGRlcG9zaXQgPSBhcC5VSW50NjQoMCkKICAgIGludCAwCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5Ojk2CiAgICAvLyBpZiBpc19kZXBvc2l0b3I6CiAgICBieiBmdW5kX3Bvb2xfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5Ojk3CiAgICAvLyBkZXBvc2l0ID0gb3AuYnRvaShkZXBvc2l0X2J5dGVzKQogICAgZnJhbWVfZGlnIDcKICAgIGJ0b2kKICAgIGZyYW1lX2J1cnkgOAoKZnVuZF9wb29sX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6OTgKICAgIC8vIG9wLkJveC5wdXQoZGVwb3NpdF9rZXksIG9wLml0b2IoZGVwb3NpdCArIGZ1bmRfYW1vdW50KSkKICAgIGZyYW1lX2RpZyA4CiAgICBmcmFtZV9kaWcgLTIKICAgICsKICAgIGl0b2IKICAgIGZyYW1lX2RpZyA1CiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjEwMAogICAgLy8gdG90YWwgPSBzZWxmLnBvb2xfdG90YWwodHhuLnhmZXJfYXNzZXQuaWQpCiAgICBmcmFtZV9kaWcgMgogICAgY2FsbHN1YiBwb29sX3RvdGFsCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjEwMQogICAgLy8gdG90YWwuYW1vdW50ID0gYTQuVUludDY0KHRvdGFsLmFtb3VudC5uYXRpdmUgKyBmdW5kX2Ftb3VudCkKICAgIGR1cAogICAgZXh0cmFjdCAwIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICBmcmFtZV9kaWcgLTIKICAgICsKICAgIGl0b2IKICAgIHJlcGxhY2UyIDAKICAgIGR1cAogICAgZnJhbWVfYnVyeSAwCiAgICBmcmFtZV9idXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MTAyCiAgICAvLyBpZiBub3QgaXNfZGVwb3NpdG9yOgogICAgZnJhbWVfZGlnIDYKICAgIGJueiBmdW5kX3Bvb2xfYWZ0ZXJfaWZfZWxzZUA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjEwMwogICAgLy8gdG90YWwuZGVwb3NpdG9ycyA9IGE0LlVJbnQ2NCh0b3RhbC5kZXBvc2l0b3JzLm5hdGl2ZSArIDEpCiAgICBmcmFtZV9kaWcgMAogICAgZHVwCiAgICBleHRyYWN0IDggOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgIGludCAxCiAgICArCiAgICBpdG9iCiAgICByZXBsYWNlMiA4CiAgICBmcmFtZV9idXJ5IDEKCmZ1bmRfcG9vbF9hZnRlcl9pZl9lbHNlQDQ6CiAgICBmcmFtZV9kaWcgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToxMDQKICAgIC8vIG9wLkJveC5wdXQoc2VsZi5wb29sX3RvdGFsX2tleSh0eG4ueGZlcl9hc3NldC5pZCksIHRvdGFsLmJ5dGVzKQogICAgZnJhbWVfZGlnIDIKICAgIGR1cAogICAgY292ZXIgMgogICAgY2FsbHN1YiBwb29sX3RvdGFsX2tleQogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToxMDcKICAgIC8vIGFzc2V0X2lkPWE0LlVJbnQ2NCh0eG4ueGZlcl9hc3NldC5pZCksCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjEwOQogICAgLy8gYW1vdW50PWE0LlVJbnQ2NChmdW5kX2Ftb3VudCksCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0b2IKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MTA2LTExMAogICAgLy8gUG9vbEZ1bmRlZCgKICAgIC8vICAgICBhc3NldF9pZD1hNC5VSW50NjQodHhuLnhmZXJfYXNzZXQuaWQpLAogICAgLy8gICAgIGRlcG9zaXRvcj1hNC5BZGRyZXNzKHR4bi5zZW5kZXIpLAogICAgLy8gICAgIGFtb3VudD1hNC5VSW50NjQoZnVuZF9hbW91bnQpLAogICAgLy8gKQogICAgZnJhbWVfZGlnIDQKICAgIGNvbmNhdAogICAgZGlnIDEKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToxMDUtMTExCiAgICAvLyBhNC5lbWl0KAogICAgLy8gICAgIFBvb2xGdW5kZWQoCiAgICAvLyAgICAgICAgIGFzc2V0X2lkPWE0LlVJbnQ2NCh0eG4ueGZlcl9hc3NldC5pZCksCiAgICAvLyAgICAgICAgIGRlcG9zaXRvcj1hNC5BZGRyZXNzKHR4bi5zZW5kZXIpLAogICAgLy8gICAgICAgICBhbW91bnQ9YTQuVUludDY0KGZ1bmRfYW1vdW50KSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBtZXRob2QgIlBvb2xGdW5kZWQodWludDY0LGFkZHJlc3MsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjExNgogICAgLy8gYXNzZXRfcHJpY2U9YTQuVUludDY0KGFzc2V0X2RvbGxhcl9wcmljZSksCiAgICBmcmFtZV9kaWcgMwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToxMTMtMTE3CiAgICAvLyByZXNwb25zZSA9IFBvb2xGdW5kUmVzcG9uc2UoCiAgICAvLyAgICAgYW1vdW50PWE0LlVJbnQ2NChmdW5kX2Ftb3VudCksCiAgICAvLyAgICAgc3VjY2Vzcz1hNC5Cb29sKFRydWUpLCAgIyBub3FhOiBGQlQwMDMKICAgIC8vICAgICBhc3NldF9wcmljZT1hNC5VSW50NjQoYXNzZXRfZG9sbGFyX3ByaWNlKSwKICAgIC8vICkKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToxMTUKICAgIC8vIHN1Y2Nlc3M9YTQuQm9vbChUcnVlKSwgICMgbm9xYTogRkJUMDAzCiAgICBieXRlIDB4ODAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MTEzLTExNwogICAgLy8gcmVzcG9uc2UgPSBQb29sRnVuZFJlc3BvbnNlKAogICAgLy8gICAgIGFtb3VudD1hNC5VSW50NjQoZnVuZF9hbW91bnQpLAogICAgLy8gICAgIHN1Y2Nlc3M9YTQuQm9vbChUcnVlKSwgICMgbm9xYTogRkJUMDAzCiAgICAvLyAgICAgYXNzZXRfcHJpY2U9YTQuVUludDY0KGFzc2V0X2RvbGxhcl9wcmljZSksCiAgICAvLyApCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MTE4CiAgICAvLyByZXR1cm4gcmVzcG9uc2UKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2Jhc2UuY29udHJhY3QuWmFpYmF0c3VCYXNlLmdldF9hc3NldF9wcmljZShhc2E6IHVpbnQ2NCkgLT4gdWludDY0OgpnZXRfYXNzZXRfcHJpY2U6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToxNzMtMTc0CiAgICAvLyBAYXAuc3Vicm91dGluZQogICAgLy8gZGVmIGdldF9hc3NldF9wcmljZShzZWxmLCBhc2E6IGFwLkFzc2V0KSAtPiBhcC5VSW50NjQ6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjE4MQogICAgLy8gY29uZmlnID0gc2VsZi5wcmljZV9vcmFjbGVfY29uZmlnKCkKICAgIGNhbGxzdWIgcHJpY2Vfb3JhY2xlX2NvbmZpZwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTgyCiAgICAvLyBbc25hcHNob3RfYnl0ZXMsIGV4aXN0c10gPSBvcC5Cb3guZ2V0KHNlbGYucHJpY2Vfa2V5KGFzYS5pZCkpCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgcHJpY2Vfa2V5CiAgICBib3hfZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToxODMKICAgIC8vIGlmIGV4aXN0czoKICAgIGJ6IGdldF9hc3NldF9wcmljZV9hZnRlcl9pZl9lbHNlQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjE4NgogICAgLy8gR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjE4NwogICAgLy8gPD0gc25hcHNob3QudGltZXN0YW1wLm5hdGl2ZSArIGNvbmZpZy5jYWNoZV93aW5kb3cubmF0aXZlCiAgICBmcmFtZV9kaWcgMQogICAgZXh0cmFjdCA4IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICBmcmFtZV9kaWcgMAogICAgZXh0cmFjdCA4IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToxODYtMTg3CiAgICAvLyBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcAogICAgLy8gPD0gc25hcHNob3QudGltZXN0YW1wLm5hdGl2ZSArIGNvbmZpZy5jYWNoZV93aW5kb3cubmF0aXZlCiAgICA8PQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTg1LTE4OAogICAgLy8gaWYgKAogICAgLy8gICAgIEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wCiAgICAvLyAgICAgPD0gc25hcHNob3QudGltZXN0YW1wLm5hdGl2ZSArIGNvbmZpZy5jYWNoZV93aW5kb3cubmF0aXZlCiAgICAvLyApOgogICAgYnogZ2V0X2Fzc2V0X3ByaWNlX2FmdGVyX2lmX2Vsc2VANAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTg5CiAgICAvLyByZXR1cm4gc25hcHNob3QucHJpY2UubmF0aXZlCiAgICBmcmFtZV9kaWcgMQogICAgZXh0cmFjdCAwIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKZ2V0X2Fzc2V0X3ByaWNlX2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjE5MAogICAgLy8gcmV0dXJuIHNlbGYucmVmcmVzaF9hc3NldF9wcmljZShhc2EuaWQsIGFwLkFwcGxpY2F0aW9uKGNvbmZpZy5vcmFjbGUubmF0aXZlKSkKICAgIGZyYW1lX2RpZyAwCiAgICBleHRyYWN0IDAgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgIGZyYW1lX2RpZyAtMQogICAgc3dhcAogICAgY2FsbHN1YiByZWZyZXNoX2Fzc2V0X3ByaWNlCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9iYXNlLmNvbnRyYWN0LlphaWJhdHN1QmFzZS5wcmljZV9vcmFjbGVfY29uZmlnKCkgLT4gYnl0ZXM6CnByaWNlX29yYWNsZV9jb25maWc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToxOTItMTkzCiAgICAvLyBAYXAuc3Vicm91dGluZQogICAgLy8gZGVmIHByaWNlX29yYWNsZV9jb25maWcoc2VsZikgLT4gUHJpY2VPcmFjbGVDb25maWc6CiAgICBwcm90byAwIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjE5NAogICAgLy8gW2NvbmZpZ19ieXRlcywgZXhpc3RzXSA9IG9wLkJveC5nZXQoUFJJQ0VfT1JBQ0xFX0tFWSkKICAgIGJ5dGUgMHg0ZgogICAgYm94X2dldAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTk1CiAgICAvLyBhc3NlcnQgZXhpc3RzLCAiVGhlIHByaWNlIG9yYWNsZSBoYXMgbm90IGJlZW4gc2V0IgogICAgYXNzZXJ0IC8vIFRoZSBwcmljZSBvcmFjbGUgaGFzIG5vdCBiZWVuIHNldAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTk2CiAgICAvLyByZXR1cm4gUHJpY2VPcmFjbGVDb25maWcuZnJvbV9ieXRlcyhjb25maWdfYnl0ZXMpCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfYmFzZS5jb250cmFjdC5aYWliYXRzdUJhc2UucHJpY2Vfa2V5KGFzc2V0X2lkOiB1aW50NjQpIC0+IGJ5dGVzOgpwcmljZV9rZXk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToyMTItMjEzCiAgICAvLyBAYXAuc3Vicm91dGluZQogICAgLy8gZGVmIHByaWNlX2tleShzZWxmLCBhc3NldF9pZDogYXAuVUludDY0KSAtPiBhcC5CeXRlczoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MjE0CiAgICAvLyByZXR1cm4gb3AuY29uY2F0KFBSSUNFX0tFWV9QUkVGSVgsIG9wLml0b2IoYXNzZXRfaWQpKQogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBieXRlIDB4NDYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2Jhc2UuY29udHJhY3QuWmFpYmF0c3VCYXNlLnJlZnJlc2hfYXNzZXRfcHJpY2UoYXNzZXRfaWQ6IHVpbnQ2NCwgb3JhY2xlOiB1aW50NjQpIC0+IHVpbnQ2NDoKcmVmcmVzaF9hc3NldF9wcmljZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjE5OC0yMDEKICAgIC8vIEBhcC5zdWJyb3V0aW5lCiAgICAvLyBkZWYgcmVmcmVzaF9hc3NldF9wcmljZSgKICAgIC8vICAgICBzZWxmLCBhc3NldF9pZDogYXAuVUludDY0LCBvcmFjbGU6IGFwLkFwcGxpY2F0aW9uCiAgICAvLyApIC0+IGFwLlVJbnQ2NDoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MjAyCiAgICAvLyBbdmFsdWUsIGV4aXN0c10gPSBvcC5BcHBHbG9iYWwuZ2V0X2V4X2J5dGVzKG9yYWNsZSwgb3AuaXRvYihhc3NldF9pZCkpCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAtMQogICAgc3dhcAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjIwMwogICAgLy8gYXNzZXJ0IGV4aXN0cywgIlRoaXMgYXNldCBpcyBub3Qgc3VwcG9ydGVkIgogICAgYXNzZXJ0IC8vIFRoaXMgYXNldCBpcyBub3Qgc3VwcG9ydGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToyMDQKICAgIC8vIHByaWNlID0gb3AuZXh0cmFjdF91aW50NjQodmFsdWUsIGFwLlVJbnQ2NCgwKSkKICAgIGludCAwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MjA2CiAgICAvLyBwcmljZT1hNC5VSW50NjQocHJpY2UpLAogICAgZHVwCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToyMDcKICAgIC8vIHRpbWVzdGFtcD1hNC5VSW50NjQoR2xvYmFsLmxhdGVzdF90aW1lc3RhbXApLAogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MjA1LTIwOAogICAgLy8gc25hcHNob3QgPSBBc3NldFByaWNlU25hcHNob3QoCiAgICAvLyAgICAgcHJpY2U9YTQuVUludDY0KHByaWNlKSwKICAgIC8vICAgICB0aW1lc3RhbXA9YTQuVUludDY0KEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wKSwKICAgIC8vICkKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MjA5CiAgICAvLyBvcC5Cb3gucHV0KHNlbGYucHJpY2Vfa2V5KGFzc2V0X2lkKSwgc25hcHNob3QuYnl0ZXMpCiAgICBmcmFtZV9kaWcgLTIKICAgIGNhbGxzdWIgcHJpY2Vfa2V5CiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToyMTAKICAgIC8vIHJldHVybiBwcmljZQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2Jhc2UuY29udHJhY3QuWmFpYmF0c3VCYXNlLmNhbGN1bGF0ZV9hbXRfcGx1c19mZWUoYW10OiB1aW50NjQsIG11bHRpcGxlczogdWludDY0KSAtPiB1aW50NjQ6CmNhbGN1bGF0ZV9hbXRfcGx1c19mZWU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToxNjYtMTY3CiAgICAvLyBAYXAuc3Vicm91dGluZQogICAgLy8gZGVmIGNhbGN1bGF0ZV9hbXRfcGx1c19mZWUoc2VsZiwgYW10OiBhcC5VSW50NjQsIG11bHRpcGxlczogYXAuVUludDY0KSAtPiBhcC5VSW50NjQ6CiAgICBwcm90byAyIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjE2OAogICAgLy8gZmVlX3BlcmNlbnRhZ2UgPSBhcC5VSW50NjQoMTApICogbXVsdGlwbGVzCiAgICBpbnQgMTAKICAgIGZyYW1lX2RpZyAtMQogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTY5CiAgICAvLyBtdWx0aXBsaWVkID0gZmVlX3BlcmNlbnRhZ2UgKiBhbXQKICAgIGZyYW1lX2RpZyAtMgogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTcwCiAgICAvLyB0cmFuc2FjdGlvbl9mZWUgPSBtdWx0aXBsaWVkIC8vIDEwMDAKICAgIGludCAxMDAwCiAgICAvCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToxNzEKICAgIC8vIHJldHVybiBhbXQgKyB0cmFuc2FjdGlvbl9mZWUKICAgIGZyYW1lX2RpZyAtMgogICAgKwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2F1dGhfYW5kX2Rhby5jb250cmFjdC5aYWliYXRzdUF1dGhBbmREYW8ucG9vbF9kZXBvc2l0X2tleShhc3NldF9pZDogdWludDY0LCBkZXBvc2l0b3I6IGJ5dGVzKSAtPiBieXRlczoKcG9vbF9kZXBvc2l0X2tleToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MjE5LTIyMAogICAgLy8gQGFwLnN1YnJvdXRpbmUKICAgIC8vIGRlZiBwb29sX2RlcG9zaXRfa2V5KHNlbGYsIGFzc2V0X2lkOiBhcC5VSW50NjQsIGRlcG9zaXRvcjogYXAuQWNjb3VudCkgLT4gYXAuQnl0ZXM6CiAgICBwcm90byAyIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MjIyCiAgICAvLyBvcC5jb25jYXQoUE9PTF9ERVBPU0lUX0tFWV9QUkVGSVgsIG9wLml0b2IoYXNzZXRfaWQpKSwgZGVwb3NpdG9yLmJ5dGVzCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0b2IKICAgIGJ5dGUgMHg0NAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjIyMS0yMjMKICAgIC8vIHJldHVybiBvcC5jb25jYXQoCiAgICAvLyAgICAgb3AuY29uY2F0KFBPT0xfREVQT1NJVF9LRVlfUFJFRklYLCBvcC5pdG9iKGFzc2V0X2lkKSksIGRlcG9zaXRvci5ieXRlcwogICAgLy8gKQogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9hdXRoX2FuZF9kYW8uY29udHJhY3QuWmFpYmF0c3VBdXRoQW5kRGFvLnBvb2xfdG90YWwoYXNzZXRfaWQ6IHVpbnQ2NCkgLT4gYnl0ZXM6CnBvb2xfdG90YWw6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjIyNS0yMjYKICAgIC8vIEBhcC5zdWJyb3V0aW5lCiAgICAvLyBkZWYgcG9vbF90b3RhbChzZWxmLCBhc3NldF9pZDogYXAuVUludDY0KSAtPiBQb29sQXNzZXRUb3RhbDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToyMjcKICAgIC8vIFt0b3RhbF9ieXRlcywgZXhpc3RzXSA9IG9wLkJveC5nZXQoc2VsZi5wb29sX3RvdGFsX2tleShhc3NldF9pZCkpCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgcG9vbF90b3RhbF9rZXkKICAgIGJveF9nZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MjI4CiAgICAvLyBpZiBleGlzdHM6CiAgICBieiBwb29sX3RvdGFsX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToyMjkKICAgIC8vIHJldHVybiBQb29sQXNzZXRUb3RhbC5mcm9tX2J5dGVzKHRvdGFsX2J5dGVzKQogICAgZnJhbWVfZGlnIDAKICAgIHN3YXAKICAgIHJldHN1YgoKcG9vbF90b3RhbF9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjIzMAogICAgLy8gcmV0dXJuIFBvb2xBc3NldFRvdGFsKGFtb3VudD1hNC5VSW50NjQoMCksIGRlcG9zaXRvcnM9YTQuVUludDY0KDApKQogICAgYnl0ZSAweDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwCiAgICBzd2FwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfYXV0aF9hbmRfZGFvLmNvbnRyYWN0LlphaWJhdHN1QXV0aEFuZERhby5wb29sX3RvdGFsX2tleShhc3NldF9pZDogdWludDY0KSAtPiBieXRlczoKcG9vbF90b3RhbF9rZXk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjIxMi0yMTYKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyAgIFN1YnJvdXRpbmVzICAgICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBhcC5zdWJyb3V0aW5lCiAgICAvLyBkZWYgcG9vbF90b3RhbF9rZXkoc2VsZiwgYXNzZXRfaWQ6IGFwLlVJbnQ2NCkgLT4gYXAuQnl0ZXM6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MjE3CiAgICAvLyByZXR1cm4gb3AuY29uY2F0KFBPT0xfVE9UQUxfS0VZX1BSRUZJWCwgb3AuaXRvYihhc3NldF9pZCkpCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIGJ5dGUgMHg1NAogICAgc3dhcAogICAgY29uY2F0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfYXV0aF9hbmRfZGFvLmNvbnRyYWN0LlphaWJhdHN1QXV0aEFuZERhby5hcHByb3ZlX3Bvb2xfdm90ZShwcm9wb3NhbF9pZDogdWludDY0LCBhcHByb3ZlOiB1aW50NjQsIHR4bjogdWludDY0KSAtPiBieXRlczoKYXBwcm92ZV9wb29sX3ZvdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjEyMC0xMjYKICAgIC8vIEBhNC5hYmltZXRob2QoKQogICAgLy8gZGVmIGFwcHJvdmVfcG9vbF92b3RlKAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgcHJvcG9zYWxfaWQ6IGFwLlVJbnQ2NCwKICAgIC8vICAgICBhcHByb3ZlOiBib29sLCAgIyBub3FhOiBGQlQwMDEKICAgIC8vICAgICB0eG46IGd0eG4uQXNzZXRUcmFuc2ZlclRyYW5zYWN0aW9uLAogICAgLy8gKSAtPiBQb29sVm90ZUFwcHJvdmFsUmVzcG9uc2U6CiAgICBwcm90byAzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MTM0CiAgICAvLyB6YWlfYXNzZXRfaWQgPSBzZWxmLmdldF96YWlfdG9rZW4oKQogICAgY2FsbHN1YiBnZXRfemFpX3Rva2VuCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjEzNgogICAgLy8gdHhuLnhmZXJfYXNzZXQuaWQgPT0gemFpX2Fzc2V0X2lkLm5hdGl2ZQogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBYZmVyQXNzZXQKICAgIHN3YXAKICAgIGJ0b2kKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjEzNS0xMzcKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgdHhuLnhmZXJfYXNzZXQuaWQgPT0gemFpX2Fzc2V0X2lkLm5hdGl2ZQogICAgLy8gKSwgIlRoZSBhc3NldCB0cmFuc2ZlcmVkIG11c3QgYmUgdGhlIHBvb2wgdG9rZW4iCiAgICBhc3NlcnQgLy8gVGhlIGFzc2V0IHRyYW5zZmVyZWQgbXVzdCBiZSB0aGUgcG9vbCB0b2tlbgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToxMzgKICAgIC8vIHNlbGYuZW5zdXJlX2FwcF9yZWNpZXZlcih0eG4pCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgZW5zdXJlX2FwcF9yZWNpZXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToxNDAKICAgIC8vIHRhbGx5ID0gc2VsZi52b3RlX3RhbGx5KHByb3Bvc2FsX2lkKQogICAgZnJhbWVfZGlnIC0zCiAgICBjYWxsc3ViIHZvdGVfdGFsbHkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MTQxCiAgICAvLyBpZiBhcHByb3ZlOgogICAgZnJhbWVfZGlnIC0yCiAgICBieiBhcHByb3ZlX3Bvb2xfdm90ZV9lbHNlX2JvZHlAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToxNDIKICAgIC8vIHRhbGx5LnZvdGVzX2ZvciA9IGE0LlVJbnQ2NCh0YWxseS52b3Rlc19mb3IubmF0aXZlICsgdHhuLmFzc2V0X2Ftb3VudCkKICAgIGR1cAogICAgZXh0cmFjdCAwIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIEFzc2V0QW1vdW50CiAgICArCiAgICBpdG9iCiAgICByZXBsYWNlMiAwCiAgICBiIGFwcHJvdmVfcG9vbF92b3RlX2FmdGVyX2lmX2Vsc2VAMwoKYXBwcm92ZV9wb29sX3ZvdGVfZWxzZV9ib2R5QDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjE0NQogICAgLy8gdGFsbHkudm90ZXNfYWdhaW5zdC5uYXRpdmUgKyB0eG4uYXNzZXRfYW1vdW50CiAgICBkdXAKICAgIGV4dHJhY3QgOCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnRvaQogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBBc3NldEFtb3VudAogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToxNDQtMTQ2CiAgICAvLyB0YWxseS52b3Rlc19hZ2FpbnN0ID0gYTQuVUludDY0KAogICAgLy8gICAgIHRhbGx5LnZvdGVzX2FnYWluc3QubmF0aXZlICsgdHhuLmFzc2V0X2Ftb3VudAogICAgLy8gKQogICAgaXRvYgogICAgcmVwbGFjZTIgOAoKYXBwcm92ZV9wb29sX3ZvdGVfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToxNDcKICAgIC8vIHRhbGx5LnZvdGVzX2Nhc3QgPSBhNC5VSW50NjQodGFsbHkudm90ZXNfY2FzdC5uYXRpdmUgKyAxKQogICAgZHVwCiAgICBleHRyYWN0IDE2IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICBpbnQgMQogICAgKwogICAgaXRvYgogICAgcmVwbGFjZTIgMTYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MTQ4CiAgICAvLyBvcC5Cb3gucHV0KHNlbGYudm90ZV90YWxseV9rZXkocHJvcG9zYWxfaWQpLCB0YWxseS5ieXRlcykKICAgIGZyYW1lX2RpZyAtMwogICAgY2FsbHN1YiB2b3RlX3RhbGx5X2tleQogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToxNTEKICAgIC8vIHByb3Bvc2FsX2lkPWE0LlVJbnQ2NChwcm9wb3NhbF9pZCksCiAgICBmcmFtZV9kaWcgLTMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MTUyCiAgICAvLyB2b3Rlcj1hNC5BZGRyZXNzKHR4bi5zZW5kZXIpLAogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MTUzCiAgICAvLyBhcHByb3ZlPWE0LkJvb2woYXBwcm92ZSksCiAgICBieXRlIDB4MDAKICAgIGludCAwCiAgICBmcmFtZV9kaWcgLTIKICAgIHNldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToxNTQKICAgIC8vIGFtb3VudD1hNC5VSW50NjQodHhuLmFzc2V0X2Ftb3VudCksCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIEFzc2V0QW1vdW50CiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjE1MC0xNTUKICAgIC8vIFBvb2xWb3RlQ2FzdCgKICAgIC8vICAgICBwcm9wb3NhbF9pZD1hNC5VSW50NjQocHJvcG9zYWxfaWQpLAogICAgLy8gICAgIHZvdGVyPWE0LkFkZHJlc3ModHhuLnNlbmRlciksCiAgICAvLyAgICAgYXBwcm92ZT1hNC5Cb29sKGFwcHJvdmUpLAogICAgLy8gICAgIGFtb3VudD1hNC5VSW50NjQodHhuLmFzc2V0X2Ftb3VudCksCiAgICAvLyApCiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgZGlnIDEKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToxNDktMTU2CiAgICAvLyBhNC5lbWl0KAogICAgLy8gICAgIFBvb2xWb3RlQ2FzdCgKICAgIC8vICAgICAgICAgcHJvcG9zYWxfaWQ9YTQuVUludDY0KHByb3Bvc2FsX2lkKSwKICAgIC8vICAgICAgICAgdm90ZXI9YTQuQWRkcmVzcyh0eG4uc2VuZGVyKSwKICAgIC8vICAgICAgICAgYXBwcm92ZT1hNC5Cb29sKGFwcHJvdmUpLAogICAgLy8gICAgICAgICBhbW91bnQ9YTQuVUludDY0KHR4bi5hc3NldF9hbW91bnQpLAogICAgLy8gICAgICkKICAgIC8vICkKICAgIG1ldGhvZCAiUG9vbFZvdGVDYXN0KHVpbnQ2NCxhZGRyZXNzLGJvb2wsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjE2MAogICAgLy8gdHhuX2lkPWE0LlN0cmluZy5mcm9tX2J5dGVzKHR4bi50eG5faWQpLAogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBUeElECiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjE1OC0xNjEKICAgIC8vIHJlc3BvbnNlID0gUG9vbFZvdGVBcHByb3ZhbFJlc3BvbnNlKAogICAgLy8gICAgIG11bHRpcGxpZXI9YTQuVUludDY0KHR4bi5hc3NldF9hbW91bnQpLAogICAgLy8gICAgIHR4bl9pZD1hNC5TdHJpbmcuZnJvbV9ieXRlcyh0eG4udHhuX2lkKSwKICAgIC8vICkKICAgIHN3YXAKICAgIGJ5dGUgMHgwMDBhCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToxNjIKICAgIC8vIHJldHVybiByZXNwb25zZQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2Jhc2UuY29udHJhY3QuWmFpYmF0c3VCYXNlLmVuc3VyZV9hcHBfcmVjaWV2ZXIodHhuOiB1aW50NjQpIC0+IHZvaWQ6CmVuc3VyZV9hcHBfcmVjaWV2ZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToyMjctMjI4CiAgICAvLyBAYXAuc3Vicm91dGluZQogICAgLy8gZGVmIGVuc3VyZV9hcHBfcmVjaWV2ZXIoc2VsZiwgdHhuOiBndHhuLkFzc2V0VHJhbnNmZXJUcmFuc2FjdGlvbikgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MjMwCiAgICAvLyB0eG4uYXNzZXRfcmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBBc3NldFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjIyOS0yMzEKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgdHhuLmFzc2V0X3JlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIC8vICksICJUaGUgcmVjaXBpZW50IG11c3QgYmUgdGhlIGN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcyBhZGRyZXNzIgogICAgYXNzZXJ0IC8vIFRoZSByZWNpcGllbnQgbXVzdCBiZSB0aGUgY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzIGFkZHJlc3MKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9hdXRoX2FuZF9kYW8uY29udHJhY3QuWmFpYmF0c3VBdXRoQW5kRGFvLnZvdGVfdGFsbHkocHJvcG9zYWxfaWQ6IHVpbnQ2NCkgLT4gYnl0ZXM6CnZvdGVfdGFsbHk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjIzNi0yMzcKICAgIC8vIEBhcC5zdWJyb3V0aW5lCiAgICAvLyBkZWYgdm90ZV90YWxseShzZWxmLCBwcm9wb3NhbF9pZDogYXAuVUludDY0KSAtPiBQcm9wb3NhbFZvdGVUYWxseToKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToyMzgKICAgIC8vIFt0YWxseV9ieXRlcywgZXhpc3RzXSA9IG9wLkJveC5nZXQoc2VsZi52b3RlX3RhbGx5X2tleShwcm9wb3NhbF9pZCkpCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgdm90ZV90YWxseV9rZXkKICAgIGJveF9nZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MjM5CiAgICAvLyBpZiBleGlzdHM6CiAgICBieiB2b3RlX3RhbGx5X2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToyNDAKICAgIC8vIHJldHVybiBQcm9wb3NhbFZvdGVUYWxseS5mcm9tX2J5dGVzKHRhbGx5X2J5dGVzKQogICAgZnJhbWVfZGlnIDAKICAgIHN3YXAKICAgIHJldHN1YgoKdm90ZV90YWxseV9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjI0MS0yNDUKICAgIC8vIHJldHVybiBQcm9wb3NhbFZvdGVUYWxseSgKICAgIC8vICAgICB2b3Rlc19mb3I9YTQuVUludDY0KDApLAogICAgLy8gICAgIHZvdGVzX2FnYWluc3Q9YTQuVUludDY0KDApLAogICAgLy8gICAgIHZvdGVzX2Nhc3Q9YTQuVUludDY0KDApLAogICAgLy8gKQogICAgYnl0ZSAweDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMAogICAgc3dhcAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2F1dGhfYW5kX2Rhby5jb250cmFjdC5aYWliYXRzdUF1dGhBbmREYW8udm90ZV90YWxseV9rZXkocHJvcG9zYWxfaWQ6IHVpbnQ2NCkgLT4gYnl0ZXM6CnZvdGVfdGFsbHlfa2V5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToyMzItMjMzCiAgICAvLyBAYXAuc3Vicm91dGluZQogICAgLy8gZGVmIHZvdGVfdGFsbHlfa2V5KHNlbGYsIHByb3Bvc2FsX2lkOiBhcC5VSW50NjQpIC0+IGFwLkJ5dGVzOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjIzNAogICAgLy8gcmV0dXJuIG9wLmNvbmNhdChWT1RFX1RBTExZX0tFWV9QUkVGSVgsIG9wLml0b2IocHJvcG9zYWxfaWQpKQogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBieXRlIDB4NTYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2F1dGhfYW5kX2Rhby5jb250cmFjdC5aYWliYXRzdUF1dGhBbmREYW8uZ2V0X3ZvdGVfdGFsbGllcyhwcm9wb3NhbF9pZHM6IGJ5dGVzKSAtPiBieXRlczoKZ2V0X3ZvdGVfdGFsbGllczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MTY0LTE2NwogICAgLy8gQGE0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF92b3RlX3RhbGxpZXMoCiAgICAvLyAgICAgc2VsZiwgcHJvcG9zYWxfaWRzOiBhNC5EeW5hbWljQXJyYXlbYTQuVUludDY0XQogICAgLy8gKSAtPiBhNC5EeW5hbWljQXJyYXlbUHJvcG9zYWxWb3RlVGFsbHldOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjE3MwogICAgLy8gdGFsbGllcyA9IGE0LkR5bmFtaWNBcnJheVtQcm9wb3NhbFZvdGVUYWxseV0oKQogICAgYnl0ZSAweDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MTc0CiAgICAvLyBmb3IgcHJvcG9zYWxfaWQgaW4gcHJvcG9zYWxfaWRzOgogICAgZnJhbWVfZGlnIC0xCiAgICBpbnQgMAogICAgZXh0cmFjdF91aW50MTYKICAgIGludCAwCgpnZXRfdm90ZV90YWxsaWVzX2Zvcl9oZWFkZXJAMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MTc0CiAgICAvLyBmb3IgcHJvcG9zYWxfaWQgaW4gcHJvcG9zYWxfaWRzOgogICAgZnJhbWVfZGlnIDIKICAgIGZyYW1lX2RpZyAxCiAgICA8CiAgICBieiBnZXRfdm90ZV90YWxsaWVzX2FmdGVyX2ZvckA0CiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgMiAwCiAgICBmcmFtZV9kaWcgMgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnQgOAogICAgKgogICAgaW50IDgKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToxNzUKICAgIC8vIHRhbGxpZXMuYXBwZW5kKHNlbGYudm90ZV90YWxseShwcm9wb3NhbF9pZC5uYXRpdmUpKQogICAgZnJhbWVfZGlnIDAKICAgIGV4dHJhY3QgMiAwCiAgICBzd2FwCiAgICBidG9pCiAgICBjYWxsc3ViIHZvdGVfdGFsbHkKICAgIGNvbmNhdAogICAgZHVwCiAgICBsZW4KICAgIGludCAyNAogICAgLwogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSAwCiAgICBpbnQgMQogICAgKwogICAgZnJhbWVfYnVyeSAyCiAgICBiIGdldF92b3RlX3RhbGxpZXNfZm9yX2hlYWRlckAxCgpnZXRfdm90ZV90YWxsaWVzX2FmdGVyX2ZvckA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToxNzYKICAgIC8vIHJldHVybiB0YWxsaWVzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfYXV0aF9hbmRfZGFvLmNvbnRyYWN0LlphaWJhdHN1QXV0aEFuZERhby5nZXRfcG9vbF90b3RhbHMoYXNzZXRzOiBieXRlcykgLT4gYnl0ZXM6CmdldF9wb29sX3RvdGFsczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MTc4LTE4MQogICAgLy8gQGE0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF9wb29sX3RvdGFscygKICAgIC8vICAgICBzZWxmLCBhc3NldHM6IGE0LkR5bmFtaWNBcnJheVthNC5VSW50NjRdCiAgICAvLyApIC0+IGE0LkR5bmFtaWNBcnJheVtQb29sQXNzZXRUb3RhbF06CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MTg3CiAgICAvLyB0b3RhbHMgPSBhNC5EeW5hbWljQXJyYXlbUG9vbEFzc2V0VG90YWxdKCkKICAgIGJ5dGUgMHgwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjE4OAogICAgLy8gZm9yIGFzc2V0X2lkIGluIGFzc2V0czoKICAgIGZyYW1lX2RpZyAtMQogICAgaW50IDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnQgMAoKZ2V0X3Bvb2xfdG90YWxzX2Zvcl9oZWFkZXJAMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MTg4CiAgICAvLyBmb3IgYXNzZXRfaWQgaW4gYXNzZXRzOgogICAgZnJhbWVfZGlnIDIKICAgIGZyYW1lX2RpZyAxCiAgICA8CiAgICBieiBnZXRfcG9vbF90b3RhbHNfYWZ0ZXJfZm9yQDQKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludCA4CiAgICAqCiAgICBpbnQgOAogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjE4OQogICAgLy8gdG90YWxzLmFwcGVuZChzZWxmLnBvb2xfdG90YWwoYXNzZXRfaWQubmF0aXZlKSkKICAgIGZyYW1lX2RpZyAwCiAgICBleHRyYWN0IDIgMAogICAgc3dhcAogICAgYnRvaQogICAgY2FsbHN1YiBwb29sX3RvdGFsCiAgICBjb25jYXQKICAgIGR1cAogICAgbGVuCiAgICBpbnQgMTYKICAgIC8KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2J1cnkgMAogICAgaW50IDEKICAgICsKICAgIGZyYW1lX2J1cnkgMgogICAgYiBnZXRfcG9vbF90b3RhbHNfZm9yX2hlYWRlckAxCgpnZXRfcG9vbF90b3RhbHNfYWZ0ZXJfZm9yQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjE5MAogICAgLy8gcmV0dXJuIHRvdGFscwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2F1dGhfYW5kX2Rhby5jb250cmFjdC5aYWliYXRzdUF1dGhBbmREYW8uZ2V0X3Bvb2xfZGVwb3NpdHMoZGVwb3NpdG9yOiBieXRlcywgYXNzZXRzOiBieXRlcykgLT4gYnl0ZXM6CmdldF9wb29sX2RlcG9zaXRzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToxOTItMTk1CiAgICAvLyBAYTQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZ2V0X3Bvb2xfZGVwb3NpdHMoCiAgICAvLyAgICAgc2VsZiwgZGVwb3NpdG9yOiBhcC5BY2NvdW50LCBhc3NldHM6IGE0LkR5bmFtaWNBcnJheVthNC5VSW50NjRdCiAgICAvLyApIC0+IGE0LkR5bmFtaWNBcnJheVthNC5VSW50NjRdOgogICAgcHJvdG8gMiAxCiAgICBpbnQgMAogICAgYnl0ZSAiIgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToyMDEKICAgIC8vIGRlcG9zaXRzID0gYTQuRHluYW1pY0FycmF5W2E0LlVJbnQ2NF0oKQogICAgYnl0ZSAweDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MjAyCiAgICAvLyBmb3IgYXNzZXRfaWQgaW4gYXNzZXRzOgogICAgZnJhbWVfZGlnIC0xCiAgICBpbnQgMAogICAgZXh0cmFjdF91aW50MTYKICAgIGludCAwCgpnZXRfcG9vbF9kZXBvc2l0c19mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjIwMgogICAgLy8gZm9yIGFzc2V0X2lkIGluIGFzc2V0czoKICAgIGZyYW1lX2RpZyA0CiAgICBmcmFtZV9kaWcgMwogICAgPAogICAgYnogZ2V0X3Bvb2xfZGVwb3NpdHNfYWZ0ZXJfZm9yQDYKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyA0CiAgICBpbnQgOAogICAgKgogICAgaW50IDgKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToyMDQKICAgIC8vIHNlbGYucG9vbF9kZXBvc2l0X2tleShhc3NldF9pZC5uYXRpdmUsIGRlcG9zaXRvcikKICAgIGJ0b2kKICAgIGZyYW1lX2RpZyAtMgogICAgY2FsbHN1YiBwb29sX2RlcG9zaXRfa2V5CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjIwMy0yMDUKICAgIC8vIFtkZXBvc2l0X2J5dGVzLCBleGlzdHNdID0gb3AuQm94LmdldCgKICAgIC8vICAgICBzZWxmLnBvb2xfZGVwb3NpdF9rZXkoYXNzZXRfaWQubmF0aXZlLCBkZXBvc2l0b3IpCiAgICAvLyApCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MjA2CiAgICAvLyBkZXBvc2l0ID0gYXAuVUludDY0KDApCiAgICBpbnQgMAogICAgZnJhbWVfYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjIwNwogICAgLy8gaWYgZXhpc3RzOgogICAgYnogZ2V0X3Bvb2xfZGVwb3NpdHNfYWZ0ZXJfaWZfZWxzZUA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYXV0aF9hbmRfZGFvL2NvbnRyYWN0LnB5OjIwOAogICAgLy8gZGVwb3NpdCA9IG9wLmJ0b2koZGVwb3NpdF9ieXRlcykKICAgIGZyYW1lX2RpZyAwCiAgICBidG9pCiAgICBmcmFtZV9idXJ5IDEKCmdldF9wb29sX2RlcG9zaXRzX2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MjA5CiAgICAvLyBkZXBvc2l0cy5hcHBlbmQoYTQuVUludDY0KGRlcG9zaXQpKQogICAgZnJhbWVfZGlnIDIKICAgIGV4dHJhY3QgMiAwCiAgICBmcmFtZV9kaWcgMQogICAgaXRvYgogICAgY29uY2F0CiAgICBkdXAKICAgIGxlbgogICAgaW50IDgKICAgIC8KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2J1cnkgMgogICAgZnJhbWVfZGlnIDQKICAgIGludCAxCiAgICArCiAgICBmcmFtZV9idXJ5IDQKICAgIGIgZ2V0X3Bvb2xfZGVwb3NpdHNfZm9yX2hlYWRlckAxCgpnZXRfcG9vbF9kZXBvc2l0c19hZnRlcl9mb3JANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MjEwCiAgICAvLyByZXR1cm4gZGVwb3NpdHMKICAgIGZyYW1lX2RpZyAyCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9iYXNlLmNvbnRyYWN0LlphaWJhdHN1QmFzZS5jcmVhdGUoKSAtPiB1aW50NjQ6CmNyZWF0ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjI2LTI3CiAgICAvLyBAYTQuYWJpbWV0aG9kKGNyZWF0ZT0iYWxsb3ciKQogICAgLy8gZGVmIGNyZWF0ZShzZWxmKSAtPiBib29sOgogICAgcHJvdG8gMCAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToyOAogICAgLy8gcmV0dXJuIFRydWUKICAgIGludCAxCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfYmFzZS5jb250cmFjdC5aYWliYXRzdUJhc2UudXBkYXRlKCkgLT4gdWludDY0Ogp1cGRhdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTozMC0zMQogICAgLy8gQGE0LmFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiVXBkYXRlQXBwbGljYXRpb24iXSkKICAgIC8vIGRlZiB1cGRhdGUoc2VsZikgLT4gYm9vbDoKICAgIHByb3RvIDAgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MzIKICAgIC8vIHJldHVybiBzZWxmLmlzX2FkbWluKGFwLlR4bi5zZW5kZXIpCiAgICB0eG4gU2VuZGVyCiAgICBjYWxsc3ViIGlzX2FkbWluCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfYmFzZS5jb250cmFjdC5aYWliYXRzdUJhc2UuZGVsZXRlKCkgLT4gdWludDY0OgpkZWxldGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTozNC0zNQogICAgLy8gQGE0LmFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiRGVsZXRlQXBwbGljYXRpb24iXSkKICAgIC8vIGRlZiBkZWxldGUoc2VsZikgLT4gYm9vbDoKICAgIHByb3RvIDAgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MzYKICAgIC8vIGlmIGFwLlR4bi5zZW5kZXIgPT0gb3AuR2xvYmFsLmNyZWF0b3JfYWRkcmVzczoKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIGJ6IGRlbGV0ZV9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjM3CiAgICAvLyByZXR1cm4gVHJ1ZQogICAgaW50IDEKICAgIHJldHN1YgoKZGVsZXRlX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjM4CiAgICAvLyByZXR1cm4gRmFsc2UKICAgIGludCAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfYmFzZS5jb250cmFjdC5aYWliYXRzdUJhc2UuYWRkX2FkbWluKGFjY291bnQ6IGJ5dGVzKSAtPiB1aW50NjQ6CmFkZF9hZG1pbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjQwLTQxCiAgICAvLyBAYTQuYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBhZGRfYWRtaW4oc2VsZiwgYWNjb3VudDogYXAuQWNjb3VudCkgLT4gYm9vbDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6NDUKICAgIC8vIHNlbGYuYXV0aG9yaXNlX3R4bigpCiAgICBjYWxsc3ViIGF1dGhvcmlzZV90eG4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjQ2CiAgICAvLyBvcC5Cb3gucHV0KHNlbGYuYWRtaW5fa2V5KGFjY291bnQpLCBhNC5Cb29sKFRydWUpLmJ5dGVzKSAgIyBub3FhOiBGQlQwMDMKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBhZG1pbl9rZXkKICAgIGJ5dGUgMHg4MAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6NDcKICAgIC8vIHJldHVybiBUcnVlCiAgICBpbnQgMQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2Jhc2UuY29udHJhY3QuWmFpYmF0c3VCYXNlLnJlbW92ZV9hZG1pbihhY2NvdW50OiBieXRlcykgLT4gdWludDY0OgpyZW1vdmVfYWRtaW46CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo0OS01MAogICAgLy8gQGE0LmFiaW1ldGhvZCgpCiAgICAvLyBkZWYgcmVtb3ZlX2FkbWluKHNlbGYsIGFjY291bnQ6IGFwLkFjY291bnQpIC0+IGJvb2w6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjUxCiAgICAvLyBzZWxmLmF1dGhvcmlzZV90eG4oKQogICAgY2FsbHN1YiBhdXRob3Jpc2VfdHhuCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo1MgogICAgLy8gcmV0dXJuIG9wLkJveC5kZWxldGUoc2VsZi5hZG1pbl9rZXkoYWNjb3VudCkpCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgYWRtaW5fa2V5CiAgICBib3hfZGVsCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfYmFzZS5jb250cmFjdC5aYWliYXRzdUJhc2UubWlncmF0ZV9sZWdhY3lfYWRtaW5zKCkgLT4gdWludDY0OgptaWdyYXRlX2xlZ2FjeV9hZG1pbnM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo1NC01NQogICAgLy8gQGE0LmFiaW1ldGhvZCgpCiAgICAvLyBkZWYgbWlncmF0ZV9sZWdhY3lfYWRtaW5zKHNlbGYpIC0+IGFwLlVJbnQ2NDoKICAgIHByb3RvIDAgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6NjUKICAgIC8vIGFwLlR4bi5zZW5kZXIgPT0gb3AuR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6NjQtNjYKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgYXAuVHhuLnNlbmRlciA9PSBvcC5HbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICAvLyApLCAiT25seSB0aGUgY3JlYXRvciBjYW4gbWlncmF0ZSB0aGUgYWRtaW5zIgogICAgYXNzZXJ0IC8vIE9ubHkgdGhlIGNyZWF0b3IgY2FuIG1pZ3JhdGUgdGhlIGFkbWlucwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6NjgKICAgIC8vIEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2lkLCBMRUdBQ1lfQURNSU5TX0tFWQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbklECiAgICBieXRlIDB4NjE2NDZkNjk2ZTczCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo2Ny02OQogICAgLy8gW2FkbWluc19ieXRlcywgZXhpc3RzXSA9IG9wLkFwcEdsb2JhbC5nZXRfZXhfYnl0ZXMoCiAgICAvLyAgICAgR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQsIExFR0FDWV9BRE1JTlNfS0VZCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgc3dhcAogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjcwCiAgICAvLyBhc3NlcnQgZXhpc3RzLCAiVGhlIGFkbWlucyBoYXZlIGFscmVhZHkgYmVlbiBtaWdyYXRlZCIKICAgIGFzc2VydCAvLyBUaGUgYWRtaW5zIGhhdmUgYWxyZWFkeSBiZWVuIG1pZ3JhdGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo3MgogICAgLy8gZm9yIGluZGV4IGluIGFwLnVyYW5nZShhZG1pbnMubGVuZ3RoKToKICAgIGludCAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgaW50IDAKCm1pZ3JhdGVfbGVnYWN5X2FkbWluc19mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo3MgogICAgLy8gZm9yIGluZGV4IGluIGFwLnVyYW5nZShhZG1pbnMubGVuZ3RoKToKICAgIGZyYW1lX2RpZyAyCiAgICBmcmFtZV9kaWcgMQogICAgPAogICAgYnogbWlncmF0ZV9sZWdhY3lfYWRtaW5zX2FmdGVyX2ZvckA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo3MwogICAgLy8gYWRtaW5fa2V5ID0gb3AuY29uY2F0KEFETUlOX0tFWV9QUkVGSVgsIGFkbWluc1tpbmRleF0uYnl0ZXMpCiAgICBmcmFtZV9kaWcgMAogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludCAzMgogICAgKgogICAgaW50IDMyCiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ5dGUgMHg0MQogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo3NAogICAgLy8gb3AuQm94LnB1dChhZG1pbl9rZXksIGE0LkJvb2woVHJ1ZSkuYnl0ZXMpICAjIG5vcWE6IEZCVDAwMwogICAgYnl0ZSAweDgwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo3MgogICAgLy8gZm9yIGluZGV4IGluIGFwLnVyYW5nZShhZG1pbnMubGVuZ3RoKToKICAgIGludCAxCiAgICArCiAgICBmcmFtZV9idXJ5IDIKICAgIGIgbWlncmF0ZV9sZWdhY3lfYWRtaW5zX2Zvcl9oZWFkZXJAMQoKbWlncmF0ZV9sZWdhY3lfYWRtaW5zX2FmdGVyX2ZvckA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6NzUKICAgIC8vIG9wLkFwcEdsb2JhbC5kZWxldGUoTEVHQUNZX0FETUlOU19LRVkpCiAgICBieXRlIDB4NjE2NDZkNjk2ZTczCiAgICBhcHBfZ2xvYmFsX2RlbAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6NzYKICAgIC8vIHJldHVybiBhZG1pbnMubGVuZ3RoCiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfYmFzZS5jb250cmFjdC5aYWliYXRzdUJhc2Uuc2V0X3ByaWNlX29yYWNsZShvcmFjbGU6IHVpbnQ2NCwgY2FjaGVfd2luZG93OiB1aW50NjQpIC0+IHVpbnQ2NDoKc2V0X3ByaWNlX29yYWNsZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5Ojc4LTc5CiAgICAvLyBAYTQuYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBzZXRfcHJpY2Vfb3JhY2xlKHNlbGYsIG9yYWNsZTogYXAuQXBwbGljYXRpb24sIGNhY2hlX3dpbmRvdzogYXAuVUludDY0KSAtPiBib29sOgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo4NQogICAgLy8gc2VsZi5hdXRob3Jpc2VfdHhuKCkKICAgIGNhbGxzdWIgYXV0aG9yaXNlX3R4bgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6ODcKICAgIC8vIG9yYWNsZT1hNC5VSW50NjQob3JhY2xlLmlkKSwKICAgIGZyYW1lX2RpZyAtMgogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6ODgKICAgIC8vIGNhY2hlX3dpbmRvdz1hNC5VSW50NjQoY2FjaGVfd2luZG93KSwKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6ODYtODkKICAgIC8vIGNvbmZpZyA9IFByaWNlT3JhY2xlQ29uZmlnKAogICAgLy8gICAgIG9yYWNsZT1hNC5VSW50NjQob3JhY2xlLmlkKSwKICAgIC8vICAgICBjYWNoZV93aW5kb3c9YTQuVUludDY0KGNhY2hlX3dpbmRvdyksCiAgICAvLyApCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjkwCiAgICAvLyBvcC5Cb3gucHV0KFBSSUNFX09SQUNMRV9LRVksIGNvbmZpZy5ieXRlcykKICAgIGJ5dGUgMHg0ZgogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6OTEKICAgIC8vIHJldHVybiBUcnVlCiAgICBpbnQgMQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2Jhc2UuY29udHJhY3QuWmFpYmF0c3VCYXNlLnJlZnJlc2hfYXNzZXRfcHJpY2VzKGFzc2V0czogYnl0ZXMpIC0+IHVpbnQ2NDoKcmVmcmVzaF9hc3NldF9wcmljZXM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo5My05NAogICAgLy8gQGE0LmFiaW1ldGhvZCgpCiAgICAvLyBkZWYgcmVmcmVzaF9hc3NldF9wcmljZXMoc2VsZiwgYXNzZXRzOiBhNC5EeW5hbWljQXJyYXlbYTQuVUludDY0XSkgLT4gYm9vbDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTAxCiAgICAvLyBvcmFjbGUgPSBhcC5BcHBsaWNhdGlvbihzZWxmLnByaWNlX29yYWNsZV9jb25maWcoKS5vcmFjbGUubmF0aXZlKQogICAgY2FsbHN1YiBwcmljZV9vcmFjbGVfY29uZmlnCiAgICBleHRyYWN0IDAgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjEwMgogICAgLy8gZm9yIGFzc2V0X2lkIGluIGFzc2V0czoKICAgIGZyYW1lX2RpZyAtMQogICAgaW50IDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnQgMAoKcmVmcmVzaF9hc3NldF9wcmljZXNfZm9yX2hlYWRlckAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTAyCiAgICAvLyBmb3IgYXNzZXRfaWQgaW4gYXNzZXRzOgogICAgZnJhbWVfZGlnIDIKICAgIGZyYW1lX2RpZyAxCiAgICA8CiAgICBieiByZWZyZXNoX2Fzc2V0X3ByaWNlc19hZnRlcl9mb3JANAogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDIKICAgIGR1cAogICAgY292ZXIgMgogICAgaW50IDgKICAgICoKICAgIGludCA4CiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjEwMwogICAgLy8gc2VsZi5yZWZyZXNoX2Fzc2V0X3ByaWNlKGFzc2V0X2lkLm5hdGl2ZSwgb3JhY2xlKQogICAgYnRvaQogICAgZnJhbWVfZGlnIDAKICAgIGNhbGxzdWIgcmVmcmVzaF9hc3NldF9wcmljZQogICAgcG9wCiAgICBpbnQgMQogICAgKwogICAgZnJhbWVfYnVyeSAyCiAgICBiIHJlZnJlc2hfYXNzZXRfcHJpY2VzX2Zvcl9oZWFkZXJAMQoKcmVmcmVzaF9hc3NldF9wcmljZXNfYWZ0ZXJfZm9yQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToxMDQKICAgIC8vIHJldHVybiBUcnVlCiAgICBpbnQgMQogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfYmFzZS5jb250cmFjdC5aYWliYXRzdUJhc2Uub3B0X2NvbnRyYWN0X2ludG9fYXNzZXQoYXNzZXQ6IHVpbnQ2NCkgLT4gdWludDY0OgpvcHRfY29udHJhY3RfaW50b19hc3NldDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjEwNi0xMDcKICAgIC8vIEBhNC5hYmltZXRob2QoKQogICAgLy8gZGVmIG9wdF9jb250cmFjdF9pbnRvX2Fzc2V0KHNlbGYsIGFzc2V0OiBhcC5Bc3NldCkgLT4gYm9vbDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTA4CiAgICAvLyBzZWxmLm9wdF9hcHBfaW50b19hc3NldChhc3NldCkKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBvcHRfYXBwX2ludG9fYXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjEwOQogICAgLy8gcmV0dXJuIFRydWUKICAgIGludCAxCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfYmFzZS5jb250cmFjdC5aYWliYXRzdUJhc2Uub3B0X2FwcF9pbnRvX2Fzc2V0KGFzc2V0OiB1aW50NjQpIC0+IHZvaWQ6Cm9wdF9hcHBfaW50b19hc3NldDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjEyNS0xMjkKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyAgIFN1YnJvdXRpbmVzICAgICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBhcC5zdWJyb3V0aW5lCiAgICAvLyBkZWYgb3B0X2FwcF9pbnRvX2Fzc2V0KHNlbGYsIGFzc2V0OiBhcC5Bc3NldCkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTM0CiAgICAvLyBhc3NldF9yZWNlaXZlcj1hcC5HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjEzNgogICAgLy8gdHhuLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIGZyYW1lX2RpZyAtMQogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjEzMQogICAgLy8gYXNzZXRfYW1vdW50PTAsCiAgICBpbnQgMAogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTMwCiAgICAvLyB0eG4gPSBhcC5pdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBpbnQgYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjEzMgogICAgLy8gZmVlPTAsCiAgICBpbnQgMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjEzNgogICAgLy8gdHhuLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2Jhc2UuY29udHJhY3QuWmFpYmF0c3VCYXNlLnRyYW5zZmVyX2Fzc2V0KGFzc2V0OiB1aW50NjQsIGFzc2V0X2Ftb3VudDogdWludDY0LCByZWNpcGllbnQ6IGJ5dGVzKSAtPiB1aW50NjQ6CnRyYW5zZmVyX2Fzc2V0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTExLTExNAogICAgLy8gQGE0LmFiaW1ldGhvZCgpCiAgICAvLyBkZWYgdHJhbnNmZXJfYXNzZXQoCiAgICAvLyAgICAgc2VsZiwgYXNzZXQ6IGFwLkFzc2V0LCBhc3NldF9hbW91bnQ6IGFwLlVJbnQ2NCwgcmVjaXBpZW50OiBhcC5BY2NvdW50CiAgICAvLyApIC0+IGJvb2w6CiAgICBwcm90byAzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjExNQogICAgLy8gc2VsZi5hdXRob3Jpc2VfdHhuKCkKICAgIGNhbGxzdWIgYXV0aG9yaXNlX3R4bgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTIyCiAgICAvLyB0eG4uc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIGZyYW1lX2RpZyAtMgogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgZnJhbWVfZGlnIC0xCiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIGZyYW1lX2RpZyAtMwogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjExNgogICAgLy8gdHhuID0gYXAuaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgaW50IGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToxMTcKICAgIC8vIGZlZT0wLAogICAgaW50IDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToxMjIKICAgIC8vIHR4bi5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjEyMwogICAgLy8gcmV0dXJuIFRydWUKICAgIGludCAxCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfYXV0aF9hbmRfZGFvLmNvbnRyYWN0LlphaWJhdHN1QXV0aEFuZERhby5fX2luaXRfXygpIC0+IHZvaWQ6Cl9faW5pdF9fOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToyNwogICAgLy8gZGVmIF9faW5pdF9fKHNlbGYpIC0+IE5vbmU6CiAgICBwcm90byAwIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MjgKICAgIC8vIHN1cGVyKCkuX19pbml0X18oKQogICAgY2FsbHN1YiBaYWliYXRzdUJhc2UuX19pbml0X18KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9hdXRoX2FuZF9kYW8vY29udHJhY3QucHk6MjkKICAgIC8vIHNlbGYuemFpX3Rva2VuX2Fzc2V0X2lkOiBhNC5VSW50NjQgPSBhNC5VSW50NjQoKQogICAgYnl0ZSAiemFpX3Rva2VuX2Fzc2V0X2lkIgogICAgYnl0ZSAweDAwMDAwMDAwMDAwMDAwMDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfYmFzZS5jb250cmFjdC5aYWliYXRzdUJhc2UuX19pbml0X18oKSAtPiB2b2lkOgpaYWliYXRzdUJhc2UuX19pbml0X186CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToyMwogICAgLy8gZGVmIF9faW5pdF9fKHNlbGYpIC0+IE5vbmU6CiAgICBwcm90byAwIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjI0CiAgICAvLyBzZWxmLnNlcnZpY2VfY29udHJhY3Q6IGE0LkFkZHJlc3MgPSBhNC5BZGRyZXNzKCkKICAgIGJ5dGUgInNlcnZpY2VfY29udHJhY3QiCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIK",
+    "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzbWFydF9jb250cmFjdHMuemFpYmF0c3VfYXV0aF9hbmRfZGFvLmNvbnRyYWN0LlphaWJhdHN1QXV0aEFuZERhby5jbGVhcl9zdGF0ZV9wcm9ncmFtOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2F1dGhfYW5kX2Rhby9jb250cmFjdC5weToyNgogICAgLy8gY2xhc3MgWmFpYmF0c3VBdXRoQW5kRGFvKFphaWJhdHN1QmFzZSk6CiAgICBpbnQgMQogICAgcmV0dXJuCg=="
   },
   "state": {
     "global": {
-      "num_byte_slices": 4,
+      "num_byte_slices": 3,
       "num_uints": 0
     },
     "local": {
@@ -138,10 +181,6 @@ export const APP_SPEC: AppSpec = {
   "schema": {
     "global": {
       "declared": {
-        "admins": {
-          "type": "bytes",
-          "key": "admins"
-        },
         "service_contract": {
           "type": "bytes",
           "key": "service_contract"
@@ -177,27 +216,6 @@ export const APP_SPEC: AppSpec = {
           "type": "string"
         }
       },
-      {
-        "name": "create",
-        "args": [],
-        "returns": {
-          "type": "bool"
-        }
-      },
-      {
-        "name": "update",
-        "args": [],
-        "returns": {
-          "type": "bool"
-        }
-      },
-      {
-        "name": "delete",
-        "args": [],
-        "returns": {
-          "type": "bool"
-        }
-      },
       {
         "name": "set_service_contract_address",
         "args": [
@@ -215,7 +233,8 @@ export const APP_SPEC: AppSpec = {
         "args": [],
         "returns": {
           "type": "uint64"
-        }
+        },
+        "desc": "Creates the ZAI token, or moves its id out of the legacy ZAI box on\napps that still have one. Returns the ZAI asset id * The ZAI box must be passed in the box references until the token id   has been set"
       },
       {
         "name": "transfer_zai",
@@ -244,10 +263,6 @@ export const APP_SPEC: AppSpec = {
             "type": "uint64",
             "name": "fund_amount"
           },
-          {
-            "type": "application",
-            "name": "folks_feed_oracle"
-          },
           {
             "type": "axfer",
             "name": "txn"
@@ -255,11 +270,20 @@ export const APP_SPEC: AppSpec = {
         ],
         "returns": {
           "type": "(uint64,uint64,bool)"
-        }
+        },
+        "desc": "Records fund_amount in the pool ledger, under the asset total and the\nsender's deposit. * The txn must transfer exactly fund_amount plus the 1% transaction fee, so the ledger holds what was funded * The total and deposit boxes must be passed in the box references"
       },
       {
         "name": "approve_pool_vote",
         "args": [
+          {
+            "type": "uint64",
+            "name": "proposal_id"
+          },
+          {
+            "type": "bool",
+            "name": "approve"
+          },
           {
             "type": "axfer",
             "name": "txn"
@@ -267,8 +291,136 @@ export const APP_SPEC: AppSpec = {
         ],
         "returns": {
           "type": "(uint64,string)"
+        },
+        "desc": "Adds the ZAI transferred to the app to the tally of the proposal, for\nor against it as approve says. * Voting spends the ZAI: it stays in the app account and is not   returned to the voter when the vote ends * The tally box of the proposal must be passed in the box references"
+      },
+      {
+        "name": "get_vote_tallies",
+        "args": [
+          {
+            "type": "uint64[]",
+            "name": "proposal_ids"
+          }
+        ],
+        "returns": {
+          "type": "(uint64,uint64,uint64)[]"
+        },
+        "desc": "Returns the tally of every proposal, all zero for proposals that have\nnot been voted on * The tally boxes must be passed in the box references"
+      },
+      {
+        "name": "get_pool_totals",
+        "args": [
+          {
+            "type": "uint64[]",
+            "name": "assets"
+          }
+        ],
+        "returns": {
+          "type": "(uint64,uint64)[]"
+        },
+        "desc": "Returns the total funded into the pool and the number of depositors of\nevery asset * The total boxes must be passed in the box references"
+      },
+      {
+        "name": "get_pool_deposits",
+        "args": [
+          {
+            "type": "account",
+            "name": "depositor"
+          },
+          {
+            "type": "uint64[]",
+            "name": "assets"
+          }
+        ],
+        "returns": {
+          "type": "uint64[]"
+        },
+        "desc": "Returns the amount of every asset funded into the pool by the depositor.\nIts share of the pool is this amount over the asset total * The deposit boxes must be passed in the box references"
+      },
+      {
+        "name": "create",
+        "args": [],
+        "returns": {
+          "type": "bool"
+        }
+      },
+      {
+        "name": "update",
+        "args": [],
+        "returns": {
+          "type": "bool"
+        }
+      },
+      {
+        "name": "delete",
+        "args": [],
+        "returns": {
+          "type": "bool"
+        }
+      },
+      {
+        "name": "add_admin",
+        "args": [
+          {
+            "type": "account",
+            "name": "account"
+          }
+        ],
+        "returns": {
+          "type": "bool"
+        },
+        "desc": "* The admin box of the account must be passed in the box references"
+      },
+      {
+        "name": "remove_admin",
+        "args": [
+          {
+            "type": "account",
+            "name": "account"
+          }
+        ],
+        "returns": {
+          "type": "bool"
         }
       },
+      {
+        "name": "migrate_legacy_admins",
+        "args": [],
+        "returns": {
+          "type": "uint64"
+        },
+        "desc": "Moves the admins of the legacy global AddressArray into admin boxes\nand deletes the global key, so it can only run once. Returns the number of admins migrated. * Only the creator can migrate the admins * The admin box of every legacy admin must be passed in the box   references, pooled across the group when there are more than 8"
+      },
+      {
+        "name": "set_price_oracle",
+        "args": [
+          {
+            "type": "application",
+            "name": "oracle"
+          },
+          {
+            "type": "uint64",
+            "name": "cache_window"
+          }
+        ],
+        "returns": {
+          "type": "bool"
+        },
+        "desc": "* cache_window is the number of seconds a cached price is used for\nbefore the oracle is read again * The \"O\" price oracle box must be passed in the box references"
+      },
+      {
+        "name": "refresh_asset_prices",
+        "args": [
+          {
+            "type": "uint64[]",
+            "name": "assets"
+          }
+        ],
+        "returns": {
+          "type": "bool"
+        },
+        "desc": "Reads the oracle price of every asset passed into the price cache.\n* The price_oracle must be passed in the foreign apps array * The \"O\" price oracle box and the price boxes must be passed in the   box references"
+      },
       {
         "name": "opt_contract_into_asset",
         "args": [
@@ -384,6 +536,67 @@ export type ZaibatsuAuthAndDao = {
       argsTuple: [name: string]
       returns: string
     }>
+    & Record<'set_service_contract_address(address)bool' | 'set_service_contract_address', {
+      argsObj: {
+        address: string
+      }
+      argsTuple: [address: string]
+      returns: boolean
+    }>
+    & Record<'create_zaibatsu_token()uint64' | 'create_zaibatsu_token', {
+      argsObj: {
+      }
+      argsTuple: []
+      returns: bigint
+    }>
+    & Record<'transfer_zai(address,uint64,string)bool' | 'transfer_zai', {
+      argsObj: {
+        to: string
+        assetAmount: bigint | number
+        note: string
+      }
+      argsTuple: [to: string, assetAmount: bigint | number, note: string]
+      returns: boolean
+    }>
+    & Record<'fund_pool(uint64,axfer)(uint64,uint64,bool)' | 'fund_pool', {
+      argsObj: {
+        fundAmount: bigint | number
+        txn: TransactionToSign | Transaction | Promise<SendTransactionResult>
+      }
+      argsTuple: [fundAmount: bigint | number, txn: TransactionToSign | Transaction | Promise<SendTransactionResult>]
+      returns: PoolFundResponse
+    }>
+    & Record<'approve_pool_vote(uint64,bool,axfer)(uint64,string)' | 'approve_pool_vote', {
+      argsObj: {
+        proposalId: bigint | number
+        approve: boolean
+        txn: TransactionToSign | Transaction | Promise<SendTransactionResult>
+      }
+      argsTuple: [proposalId: bigint | number, approve: boolean, txn: TransactionToSign | Transaction | Promise<SendTransactionResult>]
+      returns: PoolVoteApprovalResponse
+    }>
+    & Record<'get_vote_tallies(uint64[])(uint64,uint64,uint64)[]' | 'get_vote_tallies', {
+      argsObj: {
+        proposalIds: bigint | number[]
+      }
+      argsTuple: [proposalIds: bigint | number[]]
+      returns: [bigint, bigint, bigint][]
+    }>
+    & Record<'get_pool_totals(uint64[])(uint64,uint64)[]' | 'get_pool_totals', {
+      argsObj: {
+        assets: bigint | number[]
+      }
+      argsTuple: [assets: bigint | number[]]
+      returns: [bigint, bigint][]
+    }>
+    & Record<'get_pool_deposits(account,uint64[])uint64[]' | 'get_pool_deposits', {
+      argsObj: {
+        depositor: string | Uint8Array
+        assets: bigint | number[]
+      }
+      argsTuple: [depositor: string | Uint8Array, assets: bigint | number[]]
+      returns: bigint[]
+    }>
     & Record<'create()bool' | 'create', {
       argsObj: {
       }
@@ -402,43 +615,40 @@ export type ZaibatsuAuthAndDao = {
       argsTuple: []
       returns: boolean
     }>
-    & Record<'set_service_contract_address(address)bool' | 'set_service_contract_address', {
+    & Record<'add_admin(account)bool' | 'add_admin', {
       argsObj: {
-        address: string
+        account: string | Uint8Array
       }
-      argsTuple: [address: string]
+      argsTuple: [account: string | Uint8Array]
       returns: boolean
     }>
-    & Record<'create_zaibatsu_token()uint64' | 'create_zaibatsu_token', {
+    & Record<'remove_admin(account)bool' | 'remove_admin', {
       argsObj: {
+        account: string | Uint8Array
       }
-      argsTuple: []
-      returns: bigint
+      argsTuple: [account: string | Uint8Array]
+      returns: boolean
     }>
-    & Record<'transfer_zai(address,uint64,string)bool' | 'transfer_zai', {
+    & Record<'migrate_legacy_admins()uint64' | 'migrate_legacy_admins', {
       argsObj: {
-        to: string
-        assetAmount: bigint | number
-        note: string
       }
-      argsTuple: [to: string, assetAmount: bigint | number, note: string]
-      returns: boolean
+      argsTuple: []
+      returns: bigint
     }>
-    & Record<'fund_pool(uint64,application,axfer)(uint64,uint64,bool)' | 'fund_pool', {
+    & Record<'set_price_oracle(application,uint64)bool' | 'set_price_oracle', {
       argsObj: {
-        fundAmount: bigint | number
-        folksFeedOracle: number | bigint
-        txn: TransactionToSign | Transaction | Promise<SendTransactionResult>
+        oracle: number | bigint
+        cacheWindow: bigint | number
       }
-      argsTuple: [fundAmount: bigint | number, folksFeedOracle: number | bigint, txn: TransactionToSign | Transaction | Promise<SendTransactionResult>]
-      returns: PoolFundResponse
+      argsTuple: [oracle: number | bigint, cacheWindow: bigint | number]
+      returns: boolean
     }>
-    & Record<'approve_pool_vote(axfer)(uint64,string)' | 'approve_pool_vote', {
+    & Record<'refresh_asset_prices(uint64[])bool' | 'refresh_asset_prices', {
       argsObj: {
-        txn: TransactionToSign | Transaction | Promise<SendTransactionResult>
+        assets: bigint | number[]
       }
-      argsTuple: [txn: TransactionToSign | Transaction | Promise<SendTransactionResult>]
-      returns: PoolVoteApprovalResponse
+      argsTuple: [assets: bigint | number[]]
+      returns: boolean
     }>
     & Record<'opt_contract_into_asset(asset)bool' | 'opt_contract_into_asset', {
       argsObj: {
@@ -461,7 +671,6 @@ export type ZaibatsuAuthAndDao = {
    */
   state: {
     global: {
-      admins?: BinaryState
       serviceContract?: BinaryState
       serviceContractAddress?: BinaryState
       zaiTokenAssetId?: BinaryState
@@ -620,40 +829,170 @@ export abstract class ZaibatsuAuthAndDaoCallFactory {
       },
     }
   }
-
+
+  /**
+   * Gets available delete call factories
+   */
+  static get delete() {
+    return {
+      /**
+       * Constructs a delete call for the ZaibatsuAuthAndDao smart contract using the delete()bool ABI method
+       *
+       * @param args Any args for the contract call
+       * @param params Any additional parameters for the call
+       * @returns A TypedCallParams object for the call
+       */
+      delete(args: MethodArgs<'delete()bool'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+        return {
+          method: 'delete()bool' as const,
+          methodArgs: Array.isArray(args) ? args : [],
+          ...params,
+        }
+      },
+    }
+  }
+
+  /**
+   * Constructs a no op call for the hello(string)string ABI method
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static hello(args: MethodArgs<'hello(string)string'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'hello(string)string' as const,
+      methodArgs: Array.isArray(args) ? args : [args.name],
+      ...params,
+    }
+  }
+  /**
+   * Constructs a no op call for the set_service_contract_address(address)bool ABI method
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static setServiceContractAddress(args: MethodArgs<'set_service_contract_address(address)bool'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'set_service_contract_address(address)bool' as const,
+      methodArgs: Array.isArray(args) ? args : [args.address],
+      ...params,
+    }
+  }
+  /**
+   * Constructs a no op call for the create_zaibatsu_token()uint64 ABI method
+   *
+   * Creates the ZAI token, or moves its id out of the legacy ZAI box on
+   * apps that still have one. Returns the ZAI asset id * The ZAI box must be passed in the box references until the token id   has been set
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static createZaibatsuToken(args: MethodArgs<'create_zaibatsu_token()uint64'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'create_zaibatsu_token()uint64' as const,
+      methodArgs: Array.isArray(args) ? args : [],
+      ...params,
+    }
+  }
+  /**
+   * Constructs a no op call for the transfer_zai(address,uint64,string)bool ABI method
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static transferZai(args: MethodArgs<'transfer_zai(address,uint64,string)bool'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'transfer_zai(address,uint64,string)bool' as const,
+      methodArgs: Array.isArray(args) ? args : [args.to, args.assetAmount, args.note],
+      ...params,
+    }
+  }
+  /**
+   * Constructs a no op call for the fund_pool(uint64,axfer)(uint64,uint64,bool) ABI method
+   *
+   * Records fund_amount in the pool ledger, under the asset total and the
+   * sender's deposit. * The txn must transfer exactly fund_amount plus the 1% transaction fee, so the ledger holds what was funded * The total and deposit boxes must be passed in the box references
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static fundPool(args: MethodArgs<'fund_pool(uint64,axfer)(uint64,uint64,bool)'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'fund_pool(uint64,axfer)(uint64,uint64,bool)' as const,
+      methodArgs: Array.isArray(args) ? args : [args.fundAmount, args.txn],
+      ...params,
+    }
+  }
+  /**
+   * Constructs a no op call for the approve_pool_vote(uint64,bool,axfer)(uint64,string) ABI method
+   *
+   * Adds the ZAI transferred to the app to the tally of the proposal, for
+   * or against it as approve says. * Voting spends the ZAI: it stays in the app account and is not   returned to the voter when the vote ends * The tally box of the proposal must be passed in the box references
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static approvePoolVote(args: MethodArgs<'approve_pool_vote(uint64,bool,axfer)(uint64,string)'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'approve_pool_vote(uint64,bool,axfer)(uint64,string)' as const,
+      methodArgs: Array.isArray(args) ? args : [args.proposalId, args.approve, args.txn],
+      ...params,
+    }
+  }
+  /**
+   * Constructs a no op call for the get_vote_tallies(uint64[])(uint64,uint64,uint64)[] ABI method
+   *
+   * Returns the tally of every proposal, all zero for proposals that have
+   * not been voted on * The tally boxes must be passed in the box references
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static getVoteTallies(args: MethodArgs<'get_vote_tallies(uint64[])(uint64,uint64,uint64)[]'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'get_vote_tallies(uint64[])(uint64,uint64,uint64)[]' as const,
+      methodArgs: Array.isArray(args) ? args : [args.proposalIds],
+      ...params,
+    }
+  }
   /**
-   * Gets available delete call factories
+   * Constructs a no op call for the get_pool_totals(uint64[])(uint64,uint64)[] ABI method
+   *
+   * Returns the total funded into the pool and the number of depositors of
+   * every asset * The total boxes must be passed in the box references
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
    */
-  static get delete() {
+  static getPoolTotals(args: MethodArgs<'get_pool_totals(uint64[])(uint64,uint64)[]'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
     return {
-      /**
-       * Constructs a delete call for the ZaibatsuAuthAndDao smart contract using the delete()bool ABI method
-       *
-       * @param args Any args for the contract call
-       * @param params Any additional parameters for the call
-       * @returns A TypedCallParams object for the call
-       */
-      delete(args: MethodArgs<'delete()bool'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
-        return {
-          method: 'delete()bool' as const,
-          methodArgs: Array.isArray(args) ? args : [],
-          ...params,
-        }
-      },
+      method: 'get_pool_totals(uint64[])(uint64,uint64)[]' as const,
+      methodArgs: Array.isArray(args) ? args : [args.assets],
+      ...params,
     }
   }
-
   /**
-   * Constructs a no op call for the hello(string)string ABI method
+   * Constructs a no op call for the get_pool_deposits(account,uint64[])uint64[] ABI method
+   *
+   * Returns the amount of every asset funded into the pool by the depositor.
+   * Its share of the pool is this amount over the asset total * The deposit boxes must be passed in the box references
    *
    * @param args Any args for the contract call
    * @param params Any additional parameters for the call
    * @returns A TypedCallParams object for the call
    */
-  static hello(args: MethodArgs<'hello(string)string'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+  static getPoolDeposits(args: MethodArgs<'get_pool_deposits(account,uint64[])uint64[]'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
     return {
-      method: 'hello(string)string' as const,
-      methodArgs: Array.isArray(args) ? args : [args.name],
+      method: 'get_pool_deposits(account,uint64[])uint64[]' as const,
+      methodArgs: Array.isArray(args) ? args : [args.depositor, args.assets],
       ...params,
     }
   }
@@ -672,72 +1011,83 @@ export abstract class ZaibatsuAuthAndDaoCallFactory {
     }
   }
   /**
-   * Constructs a no op call for the set_service_contract_address(address)bool ABI method
+   * Constructs a no op call for the add_admin(account)bool ABI method
+   *
+   * * The admin box of the account must be passed in the box references
    *
    * @param args Any args for the contract call
    * @param params Any additional parameters for the call
    * @returns A TypedCallParams object for the call
    */
-  static setServiceContractAddress(args: MethodArgs<'set_service_contract_address(address)bool'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+  static addAdmin(args: MethodArgs<'add_admin(account)bool'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
     return {
-      method: 'set_service_contract_address(address)bool' as const,
-      methodArgs: Array.isArray(args) ? args : [args.address],
+      method: 'add_admin(account)bool' as const,
+      methodArgs: Array.isArray(args) ? args : [args.account],
       ...params,
     }
   }
   /**
-   * Constructs a no op call for the create_zaibatsu_token()uint64 ABI method
+   * Constructs a no op call for the remove_admin(account)bool ABI method
    *
    * @param args Any args for the contract call
    * @param params Any additional parameters for the call
    * @returns A TypedCallParams object for the call
    */
-  static createZaibatsuToken(args: MethodArgs<'create_zaibatsu_token()uint64'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+  static removeAdmin(args: MethodArgs<'remove_admin(account)bool'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
     return {
-      method: 'create_zaibatsu_token()uint64' as const,
-      methodArgs: Array.isArray(args) ? args : [],
+      method: 'remove_admin(account)bool' as const,
+      methodArgs: Array.isArray(args) ? args : [args.account],
       ...params,
     }
   }
   /**
-   * Constructs a no op call for the transfer_zai(address,uint64,string)bool ABI method
+   * Constructs a no op call for the migrate_legacy_admins()uint64 ABI method
+   *
+   * Moves the admins of the legacy global AddressArray into admin boxes
+   * and deletes the global key, so it can only run once. Returns the number of admins migrated. * Only the creator can migrate the admins * The admin box of every legacy admin must be passed in the box   references, pooled across the group when there are more than 8
    *
    * @param args Any args for the contract call
    * @param params Any additional parameters for the call
    * @returns A TypedCallParams object for the call
    */
-  static transferZai(args: MethodArgs<'transfer_zai(address,uint64,string)bool'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+  static migrateLegacyAdmins(args: MethodArgs<'migrate_legacy_admins()uint64'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
     return {
-      method: 'transfer_zai(address,uint64,string)bool' as const,
-      methodArgs: Array.isArray(args) ? args : [args.to, args.assetAmount, args.note],
+      method: 'migrate_legacy_admins()uint64' as const,
+      methodArgs: Array.isArray(args) ? args : [],
       ...params,
     }
   }
   /**
-   * Constructs a no op call for the fund_pool(uint64,application,axfer)(uint64,uint64,bool) ABI method
+   * Constructs a no op call for the set_price_oracle(application,uint64)bool ABI method
+   *
+   * * cache_window is the number of seconds a cached price is used for
+   * before the oracle is read again * The "O" price oracle box must be passed in the box references
    *
    * @param args Any args for the contract call
    * @param params Any additional parameters for the call
    * @returns A TypedCallParams object for the call
    */
-  static fundPool(args: MethodArgs<'fund_pool(uint64,application,axfer)(uint64,uint64,bool)'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+  static setPriceOracle(args: MethodArgs<'set_price_oracle(application,uint64)bool'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
     return {
-      method: 'fund_pool(uint64,application,axfer)(uint64,uint64,bool)' as const,
-      methodArgs: Array.isArray(args) ? args : [args.fundAmount, args.folksFeedOracle, args.txn],
+      method: 'set_price_oracle(application,uint64)bool' as const,
+      methodArgs: Array.isArray(args) ? args : [args.oracle, args.cacheWindow],
       ...params,
     }
   }
   /**
-   * Constructs a no op call for the approve_pool_vote(axfer)(uint64,string) ABI method
+   * Constructs a no op call for the refresh_asset_prices(uint64[])bool ABI method
+   *
+   * Reads the oracle price of every asset passed into the price cache.
+   * * The price_oracle must be passed in the foreign apps array * The "O" price oracle box and the price boxes must be passed in the   box references
    *
    * @param args Any args for the contract call
    * @param params Any additional parameters for the call
    * @returns A TypedCallParams object for the call
    */
-  static approvePoolVote(args: MethodArgs<'approve_pool_vote(axfer)(uint64,string)'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+  static refreshAssetPrices(args: MethodArgs<'refresh_asset_prices(uint64[])bool'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
     return {
-      method: 'approve_pool_vote(axfer)(uint64,string)' as const,
-      methodArgs: Array.isArray(args) ? args : [args.txn],
+      method: 'refresh_asset_prices(uint64[])bool' as const,
+      methodArgs: Array.isArray(args) ? args : [args.assets],
       ...params,
     }
   }
@@ -921,17 +1271,6 @@ export class ZaibatsuAuthAndDaoClient {
     return this.call(ZaibatsuAuthAndDaoCallFactory.hello(args, params))
   }
 
-  /**
-   * Calls the create()bool ABI method.
-   *
-   * @param args The arguments for the contract call
-   * @param params Any additional parameters for the call
-   * @returns The result of the call
-   */
-  public create(args: MethodArgs<'create()bool'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
-    return this.call(ZaibatsuAuthAndDaoCallFactory.create(args, params))
-  }
-
   /**
    * Calls the set_service_contract_address(address)bool ABI method.
    *
@@ -946,6 +1285,9 @@ export class ZaibatsuAuthAndDaoClient {
   /**
    * Calls the create_zaibatsu_token()uint64 ABI method.
    *
+   * Creates the ZAI token, or moves its id out of the legacy ZAI box on
+   * apps that still have one. Returns the ZAI asset id * The ZAI box must be passed in the box references until the token id   has been set
+   *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The result of the call
@@ -966,27 +1308,152 @@ export class ZaibatsuAuthAndDaoClient {
   }
 
   /**
-   * Calls the fund_pool(uint64,application,axfer)(uint64,uint64,bool) ABI method.
+   * Calls the fund_pool(uint64,axfer)(uint64,uint64,bool) ABI method.
+   *
+   * Records fund_amount in the pool ledger, under the asset total and the
+   * sender's deposit. * The txn must transfer exactly fund_amount plus the 1% transaction fee, so the ledger holds what was funded * The total and deposit boxes must be passed in the box references
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The result of the call
    */
-  public fundPool(args: MethodArgs<'fund_pool(uint64,application,axfer)(uint64,uint64,bool)'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+  public fundPool(args: MethodArgs<'fund_pool(uint64,axfer)(uint64,uint64,bool)'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
     return this.call(ZaibatsuAuthAndDaoCallFactory.fundPool(args, params), PoolFundResponse)
   }
 
   /**
-   * Calls the approve_pool_vote(axfer)(uint64,string) ABI method.
+   * Calls the approve_pool_vote(uint64,bool,axfer)(uint64,string) ABI method.
+   *
+   * Adds the ZAI transferred to the app to the tally of the proposal, for
+   * or against it as approve says. * Voting spends the ZAI: it stays in the app account and is not   returned to the voter when the vote ends * The tally box of the proposal must be passed in the box references
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The result of the call
    */
-  public approvePoolVote(args: MethodArgs<'approve_pool_vote(axfer)(uint64,string)'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+  public approvePoolVote(args: MethodArgs<'approve_pool_vote(uint64,bool,axfer)(uint64,string)'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
     return this.call(ZaibatsuAuthAndDaoCallFactory.approvePoolVote(args, params), PoolVoteApprovalResponse)
   }
 
+  /**
+   * Calls the get_vote_tallies(uint64[])(uint64,uint64,uint64)[] ABI method.
+   *
+   * Returns the tally of every proposal, all zero for proposals that have
+   * not been voted on * The tally boxes must be passed in the box references
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public getVoteTallies(args: MethodArgs<'get_vote_tallies(uint64[])(uint64,uint64,uint64)[]'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(ZaibatsuAuthAndDaoCallFactory.getVoteTallies(args, params))
+  }
+
+  /**
+   * Calls the get_pool_totals(uint64[])(uint64,uint64)[] ABI method.
+   *
+   * Returns the total funded into the pool and the number of depositors of
+   * every asset * The total boxes must be passed in the box references
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public getPoolTotals(args: MethodArgs<'get_pool_totals(uint64[])(uint64,uint64)[]'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(ZaibatsuAuthAndDaoCallFactory.getPoolTotals(args, params))
+  }
+
+  /**
+   * Calls the get_pool_deposits(account,uint64[])uint64[] ABI method.
+   *
+   * Returns the amount of every asset funded into the pool by the depositor.
+   * Its share of the pool is this amount over the asset total * The deposit boxes must be passed in the box references
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public getPoolDeposits(args: MethodArgs<'get_pool_deposits(account,uint64[])uint64[]'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(ZaibatsuAuthAndDaoCallFactory.getPoolDeposits(args, params))
+  }
+
+  /**
+   * Calls the create()bool ABI method.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public create(args: MethodArgs<'create()bool'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(ZaibatsuAuthAndDaoCallFactory.create(args, params))
+  }
+
+  /**
+   * Calls the add_admin(account)bool ABI method.
+   *
+   * * The admin box of the account must be passed in the box references
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public addAdmin(args: MethodArgs<'add_admin(account)bool'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(ZaibatsuAuthAndDaoCallFactory.addAdmin(args, params))
+  }
+
+  /**
+   * Calls the remove_admin(account)bool ABI method.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public removeAdmin(args: MethodArgs<'remove_admin(account)bool'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(ZaibatsuAuthAndDaoCallFactory.removeAdmin(args, params))
+  }
+
+  /**
+   * Calls the migrate_legacy_admins()uint64 ABI method.
+   *
+   * Moves the admins of the legacy global AddressArray into admin boxes
+   * and deletes the global key, so it can only run once. Returns the number of admins migrated. * Only the creator can migrate the admins * The admin box of every legacy admin must be passed in the box   references, pooled across the group when there are more than 8
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public migrateLegacyAdmins(args: MethodArgs<'migrate_legacy_admins()uint64'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(ZaibatsuAuthAndDaoCallFactory.migrateLegacyAdmins(args, params))
+  }
+
+  /**
+   * Calls the set_price_oracle(application,uint64)bool ABI method.
+   *
+   * * cache_window is the number of seconds a cached price is used for
+   * before the oracle is read again * The "O" price oracle box must be passed in the box references
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public setPriceOracle(args: MethodArgs<'set_price_oracle(application,uint64)bool'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(ZaibatsuAuthAndDaoCallFactory.setPriceOracle(args, params))
+  }
+
+  /**
+   * Calls the refresh_asset_prices(uint64[])bool ABI method.
+   *
+   * Reads the oracle price of every asset passed into the price cache.
+   * * The price_oracle must be passed in the foreign apps array * The "O" price oracle box and the price boxes must be passed in the   box references
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public refreshAssetPrices(args: MethodArgs<'refresh_asset_prices(uint64[])bool'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(ZaibatsuAuthAndDaoCallFactory.refreshAssetPrices(args, params))
+  }
+
   /**
    * Calls the opt_contract_into_asset(asset)bool ABI method.
    *
@@ -1059,9 +1526,6 @@ export class ZaibatsuAuthAndDaoClient {
   public async getGlobalState(): Promise<ZaibatsuAuthAndDao['state']['global']> {
     const state = await this.appClient.getGlobalState()
     return {
-      get admins() {
-        return ZaibatsuAuthAndDaoClient.getBinaryState(state, 'admins')
-      },
       get serviceContract() {
         return ZaibatsuAuthAndDaoClient.getBinaryState(state, 'service_contract')
       },
@@ -1085,11 +1549,6 @@ export class ZaibatsuAuthAndDaoClient {
         resultMappers.push(undefined)
         return this
       },
-      create(args: MethodArgs<'create()bool'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
-        promiseChain = promiseChain.then(() => client.create(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
-        resultMappers.push(undefined)
-        return this
-      },
       setServiceContractAddress(args: MethodArgs<'set_service_contract_address(address)bool'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
         promiseChain = promiseChain.then(() => client.setServiceContractAddress(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
         resultMappers.push(undefined)
@@ -1105,16 +1564,61 @@ export class ZaibatsuAuthAndDaoClient {
         resultMappers.push(undefined)
         return this
       },
-      fundPool(args: MethodArgs<'fund_pool(uint64,application,axfer)(uint64,uint64,bool)'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+      fundPool(args: MethodArgs<'fund_pool(uint64,axfer)(uint64,uint64,bool)'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
         promiseChain = promiseChain.then(() => client.fundPool(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
         resultMappers.push(PoolFundResponse)
         return this
       },
-      approvePoolVote(args: MethodArgs<'approve_pool_vote(axfer)(uint64,string)'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+      approvePoolVote(args: MethodArgs<'approve_pool_vote(uint64,bool,axfer)(uint64,string)'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
         promiseChain = promiseChain.then(() => client.approvePoolVote(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
         resultMappers.push(PoolVoteApprovalResponse)
         return this
       },
+      getVoteTallies(args: MethodArgs<'get_vote_tallies(uint64[])(uint64,uint64,uint64)[]'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.getVoteTallies(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
+      getPoolTotals(args: MethodArgs<'get_pool_totals(uint64[])(uint64,uint64)[]'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.getPoolTotals(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
+      getPoolDeposits(args: MethodArgs<'get_pool_deposits(account,uint64[])uint64[]'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.getPoolDeposits(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
+      create(args: MethodArgs<'create()bool'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.create(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
+      addAdmin(args: MethodArgs<'add_admin(account)bool'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.addAdmin(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
+      removeAdmin(args: MethodArgs<'remove_admin(account)bool'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.removeAdmin(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
+      migrateLegacyAdmins(args: MethodArgs<'migrate_legacy_admins()uint64'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.migrateLegacyAdmins(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
+      setPriceOracle(args: MethodArgs<'set_price_oracle(application,uint64)bool'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.setPriceOracle(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
+      refreshAssetPrices(args: MethodArgs<'refresh_asset_prices(uint64[])bool'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.refreshAssetPrices(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
       optContractIntoAsset(args: MethodArgs<'opt_contract_into_asset(asset)bool'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
         promiseChain = promiseChain.then(() => client.optContractIntoAsset(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
         resultMappers.push(undefined)
@@ -1187,6 +1691,96 @@ export type ZaibatsuAuthAndDaoComposer<TReturns extends [...any[]] = []> = {
    */
   hello(args: MethodArgs<'hello(string)string'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuAuthAndDaoComposer<[...TReturns, MethodReturn<'hello(string)string'>]>
 
+  /**
+   * Calls the set_service_contract_address(address)bool ABI method.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  setServiceContractAddress(args: MethodArgs<'set_service_contract_address(address)bool'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuAuthAndDaoComposer<[...TReturns, MethodReturn<'set_service_contract_address(address)bool'>]>
+
+  /**
+   * Calls the create_zaibatsu_token()uint64 ABI method.
+   *
+   * Creates the ZAI token, or moves its id out of the legacy ZAI box on
+   * apps that still have one. Returns the ZAI asset id * The ZAI box must be passed in the box references until the token id   has been set
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  createZaibatsuToken(args: MethodArgs<'create_zaibatsu_token()uint64'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuAuthAndDaoComposer<[...TReturns, MethodReturn<'create_zaibatsu_token()uint64'>]>
+
+  /**
+   * Calls the transfer_zai(address,uint64,string)bool ABI method.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  transferZai(args: MethodArgs<'transfer_zai(address,uint64,string)bool'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuAuthAndDaoComposer<[...TReturns, MethodReturn<'transfer_zai(address,uint64,string)bool'>]>
+
+  /**
+   * Calls the fund_pool(uint64,axfer)(uint64,uint64,bool) ABI method.
+   *
+   * Records fund_amount in the pool ledger, under the asset total and the
+   * sender's deposit. * The txn must transfer exactly fund_amount plus the 1% transaction fee, so the ledger holds what was funded * The total and deposit boxes must be passed in the box references
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  fundPool(args: MethodArgs<'fund_pool(uint64,axfer)(uint64,uint64,bool)'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuAuthAndDaoComposer<[...TReturns, MethodReturn<'fund_pool(uint64,axfer)(uint64,uint64,bool)'>]>
+
+  /**
+   * Calls the approve_pool_vote(uint64,bool,axfer)(uint64,string) ABI method.
+   *
+   * Adds the ZAI transferred to the app to the tally of the proposal, for
+   * or against it as approve says. * Voting spends the ZAI: it stays in the app account and is not   returned to the voter when the vote ends * The tally box of the proposal must be passed in the box references
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  approvePoolVote(args: MethodArgs<'approve_pool_vote(uint64,bool,axfer)(uint64,string)'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuAuthAndDaoComposer<[...TReturns, MethodReturn<'approve_pool_vote(uint64,bool,axfer)(uint64,string)'>]>
+
+  /**
+   * Calls the get_vote_tallies(uint64[])(uint64,uint64,uint64)[] ABI method.
+   *
+   * Returns the tally of every proposal, all zero for proposals that have
+   * not been voted on * The tally boxes must be passed in the box references
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getVoteTallies(args: MethodArgs<'get_vote_tallies(uint64[])(uint64,uint64,uint64)[]'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuAuthAndDaoComposer<[...TReturns, MethodReturn<'get_vote_tallies(uint64[])(uint64,uint64,uint64)[]'>]>
+
+  /**
+   * Calls the get_pool_totals(uint64[])(uint64,uint64)[] ABI method.
+   *
+   * Returns the total funded into the pool and the number of depositors of
+   * every asset * The total boxes must be passed in the box references
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getPoolTotals(args: MethodArgs<'get_pool_totals(uint64[])(uint64,uint64)[]'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuAuthAndDaoComposer<[...TReturns, MethodReturn<'get_pool_totals(uint64[])(uint64,uint64)[]'>]>
+
+  /**
+   * Calls the get_pool_deposits(account,uint64[])uint64[] ABI method.
+   *
+   * Returns the amount of every asset funded into the pool by the depositor.
+   * Its share of the pool is this amount over the asset total * The deposit boxes must be passed in the box references
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getPoolDeposits(args: MethodArgs<'get_pool_deposits(account,uint64[])uint64[]'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuAuthAndDaoComposer<[...TReturns, MethodReturn<'get_pool_deposits(account,uint64[])uint64[]'>]>
+
   /**
    * Calls the create()bool ABI method.
    *
@@ -1197,49 +1791,60 @@ export type ZaibatsuAuthAndDaoComposer<TReturns extends [...any[]] = []> = {
   create(args: MethodArgs<'create()bool'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuAuthAndDaoComposer<[...TReturns, MethodReturn<'create()bool'>]>
 
   /**
-   * Calls the set_service_contract_address(address)bool ABI method.
+   * Calls the add_admin(account)bool ABI method.
+   *
+   * * The admin box of the account must be passed in the box references
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
    */
-  setServiceContractAddress(args: MethodArgs<'set_service_contract_address(address)bool'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuAuthAndDaoComposer<[...TReturns, MethodReturn<'set_service_contract_address(address)bool'>]>
+  addAdmin(args: MethodArgs<'add_admin(account)bool'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuAuthAndDaoComposer<[...TReturns, MethodReturn<'add_admin(account)bool'>]>
 
   /**
-   * Calls the create_zaibatsu_token()uint64 ABI method.
+   * Calls the remove_admin(account)bool ABI method.
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
    */
-  createZaibatsuToken(args: MethodArgs<'create_zaibatsu_token()uint64'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuAuthAndDaoComposer<[...TReturns, MethodReturn<'create_zaibatsu_token()uint64'>]>
+  removeAdmin(args: MethodArgs<'remove_admin(account)bool'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuAuthAndDaoComposer<[...TReturns, MethodReturn<'remove_admin(account)bool'>]>
 
   /**
-   * Calls the transfer_zai(address,uint64,string)bool ABI method.
+   * Calls the migrate_legacy_admins()uint64 ABI method.
+   *
+   * Moves the admins of the legacy global AddressArray into admin boxes
+   * and deletes the global key, so it can only run once. Returns the number of admins migrated. * Only the creator can migrate the admins * The admin box of every legacy admin must be passed in the box   references, pooled across the group when there are more than 8
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
    */
-  transferZai(args: MethodArgs<'transfer_zai(address,uint64,string)bool'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuAuthAndDaoComposer<[...TReturns, MethodReturn<'transfer_zai(address,uint64,string)bool'>]>
+  migrateLegacyAdmins(args: MethodArgs<'migrate_legacy_admins()uint64'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuAuthAndDaoComposer<[...TReturns, MethodReturn<'migrate_legacy_admins()uint64'>]>
 
   /**
-   * Calls the fund_pool(uint64,application,axfer)(uint64,uint64,bool) ABI method.
+   * Calls the set_price_oracle(application,uint64)bool ABI method.
+   *
+   * * cache_window is the number of seconds a cached price is used for
+   * before the oracle is read again * The "O" price oracle box must be passed in the box references
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
    */
-  fundPool(args: MethodArgs<'fund_pool(uint64,application,axfer)(uint64,uint64,bool)'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuAuthAndDaoComposer<[...TReturns, MethodReturn<'fund_pool(uint64,application,axfer)(uint64,uint64,bool)'>]>
+  setPriceOracle(args: MethodArgs<'set_price_oracle(application,uint64)bool'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuAuthAndDaoComposer<[...TReturns, MethodReturn<'set_price_oracle(application,uint64)bool'>]>
 
   /**
-   * Calls the approve_pool_vote(axfer)(uint64,string) ABI method.
+   * Calls the refresh_asset_prices(uint64[])bool ABI method.
+   *
+   * Reads the oracle price of every asset passed into the price cache.
+   * * The price_oracle must be passed in the foreign apps array * The "O" price oracle box and the price boxes must be passed in the   box references
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
    */
-  approvePoolVote(args: MethodArgs<'approve_pool_vote(axfer)(uint64,string)'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuAuthAndDaoComposer<[...TReturns, MethodReturn<'approve_pool_vote(axfer)(uint64,string)'>]>
+  refreshAssetPrices(args: MethodArgs<'refresh_asset_prices(uint64[])bool'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuAuthAndDaoComposer<[...TReturns, MethodReturn<'refresh_asset_prices(uint64[])bool'>]>
 
   /**
    * Calls the opt_contract_into_asset(asset)bool ABI method.
@@ -31,7 +31,7 @@ import type { ABIResult, TransactionWithSigner } from 'algosdk'
 import { Algodv2, OnApplicationComplete, Transaction, AtomicTransactionComposer, modelsv2 } from 'algosdk'
 export const APP_SPEC: AppSpec = {
   "hints": {
-    "initiate_loan_purchase(byte[],application,(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64),axfer)(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64)": {
+    "initiate_loan_purchase((string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64),axfer)byte[8]": {
       "call_config": {
         "no_op": "CALL"
       },
@@ -112,87 +112,15 @@ export const APP_SPEC: AppSpec = {
               "uint64"
             ]
           ]
-        },
-        "output": {
-          "name": "LoanDetails",
-          "elements": [
-            [
-              "loan_key",
-              "string"
-            ],
-            [
-              "loan_type",
-              "string"
-            ],
-            [
-              "tenure",
-              "uint8"
-            ],
-            [
-              "principal_asset_id",
-              "uint64"
-            ],
-            [
-              "collateral_asset_id",
-              "uint64"
-            ],
-            [
-              "interest_asset_amount",
-              "uint64"
-            ],
-            [
-              "principal_asset_amount",
-              "uint64"
-            ],
-            [
-              "collateral_asset_amount",
-              "uint64"
-            ],
-            [
-              "early_payment_penalty_amount",
-              "uint64"
-            ],
-            [
-              "payment_rounds",
-              "uint8"
-            ],
-            [
-              "payment_completion_timestamp",
-              "uint64"
-            ],
-            [
-              "payment_recipients",
-              "(uint64,address)[]"
-            ],
-            [
-              "collateral_paid",
-              "bool"
-            ],
-            [
-              "principal_paid",
-              "bool"
-            ],
-            [
-              "completed_payment_rounds",
-              "uint8"
-            ],
-            [
-              "borrower",
-              "address"
-            ],
-            [
-              "lender_nft_asser_id",
-              "uint64"
-            ],
-            [
-              "borrower_nft_asser_id",
-              "uint64"
-            ]
-          ]
         }
       }
     },
-    "complete_non_p2p_loan_purchase(byte[],(string,string,string,string),asset,account)(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64)": {
+    "initiate_loan_purchases((string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64)[])byte[8][]": {
+      "call_config": {
+        "no_op": "CALL"
+      }
+    },
+    "complete_non_p2p_loan_purchase(byte[],(string,string,string,string),asset,account)(uint8,uint8,uint8,uint8,uint8,bool,bool,bool,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,address,uint64)": {
       "call_config": {
         "no_op": "CALL"
       },
@@ -219,20 +147,40 @@ export const APP_SPEC: AppSpec = {
           ]
         },
         "output": {
-          "name": "LoanDetails",
+          "name": "LoanRecord",
           "elements": [
             [
-              "loan_key",
-              "string"
+              "version",
+              "uint8"
             ],
             [
               "loan_type",
-              "string"
+              "uint8"
             ],
             [
               "tenure",
               "uint8"
             ],
+            [
+              "payment_rounds",
+              "uint8"
+            ],
+            [
+              "completed_payment_rounds",
+              "uint8"
+            ],
+            [
+              "collateral_paid",
+              "bool"
+            ],
+            [
+              "principal_paid",
+              "bool"
+            ],
+            [
+              "payment_defaulted",
+              "bool"
+            ],
             [
               "principal_asset_id",
               "uint64"
@@ -257,47 +205,31 @@ export const APP_SPEC: AppSpec = {
               "early_payment_penalty_amount",
               "uint64"
             ],
-            [
-              "payment_rounds",
-              "uint8"
-            ],
             [
               "payment_completion_timestamp",
               "uint64"
             ],
             [
-              "payment_recipients",
-              "(uint64,address)[]"
-            ],
-            [
-              "collateral_paid",
-              "bool"
-            ],
-            [
-              "principal_paid",
-              "bool"
+              "lender_nft_asser_id",
+              "uint64"
             ],
             [
-              "completed_payment_rounds",
-              "uint8"
+              "borrower_nft_asser_id",
+              "uint64"
             ],
             [
               "borrower",
               "address"
             ],
             [
-              "lender_nft_asser_id",
-              "uint64"
-            ],
-            [
-              "borrower_nft_asser_id",
+              "active_loan_position",
               "uint64"
             ]
           ]
         }
       }
     },
-    "complete_p2p_loan_purchase(byte[],(string,string,string,string),asset,account,axfer)(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64)": {
+    "complete_p2p_loan_purchase(byte[],(string,string,string,string),asset,account,axfer)(uint8,uint8,uint8,uint8,uint8,bool,bool,bool,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,address,uint64)": {
       "call_config": {
         "no_op": "CALL"
       },
@@ -324,20 +256,40 @@ export const APP_SPEC: AppSpec = {
           ]
         },
         "output": {
-          "name": "LoanDetails",
+          "name": "LoanRecord",
           "elements": [
             [
-              "loan_key",
-              "string"
+              "version",
+              "uint8"
             ],
             [
               "loan_type",
-              "string"
+              "uint8"
             ],
             [
               "tenure",
               "uint8"
             ],
+            [
+              "payment_rounds",
+              "uint8"
+            ],
+            [
+              "completed_payment_rounds",
+              "uint8"
+            ],
+            [
+              "collateral_paid",
+              "bool"
+            ],
+            [
+              "principal_paid",
+              "bool"
+            ],
+            [
+              "payment_defaulted",
+              "bool"
+            ],
             [
               "principal_asset_id",
               "uint64"
@@ -362,69 +314,60 @@ export const APP_SPEC: AppSpec = {
               "early_payment_penalty_amount",
               "uint64"
             ],
-            [
-              "payment_rounds",
-              "uint8"
-            ],
             [
               "payment_completion_timestamp",
               "uint64"
             ],
             [
-              "payment_recipients",
-              "(uint64,address)[]"
-            ],
-            [
-              "collateral_paid",
-              "bool"
-            ],
-            [
-              "principal_paid",
-              "bool"
+              "lender_nft_asser_id",
+              "uint64"
             ],
             [
-              "completed_payment_rounds",
-              "uint8"
+              "borrower_nft_asser_id",
+              "uint64"
             ],
             [
               "borrower",
               "address"
             ],
             [
-              "lender_nft_asser_id",
-              "uint64"
-            ],
-            [
-              "borrower_nft_asser_id",
+              "active_loan_position",
               "uint64"
             ]
           ]
         }
       }
     },
-    "initiate_loan_repayment(byte[],string,axfer)void": {
+    "initiate_loan_repayment(byte[],axfer)byte[8]": {
       "call_config": {
         "no_op": "CALL"
       }
     },
-    "execute_loan_repayment(string,account,(uint64,address),asset)(bool,uint64)": {
+    "execute_loan_repayment(byte[],uint64,account,asset)(bool,uint64)": {
       "call_config": {
         "no_op": "CALL"
       },
       "structs": {
-        "payment_recipient": {
-          "name": "PaymentReciepient",
+        "output": {
+          "name": "ExecuteLoanRepaymentResponse",
           "elements": [
             [
-              "payment_percentage",
-              "uint64"
+              "loan_repayment_complete",
+              "bool"
             ],
             [
-              "recipient_address",
-              "address"
+              "percentage_paid",
+              "uint64"
             ]
           ]
-        },
+        }
+      }
+    },
+    "execute_loan_repayment_batch(byte[],asset)(bool,uint64)": {
+      "call_config": {
+        "no_op": "CALL"
+      },
+      "structs": {
         "output": {
           "name": "ExecuteLoanRepaymentResponse",
           "elements": [
@@ -440,7 +383,28 @@ export const APP_SPEC: AppSpec = {
         }
       }
     },
-    "clean_up_loan_repayment(string,account)(bool)": {
+    "clean_up_loan_repayment(byte[],account)(bool)": {
+      "call_config": {
+        "no_op": "CALL"
+      },
+      "structs": {
+        "output": {
+          "name": "CleanUpLoanRepaymentResponse",
+          "elements": [
+            [
+              "loan_repayment_complete",
+              "bool"
+            ]
+          ]
+        }
+      }
+    },
+    "clean_up_loan_repayments(byte[8][])bool[]": {
+      "call_config": {
+        "no_op": "CALL"
+      }
+    },
+    "repay_loan_round(byte[],axfer)(bool)": {
       "call_config": {
         "no_op": "CALL"
       },
@@ -456,7 +420,12 @@ export const APP_SPEC: AppSpec = {
         }
       }
     },
-    "handle_payment_default(string,string,uint64,uint64)void": {
+    "handle_payment_default(byte[],uint64,uint64)byte[8]": {
+      "call_config": {
+        "no_op": "CALL"
+      }
+    },
+    "handle_payment_defaults(byte[8][])(byte[8],uint64)[]": {
       "call_config": {
         "no_op": "CALL"
       }
@@ -466,6 +435,41 @@ export const APP_SPEC: AppSpec = {
         "no_op": "CALL"
       }
     },
+    "migrate_loan_record(byte[])byte[8]": {
+      "call_config": {
+        "no_op": "CALL"
+      }
+    },
+    "get_borrower_loans(account)byte[8][]": {
+      "read_only": true,
+      "call_config": {
+        "no_op": "CALL"
+      }
+    },
+    "get_loan_statuses(byte[8][])uint8[]": {
+      "read_only": true,
+      "call_config": {
+        "no_op": "CALL"
+      }
+    },
+    "get_amounts_due(byte[8][])uint64[]": {
+      "read_only": true,
+      "call_config": {
+        "no_op": "CALL"
+      }
+    },
+    "get_remaining_rounds(byte[8][])uint8[]": {
+      "read_only": true,
+      "call_config": {
+        "no_op": "CALL"
+      }
+    },
+    "get_repayment_progress(byte[8][])(bool,uint64)[]": {
+      "read_only": true,
+      "call_config": {
+        "no_op": "CALL"
+      }
+    },
     "create()bool": {
       "call_config": {
         "no_op": "ALL"
@@ -481,38 +485,59 @@ export const APP_SPEC: AppSpec = {
         "delete_application": "CALL"
       }
     },
-    "opt_contract_into_asset(asset)bool": {
+    "add_admin(account)bool": {
       "call_config": {
         "no_op": "CALL"
       }
     },
-    "transfer_asset(asset,uint64,account)bool": {
+    "remove_admin(account)bool": {
       "call_config": {
         "no_op": "CALL"
       }
-    }
-  },
-  "source": {
-    "approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzbWFydF9jb250cmFjdHMuemFpYmF0c3VfbG9hbi5jb250cmFjdC5aYWliYXRzdUxvYW4uYXBwcm92YWxfcHJvZ3JhbToKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBibnogbWFpbl9lbnRyeXBvaW50QDIKICAgIGNhbGxzdWIgX19pbml0X18KCm1haW5fZW50cnlwb2ludEAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MTcKICAgIC8vIGNsYXNzIFphaWJhdHN1TG9hbihaYWliYXRzdUJhc2UpOgogICAgbWV0aG9kICJpbml0aWF0ZV9sb2FuX3B1cmNoYXNlKGJ5dGVbXSxhcHBsaWNhdGlvbiwoc3RyaW5nLHN0cmluZyx1aW50OCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50OCx1aW50NjQsKHVpbnQ2NCxhZGRyZXNzKVtdLGJvb2wsYm9vbCx1aW50OCxhZGRyZXNzLHVpbnQ2NCx1aW50NjQpLGF4ZmVyKShzdHJpbmcsc3RyaW5nLHVpbnQ4LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ4LHVpbnQ2NCwodWludDY0LGFkZHJlc3MpW10sYm9vbCxib29sLHVpbnQ4LGFkZHJlc3MsdWludDY0LHVpbnQ2NCkiCiAgICBtZXRob2QgImNvbXBsZXRlX25vbl9wMnBfbG9hbl9wdXJjaGFzZShieXRlW10sKHN0cmluZyxzdHJpbmcsc3RyaW5nLHN0cmluZyksYXNzZXQsYWNjb3VudCkoc3RyaW5nLHN0cmluZyx1aW50OCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50OCx1aW50NjQsKHVpbnQ2NCxhZGRyZXNzKVtdLGJvb2wsYm9vbCx1aW50OCxhZGRyZXNzLHVpbnQ2NCx1aW50NjQpIgogICAgbWV0aG9kICJjb21wbGV0ZV9wMnBfbG9hbl9wdXJjaGFzZShieXRlW10sKHN0cmluZyxzdHJpbmcsc3RyaW5nLHN0cmluZyksYXNzZXQsYWNjb3VudCxheGZlcikoc3RyaW5nLHN0cmluZyx1aW50OCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50OCx1aW50NjQsKHVpbnQ2NCxhZGRyZXNzKVtdLGJvb2wsYm9vbCx1aW50OCxhZGRyZXNzLHVpbnQ2NCx1aW50NjQpIgogICAgbWV0aG9kICJpbml0aWF0ZV9sb2FuX3JlcGF5bWVudChieXRlW10sc3RyaW5nLGF4ZmVyKXZvaWQiCiAgICBtZXRob2QgImV4ZWN1dGVfbG9hbl9yZXBheW1lbnQoc3RyaW5nLGFjY291bnQsKHVpbnQ2NCxhZGRyZXNzKSxhc3NldCkoYm9vbCx1aW50NjQpIgogICAgbWV0aG9kICJjbGVhbl91cF9sb2FuX3JlcGF5bWVudChzdHJpbmcsYWNjb3VudCkoYm9vbCkiCiAgICBtZXRob2QgImhhbmRsZV9wYXltZW50X2RlZmF1bHQoc3RyaW5nLHN0cmluZyx1aW50NjQsdWludDY0KXZvaWQiCiAgICBtZXRob2QgImRlbGV0ZV9sb2FuKGJ5dGVbXSl2b2lkIgogICAgbWV0aG9kICJjcmVhdGUoKWJvb2wiCiAgICBtZXRob2QgInVwZGF0ZSgpYm9vbCIKICAgIG1ldGhvZCAiZGVsZXRlKClib29sIgogICAgbWV0aG9kICJvcHRfY29udHJhY3RfaW50b19hc3NldChhc3NldClib29sIgogICAgbWV0aG9kICJ0cmFuc2Zlcl9hc3NldChhc3NldCx1aW50NjQsYWNjb3VudClib29sIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl9pbml0aWF0ZV9sb2FuX3B1cmNoYXNlX3JvdXRlQDMgbWFpbl9jb21wbGV0ZV9ub25fcDJwX2xvYW5fcHVyY2hhc2Vfcm91dGVANCBtYWluX2NvbXBsZXRlX3AycF9sb2FuX3B1cmNoYXNlX3JvdXRlQDUgbWFpbl9pbml0aWF0ZV9sb2FuX3JlcGF5bWVudF9yb3V0ZUA2IG1haW5fZXhlY3V0ZV9sb2FuX3JlcGF5bWVudF9yb3V0ZUA3IG1haW5fY2xlYW5fdXBfbG9hbl9yZXBheW1lbnRfcm91dGVAOCBtYWluX2hhbmRsZV9wYXltZW50X2RlZmF1bHRfcm91dGVAOSBtYWluX2RlbGV0ZV9sb2FuX3JvdXRlQDEwIG1haW5fY3JlYXRlX3JvdXRlQDExIG1haW5fdXBkYXRlX3JvdXRlQDEyIG1haW5fZGVsZXRlX3JvdXRlQDEzIG1haW5fb3B0X2NvbnRyYWN0X2ludG9fYXNzZXRfcm91dGVAMTQgbWFpbl90cmFuc2Zlcl9hc3NldF9yb3V0ZUAxNQogICAgZXJyIC8vIHJlamVjdCB0cmFuc2FjdGlvbgoKbWFpbl9pbml0aWF0ZV9sb2FuX3B1cmNoYXNlX3JvdXRlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyNAogICAgLy8gQGE0LmFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxNwogICAgLy8gY2xhc3MgWmFpYmF0c3VMb2FuKFphaWJhdHN1QmFzZSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgYnRvaQogICAgdHhuYXMgQXBwbGljYXRpb25zCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50IDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludCBheGZlcgogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIGF4ZmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyNAogICAgLy8gQGE0LmFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGluaXRpYXRlX2xvYW5fcHVyY2hhc2UKICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fY29tcGxldGVfbm9uX3AycF9sb2FuX3B1cmNoYXNlX3JvdXRlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo1OAogICAgLy8gQGFwLmFyYzQuYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjE3CiAgICAvLyBjbGFzcyBaYWliYXRzdUxvYW4oWmFpYmF0c3VCYXNlKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGV4dHJhY3QgMiAwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBidG9pCiAgICB0eG5hcyBBc3NldHMKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIGJ0b2kKICAgIHR4bmFzIEFjY291bnRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo1OAogICAgLy8gQGFwLmFyYzQuYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgY29tcGxldGVfbm9uX3AycF9sb2FuX3B1cmNoYXNlCiAgICBieXRlIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX2NvbXBsZXRlX3AycF9sb2FuX3B1cmNoYXNlX3JvdXRlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxMDcKICAgIC8vIEBhcC5hcmM0LmFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxNwogICAgLy8gY2xhc3MgWmFpYmF0c3VMb2FuKFphaWJhdHN1QmFzZSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgYnRvaQogICAgdHhuYXMgQXNzZXRzCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA0CiAgICBidG9pCiAgICB0eG5hcyBBY2NvdW50cwogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludCAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnQgYXhmZXIKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBheGZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MTA3CiAgICAvLyBAYXAuYXJjNC5hYmltZXRob2QoKQogICAgY2FsbHN1YiBjb21wbGV0ZV9wMnBfbG9hbl9wdXJjaGFzZQogICAgYnl0ZSAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9pbml0aWF0ZV9sb2FuX3JlcGF5bWVudF9yb3V0ZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MTQ5CiAgICAvLyBAYXAuYXJjNC5hYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MTcKICAgIC8vIGNsYXNzIFphaWJhdHN1TG9hbihaYWliYXRzdUJhc2UpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGV4dHJhY3QgMiAwCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50IDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludCBheGZlcgogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIGF4ZmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxNDkKICAgIC8vIEBhcC5hcmM0LmFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGluaXRpYXRlX2xvYW5fcmVwYXltZW50CiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX2V4ZWN1dGVfbG9hbl9yZXBheW1lbnRfcm91dGVANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjE3NgogICAgLy8gQGFwLmFyYzQuYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjE3CiAgICAvLyBjbGFzcyBaYWliYXRzdUxvYW4oWmFpYmF0c3VCYXNlKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGV4dHJhY3QgMiAwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBidG9pCiAgICB0eG5hcyBBY2NvdW50cwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgYnRvaQogICAgdHhuYXMgQXNzZXRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxNzYKICAgIC8vIEBhcC5hcmM0LmFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGV4ZWN1dGVfbG9hbl9yZXBheW1lbnQKICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fY2xlYW5fdXBfbG9hbl9yZXBheW1lbnRfcm91dGVAODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjIzOQogICAgLy8gQGFwLmFyYzQuYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjE3CiAgICAvLyBjbGFzcyBaYWliYXRzdUxvYW4oWmFpYmF0c3VCYXNlKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGV4dHJhY3QgMiAwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBidG9pCiAgICB0eG5hcyBBY2NvdW50cwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MjM5CiAgICAvLyBAYXAuYXJjNC5hYmltZXRob2QoKQogICAgY2FsbHN1YiBjbGVhbl91cF9sb2FuX3JlcGF5bWVudAogICAgYnl0ZSAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9oYW5kbGVfcGF5bWVudF9kZWZhdWx0X3JvdXRlQDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyNzgKICAgIC8vIEBhcC5hcmM0LmFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxNwogICAgLy8gY2xhc3MgWmFpYmF0c3VMb2FuKFphaWJhdHN1QmFzZSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjI3OAogICAgLy8gQGFwLmFyYzQuYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgaGFuZGxlX3BheW1lbnRfZGVmYXVsdAogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9kZWxldGVfbG9hbl9yb3V0ZUAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjMwNgogICAgLy8gQGFwLmFyYzQuYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjE3CiAgICAvLyBjbGFzcyBaYWliYXRzdUxvYW4oWmFpYmF0c3VCYXNlKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTozMDYKICAgIC8vIEBhcC5hcmM0LmFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGRlbGV0ZV9sb2FuCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX2NyZWF0ZV9yb3V0ZUAxMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjE2CiAgICAvLyBAYTQuYWJpbWV0aG9kKGNyZWF0ZT0iYWxsb3ciKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICBjYWxsc3ViIGNyZWF0ZQogICAgYnl0ZSAweDAwCiAgICBpbnQgMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fdXBkYXRlX3JvdXRlQDEyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MjEKICAgIC8vIEBhNC5hYmltZXRob2QoYWxsb3dfYWN0aW9ucz1bIlVwZGF0ZUFwcGxpY2F0aW9uIl0pCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBpbnQgVXBkYXRlQXBwbGljYXRpb24KICAgID09CiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIFVwZGF0ZUFwcGxpY2F0aW9uCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiB1cGRhdGUKICAgIGJ5dGUgMHgwMAogICAgaW50IDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBieXRlIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX2RlbGV0ZV9yb3V0ZUAxMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjMwCiAgICAvLyBAYTQuYWJpbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJEZWxldGVBcHBsaWNhdGlvbiJdKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgaW50IERlbGV0ZUFwcGxpY2F0aW9uCiAgICA9PQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBEZWxldGVBcHBsaWNhdGlvbgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgZGVsZXRlCiAgICBieXRlIDB4MDAKICAgIGludCAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgYnl0ZSAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9vcHRfY29udHJhY3RfaW50b19hc3NldF9yb3V0ZUAxNDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjM2CiAgICAvLyBAYTQuYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjE3CiAgICAvLyBjbGFzcyBaYWliYXRzdUxvYW4oWmFpYmF0c3VCYXNlKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmFzIEFzc2V0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MzYKICAgIC8vIEBhNC5hYmltZXRob2QoKQogICAgY2FsbHN1YiBvcHRfY29udHJhY3RfaW50b19hc3NldAogICAgYnl0ZSAweDAwCiAgICBpbnQgMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fdHJhbnNmZXJfYXNzZXRfcm91dGVAMTU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo0MQogICAgLy8gQGE0LmFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxNwogICAgLy8gY2xhc3MgWmFpYmF0c3VMb2FuKFphaWJhdHN1QmFzZSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hcyBBc3NldHMKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGJ0b2kKICAgIHR4bmFzIEFjY291bnRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo0MQogICAgLy8gQGE0LmFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIHRyYW5zZmVyX2Fzc2V0CiAgICBieXRlIDB4MDAKICAgIGludCAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgYnl0ZSAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50IDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLmNvbnRyYWN0LlphaWJhdHN1TG9hbi5pbml0aWF0ZV9sb2FuX3B1cmNoYXNlKGxvYW5fa2V5OiBieXRlcywgZm9sa3NfZmVlZF9vcmFjbGU6IHVpbnQ2NCwgbG9hbl9kZXRhaWxzOiBieXRlcywgdHhuOiB1aW50NjQpIC0+IGJ5dGVzOgppbml0aWF0ZV9sb2FuX3B1cmNoYXNlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MjQtMzEKICAgIC8vIEBhNC5hYmltZXRob2QoKQogICAgLy8gZGVmIGluaXRpYXRlX2xvYW5fcHVyY2hhc2UoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICBsb2FuX2tleTogYXAuQnl0ZXMsCiAgICAvLyAgICAgZm9sa3NfZmVlZF9vcmFjbGU6IGFwLkFwcGxpY2F0aW9uLAogICAgLy8gICAgIGxvYW5fZGV0YWlsczogTG9hbkRldGFpbHMsCiAgICAvLyAgICAgdHhuOiBndHhuLkFzc2V0VHJhbnNmZXJUcmFuc2FjdGlvbiwKICAgIC8vICkgLT4gTG9hbkRldGFpbHM6CiAgICBwcm90byA0IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjMyCiAgICAvLyBzZWxmLmVuc3VyZV9hcHBfcmVjaWV2ZXIodHhuKQogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIGVuc3VyZV9hcHBfcmVjaWV2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjMzCiAgICAvLyBjb2xsYXRlcmFsX3ByaWNlID0gc2VsZi5nZXRfYXNzZXRfcHJpY2UoZm9sa3NfZmVlZF9vcmFjbGUsIHR4bi54ZmVyX2Fzc2V0KQogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBYZmVyQXNzZXQKICAgIGR1cAogICAgZnJhbWVfZGlnIC0zCiAgICBzd2FwCiAgICBjYWxsc3ViIGdldF9hc3NldF9wcmljZQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MzQKICAgIC8vIGFzc2VydCBjb2xsYXRlcmFsX3ByaWNlID4gMCwgIlRoZSBhc2EgaXMgb2Ygbm8gdmFsdWUgb3IgaXMgbm90IHN1cHBvcnRlZCIKICAgIGFzc2VydCAvLyBUaGUgYXNhIGlzIG9mIG5vIHZhbHVlIG9yIGlzIG5vdCBzdXBwb3J0ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjM2CiAgICAvLyBpZiBsb2FuX2RldGFpbHMubG9hbl90eXBlID09IGE0LlN0cmluZygiUDJQIik6CiAgICBmcmFtZV9kaWcgLTIKICAgIGludCAyCiAgICBleHRyYWN0X3VpbnQxNgogICAgZnJhbWVfZGlnIC0yCiAgICBpbnQgNjIKICAgIGV4dHJhY3RfdWludDE2CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGZyYW1lX2RpZyAtMgogICAgY292ZXIgMgogICAgc3Vic3RyaW5nMwogICAgYnl0ZSAweDAwMDM1MDMyNTAKICAgID09CiAgICBieiBpbml0aWF0ZV9sb2FuX3B1cmNoYXNlX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MzcKICAgIC8vIGFzc2VydCBsb2FuX2RldGFpbHMucGF5bWVudF9yZWNpcGllbnRzLmxlbmd0aCA9PSBhcC5VSW50NjQoCiAgICBmcmFtZV9kaWcgLTIKICAgIGxlbgogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgMQogICAgdW5jb3ZlciAyCiAgICBzdWJzdHJpbmczCiAgICBpbnQgMAogICAgZXh0cmFjdF91aW50MTYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjM3LTM5CiAgICAvLyBhc3NlcnQgbG9hbl9kZXRhaWxzLnBheW1lbnRfcmVjaXBpZW50cy5sZW5ndGggPT0gYXAuVUludDY0KAogICAgLy8gICAgIDEKICAgIC8vICksICJPbmx5IG9uZSByZWNpcGllbnQgaXMgYWxsb3dlZCBpbiBhIFAyUCBsb2FuIgogICAgaW50IDEKICAgID09CiAgICBhc3NlcnQgLy8gT25seSBvbmUgcmVjaXBpZW50IGlzIGFsbG93ZWQgaW4gYSBQMlAgbG9hbgoKaW5pdGlhdGVfbG9hbl9wdXJjaGFzZV9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo0MgogICAgLy8gbG9hbl9kZXRhaWxzLmJvcnJvd2VyID09IHR4bi5zZW5kZXIKICAgIGZyYW1lX2RpZyAtMgogICAgZXh0cmFjdCA2NiAzMiAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgU2VuZGVyCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NDEtNDMKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgbG9hbl9kZXRhaWxzLmJvcnJvd2VyID09IHR4bi5zZW5kZXIKICAgIC8vICksICJUaGUgc2VuZGVyIG11c3QgYWxzbyBiZSB0aGUgYm9ycm93ZXIiCiAgICBhc3NlcnQgLy8gVGhlIHNlbmRlciBtdXN0IGFsc28gYmUgdGhlIGJvcnJvd2VyCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo0NgogICAgLy8gbG9hbl9kZXRhaWxzLmNvbGxhdGVyYWxfYXNzZXRfaWQgPT0gdHhuLnhmZXJfYXNzZXQuaWQKICAgIGZyYW1lX2RpZyAtMgogICAgZXh0cmFjdCAxMyA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZnJhbWVfZGlnIDAKICAgIGl0b2IKICAgIGI9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NDUtNDcKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgbG9hbl9kZXRhaWxzLmNvbGxhdGVyYWxfYXNzZXRfaWQgPT0gdHhuLnhmZXJfYXNzZXQuaWQKICAgIC8vICksICJUaGUgYXNzZXQgYmVpbmcgdHJhbnNmZXJlZCBtdXN0IGJlIHRoZSBjb2xsYXRlcmFsIGFzc2V0IgogICAgYXNzZXJ0IC8vIFRoZSBhc3NldCBiZWluZyB0cmFuc2ZlcmVkIG11c3QgYmUgdGhlIGNvbGxhdGVyYWwgYXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjQ5CiAgICAvLyBhc3NlcnQgdHhuLmFzc2V0X2Ftb3VudCA+PSBzZWxmLmNhbGN1bGF0ZV9hbXRfcGx1c19mZWUoCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIEFzc2V0QW1vdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo1MAogICAgLy8gbG9hbl9kZXRhaWxzLmNvbGxhdGVyYWxfYXNzZXRfYW1vdW50Lm5hdGl2ZSwgYXAuVUludDY0KDEpCiAgICBmcmFtZV9kaWcgLTIKICAgIGV4dHJhY3QgMzcgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgIGludCAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo0OS01MQogICAgLy8gYXNzZXJ0IHR4bi5hc3NldF9hbW91bnQgPj0gc2VsZi5jYWxjdWxhdGVfYW10X3BsdXNfZmVlKAogICAgLy8gICAgIGxvYW5fZGV0YWlscy5jb2xsYXRlcmFsX2Fzc2V0X2Ftb3VudC5uYXRpdmUsIGFwLlVJbnQ2NCgxKQogICAgLy8gKSwgIkluc3VmZmljaWVudCB0eG4gYXNzZXRfYW1vdW50ISBBbW91bnQgbXVzdCBiZSBlcXVhbCB0byBjb2xsYXRlcmFsX2Fzc2V0X2Ftb3VudCBwbHVzIGZlZXMiCiAgICBjYWxsc3ViIGNhbGN1bGF0ZV9hbXRfcGx1c19mZWUKICAgID49CiAgICBhc3NlcnQgLy8gSW5zdWZmaWNpZW50IHR4biBhc3NldF9hbW91bnQhIEFtb3VudCBtdXN0IGJlIGVxdWFsIHRvIGNvbGxhdGVyYWxfYXNzZXRfYW1vdW50IHBsdXMgZmVlcwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NTMKICAgIC8vIGxvYW5fZGV0YWlscy5jb2xsYXRlcmFsX3BhaWQgPSBhNC5Cb29sKFRydWUpICAjIG5vcWE6IEZCVDAwMwogICAgZnJhbWVfZGlnIC0yCiAgICBpbnQgNTEyCiAgICBpbnQgMQogICAgc2V0Yml0CiAgICBmcmFtZV9idXJ5IC0yCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo1NQogICAgLy8gb3AuQm94LnB1dChsb2FuX2tleSwgbG9hbl9kZXRhaWxzLmJ5dGVzKQogICAgZnJhbWVfZGlnIC00CiAgICBmcmFtZV9kaWcgLTIKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjU2CiAgICAvLyByZXR1cm4gbG9hbl9kZXRhaWxzCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2Jhc2UuY29udHJhY3QuWmFpYmF0c3VCYXNlLmVuc3VyZV9hcHBfcmVjaWV2ZXIodHhuOiB1aW50NjQpIC0+IHZvaWQ6CmVuc3VyZV9hcHBfcmVjaWV2ZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToxMzktMTQwCiAgICAvLyBAYXAuc3Vicm91dGluZQogICAgLy8gZGVmIGVuc3VyZV9hcHBfcmVjaWV2ZXIoc2VsZiwgdHhuOiBndHhuLkFzc2V0VHJhbnNmZXJUcmFuc2FjdGlvbikgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTQyCiAgICAvLyB0eG4uYXNzZXRfcmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBBc3NldFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjE0MS0xNDMKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgdHhuLmFzc2V0X3JlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIC8vICksICJUaGUgcmVjaXBpZW50IG11c3QgYmUgdGhlIGN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcyBhZGRyZXNzIgogICAgYXNzZXJ0IC8vIFRoZSByZWNpcGllbnQgbXVzdCBiZSB0aGUgY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzIGFkZHJlc3MKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9iYXNlLmNvbnRyYWN0LlphaWJhdHN1QmFzZS5nZXRfYXNzZXRfcHJpY2UoZm9sa3NfZmVlZF9vcmFjbGU6IHVpbnQ2NCwgYXNhOiB1aW50NjQpIC0+IHVpbnQ2NDoKZ2V0X2Fzc2V0X3ByaWNlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTIwLTEyMwogICAgLy8gQGFwLnN1YnJvdXRpbmUKICAgIC8vIGRlZiBnZXRfYXNzZXRfcHJpY2UoCiAgICAvLyAgICAgc2VsZiwgZm9sa3NfZmVlZF9vcmFjbGU6IGFwLkFwcGxpY2F0aW9uLCBhc2E6IGFwLkFzc2V0CiAgICAvLyApIC0+IGFwLlVJbnQ2NDoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTI0CiAgICAvLyBbdmFsdWUsIGV4aXN0c10gPSBvcC5BcHBHbG9iYWwuZ2V0X2V4X2J5dGVzKGZvbGtzX2ZlZWRfb3JhY2xlLCBvcC5pdG9iKGFzYS5pZCkpCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAtMgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjEyNQogICAgLy8gYXNzZXJ0IGV4aXN0cywgIlRoaXMgYXNldCBpcyBub3Qgc3VwcG9ydGVkIgogICAgYXNzZXJ0IC8vIFRoaXMgYXNldCBpcyBub3Qgc3VwcG9ydGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToxMjYKICAgIC8vIHJldHVybiBvcC5leHRyYWN0X3VpbnQ2NCh2YWx1ZSwgYXAuVUludDY0KDApKQogICAgaW50IDAKICAgIGV4dHJhY3RfdWludDY0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfYmFzZS5jb250cmFjdC5aYWliYXRzdUJhc2UuY2FsY3VsYXRlX2FtdF9wbHVzX2ZlZShhbXQ6IHVpbnQ2NCwgbXVsdGlwbGVzOiB1aW50NjQpIC0+IHVpbnQ2NDoKY2FsY3VsYXRlX2FtdF9wbHVzX2ZlZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjExMy0xMTQKICAgIC8vIEBhcC5zdWJyb3V0aW5lCiAgICAvLyBkZWYgY2FsY3VsYXRlX2FtdF9wbHVzX2ZlZShzZWxmLCBhbXQ6IGFwLlVJbnQ2NCwgbXVsdGlwbGVzOiBhcC5VSW50NjQpIC0+IGFwLlVJbnQ2NDoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTE1CiAgICAvLyBmZWVfcGVyY2VudGFnZSA9IGFwLlVJbnQ2NCgxMCkgKiBtdWx0aXBsZXMKICAgIGludCAxMAogICAgZnJhbWVfZGlnIC0xCiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToxMTYKICAgIC8vIG11bHRpcGxpZWQgPSBmZWVfcGVyY2VudGFnZSAqIGFtdAogICAgZnJhbWVfZGlnIC0yCiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToxMTcKICAgIC8vIGhhbGZfcGVyY2VudCA9IG11bHRpcGxpZWQgLy8gMTAwMAogICAgaW50IDEwMDAKICAgIC8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjExOAogICAgLy8gcmV0dXJuIGhhbGZfcGVyY2VudAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2xvYW4uY29udHJhY3QuWmFpYmF0c3VMb2FuLmNvbXBsZXRlX25vbl9wMnBfbG9hbl9wdXJjaGFzZShsb2FuX2tleTogYnl0ZXMsIGNvbXBsZXRpb25fYXJnczogYnl0ZXMsIHByaW5jaXBhbF9hc3NldDogdWludDY0LCBib3Jyb3dlcjogYnl0ZXMpIC0+IGJ5dGVzOgpjb21wbGV0ZV9ub25fcDJwX2xvYW5fcHVyY2hhc2U6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo1OC02NQogICAgLy8gQGFwLmFyYzQuYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBjb21wbGV0ZV9ub25fcDJwX2xvYW5fcHVyY2hhc2UoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICBsb2FuX2tleTogYXAuQnl0ZXMsCiAgICAvLyAgICAgY29tcGxldGlvbl9hcmdzOiBDb21wbGV0ZUxvYW5BcmdzLAogICAgLy8gICAgIHByaW5jaXBhbF9hc3NldDogYXAuQXNzZXQsCiAgICAvLyAgICAgYm9ycm93ZXI6IGFwLkFjY291bnQsCiAgICAvLyApIC0+IExvYW5EZXRhaWxzOgogICAgcHJvdG8gNCAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo2NgogICAgLy8gW2xvYW5fYnl0ZXMsIGV4aXN0c10gPSBvcC5Cb3guZ2V0KGxvYW5fa2V5KQogICAgZnJhbWVfZGlnIC00CiAgICBib3hfZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo2NwogICAgLy8gYXNzZXJ0IGV4aXN0cywgIkEgcmVjY29yZCB3aXRoIHRoZSBsb2FuX2tleSBwYXNzZWQgd2FzIG5vdCBmb3VuZCIKICAgIGFzc2VydCAvLyBBIHJlY2NvcmQgd2l0aCB0aGUgbG9hbl9rZXkgcGFzc2VkIHdhcyBub3QgZm91bmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjcwCiAgICAvLyBkZXRhaWxzLmNvbGxhdGVyYWxfcGFpZAogICAgZHVwCiAgICBpbnQgNTEyCiAgICBnZXRiaXQKICAgIGJ5dGUgMHgwMAogICAgaW50IDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBieXRlIDB4MDAKICAgICE9CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo2OS03MQogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBkZXRhaWxzLmNvbGxhdGVyYWxfcGFpZAogICAgLy8gKSwgIlRoZSBsb2FuIGNvbGxhdGVyYWwgbXVzdCBoYXZlIGJlZW4gcGFpZCBieSB0aGlzIHBvaW50IgogICAgYXNzZXJ0IC8vIFRoZSBsb2FuIGNvbGxhdGVyYWwgbXVzdCBoYXZlIGJlZW4gcGFpZCBieSB0aGlzIHBvaW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo3MgogICAgLy8gYXNzZXJ0IG5vdCBkZXRhaWxzLnByaW5jaXBhbF9wYWlkLCAiVGhlIHByaW5jaXBhbCBtdXN0IG5vdCBoYXZlIGJlZW4gcGFpZCIKICAgIGR1cAogICAgaW50IDUxMwogICAgZ2V0Yml0CiAgICBieXRlIDB4MDAKICAgIGludCAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgYnl0ZSAweDAwCiAgICA9PQogICAgYXNzZXJ0IC8vIFRoZSBwcmluY2lwYWwgbXVzdCBub3QgaGF2ZSBiZWVuIHBhaWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5Ojc0CiAgICAvLyBib3Jyb3dlciA9PSBkZXRhaWxzLmJvcnJvd2VyLm5hdGl2ZQogICAgZHVwCiAgICBleHRyYWN0IDY2IDMyIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZnJhbWVfZGlnIC0xCiAgICBkaWcgMQogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjczLTc1CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIGJvcnJvd2VyID09IGRldGFpbHMuYm9ycm93ZXIubmF0aXZlCiAgICAvLyApLCAiVGhlIGJvcnJvd2VyIG11c3QgYmUgdGhlIGJvcnJvd2VyIGluIHRoZSBsb2FuIGRldGFpbHMiCiAgICBhc3NlcnQgLy8gVGhlIGJvcnJvd2VyIG11c3QgYmUgdGhlIGJvcnJvd2VyIGluIHRoZSBsb2FuIGRldGFpbHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5Ojc3CiAgICAvLyBwcmluY2lwYWxfYXNzZXQuaWQgPT0gZGV0YWlscy5wcmluY2lwYWxfYXNzZXRfaWQubmF0aXZlCiAgICBkaWcgMQogICAgZXh0cmFjdCA1IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICBmcmFtZV9kaWcgLTIKICAgIGRpZyAxCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NzYtNzgKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgcHJpbmNpcGFsX2Fzc2V0LmlkID09IGRldGFpbHMucHJpbmNpcGFsX2Fzc2V0X2lkLm5hdGl2ZQogICAgLy8gKSwgIlRoZSBhc3NldCBwYXNzZWQgbXVzdCBiZSB0aGUgc2FtZSBhcyB0aGUgcHJpbmNpcGFsIgogICAgYXNzZXJ0IC8vIFRoZSBhc3NldCBwYXNzZWQgbXVzdCBiZSB0aGUgc2FtZSBhcyB0aGUgcHJpbmNpcGFsCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo4NAogICAgLy8gYXNzZXRfYW1vdW50PWRldGFpbHMucHJpbmNpcGFsX2Fzc2V0X2Ftb3VudC5uYXRpdmUsCiAgICBkaWcgMgogICAgZXh0cmFjdCAyOSA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6ODYKICAgIC8vIGNvbXBsZXRpb25fdHhuLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo4MAogICAgLy8gY29tcGxldGlvbl90eG4gPSBhcC5pdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBpbnQgYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjgxCiAgICAvLyBmZWU9MTAwMCwKICAgIGludCAxMDAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6ODYKICAgIC8vIGNvbXBsZXRpb25fdHhuLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6ODgKICAgIC8vIGRldGFpbHMucHJpbmNpcGFsX3BhaWQgPSBhNC5Cb29sKFRydWUpICAjIG5vcWE6IEZCVDAwMwogICAgaW50IDUxMwogICAgaW50IDEKICAgIHNldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6ODkKICAgIC8vIGRldGFpbHMuY29tcGxldGVkX3BheW1lbnRfcm91bmRzID0gYTQuVUludDgoMCkKICAgIGJ5dGUgMHgwMAogICAgcmVwbGFjZTIgNjUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjkxCiAgICAvLyBjb21wbGV0aW9uX2FyZ3MuYm9ycm93ZXJfbmZ0X2ltYWdlX3VybCwKICAgIGZyYW1lX2RpZyAtMwogICAgaW50IDQKICAgIGV4dHJhY3RfdWludDE2CiAgICBmcmFtZV9kaWcgLTMKICAgIGludCA2CiAgICBleHRyYWN0X3VpbnQxNgogICAgZnJhbWVfZGlnIC0zCiAgICBkaWcgMgogICAgZGlnIDIKICAgIHN1YnN0cmluZzMKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjkyCiAgICAvLyBvcC5jb25jYXQoYXAuQnl0ZXMoYiJCIiksIGNvbXBsZXRpb25fYXJncy5sb2FuX3VuaXRfbmFtZS5ieXRlcyksCiAgICBmcmFtZV9kaWcgLTMKICAgIGludCAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZnJhbWVfZGlnIC0zCiAgICBpbnQgMgogICAgZXh0cmFjdF91aW50MTYKICAgIGZyYW1lX2RpZyAtMwogICAgdW5jb3ZlciAyCiAgICBkaWcgMgogICAgc3Vic3RyaW5nMwogICAgYnl0ZSAweDQyCiAgICBkaWcgMQogICAgY29uY2F0CiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo5MwogICAgLy8gb3AuY29uY2F0KGFwLkJ5dGVzKGIiI0ItIiksIGNvbXBsZXRpb25fYXJncy5sb2FuX3VuaXRfbmFtZS5ieXRlcyksCiAgICBieXRlIDB4MjM0MjJkCiAgICBkaWcgMQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo5NAogICAgLy8gY29tcGxldGlvbl9hcmdzLmxvYW5faGFzaCwKICAgIGZyYW1lX2RpZyAtMwogICAgbGVuCiAgICBmcmFtZV9kaWcgLTMKICAgIHVuY292ZXIgNgogICAgdW5jb3ZlciAyCiAgICBzdWJzdHJpbmczCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo5MC05NQogICAgLy8gYm9ycm93ZXJfbmZ0ID0gc2VsZi5jcmVhdGVfbG9hbl9uZnQoCiAgICAvLyAgICAgY29tcGxldGlvbl9hcmdzLmJvcnJvd2VyX25mdF9pbWFnZV91cmwsCiAgICAvLyAgICAgb3AuY29uY2F0KGFwLkJ5dGVzKGIiQiIpLCBjb21wbGV0aW9uX2FyZ3MubG9hbl91bml0X25hbWUuYnl0ZXMpLAogICAgLy8gICAgIG9wLmNvbmNhdChhcC5CeXRlcyhiIiNCLSIpLCBjb21wbGV0aW9uX2FyZ3MubG9hbl91bml0X25hbWUuYnl0ZXMpLAogICAgLy8gICAgIGNvbXBsZXRpb25fYXJncy5sb2FuX2hhc2gsCiAgICAvLyApCiAgICB1bmNvdmVyIDUKICAgIHVuY292ZXIgNAogICAgdW5jb3ZlciAzCiAgICBkaWcgMwogICAgY2FsbHN1YiBjcmVhdGVfbG9hbl9uZnQKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5Ojk3CiAgICAvLyBjb21wbGV0aW9uX2FyZ3MubGVuZGVyX25mdF9pbWFnZV91cmwsCiAgICBmcmFtZV9kaWcgLTMKICAgIHVuY292ZXIgNAogICAgdW5jb3ZlciA1CiAgICBzdWJzdHJpbmczCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo5OAogICAgLy8gb3AuY29uY2F0KGFwLkJ5dGVzKGIiTCIpLCBjb21wbGV0aW9uX2FyZ3MubG9hbl91bml0X25hbWUuYnl0ZXMpLAogICAgYnl0ZSAweDRjCiAgICBkaWcgNAogICAgY29uY2F0CiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo5OQogICAgLy8gb3AuY29uY2F0KGFwLkJ5dGVzKGIiI0wtIiksIGNvbXBsZXRpb25fYXJncy5sb2FuX3VuaXRfbmFtZS5ieXRlcyksCiAgICBieXRlIDB4MjM0YzJkCiAgICB1bmNvdmVyIDUKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6OTYtMTAxCiAgICAvLyBsZW5kZXJfbmZ0ID0gc2VsZi5jcmVhdGVfbG9hbl9uZnQoCiAgICAvLyAgICAgY29tcGxldGlvbl9hcmdzLmxlbmRlcl9uZnRfaW1hZ2VfdXJsLAogICAgLy8gICAgIG9wLmNvbmNhdChhcC5CeXRlcyhiIkwiKSwgY29tcGxldGlvbl9hcmdzLmxvYW5fdW5pdF9uYW1lLmJ5dGVzKSwKICAgIC8vICAgICBvcC5jb25jYXQoYXAuQnl0ZXMoYiIjTC0iKSwgY29tcGxldGlvbl9hcmdzLmxvYW5fdW5pdF9uYW1lLmJ5dGVzKSwKICAgIC8vICAgICBjb21wbGV0aW9uX2FyZ3MubG9hbl9oYXNoLAogICAgLy8gKQogICAgc3dhcAogICAgY292ZXIgMgogICAgdW5jb3ZlciAzCiAgICBjYWxsc3ViIGNyZWF0ZV9sb2FuX25mdAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MTAyCiAgICAvLyBkZXRhaWxzLmJvcnJvd2VyX25mdF9hc3Nlcl9pZCA9IGE0LlVJbnQ2NChib3Jyb3dlcl9uZnQuaWQpCiAgICBzd2FwCiAgICBpdG9iCiAgICB1bmNvdmVyIDIKICAgIHN3YXAKICAgIHJlcGxhY2UyIDEwNgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MTAzCiAgICAvLyBkZXRhaWxzLmxlbmRlcl9uZnRfYXNzZXJfaWQgPSBhNC5VSW50NjQobGVuZGVyX25mdC5pZCkKICAgIHN3YXAKICAgIGl0b2IKICAgIHJlcGxhY2UyIDk4CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxMDQKICAgIC8vIG9wLkJveC5wdXQobG9hbl9rZXksIGRldGFpbHMuYnl0ZXMpCiAgICBmcmFtZV9kaWcgLTQKICAgIGRpZyAxCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxMDUKICAgIC8vIHJldHVybiBkZXRhaWxzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfYmFzZS5jb250cmFjdC5aYWliYXRzdUJhc2UuY3JlYXRlX2xvYW5fbmZ0KGltYWdlX3VybDogYnl0ZXMsIHNob3J0X25hbWU6IGJ5dGVzLCBsb2duX25hbWU6IGJ5dGVzLCBsb2FuX2hhc2g6IGJ5dGVzKSAtPiB1aW50NjQ6CmNyZWF0ZV9sb2FuX25mdDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5Ojc5LTg2CiAgICAvLyBAYXAuc3Vicm91dGluZQogICAgLy8gZGVmIGNyZWF0ZV9sb2FuX25mdCgKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIGltYWdlX3VybDogYTQuU3RyaW5nLAogICAgLy8gICAgIHNob3J0X25hbWU6IGFwLkJ5dGVzLAogICAgLy8gICAgIGxvZ25fbmFtZTogYXAuQnl0ZXMsCiAgICAvLyAgICAgbG9hbl9oYXNoOiBhNC5TdHJpbmcsCiAgICAvLyApIC0+IGFwLkFzc2V0OgogICAgcHJvdG8gNCAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo4OQogICAgLy8gdXJsPWltYWdlX3VybC5uYXRpdmUsCiAgICBmcmFtZV9kaWcgLTQKICAgIGV4dHJhY3QgMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo5MwogICAgLy8gbWV0YWRhdGFfaGFzaD1sb2FuX2hhc2gubmF0aXZlLmJ5dGVzLAogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6OTQKICAgIC8vIG1hbmFnZXI9b3AuR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo5NS05NwogICAgLy8gcmVzZXJ2ZT1vcC5HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gZnJlZXplPW9wLkdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyBjbGF3YmFjaz1vcC5HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgZHVwbiAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo5OQogICAgLy8gdHhuLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0Q2xhd2JhY2sKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRGcmVlemUKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRSZXNlcnZlCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0TWFuYWdlcgogICAgaXR4bl9maWVsZCBDb25maWdBc3NldE1ldGFkYXRhSGFzaAogICAgZnJhbWVfZGlnIC0yCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0TmFtZQogICAgZnJhbWVfZGlnIC0zCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0VW5pdE5hbWUKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRVUkwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5Ojg4CiAgICAvLyB0b3RhbD0xLAogICAgaW50IDEKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRUb3RhbAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6ODcKICAgIC8vIHR4biA9IGFwLml0eG4uQXNzZXRDb25maWcoCiAgICBpbnQgYWNmZwogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6OTIKICAgIC8vIGZlZT0xMDAwLAogICAgaW50IDEwMDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo5OQogICAgLy8gdHhuLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTAwCiAgICAvLyByZXR1cm4gb3AuSVR4bi5jcmVhdGVkX2Fzc2V0X2lkKCkKICAgIGl0eG4gQ3JlYXRlZEFzc2V0SUQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLmNvbnRyYWN0LlphaWJhdHN1TG9hbi5jb21wbGV0ZV9wMnBfbG9hbl9wdXJjaGFzZShsb2FuX2tleTogYnl0ZXMsIGNvbXBsZXRpb25fYXJnczogYnl0ZXMsIHByaW5jaXBhbF9hc3NldDogdWludDY0LCBib3Jyb3dlcjogYnl0ZXMsIHR4bjogdWludDY0KSAtPiBieXRlczoKY29tcGxldGVfcDJwX2xvYW5fcHVyY2hhc2U6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxMDctMTE1CiAgICAvLyBAYXAuYXJjNC5hYmltZXRob2QoKQogICAgLy8gZGVmIGNvbXBsZXRlX3AycF9sb2FuX3B1cmNoYXNlKAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgbG9hbl9rZXk6IGFwLkJ5dGVzLAogICAgLy8gICAgIGNvbXBsZXRpb25fYXJnczogQ29tcGxldGVMb2FuQXJncywKICAgIC8vICAgICBwcmluY2lwYWxfYXNzZXQ6IGFwLkFzc2V0LAogICAgLy8gICAgIGJvcnJvd2VyOiBhcC5BY2NvdW50LAogICAgLy8gICAgIHR4bjogZ3R4bi5Bc3NldFRyYW5zZmVyVHJhbnNhY3Rpb24sCiAgICAvLyApIC0+IExvYW5EZXRhaWxzOgogICAgcHJvdG8gNSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxMTYKICAgIC8vIHNlbGYuZW5zdXJlX2FwcF9yZWNpZXZlcih0eG4pCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgZW5zdXJlX2FwcF9yZWNpZXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MTE4CiAgICAvLyBbbG9hbl9ieXRlcywgZXhpc3RzXSA9IG9wLkJveC5nZXQobG9hbl9rZXkpCiAgICBmcmFtZV9kaWcgLTUKICAgIGJveF9nZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjExOQogICAgLy8gYXNzZXJ0IGV4aXN0cywgIkEgcmVjY29yZCB3aXRoIHRoZSBsb2FuX2tleSBwYXNzZWQgd2FzIG5vdCBmb3VuZCIKICAgIGFzc2VydCAvLyBBIHJlY2NvcmQgd2l0aCB0aGUgbG9hbl9rZXkgcGFzc2VkIHdhcyBub3QgZm91bmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjEyNAogICAgLy8geGZlcl9hc3NldD1kZXRhaWxzLnByaW5jaXBhbF9hc3NldF9pZC5uYXRpdmUsCiAgICBkdXAKICAgIGV4dHJhY3QgNSA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnRvaQogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MTI1CiAgICAvLyBhc3NldF9yZWNlaXZlcj1kZXRhaWxzLmJvcnJvd2VyLm5hdGl2ZSwKICAgIGR1cAogICAgZXh0cmFjdCA2NiAzMiAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjEyNgogICAgLy8gYXNzZXRfYW1vdW50PWRldGFpbHMucHJpbmNpcGFsX2Fzc2V0X2Ftb3VudC5uYXRpdmUsCiAgICBkdXAKICAgIGV4dHJhY3QgMjkgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjEyOAogICAgLy8gY29tcGxldGlvbl90eG4uc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIGl0eG5fZmllbGQgQXNzZXRBbW91bnQKICAgIHN3YXAKICAgIGl0eG5fZmllbGQgQXNzZXRSZWNlaXZlcgogICAgc3dhcAogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjEyMgogICAgLy8gY29tcGxldGlvbl90eG4gPSBhcC5pdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBpbnQgYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjEyMwogICAgLy8gZmVlPTEwMDAsCiAgICBpbnQgMTAwMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjEyOAogICAgLy8gY29tcGxldGlvbl90eG4uc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxMzAKICAgIC8vIGRldGFpbHMucHJpbmNpcGFsX3BhaWQgPSBhNC5Cb29sKFRydWUpICAjIG5vcWE6IEZCVDAwMwogICAgaW50IDUxMwogICAgaW50IDEKICAgIHNldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MTMxCiAgICAvLyBkZXRhaWxzLmNvbXBsZXRlZF9wYXltZW50X3JvdW5kcyA9IGE0LlVJbnQ4KDApCiAgICBieXRlIDB4MDAKICAgIHJlcGxhY2UyIDY1CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxMzMKICAgIC8vIGNvbXBsZXRpb25fYXJncy5ib3Jyb3dlcl9uZnRfaW1hZ2VfdXJsLAogICAgZnJhbWVfZGlnIC00CiAgICBpbnQgNAogICAgZXh0cmFjdF91aW50MTYKICAgIGZyYW1lX2RpZyAtNAogICAgaW50IDYKICAgIGV4dHJhY3RfdWludDE2CiAgICBmcmFtZV9kaWcgLTQKICAgIGRpZyAyCiAgICBkaWcgMgogICAgc3Vic3RyaW5nMwogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MTM0CiAgICAvLyBvcC5jb25jYXQoYXAuQnl0ZXMoYiJCIiksIGNvbXBsZXRpb25fYXJncy5sb2FuX3VuaXRfbmFtZS5ieXRlcyksCiAgICBmcmFtZV9kaWcgLTQKICAgIGludCAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZnJhbWVfZGlnIC00CiAgICBpbnQgMgogICAgZXh0cmFjdF91aW50MTYKICAgIGZyYW1lX2RpZyAtNAogICAgdW5jb3ZlciAyCiAgICBkaWcgMgogICAgc3Vic3RyaW5nMwogICAgYnl0ZSAweDQyCiAgICBkaWcgMQogICAgY29uY2F0CiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxMzUKICAgIC8vIG9wLmNvbmNhdChhcC5CeXRlcyhiIiNCLSIpLCBjb21wbGV0aW9uX2FyZ3MubG9hbl91bml0X25hbWUuYnl0ZXMpLAogICAgYnl0ZSAweDIzNDIyZAogICAgZGlnIDEKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MTM2CiAgICAvLyBjb21wbGV0aW9uX2FyZ3MubG9hbl9oYXNoLAogICAgZnJhbWVfZGlnIC00CiAgICBsZW4KICAgIGZyYW1lX2RpZyAtNAogICAgdW5jb3ZlciA2CiAgICB1bmNvdmVyIDIKICAgIHN1YnN0cmluZzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjEzMi0xMzcKICAgIC8vIGJvcnJvd2VyX25mdCA9IHNlbGYuY3JlYXRlX2xvYW5fbmZ0KAogICAgLy8gICAgIGNvbXBsZXRpb25fYXJncy5ib3Jyb3dlcl9uZnRfaW1hZ2VfdXJsLAogICAgLy8gICAgIG9wLmNvbmNhdChhcC5CeXRlcyhiIkIiKSwgY29tcGxldGlvbl9hcmdzLmxvYW5fdW5pdF9uYW1lLmJ5dGVzKSwKICAgIC8vICAgICBvcC5jb25jYXQoYXAuQnl0ZXMoYiIjQi0iKSwgY29tcGxldGlvbl9hcmdzLmxvYW5fdW5pdF9uYW1lLmJ5dGVzKSwKICAgIC8vICAgICBjb21wbGV0aW9uX2FyZ3MubG9hbl9oYXNoLAogICAgLy8gKQogICAgdW5jb3ZlciA1CiAgICB1bmNvdmVyIDQKICAgIHVuY292ZXIgMwogICAgZGlnIDMKICAgIGNhbGxzdWIgY3JlYXRlX2xvYW5fbmZ0CiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxMzkKICAgIC8vIGNvbXBsZXRpb25fYXJncy5sZW5kZXJfbmZ0X2ltYWdlX3VybCwKICAgIGZyYW1lX2RpZyAtNAogICAgdW5jb3ZlciA0CiAgICB1bmNvdmVyIDUKICAgIHN1YnN0cmluZzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjE0MAogICAgLy8gb3AuY29uY2F0KGFwLkJ5dGVzKGIiTCIpLCBjb21wbGV0aW9uX2FyZ3MubG9hbl91bml0X25hbWUuYnl0ZXMpLAogICAgYnl0ZSAweDRjCiAgICBkaWcgNAogICAgY29uY2F0CiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxNDEKICAgIC8vIG9wLmNvbmNhdChhcC5CeXRlcyhiIiNMLSIpLCBjb21wbGV0aW9uX2FyZ3MubG9hbl91bml0X25hbWUuYnl0ZXMpLAogICAgYnl0ZSAweDIzNGMyZAogICAgdW5jb3ZlciA1CiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjEzOC0xNDMKICAgIC8vIGxlbmRlcl9uZnQgPSBzZWxmLmNyZWF0ZV9sb2FuX25mdCgKICAgIC8vICAgICBjb21wbGV0aW9uX2FyZ3MubGVuZGVyX25mdF9pbWFnZV91cmwsCiAgICAvLyAgICAgb3AuY29uY2F0KGFwLkJ5dGVzKGIiTCIpLCBjb21wbGV0aW9uX2FyZ3MubG9hbl91bml0X25hbWUuYnl0ZXMpLAogICAgLy8gICAgIG9wLmNvbmNhdChhcC5CeXRlcyhiIiNMLSIpLCBjb21wbGV0aW9uX2FyZ3MubG9hbl91bml0X25hbWUuYnl0ZXMpLAogICAgLy8gICAgIGNvbXBsZXRpb25fYXJncy5sb2FuX2hhc2gsCiAgICAvLyApCiAgICBzd2FwCiAgICBjb3ZlciAyCiAgICB1bmNvdmVyIDMKICAgIGNhbGxzdWIgY3JlYXRlX2xvYW5fbmZ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxNDQKICAgIC8vIGRldGFpbHMuYm9ycm93ZXJfbmZ0X2Fzc2VyX2lkID0gYTQuVUludDY0KGJvcnJvd2VyX25mdC5pZCkKICAgIHN3YXAKICAgIGl0b2IKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgcmVwbGFjZTIgMTA2CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxNDUKICAgIC8vIGRldGFpbHMubGVuZGVyX25mdF9hc3Nlcl9pZCA9IGE0LlVJbnQ2NChsZW5kZXJfbmZ0LmlkKQogICAgc3dhcAogICAgaXRvYgogICAgcmVwbGFjZTIgOTgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjE0NgogICAgLy8gb3AuQm94LnB1dChsb2FuX2tleSwgZGV0YWlscy5ieXRlcykKICAgIGZyYW1lX2RpZyAtNQogICAgZGlnIDEKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjE0NwogICAgLy8gcmV0dXJuIGRldGFpbHMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLmNvbnRyYWN0LlphaWJhdHN1TG9hbi5pbml0aWF0ZV9sb2FuX3JlcGF5bWVudChsb2FuX2tleTogYnl0ZXMsIHJlcGF5bWVudF9rZXk6IGJ5dGVzLCB0eG46IHVpbnQ2NCkgLT4gdm9pZDoKaW5pdGlhdGVfbG9hbl9yZXBheW1lbnQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxNDktMTU1CiAgICAvLyBAYXAuYXJjNC5hYmltZXRob2QoKQogICAgLy8gZGVmIGluaXRpYXRlX2xvYW5fcmVwYXltZW50KAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgbG9hbl9rZXk6IGFwLkJ5dGVzLAogICAgLy8gICAgIHJlcGF5bWVudF9rZXk6IGFwLlN0cmluZywKICAgIC8vICAgICB0eG46IGd0eG4uQXNzZXRUcmFuc2ZlclRyYW5zYWN0aW9uLAogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gMyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxNTYKICAgIC8vIHNlbGYuZW5zdXJlX2FwcF9yZWNpZXZlcih0eG4pCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgZW5zdXJlX2FwcF9yZWNpZXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MTU4CiAgICAvLyBbbG9hbl9ieXRlcywgZXhpc3RzXSA9IG9wLkJveC5nZXQobG9hbl9rZXkpCiAgICBmcmFtZV9kaWcgLTMKICAgIGJveF9nZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjE1OQogICAgLy8gYXNzZXJ0IGV4aXN0cywgIkEgcmVjY29yZCB3aXRoIHRoZSBsb2FuX2tleSBwYXNzZWQgd2FzIG5vdCBmb3VuZCIKICAgIGFzc2VydCAvLyBBIHJlY2NvcmQgd2l0aCB0aGUgbG9hbl9rZXkgcGFzc2VkIHdhcyBub3QgZm91bmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjE2MwogICAgLy8gZGV0YWlscy5wcmluY2lwYWxfYXNzZXRfYW1vdW50Lm5hdGl2ZSArIGRldGFpbHMuaW50ZXJlc3RfYXNzZXRfYW1vdW50Lm5hdGl2ZQogICAgZHVwCiAgICBleHRyYWN0IDI5IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICBzd2FwCiAgICBkdXAKICAgIGV4dHJhY3QgMjEgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjE2Mi0xNjQKICAgIC8vIHByaW5jaXBhbF9wbHVzX2ludGVyZXN0ID0gKAogICAgLy8gICAgIGRldGFpbHMucHJpbmNpcGFsX2Fzc2V0X2Ftb3VudC5uYXRpdmUgKyBkZXRhaWxzLmludGVyZXN0X2Fzc2V0X2Ftb3VudC5uYXRpdmUKICAgIC8vICkKICAgIHVuY292ZXIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MTYzCiAgICAvLyBkZXRhaWxzLnByaW5jaXBhbF9hc3NldF9hbW91bnQubmF0aXZlICsgZGV0YWlscy5pbnRlcmVzdF9hc3NldF9hbW91bnQubmF0aXZlCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxNjUKICAgIC8vIHBheW1lbnRfYW1vdW50ID0gcHJpbmNpcGFsX3BsdXNfaW50ZXJlc3QgLy8gZGV0YWlscy5wYXltZW50X3JvdW5kcy5uYXRpdmUKICAgIGRpZyAxCiAgICBleHRyYWN0IDUzIDEgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICAvCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxNjgKICAgIC8vIHJlcGF5bWVudF9rZXk9YTQuU3RyaW5nKHJlcGF5bWVudF9rZXkpLAogICAgZnJhbWVfZGlnIC0yCiAgICBsZW4KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MTcwCiAgICAvLyByZXBheW1lbnRfYW1vdW50PWE0LlVJbnQ2NChwYXltZW50X2Ftb3VudCksCiAgICBpdG9iCiAgICBjb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxNzIKICAgIC8vIHJlY2lwaWVudHM9ZGV0YWlscy5wYXltZW50X3JlY2lwaWVudHMuY29weSgpLAogICAgZGlnIDEKICAgIGludCA2MgogICAgZXh0cmFjdF91aW50MTYKICAgIHN3YXAKICAgIGRpZyAyCiAgICBsZW4KICAgIHN3YXAKICAgIGNvdmVyIDMKICAgIHN1YnN0cmluZzMKICAgIGNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjE2Ny0xNzMKICAgIC8vIHJvdW5kX3BheW1lbnQgPSBQZW5kaW5nTG9hblJvdW5kUGF5bWVudCgKICAgIC8vICAgICByZXBheW1lbnRfa2V5PWE0LlN0cmluZyhyZXBheW1lbnRfa2V5KSwKICAgIC8vICAgICBsb2FuX2tleT1hNC5TdHJpbmcuZnJvbV9ieXRlcyhsb2FuX2tleSksCiAgICAvLyAgICAgcmVwYXltZW50X2Ftb3VudD1hNC5VSW50NjQocGF5bWVudF9hbW91bnQpLAogICAgLy8gICAgIHBlcmNlbnRhZ2VfcGFpZD1hNC5VSW50NjQoMCksCiAgICAvLyAgICAgcmVjaXBpZW50cz1kZXRhaWxzLnBheW1lbnRfcmVjaXBpZW50cy5jb3B5KCksCiAgICAvLyApCiAgICBkdXAKICAgIGxlbgogICAgaW50IDIyCiAgICArCiAgICBkdXAKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBieXRlIDB4MDAxNgogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTMKICAgIGxlbgogICAgdW5jb3ZlciAyCiAgICArCiAgICBzd2FwCiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MTcxCiAgICAvLyBwZXJjZW50YWdlX3BhaWQ9YTQuVUludDY0KDApLAogICAgYnl0ZSAweDAwMDAwMDAwMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjE2Ny0xNzMKICAgIC8vIHJvdW5kX3BheW1lbnQgPSBQZW5kaW5nTG9hblJvdW5kUGF5bWVudCgKICAgIC8vICAgICByZXBheW1lbnRfa2V5PWE0LlN0cmluZyhyZXBheW1lbnRfa2V5KSwKICAgIC8vICAgICBsb2FuX2tleT1hNC5TdHJpbmcuZnJvbV9ieXRlcyhsb2FuX2tleSksCiAgICAvLyAgICAgcmVwYXltZW50X2Ftb3VudD1hNC5VSW50NjQocGF5bWVudF9hbW91bnQpLAogICAgLy8gICAgIHBlcmNlbnRhZ2VfcGFpZD1hNC5VSW50NjQoMCksCiAgICAvLyAgICAgcmVjaXBpZW50cz1kZXRhaWxzLnBheW1lbnRfcmVjaXBpZW50cy5jb3B5KCksCiAgICAvLyApCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC0zCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MTc0CiAgICAvLyBvcC5Cb3gucHV0KHJlcGF5bWVudF9rZXkuYnl0ZXMsIHJvdW5kX3BheW1lbnQuYnl0ZXMpCiAgICBmcmFtZV9kaWcgLTIKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLmNvbnRyYWN0LlphaWJhdHN1TG9hbi5leGVjdXRlX2xvYW5fcmVwYXltZW50KHJlcGF5bWVudF9rZXk6IGJ5dGVzLCByZWNpcGllbnRfYWNjb3VudDogYnl0ZXMsIHBheW1lbnRfcmVjaXBpZW50OiBieXRlcywgcHJpbmNpcGFsX2Fzc2V0OiB1aW50NjQpIC0+IGJ5dGVzOgpleGVjdXRlX2xvYW5fcmVwYXltZW50OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MTc2LTE4MwogICAgLy8gQGFwLmFyYzQuYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBleGVjdXRlX2xvYW5fcmVwYXltZW50KAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgcmVwYXltZW50X2tleTogYXAuU3RyaW5nLAogICAgLy8gICAgIHJlY2lwaWVudF9hY2NvdW50OiBhcC5BY2NvdW50LAogICAgLy8gICAgIHBheW1lbnRfcmVjaXBpZW50OiBQYXltZW50UmVjaWVwaWVudCwKICAgIC8vICAgICBwcmluY2lwYWxfYXNzZXQ6IGFwLkFzc2V0LAogICAgLy8gKSAtPiBFeGVjdXRlTG9hblJlcGF5bWVudFJlc3BvbnNlOgogICAgcHJvdG8gNCAxCiAgICBpbnQgMAogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxODQKICAgIC8vIFtyZXBheW1lbnRfYnl0ZXMsIGV4aXN0c10gPSBvcC5Cb3guZ2V0KHJlcGF5bWVudF9rZXkuYnl0ZXMpCiAgICBmcmFtZV9kaWcgLTQKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxODUKICAgIC8vIGFzc2VydCBleGlzdHMsICJBIFBlbmRpbmdMb2FuUm91bmRQYXltZW50IHdpdGggdGhpcyByZXBheW1lbnRfa2V5IHdhcyBub3QgZm91bmQiCiAgICBhc3NlcnQgLy8gQSBQZW5kaW5nTG9hblJvdW5kUGF5bWVudCB3aXRoIHRoaXMgcmVwYXltZW50X2tleSB3YXMgbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxODgKICAgIC8vIFtsb2FuX2J5dGVzLCBsb2FuX2V4aXN0c10gPSBvcC5Cb3guZ2V0KHJlcGF5bWVudC5sb2FuX2tleS5ieXRlcykKICAgIGR1cAogICAgaW50IDIKICAgIGV4dHJhY3RfdWludDE2CiAgICBzd2FwCiAgICBkdXAKICAgIGludCAyMAogICAgZXh0cmFjdF91aW50MTYKICAgIGRpZyAxCiAgICB1bmNvdmVyIDMKICAgIGRpZyAyCiAgICBzdWJzdHJpbmczCiAgICBib3hfZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxODkKICAgIC8vIGFzc2VydCBsb2FuX2V4aXN0cywgIkEgbG9hbiB3aXRoIHRoaXMga2V5IHdhcyBub3QgZm91bmQiCiAgICBhc3NlcnQgLy8gQSBsb2FuIHdpdGggdGhpcyBrZXkgd2FzIG5vdCBmb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MTkyCiAgICAvLyBwYXltZW50X3JlY2lwaWVudC5yZWNpcGllbnRfYWRkcmVzcy5uYXRpdmUgPT0gcmVjaXBpZW50X2FjY291bnQKICAgIGZyYW1lX2RpZyAtMgogICAgZXh0cmFjdCA4IDMyIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZHVwCiAgICBjb3ZlciA0CiAgICBmcmFtZV9kaWcgLTMKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxOTEtMTkzCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHBheW1lbnRfcmVjaXBpZW50LnJlY2lwaWVudF9hZGRyZXNzLm5hdGl2ZSA9PSByZWNpcGllbnRfYWNjb3VudAogICAgLy8gKSwgIlRoZSByZWNpcGllbnRfYWNjb3VudCBkb2VzIG5vdCBtYXRjaCB0aGUgcGF5bWVudF9yZWNpcGllbnQiCiAgICBhc3NlcnQgLy8gVGhlIHJlY2lwaWVudF9hY2NvdW50IGRvZXMgbm90IG1hdGNoIHRoZSBwYXltZW50X3JlY2lwaWVudAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MTk2CiAgICAvLyBwcmluY2lwYWxfYXNzZXQuaWQgPT0gbG9hbi5wcmluY2lwYWxfYXNzZXRfaWQubmF0aXZlCiAgICBleHRyYWN0IDUgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgIGR1cAogICAgY292ZXIgMwogICAgZnJhbWVfZGlnIC0xCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MTk1LTE5NwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBwcmluY2lwYWxfYXNzZXQuaWQgPT0gbG9hbi5wcmluY2lwYWxfYXNzZXRfaWQubmF0aXZlCiAgICAvLyApLCAiVGhlIHByaW5jaXBhbF9hc3NldCBwYXNzZWQgaXMgaW52YWxpZCIKICAgIGFzc2VydCAvLyBUaGUgcHJpbmNpcGFsX2Fzc2V0IHBhc3NlZCBpcyBpbnZhbGlkCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxOTkKICAgIC8vIHJlY2lwaWVudF9pc192YWxpZCA9IGE0LkJvb2woKQogICAgYnl0ZSAweDAwCiAgICBjb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyMDEKICAgIC8vIGZvciBpbmRleCBpbiBhcC51cmFuZ2UocmVwYXltZW50LnJlY2lwaWVudHMubGVuZ3RoKToKICAgIGRpZyAxCiAgICBsZW4KICAgIHN1YnN0cmluZzMKICAgIGR1cAogICAgaW50IDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnQgMAoKZXhlY3V0ZV9sb2FuX3JlcGF5bWVudF9mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyMDEKICAgIC8vIGZvciBpbmRleCBpbiBhcC51cmFuZ2UocmVwYXltZW50LnJlY2lwaWVudHMubGVuZ3RoKToKICAgIGZyYW1lX2RpZyA4CiAgICBmcmFtZV9kaWcgNwogICAgPAogICAgZnJhbWVfZGlnIDUKICAgIGZyYW1lX2J1cnkgMQogICAgYnogZXhlY3V0ZV9sb2FuX3JlcGF5bWVudF9hZnRlcl9mb3JANwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MjAyCiAgICAvLyByZWNpcGllbnQgPSByZXBheW1lbnQucmVjaXBpZW50c1tpbmRleF0uY29weSgpCiAgICBmcmFtZV9kaWcgNgogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyA4CiAgICBpbnQgNDAKICAgICoKICAgIGludCA0MAogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MjAzCiAgICAvLyBpZiByZWNpcGllbnQucmVjaXBpZW50X2FkZHJlc3MgPT0gcGF5bWVudF9yZWNpcGllbnQucmVjaXBpZW50X2FkZHJlc3M6CiAgICBleHRyYWN0IDggMzIgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBmcmFtZV9kaWcgMwogICAgPT0KICAgIGJ6IGV4ZWN1dGVfbG9hbl9yZXBheW1lbnRfYWZ0ZXJfaWZfZWxzZUA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyMDUKICAgIC8vIHJlY2lwaWVudC5wYXltZW50X3BlcmNlbnRhZ2UubmF0aXZlCiAgICBmcmFtZV9kaWcgMAogICAgZXh0cmFjdCAwIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyMDYKICAgIC8vID09IHBheW1lbnRfcmVjaXBpZW50LnBheW1lbnRfcGVyY2VudGFnZS5uYXRpdmUKICAgIGZyYW1lX2RpZyAtMgogICAgZXh0cmFjdCAwIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyMDUtMjA2CiAgICAvLyByZWNpcGllbnQucGF5bWVudF9wZXJjZW50YWdlLm5hdGl2ZQogICAgLy8gPT0gcGF5bWVudF9yZWNpcGllbnQucGF5bWVudF9wZXJjZW50YWdlLm5hdGl2ZQogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjIwNC0yMDcKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgcmVjaXBpZW50LnBheW1lbnRfcGVyY2VudGFnZS5uYXRpdmUKICAgIC8vICAgICA9PSBwYXltZW50X3JlY2lwaWVudC5wYXltZW50X3BlcmNlbnRhZ2UubmF0aXZlCiAgICAvLyApLCAicGF5bWVudF9yZWNpcGllbnQucGF5bWVudF9wZXJjZW50YWdlIGlzIGluY29ycmVjdCIKICAgIGFzc2VydCAvLyBwYXltZW50X3JlY2lwaWVudC5wYXltZW50X3BlcmNlbnRhZ2UgaXMgaW5jb3JyZWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyMDgKICAgIC8vIHJlY2lwaWVudF9pc192YWxpZCA9IGE0LkJvb2woVHJ1ZSkgICMgbm9xYTogRkJUMDAzCiAgICBieXRlIDB4ODAKICAgIGZyYW1lX2J1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MjA5CiAgICAvLyBicmVhawogICAgYiBleGVjdXRlX2xvYW5fcmVwYXltZW50X2FmdGVyX2ZvckA3CgpleGVjdXRlX2xvYW5fcmVwYXltZW50X2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjIwMQogICAgLy8gZm9yIGluZGV4IGluIGFwLnVyYW5nZShyZXBheW1lbnQucmVjaXBpZW50cy5sZW5ndGgpOgogICAgZnJhbWVfZGlnIDgKICAgIGludCAxCiAgICArCiAgICBmcmFtZV9idXJ5IDgKICAgIGIgZXhlY3V0ZV9sb2FuX3JlcGF5bWVudF9mb3JfaGVhZGVyQDEKCmV4ZWN1dGVfbG9hbl9yZXBheW1lbnRfYWZ0ZXJfZm9yQDc6CiAgICBmcmFtZV9kaWcgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MjEyCiAgICAvLyByZWNpcGllbnRfaXNfdmFsaWQKICAgIGJ5dGUgMHgwMAogICAgIT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjIxMS0yMTMKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgcmVjaXBpZW50X2lzX3ZhbGlkCiAgICAvLyApLCAicGF5bWVudF9yZWNpcGllbnQgcGFzc2VkIGlzIG5vdCBhIHZhbGlkIHBheW1lbnRfcmVjaXBpZW50IG9mIHRoZSBzcGVjaWZpZWQgbG9hbiIKICAgIGFzc2VydCAvLyBwYXltZW50X3JlY2lwaWVudCBwYXNzZWQgaXMgbm90IGEgdmFsaWQgcGF5bWVudF9yZWNpcGllbnQgb2YgdGhlIHNwZWNpZmllZCBsb2FuCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyMTYKICAgIC8vIHBheW1lbnRfcmVjaXBpZW50LnBheW1lbnRfcGVyY2VudGFnZS5uYXRpdmUKICAgIGZyYW1lX2RpZyAtMgogICAgZXh0cmFjdCAwIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkdXAKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjIxNwogICAgLy8gKyByZXBheW1lbnQucGVyY2VudGFnZV9wYWlkLm5hdGl2ZQogICAgZnJhbWVfZGlnIDIKICAgIGR1cAogICAgY292ZXIgMgogICAgZXh0cmFjdCAxMiA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MjE2LTIxNwogICAgLy8gcGF5bWVudF9yZWNpcGllbnQucGF5bWVudF9wZXJjZW50YWdlLm5hdGl2ZQogICAgLy8gKyByZXBheW1lbnQucGVyY2VudGFnZV9wYWlkLm5hdGl2ZQogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MjE1LTIxOAogICAgLy8gbmV3X3BlcmNlbnRhZ2VfcGFpZCA9ICgKICAgIC8vICAgICBwYXltZW50X3JlY2lwaWVudC5wYXltZW50X3BlcmNlbnRhZ2UubmF0aXZlCiAgICAvLyAgICAgKyByZXBheW1lbnQucGVyY2VudGFnZV9wYWlkLm5hdGl2ZQogICAgLy8gKQogICAgY292ZXIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MjI1CiAgICAvLyByZXBheW1lbnQucmVwYXltZW50X2Ftb3VudCwKICAgIGR1cAogICAgZXh0cmFjdCA0IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyMjQtMjI3CiAgICAvLyBhc3NldF9hbW91bnQ9c2VsZi5wZXJjZW50YWdlKAogICAgLy8gICAgIHJlcGF5bWVudC5yZXBheW1lbnRfYW1vdW50LAogICAgLy8gICAgIHBheW1lbnRfcmVjaXBpZW50LnBheW1lbnRfcGVyY2VudGFnZSwKICAgIC8vICkubmF0aXZlLAogICAgdW5jb3ZlciAyCiAgICBjYWxsc3ViIHBlcmNlbnRhZ2UKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjIyOQogICAgLy8gcmVwYXltZW50X3R4bi5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgZnJhbWVfZGlnIC0zCiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIGZyYW1lX2RpZyA0CiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MjIwCiAgICAvLyByZXBheW1lbnRfdHhuID0gYXAuaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgaW50IGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyMjEKICAgIC8vIGZlZT0xMDAwLAogICAgaW50IDEwMDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyMjkKICAgIC8vIHJlcGF5bWVudF90eG4uc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyMzAKICAgIC8vIHJlcGF5bWVudC5wZXJjZW50YWdlX3BhaWQgPSBhNC5VSW50NjQobmV3X3BlcmNlbnRhZ2VfcGFpZCkKICAgIGRpZyAxCiAgICBpdG9iCiAgICBkdXAKICAgIGNvdmVyIDMKICAgIHJlcGxhY2UyIDEyCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyMzIKICAgIC8vIG9wLkJveC5wdXQocmVwYXltZW50X2tleS5ieXRlcywgcmVwYXltZW50LmJ5dGVzKQogICAgZnJhbWVfZGlnIC00CiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyMzQKICAgIC8vIGxvYW5fcmVwYXltZW50X2NvbXBsZXRlPWE0LkJvb2wobmV3X3BlcmNlbnRhZ2VfcGFpZCA9PSBhcC5VSW50NjQoMTAwMDApKSwKICAgIGludCAxMDAwMAogICAgPT0KICAgIGJ5dGUgMHgwMAogICAgaW50IDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyMzMtMjM2CiAgICAvLyByZXBheW1lbnRfcmVzcG9uc2UgPSBFeGVjdXRlTG9hblJlcGF5bWVudFJlc3BvbnNlKAogICAgLy8gICAgIGxvYW5fcmVwYXltZW50X2NvbXBsZXRlPWE0LkJvb2wobmV3X3BlcmNlbnRhZ2VfcGFpZCA9PSBhcC5VSW50NjQoMTAwMDApKSwKICAgIC8vICAgICBwZXJjZW50YWdlX3BhaWQ9YTQuVUludDY0KG5ld19wZXJjZW50YWdlX3BhaWQpLAogICAgLy8gKQogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyMzcKICAgIC8vIHJldHVybiByZXBheW1lbnRfcmVzcG9uc2UKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2Jhc2UuY29udHJhY3QuWmFpYmF0c3VCYXNlLnBlcmNlbnRhZ2UoYW1vdW50OiBieXRlcywgcGVyY2VudDogYnl0ZXMpIC0+IGJ5dGVzOgpwZXJjZW50YWdlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTI4LTEyOQogICAgLy8gQGFwLnN1YnJvdXRpbmUKICAgIC8vIGRlZiBwZXJjZW50YWdlKHNlbGYsIGFtb3VudDogYTQuVUludDY0LCBwZXJjZW50OiBhNC5VSW50NjQpIC0+IGE0LlVJbnQ2NDoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTMwCiAgICAvLyByZXN1bHQgPSAocGVyY2VudC5uYXRpdmUgKiBhbW91bnQubmF0aXZlKSAvLyBhcC5VSW50NjQoMTAwKQogICAgZnJhbWVfZGlnIC0xCiAgICBidG9pCiAgICBmcmFtZV9kaWcgLTIKICAgIGJ0b2kKICAgICoKICAgIGludCAxMDAKICAgIC8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjEzMQogICAgLy8gcmV0dXJuIGE0LlVJbnQ2NChyZXN1bHQpCiAgICBpdG9iCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfbG9hbi5jb250cmFjdC5aYWliYXRzdUxvYW4uY2xlYW5fdXBfbG9hbl9yZXBheW1lbnQocmVwYXltZW50X2tleTogYnl0ZXMsIGJvcnJvd2VyX2FjY291bnQ6IGJ5dGVzKSAtPiBieXRlczoKY2xlYW5fdXBfbG9hbl9yZXBheW1lbnQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyMzktMjQ0CiAgICAvLyBAYXAuYXJjNC5hYmltZXRob2QoKQogICAgLy8gZGVmIGNsZWFuX3VwX2xvYW5fcmVwYXltZW50KAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgcmVwYXltZW50X2tleTogYXAuU3RyaW5nLAogICAgLy8gICAgIGJvcnJvd2VyX2FjY291bnQ6IGFwLkFjY291bnQsCiAgICAvLyApIC0+IENsZWFuVXBMb2FuUmVwYXltZW50UmVzcG9uc2U6CiAgICBwcm90byAyIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjI0NQogICAgLy8gW3JlcGF5bWVudF9ieXRlcywgZXhpc3RzXSA9IG9wLkJveC5nZXQocmVwYXltZW50X2tleS5ieXRlcykKICAgIGZyYW1lX2RpZyAtMgogICAgYm94X2dldAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MjQ2CiAgICAvLyBhc3NlcnQgZXhpc3RzLCAiQSBQZW5kaW5nTG9hblJvdW5kUGF5bWVudCB3aXRoIHRoaXMgcmVwYXltZW50X2tleSB3YXMgbm90IGZvdW5kIgogICAgYXNzZXJ0IC8vIEEgUGVuZGluZ0xvYW5Sb3VuZFBheW1lbnQgd2l0aCB0aGlzIHJlcGF5bWVudF9rZXkgd2FzIG5vdCBmb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MjQ5CiAgICAvLyBbbG9hbl9ieXRlcywgbG9hbl9leGlzdHNdID0gb3AuQm94LmdldChyZXBheW1lbnQubG9hbl9rZXkuYnl0ZXMpCiAgICBkdXAKICAgIGludCAyCiAgICBleHRyYWN0X3VpbnQxNgogICAgc3dhcAogICAgZHVwCiAgICBpbnQgMjAKICAgIGV4dHJhY3RfdWludDE2CiAgICBzd2FwCiAgICBjb3ZlciAyCiAgICBzdWJzdHJpbmczCiAgICBkdXAKICAgIGJveF9nZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjI1MAogICAgLy8gYXNzZXJ0IGxvYW5fZXhpc3RzLCAiQSBsb2FuIHdpdGggdGhpcyBrZXkgd2FzIG5vdCBmb3VuZCIKICAgIGFzc2VydCAvLyBBIGxvYW4gd2l0aCB0aGlzIGtleSB3YXMgbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyNTQKICAgIC8vIGxvYW5fcmVwYXltZW50X2NvbXBsZXRlPWE0LkJvb2woKQogICAgYnl0ZSAweDAwCiAgICBjb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyNTgKICAgIC8vIGxvYW4uY29tcGxldGVkX3BheW1lbnRfcm91bmRzLm5hdGl2ZSArIGFwLlVJbnQ2NCgxKQogICAgZHVwCiAgICBleHRyYWN0IDY1IDEgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICBpbnQgMQogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MjU3LTI1OQogICAgLy8gbG9hbi5jb21wbGV0ZWRfcGF5bWVudF9yb3VuZHMgPSBhNC5VSW50OCgKICAgIC8vICAgICBsb2FuLmNvbXBsZXRlZF9wYXltZW50X3JvdW5kcy5uYXRpdmUgKyBhcC5VSW50NjQoMSkKICAgIC8vICkKICAgIGl0b2IKICAgIGV4dHJhY3QgNyAxCiAgICByZXBsYWNlMiA2NQogICAgZHVwCiAgICBjb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyNjAKICAgIC8vIGlmIGxvYW4ucGF5bWVudF9yb3VuZHMubmF0aXZlID09IGxvYW4uY29tcGxldGVkX3BheW1lbnRfcm91bmRzLm5hdGl2ZToKICAgIGR1cAogICAgZXh0cmFjdCA1MyAxIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnRvaQogICAgc3dhcAogICAgZXh0cmFjdCA2NSAxIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnRvaQogICAgPT0KICAgIGJ6IGNsZWFuX3VwX2xvYW5fcmVwYXltZW50X2Vsc2VfYm9keUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyNjMKICAgIC8vIHhmZXJfYXNzZXQ9bG9hbi5jb2xsYXRlcmFsX2Fzc2V0X2lkLm5hdGl2ZSwKICAgIGZyYW1lX2RpZyAxCiAgICBkdXAKICAgIGV4dHJhY3QgMTMgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjI2NQogICAgLy8gYXNzZXRfYW1vdW50PWxvYW4uY29sbGF0ZXJhbF9hc3NldF9hbW91bnQubmF0aXZlLAogICAgZXh0cmFjdCAzNyA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MjY4CiAgICAvLyBjb21wbGV0ZV9sb2FuX3JlcGF5bWV0X3R4bi5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MjY2CiAgICAvLyBub3RlPSJDb2xsYXRlcmFsIHJlcGF5bWVudCBvbiBjb21wbGV0ZWQgbG9hbiIsCiAgICBieXRlICJDb2xsYXRlcmFsIHJlcGF5bWVudCBvbiBjb21wbGV0ZWQgbG9hbiIKICAgIGl0eG5fZmllbGQgTm90ZQogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgZnJhbWVfZGlnIC0xCiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyNjEKICAgIC8vIGNvbXBsZXRlX2xvYW5fcmVwYXltZXRfdHhuID0gYXAuaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgaW50IGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyNjIKICAgIC8vIGZlZT0xMDAsCiAgICBpbnQgMTAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MjY4CiAgICAvLyBjb21wbGV0ZV9sb2FuX3JlcGF5bWV0X3R4bi5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjI2OQogICAgLy8gb3AuQm94LmRlbGV0ZShyZXBheW1lbnQubG9hbl9rZXkuYnl0ZXMpCiAgICBib3hfZGVsCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjI3MAogICAgLy8gY2xlYW5fdXBfcmVzcG9uc2UubG9hbl9yZXBheW1lbnRfY29tcGxldGUgPSBhNC5Cb29sKFRydWUpICAjIG5vcWE6IEZCVDAwMwogICAgYnl0ZSAweDgwCiAgICBmcmFtZV9idXJ5IDAKICAgIGIgY2xlYW5fdXBfbG9hbl9yZXBheW1lbnRfYWZ0ZXJfaWZfZWxzZUA0CgpjbGVhbl91cF9sb2FuX3JlcGF5bWVudF9lbHNlX2JvZHlAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjI3MgogICAgLy8gb3AuQm94LnB1dChyZXBheW1lbnQubG9hbl9rZXkuYnl0ZXMsIGxvYW4uYnl0ZXMpCiAgICBmcmFtZV9kaWcgMQogICAgYm94X3B1dAoKY2xlYW5fdXBfbG9hbl9yZXBheW1lbnRfYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6Mjc0CiAgICAvLyBvcC5Cb3guZGVsZXRlKHJlcGF5bWVudF9rZXkuYnl0ZXMpCiAgICBmcmFtZV9kaWcgLTIKICAgIGJveF9kZWwKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6Mjc2CiAgICAvLyByZXR1cm4gY2xlYW5fdXBfcmVzcG9uc2UKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLmNvbnRyYWN0LlphaWJhdHN1TG9hbi5oYW5kbGVfcGF5bWVudF9kZWZhdWx0KGxvYW5fa2V5OiBieXRlcywgcmVwYXltZW50X2tleTogYnl0ZXMsIHBheW1lbnRfcHJpbmNpcGFsX2Fzc2V0X2Ftb3VudDogdWludDY0LCBwYXltZW50X2NvbGxhdGVyYWxfYXNzZXRfYW1vdW50OiB1aW50NjQpIC0+IHZvaWQ6CmhhbmRsZV9wYXltZW50X2RlZmF1bHQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyNzgtMjg1CiAgICAvLyBAYXAuYXJjNC5hYmltZXRob2QoKQogICAgLy8gZGVmIGhhbmRsZV9wYXltZW50X2RlZmF1bHQoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICBsb2FuX2tleTogYXAuU3RyaW5nLAogICAgLy8gICAgIHJlcGF5bWVudF9rZXk6IGFwLlN0cmluZywKICAgIC8vICAgICBwYXltZW50X3ByaW5jaXBhbF9hc3NldF9hbW91bnQ6IGFwLlVJbnQ2NCwKICAgIC8vICAgICBwYXltZW50X2NvbGxhdGVyYWxfYXNzZXRfYW1vdW50OiBhcC5VSW50NjQsCiAgICAvLyApIC0+IE5vbmU6CiAgICBwcm90byA0IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjI4NgogICAgLy8gW2xvYW5fYnl0ZXMsIGV4aXN0c10gPSBvcC5Cb3guZ2V0KGxvYW5fa2V5LmJ5dGVzKQogICAgZnJhbWVfZGlnIC00CiAgICBib3hfZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyODcKICAgIC8vIGFzc2VydCBleGlzdHMsICJBIHJlY2NvcmQgd2l0aCB0aGUgbG9hbl9rZXkgcGFzc2VkIHdhcyBub3QgZm91bmQiCiAgICBhc3NlcnQgLy8gQSByZWNjb3JkIHdpdGggdGhlIGxvYW5fa2V5IHBhc3NlZCB3YXMgbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyOTIKICAgIC8vIGRldGFpbHMuY29sbGF0ZXJhbF9hc3NldF9hbW91bnQubmF0aXZlIC0gcGF5bWVudF9jb2xsYXRlcmFsX2Fzc2V0X2Ftb3VudAogICAgZHVwCiAgICBleHRyYWN0IDM3IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICBmcmFtZV9kaWcgLTEKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjI5MS0yOTMKICAgIC8vIGRldGFpbHMuY29sbGF0ZXJhbF9hc3NldF9hbW91bnQgPSBhNC5VSW50NjQoCiAgICAvLyAgICAgZGV0YWlscy5jb2xsYXRlcmFsX2Fzc2V0X2Ftb3VudC5uYXRpdmUgLSBwYXltZW50X2NvbGxhdGVyYWxfYXNzZXRfYW1vdW50CiAgICAvLyApCiAgICBpdG9iCiAgICByZXBsYWNlMiAzNwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6Mjk2CiAgICAvLyByZXBheW1lbnRfa2V5PWE0LlN0cmluZyhyZXBheW1lbnRfa2V5KSwKICAgIGZyYW1lX2RpZyAtMwogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgZnJhbWVfZGlnIC0zCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjI5OAogICAgLy8gcmVwYXltZW50X2Ftb3VudD1hNC5VSW50NjQocGF5bWVudF9wcmluY2lwYWxfYXNzZXRfYW1vdW50KSwKICAgIGZyYW1lX2RpZyAtMgogICAgaXRvYgogICAgY292ZXIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MzAwCiAgICAvLyByZWNpcGllbnRzPWRldGFpbHMucGF5bWVudF9yZWNpcGllbnRzLmNvcHkoKSwKICAgIGRpZyAxCiAgICBpbnQgNjIKICAgIGV4dHJhY3RfdWludDE2CiAgICBzd2FwCiAgICBkaWcgMgogICAgbGVuCiAgICBzd2FwCiAgICBkaWcgMwogICAgdW5jb3ZlciAzCiAgICB1bmNvdmVyIDMKICAgIHN1YnN0cmluZzMKICAgIGNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjI5NS0zMDEKICAgIC8vIHJvdW5kX3BheW1lbnQgPSBQZW5kaW5nTG9hblJvdW5kUGF5bWVudCgKICAgIC8vICAgICByZXBheW1lbnRfa2V5PWE0LlN0cmluZyhyZXBheW1lbnRfa2V5KSwKICAgIC8vICAgICBsb2FuX2tleT1hNC5TdHJpbmcuZnJvbV9ieXRlcyhsb2FuX2tleS5ieXRlcyksCiAgICAvLyAgICAgcmVwYXltZW50X2Ftb3VudD1hNC5VSW50NjQocGF5bWVudF9wcmluY2lwYWxfYXNzZXRfYW1vdW50KSwKICAgIC8vICAgICBwZXJjZW50YWdlX3BhaWQ9YTQuVUludDY0KDApLAogICAgLy8gICAgIHJlY2lwaWVudHM9ZGV0YWlscy5wYXltZW50X3JlY2lwaWVudHMuY29weSgpLAogICAgLy8gKQogICAgZHVwCiAgICBsZW4KICAgIGludCAyMgogICAgKwogICAgZHVwCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgYnl0ZSAweDAwMTYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC00CiAgICBsZW4KICAgIHVuY292ZXIgMgogICAgKwogICAgc3dhcAogICAgdW5jb3ZlciA1CiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjI5OQogICAgLy8gcGVyY2VudGFnZV9wYWlkPWE0LlVJbnQ2NCgwKSwKICAgIGJ5dGUgMHgwMDAwMDAwMDAwMDAwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyOTUtMzAxCiAgICAvLyByb3VuZF9wYXltZW50ID0gUGVuZGluZ0xvYW5Sb3VuZFBheW1lbnQoCiAgICAvLyAgICAgcmVwYXltZW50X2tleT1hNC5TdHJpbmcocmVwYXltZW50X2tleSksCiAgICAvLyAgICAgbG9hbl9rZXk9YTQuU3RyaW5nLmZyb21fYnl0ZXMobG9hbl9rZXkuYnl0ZXMpLAogICAgLy8gICAgIHJlcGF5bWVudF9hbW91bnQ9YTQuVUludDY0KHBheW1lbnRfcHJpbmNpcGFsX2Fzc2V0X2Ftb3VudCksCiAgICAvLyAgICAgcGVyY2VudGFnZV9wYWlkPWE0LlVJbnQ2NCgwKSwKICAgIC8vICAgICByZWNpcGllbnRzPWRldGFpbHMucGF5bWVudF9yZWNpcGllbnRzLmNvcHkoKSwKICAgIC8vICkKICAgIGNvbmNhdAogICAgc3dhcAogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTQKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjMwMwogICAgLy8gb3AuQm94LnB1dChsb2FuX2tleS5ieXRlcywgZGV0YWlscy5ieXRlcykKICAgIGZyYW1lX2RpZyAtNAogICAgdW5jb3ZlciAyCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTozMDQKICAgIC8vIG9wLkJveC5wdXQocmVwYXltZW50X2tleS5ieXRlcywgcm91bmRfcGF5bWVudC5ieXRlcykKICAgIGZyYW1lX2RpZyAtMwogICAgc3dhcAogICAgYm94X3B1dAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2xvYW4uY29udHJhY3QuWmFpYmF0c3VMb2FuLmRlbGV0ZV9sb2FuKGxvYW5fa2V5OiBieXRlcykgLT4gdm9pZDoKZGVsZXRlX2xvYW46CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTozMDYtMzA3CiAgICAvLyBAYXAuYXJjNC5hYmltZXRob2QoKQogICAgLy8gZGVmIGRlbGV0ZV9sb2FuKHNlbGYsIGxvYW5fa2V5OiBhcC5CeXRlcykgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MzA4CiAgICAvLyBvcC5Cb3guZGVsZXRlKGxvYW5fa2V5KQogICAgZnJhbWVfZGlnIC0xCiAgICBib3hfZGVsCiAgICBwb3AKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9iYXNlLmNvbnRyYWN0LlphaWJhdHN1QmFzZS5jcmVhdGUoKSAtPiB1aW50NjQ6CmNyZWF0ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjE2LTE3CiAgICAvLyBAYTQuYWJpbWV0aG9kKGNyZWF0ZT0iYWxsb3ciKQogICAgLy8gZGVmIGNyZWF0ZShzZWxmKSAtPiBib29sOgogICAgcHJvdG8gMCAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToxOAogICAgLy8gc2VsZi5hZG1pbnMuYXBwZW5kKGE0LkFkZHJlc3MoYXAuVHhuLnNlbmRlcikpCiAgICBpbnQgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTMKICAgIC8vIHNlbGYuYWRtaW5zOiBBZGRyZXNzQXJyYXkgPSBBZGRyZXNzQXJyYXkoKQogICAgYnl0ZSAiYWRtaW5zIgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTgKICAgIC8vIHNlbGYuYWRtaW5zLmFwcGVuZChhNC5BZGRyZXNzKGFwLlR4bi5zZW5kZXIpKQogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFkbWlucyBleGlzdHMKICAgIGV4dHJhY3QgMiAwCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIGR1cAogICAgbGVuCiAgICBpbnQgMzIKICAgIC8KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjEzCiAgICAvLyBzZWxmLmFkbWluczogQWRkcmVzc0FycmF5ID0gQWRkcmVzc0FycmF5KCkKICAgIGJ5dGUgImFkbWlucyIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjE4CiAgICAvLyBzZWxmLmFkbWlucy5hcHBlbmQoYTQuQWRkcmVzcyhhcC5UeG4uc2VuZGVyKSkKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToxOQogICAgLy8gcmV0dXJuIFRydWUKICAgIGludCAxCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfYmFzZS5jb250cmFjdC5aYWliYXRzdUJhc2UudXBkYXRlKCkgLT4gdWludDY0Ogp1cGRhdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToyMS0yMgogICAgLy8gQGE0LmFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiVXBkYXRlQXBwbGljYXRpb24iXSkKICAgIC8vIGRlZiB1cGRhdGUoc2VsZikgLT4gYm9vbDoKICAgIHByb3RvIDAgMQogICAgYnl0ZSAiIgogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToyMwogICAgLy8gaWYgYXAuVHhuLnNlbmRlciA9PSBvcC5HbG9iYWwuY3JlYXRvcl9hZGRyZXNzOgogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgYnogdXBkYXRlX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MjQKICAgIC8vIHJldHVybiBUcnVlCiAgICBpbnQgMQogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCnVwZGF0ZV9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToyNQogICAgLy8gZm9yIGluZGV4IGluIGFwLnVyYW5nZShzZWxmLmFkbWlucy5sZW5ndGgpOgogICAgaW50IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjEzCiAgICAvLyBzZWxmLmFkbWluczogQWRkcmVzc0FycmF5ID0gQWRkcmVzc0FycmF5KCkKICAgIGJ5dGUgImFkbWlucyIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjI1CiAgICAvLyBmb3IgaW5kZXggaW4gYXAudXJhbmdlKHNlbGYuYWRtaW5zLmxlbmd0aCk6CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWRtaW5zIGV4aXN0cwogICAgaW50IDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBmcmFtZV9idXJ5IDEKICAgIGludCAwCiAgICBmcmFtZV9idXJ5IDAKCnVwZGF0ZV9mb3JfaGVhZGVyQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToyNQogICAgLy8gZm9yIGluZGV4IGluIGFwLnVyYW5nZShzZWxmLmFkbWlucy5sZW5ndGgpOgogICAgZnJhbWVfZGlnIDAKICAgIGZyYW1lX2RpZyAxCiAgICA8CiAgICBieiB1cGRhdGVfYWZ0ZXJfZm9yQDkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjI2CiAgICAvLyBpZiBzZWxmLmFkbWluc1tpbmRleF0gPT0gYXAuVHhuLnNlbmRlcjoKICAgIGludCAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToxMwogICAgLy8gc2VsZi5hZG1pbnM6IEFkZHJlc3NBcnJheSA9IEFkZHJlc3NBcnJheSgpCiAgICBieXRlICJhZG1pbnMiCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToyNgogICAgLy8gaWYgc2VsZi5hZG1pbnNbaW5kZXhdID09IGFwLlR4bi5zZW5kZXI6CiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWRtaW5zIGV4aXN0cwogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAwCiAgICBpbnQgMzIKICAgICoKICAgIGludCAzMgogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICB0eG4gU2VuZGVyCiAgICA9PQogICAgYnogdXBkYXRlX2FmdGVyX2lmX2Vsc2VANgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MjcKICAgIC8vIHJldHVybiBUcnVlCiAgICBpbnQgMQogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCnVwZGF0ZV9hZnRlcl9pZl9lbHNlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToyNQogICAgLy8gZm9yIGluZGV4IGluIGFwLnVyYW5nZShzZWxmLmFkbWlucy5sZW5ndGgpOgogICAgZnJhbWVfZGlnIDAKICAgIGludCAxCiAgICArCiAgICBmcmFtZV9idXJ5IDAKICAgIGIgdXBkYXRlX2Zvcl9oZWFkZXJAMwoKdXBkYXRlX2FmdGVyX2ZvckA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MjgKICAgIC8vIHJldHVybiBGYWxzZQogICAgaW50IDAKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2Jhc2UuY29udHJhY3QuWmFpYmF0c3VCYXNlLmRlbGV0ZSgpIC0+IHVpbnQ2NDoKZGVsZXRlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MzAtMzEKICAgIC8vIEBhNC5hYmltZXRob2QoYWxsb3dfYWN0aW9ucz1bIkRlbGV0ZUFwcGxpY2F0aW9uIl0pCiAgICAvLyBkZWYgZGVsZXRlKHNlbGYpIC0+IGJvb2w6CiAgICBwcm90byAwIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjMyCiAgICAvLyBpZiBhcC5UeG4uc2VuZGVyID09IG9wLkdsb2JhbC5jcmVhdG9yX2FkZHJlc3M6CiAgICB0eG4gU2VuZGVyCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBieiBkZWxldGVfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTozMwogICAgLy8gcmV0dXJuIFRydWUKICAgIGludCAxCiAgICByZXRzdWIKCmRlbGV0ZV9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTozNAogICAgLy8gcmV0dXJuIEZhbHNlCiAgICBpbnQgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2Jhc2UuY29udHJhY3QuWmFpYmF0c3VCYXNlLm9wdF9jb250cmFjdF9pbnRvX2Fzc2V0KGFzc2V0OiB1aW50NjQpIC0+IHVpbnQ2NDoKb3B0X2NvbnRyYWN0X2ludG9fYXNzZXQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTozNi0zNwogICAgLy8gQGE0LmFiaW1ldGhvZCgpCiAgICAvLyBkZWYgb3B0X2NvbnRyYWN0X2ludG9fYXNzZXQoc2VsZiwgYXNzZXQ6IGFwLkFzc2V0KSAtPiBib29sOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTozOAogICAgLy8gc2VsZi5vcHRfYXBwX2ludG9fYXNzZXQoYXNzZXQpCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgb3B0X2FwcF9pbnRvX2Fzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTozOQogICAgLy8gcmV0dXJuIFRydWUKICAgIGludCAxCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfYmFzZS5jb250cmFjdC5aYWliYXRzdUJhc2Uub3B0X2FwcF9pbnRvX2Fzc2V0KGFzc2V0OiB1aW50NjQpIC0+IHZvaWQ6Cm9wdF9hcHBfaW50b19hc3NldDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjU1LTU5CiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMgICBTdWJyb3V0aW5lcyAgICAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBAYXAuc3Vicm91dGluZQogICAgLy8gZGVmIG9wdF9hcHBfaW50b19hc3NldChzZWxmLCBhc3NldDogYXAuQXNzZXQpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjY0CiAgICAvLyBhc3NldF9yZWNlaXZlcj1hcC5HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjY2CiAgICAvLyB0eG4uc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIGl0eG5fZmllbGQgQXNzZXRSZWNlaXZlcgogICAgZnJhbWVfZGlnIC0xCiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6NjEKICAgIC8vIGFzc2V0X2Ftb3VudD0wLAogICAgaW50IDAKICAgIGl0eG5fZmllbGQgQXNzZXRBbW91bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjYwCiAgICAvLyB0eG4gPSBhcC5pdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBpbnQgYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjYyCiAgICAvLyBmZWU9MTAwMCwKICAgIGludCAxMDAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6NjYKICAgIC8vIHR4bi5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9iYXNlLmNvbnRyYWN0LlphaWJhdHN1QmFzZS50cmFuc2Zlcl9hc3NldChhc3NldDogdWludDY0LCBhc3NldF9hbW91bnQ6IHVpbnQ2NCwgcmVjaXBpZW50OiBieXRlcykgLT4gdWludDY0Ogp0cmFuc2Zlcl9hc3NldDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjQxLTQ0CiAgICAvLyBAYTQuYWJpbWV0aG9kKCkKICAgIC8vIGRlZiB0cmFuc2Zlcl9hc3NldCgKICAgIC8vICAgICBzZWxmLCBhc3NldDogYXAuQXNzZXQsIGFzc2V0X2Ftb3VudDogYXAuVUludDY0LCByZWNpcGllbnQ6IGFwLkFjY291bnQKICAgIC8vICkgLT4gYm9vbDoKICAgIHByb3RvIDMgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6NDUKICAgIC8vIHNlbGYuYXV0aG9yaXNlX3R4bigpCiAgICBjYWxsc3ViIGF1dGhvcmlzZV90eG4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjUyCiAgICAvLyB0eG4uc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIGZyYW1lX2RpZyAtMgogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgZnJhbWVfZGlnIC0xCiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIGZyYW1lX2RpZyAtMwogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjQ2CiAgICAvLyB0eG4gPSBhcC5pdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBpbnQgYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjQ3CiAgICAvLyBmZWU9MTAwMCwKICAgIGludCAxMDAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6NTIKICAgIC8vIHR4bi5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjUzCiAgICAvLyByZXR1cm4gVHJ1ZQogICAgaW50IDEKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9iYXNlLmNvbnRyYWN0LlphaWJhdHN1QmFzZS5hdXRob3Jpc2VfdHhuKCkgLT4gdm9pZDoKYXV0aG9yaXNlX3R4bjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjY4LTY5CiAgICAvLyBAYXAuc3Vicm91dGluZQogICAgLy8gZGVmIGF1dGhvcmlzZV90eG4oc2VsZikgLT4gTm9uZToKICAgIHByb3RvIDAgMAogICAgYnl0ZSAiIgogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo3MAogICAgLy8gaXNfYXV0aG9yaXNlZCA9IGE0LkJvb2woKQogICAgYnl0ZSAweDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo3MQogICAgLy8gaWYgYXAuVHhuLnNlbmRlciA9PSBvcC5HbG9iYWwuY3JlYXRvcl9hZGRyZXNzOgogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgYnogYXV0aG9yaXNlX3R4bl9lbHNlX2JvZHlAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6NzIKICAgIC8vIGlzX2F1dGhvcmlzZWQgPSBhNC5Cb29sKFRydWUpICAjIG5vcWE6IEZCVDAwMwogICAgYnl0ZSAweDgwCiAgICBmcmFtZV9idXJ5IDIKICAgIGIgYXV0aG9yaXNlX3R4bl9hZnRlcl9pZl9lbHNlQDEwCgphdXRob3Jpc2VfdHhuX2Vsc2VfYm9keUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6NzQKICAgIC8vIGZvciBpbmRleCBpbiBhcC51cmFuZ2Uoc2VsZi5hZG1pbnMubGVuZ3RoKToKICAgIGludCAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToxMwogICAgLy8gc2VsZi5hZG1pbnM6IEFkZHJlc3NBcnJheSA9IEFkZHJlc3NBcnJheSgpCiAgICBieXRlICJhZG1pbnMiCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo3NAogICAgLy8gZm9yIGluZGV4IGluIGFwLnVyYW5nZShzZWxmLmFkbWlucy5sZW5ndGgpOgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFkbWlucyBleGlzdHMKICAgIGludCAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZnJhbWVfYnVyeSAxCiAgICBpbnQgMAogICAgZnJhbWVfYnVyeSAwCgphdXRob3Jpc2VfdHhuX2Zvcl9oZWFkZXJAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5Ojc0CiAgICAvLyBmb3IgaW5kZXggaW4gYXAudXJhbmdlKHNlbGYuYWRtaW5zLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgMAogICAgZnJhbWVfZGlnIDEKICAgIDwKICAgIGJ6IGF1dGhvcmlzZV90eG5fYWZ0ZXJfaWZfZWxzZUAxMAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6NzUKICAgIC8vIGlmIHNlbGYuYWRtaW5zW2luZGV4XSA9PSBhcC5UeG4uc2VuZGVyOgogICAgaW50IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjEzCiAgICAvLyBzZWxmLmFkbWluczogQWRkcmVzc0FycmF5ID0gQWRkcmVzc0FycmF5KCkKICAgIGJ5dGUgImFkbWlucyIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5Ojc1CiAgICAvLyBpZiBzZWxmLmFkbWluc1tpbmRleF0gPT0gYXAuVHhuLnNlbmRlcjoKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hZG1pbnMgZXhpc3RzCiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDAKICAgIGludCAzMgogICAgKgogICAgaW50IDMyCiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIHR4biBTZW5kZXIKICAgID09CiAgICBieiBhdXRob3Jpc2VfdHhuX2FmdGVyX2lmX2Vsc2VANgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6NzYKICAgIC8vIGlzX2F1dGhvcmlzZWQgPSBhNC5Cb29sKFRydWUpICAjIG5vcWE6IEZCVDAwMwogICAgYnl0ZSAweDgwCiAgICBmcmFtZV9idXJ5IDIKCmF1dGhvcmlzZV90eG5fYWZ0ZXJfaWZfZWxzZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6NzQKICAgIC8vIGZvciBpbmRleCBpbiBhcC51cmFuZ2Uoc2VsZi5hZG1pbnMubGVuZ3RoKToKICAgIGZyYW1lX2RpZyAwCiAgICBpbnQgMQogICAgKwogICAgZnJhbWVfYnVyeSAwCiAgICBiIGF1dGhvcmlzZV90eG5fZm9yX2hlYWRlckAzCgphdXRob3Jpc2VfdHhuX2FmdGVyX2lmX2Vsc2VAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo3NwogICAgLy8gYXNzZXJ0IGlzX2F1dGhvcmlzZWQsICJZb3UgYXJlIG5vdCBhdXRob3Jpc2VkIHRvIHBlcmZvcm0gdGhpcyBhY3Rpb24iCiAgICBmcmFtZV9kaWcgMgogICAgYnl0ZSAweDAwCiAgICAhPQogICAgYXNzZXJ0IC8vIFlvdSBhcmUgbm90IGF1dGhvcmlzZWQgdG8gcGVyZm9ybSB0aGlzIGFjdGlvbgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2Jhc2UuY29udHJhY3QuWmFpYmF0c3VCYXNlLl9faW5pdF9fKCkgLT4gdm9pZDoKX19pbml0X186CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToxMgogICAgLy8gZGVmIF9faW5pdF9fKHNlbGYpIC0+IE5vbmU6CiAgICBwcm90byAwIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjEzCiAgICAvLyBzZWxmLmFkbWluczogQWRkcmVzc0FycmF5ID0gQWRkcmVzc0FycmF5KCkKICAgIGJ5dGUgImFkbWlucyIKICAgIGJ5dGUgMHgwMDAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTQKICAgIC8vIHNlbGYuc2VydmljZV9jb250cmFjdDogYTQuQWRkcmVzcyA9IGE0LkFkZHJlc3MoKQogICAgYnl0ZSAic2VydmljZV9jb250cmFjdCIKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1Ygo=",
-    "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzbWFydF9jb250cmFjdHMuemFpYmF0c3VfbG9hbi5jb250cmFjdC5aYWliYXRzdUxvYW4uY2xlYXJfc3RhdGVfcHJvZ3JhbToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjE3CiAgICAvLyBjbGFzcyBaYWliYXRzdUxvYW4oWmFpYmF0c3VCYXNlKToKICAgIGludCAxCiAgICByZXR1cm4K"
-  },
-  "state": {
-    "global": {
-      "num_byte_slices": 2,
-      "num_uints": 0
     },
-    "local": {
-      "num_byte_slices": 0,
-      "num_uints": 0
+    "migrate_legacy_admins()uint64": {
+      "call_config": {
+        "no_op": "CALL"
+      }
+    },
+    "set_price_oracle(application,uint64)bool": {
+      "call_config": {
+        "no_op": "CALL"
+      }
+    },
+    "refresh_asset_prices(uint64[])bool": {
+      "call_config": {
+        "no_op": "CALL"
+      }
+    },
+    "opt_contract_into_asset(asset)bool": {
+      "call_config": {
+        "no_op": "CALL"
+      }
+    },
+    "transfer_asset(asset,uint64,account)bool": {
+      "call_config": {
+        "no_op": "CALL"
+      }
+    }
+  },
+  "source": {
+    "approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzbWFydF9jb250cmFjdHMuemFpYmF0c3VfbG9hbi5jb250cmFjdC5aYWliYXRzdUxvYW4uYXBwcm92YWxfcHJvZ3JhbToKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBibnogbWFpbl9lbnRyeXBvaW50QDIKICAgIGNhbGxzdWIgX19pbml0X18KCm1haW5fZW50cnlwb2ludEAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6OTIKICAgIC8vIGNsYXNzIFphaWJhdHN1TG9hbihaYWliYXRzdUJhc2UpOgogICAgbWV0aG9kICJpbml0aWF0ZV9sb2FuX3B1cmNoYXNlKChzdHJpbmcsc3RyaW5nLHVpbnQ4LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ4LHVpbnQ2NCwodWludDY0LGFkZHJlc3MpW10sYm9vbCxib29sLHVpbnQ4LGFkZHJlc3MsdWludDY0LHVpbnQ2NCksYXhmZXIpYnl0ZVs4XSIKICAgIG1ldGhvZCAiaW5pdGlhdGVfbG9hbl9wdXJjaGFzZXMoKHN0cmluZyxzdHJpbmcsdWludDgsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDgsdWludDY0LCh1aW50NjQsYWRkcmVzcylbXSxib29sLGJvb2wsdWludDgsYWRkcmVzcyx1aW50NjQsdWludDY0KVtdKWJ5dGVbOF1bXSIKICAgIG1ldGhvZCAiY29tcGxldGVfbm9uX3AycF9sb2FuX3B1cmNoYXNlKGJ5dGVbXSwoc3RyaW5nLHN0cmluZyxzdHJpbmcsc3RyaW5nKSxhc3NldCxhY2NvdW50KSh1aW50OCx1aW50OCx1aW50OCx1aW50OCx1aW50OCxib29sLGJvb2wsYm9vbCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCxhZGRyZXNzLHVpbnQ2NCkiCiAgICBtZXRob2QgImNvbXBsZXRlX3AycF9sb2FuX3B1cmNoYXNlKGJ5dGVbXSwoc3RyaW5nLHN0cmluZyxzdHJpbmcsc3RyaW5nKSxhc3NldCxhY2NvdW50LGF4ZmVyKSh1aW50OCx1aW50OCx1aW50OCx1aW50OCx1aW50OCxib29sLGJvb2wsYm9vbCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCxhZGRyZXNzLHVpbnQ2NCkiCiAgICBtZXRob2QgImluaXRpYXRlX2xvYW5fcmVwYXltZW50KGJ5dGVbXSxheGZlcilieXRlWzhdIgogICAgbWV0aG9kICJleGVjdXRlX2xvYW5fcmVwYXltZW50KGJ5dGVbXSx1aW50NjQsYWNjb3VudCxhc3NldCkoYm9vbCx1aW50NjQpIgogICAgbWV0aG9kICJleGVjdXRlX2xvYW5fcmVwYXltZW50X2JhdGNoKGJ5dGVbXSxhc3NldCkoYm9vbCx1aW50NjQpIgogICAgbWV0aG9kICJjbGVhbl91cF9sb2FuX3JlcGF5bWVudChieXRlW10sYWNjb3VudCkoYm9vbCkiCiAgICBtZXRob2QgImNsZWFuX3VwX2xvYW5fcmVwYXltZW50cyhieXRlWzhdW10pYm9vbFtdIgogICAgbWV0aG9kICJyZXBheV9sb2FuX3JvdW5kKGJ5dGVbXSxheGZlcikoYm9vbCkiCiAgICBtZXRob2QgImhhbmRsZV9wYXltZW50X2RlZmF1bHQoYnl0ZVtdLHVpbnQ2NCx1aW50NjQpYnl0ZVs4XSIKICAgIG1ldGhvZCAiaGFuZGxlX3BheW1lbnRfZGVmYXVsdHMoYnl0ZVs4XVtdKShieXRlWzhdLHVpbnQ2NClbXSIKICAgIG1ldGhvZCAiZGVsZXRlX2xvYW4oYnl0ZVtdKXZvaWQiCiAgICBtZXRob2QgIm1pZ3JhdGVfbG9hbl9yZWNvcmQoYnl0ZVtdKWJ5dGVbOF0iCiAgICBtZXRob2QgImdldF9ib3Jyb3dlcl9sb2FucyhhY2NvdW50KWJ5dGVbOF1bXSIKICAgIG1ldGhvZCAiZ2V0X2xvYW5fc3RhdHVzZXMoYnl0ZVs4XVtdKXVpbnQ4W10iCiAgICBtZXRob2QgImdldF9hbW91bnRzX2R1ZShieXRlWzhdW10pdWludDY0W10iCiAgICBtZXRob2QgImdldF9yZW1haW5pbmdfcm91bmRzKGJ5dGVbOF1bXSl1aW50OFtdIgogICAgbWV0aG9kICJnZXRfcmVwYXltZW50X3Byb2dyZXNzKGJ5dGVbOF1bXSkoYm9vbCx1aW50NjQpW10iCiAgICBtZXRob2QgImNyZWF0ZSgpYm9vbCIKICAgIG1ldGhvZCAidXBkYXRlKClib29sIgogICAgbWV0aG9kICJkZWxldGUoKWJvb2wiCiAgICBtZXRob2QgImFkZF9hZG1pbihhY2NvdW50KWJvb2wiCiAgICBtZXRob2QgInJlbW92ZV9hZG1pbihhY2NvdW50KWJvb2wiCiAgICBtZXRob2QgIm1pZ3JhdGVfbGVnYWN5X2FkbWlucygpdWludDY0IgogICAgbWV0aG9kICJzZXRfcHJpY2Vfb3JhY2xlKGFwcGxpY2F0aW9uLHVpbnQ2NClib29sIgogICAgbWV0aG9kICJyZWZyZXNoX2Fzc2V0X3ByaWNlcyh1aW50NjRbXSlib29sIgogICAgbWV0aG9kICJvcHRfY29udHJhY3RfaW50b19hc3NldChhc3NldClib29sIgogICAgbWV0aG9kICJ0cmFuc2Zlcl9hc3NldChhc3NldCx1aW50NjQsYWNjb3VudClib29sIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl9pbml0aWF0ZV9sb2FuX3B1cmNoYXNlX3JvdXRlQDMgbWFpbl9pbml0aWF0ZV9sb2FuX3B1cmNoYXNlc19yb3V0ZUA0IG1haW5fY29tcGxldGVfbm9uX3AycF9sb2FuX3B1cmNoYXNlX3JvdXRlQDUgbWFpbl9jb21wbGV0ZV9wMnBfbG9hbl9wdXJjaGFzZV9yb3V0ZUA2IG1haW5faW5pdGlhdGVfbG9hbl9yZXBheW1lbnRfcm91dGVANyBtYWluX2V4ZWN1dGVfbG9hbl9yZXBheW1lbnRfcm91dGVAOCBtYWluX2V4ZWN1dGVfbG9hbl9yZXBheW1lbnRfYmF0Y2hfcm91dGVAOSBtYWluX2NsZWFuX3VwX2xvYW5fcmVwYXltZW50X3JvdXRlQDEwIG1haW5fY2xlYW5fdXBfbG9hbl9yZXBheW1lbnRzX3JvdXRlQDExIG1haW5fcmVwYXlfbG9hbl9yb3VuZF9yb3V0ZUAxMiBtYWluX2hhbmRsZV9wYXltZW50X2RlZmF1bHRfcm91dGVAMTMgbWFpbl9oYW5kbGVfcGF5bWVudF9kZWZhdWx0c19yb3V0ZUAxNCBtYWluX2RlbGV0ZV9sb2FuX3JvdXRlQDE1IG1haW5fbWlncmF0ZV9sb2FuX3JlY29yZF9yb3V0ZUAxNiBtYWluX2dldF9ib3Jyb3dlcl9sb2Fuc19yb3V0ZUAxNyBtYWluX2dldF9sb2FuX3N0YXR1c2VzX3JvdXRlQDE4IG1haW5fZ2V0X2Ftb3VudHNfZHVlX3JvdXRlQDE5IG1haW5fZ2V0X3JlbWFpbmluZ19yb3VuZHNfcm91dGVAMjAgbWFpbl9nZXRfcmVwYXltZW50X3Byb2dyZXNzX3JvdXRlQDIxIG1haW5fY3JlYXRlX3JvdXRlQDIyIG1haW5fdXBkYXRlX3JvdXRlQDIzIG1haW5fZGVsZXRlX3JvdXRlQDI0IG1haW5fYWRkX2FkbWluX3JvdXRlQDI1IG1haW5fcmVtb3ZlX2FkbWluX3JvdXRlQDI2IG1haW5fbWlncmF0ZV9sZWdhY3lfYWRtaW5zX3JvdXRlQDI3IG1haW5fc2V0X3ByaWNlX29yYWNsZV9yb3V0ZUAyOCBtYWluX3JlZnJlc2hfYXNzZXRfcHJpY2VzX3JvdXRlQDI5IG1haW5fb3B0X2NvbnRyYWN0X2ludG9fYXNzZXRfcm91dGVAMzAgbWFpbl90cmFuc2Zlcl9hc3NldF9yb3V0ZUAzMQogICAgZXJyIC8vIHJlamVjdCB0cmFuc2FjdGlvbgoKbWFpbl9pbml0aWF0ZV9sb2FuX3B1cmNoYXNlX3JvdXRlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxMDQKICAgIC8vIEBhNC5hYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6OTIKICAgIC8vIGNsYXNzIFphaWJhdHN1TG9hbihaYWliYXRzdUJhc2UpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludCAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnQgYXhmZXIKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBheGZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MTA0CiAgICAvLyBAYTQuYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgaW5pdGlhdGVfbG9hbl9wdXJjaGFzZQogICAgYnl0ZSAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9pbml0aWF0ZV9sb2FuX3B1cmNoYXNlc19yb3V0ZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MTE2CiAgICAvLyBAYTQuYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjkyCiAgICAvLyBjbGFzcyBaYWliYXRzdUxvYW4oWmFpYmF0c3VCYXNlKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjExNgogICAgLy8gQGE0LmFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGluaXRpYXRlX2xvYW5fcHVyY2hhc2VzCiAgICBieXRlIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX2NvbXBsZXRlX25vbl9wMnBfbG9hbl9wdXJjaGFzZV9yb3V0ZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MTQ1CiAgICAvLyBAYXAuYXJjNC5hYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6OTIKICAgIC8vIGNsYXNzIFphaWJhdHN1TG9hbihaYWliYXRzdUJhc2UpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGJ0b2kKICAgIHR4bmFzIEFzc2V0cwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgYnRvaQogICAgdHhuYXMgQWNjb3VudHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjE0NQogICAgLy8gQGFwLmFyYzQuYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgY29tcGxldGVfbm9uX3AycF9sb2FuX3B1cmNoYXNlCiAgICBieXRlIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX2NvbXBsZXRlX3AycF9sb2FuX3B1cmNoYXNlX3JvdXRlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxNjEKICAgIC8vIEBhcC5hcmM0LmFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo5MgogICAgLy8gY2xhc3MgWmFpYmF0c3VMb2FuKFphaWJhdHN1QmFzZSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgYnRvaQogICAgdHhuYXMgQXNzZXRzCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA0CiAgICBidG9pCiAgICB0eG5hcyBBY2NvdW50cwogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludCAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnQgYXhmZXIKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBheGZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MTYxCiAgICAvLyBAYXAuYXJjNC5hYmltZXRob2QoKQogICAgY2FsbHN1YiBjb21wbGV0ZV9wMnBfbG9hbl9wdXJjaGFzZQogICAgYnl0ZSAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9pbml0aWF0ZV9sb2FuX3JlcGF5bWVudF9yb3V0ZUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MTg1CiAgICAvLyBAYXAuYXJjNC5hYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6OTIKICAgIC8vIGNsYXNzIFphaWJhdHN1TG9hbihaYWliYXRzdUJhc2UpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZXh0cmFjdCAyIDAKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnQgMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50IGF4ZmVyCiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgYXhmZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjE4NQogICAgLy8gQGFwLmFyYzQuYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgaW5pdGlhdGVfbG9hbl9yZXBheW1lbnQKICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fZXhlY3V0ZV9sb2FuX3JlcGF5bWVudF9yb3V0ZUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MjE3CiAgICAvLyBAYXAuYXJjNC5hYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6OTIKICAgIC8vIGNsYXNzIFphaWJhdHN1TG9hbihaYWliYXRzdUJhc2UpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZXh0cmFjdCAyIDAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGJ0b2kKICAgIHR4bmFzIEFjY291bnRzCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA0CiAgICBidG9pCiAgICB0eG5hcyBBc3NldHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjIxNwogICAgLy8gQGFwLmFyYzQuYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgZXhlY3V0ZV9sb2FuX3JlcGF5bWVudAogICAgYnl0ZSAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9leGVjdXRlX2xvYW5fcmVwYXltZW50X2JhdGNoX3JvdXRlQDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyODYKICAgIC8vIEBhcC5hcmM0LmFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo5MgogICAgLy8gY2xhc3MgWmFpYmF0c3VMb2FuKFphaWJhdHN1QmFzZSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgYnRvaQogICAgdHhuYXMgQXNzZXRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyODYKICAgIC8vIEBhcC5hcmM0LmFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGV4ZWN1dGVfbG9hbl9yZXBheW1lbnRfYmF0Y2gKICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fY2xlYW5fdXBfbG9hbl9yZXBheW1lbnRfcm91dGVAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTozMjQKICAgIC8vIEBhcC5hcmM0LmFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo5MgogICAgLy8gY2xhc3MgWmFpYmF0c3VMb2FuKFphaWJhdHN1QmFzZSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBleHRyYWN0IDIgMAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgYnRvaQogICAgdHhuYXMgQWNjb3VudHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjMyNAogICAgLy8gQGFwLmFyYzQuYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgY2xlYW5fdXBfbG9hbl9yZXBheW1lbnQKICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fY2xlYW5fdXBfbG9hbl9yZXBheW1lbnRzX3JvdXRlQDExOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MzQyCiAgICAvLyBAYXAuYXJjNC5hYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6OTIKICAgIC8vIGNsYXNzIFphaWJhdHN1TG9hbihaYWliYXRzdUJhc2UpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MzQyCiAgICAvLyBAYXAuYXJjNC5hYmltZXRob2QoKQogICAgY2FsbHN1YiBjbGVhbl91cF9sb2FuX3JlcGF5bWVudHMKICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fcmVwYXlfbG9hbl9yb3VuZF9yb3V0ZUAxMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjM3NQogICAgLy8gQGFwLmFyYzQuYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjkyCiAgICAvLyBjbGFzcyBaYWliYXRzdUxvYW4oWmFpYmF0c3VCYXNlKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGV4dHJhY3QgMiAwCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50IDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludCBheGZlcgogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIGF4ZmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTozNzUKICAgIC8vIEBhcC5hcmM0LmFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIHJlcGF5X2xvYW5fcm91bmQKICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5faGFuZGxlX3BheW1lbnRfZGVmYXVsdF9yb3V0ZUAxMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjQxOQogICAgLy8gQGFwLmFyYzQuYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjkyCiAgICAvLyBjbGFzcyBaYWliYXRzdUxvYW4oWmFpYmF0c3VCYXNlKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGV4dHJhY3QgMiAwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo0MTkKICAgIC8vIEBhcC5hcmM0LmFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGhhbmRsZV9wYXltZW50X2RlZmF1bHQKICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5faGFuZGxlX3BheW1lbnRfZGVmYXVsdHNfcm91dGVAMTQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo0MzYKICAgIC8vIEBhNC5hYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6OTIKICAgIC8vIGNsYXNzIFphaWJhdHN1TG9hbihaYWliYXRzdUJhc2UpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NDM2CiAgICAvLyBAYTQuYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgaGFuZGxlX3BheW1lbnRfZGVmYXVsdHMKICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fZGVsZXRlX2xvYW5fcm91dGVAMTU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo0OTAKICAgIC8vIEBhcC5hcmM0LmFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo5MgogICAgLy8gY2xhc3MgWmFpYmF0c3VMb2FuKFphaWJhdHN1QmFzZSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBleHRyYWN0IDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NDkwCiAgICAvLyBAYXAuYXJjNC5hYmltZXRob2QoKQogICAgY2FsbHN1YiBkZWxldGVfbG9hbgogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9taWdyYXRlX2xvYW5fcmVjb3JkX3JvdXRlQDE2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NDk1CiAgICAvLyBAYXAuYXJjNC5hYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6OTIKICAgIC8vIGNsYXNzIFphaWJhdHN1TG9hbihaYWliYXRzdUJhc2UpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZXh0cmFjdCAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjQ5NQogICAgLy8gQGFwLmFyYzQuYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgbWlncmF0ZV9sb2FuX3JlY29yZAogICAgYnl0ZSAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9nZXRfYm9ycm93ZXJfbG9hbnNfcm91dGVAMTc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo1MjMKICAgIC8vIEBhNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjkyCiAgICAvLyBjbGFzcyBaYWliYXRzdUxvYW4oWmFpYmF0c3VCYXNlKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmFzIEFjY291bnRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo1MjMKICAgIC8vIEBhNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X2JvcnJvd2VyX2xvYW5zCiAgICBieXRlIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX2dldF9sb2FuX3N0YXR1c2VzX3JvdXRlQDE4OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NTM0CiAgICAvLyBAYTQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo5MgogICAgLy8gY2xhc3MgWmFpYmF0c3VMb2FuKFphaWJhdHN1QmFzZSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo1MzQKICAgIC8vIEBhNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X2xvYW5fc3RhdHVzZXMKICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fZ2V0X2Ftb3VudHNfZHVlX3JvdXRlQDE5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NTQzCiAgICAvLyBAYTQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo5MgogICAgLy8gY2xhc3MgWmFpYmF0c3VMb2FuKFphaWJhdHN1QmFzZSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo1NDMKICAgIC8vIEBhNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X2Ftb3VudHNfZHVlCiAgICBieXRlIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX2dldF9yZW1haW5pbmdfcm91bmRzX3JvdXRlQDIwOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NTYwCiAgICAvLyBAYTQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo5MgogICAgLy8gY2xhc3MgWmFpYmF0c3VMb2FuKFphaWJhdHN1QmFzZSk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo1NjAKICAgIC8vIEBhNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X3JlbWFpbmluZ19yb3VuZHMKICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fZ2V0X3JlcGF5bWVudF9wcm9ncmVzc19yb3V0ZUAyMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjU3MwogICAgLy8gQGE0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6OTIKICAgIC8vIGNsYXNzIFphaWJhdHN1TG9hbihaYWliYXRzdUJhc2UpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NTczCiAgICAvLyBAYTQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGdldF9yZXBheW1lbnRfcHJvZ3Jlc3MKICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fY3JlYXRlX3JvdXRlQDIyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MjYKICAgIC8vIEBhNC5hYmltZXRob2QoY3JlYXRlPSJhbGxvdyIpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIGNhbGxzdWIgY3JlYXRlCiAgICBieXRlIDB4MDAKICAgIGludCAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgYnl0ZSAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl91cGRhdGVfcm91dGVAMjM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTozMAogICAgLy8gQGE0LmFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiVXBkYXRlQXBwbGljYXRpb24iXSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIGludCBVcGRhdGVBcHBsaWNhdGlvbgogICAgPT0KICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgVXBkYXRlQXBwbGljYXRpb24KICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIHVwZGF0ZQogICAgYnl0ZSAweDAwCiAgICBpbnQgMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fZGVsZXRlX3JvdXRlQDI0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MzQKICAgIC8vIEBhNC5hYmltZXRob2QoYWxsb3dfYWN0aW9ucz1bIkRlbGV0ZUFwcGxpY2F0aW9uIl0pCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBpbnQgRGVsZXRlQXBwbGljYXRpb24KICAgID09CiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIERlbGV0ZUFwcGxpY2F0aW9uCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBkZWxldGUKICAgIGJ5dGUgMHgwMAogICAgaW50IDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBieXRlIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX2FkZF9hZG1pbl9yb3V0ZUAyNToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjQwCiAgICAvLyBAYTQuYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBpcyBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjkyCiAgICAvLyBjbGFzcyBaYWliYXRzdUxvYW4oWmFpYmF0c3VCYXNlKToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmFzIEFjY291bnRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo0MAogICAgLy8gQGE0LmFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGFkZF9hZG1pbgogICAgYnl0ZSAweDAwCiAgICBpbnQgMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fcmVtb3ZlX2FkbWluX3JvdXRlQDI2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6NDkKICAgIC8vIEBhNC5hYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6OTIKICAgIC8vIGNsYXNzIFphaWJhdHN1TG9hbihaYWliYXRzdUJhc2UpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYXMgQWNjb3VudHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjQ5CiAgICAvLyBAYTQuYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgcmVtb3ZlX2FkbWluCiAgICBieXRlIDB4MDAKICAgIGludCAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgYnl0ZSAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9taWdyYXRlX2xlZ2FjeV9hZG1pbnNfcm91dGVAMjc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo1NAogICAgLy8gQGE0LmFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gaXMgbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIG1pZ3JhdGVfbGVnYWN5X2FkbWlucwogICAgaXRvYgogICAgYnl0ZSAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50IDEKICAgIHJldHVybgoKbWFpbl9zZXRfcHJpY2Vfb3JhY2xlX3JvdXRlQDI4OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6NzgKICAgIC8vIEBhNC5hYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6OTIKICAgIC8vIGNsYXNzIFphaWJhdHN1TG9hbihaYWliYXRzdUJhc2UpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYXMgQXBwbGljYXRpb25zCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo3OAogICAgLy8gQGE0LmFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIHNldF9wcmljZV9vcmFjbGUKICAgIGJ5dGUgMHgwMAogICAgaW50IDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBieXRlIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnQgMQogICAgcmV0dXJuCgptYWluX3JlZnJlc2hfYXNzZXRfcHJpY2VzX3JvdXRlQDI5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6OTMKICAgIC8vIEBhNC5hYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6OTIKICAgIC8vIGNsYXNzIFphaWJhdHN1TG9hbihaYWliYXRzdUJhc2UpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6OTMKICAgIC8vIEBhNC5hYmltZXRob2QoKQogICAgY2FsbHN1YiByZWZyZXNoX2Fzc2V0X3ByaWNlcwogICAgYnl0ZSAweDAwCiAgICBpbnQgMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fb3B0X2NvbnRyYWN0X2ludG9fYXNzZXRfcm91dGVAMzA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToxMDYKICAgIC8vIEBhNC5hYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6OTIKICAgIC8vIGNsYXNzIFphaWJhdHN1TG9hbihaYWliYXRzdUJhc2UpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYXMgQXNzZXRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToxMDYKICAgIC8vIEBhNC5hYmltZXRob2QoKQogICAgY2FsbHN1YiBvcHRfY29udHJhY3RfaW50b19hc3NldAogICAgYnl0ZSAweDAwCiAgICBpbnQgMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIGJ5dGUgMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludCAxCiAgICByZXR1cm4KCm1haW5fdHJhbnNmZXJfYXNzZXRfcm91dGVAMzE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToxMTEKICAgIC8vIEBhNC5hYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGlzIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6OTIKICAgIC8vIGNsYXNzIFphaWJhdHN1TG9hbihaYWliYXRzdUJhc2UpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYXMgQXNzZXRzCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBidG9pCiAgICB0eG5hcyBBY2NvdW50cwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTExCiAgICAvLyBAYTQuYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgdHJhbnNmZXJfYXNzZXQKICAgIGJ5dGUgMHgwMAogICAgaW50IDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBieXRlIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnQgMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2xvYW4uY29udHJhY3QuWmFpYmF0c3VMb2FuLmluaXRpYXRlX2xvYW5fcHVyY2hhc2UobG9hbl9kZXRhaWxzOiBieXRlcywgdHhuOiB1aW50NjQpIC0+IGJ5dGVzOgppbml0aWF0ZV9sb2FuX3B1cmNoYXNlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MTA0LTEwOQogICAgLy8gQGE0LmFiaW1ldGhvZCgpCiAgICAvLyBkZWYgaW5pdGlhdGVfbG9hbl9wdXJjaGFzZSgKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIGxvYW5fZGV0YWlsczogTG9hbkRldGFpbHMsCiAgICAvLyAgICAgdHhuOiBndHhuLkFzc2V0VHJhbnNmZXJUcmFuc2FjdGlvbiwKICAgIC8vICkgLT4gUmVjb3JkS2V5OgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxMTEKICAgIC8vIGNvbGxhdGVyYWxfcHJpY2UgPSBzZWxmLmdldF9hc3NldF9wcmljZSh0eG4ueGZlcl9hc3NldCkKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgWGZlckFzc2V0CiAgICBjYWxsc3ViIGdldF9hc3NldF9wcmljZQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MTEyCiAgICAvLyBhc3NlcnQgY29sbGF0ZXJhbF9wcmljZSA+IDAsICJUaGUgYXNhIGlzIG9mIG5vIHZhbHVlIG9yIGlzIG5vdCBzdXBwb3J0ZWQiCiAgICBhc3NlcnQgLy8gVGhlIGFzYSBpcyBvZiBubyB2YWx1ZSBvciBpcyBub3Qgc3VwcG9ydGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxMTQKICAgIC8vIHJldHVybiBSZWNvcmRLZXkuZnJvbV9ieXRlcyhzZWxmLmluaXRpYXRlX2xvYW4obG9hbl9kZXRhaWxzLCB0eG4pKQogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgaW5pdGlhdGVfbG9hbgogICAgZnJhbWVfYnVyeSAtMgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2Jhc2UuY29udHJhY3QuWmFpYmF0c3VCYXNlLmdldF9hc3NldF9wcmljZShhc2E6IHVpbnQ2NCkgLT4gdWludDY0OgpnZXRfYXNzZXRfcHJpY2U6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToxNzMtMTc0CiAgICAvLyBAYXAuc3Vicm91dGluZQogICAgLy8gZGVmIGdldF9hc3NldF9wcmljZShzZWxmLCBhc2E6IGFwLkFzc2V0KSAtPiBhcC5VSW50NjQ6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjE4MQogICAgLy8gY29uZmlnID0gc2VsZi5wcmljZV9vcmFjbGVfY29uZmlnKCkKICAgIGNhbGxzdWIgcHJpY2Vfb3JhY2xlX2NvbmZpZwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTgyCiAgICAvLyBbc25hcHNob3RfYnl0ZXMsIGV4aXN0c10gPSBvcC5Cb3guZ2V0KHNlbGYucHJpY2Vfa2V5KGFzYS5pZCkpCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgcHJpY2Vfa2V5CiAgICBib3hfZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToxODMKICAgIC8vIGlmIGV4aXN0czoKICAgIGJ6IGdldF9hc3NldF9wcmljZV9hZnRlcl9pZl9lbHNlQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjE4NgogICAgLy8gR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjE4NwogICAgLy8gPD0gc25hcHNob3QudGltZXN0YW1wLm5hdGl2ZSArIGNvbmZpZy5jYWNoZV93aW5kb3cubmF0aXZlCiAgICBmcmFtZV9kaWcgMQogICAgZXh0cmFjdCA4IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICBmcmFtZV9kaWcgMAogICAgZXh0cmFjdCA4IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToxODYtMTg3CiAgICAvLyBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcAogICAgLy8gPD0gc25hcHNob3QudGltZXN0YW1wLm5hdGl2ZSArIGNvbmZpZy5jYWNoZV93aW5kb3cubmF0aXZlCiAgICA8PQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTg1LTE4OAogICAgLy8gaWYgKAogICAgLy8gICAgIEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wCiAgICAvLyAgICAgPD0gc25hcHNob3QudGltZXN0YW1wLm5hdGl2ZSArIGNvbmZpZy5jYWNoZV93aW5kb3cubmF0aXZlCiAgICAvLyApOgogICAgYnogZ2V0X2Fzc2V0X3ByaWNlX2FmdGVyX2lmX2Vsc2VANAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTg5CiAgICAvLyByZXR1cm4gc25hcHNob3QucHJpY2UubmF0aXZlCiAgICBmcmFtZV9kaWcgMQogICAgZXh0cmFjdCAwIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKZ2V0X2Fzc2V0X3ByaWNlX2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjE5MAogICAgLy8gcmV0dXJuIHNlbGYucmVmcmVzaF9hc3NldF9wcmljZShhc2EuaWQsIGFwLkFwcGxpY2F0aW9uKGNvbmZpZy5vcmFjbGUubmF0aXZlKSkKICAgIGZyYW1lX2RpZyAwCiAgICBleHRyYWN0IDAgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgIGZyYW1lX2RpZyAtMQogICAgc3dhcAogICAgY2FsbHN1YiByZWZyZXNoX2Fzc2V0X3ByaWNlCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9iYXNlLmNvbnRyYWN0LlphaWJhdHN1QmFzZS5wcmljZV9vcmFjbGVfY29uZmlnKCkgLT4gYnl0ZXM6CnByaWNlX29yYWNsZV9jb25maWc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToxOTItMTkzCiAgICAvLyBAYXAuc3Vicm91dGluZQogICAgLy8gZGVmIHByaWNlX29yYWNsZV9jb25maWcoc2VsZikgLT4gUHJpY2VPcmFjbGVDb25maWc6CiAgICBwcm90byAwIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjE5NAogICAgLy8gW2NvbmZpZ19ieXRlcywgZXhpc3RzXSA9IG9wLkJveC5nZXQoUFJJQ0VfT1JBQ0xFX0tFWSkKICAgIGJ5dGUgMHg0ZgogICAgYm94X2dldAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTk1CiAgICAvLyBhc3NlcnQgZXhpc3RzLCAiVGhlIHByaWNlIG9yYWNsZSBoYXMgbm90IGJlZW4gc2V0IgogICAgYXNzZXJ0IC8vIFRoZSBwcmljZSBvcmFjbGUgaGFzIG5vdCBiZWVuIHNldAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTk2CiAgICAvLyByZXR1cm4gUHJpY2VPcmFjbGVDb25maWcuZnJvbV9ieXRlcyhjb25maWdfYnl0ZXMpCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfYmFzZS5jb250cmFjdC5aYWliYXRzdUJhc2UucHJpY2Vfa2V5KGFzc2V0X2lkOiB1aW50NjQpIC0+IGJ5dGVzOgpwcmljZV9rZXk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToyMTItMjEzCiAgICAvLyBAYXAuc3Vicm91dGluZQogICAgLy8gZGVmIHByaWNlX2tleShzZWxmLCBhc3NldF9pZDogYXAuVUludDY0KSAtPiBhcC5CeXRlczoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MjE0CiAgICAvLyByZXR1cm4gb3AuY29uY2F0KFBSSUNFX0tFWV9QUkVGSVgsIG9wLml0b2IoYXNzZXRfaWQpKQogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBieXRlIDB4NDYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2Jhc2UuY29udHJhY3QuWmFpYmF0c3VCYXNlLnJlZnJlc2hfYXNzZXRfcHJpY2UoYXNzZXRfaWQ6IHVpbnQ2NCwgb3JhY2xlOiB1aW50NjQpIC0+IHVpbnQ2NDoKcmVmcmVzaF9hc3NldF9wcmljZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjE5OC0yMDEKICAgIC8vIEBhcC5zdWJyb3V0aW5lCiAgICAvLyBkZWYgcmVmcmVzaF9hc3NldF9wcmljZSgKICAgIC8vICAgICBzZWxmLCBhc3NldF9pZDogYXAuVUludDY0LCBvcmFjbGU6IGFwLkFwcGxpY2F0aW9uCiAgICAvLyApIC0+IGFwLlVJbnQ2NDoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MjAyCiAgICAvLyBbdmFsdWUsIGV4aXN0c10gPSBvcC5BcHBHbG9iYWwuZ2V0X2V4X2J5dGVzKG9yYWNsZSwgb3AuaXRvYihhc3NldF9pZCkpCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAtMQogICAgc3dhcAogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjIwMwogICAgLy8gYXNzZXJ0IGV4aXN0cywgIlRoaXMgYXNldCBpcyBub3Qgc3VwcG9ydGVkIgogICAgYXNzZXJ0IC8vIFRoaXMgYXNldCBpcyBub3Qgc3VwcG9ydGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToyMDQKICAgIC8vIHByaWNlID0gb3AuZXh0cmFjdF91aW50NjQodmFsdWUsIGFwLlVJbnQ2NCgwKSkKICAgIGludCAwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MjA2CiAgICAvLyBwcmljZT1hNC5VSW50NjQocHJpY2UpLAogICAgZHVwCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToyMDcKICAgIC8vIHRpbWVzdGFtcD1hNC5VSW50NjQoR2xvYmFsLmxhdGVzdF90aW1lc3RhbXApLAogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MjA1LTIwOAogICAgLy8gc25hcHNob3QgPSBBc3NldFByaWNlU25hcHNob3QoCiAgICAvLyAgICAgcHJpY2U9YTQuVUludDY0KHByaWNlKSwKICAgIC8vICAgICB0aW1lc3RhbXA9YTQuVUludDY0KEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wKSwKICAgIC8vICkKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MjA5CiAgICAvLyBvcC5Cb3gucHV0KHNlbGYucHJpY2Vfa2V5KGFzc2V0X2lkKSwgc25hcHNob3QuYnl0ZXMpCiAgICBmcmFtZV9kaWcgLTIKICAgIGNhbGxzdWIgcHJpY2Vfa2V5CiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToyMTAKICAgIC8vIHJldHVybiBwcmljZQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2xvYW4uY29udHJhY3QuWmFpYmF0c3VMb2FuLmluaXRpYXRlX2xvYW4obG9hbl9kZXRhaWxzOiBieXRlcywgdHhuOiB1aW50NjQpIC0+IGJ5dGVzLCBieXRlczoKaW5pdGlhdGVfbG9hbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjY2MC02NjUKICAgIC8vIEBhcC5zdWJyb3V0aW5lCiAgICAvLyBkZWYgaW5pdGlhdGVfbG9hbigKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIGxvYW5fZGV0YWlsczogTG9hbkRldGFpbHMsCiAgICAvLyAgICAgdHhuOiBndHhuLkFzc2V0VHJhbnNmZXJUcmFuc2FjdGlvbiwKICAgIC8vICkgLT4gYXAuQnl0ZXM6CiAgICBwcm90byAyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjY3MAogICAgLy8gc2VsZi5lbnN1cmVfYXBwX3JlY2lldmVyKHR4bikKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBlbnN1cmVfYXBwX3JlY2lldmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo2NzIKICAgIC8vIGxvYW5fZGV0YWlscy5wYXltZW50X3JlY2lwaWVudHMubGVuZ3RoIDw9IE1BWF9MT0FOX1JFQ0lQSUVOVFMKICAgIGZyYW1lX2RpZyAtMgogICAgaW50IDYyCiAgICBleHRyYWN0X3VpbnQxNgogICAgZnJhbWVfZGlnIC0yCiAgICBsZW4KICAgIGZyYW1lX2RpZyAtMgogICAgZGlnIDIKICAgIHVuY292ZXIgMgogICAgc3Vic3RyaW5nMwogICAgaW50IDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludCA2NAogICAgPD0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjY3MS02NzMKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgbG9hbl9kZXRhaWxzLnBheW1lbnRfcmVjaXBpZW50cy5sZW5ndGggPD0gTUFYX0xPQU5fUkVDSVBJRU5UUwogICAgLy8gKSwgIkEgbG9hbiBjYW4gaGF2ZSBhdCBtb3N0IDY0IHBheW1lbnRfcmVjaXBpZW50cyIKICAgIGFzc2VydCAvLyBBIGxvYW4gY2FuIGhhdmUgYXQgbW9zdCA2NCBwYXltZW50X3JlY2lwaWVudHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjY3NAogICAgLy8gaWYgbG9hbl9kZXRhaWxzLmxvYW5fdHlwZSA9PSBhNC5TdHJpbmcoIlAyUCIpOgogICAgZnJhbWVfZGlnIC0yCiAgICBpbnQgMgogICAgZXh0cmFjdF91aW50MTYKICAgIGZyYW1lX2RpZyAtMgogICAgc3dhcAogICAgdW5jb3ZlciAyCiAgICBzdWJzdHJpbmczCiAgICBieXRlIDB4MDAwMzUwMzI1MAogICAgPT0KICAgIGJ6IGluaXRpYXRlX2xvYW5fYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo2NzUtNjc3CiAgICAvLyBhc3NlcnQgbG9hbl9kZXRhaWxzLnBheW1lbnRfcmVjaXBpZW50cy5sZW5ndGggPT0gYXAuVUludDY0KAogICAgLy8gICAgIDEKICAgIC8vICksICJPbmx5IG9uZSByZWNpcGllbnQgaXMgYWxsb3dlZCBpbiBhIFAyUCBsb2FuIgogICAgZnJhbWVfZGlnIDAKICAgIGludCAxCiAgICA9PQogICAgYXNzZXJ0IC8vIE9ubHkgb25lIHJlY2lwaWVudCBpcyBhbGxvd2VkIGluIGEgUDJQIGxvYW4KCmluaXRpYXRlX2xvYW5fYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NjgwCiAgICAvLyBsb2FuX2RldGFpbHMuYm9ycm93ZXIgPT0gdHhuLnNlbmRlcgogICAgZnJhbWVfZGlnIC0yCiAgICBleHRyYWN0IDY2IDMyIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBTZW5kZXIKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo2NzktNjgxCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIGxvYW5fZGV0YWlscy5ib3Jyb3dlciA9PSB0eG4uc2VuZGVyCiAgICAvLyApLCAiVGhlIHNlbmRlciBtdXN0IGFsc28gYmUgdGhlIGJvcnJvd2VyIgogICAgYXNzZXJ0IC8vIFRoZSBzZW5kZXIgbXVzdCBhbHNvIGJlIHRoZSBib3Jyb3dlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6Njg0CiAgICAvLyBsb2FuX2RldGFpbHMuY29sbGF0ZXJhbF9hc3NldF9pZCA9PSB0eG4ueGZlcl9hc3NldC5pZAogICAgZnJhbWVfZGlnIC0yCiAgICBleHRyYWN0IDEzIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIFhmZXJBc3NldAogICAgaXRvYgogICAgYj09CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo2ODMtNjg1CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIGxvYW5fZGV0YWlscy5jb2xsYXRlcmFsX2Fzc2V0X2lkID09IHR4bi54ZmVyX2Fzc2V0LmlkCiAgICAvLyApLCAiVGhlIGFzc2V0IGJlaW5nIHRyYW5zZmVyZWQgbXVzdCBiZSB0aGUgY29sbGF0ZXJhbCBhc3NldCIKICAgIGFzc2VydCAvLyBUaGUgYXNzZXQgYmVpbmcgdHJhbnNmZXJlZCBtdXN0IGJlIHRoZSBjb2xsYXRlcmFsIGFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo2ODcKICAgIC8vIGFzc2VydCB0eG4uYXNzZXRfYW1vdW50ID49IHNlbGYuY2FsY3VsYXRlX2FtdF9wbHVzX2ZlZSgKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgQXNzZXRBbW91bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjY4OAogICAgLy8gbG9hbl9kZXRhaWxzLmNvbGxhdGVyYWxfYXNzZXRfYW1vdW50Lm5hdGl2ZSwgYXAuVUludDY0KDEpCiAgICBmcmFtZV9kaWcgLTIKICAgIGV4dHJhY3QgMzcgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgIGludCAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo2ODctNjg5CiAgICAvLyBhc3NlcnQgdHhuLmFzc2V0X2Ftb3VudCA+PSBzZWxmLmNhbGN1bGF0ZV9hbXRfcGx1c19mZWUoCiAgICAvLyAgICAgbG9hbl9kZXRhaWxzLmNvbGxhdGVyYWxfYXNzZXRfYW1vdW50Lm5hdGl2ZSwgYXAuVUludDY0KDEpCiAgICAvLyApLCAiSW5zdWZmaWNpZW50IHR4biBhc3NldF9hbW91bnQhIEFtb3VudCBtdXN0IGJlIGVxdWFsIHRvIGNvbGxhdGVyYWxfYXNzZXRfYW1vdW50IHBsdXMgZmVlcyIKICAgIGNhbGxzdWIgY2FsY3VsYXRlX2FtdF9wbHVzX2ZlZQogICAgPj0KICAgIGFzc2VydCAvLyBJbnN1ZmZpY2llbnQgdHhuIGFzc2V0X2Ftb3VudCEgQW1vdW50IG11c3QgYmUgZXF1YWwgdG8gY29sbGF0ZXJhbF9hc3NldF9hbW91bnQgcGx1cyBmZWVzCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo2OTEKICAgIC8vIGxvYW5fa2V5ID0gc2VsZi5uZXh0X3JlY29yZF9rZXkoKQogICAgY2FsbHN1YiBuZXh0X3JlY29yZF9rZXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjY5MgogICAgLy8gcmVjb3JkID0gc2VsZi5idWlsZF9sb2FuX3JlY29yZChsb2FuX2RldGFpbHMpCiAgICBmcmFtZV9kaWcgLTIKICAgIGNhbGxzdWIgYnVpbGRfbG9hbl9yZWNvcmQKICAgIGZyYW1lX2J1cnkgLTIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjY5MwogICAgLy8gcmVjb3JkLmNvbGxhdGVyYWxfcGFpZCA9IGE0LkJvb2woVHJ1ZSkgICMgbm9xYTogRkJUMDAzCiAgICBpbnQgNDAKICAgIGludCAxCiAgICBzZXRiaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjY5NAogICAgLy8gb3AuQm94LnB1dChsb2FuX3JlY29yZF9rZXkobG9hbl9rZXkpLCByZWNvcmQuYnl0ZXMpCiAgICBkaWcgMQogICAgY2FsbHN1YiBsb2FuX3JlY29yZF9rZXkKICAgIGRpZyAxCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo2OTUKICAgIC8vIHB1dF9sb2FuX3JlY2lwaWVudHMobG9hbl9rZXksIGxvYW5fZGV0YWlscy5wYXltZW50X3JlY2lwaWVudHMuY29weSgpKQogICAgZnJhbWVfZGlnIC0yCiAgICBpbnQgNjIKICAgIGV4dHJhY3RfdWludDE2CiAgICBmcmFtZV9kaWcgLTIKICAgIGxlbgogICAgZnJhbWVfZGlnIC0yCiAgICBjb3ZlciAyCiAgICBzdWJzdHJpbmczCiAgICBkaWcgMgogICAgc3dhcAogICAgY2FsbHN1YiBwdXRfbG9hbl9yZWNpcGllbnRzCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjY5NgogICAgLy8gc2VsZi5hZGRfYWN0aXZlX2xvYW4obG9hbl9rZXkpCiAgICBkaWcgMQogICAgY2FsbHN1YiBhZGRfYWN0aXZlX2xvYW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjY5NwogICAgLy8gc2VsZi5lbWl0X2xvYW5faW5pdGlhdGVkKGxvYW5fa2V5LCByZWNvcmQpCiAgICBkaWcgMQogICAgc3dhcAogICAgY2FsbHN1YiBlbWl0X2xvYW5faW5pdGlhdGVkCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjY5OAogICAgLy8gcmV0dXJuIGxvYW5fa2V5CiAgICBmcmFtZV9kaWcgLTIKICAgIHVuY292ZXIgMgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2Jhc2UuY29udHJhY3QuWmFpYmF0c3VCYXNlLmVuc3VyZV9hcHBfcmVjaWV2ZXIodHhuOiB1aW50NjQpIC0+IHZvaWQ6CmVuc3VyZV9hcHBfcmVjaWV2ZXI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToyMjctMjI4CiAgICAvLyBAYXAuc3Vicm91dGluZQogICAgLy8gZGVmIGVuc3VyZV9hcHBfcmVjaWV2ZXIoc2VsZiwgdHhuOiBndHhuLkFzc2V0VHJhbnNmZXJUcmFuc2FjdGlvbikgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MjMwCiAgICAvLyB0eG4uYXNzZXRfcmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcwogICAgZnJhbWVfZGlnIC0xCiAgICBndHhucyBBc3NldFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjIyOS0yMzEKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgdHhuLmFzc2V0X3JlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MKICAgIC8vICksICJUaGUgcmVjaXBpZW50IG11c3QgYmUgdGhlIGN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcyBhZGRyZXNzIgogICAgYXNzZXJ0IC8vIFRoZSByZWNpcGllbnQgbXVzdCBiZSB0aGUgY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzIGFkZHJlc3MKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9iYXNlLmNvbnRyYWN0LlphaWJhdHN1QmFzZS5jYWxjdWxhdGVfYW10X3BsdXNfZmVlKGFtdDogdWludDY0LCBtdWx0aXBsZXM6IHVpbnQ2NCkgLT4gdWludDY0OgpjYWxjdWxhdGVfYW10X3BsdXNfZmVlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTY2LTE2NwogICAgLy8gQGFwLnN1YnJvdXRpbmUKICAgIC8vIGRlZiBjYWxjdWxhdGVfYW10X3BsdXNfZmVlKHNlbGYsIGFtdDogYXAuVUludDY0LCBtdWx0aXBsZXM6IGFwLlVJbnQ2NCkgLT4gYXAuVUludDY0OgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToxNjgKICAgIC8vIGZlZV9wZXJjZW50YWdlID0gYXAuVUludDY0KDEwKSAqIG11bHRpcGxlcwogICAgaW50IDEwCiAgICBmcmFtZV9kaWcgLTEKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjE2OQogICAgLy8gbXVsdGlwbGllZCA9IGZlZV9wZXJjZW50YWdlICogYW10CiAgICBmcmFtZV9kaWcgLTIKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjE3MAogICAgLy8gdHJhbnNhY3Rpb25fZmVlID0gbXVsdGlwbGllZCAvLyAxMDAwCiAgICBpbnQgMTAwMAogICAgLwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTcxCiAgICAvLyByZXR1cm4gYW10ICsgdHJhbnNhY3Rpb25fZmVlCiAgICBmcmFtZV9kaWcgLTIKICAgICsKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLmNvbnRyYWN0LlphaWJhdHN1TG9hbi5uZXh0X3JlY29yZF9rZXkoKSAtPiBieXRlczoKbmV4dF9yZWNvcmRfa2V5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6OTA4LTkwOQogICAgLy8gQGFwLnN1YnJvdXRpbmUKICAgIC8vIGRlZiBuZXh0X3JlY29yZF9rZXkoc2VsZikgLT4gYXAuQnl0ZXM6CiAgICBwcm90byAwIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjkxMQogICAgLy8gY291bnRlciA9IGtleV9jb3VudGVyKCkgKyAxCiAgICBjYWxsc3ViIGtleV9jb3VudGVyCiAgICBpbnQgMQogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6OTEyCiAgICAvLyBzZXRfa2V5X2NvdW50ZXIoY291bnRlcikKICAgIGR1cAogICAgY2FsbHN1YiBzZXRfa2V5X2NvdW50ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjkxMwogICAgLy8gcmV0dXJuIG9wLml0b2IoY291bnRlcikKICAgIGl0b2IKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLnN0b3JhZ2Uua2V5X2NvdW50ZXIoKSAtPiB1aW50NjQ6CmtleV9jb3VudGVyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vc3RvcmFnZS5weToxMzgtMTQyCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMgICBBY2Nlc3NvcnMgICAgIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyAjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjCiAgICAvLyBAYXAuc3Vicm91dGluZQogICAgLy8gZGVmIGtleV9jb3VudGVyKCkgLT4gYXAuVUludDY0OgogICAgcHJvdG8gMCAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9zdG9yYWdlLnB5OjE0MwogICAgLy8gcmV0dXJuIHJlYWRfbG9hbl9jb3VudGVyKGFwLlVJbnQ2NChLRVlfQ09VTlRFUikpCiAgICBpbnQgMAogICAgY2FsbHN1YiByZWFkX2xvYW5fY291bnRlcgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2xvYW4uc3RvcmFnZS5yZWFkX2xvYW5fY291bnRlcihvZmZzZXQ6IHVpbnQ2NCkgLT4gdWludDY0OgpyZWFkX2xvYW5fY291bnRlcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL3N0b3JhZ2UucHk6MTI0LTEyNQogICAgLy8gQGFwLnN1YnJvdXRpbmUKICAgIC8vIGRlZiByZWFkX2xvYW5fY291bnRlcihvZmZzZXQ6IGFwLlVJbnQ2NCkgLT4gYXAuVUludDY0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9zdG9yYWdlLnB5OjEyNgogICAgLy8gX2xlbmd0aCwgZXhpc3RzID0gb3AuQm94Lmxlbmd0aChMT0FOX0NPVU5URVJTX0tFWSkKICAgIGJ5dGUgMHg0MwogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9zdG9yYWdlLnB5OjEyNwogICAgLy8gaWYgbm90IGV4aXN0czoKICAgIGJueiByZWFkX2xvYW5fY291bnRlcl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL3N0b3JhZ2UucHk6MTI4CiAgICAvLyByZXR1cm4gYXAuVUludDY0KDApCiAgICBpbnQgMAogICAgcmV0c3ViCgpyZWFkX2xvYW5fY291bnRlcl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9zdG9yYWdlLnB5OjEyOQogICAgLy8gcmV0dXJuIG9wLmJ0b2kob3AuQm94LmV4dHJhY3QoTE9BTl9DT1VOVEVSU19LRVksIG9mZnNldCwgOCkpCiAgICBieXRlIDB4NDMKICAgIGZyYW1lX2RpZyAtMQogICAgaW50IDgKICAgIGJveF9leHRyYWN0CiAgICBidG9pCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfbG9hbi5zdG9yYWdlLnNldF9rZXlfY291bnRlcihjb3VudGVyOiB1aW50NjQpIC0+IHZvaWQ6CnNldF9rZXlfY291bnRlcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL3N0b3JhZ2UucHk6MTQ2LTE0NwogICAgLy8gQGFwLnN1YnJvdXRpbmUKICAgIC8vIGRlZiBzZXRfa2V5X2NvdW50ZXIoY291bnRlcjogYXAuVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9zdG9yYWdlLnB5OjE0OAogICAgLy8gd3JpdGVfbG9hbl9jb3VudGVyKGFwLlVJbnQ2NChLRVlfQ09VTlRFUiksIGNvdW50ZXIpCiAgICBpbnQgMAogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIHdyaXRlX2xvYW5fY291bnRlcgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2xvYW4uc3RvcmFnZS53cml0ZV9sb2FuX2NvdW50ZXIob2Zmc2V0OiB1aW50NjQsIHZhbHVlOiB1aW50NjQpIC0+IHZvaWQ6CndyaXRlX2xvYW5fY291bnRlcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL3N0b3JhZ2UucHk6MTMyLTEzMwogICAgLy8gQGFwLnN1YnJvdXRpbmUKICAgIC8vIGRlZiB3cml0ZV9sb2FuX2NvdW50ZXIob2Zmc2V0OiBhcC5VSW50NjQsIHZhbHVlOiBhcC5VSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL3N0b3JhZ2UucHk6MTM0CiAgICAvLyBfY3JlYXRlZCA9IG9wLkJveC5jcmVhdGUoTE9BTl9DT1VOVEVSU19LRVksIExPQU5fQ09VTlRFUlNfU0laRSkKICAgIGJ5dGUgMHg0MwogICAgaW50IDE2CiAgICBib3hfY3JlYXRlCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL3N0b3JhZ2UucHk6MTM1CiAgICAvLyBvcC5Cb3gucmVwbGFjZShMT0FOX0NPVU5URVJTX0tFWSwgb2Zmc2V0LCBvcC5pdG9iKHZhbHVlKSkKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgYnl0ZSAweDQzCiAgICBmcmFtZV9kaWcgLTIKICAgIHVuY292ZXIgMgogICAgYm94X3JlcGxhY2UKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLmNvbnRyYWN0LlphaWJhdHN1TG9hbi5idWlsZF9sb2FuX3JlY29yZChkZXRhaWxzOiBieXRlcykgLT4gYnl0ZXMsIGJ5dGVzOgpidWlsZF9sb2FuX3JlY29yZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5Ojc4OS03OTAKICAgIC8vIEBhcC5zdWJyb3V0aW5lCiAgICAvLyBkZWYgYnVpbGRfbG9hbl9yZWNvcmQoc2VsZiwgZGV0YWlsczogTG9hbkRldGFpbHMpIC0+IExvYW5SZWNvcmQ6CiAgICBwcm90byAxIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5Ojc5MwogICAgLy8gbG9hbl90eXBlPXNlbGYubG9hbl90eXBlX2Zyb21fbmFtZShkZXRhaWxzLmxvYW5fdHlwZSksCiAgICBmcmFtZV9kaWcgLTEKICAgIGludCAyCiAgICBleHRyYWN0X3VpbnQxNgogICAgZnJhbWVfZGlnIC0xCiAgICBpbnQgNjIKICAgIGV4dHJhY3RfdWludDE2CiAgICBmcmFtZV9kaWcgLTEKICAgIGNvdmVyIDIKICAgIHN1YnN0cmluZzMKICAgIGNhbGxzdWIgbG9hbl90eXBlX2Zyb21fbmFtZQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6Nzk0CiAgICAvLyB0ZW51cmU9ZGV0YWlscy50ZW51cmUsCiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgNCAxIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6Nzk1CiAgICAvLyBwYXltZW50X3JvdW5kcz1kZXRhaWxzLnBheW1lbnRfcm91bmRzLAogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDUzIDEgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBjb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo3OTYKICAgIC8vIGNvbXBsZXRlZF9wYXltZW50X3JvdW5kcz1kZXRhaWxzLmNvbXBsZXRlZF9wYXltZW50X3JvdW5kcywKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCA2NSAxIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgY292ZXIgMwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6Nzk3CiAgICAvLyBjb2xsYXRlcmFsX3BhaWQ9ZGV0YWlscy5jb2xsYXRlcmFsX3BhaWQsCiAgICBmcmFtZV9kaWcgLTEKICAgIGludCA1MTIKICAgIGdldGJpdAogICAgYnl0ZSAweDAwCiAgICBpbnQgMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5Ojc5OAogICAgLy8gcHJpbmNpcGFsX3BhaWQ9ZGV0YWlscy5wcmluY2lwYWxfcGFpZCwKICAgIGZyYW1lX2RpZyAtMQogICAgaW50IDUxMwogICAgZ2V0Yml0CiAgICBieXRlIDB4MDAKICAgIGludCAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6ODAwCiAgICAvLyBwcmluY2lwYWxfYXNzZXRfaWQ9ZGV0YWlscy5wcmluY2lwYWxfYXNzZXRfaWQsCiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgNSA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgY292ZXIgNgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6ODAxCiAgICAvLyBjb2xsYXRlcmFsX2Fzc2V0X2lkPWRldGFpbHMuY29sbGF0ZXJhbF9hc3NldF9pZCwKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAxMyA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgY292ZXIgNwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6ODAyCiAgICAvLyBpbnRlcmVzdF9hc3NldF9hbW91bnQ9ZGV0YWlscy5pbnRlcmVzdF9hc3NldF9hbW91bnQsCiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgMjEgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGNvdmVyIDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjgwMwogICAgLy8gcHJpbmNpcGFsX2Fzc2V0X2Ftb3VudD1kZXRhaWxzLnByaW5jaXBhbF9hc3NldF9hbW91bnQsCiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgMjkgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGNvdmVyIDkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjgwNAogICAgLy8gY29sbGF0ZXJhbF9hc3NldF9hbW91bnQ9ZGV0YWlscy5jb2xsYXRlcmFsX2Fzc2V0X2Ftb3VudCwKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAzNyA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgY292ZXIgMTAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjgwNQogICAgLy8gZWFybHlfcGF5bWVudF9wZW5hbHR5X2Ftb3VudD1kZXRhaWxzLmVhcmx5X3BheW1lbnRfcGVuYWx0eV9hbW91bnQsCiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgNDUgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGNvdmVyIDExCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo4MDYKICAgIC8vIHBheW1lbnRfY29tcGxldGlvbl90aW1lc3RhbXA9ZGV0YWlscy5wYXltZW50X2NvbXBsZXRpb25fdGltZXN0YW1wLAogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDU0IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBjb3ZlciAxMgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6ODA3CiAgICAvLyBsZW5kZXJfbmZ0X2Fzc2VyX2lkPWRldGFpbHMubGVuZGVyX25mdF9hc3Nlcl9pZCwKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCA5OCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgY292ZXIgMTMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjgwOAogICAgLy8gYm9ycm93ZXJfbmZ0X2Fzc2VyX2lkPWRldGFpbHMuYm9ycm93ZXJfbmZ0X2Fzc2VyX2lkLAogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDEwNiA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgY292ZXIgMTQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjgwOQogICAgLy8gYm9ycm93ZXI9ZGV0YWlscy5ib3Jyb3dlciwKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCA2NiAzMiAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGNvdmVyIDE1CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo3OTIKICAgIC8vIHZlcnNpb249YTQuVUludDgoTE9BTl9SRUNPUkRfVkVSU0lPTiksCiAgICBieXRlIDB4MDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5Ojc5MS04MTEKICAgIC8vIHJldHVybiBMb2FuUmVjb3JkKAogICAgLy8gICAgIHZlcnNpb249YTQuVUludDgoTE9BTl9SRUNPUkRfVkVSU0lPTiksCiAgICAvLyAgICAgbG9hbl90eXBlPXNlbGYubG9hbl90eXBlX2Zyb21fbmFtZShkZXRhaWxzLmxvYW5fdHlwZSksCiAgICAvLyAgICAgdGVudXJlPWRldGFpbHMudGVudXJlLAogICAgLy8gICAgIHBheW1lbnRfcm91bmRzPWRldGFpbHMucGF5bWVudF9yb3VuZHMsCiAgICAvLyAgICAgY29tcGxldGVkX3BheW1lbnRfcm91bmRzPWRldGFpbHMuY29tcGxldGVkX3BheW1lbnRfcm91bmRzLAogICAgLy8gICAgIGNvbGxhdGVyYWxfcGFpZD1kZXRhaWxzLmNvbGxhdGVyYWxfcGFpZCwKICAgIC8vICAgICBwcmluY2lwYWxfcGFpZD1kZXRhaWxzLnByaW5jaXBhbF9wYWlkLAogICAgLy8gICAgIHBheW1lbnRfZGVmYXVsdGVkPWE0LkJvb2woRmFsc2UpLCAgIyBub3FhOiBGQlQwMDMKICAgIC8vICAgICBwcmluY2lwYWxfYXNzZXRfaWQ9ZGV0YWlscy5wcmluY2lwYWxfYXNzZXRfaWQsCiAgICAvLyAgICAgY29sbGF0ZXJhbF9hc3NldF9pZD1kZXRhaWxzLmNvbGxhdGVyYWxfYXNzZXRfaWQsCiAgICAvLyAgICAgaW50ZXJlc3RfYXNzZXRfYW1vdW50PWRldGFpbHMuaW50ZXJlc3RfYXNzZXRfYW1vdW50LAogICAgLy8gICAgIHByaW5jaXBhbF9hc3NldF9hbW91bnQ9ZGV0YWlscy5wcmluY2lwYWxfYXNzZXRfYW1vdW50LAogICAgLy8gICAgIGNvbGxhdGVyYWxfYXNzZXRfYW1vdW50PWRldGFpbHMuY29sbGF0ZXJhbF9hc3NldF9hbW91bnQsCiAgICAvLyAgICAgZWFybHlfcGF5bWVudF9wZW5hbHR5X2Ftb3VudD1kZXRhaWxzLmVhcmx5X3BheW1lbnRfcGVuYWx0eV9hbW91bnQsCiAgICAvLyAgICAgcGF5bWVudF9jb21wbGV0aW9uX3RpbWVzdGFtcD1kZXRhaWxzLnBheW1lbnRfY29tcGxldGlvbl90aW1lc3RhbXAsCiAgICAvLyAgICAgbGVuZGVyX25mdF9hc3Nlcl9pZD1kZXRhaWxzLmxlbmRlcl9uZnRfYXNzZXJfaWQsCiAgICAvLyAgICAgYm9ycm93ZXJfbmZ0X2Fzc2VyX2lkPWRldGFpbHMuYm9ycm93ZXJfbmZ0X2Fzc2VyX2lkLAogICAgLy8gICAgIGJvcnJvd2VyPWRldGFpbHMuYm9ycm93ZXIsCiAgICAvLyAgICAgYWN0aXZlX2xvYW5fcG9zaXRpb249YTQuVUludDY0KDApLAogICAgLy8gKQogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBpbnQgMAogICAgZ2V0Yml0CiAgICBpbnQgNDEKICAgIHN3YXAKICAgIHNldGJpdAogICAgaW50IDQyCiAgICBpbnQgMAogICAgc2V0Yml0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjgxMAogICAgLy8gYWN0aXZlX2xvYW5fcG9zaXRpb249YTQuVUludDY0KDApLAogICAgYnl0ZSAweDAwMDAwMDAwMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5Ojc5MS04MTEKICAgIC8vIHJldHVybiBMb2FuUmVjb3JkKAogICAgLy8gICAgIHZlcnNpb249YTQuVUludDgoTE9BTl9SRUNPUkRfVkVSU0lPTiksCiAgICAvLyAgICAgbG9hbl90eXBlPXNlbGYubG9hbl90eXBlX2Zyb21fbmFtZShkZXRhaWxzLmxvYW5fdHlwZSksCiAgICAvLyAgICAgdGVudXJlPWRldGFpbHMudGVudXJlLAogICAgLy8gICAgIHBheW1lbnRfcm91bmRzPWRldGFpbHMucGF5bWVudF9yb3VuZHMsCiAgICAvLyAgICAgY29tcGxldGVkX3BheW1lbnRfcm91bmRzPWRldGFpbHMuY29tcGxldGVkX3BheW1lbnRfcm91bmRzLAogICAgLy8gICAgIGNvbGxhdGVyYWxfcGFpZD1kZXRhaWxzLmNvbGxhdGVyYWxfcGFpZCwKICAgIC8vICAgICBwcmluY2lwYWxfcGFpZD1kZXRhaWxzLnByaW5jaXBhbF9wYWlkLAogICAgLy8gICAgIHBheW1lbnRfZGVmYXVsdGVkPWE0LkJvb2woRmFsc2UpLCAgIyBub3FhOiBGQlQwMDMKICAgIC8vICAgICBwcmluY2lwYWxfYXNzZXRfaWQ9ZGV0YWlscy5wcmluY2lwYWxfYXNzZXRfaWQsCiAgICAvLyAgICAgY29sbGF0ZXJhbF9hc3NldF9pZD1kZXRhaWxzLmNvbGxhdGVyYWxfYXNzZXRfaWQsCiAgICAvLyAgICAgaW50ZXJlc3RfYXNzZXRfYW1vdW50PWRldGFpbHMuaW50ZXJlc3RfYXNzZXRfYW1vdW50LAogICAgLy8gICAgIHByaW5jaXBhbF9hc3NldF9hbW91bnQ9ZGV0YWlscy5wcmluY2lwYWxfYXNzZXRfYW1vdW50LAogICAgLy8gICAgIGNvbGxhdGVyYWxfYXNzZXRfYW1vdW50PWRldGFpbHMuY29sbGF0ZXJhbF9hc3NldF9hbW91bnQsCiAgICAvLyAgICAgZWFybHlfcGF5bWVudF9wZW5hbHR5X2Ftb3VudD1kZXRhaWxzLmVhcmx5X3BheW1lbnRfcGVuYWx0eV9hbW91bnQsCiAgICAvLyAgICAgcGF5bWVudF9jb21wbGV0aW9uX3RpbWVzdGFtcD1kZXRhaWxzLnBheW1lbnRfY29tcGxldGlvbl90aW1lc3RhbXAsCiAgICAvLyAgICAgbGVuZGVyX25mdF9hc3Nlcl9pZD1kZXRhaWxzLmxlbmRlcl9uZnRfYXNzZXJfaWQsCiAgICAvLyAgICAgYm9ycm93ZXJfbmZ0X2Fzc2VyX2lkPWRldGFpbHMuYm9ycm93ZXJfbmZ0X2Fzc2VyX2lkLAogICAgLy8gICAgIGJvcnJvd2VyPWRldGFpbHMuYm9ycm93ZXIsCiAgICAvLyAgICAgYWN0aXZlX2xvYW5fcG9zaXRpb249YTQuVUludDY0KDApLAogICAgLy8gKQogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTEKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLmNvbnRyYWN0LlphaWJhdHN1TG9hbi5sb2FuX3R5cGVfZnJvbV9uYW1lKGxvYW5fdHlwZTogYnl0ZXMpIC0+IGJ5dGVzOgpsb2FuX3R5cGVfZnJvbV9uYW1lOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6ODI2LTgyNwogICAgLy8gQGFwLnN1YnJvdXRpbmUKICAgIC8vIGRlZiBsb2FuX3R5cGVfZnJvbV9uYW1lKHNlbGYsIGxvYW5fdHlwZTogYTQuU3RyaW5nKSAtPiBhNC5VSW50ODoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6ODI4CiAgICAvLyBpZiBsb2FuX3R5cGUgPT0gYTQuU3RyaW5nKCJQMlAiKToKICAgIGZyYW1lX2RpZyAtMQogICAgYnl0ZSAweDAwMDM1MDMyNTAKICAgID09CiAgICBieiBsb2FuX3R5cGVfZnJvbV9uYW1lX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6ODI5CiAgICAvLyByZXR1cm4gYTQuVUludDgoTE9BTl9UWVBFX1AyUCkKICAgIGJ5dGUgMHgwMQogICAgcmV0c3ViCgpsb2FuX3R5cGVfZnJvbV9uYW1lX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjgzMAogICAgLy8gaWYgbG9hbl90eXBlID09IGE0LlN0cmluZygiREFPIik6CiAgICBmcmFtZV9kaWcgLTEKICAgIGJ5dGUgMHgwMDAzNDQ0MTRmCiAgICA9PQogICAgYnogbG9hbl90eXBlX2Zyb21fbmFtZV9hZnRlcl9pZl9lbHNlQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjgzMQogICAgLy8gcmV0dXJuIGE0LlVJbnQ4KExPQU5fVFlQRV9EQU8pCiAgICBieXRlIDB4MDIKICAgIHJldHN1YgoKbG9hbl90eXBlX2Zyb21fbmFtZV9hZnRlcl9pZl9lbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo4MzIKICAgIC8vIGFzc2VydCBsb2FuX3R5cGUgPT0gYTQuU3RyaW5nKCJaQUlCQVRTVSIpLCAiVGhlIGxvYW5fdHlwZSBpcyBub3Qgc3VwcG9ydGVkIgogICAgZnJhbWVfZGlnIC0xCiAgICBieXRlIDB4MDAwODVhNDE0OTQyNDE1NDUzNTUKICAgID09CiAgICBhc3NlcnQgLy8gVGhlIGxvYW5fdHlwZSBpcyBub3Qgc3VwcG9ydGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo4MzMKICAgIC8vIHJldHVybiBhNC5VSW50OChMT0FOX1RZUEVfWkFJQkFUU1UpCiAgICBieXRlIDB4MDMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLnN0b3JhZ2UubG9hbl9yZWNvcmRfa2V5KGxvYW5fa2V5OiBieXRlcykgLT4gYnl0ZXM6CmxvYW5fcmVjb3JkX2tleToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL3N0b3JhZ2UucHk6NzEtNzIKICAgIC8vIEBhcC5zdWJyb3V0aW5lCiAgICAvLyBkZWYgbG9hbl9yZWNvcmRfa2V5KGxvYW5fa2V5OiBhcC5CeXRlcykgLT4gYXAuQnl0ZXM6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL3N0b3JhZ2UucHk6NzMKICAgIC8vIHJldHVybiBvcC5jb25jYXQoTE9BTl9LRVlfUFJFRklYLCBsb2FuX2tleSkKICAgIGJ5dGUgMHg0YwogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLnN0b3JhZ2UucHV0X2xvYW5fcmVjaXBpZW50cyhsb2FuX2tleTogYnl0ZXMsIHJlY2lwaWVudHM6IGJ5dGVzKSAtPiBieXRlczoKcHV0X2xvYW5fcmVjaXBpZW50czoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL3N0b3JhZ2UucHk6MjkzLTI5NAogICAgLy8gQGFwLnN1YnJvdXRpbmUKICAgIC8vIGRlZiBwdXRfbG9hbl9yZWNpcGllbnRzKGxvYW5fa2V5OiBhcC5CeXRlcywgcmVjaXBpZW50czogUGF5bWVudFJlY2llcGllbnRBcnJheSkgLT4gTm9uZToKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vc3RvcmFnZS5weToyOTUKICAgIC8vIG9wLkJveC5wdXQobG9hbl9yZWNpcGllbnRzX2tleShsb2FuX2tleSksIHJlY2lwaWVudHMuYnl0ZXMpCiAgICBmcmFtZV9kaWcgLTIKICAgIGNhbGxzdWIgbG9hbl9yZWNpcGllbnRzX2tleQogICAgZnJhbWVfZGlnIC0xCiAgICBib3hfcHV0CiAgICBmcmFtZV9kaWcgLTEKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLnN0b3JhZ2UubG9hbl9yZWNpcGllbnRzX2tleShsb2FuX2tleTogYnl0ZXMpIC0+IGJ5dGVzOgpsb2FuX3JlY2lwaWVudHNfa2V5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vc3RvcmFnZS5weToyNjQtMjY1CiAgICAvLyBAYXAuc3Vicm91dGluZQogICAgLy8gZGVmIGxvYW5fcmVjaXBpZW50c19rZXkobG9hbl9rZXk6IGFwLkJ5dGVzKSAtPiBhcC5CeXRlczoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vc3RvcmFnZS5weToyNjYKICAgIC8vIHJldHVybiBvcC5jb25jYXQoUkVDSVBJRU5UU19LRVlfUFJFRklYLCBsb2FuX2tleSkKICAgIGJ5dGUgMHg1MAogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLmNvbnRyYWN0LlphaWJhdHN1TG9hbi5hZGRfYWN0aXZlX2xvYW4obG9hbl9rZXk6IGJ5dGVzKSAtPiB2b2lkOgphZGRfYWN0aXZlX2xvYW46CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo5MTUtOTE2CiAgICAvLyBAYXAuc3Vicm91dGluZQogICAgLy8gZGVmIGFkZF9hY3RpdmVfbG9hbihzZWxmLCBsb2FuX2tleTogYXAuQnl0ZXMpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjkxOAogICAgLy8gY291bnQgPSBhY3RpdmVfbG9hbl9jb3VudCgpCiAgICBjYWxsc3ViIGFjdGl2ZV9sb2FuX2NvdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo5MTkKICAgIC8vIGluc2VydF9hY3RpdmVfbG9hbihsb2FuX2tleSwgY291bnQpCiAgICBmcmFtZV9kaWcgLTEKICAgIGRpZyAxCiAgICBjYWxsc3ViIGluc2VydF9hY3RpdmVfbG9hbgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6OTIwCiAgICAvLyBzZXRfYWN0aXZlX2xvYW5fY291bnQoY291bnQgKyAxKQogICAgaW50IDEKICAgICsKICAgIGNhbGxzdWIgc2V0X2FjdGl2ZV9sb2FuX2NvdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo5MjEKICAgIC8vIGFkZF9ib3Jyb3dlcl9sb2FuKGxvYW5fYm9ycm93ZXIobG9hbl9rZXkpLCBsb2FuX2tleSkKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBsb2FuX2JvcnJvd2VyCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgYWRkX2JvcnJvd2VyX2xvYW4KICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLnN0b3JhZ2UuYWN0aXZlX2xvYW5fY291bnQoKSAtPiB1aW50NjQ6CmFjdGl2ZV9sb2FuX2NvdW50OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vc3RvcmFnZS5weToxNTEtMTUyCiAgICAvLyBAYXAuc3Vicm91dGluZQogICAgLy8gZGVmIGFjdGl2ZV9sb2FuX2NvdW50KCkgLT4gYXAuVUludDY0OgogICAgcHJvdG8gMCAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9zdG9yYWdlLnB5OjE1MwogICAgLy8gcmV0dXJuIHJlYWRfbG9hbl9jb3VudGVyKGFwLlVJbnQ2NChBQ1RJVkVfTE9BTl9DT1VOVCkpCiAgICBpbnQgOAogICAgY2FsbHN1YiByZWFkX2xvYW5fY291bnRlcgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2xvYW4uYWN0aXZlX2xvYW5zLmluc2VydF9hY3RpdmVfbG9hbihsb2FuX2tleTogYnl0ZXMsIGFjdGl2ZV9sb2FuX2NvdW50OiB1aW50NjQpIC0+IHZvaWQ6Cmluc2VydF9hY3RpdmVfbG9hbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2FjdGl2ZV9sb2Fucy5weTo1Ni01NwogICAgLy8gQGFwLnN1YnJvdXRpbmUKICAgIC8vIGRlZiBpbnNlcnRfYWN0aXZlX2xvYW4obG9hbl9rZXk6IGFwLkJ5dGVzLCBhY3RpdmVfbG9hbl9jb3VudDogYXAuVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9hY3RpdmVfbG9hbnMucHk6NjIKICAgIC8vIGlmIGFjdGl2ZV9sb2FuX2NvdW50ICUgQUNUSVZFX0xPQU5TX1BFUl9QQUdFID09IDA6CiAgICBmcmFtZV9kaWcgLTEKICAgIGludCAxMjgKICAgICUKICAgIGJueiBpbnNlcnRfYWN0aXZlX2xvYW5fYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9hY3RpdmVfbG9hbnMucHk6NjQKICAgIC8vIGFjdGl2ZV9sb2Fuc19wYWdlX2tleShhY3RpdmVfbG9hbl9jb3VudCksIEFDVElWRV9MT0FOU19QQUdFX1NJWkUKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBhY3RpdmVfbG9hbnNfcGFnZV9rZXkKICAgIGludCAxMDI0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9hY3RpdmVfbG9hbnMucHk6NjMtNjUKICAgIC8vIF9jcmVhdGVkID0gb3AuQm94LmNyZWF0ZSgKICAgIC8vICAgICBhY3RpdmVfbG9hbnNfcGFnZV9rZXkoYWN0aXZlX2xvYW5fY291bnQpLCBBQ1RJVkVfTE9BTlNfUEFHRV9TSVpFCiAgICAvLyApCiAgICBib3hfY3JlYXRlCiAgICBwb3AKCmluc2VydF9hY3RpdmVfbG9hbl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9hY3RpdmVfbG9hbnMucHk6NjYKICAgIC8vIHdyaXRlX2FjdGl2ZV9sb2FuKGFjdGl2ZV9sb2FuX2NvdW50LCBsb2FuX2tleSkKICAgIGZyYW1lX2RpZyAtMQogICAgZnJhbWVfZGlnIC0yCiAgICBjYWxsc3ViIHdyaXRlX2FjdGl2ZV9sb2FuCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9hY3RpdmVfbG9hbnMucHk6NjcKICAgIC8vIHNldF9sb2FuX2FjdGl2ZV9wb3NpdGlvbihsb2FuX2tleSwgYWN0aXZlX2xvYW5fY291bnQpCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBzZXRfbG9hbl9hY3RpdmVfcG9zaXRpb24KICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLmFjdGl2ZV9sb2Fucy5hY3RpdmVfbG9hbnNfcGFnZV9rZXkocG9zaXRpb246IHVpbnQ2NCkgLT4gYnl0ZXM6CmFjdGl2ZV9sb2Fuc19wYWdlX2tleToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2FjdGl2ZV9sb2Fucy5weToyNi0yNwogICAgLy8gQGFwLnN1YnJvdXRpbmUKICAgIC8vIGRlZiBhY3RpdmVfbG9hbnNfcGFnZV9rZXkocG9zaXRpb246IGFwLlVJbnQ2NCkgLT4gYXAuQnl0ZXM6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2FjdGl2ZV9sb2Fucy5weToyOQogICAgLy8gcGFnZSA9IHBvc2l0aW9uIC8vIEFDVElWRV9MT0FOU19QRVJfUEFHRQogICAgZnJhbWVfZGlnIC0xCiAgICBpbnQgMTI4CiAgICAvCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9hY3RpdmVfbG9hbnMucHk6MzAKICAgIC8vIHJldHVybiBvcC5jb25jYXQoQUNUSVZFX0xPQU5TX0tFWV9QUkVGSVgsIG9wLml0b2IocGFnZSkpCiAgICBpdG9iCiAgICBieXRlIDB4NDkKICAgIHN3YXAKICAgIGNvbmNhdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2xvYW4uYWN0aXZlX2xvYW5zLndyaXRlX2FjdGl2ZV9sb2FuKHBvc2l0aW9uOiB1aW50NjQsIGxvYW5fa2V5OiBieXRlcykgLT4gdm9pZDoKd3JpdGVfYWN0aXZlX2xvYW46CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9hY3RpdmVfbG9hbnMucHk6NDctNDgKICAgIC8vIEBhcC5zdWJyb3V0aW5lCiAgICAvLyBkZWYgd3JpdGVfYWN0aXZlX2xvYW4ocG9zaXRpb246IGFwLlVJbnQ2NCwgbG9hbl9rZXk6IGFwLkJ5dGVzKSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9hY3RpdmVfbG9hbnMucHk6NTAKICAgIC8vIGFjdGl2ZV9sb2Fuc19wYWdlX2tleShwb3NpdGlvbiksCiAgICBmcmFtZV9kaWcgLTIKICAgIGNhbGxzdWIgYWN0aXZlX2xvYW5zX3BhZ2Vfa2V5CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9hY3RpdmVfbG9hbnMucHk6NTEKICAgIC8vIGFjdGl2ZV9sb2FuX3Nsb3Rfb2Zmc2V0KHBvc2l0aW9uKSwKICAgIGZyYW1lX2RpZyAtMgogICAgY2FsbHN1YiBhY3RpdmVfbG9hbl9zbG90X29mZnNldAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vYWN0aXZlX2xvYW5zLnB5OjQ5LTUzCiAgICAvLyBvcC5Cb3gucmVwbGFjZSgKICAgIC8vICAgICBhY3RpdmVfbG9hbnNfcGFnZV9rZXkocG9zaXRpb24pLAogICAgLy8gICAgIGFjdGl2ZV9sb2FuX3Nsb3Rfb2Zmc2V0KHBvc2l0aW9uKSwKICAgIC8vICAgICBsb2FuX2tleSwKICAgIC8vICkKICAgIGZyYW1lX2RpZyAtMQogICAgYm94X3JlcGxhY2UKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLmFjdGl2ZV9sb2Fucy5hY3RpdmVfbG9hbl9zbG90X29mZnNldChwb3NpdGlvbjogdWludDY0KSAtPiB1aW50NjQ6CmFjdGl2ZV9sb2FuX3Nsb3Rfb2Zmc2V0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vYWN0aXZlX2xvYW5zLnB5OjMzLTM0CiAgICAvLyBAYXAuc3Vicm91dGluZQogICAgLy8gZGVmIGFjdGl2ZV9sb2FuX3Nsb3Rfb2Zmc2V0KHBvc2l0aW9uOiBhcC5VSW50NjQpIC0+IGFwLlVJbnQ2NDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vYWN0aXZlX2xvYW5zLnB5OjM1CiAgICAvLyByZXR1cm4gKHBvc2l0aW9uICUgQUNUSVZFX0xPQU5TX1BFUl9QQUdFKSAqIFJFQ09SRF9LRVlfU0laRQogICAgZnJhbWVfZGlnIC0xCiAgICBpbnQgMTI4CiAgICAlCiAgICBpbnQgOAogICAgKgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2xvYW4uc3RvcmFnZS5zZXRfbG9hbl9hY3RpdmVfcG9zaXRpb24obG9hbl9rZXk6IGJ5dGVzLCBwb3NpdGlvbjogdWludDY0KSAtPiB2b2lkOgpzZXRfbG9hbl9hY3RpdmVfcG9zaXRpb246CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9zdG9yYWdlLnB5OjI0OC0yNDkKICAgIC8vIEBhcC5zdWJyb3V0aW5lCiAgICAvLyBkZWYgc2V0X2xvYW5fYWN0aXZlX3Bvc2l0aW9uKGxvYW5fa2V5OiBhcC5CeXRlcywgcG9zaXRpb246IGFwLlVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vc3RvcmFnZS5weToyNTAKICAgIC8vIHdyaXRlX3VpbnQ2NChsb2FuX2tleSwgYXAuVUludDY0KEFDVElWRV9MT0FOX1BPU0lUSU9OKSwgcG9zaXRpb24pCiAgICBmcmFtZV9kaWcgLTIKICAgIGludCAxMTAKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiB3cml0ZV91aW50NjQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLnN0b3JhZ2Uud3JpdGVfdWludDY0KGxvYW5fa2V5OiBieXRlcywgb2Zmc2V0OiB1aW50NjQsIHZhbHVlOiB1aW50NjQpIC0+IHZvaWQ6CndyaXRlX3VpbnQ2NDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL3N0b3JhZ2UucHk6OTItOTMKICAgIC8vIEBhcC5zdWJyb3V0aW5lCiAgICAvLyBkZWYgd3JpdGVfdWludDY0KGxvYW5fa2V5OiBhcC5CeXRlcywgb2Zmc2V0OiBhcC5VSW50NjQsIHZhbHVlOiBhcC5VSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAzIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL3N0b3JhZ2UucHk6OTQKICAgIC8vIG9wLkJveC5yZXBsYWNlKGxvYW5fcmVjb3JkX2tleShsb2FuX2tleSksIG9mZnNldCwgb3AuaXRvYih2YWx1ZSkpCiAgICBmcmFtZV9kaWcgLTMKICAgIGNhbGxzdWIgbG9hbl9yZWNvcmRfa2V5CiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAtMgogICAgc3dhcAogICAgYm94X3JlcGxhY2UKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLnN0b3JhZ2Uuc2V0X2FjdGl2ZV9sb2FuX2NvdW50KGNvdW50OiB1aW50NjQpIC0+IHZvaWQ6CnNldF9hY3RpdmVfbG9hbl9jb3VudDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL3N0b3JhZ2UucHk6MTU2LTE1NwogICAgLy8gQGFwLnN1YnJvdXRpbmUKICAgIC8vIGRlZiBzZXRfYWN0aXZlX2xvYW5fY291bnQoY291bnQ6IGFwLlVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vc3RvcmFnZS5weToxNTgKICAgIC8vIHdyaXRlX2xvYW5fY291bnRlcihhcC5VSW50NjQoQUNUSVZFX0xPQU5fQ09VTlQpLCBjb3VudCkKICAgIGludCA4CiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgd3JpdGVfbG9hbl9jb3VudGVyCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfbG9hbi5zdG9yYWdlLmxvYW5fYm9ycm93ZXIobG9hbl9rZXk6IGJ5dGVzKSAtPiBieXRlczoKbG9hbl9ib3Jyb3dlcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL3N0b3JhZ2UucHk6MjM4LTIzOQogICAgLy8gQGFwLnN1YnJvdXRpbmUKICAgIC8vIGRlZiBsb2FuX2JvcnJvd2VyKGxvYW5fa2V5OiBhcC5CeXRlcykgLT4gYXAuQWNjb3VudDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vc3RvcmFnZS5weToyNDAKICAgIC8vIHJldHVybiBhcC5BY2NvdW50KG9wLkJveC5leHRyYWN0KGxvYW5fcmVjb3JkX2tleShsb2FuX2tleSksIEJPUlJPV0VSLCAzMikpCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgbG9hbl9yZWNvcmRfa2V5CiAgICBpbnQgNzgKICAgIGludCAzMgogICAgYm94X2V4dHJhY3QKICAgIGR1cAogICAgbGVuCiAgICBpbnQgMzIKICAgID09CiAgICBhc3NlcnQgLy8gQWRkcmVzcyBsZW5ndGggaXMgMzIgYnl0ZXMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLmJvcnJvd2VyX2xvYW5zLmFkZF9ib3Jyb3dlcl9sb2FuKGJvcnJvd2VyOiBieXRlcywgbG9hbl9rZXk6IGJ5dGVzKSAtPiB2b2lkOgphZGRfYm9ycm93ZXJfbG9hbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2JvcnJvd2VyX2xvYW5zLnB5OjM4LTM5CiAgICAvLyBAYXAuc3Vicm91dGluZQogICAgLy8gZGVmIGFkZF9ib3Jyb3dlcl9sb2FuKGJvcnJvd2VyOiBhcC5BY2NvdW50LCBsb2FuX2tleTogYXAuQnl0ZXMpIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2JvcnJvd2VyX2xvYW5zLnB5OjQwCiAgICAvLyBib3hfa2V5ID0gYm9ycm93ZXJfbG9hbnNfa2V5KGJvcnJvd2VyKQogICAgZnJhbWVfZGlnIC0yCiAgICBjYWxsc3ViIGJvcnJvd2VyX2xvYW5zX2tleQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vYm9ycm93ZXJfbG9hbnMucHk6NDEKICAgIC8vIGNvdW50ID0gYm9ycm93ZXJfbG9hbl9jb3VudChib3Jyb3dlcikKICAgIGZyYW1lX2RpZyAtMgogICAgY2FsbHN1YiBib3Jyb3dlcl9sb2FuX2NvdW50CiAgICBkdXBuIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2JvcnJvd2VyX2xvYW5zLnB5OjQyCiAgICAvLyBhc3NlcnQgY291bnQgPCBNQVhfQk9SUk9XRVJfTE9BTlMsICJBIGJvcnJvd2VyIGNhbiBoYXZlIGF0IG1vc3QgMTI4IG9wZW4gbG9hbnMiCiAgICBpbnQgMTI4CiAgICA8CiAgICBhc3NlcnQgLy8gQSBib3Jyb3dlciBjYW4gaGF2ZSBhdCBtb3N0IDEyOCBvcGVuIGxvYW5zCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9ib3Jyb3dlcl9sb2Fucy5weTo0MwogICAgLy8gaWYgY291bnQgPT0gMDoKICAgIGJueiBhZGRfYm9ycm93ZXJfbG9hbl9lbHNlX2JvZHlAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vYm9ycm93ZXJfbG9hbnMucHk6NDQKICAgIC8vIF9jcmVhdGVkID0gb3AuQm94LmNyZWF0ZShib3hfa2V5LCBSRUNPUkRfS0VZX1NJWkUpCiAgICBmcmFtZV9kaWcgMAogICAgaW50IDgKICAgIGJveF9jcmVhdGUKICAgIHBvcAogICAgYiBhZGRfYm9ycm93ZXJfbG9hbl9hZnRlcl9pZl9lbHNlQDMKCmFkZF9ib3Jyb3dlcl9sb2FuX2Vsc2VfYm9keUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vYm9ycm93ZXJfbG9hbnMucHk6NDYKICAgIC8vIG9wLkJveC5yZXNpemUoYm94X2tleSwgKGNvdW50ICsgMSkgKiBSRUNPUkRfS0VZX1NJWkUpCiAgICBmcmFtZV9kaWcgMQogICAgaW50IDEKICAgICsKICAgIGludCA4CiAgICAqCiAgICBmcmFtZV9kaWcgMAogICAgc3dhcAogICAgYm94X3Jlc2l6ZQoKYWRkX2JvcnJvd2VyX2xvYW5fYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vYm9ycm93ZXJfbG9hbnMucHk6NDcKICAgIC8vIG9wLkJveC5yZXBsYWNlKGJveF9rZXksIGNvdW50ICogUkVDT1JEX0tFWV9TSVpFLCBsb2FuX2tleSkKICAgIGZyYW1lX2RpZyAxCiAgICBpbnQgOAogICAgKgogICAgZnJhbWVfZGlnIDAKICAgIHN3YXAKICAgIGZyYW1lX2RpZyAtMQogICAgYm94X3JlcGxhY2UKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLmJvcnJvd2VyX2xvYW5zLmJvcnJvd2VyX2xvYW5zX2tleShib3Jyb3dlcjogYnl0ZXMpIC0+IGJ5dGVzOgpib3Jyb3dlcl9sb2Fuc19rZXk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9ib3Jyb3dlcl9sb2Fucy5weToyMC0yMQogICAgLy8gQGFwLnN1YnJvdXRpbmUKICAgIC8vIGRlZiBib3Jyb3dlcl9sb2Fuc19rZXkoYm9ycm93ZXI6IGFwLkFjY291bnQpIC0+IGFwLkJ5dGVzOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9ib3Jyb3dlcl9sb2Fucy5weToyMgogICAgLy8gcmV0dXJuIG9wLmNvbmNhdChCT1JST1dFUl9MT0FOU19LRVlfUFJFRklYLCBib3Jyb3dlci5ieXRlcykKICAgIGJ5dGUgMHg0MgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLmJvcnJvd2VyX2xvYW5zLmJvcnJvd2VyX2xvYW5fY291bnQoYm9ycm93ZXI6IGJ5dGVzKSAtPiB1aW50NjQ6CmJvcnJvd2VyX2xvYW5fY291bnQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9ib3Jyb3dlcl9sb2Fucy5weToyNS0yNgogICAgLy8gQGFwLnN1YnJvdXRpbmUKICAgIC8vIGRlZiBib3Jyb3dlcl9sb2FuX2NvdW50KGJvcnJvd2VyOiBhcC5BY2NvdW50KSAtPiBhcC5VSW50NjQ6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2JvcnJvd2VyX2xvYW5zLnB5OjI3CiAgICAvLyBsZW5ndGgsIF9leGlzdHMgPSBvcC5Cb3gubGVuZ3RoKGJvcnJvd2VyX2xvYW5zX2tleShib3Jyb3dlcikpCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgYm9ycm93ZXJfbG9hbnNfa2V5CiAgICBib3hfbGVuCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2JvcnJvd2VyX2xvYW5zLnB5OjI4CiAgICAvLyByZXR1cm4gbGVuZ3RoIC8vIFJFQ09SRF9LRVlfU0laRQogICAgaW50IDgKICAgIC8KICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLmNvbnRyYWN0LlphaWJhdHN1TG9hbi5lbWl0X2xvYW5faW5pdGlhdGVkKGxvYW5fa2V5OiBieXRlcywgcmVjb3JkOiBieXRlcykgLT4gYnl0ZXM6CmVtaXRfbG9hbl9pbml0aWF0ZWQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo4MTMtODE0CiAgICAvLyBAYXAuc3Vicm91dGluZQogICAgLy8gZGVmIGVtaXRfbG9hbl9pbml0aWF0ZWQoc2VsZiwgbG9hbl9rZXk6IGFwLkJ5dGVzLCByZWNvcmQ6IExvYW5SZWNvcmQpIC0+IE5vbmU6CiAgICBwcm90byAyIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjgxOAogICAgLy8gYm9ycm93ZXI9cmVjb3JkLmJvcnJvd2VyLAogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDc4IDMyIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6ODE5CiAgICAvLyBwcmluY2lwYWxfYXNzZXRfaWQ9cmVjb3JkLnByaW5jaXBhbF9hc3NldF9pZCwKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCA2IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo4MjAKICAgIC8vIHByaW5jaXBhbF9hc3NldF9hbW91bnQ9cmVjb3JkLnByaW5jaXBhbF9hc3NldF9hbW91bnQsCiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgMzAgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjgyMQogICAgLy8gY29sbGF0ZXJhbF9hc3NldF9pZD1yZWNvcmQuY29sbGF0ZXJhbF9hc3NldF9pZCwKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAxNCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgY292ZXIgMwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6ODIyCiAgICAvLyBjb2xsYXRlcmFsX2Fzc2V0X2Ftb3VudD1yZWNvcmQuY29sbGF0ZXJhbF9hc3NldF9hbW91bnQsCiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgMzggOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGNvdmVyIDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjgxNi04MjMKICAgIC8vIExvYW5Jbml0aWF0ZWQoCiAgICAvLyAgICAgbG9hbl9rZXk9UmVjb3JkS2V5LmZyb21fYnl0ZXMobG9hbl9rZXkpLAogICAgLy8gICAgIGJvcnJvd2VyPXJlY29yZC5ib3Jyb3dlciwKICAgIC8vICAgICBwcmluY2lwYWxfYXNzZXRfaWQ9cmVjb3JkLnByaW5jaXBhbF9hc3NldF9pZCwKICAgIC8vICAgICBwcmluY2lwYWxfYXNzZXRfYW1vdW50PXJlY29yZC5wcmluY2lwYWxfYXNzZXRfYW1vdW50LAogICAgLy8gICAgIGNvbGxhdGVyYWxfYXNzZXRfaWQ9cmVjb3JkLmNvbGxhdGVyYWxfYXNzZXRfaWQsCiAgICAvLyAgICAgY29sbGF0ZXJhbF9hc3NldF9hbW91bnQ9cmVjb3JkLmNvbGxhdGVyYWxfYXNzZXRfYW1vdW50LAogICAgLy8gKQogICAgZnJhbWVfZGlnIC0yCiAgICBzd2FwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6ODE1LTgyNAogICAgLy8gYTQuZW1pdCgKICAgIC8vICAgICBMb2FuSW5pdGlhdGVkKAogICAgLy8gICAgICAgICBsb2FuX2tleT1SZWNvcmRLZXkuZnJvbV9ieXRlcyhsb2FuX2tleSksCiAgICAvLyAgICAgICAgIGJvcnJvd2VyPXJlY29yZC5ib3Jyb3dlciwKICAgIC8vICAgICAgICAgcHJpbmNpcGFsX2Fzc2V0X2lkPXJlY29yZC5wcmluY2lwYWxfYXNzZXRfaWQsCiAgICAvLyAgICAgICAgIHByaW5jaXBhbF9hc3NldF9hbW91bnQ9cmVjb3JkLnByaW5jaXBhbF9hc3NldF9hbW91bnQsCiAgICAvLyAgICAgICAgIGNvbGxhdGVyYWxfYXNzZXRfaWQ9cmVjb3JkLmNvbGxhdGVyYWxfYXNzZXRfaWQsCiAgICAvLyAgICAgICAgIGNvbGxhdGVyYWxfYXNzZXRfYW1vdW50PXJlY29yZC5jb2xsYXRlcmFsX2Fzc2V0X2Ftb3VudCwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBtZXRob2QgIkxvYW5Jbml0aWF0ZWQoYnl0ZVs4XSxhZGRyZXNzLHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgZnJhbWVfZGlnIC0xCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfbG9hbi5jb250cmFjdC5aYWliYXRzdUxvYW4uaW5pdGlhdGVfbG9hbl9wdXJjaGFzZXMobG9hbnM6IGJ5dGVzKSAtPiBieXRlczoKaW5pdGlhdGVfbG9hbl9wdXJjaGFzZXM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxMTYtMTIwCiAgICAvLyBAYTQuYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBpbml0aWF0ZV9sb2FuX3B1cmNoYXNlcygKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIGxvYW5zOiBhNC5EeW5hbWljQXJyYXlbTG9hbkRldGFpbHNdLAogICAgLy8gKSAtPiBSZWNvcmRLZXlBcnJheToKICAgIHByb3RvIDEgMQogICAgYnl0ZSAiIgogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxMjgKICAgIC8vIGZpcnN0X3R4bl9pbmRleCA9IGFwLlR4bi5ncm91cF9pbmRleCAtIGxvYW5zLmxlbmd0aAogICAgdHhuIEdyb3VwSW5kZXgKICAgIGZyYW1lX2RpZyAtMQogICAgaW50IDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjEzMAogICAgLy8gbG9hbl9rZXlzID0gUmVjb3JkS2V5QXJyYXkoKQogICAgYnl0ZSAweDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjEzMQogICAgLy8gcHJpY2VkX2Fzc2V0X2lkID0gYXAuVUludDY0KDApCiAgICBpbnQgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MTMyCiAgICAvLyBmb3IgaW5kZXggaW4gYXAudXJhbmdlKGxvYW5zLmxlbmd0aCk6CiAgICBkdXAKCmluaXRpYXRlX2xvYW5fcHVyY2hhc2VzX2Zvcl9oZWFkZXJAMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjEzMgogICAgLy8gZm9yIGluZGV4IGluIGFwLnVyYW5nZShsb2Fucy5sZW5ndGgpOgogICAgZnJhbWVfZGlnIDYKICAgIGZyYW1lX2RpZyAyCiAgICA8CiAgICBieiBpbml0aWF0ZV9sb2FuX3B1cmNoYXNlc19hZnRlcl9mb3JANwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MTMzCiAgICAvLyB0eG4gPSBndHhuLkFzc2V0VHJhbnNmZXJUcmFuc2FjdGlvbihmaXJzdF90eG5faW5kZXggKyBpbmRleCkKICAgIGZyYW1lX2RpZyAzCiAgICBmcmFtZV9kaWcgNgogICAgKwogICAgZHVwCiAgICBmcmFtZV9idXJ5IDEKICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludCBheGZlcgogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIGF4ZmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxMzQKICAgIC8vIGlmIHR4bi54ZmVyX2Fzc2V0LmlkICE9IHByaWNlZF9hc3NldF9pZDoKICAgIGd0eG5zIFhmZXJBc3NldAogICAgZHVwCiAgICBmcmFtZV9idXJ5IDAKICAgIGZyYW1lX2RpZyA1CiAgICAhPQogICAgYnogaW5pdGlhdGVfbG9hbl9wdXJjaGFzZXNfYWZ0ZXJfaWZfZWxzZUA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxMzUKICAgIC8vIGNvbGxhdGVyYWxfcHJpY2UgPSBzZWxmLmdldF9hc3NldF9wcmljZSh0eG4ueGZlcl9hc3NldCkKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIGNhbGxzdWIgZ2V0X2Fzc2V0X3ByaWNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxMzYtMTM4CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIGNvbGxhdGVyYWxfcHJpY2UgPiAwCiAgICAvLyApLCAiVGhlIGFzYSBpcyBvZiBubyB2YWx1ZSBvciBpcyBub3Qgc3VwcG9ydGVkIgogICAgYXNzZXJ0IC8vIFRoZSBhc2EgaXMgb2Ygbm8gdmFsdWUgb3IgaXMgbm90IHN1cHBvcnRlZAogICAgZnJhbWVfYnVyeSA1Cgppbml0aWF0ZV9sb2FuX3B1cmNoYXNlc19hZnRlcl9pZl9lbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxNDEKICAgIC8vIGxvYW5fa2V5ID0gc2VsZi5pbml0aWF0ZV9sb2FuKGxvYW5zW2luZGV4XS5jb3B5KCksIHR4bikKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyA2CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludCAyCiAgICAqCiAgICBkaWcgMQogICAgc3dhcAogICAgZXh0cmFjdF91aW50MTYKICAgIGNvdmVyIDIKICAgIHN3YXAKICAgIGludCAxCiAgICArCiAgICBmcmFtZV9kaWcgMgogICAgZGlnIDEKICAgIC0gLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBjb3ZlciAyCiAgICBkaWcgMQogICAgbGVuCiAgICBjb3ZlciAyCiAgICBkdXAKICAgIGludCAyCiAgICAqCiAgICBkaWcgMgogICAgc3dhcAogICAgZXh0cmFjdF91aW50MTYKICAgIHVuY292ZXIgMwogICAgc3dhcAogICAgdW5jb3ZlciA0CiAgICBzZWxlY3QKICAgIHVuY292ZXIgMgogICAgdW5jb3ZlciAzCiAgICB1bmNvdmVyIDIKICAgIHN1YnN0cmluZzMKICAgIGZyYW1lX2RpZyAxCiAgICBjYWxsc3ViIGluaXRpYXRlX2xvYW4KICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MTQyCiAgICAvLyBsb2FuX2tleXMuYXBwZW5kKFJlY29yZEtleS5mcm9tX2J5dGVzKGxvYW5fa2V5KSkKICAgIGZyYW1lX2RpZyA0CiAgICBleHRyYWN0IDIgMAogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGxlbgogICAgaW50IDgKICAgIC8KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2J1cnkgNAogICAgZnJhbWVfYnVyeSA2CiAgICBiIGluaXRpYXRlX2xvYW5fcHVyY2hhc2VzX2Zvcl9oZWFkZXJAMQoKaW5pdGlhdGVfbG9hbl9wdXJjaGFzZXNfYWZ0ZXJfZm9yQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxNDMKICAgIC8vIHJldHVybiBsb2FuX2tleXMKICAgIGZyYW1lX2RpZyA0CiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLmNvbnRyYWN0LlphaWJhdHN1TG9hbi5jb21wbGV0ZV9ub25fcDJwX2xvYW5fcHVyY2hhc2UobG9hbl9rZXk6IGJ5dGVzLCBjb21wbGV0aW9uX2FyZ3M6IGJ5dGVzLCBwcmluY2lwYWxfYXNzZXQ6IHVpbnQ2NCwgYm9ycm93ZXI6IGJ5dGVzKSAtPiBieXRlczoKY29tcGxldGVfbm9uX3AycF9sb2FuX3B1cmNoYXNlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MTQ1LTE1MgogICAgLy8gQGFwLmFyYzQuYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBjb21wbGV0ZV9ub25fcDJwX2xvYW5fcHVyY2hhc2UoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICBsb2FuX2tleTogYXAuQnl0ZXMsCiAgICAvLyAgICAgY29tcGxldGlvbl9hcmdzOiBDb21wbGV0ZUxvYW5BcmdzLAogICAgLy8gICAgIHByaW5jaXBhbF9hc3NldDogYXAuQXNzZXQsCiAgICAvLyAgICAgYm9ycm93ZXI6IGFwLkFjY291bnQsCiAgICAvLyApIC0+IExvYW5SZWNvcmQ6CiAgICBwcm90byA0IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjE1My0xNTkKICAgIC8vIHJldHVybiBzZWxmLmNvbXBsZXRlX2xvYW5fcHVyY2hhc2UoCiAgICAvLyAgICAgbG9hbl9rZXksCiAgICAvLyAgICAgY29tcGxldGlvbl9hcmdzLAogICAgLy8gICAgIHByaW5jaXBhbF9hc3NldCwKICAgIC8vICAgICBib3Jyb3dlciwKICAgIC8vICAgICBpc19wMnA9RmFsc2UsCiAgICAvLyApCiAgICBmcmFtZV9kaWcgLTQKICAgIGZyYW1lX2RpZyAtMwogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgLTEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjE1OAogICAgLy8gaXNfcDJwPUZhbHNlLAogICAgaW50IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjE1My0xNTkKICAgIC8vIHJldHVybiBzZWxmLmNvbXBsZXRlX2xvYW5fcHVyY2hhc2UoCiAgICAvLyAgICAgbG9hbl9rZXksCiAgICAvLyAgICAgY29tcGxldGlvbl9hcmdzLAogICAgLy8gICAgIHByaW5jaXBhbF9hc3NldCwKICAgIC8vICAgICBib3Jyb3dlciwKICAgIC8vICAgICBpc19wMnA9RmFsc2UsCiAgICAvLyApCiAgICBjYWxsc3ViIGNvbXBsZXRlX2xvYW5fcHVyY2hhc2UKICAgIGZyYW1lX2J1cnkgLTMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLmNvbnRyYWN0LlphaWJhdHN1TG9hbi5jb21wbGV0ZV9sb2FuX3B1cmNoYXNlKGxvYW5fa2V5OiBieXRlcywgY29tcGxldGlvbl9hcmdzOiBieXRlcywgcHJpbmNpcGFsX2Fzc2V0OiB1aW50NjQsIGJvcnJvd2VyOiBieXRlcywgaXNfcDJwOiB1aW50NjQpIC0+IGJ5dGVzLCBieXRlczoKY29tcGxldGVfbG9hbl9wdXJjaGFzZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjcwMC03MDgKICAgIC8vIEBhcC5zdWJyb3V0aW5lCiAgICAvLyBkZWYgY29tcGxldGVfbG9hbl9wdXJjaGFzZSgKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIGxvYW5fa2V5OiBhcC5CeXRlcywKICAgIC8vICAgICBjb21wbGV0aW9uX2FyZ3M6IENvbXBsZXRlTG9hbkFyZ3MsCiAgICAvLyAgICAgcHJpbmNpcGFsX2Fzc2V0OiBhcC5Bc3NldCwKICAgIC8vICAgICBib3Jyb3dlcjogYXAuQWNjb3VudCwKICAgIC8vICAgICBpc19wMnA6IGJvb2wsICAjIG5vcWE6IEZCVDAwMQogICAgLy8gKSAtPiBMb2FuUmVjb3JkOgogICAgcHJvdG8gNSAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo3MTMKICAgIC8vIFtsb2FuX2J5dGVzLCBleGlzdHNdID0gb3AuQm94LmdldChsb2FuX3JlY29yZF9rZXkobG9hbl9rZXkpKQogICAgZnJhbWVfZGlnIC01CiAgICBjYWxsc3ViIGxvYW5fcmVjb3JkX2tleQogICAgYm94X2dldAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NzE0CiAgICAvLyBhc3NlcnQgZXhpc3RzLCAiQSByZWNjb3JkIHdpdGggdGhlIGxvYW5fa2V5IHBhc3NlZCB3YXMgbm90IGZvdW5kIgogICAgYXNzZXJ0IC8vIEEgcmVjY29yZCB3aXRoIHRoZSBsb2FuX2tleSBwYXNzZWQgd2FzIG5vdCBmb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NzE3CiAgICAvLyBkZXRhaWxzLmxvYW5fdHlwZS5uYXRpdmUgPT0gTE9BTl9UWVBFX1AyUAogICAgZHVwCiAgICBleHRyYWN0IDEgMSAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgIGludCAxCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NzE3LTcxOAogICAgLy8gICAgIGRldGFpbHMubG9hbl90eXBlLm5hdGl2ZSA9PSBMT0FOX1RZUEVfUDJQCiAgICAvLyApID09IGlzX3AycCwgIlRoZSBsb2FuX3R5cGUgZG9lcyBub3QgbWF0Y2ggdGhlIGNvbXBsZXRpb24gbWV0aG9kIgogICAgZnJhbWVfZGlnIC0xCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NzE2LTcxOAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBkZXRhaWxzLmxvYW5fdHlwZS5uYXRpdmUgPT0gTE9BTl9UWVBFX1AyUAogICAgLy8gKSA9PSBpc19wMnAsICJUaGUgbG9hbl90eXBlIGRvZXMgbm90IG1hdGNoIHRoZSBjb21wbGV0aW9uIG1ldGhvZCIKICAgIGFzc2VydCAvLyBUaGUgbG9hbl90eXBlIGRvZXMgbm90IG1hdGNoIHRoZSBjb21wbGV0aW9uIG1ldGhvZAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NzIwCiAgICAvLyBkZXRhaWxzLmNvbGxhdGVyYWxfcGFpZAogICAgZHVwCiAgICBpbnQgNDAKICAgIGdldGJpdAogICAgYnl0ZSAweDAwCiAgICBpbnQgMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIGJ5dGUgMHgwMAogICAgIT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjcxOS03MjEKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgZGV0YWlscy5jb2xsYXRlcmFsX3BhaWQKICAgIC8vICksICJUaGUgbG9hbiBjb2xsYXRlcmFsIG11c3QgaGF2ZSBiZWVuIHBhaWQgYnkgdGhpcyBwb2ludCIKICAgIGFzc2VydCAvLyBUaGUgbG9hbiBjb2xsYXRlcmFsIG11c3QgaGF2ZSBiZWVuIHBhaWQgYnkgdGhpcyBwb2ludAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NzIyCiAgICAvLyBhc3NlcnQgbm90IGRldGFpbHMucHJpbmNpcGFsX3BhaWQsICJUaGUgcHJpbmNpcGFsIG11c3Qgbm90IGhhdmUgYmVlbiBwYWlkIgogICAgZHVwCiAgICBpbnQgNDEKICAgIGdldGJpdAogICAgYnl0ZSAweDAwCiAgICBpbnQgMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIGJ5dGUgMHgwMAogICAgPT0KICAgIGFzc2VydCAvLyBUaGUgcHJpbmNpcGFsIG11c3Qgbm90IGhhdmUgYmVlbiBwYWlkCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo3MjQKICAgIC8vIGJvcnJvd2VyID09IGRldGFpbHMuYm9ycm93ZXIubmF0aXZlCiAgICBkdXAKICAgIGV4dHJhY3QgNzggMzIgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBmcmFtZV9kaWcgLTIKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo3MjMtNzI1CiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIGJvcnJvd2VyID09IGRldGFpbHMuYm9ycm93ZXIubmF0aXZlCiAgICAvLyApLCAiVGhlIGJvcnJvd2VyIG11c3QgYmUgdGhlIGJvcnJvd2VyIGluIHRoZSBsb2FuIGRldGFpbHMiCiAgICBhc3NlcnQgLy8gVGhlIGJvcnJvd2VyIG11c3QgYmUgdGhlIGJvcnJvd2VyIGluIHRoZSBsb2FuIGRldGFpbHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjcyNwogICAgLy8gcHJpbmNpcGFsX2Fzc2V0LmlkID09IGRldGFpbHMucHJpbmNpcGFsX2Fzc2V0X2lkLm5hdGl2ZQogICAgZHVwCiAgICBleHRyYWN0IDYgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgIGZyYW1lX2RpZyAtMwogICAgPT0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjcyNi03MjgKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgcHJpbmNpcGFsX2Fzc2V0LmlkID09IGRldGFpbHMucHJpbmNpcGFsX2Fzc2V0X2lkLm5hdGl2ZQogICAgLy8gKSwgIlRoZSBhc3NldCBwYXNzZWQgbXVzdCBiZSB0aGUgc2FtZSBhcyB0aGUgcHJpbmNpcGFsIgogICAgYXNzZXJ0IC8vIFRoZSBhc3NldCBwYXNzZWQgbXVzdCBiZSB0aGUgc2FtZSBhcyB0aGUgcHJpbmNpcGFsCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo3MzAtNzMyCiAgICAvLyBbYm9ycm93ZXJfbmZ0LCBsZW5kZXJfbmZ0XSA9IHNlbGYuZGlzYnVyc2VfcHJpbmNpcGFsX2FuZF9taW50X2xvYW5fbmZ0cygKICAgIC8vICAgICBkZXRhaWxzLCBjb21wbGV0aW9uX2FyZ3MKICAgIC8vICkKICAgIGZyYW1lX2RpZyAtNAogICAgY2FsbHN1YiBkaXNidXJzZV9wcmluY2lwYWxfYW5kX21pbnRfbG9hbl9uZnRzCiAgICBmcmFtZV9idXJ5IC00CiAgICB1bmNvdmVyIDIKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjczNAogICAgLy8gZGV0YWlscy5wcmluY2lwYWxfcGFpZCA9IGE0LkJvb2woVHJ1ZSkgICMgbm9xYTogRkJUMDAzCiAgICBpbnQgNDEKICAgIGludCAxCiAgICBzZXRiaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjczNQogICAgLy8gZGV0YWlscy5jb21wbGV0ZWRfcGF5bWVudF9yb3VuZHMgPSBhNC5VSW50OCgwKQogICAgYnl0ZSAweDAwCiAgICByZXBsYWNlMiA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo3MzYKICAgIC8vIGRldGFpbHMuYm9ycm93ZXJfbmZ0X2Fzc2VyX2lkID0gYTQuVUludDY0KGJvcnJvd2VyX25mdC5pZCkKICAgIGRpZyAxCiAgICBpdG9iCiAgICBkdXAKICAgIGNvdmVyIDQKICAgIHJlcGxhY2UyIDcwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo3MzcKICAgIC8vIGRldGFpbHMubGVuZGVyX25mdF9hc3Nlcl9pZCA9IGE0LlVJbnQ2NChsZW5kZXJfbmZ0LmlkKQogICAgZGlnIDIKICAgIGl0b2IKICAgIGR1cAogICAgY292ZXIgMwogICAgcmVwbGFjZTIgNjIKICAgIGNvdmVyIDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjczOQogICAgLy8gc2V0X2xvYW5fcHJpbmNpcGFsX3BhaWQobG9hbl9rZXksIFRydWUpICAjIG5vcWE6IEZCVDAwMwogICAgZnJhbWVfZGlnIC01CiAgICBpbnQgMQogICAgY2FsbHN1YiBzZXRfbG9hbl9wcmluY2lwYWxfcGFpZAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NzQwCiAgICAvLyBzZXRfbG9hbl9jb21wbGV0ZWRfcGF5bWVudF9yb3VuZHMobG9hbl9rZXksIGFwLlVJbnQ2NCgwKSkKICAgIGZyYW1lX2RpZyAtNQogICAgaW50IDAKICAgIGNhbGxzdWIgc2V0X2xvYW5fY29tcGxldGVkX3BheW1lbnRfcm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo3NDEKICAgIC8vIHNldF9sb2FuX25mdF9hc3NldF9pZHMobG9hbl9rZXksIGxlbmRlcl9uZnQsIGJvcnJvd2VyX25mdCkKICAgIGZyYW1lX2RpZyAtNQogICAgdW5jb3ZlciAzCiAgICB1bmNvdmVyIDIKICAgIGNhbGxzdWIgc2V0X2xvYW5fbmZ0X2Fzc2V0X2lkcwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NzQzLTc0NwogICAgLy8gTG9hbkNvbXBsZXRlZCgKICAgIC8vICAgICBsb2FuX2tleT1SZWNvcmRLZXkuZnJvbV9ieXRlcyhsb2FuX2tleSksCiAgICAvLyAgICAgbGVuZGVyX25mdF9hc3NldF9pZD1hNC5VSW50NjQobGVuZGVyX25mdC5pZCksCiAgICAvLyAgICAgYm9ycm93ZXJfbmZ0X2Fzc2V0X2lkPWE0LlVJbnQ2NChib3Jyb3dlcl9uZnQuaWQpLAogICAgLy8gKQogICAgZnJhbWVfZGlnIC01CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NzQyLTc0OAogICAgLy8gYTQuZW1pdCgKICAgIC8vICAgICBMb2FuQ29tcGxldGVkKAogICAgLy8gICAgICAgICBsb2FuX2tleT1SZWNvcmRLZXkuZnJvbV9ieXRlcyhsb2FuX2tleSksCiAgICAvLyAgICAgICAgIGxlbmRlcl9uZnRfYXNzZXRfaWQ9YTQuVUludDY0KGxlbmRlcl9uZnQuaWQpLAogICAgLy8gICAgICAgICBib3Jyb3dlcl9uZnRfYXNzZXRfaWQ9YTQuVUludDY0KGJvcnJvd2VyX25mdC5pZCksCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgbWV0aG9kICJMb2FuQ29tcGxldGVkKGJ5dGVbOF0sdWludDY0LHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NzQ5CiAgICAvLyByZXR1cm4gZGV0YWlscwogICAgZnJhbWVfZGlnIC00CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfbG9hbi5jb250cmFjdC5aYWliYXRzdUxvYW4uZGlzYnVyc2VfcHJpbmNpcGFsX2FuZF9taW50X2xvYW5fbmZ0cyhkZXRhaWxzOiBieXRlcywgY29tcGxldGlvbl9hcmdzOiBieXRlcykgLT4gdWludDY0LCB1aW50NjQsIGJ5dGVzLCBieXRlczoKZGlzYnVyc2VfcHJpbmNpcGFsX2FuZF9taW50X2xvYW5fbmZ0czoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5Ojc1MS03NTQKICAgIC8vIEBhcC5zdWJyb3V0aW5lCiAgICAvLyBkZWYgZGlzYnVyc2VfcHJpbmNpcGFsX2FuZF9taW50X2xvYW5fbmZ0cygKICAgIC8vICAgICBzZWxmLCBkZXRhaWxzOiBMb2FuUmVjb3JkLCBjb21wbGV0aW9uX2FyZ3M6IENvbXBsZXRlTG9hbkFyZ3MKICAgIC8vICkgLT4gdHVwbGVbYXAuQXNzZXQsIGFwLkFzc2V0XToKICAgIHByb3RvIDIgNAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NzYyCiAgICAvLyB4ZmVyX2Fzc2V0PWRldGFpbHMucHJpbmNpcGFsX2Fzc2V0X2lkLm5hdGl2ZSwKICAgIGZyYW1lX2RpZyAtMgogICAgZXh0cmFjdCA2IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo3NjMKICAgIC8vIGFzc2V0X3JlY2VpdmVyPWRldGFpbHMuYm9ycm93ZXIubmF0aXZlLAogICAgZnJhbWVfZGlnIC0yCiAgICBleHRyYWN0IDc4IDMyIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NzY0CiAgICAvLyBhc3NldF9hbW91bnQ9ZGV0YWlscy5wcmluY2lwYWxfYXNzZXRfYW1vdW50Lm5hdGl2ZSwKICAgIGZyYW1lX2RpZyAtMgogICAgZXh0cmFjdCAzMCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NzY4CiAgICAvLyB1cmw9Y29tcGxldGlvbl9hcmdzLmJvcnJvd2VyX25mdF9pbWFnZV91cmwubmF0aXZlLAogICAgZnJhbWVfZGlnIC0xCiAgICBpbnQgNAogICAgZXh0cmFjdF91aW50MTYKICAgIGZyYW1lX2RpZyAtMQogICAgaW50IDYKICAgIGV4dHJhY3RfdWludDE2CiAgICBmcmFtZV9kaWcgLTEKICAgIGRpZyAyCiAgICBkaWcgMgogICAgc3Vic3RyaW5nMwogICAgZXh0cmFjdCAyIDAKICAgIGNvdmVyIDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5Ojc2OQogICAgLy8gdW5pdF9uYW1lPW9wLmNvbmNhdChiIkIiLCBjb21wbGV0aW9uX2FyZ3MubG9hbl91bml0X25hbWUuYnl0ZXMpLAogICAgZnJhbWVfZGlnIC0xCiAgICBpbnQgMAogICAgZXh0cmFjdF91aW50MTYKICAgIGZyYW1lX2RpZyAtMQogICAgaW50IDIKICAgIGV4dHJhY3RfdWludDE2CiAgICBmcmFtZV9kaWcgLTEKICAgIHVuY292ZXIgMgogICAgZGlnIDIKICAgIHN1YnN0cmluZzMKICAgIGJ5dGUgMHg0MgogICAgZGlnIDEKICAgIGNvbmNhdAogICAgY292ZXIgNAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NzcwCiAgICAvLyBhc3NldF9uYW1lPW9wLmNvbmNhdChiIiNCLSIsIGNvbXBsZXRpb25fYXJncy5sb2FuX3VuaXRfbmFtZS5ieXRlcyksCiAgICBieXRlIDB4MjM0MjJkCiAgICBkaWcgMQogICAgY29uY2F0CiAgICBjb3ZlciA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo3NzIKICAgIC8vIG1ldGFkYXRhX2hhc2g9Y29tcGxldGlvbl9hcmdzLmxvYW5faGFzaC5uYXRpdmUuYnl0ZXMsCiAgICBmcmFtZV9kaWcgLTEKICAgIGxlbgogICAgZnJhbWVfZGlnIC0xCiAgICB1bmNvdmVyIDQKICAgIHVuY292ZXIgMgogICAgc3Vic3RyaW5nMwogICAgZXh0cmFjdCAyIDAKICAgIGNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5Ojc3MwogICAgLy8gbWFuYWdlcj1vcC5HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5Ojc3NAogICAgLy8gcmVzZXJ2ZT1vcC5HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5Ojc3NQogICAgLy8gZnJlZXplPW9wLkdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgY292ZXIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6Nzc2CiAgICAvLyBjbGF3YmFjaz1vcC5HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5Ojc4MAogICAgLy8gdXJsPWNvbXBsZXRpb25fYXJncy5sZW5kZXJfbmZ0X2ltYWdlX3VybC5uYXRpdmUsCiAgICBmcmFtZV9kaWcgLTEKICAgIHVuY292ZXIgMwogICAgdW5jb3ZlciA4CiAgICBzdWJzdHJpbmczCiAgICBleHRyYWN0IDIgMAogICAgY292ZXIgNgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NzgxCiAgICAvLyB1bml0X25hbWU9b3AuY29uY2F0KGIiTCIsIGNvbXBsZXRpb25fYXJncy5sb2FuX3VuaXRfbmFtZS5ieXRlcyksCiAgICBieXRlIDB4NGMKICAgIGRpZyAyCiAgICBjb25jYXQKICAgIGNvdmVyIDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5Ojc4MgogICAgLy8gYXNzZXRfbmFtZT1vcC5jb25jYXQoYiIjTC0iLCBjb21wbGV0aW9uX2FyZ3MubG9hbl91bml0X25hbWUuYnl0ZXMpLAogICAgYnl0ZSAweDIzNGMyZAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIGNvdmVyIDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5Ojc4NC03ODYKICAgIC8vIFtfcHJpbmNpcGFsLCBib3Jyb3dlcl9uZnQsIGxlbmRlcl9uZnRdID0gYXAuaXR4bi5zdWJtaXRfdHhucygKICAgIC8vICAgICBwcmluY2lwYWxfdHhuLCBib3Jyb3dlcl9uZnRfdHhuLCBsZW5kZXJfbmZ0X3R4bgogICAgLy8gKQogICAgaXR4bl9iZWdpbgogICAgdW5jb3ZlciAxMAogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgdW5jb3ZlciAxMAogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICB1bmNvdmVyIDExCiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NzYwCiAgICAvLyBwcmluY2lwYWxfdHhuID0gYXAuaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgaW50IGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo3NjEKICAgIC8vIGZlZT0wLAogICAgaW50IDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo3ODUKICAgIC8vIHByaW5jaXBhbF90eG4sIGJvcnJvd2VyX25mdF90eG4sIGxlbmRlcl9uZnRfdHhuCiAgICBpdHhuX25leHQKICAgIGR1cAogICAgaXR4bl9maWVsZCBDb25maWdBc3NldENsYXdiYWNrCiAgICBkaWcgMQogICAgaXR4bl9maWVsZCBDb25maWdBc3NldEZyZWV6ZQogICAgZGlnIDIKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRSZXNlcnZlCiAgICBkaWcgMwogICAgaXR4bl9maWVsZCBDb25maWdBc3NldE1hbmFnZXIKICAgIGRpZyA0CiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0TWV0YWRhdGFIYXNoCiAgICB1bmNvdmVyIDgKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXROYW1lCiAgICB1bmNvdmVyIDgKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRVbml0TmFtZQogICAgdW5jb3ZlciA4CiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0VVJMCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo3NjcKICAgIC8vIHRvdGFsPTEsCiAgICBpbnQgMQogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFRvdGFsCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo3NjYKICAgIC8vIGJvcnJvd2VyX25mdF90eG4gPSBhcC5pdHhuLkFzc2V0Q29uZmlnKAogICAgaW50IGFjZmcKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5Ojc3MQogICAgLy8gZmVlPTAsCiAgICBpbnQgMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5Ojc4NQogICAgLy8gcHJpbmNpcGFsX3R4biwgYm9ycm93ZXJfbmZ0X3R4biwgbGVuZGVyX25mdF90eG4KICAgIGl0eG5fbmV4dAogICAgaXR4bl9maWVsZCBDb25maWdBc3NldENsYXdiYWNrCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0RnJlZXplCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0UmVzZXJ2ZQogICAgaXR4bl9maWVsZCBDb25maWdBc3NldE1hbmFnZXIKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRNZXRhZGF0YUhhc2gKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXROYW1lCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0VVJMCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0VW5pdE5hbWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5Ojc2NwogICAgLy8gdG90YWw9MSwKICAgIGludCAxCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0VG90YWwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5Ojc2NgogICAgLy8gYm9ycm93ZXJfbmZ0X3R4biA9IGFwLml0eG4uQXNzZXRDb25maWcoCiAgICBpbnQgYWNmZwogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NzcxCiAgICAvLyBmZWU9MCwKICAgIGludCAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6Nzg0LTc4NgogICAgLy8gW19wcmluY2lwYWwsIGJvcnJvd2VyX25mdCwgbGVuZGVyX25mdF0gPSBhcC5pdHhuLnN1Ym1pdF90eG5zKAogICAgLy8gICAgIHByaW5jaXBhbF90eG4sIGJvcnJvd2VyX25mdF90eG4sIGxlbmRlcl9uZnRfdHhuCiAgICAvLyApCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6Nzg1CiAgICAvLyBwcmluY2lwYWxfdHhuLCBib3Jyb3dlcl9uZnRfdHhuLCBsZW5kZXJfbmZ0X3R4bgogICAgZ2l0eG4gMSBDcmVhdGVkQXNzZXRJRAogICAgaXR4biBDcmVhdGVkQXNzZXRJRAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6Nzg3CiAgICAvLyByZXR1cm4gYm9ycm93ZXJfbmZ0LmNyZWF0ZWRfYXNzZXQsIGxlbmRlcl9uZnQuY3JlYXRlZF9hc3NldAogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgLTEKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLnN0b3JhZ2Uuc2V0X2xvYW5fcHJpbmNpcGFsX3BhaWQobG9hbl9rZXk6IGJ5dGVzLCBwYWlkOiB1aW50NjQpIC0+IHZvaWQ6CnNldF9sb2FuX3ByaW5jaXBhbF9wYWlkOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vc3RvcmFnZS5weToyMjEtMjIyCiAgICAvLyBAYXAuc3Vicm91dGluZQogICAgLy8gZGVmIHNldF9sb2FuX3ByaW5jaXBhbF9wYWlkKGxvYW5fa2V5OiBhcC5CeXRlcywgcGFpZDogYm9vbCkgLT4gTm9uZTogICMgbm9xYTogRkJUMDAxCiAgICBwcm90byAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL3N0b3JhZ2UucHk6MjIzCiAgICAvLyB3cml0ZV9mbGFnKGxvYW5fa2V5LCBhcC5VSW50NjQoUFJJTkNJUEFMX1BBSURfQklUKSwgcGFpZCkKICAgIGZyYW1lX2RpZyAtMgogICAgaW50IDEKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiB3cml0ZV9mbGFnCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfbG9hbi5zdG9yYWdlLndyaXRlX2ZsYWcobG9hbl9rZXk6IGJ5dGVzLCBiaXQ6IHVpbnQ2NCwgdmFsdWU6IHVpbnQ2NCkgLT4gdm9pZDoKd3JpdGVfZmxhZzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL3N0b3JhZ2UucHk6MTEzLTExNAogICAgLy8gQGFwLnN1YnJvdXRpbmUKICAgIC8vIGRlZiB3cml0ZV9mbGFnKGxvYW5fa2V5OiBhcC5CeXRlcywgYml0OiBhcC5VSW50NjQsIHZhbHVlOiBib29sKSAtPiBOb25lOiAgIyBub3FhOiBGQlQwMDEKICAgIHByb3RvIDMgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vc3RvcmFnZS5weToxMTUKICAgIC8vIHJlY29yZF9rZXkgPSBsb2FuX3JlY29yZF9rZXkobG9hbl9rZXkpCiAgICBmcmFtZV9kaWcgLTMKICAgIGNhbGxzdWIgbG9hbl9yZWNvcmRfa2V5CiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL3N0b3JhZ2UucHk6MTE2CiAgICAvLyBmbGFncyA9IG9wLkJveC5leHRyYWN0KHJlY29yZF9rZXksIFBBSURfRkxBR1MsIDEpCiAgICBpbnQgNQogICAgaW50IDEKICAgIGJveF9leHRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9zdG9yYWdlLnB5OjEyMAogICAgLy8gb3Auc2V0Yml0X2J5dGVzKGZsYWdzLCBiaXQsIGFwLlVJbnQ2NCgxKSBpZiB2YWx1ZSBlbHNlIGFwLlVJbnQ2NCgwKSksCiAgICBmcmFtZV9kaWcgLTEKICAgIGJ6IHdyaXRlX2ZsYWdfdGVybmFyeV9mYWxzZUAyCiAgICBpbnQgMQogICAgYiB3cml0ZV9mbGFnX3Rlcm5hcnlfbWVyZ2VAMwoKd3JpdGVfZmxhZ190ZXJuYXJ5X2ZhbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9zdG9yYWdlLnB5OjEyMAogICAgLy8gb3Auc2V0Yml0X2J5dGVzKGZsYWdzLCBiaXQsIGFwLlVJbnQ2NCgxKSBpZiB2YWx1ZSBlbHNlIGFwLlVJbnQ2NCgwKSksCiAgICBpbnQgMAoKd3JpdGVfZmxhZ190ZXJuYXJ5X21lcmdlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9zdG9yYWdlLnB5OjEyMAogICAgLy8gb3Auc2V0Yml0X2J5dGVzKGZsYWdzLCBiaXQsIGFwLlVJbnQ2NCgxKSBpZiB2YWx1ZSBlbHNlIGFwLlVJbnQ2NCgwKSksCiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfZGlnIC0yCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vc3RvcmFnZS5weToxMTctMTIxCiAgICAvLyBvcC5Cb3gucmVwbGFjZSgKICAgIC8vICAgICByZWNvcmRfa2V5LAogICAgLy8gICAgIFBBSURfRkxBR1MsCiAgICAvLyAgICAgb3Auc2V0Yml0X2J5dGVzKGZsYWdzLCBiaXQsIGFwLlVJbnQ2NCgxKSBpZiB2YWx1ZSBlbHNlIGFwLlVJbnQ2NCgwKSksCiAgICAvLyApCiAgICBmcmFtZV9kaWcgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vc3RvcmFnZS5weToxMTkKICAgIC8vIFBBSURfRkxBR1MsCiAgICBpbnQgNQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vc3RvcmFnZS5weToxMTctMTIxCiAgICAvLyBvcC5Cb3gucmVwbGFjZSgKICAgIC8vICAgICByZWNvcmRfa2V5LAogICAgLy8gICAgIFBBSURfRkxBR1MsCiAgICAvLyAgICAgb3Auc2V0Yml0X2J5dGVzKGZsYWdzLCBiaXQsIGFwLlVJbnQ2NCgxKSBpZiB2YWx1ZSBlbHNlIGFwLlVJbnQ2NCgwKSksCiAgICAvLyApCiAgICB1bmNvdmVyIDIKICAgIGJveF9yZXBsYWNlCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfbG9hbi5zdG9yYWdlLnNldF9sb2FuX2NvbXBsZXRlZF9wYXltZW50X3JvdW5kcyhsb2FuX2tleTogYnl0ZXMsIHJvdW5kczogdWludDY0KSAtPiB2b2lkOgpzZXRfbG9hbl9jb21wbGV0ZWRfcGF5bWVudF9yb3VuZHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9zdG9yYWdlLnB5OjIwMS0yMDIKICAgIC8vIEBhcC5zdWJyb3V0aW5lCiAgICAvLyBkZWYgc2V0X2xvYW5fY29tcGxldGVkX3BheW1lbnRfcm91bmRzKGxvYW5fa2V5OiBhcC5CeXRlcywgcm91bmRzOiBhcC5VSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL3N0b3JhZ2UucHk6MjAzCiAgICAvLyB3cml0ZV91aW50OChsb2FuX2tleSwgYXAuVUludDY0KENPTVBMRVRFRF9QQVlNRU5UX1JPVU5EUyksIHJvdW5kcykKICAgIGZyYW1lX2RpZyAtMgogICAgaW50IDQKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiB3cml0ZV91aW50OAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2xvYW4uc3RvcmFnZS53cml0ZV91aW50OChsb2FuX2tleTogYnl0ZXMsIG9mZnNldDogdWludDY0LCB2YWx1ZTogdWludDY0KSAtPiB2b2lkOgp3cml0ZV91aW50ODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL3N0b3JhZ2UucHk6MTAyLTEwMwogICAgLy8gQGFwLnN1YnJvdXRpbmUKICAgIC8vIGRlZiB3cml0ZV91aW50OChsb2FuX2tleTogYXAuQnl0ZXMsIG9mZnNldDogYXAuVUludDY0LCB2YWx1ZTogYXAuVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9zdG9yYWdlLnB5OjEwNAogICAgLy8gb3AuQm94LnJlcGxhY2UobG9hbl9yZWNvcmRfa2V5KGxvYW5fa2V5KSwgb2Zmc2V0LCBhNC5VSW50OCh2YWx1ZSkuYnl0ZXMpCiAgICBmcmFtZV9kaWcgLTMKICAgIGNhbGxzdWIgbG9hbl9yZWNvcmRfa2V5CiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIGV4dHJhY3QgNyAxCiAgICBmcmFtZV9kaWcgLTIKICAgIHN3YXAKICAgIGJveF9yZXBsYWNlCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfbG9hbi5zdG9yYWdlLnNldF9sb2FuX25mdF9hc3NldF9pZHMobG9hbl9rZXk6IGJ5dGVzLCBsZW5kZXJfbmZ0OiB1aW50NjQsIGJvcnJvd2VyX25mdDogdWludDY0KSAtPiB2b2lkOgpzZXRfbG9hbl9uZnRfYXNzZXRfaWRzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vc3RvcmFnZS5weToyNTMtMjU2CiAgICAvLyBAYXAuc3Vicm91dGluZQogICAgLy8gZGVmIHNldF9sb2FuX25mdF9hc3NldF9pZHMoCiAgICAvLyAgICAgbG9hbl9rZXk6IGFwLkJ5dGVzLCBsZW5kZXJfbmZ0OiBhcC5Bc3NldCwgYm9ycm93ZXJfbmZ0OiBhcC5Bc3NldAogICAgLy8gKSAtPiBOb25lOgogICAgcHJvdG8gMyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9zdG9yYWdlLnB5OjI1OAogICAgLy8gbG9hbl9yZWNvcmRfa2V5KGxvYW5fa2V5KSwKICAgIGZyYW1lX2RpZyAtMwogICAgY2FsbHN1YiBsb2FuX3JlY29yZF9rZXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL3N0b3JhZ2UucHk6MjYwCiAgICAvLyBvcC5jb25jYXQob3AuaXRvYihsZW5kZXJfbmZ0LmlkKSwgb3AuaXRvYihib3Jyb3dlcl9uZnQuaWQpKSwKICAgIGZyYW1lX2RpZyAtMgogICAgaXRvYgogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL3N0b3JhZ2UucHk6MjU5CiAgICAvLyBMRU5ERVJfTkZUX0FTU0VUX0lELAogICAgaW50IDYyCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9zdG9yYWdlLnB5OjI1Ny0yNjEKICAgIC8vIG9wLkJveC5yZXBsYWNlKAogICAgLy8gICAgIGxvYW5fcmVjb3JkX2tleShsb2FuX2tleSksCiAgICAvLyAgICAgTEVOREVSX05GVF9BU1NFVF9JRCwKICAgIC8vICAgICBvcC5jb25jYXQob3AuaXRvYihsZW5kZXJfbmZ0LmlkKSwgb3AuaXRvYihib3Jyb3dlcl9uZnQuaWQpKSwKICAgIC8vICkKICAgIHN3YXAKICAgIGJveF9yZXBsYWNlCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfbG9hbi5jb250cmFjdC5aYWliYXRzdUxvYW4uY29tcGxldGVfcDJwX2xvYW5fcHVyY2hhc2UobG9hbl9rZXk6IGJ5dGVzLCBjb21wbGV0aW9uX2FyZ3M6IGJ5dGVzLCBwcmluY2lwYWxfYXNzZXQ6IHVpbnQ2NCwgYm9ycm93ZXI6IGJ5dGVzLCB0eG46IHVpbnQ2NCkgLT4gYnl0ZXM6CmNvbXBsZXRlX3AycF9sb2FuX3B1cmNoYXNlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MTYxLTE2OQogICAgLy8gQGFwLmFyYzQuYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBjb21wbGV0ZV9wMnBfbG9hbl9wdXJjaGFzZSgKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIGxvYW5fa2V5OiBhcC5CeXRlcywKICAgIC8vICAgICBjb21wbGV0aW9uX2FyZ3M6IENvbXBsZXRlTG9hbkFyZ3MsCiAgICAvLyAgICAgcHJpbmNpcGFsX2Fzc2V0OiBhcC5Bc3NldCwKICAgIC8vICAgICBib3Jyb3dlcjogYXAuQWNjb3VudCwKICAgIC8vICAgICB0eG46IGd0eG4uQXNzZXRUcmFuc2ZlclRyYW5zYWN0aW9uLAogICAgLy8gKSAtPiBMb2FuUmVjb3JkOgogICAgcHJvdG8gNSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxNzAKICAgIC8vIHNlbGYuZW5zdXJlX2FwcF9yZWNpZXZlcih0eG4pCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgZW5zdXJlX2FwcF9yZWNpZXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MTcyCiAgICAvLyB0eG4ueGZlcl9hc3NldCA9PSBwcmluY2lwYWxfYXNzZXQKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgWGZlckFzc2V0CiAgICBmcmFtZV9kaWcgLTMKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxNzEtMTczCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHR4bi54ZmVyX2Fzc2V0ID09IHByaW5jaXBhbF9hc3NldAogICAgLy8gKSwgIlRoZSBhc3NldCBiZWluZyB0cmFuc2ZlcmVkIG11c3QgYmUgdGhlIHByaW5jaXBhbCBhc3NldCIKICAgIGFzc2VydCAvLyBUaGUgYXNzZXQgYmVpbmcgdHJhbnNmZXJlZCBtdXN0IGJlIHRoZSBwcmluY2lwYWwgYXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjE3NQogICAgLy8gdHhuLCBsb2FuX3ByaW5jaXBhbF9hc3NldF9hbW91bnQobG9hbl9rZXkpLCBhcC5VSW50NjQoMSkKICAgIGZyYW1lX2RpZyAtNQogICAgY2FsbHN1YiBsb2FuX3ByaW5jaXBhbF9hc3NldF9hbW91bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjE3NC0xNzYKICAgIC8vIHNlbGYuZW5zdXJlX3RyYW5zYWN0aW9uX2ZlZV9vbl9hbW91bnQoCiAgICAvLyAgICAgdHhuLCBsb2FuX3ByaW5jaXBhbF9hc3NldF9hbW91bnQobG9hbl9rZXkpLCBhcC5VSW50NjQoMSkKICAgIC8vICkKICAgIGZyYW1lX2RpZyAtMQogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MTc1CiAgICAvLyB0eG4sIGxvYW5fcHJpbmNpcGFsX2Fzc2V0X2Ftb3VudChsb2FuX2tleSksIGFwLlVJbnQ2NCgxKQogICAgaW50IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjE3NC0xNzYKICAgIC8vIHNlbGYuZW5zdXJlX3RyYW5zYWN0aW9uX2ZlZV9vbl9hbW91bnQoCiAgICAvLyAgICAgdHhuLCBsb2FuX3ByaW5jaXBhbF9hc3NldF9hbW91bnQobG9hbl9rZXkpLCBhcC5VSW50NjQoMSkKICAgIC8vICkKICAgIGNhbGxzdWIgZW5zdXJlX3RyYW5zYWN0aW9uX2ZlZV9vbl9hbW91bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjE3Ny0xODMKICAgIC8vIHJldHVybiBzZWxmLmNvbXBsZXRlX2xvYW5fcHVyY2hhc2UoCiAgICAvLyAgICAgbG9hbl9rZXksCiAgICAvLyAgICAgY29tcGxldGlvbl9hcmdzLAogICAgLy8gICAgIHByaW5jaXBhbF9hc3NldCwKICAgIC8vICAgICBib3Jyb3dlciwKICAgIC8vICAgICBpc19wMnA9VHJ1ZSwKICAgIC8vICkKICAgIGZyYW1lX2RpZyAtNQogICAgZnJhbWVfZGlnIC00CiAgICBmcmFtZV9kaWcgLTMKICAgIGZyYW1lX2RpZyAtMgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MTgyCiAgICAvLyBpc19wMnA9VHJ1ZSwKICAgIGludCAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxNzctMTgzCiAgICAvLyByZXR1cm4gc2VsZi5jb21wbGV0ZV9sb2FuX3B1cmNoYXNlKAogICAgLy8gICAgIGxvYW5fa2V5LAogICAgLy8gICAgIGNvbXBsZXRpb25fYXJncywKICAgIC8vICAgICBwcmluY2lwYWxfYXNzZXQsCiAgICAvLyAgICAgYm9ycm93ZXIsCiAgICAvLyAgICAgaXNfcDJwPVRydWUsCiAgICAvLyApCiAgICBjYWxsc3ViIGNvbXBsZXRlX2xvYW5fcHVyY2hhc2UKICAgIGZyYW1lX2J1cnkgLTQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLnN0b3JhZ2UubG9hbl9wcmluY2lwYWxfYXNzZXRfYW1vdW50KGxvYW5fa2V5OiBieXRlcykgLT4gdWludDY0Ogpsb2FuX3ByaW5jaXBhbF9hc3NldF9hbW91bnQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9zdG9yYWdlLnB5OjE3Ni0xNzcKICAgIC8vIEBhcC5zdWJyb3V0aW5lCiAgICAvLyBkZWYgbG9hbl9wcmluY2lwYWxfYXNzZXRfYW1vdW50KGxvYW5fa2V5OiBhcC5CeXRlcykgLT4gYXAuVUludDY0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9zdG9yYWdlLnB5OjE3OAogICAgLy8gcmV0dXJuIHJlYWRfdWludDY0KGxvYW5fa2V5LCBhcC5VSW50NjQoUFJJTkNJUEFMX0FTU0VUX0FNT1VOVCkpCiAgICBmcmFtZV9kaWcgLTEKICAgIGludCAzMAogICAgY2FsbHN1YiByZWFkX3VpbnQ2NAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2xvYW4uc3RvcmFnZS5yZWFkX3VpbnQ2NChsb2FuX2tleTogYnl0ZXMsIG9mZnNldDogdWludDY0KSAtPiB1aW50NjQ6CnJlYWRfdWludDY0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vc3RvcmFnZS5weTo4Ny04OAogICAgLy8gQGFwLnN1YnJvdXRpbmUKICAgIC8vIGRlZiByZWFkX3VpbnQ2NChsb2FuX2tleTogYXAuQnl0ZXMsIG9mZnNldDogYXAuVUludDY0KSAtPiBhcC5VSW50NjQ6CiAgICBwcm90byAyIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL3N0b3JhZ2UucHk6ODkKICAgIC8vIHJldHVybiBvcC5idG9pKG9wLkJveC5leHRyYWN0KGxvYW5fcmVjb3JkX2tleShsb2FuX2tleSksIG9mZnNldCwgOCkpCiAgICBmcmFtZV9kaWcgLTIKICAgIGNhbGxzdWIgbG9hbl9yZWNvcmRfa2V5CiAgICBmcmFtZV9kaWcgLTEKICAgIGludCA4CiAgICBib3hfZXh0cmFjdAogICAgYnRvaQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2Jhc2UuY29udHJhY3QuWmFpYmF0c3VCYXNlLmVuc3VyZV90cmFuc2FjdGlvbl9mZWVfb25fYW1vdW50KHR4bjogdWludDY0LCBhbW91bnQ6IHVpbnQ2NCwgbXVsdGlwbGVzOiB1aW50NjQpIC0+IHZvaWQ6CmVuc3VyZV90cmFuc2FjdGlvbl9mZWVfb25fYW1vdW50OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTU1LTE2MQogICAgLy8gQGFwLnN1YnJvdXRpbmUKICAgIC8vIGRlZiBlbnN1cmVfdHJhbnNhY3Rpb25fZmVlX29uX2Ftb3VudCgKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIHR4bjogZ3R4bi5Bc3NldFRyYW5zZmVyVHJhbnNhY3Rpb24sCiAgICAvLyAgICAgYW1vdW50OiBhcC5VSW50NjQsCiAgICAvLyAgICAgbXVsdGlwbGVzOiBhcC5VSW50NjQsCiAgICAvLyApIC0+IE5vbmU6CiAgICBwcm90byAzIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjE2MgogICAgLy8gYXNzZXJ0IHR4bi5hc3NldF9hbW91bnQgPj0gc2VsZi5jYWxjdWxhdGVfYW10X3BsdXNfZmVlKAogICAgZnJhbWVfZGlnIC0zCiAgICBndHhucyBBc3NldEFtb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTYyLTE2NAogICAgLy8gYXNzZXJ0IHR4bi5hc3NldF9hbW91bnQgPj0gc2VsZi5jYWxjdWxhdGVfYW10X3BsdXNfZmVlKAogICAgLy8gICAgIGFtb3VudCwgbXVsdGlwbGVzCiAgICAvLyApLCAiSW5zdWZmaWNpZW50IHR4biBhc3NldF9hbW91bnQhIEFtb3VudCBtdXN0IGJlIGVxdWFsIHRvIHByaW5jaXBhbF9hc3NldF9hbW91bnQgcGx1cyBmZWVzIgogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgY2FsY3VsYXRlX2FtdF9wbHVzX2ZlZQogICAgPj0KICAgIGFzc2VydCAvLyBJbnN1ZmZpY2llbnQgdHhuIGFzc2V0X2Ftb3VudCEgQW1vdW50IG11c3QgYmUgZXF1YWwgdG8gcHJpbmNpcGFsX2Fzc2V0X2Ftb3VudCBwbHVzIGZlZXMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLmNvbnRyYWN0LlphaWJhdHN1TG9hbi5pbml0aWF0ZV9sb2FuX3JlcGF5bWVudChsb2FuX2tleTogYnl0ZXMsIHR4bjogdWludDY0KSAtPiBieXRlczoKaW5pdGlhdGVfbG9hbl9yZXBheW1lbnQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxODUtMTkwCiAgICAvLyBAYXAuYXJjNC5hYmltZXRob2QoKQogICAgLy8gZGVmIGluaXRpYXRlX2xvYW5fcmVwYXltZW50KAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgbG9hbl9rZXk6IGFwLkJ5dGVzLAogICAgLy8gICAgIHR4bjogZ3R4bi5Bc3NldFRyYW5zZmVyVHJhbnNhY3Rpb24sCiAgICAvLyApIC0+IFJlY29yZEtleToKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MTkyCiAgICAvLyBzZWxmLmVuc3VyZV9hcHBfcmVjaWV2ZXIodHhuKQogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIGVuc3VyZV9hcHBfcmVjaWV2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjE5NAogICAgLy8gW2xvYW5fYnl0ZXMsIGV4aXN0c10gPSBvcC5Cb3guZ2V0KGxvYW5fcmVjb3JkX2tleShsb2FuX2tleSkpCiAgICBmcmFtZV9kaWcgLTIKICAgIGNhbGxzdWIgbG9hbl9yZWNvcmRfa2V5CiAgICBib3hfZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxOTUKICAgIC8vIGFzc2VydCBleGlzdHMsICJBIHJlY2NvcmQgd2l0aCB0aGUgbG9hbl9rZXkgcGFzc2VkIHdhcyBub3QgZm91bmQiCiAgICBhc3NlcnQgLy8gQSByZWNjb3JkIHdpdGggdGhlIGxvYW5fa2V5IHBhc3NlZCB3YXMgbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxOTgKICAgIC8vIHBheW1lbnRfYW1vdW50ID0gc2VsZi5jYWxjdWxhdGVfcm91bmRfcGF5bWVudF9hbW91bnQoZGV0YWlscykKICAgIGNhbGxzdWIgY2FsY3VsYXRlX3JvdW5kX3BheW1lbnRfYW1vdW50CiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjIwMAogICAgLy8gcmVwYXltZW50X2tleSA9IHNlbGYubmV4dF9yZWNvcmRfa2V5KCkKICAgIGNhbGxzdWIgbmV4dF9yZWNvcmRfa2V5CiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyMDMKICAgIC8vIHJlcGF5bWVudF9hbW91bnQ9YTQuVUludDY0KHBheW1lbnRfYW1vdW50KSwKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjIwMS0yMDYKICAgIC8vIHJvdW5kX3BheW1lbnQgPSBQZW5kaW5nTG9hblJvdW5kUGF5bWVudCgKICAgIC8vICAgICBsb2FuX2tleT1SZWNvcmRLZXkuZnJvbV9ieXRlcyhsb2FuX2tleSksCiAgICAvLyAgICAgcmVwYXltZW50X2Ftb3VudD1hNC5VSW50NjQocGF5bWVudF9hbW91bnQpLAogICAgLy8gICAgIHBlcmNlbnRhZ2VfcGFpZD1hNC5VSW50NjQoMCksCiAgICAvLyAgICAgcGFpZF9yZWNpcGllbnRzPWE0LlVJbnQ2NCgwKSwKICAgIC8vICkKICAgIGZyYW1lX2RpZyAtMgogICAgZGlnIDEKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MjA0CiAgICAvLyBwZXJjZW50YWdlX3BhaWQ9YTQuVUludDY0KDApLAogICAgYnl0ZSAweDAwMDAwMDAwMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjIwMS0yMDYKICAgIC8vIHJvdW5kX3BheW1lbnQgPSBQZW5kaW5nTG9hblJvdW5kUGF5bWVudCgKICAgIC8vICAgICBsb2FuX2tleT1SZWNvcmRLZXkuZnJvbV9ieXRlcyhsb2FuX2tleSksCiAgICAvLyAgICAgcmVwYXltZW50X2Ftb3VudD1hNC5VSW50NjQocGF5bWVudF9hbW91bnQpLAogICAgLy8gICAgIHBlcmNlbnRhZ2VfcGFpZD1hNC5VSW50NjQoMCksCiAgICAvLyAgICAgcGFpZF9yZWNpcGllbnRzPWE0LlVJbnQ2NCgwKSwKICAgIC8vICkKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MjA1CiAgICAvLyBwYWlkX3JlY2lwaWVudHM9YTQuVUludDY0KDApLAogICAgYnl0ZSAweDAwMDAwMDAwMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjIwMS0yMDYKICAgIC8vIHJvdW5kX3BheW1lbnQgPSBQZW5kaW5nTG9hblJvdW5kUGF5bWVudCgKICAgIC8vICAgICBsb2FuX2tleT1SZWNvcmRLZXkuZnJvbV9ieXRlcyhsb2FuX2tleSksCiAgICAvLyAgICAgcmVwYXltZW50X2Ftb3VudD1hNC5VSW50NjQocGF5bWVudF9hbW91bnQpLAogICAgLy8gICAgIHBlcmNlbnRhZ2VfcGFpZD1hNC5VSW50NjQoMCksCiAgICAvLyAgICAgcGFpZF9yZWNpcGllbnRzPWE0LlVJbnQ2NCgwKSwKICAgIC8vICkKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MjA3CiAgICAvLyBvcC5Cb3gucHV0KHJlcGF5bWVudF9yZWNvcmRfa2V5KHJlcGF5bWVudF9rZXkpLCByb3VuZF9wYXltZW50LmJ5dGVzKQogICAgZGlnIDIKICAgIGNhbGxzdWIgcmVwYXltZW50X3JlY29yZF9rZXkKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjIwOS0yMTMKICAgIC8vIFJlcGF5bWVudFJvdW5kSW5pdGlhdGVkKAogICAgLy8gICAgIGxvYW5fa2V5PVJlY29yZEtleS5mcm9tX2J5dGVzKGxvYW5fa2V5KSwKICAgIC8vICAgICByZXBheW1lbnRfa2V5PVJlY29yZEtleS5mcm9tX2J5dGVzKHJlcGF5bWVudF9rZXkpLAogICAgLy8gICAgIHJlcGF5bWVudF9hbW91bnQ9YTQuVUludDY0KHBheW1lbnRfYW1vdW50KSwKICAgIC8vICkKICAgIGZyYW1lX2RpZyAtMgogICAgZGlnIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyMDgtMjE0CiAgICAvLyBhNC5lbWl0KAogICAgLy8gICAgIFJlcGF5bWVudFJvdW5kSW5pdGlhdGVkKAogICAgLy8gICAgICAgICBsb2FuX2tleT1SZWNvcmRLZXkuZnJvbV9ieXRlcyhsb2FuX2tleSksCiAgICAvLyAgICAgICAgIHJlcGF5bWVudF9rZXk9UmVjb3JkS2V5LmZyb21fYnl0ZXMocmVwYXltZW50X2tleSksCiAgICAvLyAgICAgICAgIHJlcGF5bWVudF9hbW91bnQ9YTQuVUludDY0KHBheW1lbnRfYW1vdW50KSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBtZXRob2QgIlJlcGF5bWVudFJvdW5kSW5pdGlhdGVkKGJ5dGVbOF0sYnl0ZVs4XSx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjIxNQogICAgLy8gcmV0dXJuIFJlY29yZEtleS5mcm9tX2J5dGVzKHJlcGF5bWVudF9rZXkpCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfbG9hbi5jb250cmFjdC5aYWliYXRzdUxvYW4uY2FsY3VsYXRlX3JvdW5kX3BheW1lbnRfYW1vdW50KGxvYW46IGJ5dGVzKSAtPiB1aW50NjQsIGJ5dGVzOgpjYWxjdWxhdGVfcm91bmRfcGF5bWVudF9hbW91bnQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo4MzUtODM2CiAgICAvLyBAYXAuc3Vicm91dGluZQogICAgLy8gZGVmIGNhbGN1bGF0ZV9yb3VuZF9wYXltZW50X2Ftb3VudChzZWxmLCBsb2FuOiBMb2FuUmVjb3JkKSAtPiBhcC5VSW50NjQ6CiAgICBwcm90byAxIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjgzOAogICAgLy8gbG9hbi5wcmluY2lwYWxfYXNzZXRfYW1vdW50Lm5hdGl2ZSArIGxvYW4uaW50ZXJlc3RfYXNzZXRfYW1vdW50Lm5hdGl2ZQogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDMwIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgMjIgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5Ojg0MAogICAgLy8gcmV0dXJuIHByaW5jaXBhbF9wbHVzX2ludGVyZXN0IC8vIGxvYW4ucGF5bWVudF9yb3VuZHMubmF0aXZlCiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgMyAxIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnRvaQogICAgLwogICAgZnJhbWVfZGlnIC0xCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfbG9hbi5zdG9yYWdlLnJlcGF5bWVudF9yZWNvcmRfa2V5KHJlcGF5bWVudF9rZXk6IGJ5dGVzKSAtPiBieXRlczoKcmVwYXltZW50X3JlY29yZF9rZXk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9zdG9yYWdlLnB5Ojc2LTc3CiAgICAvLyBAYXAuc3Vicm91dGluZQogICAgLy8gZGVmIHJlcGF5bWVudF9yZWNvcmRfa2V5KHJlcGF5bWVudF9rZXk6IGFwLkJ5dGVzKSAtPiBhcC5CeXRlczoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vc3RvcmFnZS5weTo3OAogICAgLy8gcmV0dXJuIG9wLmNvbmNhdChSRVBBWU1FTlRfS0VZX1BSRUZJWCwgcmVwYXltZW50X2tleSkKICAgIGJ5dGUgMHg1MgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLmNvbnRyYWN0LlphaWJhdHN1TG9hbi5leGVjdXRlX2xvYW5fcmVwYXltZW50KHJlcGF5bWVudF9rZXk6IGJ5dGVzLCByZWNpcGllbnRfaW5kZXg6IHVpbnQ2NCwgcmVjaXBpZW50X2FjY291bnQ6IGJ5dGVzLCBwcmluY2lwYWxfYXNzZXQ6IHVpbnQ2NCkgLT4gYnl0ZXM6CmV4ZWN1dGVfbG9hbl9yZXBheW1lbnQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyMTctMjI0CiAgICAvLyBAYXAuYXJjNC5hYmltZXRob2QoKQogICAgLy8gZGVmIGV4ZWN1dGVfbG9hbl9yZXBheW1lbnQoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICByZXBheW1lbnRfa2V5OiBhcC5CeXRlcywKICAgIC8vICAgICByZWNpcGllbnRfaW5kZXg6IGFwLlVJbnQ2NCwKICAgIC8vICAgICByZWNpcGllbnRfYWNjb3VudDogYXAuQWNjb3VudCwKICAgIC8vICAgICBwcmluY2lwYWxfYXNzZXQ6IGFwLkFzc2V0LAogICAgLy8gKSAtPiBFeGVjdXRlTG9hblJlcGF5bWVudFJlc3BvbnNlOgogICAgcHJvdG8gNCAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyMjkKICAgIC8vIFtyZXBheW1lbnRfYnl0ZXMsIGV4aXN0c10gPSBvcC5Cb3guZ2V0KHJlcGF5bWVudF9yZWNvcmRfa2V5KHJlcGF5bWVudF9rZXkpKQogICAgZnJhbWVfZGlnIC00CiAgICBjYWxsc3ViIHJlcGF5bWVudF9yZWNvcmRfa2V5CiAgICBib3hfZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyMzAKICAgIC8vIGFzc2VydCBleGlzdHMsICJBIFBlbmRpbmdMb2FuUm91bmRQYXltZW50IHdpdGggdGhpcyByZXBheW1lbnRfa2V5IHdhcyBub3QgZm91bmQiCiAgICBhc3NlcnQgLy8gQSBQZW5kaW5nTG9hblJvdW5kUGF5bWVudCB3aXRoIHRoaXMgcmVwYXltZW50X2tleSB3YXMgbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyMzQKICAgIC8vIHJlcGF5bWVudC5sb2FuX2tleS5ieXRlcwogICAgZHVwCiAgICBleHRyYWN0IDAgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjIzMy0yMzUKICAgIC8vIGFzc2VydCBsb2FuX2V4aXN0cygKICAgIC8vICAgICByZXBheW1lbnQubG9hbl9rZXkuYnl0ZXMKICAgIC8vICksICJBIGxvYW4gd2l0aCB0aGlzIGtleSB3YXMgbm90IGZvdW5kIgogICAgZHVwCiAgICBjYWxsc3ViIGxvYW5fZXhpc3RzCiAgICBhc3NlcnQgLy8gQSBsb2FuIHdpdGggdGhpcyBrZXkgd2FzIG5vdCBmb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MjM2LTIzOAogICAgLy8gYXNzZXJ0IHByaW5jaXBhbF9hc3NldC5pZCA9PSBsb2FuX3ByaW5jaXBhbF9hc3NldF9pZCgKICAgIC8vICAgICByZXBheW1lbnQubG9hbl9rZXkuYnl0ZXMKICAgIC8vICksICJUaGUgcHJpbmNpcGFsX2Fzc2V0IHBhc3NlZCBpcyBpbnZhbGlkIgogICAgZHVwCiAgICBjYWxsc3ViIGxvYW5fcHJpbmNpcGFsX2Fzc2V0X2lkCiAgICBmcmFtZV9kaWcgLTEKICAgID09CiAgICBhc3NlcnQgLy8gVGhlIHByaW5jaXBhbF9hc3NldCBwYXNzZWQgaXMgaW52YWxpZAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MjQwCiAgICAvLyBwYXltZW50X3JlY2lwaWVudCA9IGxvYW5fcmVjaXBpZW50KHJlcGF5bWVudC5sb2FuX2tleS5ieXRlcywgcmVjaXBpZW50X2luZGV4KQogICAgZHVwCiAgICBmcmFtZV9kaWcgLTMKICAgIGNhbGxzdWIgbG9hbl9yZWNpcGllbnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjI0MgogICAgLy8gcGF5bWVudF9yZWNpcGllbnQucmVjaXBpZW50X2FkZHJlc3MubmF0aXZlID09IHJlY2lwaWVudF9hY2NvdW50CiAgICBkdXAKICAgIGV4dHJhY3QgOCAzMiAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgZnJhbWVfZGlnIC0yCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MjQxLTI0MwogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICBwYXltZW50X3JlY2lwaWVudC5yZWNpcGllbnRfYWRkcmVzcy5uYXRpdmUgPT0gcmVjaXBpZW50X2FjY291bnQKICAgIC8vICksICJUaGUgcmVjaXBpZW50X2FjY291bnQgZG9lcyBub3QgbWF0Y2ggdGhlIHBheW1lbnRfcmVjaXBpZW50IgogICAgYXNzZXJ0IC8vIFRoZSByZWNpcGllbnRfYWNjb3VudCBkb2VzIG5vdCBtYXRjaCB0aGUgcGF5bWVudF9yZWNpcGllbnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjI0NQogICAgLy8gcmVjaXBpZW50X2JpdCA9IGFwLlVJbnQ2NCgxKSA8PCByZWNpcGllbnRfaW5kZXgKICAgIGludCAxCiAgICBmcmFtZV9kaWcgLTMKICAgIHNobAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MjQ3CiAgICAvLyByZXBheW1lbnQucGFpZF9yZWNpcGllbnRzLm5hdGl2ZSAmIHJlY2lwaWVudF9iaXQKICAgIGRpZyA0CiAgICBleHRyYWN0IDI0IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICBkaWcgMQogICAgJgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MjQ2LTI0OAogICAgLy8gYXNzZXJ0IG5vdCAoCiAgICAvLyAgICAgcmVwYXltZW50LnBhaWRfcmVjaXBpZW50cy5uYXRpdmUgJiByZWNpcGllbnRfYml0CiAgICAvLyApLCAiVGhpcyBwYXltZW50X3JlY2lwaWVudCBoYXMgYWxyZWFkeSBiZWVuIHBhaWQiCiAgICAhCiAgICBhc3NlcnQgLy8gVGhpcyBwYXltZW50X3JlY2lwaWVudCBoYXMgYWxyZWFkeSBiZWVuIHBhaWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjI1MQogICAgLy8gcGF5bWVudF9yZWNpcGllbnQucGF5bWVudF9wZXJjZW50YWdlLm5hdGl2ZQogICAgdW5jb3ZlciAyCiAgICBleHRyYWN0IDAgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MjUyCiAgICAvLyArIHJlcGF5bWVudC5wZXJjZW50YWdlX3BhaWQubmF0aXZlCiAgICBkaWcgNQogICAgZXh0cmFjdCAxNiA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MjUxLTI1MgogICAgLy8gcGF5bWVudF9yZWNpcGllbnQucGF5bWVudF9wZXJjZW50YWdlLm5hdGl2ZQogICAgLy8gKyByZXBheW1lbnQucGVyY2VudGFnZV9wYWlkLm5hdGl2ZQogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MjUwLTI1MwogICAgLy8gbmV3X3BlcmNlbnRhZ2VfcGFpZCA9ICgKICAgIC8vICAgICBwYXltZW50X3JlY2lwaWVudC5wYXltZW50X3BlcmNlbnRhZ2UubmF0aXZlCiAgICAvLyAgICAgKyByZXBheW1lbnQucGVyY2VudGFnZV9wYWlkLm5hdGl2ZQogICAgLy8gKQogICAgY292ZXIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MjU2CiAgICAvLyByZXBheW1lbnQucmVwYXltZW50X2Ftb3VudCwKICAgIGRpZyA1CiAgICBleHRyYWN0IDggOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjI1NS0yNTgKICAgIC8vIHJlY2lwaWVudF9hbW91bnQgPSBzZWxmLnBlcmNlbnRhZ2UoCiAgICAvLyAgICAgcmVwYXltZW50LnJlcGF5bWVudF9hbW91bnQsCiAgICAvLyAgICAgcGF5bWVudF9yZWNpcGllbnQucGF5bWVudF9wZXJjZW50YWdlLAogICAgLy8gKQogICAgc3dhcAogICAgY2FsbHN1YiBwZXJjZW50YWdlCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyNjMKICAgIC8vIGFzc2V0X2Ftb3VudD1yZWNpcGllbnRfYW1vdW50Lm5hdGl2ZSwKICAgIGR1cAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MjY1CiAgICAvLyByZXBheW1lbnRfdHhuLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICBmcmFtZV9kaWcgLTIKICAgIGl0eG5fZmllbGQgQXNzZXRSZWNlaXZlcgogICAgZnJhbWVfZGlnIC0xCiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MjU5CiAgICAvLyByZXBheW1lbnRfdHhuID0gYXAuaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgaW50IGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyNjAKICAgIC8vIGZlZT0wLAogICAgaW50IDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyNjUKICAgIC8vIHJlcGF5bWVudF90eG4uc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyNjkKICAgIC8vIHJlY2lwaWVudF9pbmRleD1hNC5VSW50NjQocmVjaXBpZW50X2luZGV4KSwKICAgIGZyYW1lX2RpZyAtMwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MjY3LTI3MgogICAgLy8gUmVjaXBpZW50UGFpZCgKICAgIC8vICAgICBsb2FuX2tleT1yZXBheW1lbnQubG9hbl9rZXksCiAgICAvLyAgICAgcmVjaXBpZW50X2luZGV4PWE0LlVJbnQ2NChyZWNpcGllbnRfaW5kZXgpLAogICAgLy8gICAgIHJlY2lwaWVudD1wYXltZW50X3JlY2lwaWVudC5yZWNpcGllbnRfYWRkcmVzcywKICAgIC8vICAgICBhbW91bnQ9cmVjaXBpZW50X2Ftb3VudCwKICAgIC8vICkKICAgIHVuY292ZXIgNQogICAgc3dhcAogICAgY29uY2F0CiAgICB1bmNvdmVyIDQKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyNjYtMjczCiAgICAvLyBhNC5lbWl0KAogICAgLy8gICAgIFJlY2lwaWVudFBhaWQoCiAgICAvLyAgICAgICAgIGxvYW5fa2V5PXJlcGF5bWVudC5sb2FuX2tleSwKICAgIC8vICAgICAgICAgcmVjaXBpZW50X2luZGV4PWE0LlVJbnQ2NChyZWNpcGllbnRfaW5kZXgpLAogICAgLy8gICAgICAgICByZWNpcGllbnQ9cGF5bWVudF9yZWNpcGllbnQucmVjaXBpZW50X2FkZHJlc3MsCiAgICAvLyAgICAgICAgIGFtb3VudD1yZWNpcGllbnRfYW1vdW50LAogICAgLy8gICAgICkKICAgIC8vICkKICAgIG1ldGhvZCAiUmVjaXBpZW50UGFpZChieXRlWzhdLHVpbnQ2NCxhZGRyZXNzLHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6Mjc0CiAgICAvLyByZXBheW1lbnQucGVyY2VudGFnZV9wYWlkID0gYTQuVUludDY0KG5ld19wZXJjZW50YWdlX3BhaWQpCiAgICBkaWcgMQogICAgaXRvYgogICAgdW5jb3ZlciAzCiAgICBkaWcgMQogICAgcmVwbGFjZTIgMTYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjI3NgogICAgLy8gcmVwYXltZW50LnBhaWRfcmVjaXBpZW50cy5uYXRpdmUgfCByZWNpcGllbnRfYml0CiAgICBkdXAKICAgIGV4dHJhY3QgMjQgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgIHVuY292ZXIgMwogICAgfAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6Mjc1LTI3NwogICAgLy8gcmVwYXltZW50LnBhaWRfcmVjaXBpZW50cyA9IGE0LlVJbnQ2NCgKICAgIC8vICAgICByZXBheW1lbnQucGFpZF9yZWNpcGllbnRzLm5hdGl2ZSB8IHJlY2lwaWVudF9iaXQKICAgIC8vICkKICAgIGl0b2IKICAgIHJlcGxhY2UyIDI0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyNzkKICAgIC8vIG9wLkJveC5wdXQocmVwYXltZW50X3JlY29yZF9rZXkocmVwYXltZW50X2tleSksIHJlcGF5bWVudC5ieXRlcykKICAgIGZyYW1lX2RpZyAtNAogICAgY2FsbHN1YiByZXBheW1lbnRfcmVjb3JkX2tleQogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MjgxCiAgICAvLyBsb2FuX3JlcGF5bWVudF9jb21wbGV0ZT1hNC5Cb29sKG5ld19wZXJjZW50YWdlX3BhaWQgPT0gYXAuVUludDY0KDEwMDAwKSksCiAgICBzd2FwCiAgICBpbnQgMTAwMDAKICAgID09CiAgICBieXRlIDB4MDAKICAgIGludCAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MjgwLTI4MwogICAgLy8gcmVwYXltZW50X3Jlc3BvbnNlID0gRXhlY3V0ZUxvYW5SZXBheW1lbnRSZXNwb25zZSgKICAgIC8vICAgICBsb2FuX3JlcGF5bWVudF9jb21wbGV0ZT1hNC5Cb29sKG5ld19wZXJjZW50YWdlX3BhaWQgPT0gYXAuVUludDY0KDEwMDAwKSksCiAgICAvLyAgICAgcGVyY2VudGFnZV9wYWlkPWE0LlVJbnQ2NChuZXdfcGVyY2VudGFnZV9wYWlkKSwKICAgIC8vICkKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6Mjg0CiAgICAvLyByZXR1cm4gcmVwYXltZW50X3Jlc3BvbnNlCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfbG9hbi5zdG9yYWdlLmxvYW5fZXhpc3RzKGxvYW5fa2V5OiBieXRlcykgLT4gdWludDY0Ogpsb2FuX2V4aXN0czoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL3N0b3JhZ2UucHk6ODEtODIKICAgIC8vIEBhcC5zdWJyb3V0aW5lCiAgICAvLyBkZWYgbG9hbl9leGlzdHMobG9hbl9rZXk6IGFwLkJ5dGVzKSAtPiBib29sOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9zdG9yYWdlLnB5OjgzCiAgICAvLyBfbGVuZ3RoLCBleGlzdHMgPSBvcC5Cb3gubGVuZ3RoKGxvYW5fcmVjb3JkX2tleShsb2FuX2tleSkpCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgbG9hbl9yZWNvcmRfa2V5CiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL3N0b3JhZ2UucHk6ODQKICAgIC8vIHJldHVybiBleGlzdHMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLnN0b3JhZ2UubG9hbl9wcmluY2lwYWxfYXNzZXRfaWQobG9hbl9rZXk6IGJ5dGVzKSAtPiB1aW50NjQ6CmxvYW5fcHJpbmNpcGFsX2Fzc2V0X2lkOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vc3RvcmFnZS5weToxNjEtMTYyCiAgICAvLyBAYXAuc3Vicm91dGluZQogICAgLy8gZGVmIGxvYW5fcHJpbmNpcGFsX2Fzc2V0X2lkKGxvYW5fa2V5OiBhcC5CeXRlcykgLT4gYXAuVUludDY0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9zdG9yYWdlLnB5OjE2MwogICAgLy8gcmV0dXJuIHJlYWRfdWludDY0KGxvYW5fa2V5LCBhcC5VSW50NjQoUFJJTkNJUEFMX0FTU0VUX0lEKSkKICAgIGZyYW1lX2RpZyAtMQogICAgaW50IDYKICAgIGNhbGxzdWIgcmVhZF91aW50NjQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLnN0b3JhZ2UubG9hbl9yZWNpcGllbnQobG9hbl9rZXk6IGJ5dGVzLCBpbmRleDogdWludDY0KSAtPiBieXRlczoKbG9hbl9yZWNpcGllbnQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9zdG9yYWdlLnB5OjI3Ni0yNzcKICAgIC8vIEBhcC5zdWJyb3V0aW5lCiAgICAvLyBkZWYgbG9hbl9yZWNpcGllbnQobG9hbl9rZXk6IGFwLkJ5dGVzLCBpbmRleDogYXAuVUludDY0KSAtPiBQYXltZW50UmVjaWVwaWVudDoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vc3RvcmFnZS5weToyNzkKICAgIC8vIHJlY2lwaWVudHNfa2V5ID0gbG9hbl9yZWNpcGllbnRzX2tleShsb2FuX2tleSkKICAgIGZyYW1lX2RpZyAtMgogICAgY2FsbHN1YiBsb2FuX3JlY2lwaWVudHNfa2V5CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9zdG9yYWdlLnB5OjI4MQogICAgLy8gb3AuQm94LmV4dHJhY3QocmVjaXBpZW50c19rZXksIDAsIFJFQ0lQSUVOVFNfTEVOR1RIX1NJWkUpCiAgICBkdXAKICAgIGludCAwCiAgICBpbnQgMgogICAgYm94X2V4dHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL3N0b3JhZ2UucHk6MjgwLTI4MgogICAgLy8gcmVjaXBpZW50c19sZW5ndGggPSBvcC5idG9pKAogICAgLy8gICAgIG9wLkJveC5leHRyYWN0KHJlY2lwaWVudHNfa2V5LCAwLCBSRUNJUElFTlRTX0xFTkdUSF9TSVpFKQogICAgLy8gKQogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vc3RvcmFnZS5weToyODMKICAgIC8vIGFzc2VydCBpbmRleCA8IHJlY2lwaWVudHNfbGVuZ3RoLCAiVGhlIHJlY2lwaWVudF9pbmRleCBpcyBvdXQgb2YgcmFuZ2UiCiAgICBmcmFtZV9kaWcgLTEKICAgID4KICAgIGFzc2VydCAvLyBUaGUgcmVjaXBpZW50X2luZGV4IGlzIG91dCBvZiByYW5nZQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vc3RvcmFnZS5weToyODcKICAgIC8vIFJFQ0lQSUVOVFNfTEVOR1RIX1NJWkUgKyBpbmRleCAqIFJFQ0lQSUVOVF9TSVpFLAogICAgZnJhbWVfZGlnIC0xCiAgICBpbnQgNDAKICAgICoKICAgIGludCAyCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9zdG9yYWdlLnB5OjI4OAogICAgLy8gUkVDSVBJRU5UX1NJWkUsCiAgICBpbnQgNDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL3N0b3JhZ2UucHk6Mjg1LTI4OQogICAgLy8gb3AuQm94LmV4dHJhY3QoCiAgICAvLyAgICAgcmVjaXBpZW50c19rZXksCiAgICAvLyAgICAgUkVDSVBJRU5UU19MRU5HVEhfU0laRSArIGluZGV4ICogUkVDSVBJRU5UX1NJWkUsCiAgICAvLyAgICAgUkVDSVBJRU5UX1NJWkUsCiAgICAvLyApCiAgICBib3hfZXh0cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vc3RvcmFnZS5weToyODQtMjkwCiAgICAvLyByZXR1cm4gUGF5bWVudFJlY2llcGllbnQuZnJvbV9ieXRlcygKICAgIC8vICAgICBvcC5Cb3guZXh0cmFjdCgKICAgIC8vICAgICAgICAgcmVjaXBpZW50c19rZXksCiAgICAvLyAgICAgICAgIFJFQ0lQSUVOVFNfTEVOR1RIX1NJWkUgKyBpbmRleCAqIFJFQ0lQSUVOVF9TSVpFLAogICAgLy8gICAgICAgICBSRUNJUElFTlRfU0laRSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfYmFzZS5jb250cmFjdC5aYWliYXRzdUJhc2UucGVyY2VudGFnZShhbW91bnQ6IGJ5dGVzLCBwZXJjZW50OiBieXRlcykgLT4gYnl0ZXM6CnBlcmNlbnRhZ2U6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToyMTYtMjE3CiAgICAvLyBAYXAuc3Vicm91dGluZQogICAgLy8gZGVmIHBlcmNlbnRhZ2Uoc2VsZiwgYW1vdW50OiBhNC5VSW50NjQsIHBlcmNlbnQ6IGE0LlVJbnQ2NCkgLT4gYTQuVUludDY0OgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToyMTgKICAgIC8vIHJlc3VsdCA9IChwZXJjZW50Lm5hdGl2ZSAqIGFtb3VudC5uYXRpdmUpIC8vIGFwLlVJbnQ2NCgxMDApCiAgICBmcmFtZV9kaWcgLTEKICAgIGJ0b2kKICAgIGZyYW1lX2RpZyAtMgogICAgYnRvaQogICAgKgogICAgaW50IDEwMAogICAgLwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MjE5CiAgICAvLyByZXR1cm4gYTQuVUludDY0KHJlc3VsdCkKICAgIGl0b2IKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLmNvbnRyYWN0LlphaWJhdHN1TG9hbi5leGVjdXRlX2xvYW5fcmVwYXltZW50X2JhdGNoKHJlcGF5bWVudF9rZXk6IGJ5dGVzLCBwcmluY2lwYWxfYXNzZXQ6IHVpbnQ2NCkgLT4gYnl0ZXM6CmV4ZWN1dGVfbG9hbl9yZXBheW1lbnRfYmF0Y2g6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyODYtMjkxCiAgICAvLyBAYXAuYXJjNC5hYmltZXRob2QoKQogICAgLy8gZGVmIGV4ZWN1dGVfbG9hbl9yZXBheW1lbnRfYmF0Y2goCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICByZXBheW1lbnRfa2V5OiBhcC5CeXRlcywKICAgIC8vICAgICBwcmluY2lwYWxfYXNzZXQ6IGFwLkFzc2V0LAogICAgLy8gKSAtPiBFeGVjdXRlTG9hblJlcGF5bWVudFJlc3BvbnNlOgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyOTcKICAgIC8vIFtyZXBheW1lbnRfYnl0ZXMsIGV4aXN0c10gPSBvcC5Cb3guZ2V0KHJlcGF5bWVudF9yZWNvcmRfa2V5KHJlcGF5bWVudF9rZXkpKQogICAgZnJhbWVfZGlnIC0yCiAgICBjYWxsc3ViIHJlcGF5bWVudF9yZWNvcmRfa2V5CiAgICBib3hfZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToyOTgKICAgIC8vIGFzc2VydCBleGlzdHMsICJBIFBlbmRpbmdMb2FuUm91bmRQYXltZW50IHdpdGggdGhpcyByZXBheW1lbnRfa2V5IHdhcyBub3QgZm91bmQiCiAgICBhc3NlcnQgLy8gQSBQZW5kaW5nTG9hblJvdW5kUGF5bWVudCB3aXRoIHRoaXMgcmVwYXltZW50X2tleSB3YXMgbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTozMDIKICAgIC8vIHJlcGF5bWVudC5sb2FuX2tleS5ieXRlcwogICAgZHVwCiAgICBleHRyYWN0IDAgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjMwMS0zMDMKICAgIC8vIGFzc2VydCBsb2FuX2V4aXN0cygKICAgIC8vICAgICByZXBheW1lbnQubG9hbl9rZXkuYnl0ZXMKICAgIC8vICksICJBIGxvYW4gd2l0aCB0aGlzIGtleSB3YXMgbm90IGZvdW5kIgogICAgZHVwCiAgICBjYWxsc3ViIGxvYW5fZXhpc3RzCiAgICBhc3NlcnQgLy8gQSBsb2FuIHdpdGggdGhpcyBrZXkgd2FzIG5vdCBmb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MzA0LTMwNgogICAgLy8gYXNzZXJ0IHByaW5jaXBhbF9hc3NldC5pZCA9PSBsb2FuX3ByaW5jaXBhbF9hc3NldF9pZCgKICAgIC8vICAgICByZXBheW1lbnQubG9hbl9rZXkuYnl0ZXMKICAgIC8vICksICJUaGUgcHJpbmNpcGFsX2Fzc2V0IHBhc3NlZCBpcyBpbnZhbGlkIgogICAgZHVwCiAgICBjYWxsc3ViIGxvYW5fcHJpbmNpcGFsX2Fzc2V0X2lkCiAgICBmcmFtZV9kaWcgLTEKICAgID09CiAgICBhc3NlcnQgLy8gVGhlIHByaW5jaXBhbF9hc3NldCBwYXNzZWQgaXMgaW52YWxpZAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MzExCiAgICAvLyByZXBheW1lbnQucmVwYXltZW50X2Ftb3VudCwKICAgIGRpZyAxCiAgICBleHRyYWN0IDggOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjMxMgogICAgLy8gcmVwYXltZW50LnBhaWRfcmVjaXBpZW50cy5uYXRpdmUsCiAgICBkaWcgMgogICAgZXh0cmFjdCAyNCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MzA4LTMxMwogICAgLy8gW3BlcmNlbnRhZ2VfcGFpZCwgcGFpZF9yZWNpcGllbnRzXSA9IHNlbGYucGF5X2xvYW5fcmVjaXBpZW50cygKICAgIC8vICAgICByZXBheW1lbnQubG9hbl9rZXkuYnl0ZXMsCiAgICAvLyAgICAgcHJpbmNpcGFsX2Fzc2V0LAogICAgLy8gICAgIHJlcGF5bWVudC5yZXBheW1lbnRfYW1vdW50LAogICAgLy8gICAgIHJlcGF5bWVudC5wYWlkX3JlY2lwaWVudHMubmF0aXZlLAogICAgLy8gKQogICAgc3dhcAogICAgZnJhbWVfZGlnIC0xCiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgMwogICAgY2FsbHN1YiBwYXlfbG9hbl9yZWNpcGllbnRzCiAgICBjb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTozMTQKICAgIC8vIHBlcmNlbnRhZ2VfcGFpZCArPSByZXBheW1lbnQucGVyY2VudGFnZV9wYWlkLm5hdGl2ZQogICAgZGlnIDEKICAgIGV4dHJhY3QgMTYgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjMxNQogICAgLy8gcmVwYXltZW50LnBlcmNlbnRhZ2VfcGFpZCA9IGE0LlVJbnQ2NChwZXJjZW50YWdlX3BhaWQpCiAgICBkdXAKICAgIGl0b2IKICAgIHVuY292ZXIgMgogICAgZGlnIDEKICAgIHJlcGxhY2UyIDE2CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTozMTYKICAgIC8vIHJlcGF5bWVudC5wYWlkX3JlY2lwaWVudHMgPSBhNC5VSW50NjQocGFpZF9yZWNpcGllbnRzKQogICAgdW5jb3ZlciAzCiAgICBpdG9iCiAgICByZXBsYWNlMiAyNAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MzE4CiAgICAvLyBvcC5Cb3gucHV0KHJlcGF5bWVudF9yZWNvcmRfa2V5KHJlcGF5bWVudF9rZXkpLCByZXBheW1lbnQuYnl0ZXMpCiAgICBmcmFtZV9kaWcgLTIKICAgIGNhbGxzdWIgcmVwYXltZW50X3JlY29yZF9rZXkKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjMyMAogICAgLy8gbG9hbl9yZXBheW1lbnRfY29tcGxldGU9YTQuQm9vbChwZXJjZW50YWdlX3BhaWQgPT0gYXAuVUludDY0KDEwMDAwKSksCiAgICBzd2FwCiAgICBpbnQgMTAwMDAKICAgID09CiAgICBieXRlIDB4MDAKICAgIGludCAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MzE5LTMyMgogICAgLy8gcmV0dXJuIEV4ZWN1dGVMb2FuUmVwYXltZW50UmVzcG9uc2UoCiAgICAvLyAgICAgbG9hbl9yZXBheW1lbnRfY29tcGxldGU9YTQuQm9vbChwZXJjZW50YWdlX3BhaWQgPT0gYXAuVUludDY0KDEwMDAwKSksCiAgICAvLyAgICAgcGVyY2VudGFnZV9wYWlkPWE0LlVJbnQ2NChwZXJjZW50YWdlX3BhaWQpLAogICAgLy8gKQogICAgc3dhcAogICAgY29uY2F0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfbG9hbi5jb250cmFjdC5aYWliYXRzdUxvYW4ucGF5X2xvYW5fcmVjaXBpZW50cyhsb2FuX2tleTogYnl0ZXMsIHByaW5jaXBhbF9hc3NldDogdWludDY0LCByZXBheW1lbnRfYW1vdW50OiBieXRlcywgcGFpZF9yZWNpcGllbnRzOiB1aW50NjQpIC0+IHVpbnQ2NCwgdWludDY0OgpwYXlfbG9hbl9yZWNpcGllbnRzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NTk5LTYwOQogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjICAgU3Vicm91dGluZXMgICAgIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIwogICAgLy8gQGFwLnN1YnJvdXRpbmUKICAgIC8vIGRlZiBwYXlfbG9hbl9yZWNpcGllbnRzKAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgbG9hbl9rZXk6IGFwLkJ5dGVzLAogICAgLy8gICAgIHByaW5jaXBhbF9hc3NldDogYXAuQXNzZXQsCiAgICAvLyAgICAgcmVwYXltZW50X2Ftb3VudDogYTQuVUludDY0LAogICAgLy8gICAgIHBhaWRfcmVjaXBpZW50czogYXAuVUludDY0LAogICAgLy8gKSAtPiB0dXBsZVthcC5VSW50NjQsIGFwLlVJbnQ2NF06CiAgICBwcm90byA0IDIKICAgIGludCAwCiAgICBieXRlICIiCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo2MjAKICAgIC8vIHJlY2lwaWVudHMgPSBsb2FuX3JlY2lwaWVudHMobG9hbl9rZXkpCiAgICBmcmFtZV9kaWcgLTQKICAgIGNhbGxzdWIgbG9hbl9yZWNpcGllbnRzCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjYyMQogICAgLy8gcGVyY2VudGFnZV9wYWlkID0gYXAuVUludDY0KDApCiAgICBpbnQgMAogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NjIyCiAgICAvLyBhbW91bnRfcGFpZCA9IGFwLlVJbnQ2NCgwKQogICAgaW50IDAKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjYyMwogICAgLy8gZ3JvdXBfc2l6ZSA9IGFwLlVJbnQ2NCgwKQogICAgaW50IDAKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjYyNAogICAgLy8gZm9yIGluZGV4IGluIGFwLnVyYW5nZShyZWNpcGllbnRzLmxlbmd0aCk6CiAgICBpbnQgMAogICAgZXh0cmFjdF91aW50MTYKICAgIGludCAwCgpwYXlfbG9hbl9yZWNpcGllbnRzX2Zvcl9oZWFkZXJAMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjYyNAogICAgLy8gZm9yIGluZGV4IGluIGFwLnVyYW5nZShyZWNpcGllbnRzLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgNwogICAgZnJhbWVfZGlnIDYKICAgIDwKICAgIGJ6IHBheV9sb2FuX3JlY2lwaWVudHNfYWZ0ZXJfZm9yQDEyCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo2MjUKICAgIC8vIHJlY2lwaWVudF9iaXQgPSBhcC5VSW50NjQoMSkgPDwgaW5kZXgKICAgIGludCAxCiAgICBmcmFtZV9kaWcgNwogICAgc2hsCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NjI2CiAgICAvLyBpZiBwYWlkX3JlY2lwaWVudHMgJiByZWNpcGllbnRfYml0OgogICAgZnJhbWVfZGlnIC0xCiAgICAmCiAgICBibnogcGF5X2xvYW5fcmVjaXBpZW50c19mb3JfZm9vdGVyQDEwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo2MjkKICAgIC8vIHJlY2lwaWVudCA9IHJlY2lwaWVudHNbaW5kZXhdLmNvcHkoKQogICAgZnJhbWVfZGlnIDIKICAgIGV4dHJhY3QgMiAwCiAgICBmcmFtZV9kaWcgNwogICAgaW50IDQwCiAgICAqCiAgICBpbnQgNDAKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo2MzAKICAgIC8vIGlmIGdyb3VwX3NpemUgPT0gTUFYX0lOTkVSX0dST1VQX1NJWkU6CiAgICBmcmFtZV9kaWcgNQogICAgaW50IDE2CiAgICA9PQogICAgYnogcGF5X2xvYW5fcmVjaXBpZW50c19hZnRlcl9pZl9lbHNlQDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjYzMQogICAgLy8gb3AuSVR4bkNyZWF0ZS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjYzMgogICAgLy8gZ3JvdXBfc2l6ZSA9IGFwLlVJbnQ2NCgwKQogICAgaW50IDAKICAgIGZyYW1lX2J1cnkgNQoKcGF5X2xvYW5fcmVjaXBpZW50c19hZnRlcl9pZl9lbHNlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo2MzMKICAgIC8vIGlmIGdyb3VwX3NpemUgPT0gMDoKICAgIGZyYW1lX2RpZyA1CiAgICBibnogcGF5X2xvYW5fcmVjaXBpZW50c19lbHNlX2JvZHlAOAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NjM0CiAgICAvLyBvcC5JVHhuQ3JlYXRlLmJlZ2luKCkKICAgIGl0eG5fYmVnaW4KICAgIGIgcGF5X2xvYW5fcmVjaXBpZW50c19hZnRlcl9pZl9lbHNlQDkKCnBheV9sb2FuX3JlY2lwaWVudHNfZWxzZV9ib2R5QDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo2MzYKICAgIC8vIG9wLklUeG5DcmVhdGUubmV4dCgpCiAgICBpdHhuX25leHQKCnBheV9sb2FuX3JlY2lwaWVudHNfYWZ0ZXJfaWZfZWxzZUA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NjM3CiAgICAvLyBvcC5JVHhuQ3JlYXRlLnNldF90eXBlX2VudW0oYXAuVHJhbnNhY3Rpb25UeXBlLkFzc2V0VHJhbnNmZXIpCiAgICBpbnQgYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjYzOAogICAgLy8gb3AuSVR4bkNyZWF0ZS5zZXRfZmVlKDApCiAgICBpbnQgMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjYzOQogICAgLy8gb3AuSVR4bkNyZWF0ZS5zZXRfeGZlcl9hc3NldChwcmluY2lwYWxfYXNzZXQpCiAgICBmcmFtZV9kaWcgLTMKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo2NDAKICAgIC8vIG9wLklUeG5DcmVhdGUuc2V0X2Fzc2V0X3JlY2VpdmVyKHJlY2lwaWVudC5yZWNpcGllbnRfYWRkcmVzcy5uYXRpdmUpCiAgICBmcmFtZV9kaWcgMAogICAgZHVwCiAgICBleHRyYWN0IDggMzIgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjY0MQogICAgLy8gYW1vdW50ID0gc2VsZi5wZXJjZW50YWdlKHJlcGF5bWVudF9hbW91bnQsIHJlY2lwaWVudC5wYXltZW50X3BlcmNlbnRhZ2UpCiAgICBleHRyYWN0IDAgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGZyYW1lX2RpZyAtMgogICAgZGlnIDEKICAgIGNhbGxzdWIgcGVyY2VudGFnZQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NjQyCiAgICAvLyBvcC5JVHhuQ3JlYXRlLnNldF9hc3NldF9hbW91bnQoYW1vdW50Lm5hdGl2ZSkKICAgIGJ0b2kKICAgIGR1cAogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NjQzCiAgICAvLyBncm91cF9zaXplICs9IDEKICAgIGZyYW1lX2RpZyA1CiAgICBpbnQgMQogICAgKwogICAgZnJhbWVfYnVyeSA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo2NDQKICAgIC8vIHBhaWRfcmVjaXBpZW50cyB8PSByZWNpcGllbnRfYml0CiAgICBmcmFtZV9kaWcgLTEKICAgIGZyYW1lX2RpZyAxCiAgICB8CiAgICBmcmFtZV9idXJ5IC0xCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo2NDUKICAgIC8vIHBlcmNlbnRhZ2VfcGFpZCArPSByZWNpcGllbnQucGF5bWVudF9wZXJjZW50YWdlLm5hdGl2ZQogICAgc3dhcAogICAgYnRvaQogICAgZnJhbWVfZGlnIDMKICAgICsKICAgIGZyYW1lX2J1cnkgMwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NjQ2CiAgICAvLyBhbW91bnRfcGFpZCArPSBhbW91bnQubmF0aXZlCiAgICBmcmFtZV9kaWcgNAogICAgKwogICAgZnJhbWVfYnVyeSA0CgpwYXlfbG9hbl9yZWNpcGllbnRzX2Zvcl9mb290ZXJAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo2MjQKICAgIC8vIGZvciBpbmRleCBpbiBhcC51cmFuZ2UocmVjaXBpZW50cy5sZW5ndGgpOgogICAgZnJhbWVfZGlnIDcKICAgIGludCAxCiAgICArCiAgICBmcmFtZV9idXJ5IDcKICAgIGIgcGF5X2xvYW5fcmVjaXBpZW50c19mb3JfaGVhZGVyQDEKCnBheV9sb2FuX3JlY2lwaWVudHNfYWZ0ZXJfZm9yQDEyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NjQ4CiAgICAvLyBpZiBncm91cF9zaXplID4gMDoKICAgIGZyYW1lX2RpZyA1CiAgICBieiBwYXlfbG9hbl9yZWNpcGllbnRzX2FmdGVyX2lmX2Vsc2VAMTQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjY0OQogICAgLy8gb3AuSVR4bkNyZWF0ZS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjY1MwogICAgLy8gcGFpZF9yZWNpcGllbnRzPWE0LlVJbnQ2NChwYWlkX3JlY2lwaWVudHMpLAogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo2NTQKICAgIC8vIHBlcmNlbnRhZ2VfcGFpZD1hNC5VSW50NjQocGVyY2VudGFnZV9wYWlkKSwKICAgIGZyYW1lX2RpZyAzCiAgICBpdG9iCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo2NTUKICAgIC8vIGFtb3VudF9wYWlkPWE0LlVJbnQ2NChhbW91bnRfcGFpZCksCiAgICBmcmFtZV9kaWcgNAogICAgaXRvYgogICAgY292ZXIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NjUxLTY1NgogICAgLy8gUmVjaXBpZW50c1BhaWQoCiAgICAvLyAgICAgbG9hbl9rZXk9UmVjb3JkS2V5LmZyb21fYnl0ZXMobG9hbl9rZXkpLAogICAgLy8gICAgIHBhaWRfcmVjaXBpZW50cz1hNC5VSW50NjQocGFpZF9yZWNpcGllbnRzKSwKICAgIC8vICAgICBwZXJjZW50YWdlX3BhaWQ9YTQuVUludDY0KHBlcmNlbnRhZ2VfcGFpZCksCiAgICAvLyAgICAgYW1vdW50X3BhaWQ9YTQuVUludDY0KGFtb3VudF9wYWlkKSwKICAgIC8vICkKICAgIGZyYW1lX2RpZyAtNAogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NjUwLTY1NwogICAgLy8gYTQuZW1pdCgKICAgIC8vICAgICBSZWNpcGllbnRzUGFpZCgKICAgIC8vICAgICAgICAgbG9hbl9rZXk9UmVjb3JkS2V5LmZyb21fYnl0ZXMobG9hbl9rZXkpLAogICAgLy8gICAgICAgICBwYWlkX3JlY2lwaWVudHM9YTQuVUludDY0KHBhaWRfcmVjaXBpZW50cyksCiAgICAvLyAgICAgICAgIHBlcmNlbnRhZ2VfcGFpZD1hNC5VSW50NjQocGVyY2VudGFnZV9wYWlkKSwKICAgIC8vICAgICAgICAgYW1vdW50X3BhaWQ9YTQuVUludDY0KGFtb3VudF9wYWlkKSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBtZXRob2QgIlJlY2lwaWVudHNQYWlkKGJ5dGVbOF0sdWludDY0LHVpbnQ2NCx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKCnBheV9sb2FuX3JlY2lwaWVudHNfYWZ0ZXJfaWZfZWxzZUAxNDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjY1OAogICAgLy8gcmV0dXJuIHBlcmNlbnRhZ2VfcGFpZCwgcGFpZF9yZWNpcGllbnRzCiAgICBmcmFtZV9kaWcgMwogICAgZnJhbWVfZGlnIC0xCiAgICBmcmFtZV9idXJ5IDEKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2xvYW4uc3RvcmFnZS5sb2FuX3JlY2lwaWVudHMobG9hbl9rZXk6IGJ5dGVzKSAtPiBieXRlczoKbG9hbl9yZWNpcGllbnRzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vc3RvcmFnZS5weToyNjktMjcwCiAgICAvLyBAYXAuc3Vicm91dGluZQogICAgLy8gZGVmIGxvYW5fcmVjaXBpZW50cyhsb2FuX2tleTogYXAuQnl0ZXMpIC0+IFBheW1lbnRSZWNpZXBpZW50QXJyYXk6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL3N0b3JhZ2UucHk6MjcxCiAgICAvLyBbcmVjaXBpZW50c19ieXRlcywgZXhpc3RzXSA9IG9wLkJveC5nZXQobG9hbl9yZWNpcGllbnRzX2tleShsb2FuX2tleSkpCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgbG9hbl9yZWNpcGllbnRzX2tleQogICAgYm94X2dldAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vc3RvcmFnZS5weToyNzIKICAgIC8vIGFzc2VydCBleGlzdHMsICJUaGUgcGF5bWVudCByZWNpcGllbnRzIG9mIHRoaXMgbG9hbiB3ZXJlIG5vdCBmb3VuZCIKICAgIGFzc2VydCAvLyBUaGUgcGF5bWVudCByZWNpcGllbnRzIG9mIHRoaXMgbG9hbiB3ZXJlIG5vdCBmb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vc3RvcmFnZS5weToyNzMKICAgIC8vIHJldHVybiBQYXltZW50UmVjaWVwaWVudEFycmF5LmZyb21fYnl0ZXMocmVjaXBpZW50c19ieXRlcykKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLmNvbnRyYWN0LlphaWJhdHN1TG9hbi5jbGVhbl91cF9sb2FuX3JlcGF5bWVudChyZXBheW1lbnRfa2V5OiBieXRlcywgYm9ycm93ZXJfYWNjb3VudDogYnl0ZXMpIC0+IGJ5dGVzOgpjbGVhbl91cF9sb2FuX3JlcGF5bWVudDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjMyNC0zMjkKICAgIC8vIEBhcC5hcmM0LmFiaW1ldGhvZCgpCiAgICAvLyBkZWYgY2xlYW5fdXBfbG9hbl9yZXBheW1lbnQoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICByZXBheW1lbnRfa2V5OiBhcC5CeXRlcywKICAgIC8vICAgICBib3Jyb3dlcl9hY2NvdW50OiBhcC5BY2NvdW50LAogICAgLy8gKSAtPiBDbGVhblVwTG9hblJlcGF5bWVudFJlc3BvbnNlOgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTozMzAKICAgIC8vIGxvYW5fa2V5ID0gc2VsZi5wYWlkX3JlcGF5bWVudF9sb2FuX2tleShyZXBheW1lbnRfa2V5KQogICAgZnJhbWVfZGlnIC0yCiAgICBjYWxsc3ViIHBhaWRfcmVwYXltZW50X2xvYW5fa2V5CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTozMzEtMzMzCiAgICAvLyBhc3NlcnQgYm9ycm93ZXJfYWNjb3VudCA9PSBsb2FuX2JvcnJvd2VyKAogICAgLy8gICAgIGxvYW5fa2V5CiAgICAvLyApLCAiVGhlIGJvcnJvd2VyX2FjY291bnQgbXVzdCBiZSB0aGUgYm9ycm93ZXIgb2YgdGhlIGxvYW4iCiAgICBkdXAKICAgIGNhbGxzdWIgbG9hbl9ib3Jyb3dlcgogICAgZnJhbWVfZGlnIC0xCiAgICA9PQogICAgYXNzZXJ0IC8vIFRoZSBib3Jyb3dlcl9hY2NvdW50IG11c3QgYmUgdGhlIGJvcnJvd2VyIG9mIHRoZSBsb2FuCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTozMzUKICAgIC8vIGxvYW5fcmVwYXltZW50X2NvbXBsZXRlPXNlbGYuY2xvc2VfbG9hbl9yb3VuZChsb2FuX2tleSwgYm9ycm93ZXJfYWNjb3VudCkKICAgIGR1cAogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIGNsb3NlX2xvYW5fcm91bmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjMzOAogICAgLy8gc2VsZi5kZWxldGVfcmVwYXltZW50KHJlcGF5bWVudF9rZXksIGxvYW5fa2V5KQogICAgZnJhbWVfZGlnIC0yCiAgICB1bmNvdmVyIDIKICAgIGNhbGxzdWIgZGVsZXRlX3JlcGF5bWVudAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MzQwCiAgICAvLyByZXR1cm4gY2xlYW5fdXBfcmVzcG9uc2UKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLmNvbnRyYWN0LlphaWJhdHN1TG9hbi5wYWlkX3JlcGF5bWVudF9sb2FuX2tleShyZXBheW1lbnRfa2V5OiBieXRlcykgLT4gYnl0ZXM6CnBhaWRfcmVwYXltZW50X2xvYW5fa2V5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6OTU3LTk1OAogICAgLy8gQGFwLnN1YnJvdXRpbmUKICAgIC8vIGRlZiBwYWlkX3JlcGF5bWVudF9sb2FuX2tleShzZWxmLCByZXBheW1lbnRfa2V5OiBhcC5CeXRlcykgLT4gYXAuQnl0ZXM6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5Ojk2NAogICAgLy8gW3JlcGF5bWVudF9ieXRlcywgZXhpc3RzXSA9IG9wLkJveC5nZXQocmVwYXltZW50X3JlY29yZF9rZXkocmVwYXltZW50X2tleSkpCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgcmVwYXltZW50X3JlY29yZF9rZXkKICAgIGJveF9nZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5Ojk2NQogICAgLy8gYXNzZXJ0IGV4aXN0cywgIkEgUGVuZGluZ0xvYW5Sb3VuZFBheW1lbnQgd2l0aCB0aGlzIHJlcGF5bWVudF9rZXkgd2FzIG5vdCBmb3VuZCIKICAgIGFzc2VydCAvLyBBIFBlbmRpbmdMb2FuUm91bmRQYXltZW50IHdpdGggdGhpcyByZXBheW1lbnRfa2V5IHdhcyBub3QgZm91bmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5Ojk2NwogICAgLy8gYXNzZXJ0IHJlcGF5bWVudC5wZXJjZW50YWdlX3BhaWQgPT0gYXAuVUludDY0KAogICAgZHVwCiAgICBleHRyYWN0IDE2IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo5NjctOTY5CiAgICAvLyBhc3NlcnQgcmVwYXltZW50LnBlcmNlbnRhZ2VfcGFpZCA9PSBhcC5VSW50NjQoCiAgICAvLyAgICAgMTAwMDAKICAgIC8vICksICJFdmVyeSBwYXltZW50X3JlY2lwaWVudCBvZiB0aGUgcmVwYXltZW50IHJvdW5kIG11c3QgaGF2ZSBiZWVuIHBhaWQiCiAgICBpbnQgMTAwMDAKICAgIGl0b2IKICAgIGI9PQogICAgYXNzZXJ0IC8vIEV2ZXJ5IHBheW1lbnRfcmVjaXBpZW50IG9mIHRoZSByZXBheW1lbnQgcm91bmQgbXVzdCBoYXZlIGJlZW4gcGFpZAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6OTcwCiAgICAvLyBsb2FuX2tleSA9IHJlcGF5bWVudC5sb2FuX2tleS5ieXRlcwogICAgZXh0cmFjdCAwIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo5NzEKICAgIC8vIGFzc2VydCBsb2FuX2V4aXN0cyhsb2FuX2tleSksICJBIGxvYW4gd2l0aCB0aGlzIGtleSB3YXMgbm90IGZvdW5kIgogICAgZHVwCiAgICBjYWxsc3ViIGxvYW5fZXhpc3RzCiAgICBhc3NlcnQgLy8gQSBsb2FuIHdpdGggdGhpcyBrZXkgd2FzIG5vdCBmb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6OTcyCiAgICAvLyBhc3NlcnQgbm90IGxvYW5fcGF5bWVudF9kZWZhdWx0ZWQobG9hbl9rZXkpLCAiVGhlIGxvYW4gaGFzIGJlZW4gZGVmYXVsdGVkIgogICAgZHVwCiAgICBjYWxsc3ViIGxvYW5fcGF5bWVudF9kZWZhdWx0ZWQKICAgICEKICAgIGFzc2VydCAvLyBUaGUgbG9hbiBoYXMgYmVlbiBkZWZhdWx0ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5Ojk3MwogICAgLy8gcmV0dXJuIGxvYW5fa2V5CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfbG9hbi5zdG9yYWdlLmxvYW5fcGF5bWVudF9kZWZhdWx0ZWQobG9hbl9rZXk6IGJ5dGVzKSAtPiB1aW50NjQ6CmxvYW5fcGF5bWVudF9kZWZhdWx0ZWQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9zdG9yYWdlLnB5OjIyNi0yMjcKICAgIC8vIEBhcC5zdWJyb3V0aW5lCiAgICAvLyBkZWYgbG9hbl9wYXltZW50X2RlZmF1bHRlZChsb2FuX2tleTogYXAuQnl0ZXMpIC0+IGJvb2w6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL3N0b3JhZ2UucHk6MjI4CiAgICAvLyByZXR1cm4gcmVhZF9mbGFnKGxvYW5fa2V5LCBhcC5VSW50NjQoUEFZTUVOVF9ERUZBVUxURURfQklUKSkKICAgIGZyYW1lX2RpZyAtMQogICAgaW50IDIKICAgIGNhbGxzdWIgcmVhZF9mbGFnCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfbG9hbi5zdG9yYWdlLnJlYWRfZmxhZyhsb2FuX2tleTogYnl0ZXMsIGJpdDogdWludDY0KSAtPiB1aW50NjQ6CnJlYWRfZmxhZzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL3N0b3JhZ2UucHk6MTA3LTEwOAogICAgLy8gQGFwLnN1YnJvdXRpbmUKICAgIC8vIGRlZiByZWFkX2ZsYWcobG9hbl9rZXk6IGFwLkJ5dGVzLCBiaXQ6IGFwLlVJbnQ2NCkgLT4gYm9vbDoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vc3RvcmFnZS5weToxMDkKICAgIC8vIGZsYWdzID0gb3AuQm94LmV4dHJhY3QobG9hbl9yZWNvcmRfa2V5KGxvYW5fa2V5KSwgUEFJRF9GTEFHUywgMSkKICAgIGZyYW1lX2RpZyAtMgogICAgY2FsbHN1YiBsb2FuX3JlY29yZF9rZXkKICAgIGludCA1CiAgICBpbnQgMQogICAgYm94X2V4dHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL3N0b3JhZ2UucHk6MTEwCiAgICAvLyByZXR1cm4gb3AuZ2V0Yml0KGZsYWdzLCBiaXQpID09IDEKICAgIGZyYW1lX2RpZyAtMQogICAgZ2V0Yml0CiAgICBpbnQgMQogICAgPT0KICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLmNvbnRyYWN0LlphaWJhdHN1TG9hbi5jbG9zZV9sb2FuX3JvdW5kKGxvYW5fa2V5OiBieXRlcywgYm9ycm93ZXJfYWNjb3VudDogYnl0ZXMpIC0+IGJ5dGVzOgpjbG9zZV9sb2FuX3JvdW5kOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6OTg1LTk4OAogICAgLy8gQGFwLnN1YnJvdXRpbmUKICAgIC8vIGRlZiBjbG9zZV9sb2FuX3JvdW5kKAogICAgLy8gICAgIHNlbGYsIGxvYW5fa2V5OiBhcC5CeXRlcywgYm9ycm93ZXJfYWNjb3VudDogYXAuQWNjb3VudAogICAgLy8gKSAtPiBhNC5Cb29sOgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo5OTMKICAgIC8vIGNvbXBsZXRlZF9wYXltZW50X3JvdW5kcyA9IGxvYW5fY29tcGxldGVkX3BheW1lbnRfcm91bmRzKGxvYW5fa2V5KSArIDEKICAgIGZyYW1lX2RpZyAtMgogICAgY2FsbHN1YiBsb2FuX2NvbXBsZXRlZF9wYXltZW50X3JvdW5kcwogICAgaW50IDEKICAgICsKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6OTk0CiAgICAvLyBpZiBjb21wbGV0ZWRfcGF5bWVudF9yb3VuZHMgPT0gbG9hbl9wYXltZW50X3JvdW5kcyhsb2FuX2tleSk6CiAgICBmcmFtZV9kaWcgLTIKICAgIGNhbGxzdWIgbG9hbl9wYXltZW50X3JvdW5kcwogICAgPT0KICAgIGJ6IGNsb3NlX2xvYW5fcm91bmRfYWZ0ZXJfaWZfZWxzZUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo5OTcKICAgIC8vIHhmZXJfYXNzZXQ9bG9hbl9jb2xsYXRlcmFsX2Fzc2V0X2lkKGxvYW5fa2V5KSwKICAgIGZyYW1lX2RpZyAtMgogICAgY2FsbHN1YiBsb2FuX2NvbGxhdGVyYWxfYXNzZXRfaWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5Ojk5OQogICAgLy8gYXNzZXRfYW1vdW50PWxvYW5fY29sbGF0ZXJhbF9hc3NldF9hbW91bnQobG9hbl9rZXkpLAogICAgZnJhbWVfZGlnIC0yCiAgICBjYWxsc3ViIGxvYW5fY29sbGF0ZXJhbF9hc3NldF9hbW91bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjEwMDIKICAgIC8vIGNvbXBsZXRlX2xvYW5fcmVwYXltZXRfdHhuLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxMDAwCiAgICAvLyBub3RlPSJDb2xsYXRlcmFsIHJlcGF5bWVudCBvbiBjb21wbGV0ZWQgbG9hbiIsCiAgICBieXRlICJDb2xsYXRlcmFsIHJlcGF5bWVudCBvbiBjb21wbGV0ZWQgbG9hbiIKICAgIGl0eG5fZmllbGQgTm90ZQogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgZnJhbWVfZGlnIC0xCiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo5OTUKICAgIC8vIGNvbXBsZXRlX2xvYW5fcmVwYXltZXRfdHhuID0gYXAuaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgaW50IGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo5OTYKICAgIC8vIGZlZT0wLAogICAgaW50IDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxMDAyCiAgICAvLyBjb21wbGV0ZV9sb2FuX3JlcGF5bWV0X3R4bi5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjEwMDMKICAgIC8vIHNlbGYuZW1pdF9yb3VuZF9jbG9zZWQobG9hbl9rZXksIGNvbXBsZXRlZF9wYXltZW50X3JvdW5kcywgbG9hbl9yZXBhaWQ9VHJ1ZSkKICAgIGZyYW1lX2RpZyAtMgogICAgc3dhcAogICAgaW50IDEKICAgIGNhbGxzdWIgZW1pdF9yb3VuZF9jbG9zZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjEwMDQKICAgIC8vIHNlbGYucmVtb3ZlX2xvYW4obG9hbl9rZXkpCiAgICBmcmFtZV9kaWcgLTIKICAgIGNhbGxzdWIgcmVtb3ZlX2xvYW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjEwMDUKICAgIC8vIHJldHVybiBhNC5Cb29sKFRydWUpICAjIG5vcWE6IEZCVDAwMwogICAgYnl0ZSAweDgwCiAgICByZXRzdWIKCmNsb3NlX2xvYW5fcm91bmRfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MTAwNwogICAgLy8gc2V0X2xvYW5fY29tcGxldGVkX3BheW1lbnRfcm91bmRzKGxvYW5fa2V5LCBjb21wbGV0ZWRfcGF5bWVudF9yb3VuZHMpCiAgICBmcmFtZV9kaWcgLTIKICAgIGRpZyAxCiAgICBjYWxsc3ViIHNldF9sb2FuX2NvbXBsZXRlZF9wYXltZW50X3JvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MTAwOAogICAgLy8gc2VsZi5lbWl0X3JvdW5kX2Nsb3NlZChsb2FuX2tleSwgY29tcGxldGVkX3BheW1lbnRfcm91bmRzLCBsb2FuX3JlcGFpZD1GYWxzZSkKICAgIGZyYW1lX2RpZyAtMgogICAgc3dhcAogICAgaW50IDAKICAgIGNhbGxzdWIgZW1pdF9yb3VuZF9jbG9zZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjEwMDkKICAgIC8vIHJldHVybiBhNC5Cb29sKEZhbHNlKSAgIyBub3FhOiBGQlQwMDMKICAgIGJ5dGUgMHgwMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2xvYW4uc3RvcmFnZS5sb2FuX2NvbXBsZXRlZF9wYXltZW50X3JvdW5kcyhsb2FuX2tleTogYnl0ZXMpIC0+IHVpbnQ2NDoKbG9hbl9jb21wbGV0ZWRfcGF5bWVudF9yb3VuZHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9zdG9yYWdlLnB5OjE5Ni0xOTcKICAgIC8vIEBhcC5zdWJyb3V0aW5lCiAgICAvLyBkZWYgbG9hbl9jb21wbGV0ZWRfcGF5bWVudF9yb3VuZHMobG9hbl9rZXk6IGFwLkJ5dGVzKSAtPiBhcC5VSW50NjQ6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL3N0b3JhZ2UucHk6MTk4CiAgICAvLyByZXR1cm4gcmVhZF91aW50OChsb2FuX2tleSwgYXAuVUludDY0KENPTVBMRVRFRF9QQVlNRU5UX1JPVU5EUykpCiAgICBmcmFtZV9kaWcgLTEKICAgIGludCA0CiAgICBjYWxsc3ViIHJlYWRfdWludDgKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLnN0b3JhZ2UucmVhZF91aW50OChsb2FuX2tleTogYnl0ZXMsIG9mZnNldDogdWludDY0KSAtPiB1aW50NjQ6CnJlYWRfdWludDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9zdG9yYWdlLnB5Ojk3LTk4CiAgICAvLyBAYXAuc3Vicm91dGluZQogICAgLy8gZGVmIHJlYWRfdWludDgobG9hbl9rZXk6IGFwLkJ5dGVzLCBvZmZzZXQ6IGFwLlVJbnQ2NCkgLT4gYXAuVUludDY0OgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9zdG9yYWdlLnB5Ojk5CiAgICAvLyByZXR1cm4gb3AuYnRvaShvcC5Cb3guZXh0cmFjdChsb2FuX3JlY29yZF9rZXkobG9hbl9rZXkpLCBvZmZzZXQsIDEpKQogICAgZnJhbWVfZGlnIC0yCiAgICBjYWxsc3ViIGxvYW5fcmVjb3JkX2tleQogICAgZnJhbWVfZGlnIC0xCiAgICBpbnQgMQogICAgYm94X2V4dHJhY3QKICAgIGJ0b2kKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLnN0b3JhZ2UubG9hbl9wYXltZW50X3JvdW5kcyhsb2FuX2tleTogYnl0ZXMpIC0+IHVpbnQ2NDoKbG9hbl9wYXltZW50X3JvdW5kczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL3N0b3JhZ2UucHk6MTkxLTE5MgogICAgLy8gQGFwLnN1YnJvdXRpbmUKICAgIC8vIGRlZiBsb2FuX3BheW1lbnRfcm91bmRzKGxvYW5fa2V5OiBhcC5CeXRlcykgLT4gYXAuVUludDY0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9zdG9yYWdlLnB5OjE5MwogICAgLy8gcmV0dXJuIHJlYWRfdWludDgobG9hbl9rZXksIGFwLlVJbnQ2NChQQVlNRU5UX1JPVU5EUykpCiAgICBmcmFtZV9kaWcgLTEKICAgIGludCAzCiAgICBjYWxsc3ViIHJlYWRfdWludDgKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLnN0b3JhZ2UubG9hbl9jb2xsYXRlcmFsX2Fzc2V0X2lkKGxvYW5fa2V5OiBieXRlcykgLT4gdWludDY0Ogpsb2FuX2NvbGxhdGVyYWxfYXNzZXRfaWQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9zdG9yYWdlLnB5OjE2Ni0xNjcKICAgIC8vIEBhcC5zdWJyb3V0aW5lCiAgICAvLyBkZWYgbG9hbl9jb2xsYXRlcmFsX2Fzc2V0X2lkKGxvYW5fa2V5OiBhcC5CeXRlcykgLT4gYXAuVUludDY0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9zdG9yYWdlLnB5OjE2OAogICAgLy8gcmV0dXJuIHJlYWRfdWludDY0KGxvYW5fa2V5LCBhcC5VSW50NjQoQ09MTEFURVJBTF9BU1NFVF9JRCkpCiAgICBmcmFtZV9kaWcgLTEKICAgIGludCAxNAogICAgY2FsbHN1YiByZWFkX3VpbnQ2NAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2xvYW4uc3RvcmFnZS5sb2FuX2NvbGxhdGVyYWxfYXNzZXRfYW1vdW50KGxvYW5fa2V5OiBieXRlcykgLT4gdWludDY0Ogpsb2FuX2NvbGxhdGVyYWxfYXNzZXRfYW1vdW50OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vc3RvcmFnZS5weToxODEtMTgyCiAgICAvLyBAYXAuc3Vicm91dGluZQogICAgLy8gZGVmIGxvYW5fY29sbGF0ZXJhbF9hc3NldF9hbW91bnQobG9hbl9rZXk6IGFwLkJ5dGVzKSAtPiBhcC5VSW50NjQ6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL3N0b3JhZ2UucHk6MTgzCiAgICAvLyByZXR1cm4gcmVhZF91aW50NjQobG9hbl9rZXksIGFwLlVJbnQ2NChDT0xMQVRFUkFMX0FTU0VUX0FNT1VOVCkpCiAgICBmcmFtZV9kaWcgLTEKICAgIGludCAzOAogICAgY2FsbHN1YiByZWFkX3VpbnQ2NAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2xvYW4uY29udHJhY3QuWmFpYmF0c3VMb2FuLmVtaXRfcm91bmRfY2xvc2VkKGxvYW5fa2V5OiBieXRlcywgY29tcGxldGVkX3BheW1lbnRfcm91bmRzOiB1aW50NjQsIGxvYW5fcmVwYWlkOiB1aW50NjQpIC0+IHZvaWQ6CmVtaXRfcm91bmRfY2xvc2VkOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MTAxMS0xMDE3CiAgICAvLyBAYXAuc3Vicm91dGluZQogICAgLy8gZGVmIGVtaXRfcm91bmRfY2xvc2VkKAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgbG9hbl9rZXk6IGFwLkJ5dGVzLAogICAgLy8gICAgIGNvbXBsZXRlZF9wYXltZW50X3JvdW5kczogYXAuVUludDY0LAogICAgLy8gICAgIGxvYW5fcmVwYWlkOiBib29sLCAgIyBub3FhOiBGQlQwMDEKICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDMgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MTAyMQogICAgLy8gY29tcGxldGVkX3BheW1lbnRfcm91bmRzPWE0LlVJbnQ4KGNvbXBsZXRlZF9wYXltZW50X3JvdW5kcyksCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0b2IKICAgIGV4dHJhY3QgNyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxMDIyCiAgICAvLyBsb2FuX3JlcGFpZD1hNC5Cb29sKGxvYW5fcmVwYWlkKSwKICAgIGJ5dGUgMHgwMAogICAgaW50IDAKICAgIGZyYW1lX2RpZyAtMQogICAgc2V0Yml0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weToxMDE5LTEwMjMKICAgIC8vIFJvdW5kQ2xvc2VkKAogICAgLy8gICAgIGxvYW5fa2V5PVJlY29yZEtleS5mcm9tX2J5dGVzKGxvYW5fa2V5KSwKICAgIC8vICAgICBjb21wbGV0ZWRfcGF5bWVudF9yb3VuZHM9YTQuVUludDgoY29tcGxldGVkX3BheW1lbnRfcm91bmRzKSwKICAgIC8vICAgICBsb2FuX3JlcGFpZD1hNC5Cb29sKGxvYW5fcmVwYWlkKSwKICAgIC8vICkKICAgIGZyYW1lX2RpZyAtMwogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MTAxOC0xMDI0CiAgICAvLyBhNC5lbWl0KAogICAgLy8gICAgIFJvdW5kQ2xvc2VkKAogICAgLy8gICAgICAgICBsb2FuX2tleT1SZWNvcmRLZXkuZnJvbV9ieXRlcyhsb2FuX2tleSksCiAgICAvLyAgICAgICAgIGNvbXBsZXRlZF9wYXltZW50X3JvdW5kcz1hNC5VSW50OChjb21wbGV0ZWRfcGF5bWVudF9yb3VuZHMpLAogICAgLy8gICAgICAgICBsb2FuX3JlcGFpZD1hNC5Cb29sKGxvYW5fcmVwYWlkKSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBtZXRob2QgIlJvdW5kQ2xvc2VkKGJ5dGVbOF0sdWludDgsYm9vbCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2xvYW4uY29udHJhY3QuWmFpYmF0c3VMb2FuLnJlbW92ZV9sb2FuKGxvYW5fa2V5OiBieXRlcykgLT4gdm9pZDoKcmVtb3ZlX2xvYW46CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo5MjMtOTI0CiAgICAvLyBAYXAuc3Vicm91dGluZQogICAgLy8gZGVmIHJlbW92ZV9sb2FuKHNlbGYsIGxvYW5fa2V5OiBhcC5CeXRlcykgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6OTI2CiAgICAvLyBjb3VudCA9IGFjdGl2ZV9sb2FuX2NvdW50KCkKICAgIGNhbGxzdWIgYWN0aXZlX2xvYW5fY291bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjkyNwogICAgLy8gcmVtb3ZlX2FjdGl2ZV9sb2FuKGxvYW5fa2V5LCBjb3VudCkKICAgIGZyYW1lX2RpZyAtMQogICAgZGlnIDEKICAgIGNhbGxzdWIgcmVtb3ZlX2FjdGl2ZV9sb2FuCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo5MjgKICAgIC8vIHNldF9hY3RpdmVfbG9hbl9jb3VudChjb3VudCAtIDEpCiAgICBpbnQgMQogICAgLQogICAgY2FsbHN1YiBzZXRfYWN0aXZlX2xvYW5fY291bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjkyOQogICAgLy8gcmVtb3ZlX2JvcnJvd2VyX2xvYW4obG9hbl9ib3Jyb3dlcihsb2FuX2tleSksIGxvYW5fa2V5KQogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIGxvYW5fYm9ycm93ZXIKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiByZW1vdmVfYm9ycm93ZXJfbG9hbgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6OTMwCiAgICAvLyBkZWxldGVfbG9hbl9ib3hlcyhsb2FuX2tleSkKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBkZWxldGVfbG9hbl9ib3hlcwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6OTMxCiAgICAvLyBhNC5lbWl0KExvYW5EZWxldGVkKGxvYW5fa2V5PVJlY29yZEtleS5mcm9tX2J5dGVzKGxvYW5fa2V5KSkpCiAgICBtZXRob2QgIkxvYW5EZWxldGVkKGJ5dGVbOF0pIgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGxvZwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2xvYW4uYWN0aXZlX2xvYW5zLnJlbW92ZV9hY3RpdmVfbG9hbihsb2FuX2tleTogYnl0ZXMsIGFjdGl2ZV9sb2FuX2NvdW50OiB1aW50NjQpIC0+IHZvaWQ6CnJlbW92ZV9hY3RpdmVfbG9hbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2FjdGl2ZV9sb2Fucy5weTo3MC03MQogICAgLy8gQGFwLnN1YnJvdXRpbmUKICAgIC8vIGRlZiByZW1vdmVfYWN0aXZlX2xvYW4obG9hbl9rZXk6IGFwLkJ5dGVzLCBhY3RpdmVfbG9hbl9jb3VudDogYXAuVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9hY3RpdmVfbG9hbnMucHk6NzkKICAgIC8vIHBvc2l0aW9uID0gbG9hbl9hY3RpdmVfcG9zaXRpb24obG9hbl9rZXkpCiAgICBmcmFtZV9kaWcgLTIKICAgIGNhbGxzdWIgbG9hbl9hY3RpdmVfcG9zaXRpb24KICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vYWN0aXZlX2xvYW5zLnB5OjgwCiAgICAvLyBsYXN0X3Bvc2l0aW9uID0gYWN0aXZlX2xvYW5fY291bnQgLSAxCiAgICBmcmFtZV9kaWcgLTEKICAgIGludCAxCiAgICAtCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2FjdGl2ZV9sb2Fucy5weTo4MQogICAgLy8gaWYgcG9zaXRpb24gIT0gbGFzdF9wb3NpdGlvbjoKICAgICE9CiAgICBieiByZW1vdmVfYWN0aXZlX2xvYW5fYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9hY3RpdmVfbG9hbnMucHk6ODIKICAgIC8vIGxhc3RfbG9hbl9rZXkgPSByZWFkX2FjdGl2ZV9sb2FuKGxhc3RfcG9zaXRpb24pCiAgICBmcmFtZV9kaWcgMQogICAgY2FsbHN1YiByZWFkX2FjdGl2ZV9sb2FuCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9hY3RpdmVfbG9hbnMucHk6ODMKICAgIC8vIHdyaXRlX2FjdGl2ZV9sb2FuKHBvc2l0aW9uLCBsYXN0X2xvYW5fa2V5KQogICAgZnJhbWVfZGlnIDAKICAgIGR1cAogICAgY292ZXIgMgogICAgZGlnIDEKICAgIGNhbGxzdWIgd3JpdGVfYWN0aXZlX2xvYW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2FjdGl2ZV9sb2Fucy5weTo4NAogICAgLy8gc2V0X2xvYW5fYWN0aXZlX3Bvc2l0aW9uKGxhc3RfbG9hbl9rZXksIHBvc2l0aW9uKQogICAgc3dhcAogICAgY2FsbHN1YiBzZXRfbG9hbl9hY3RpdmVfcG9zaXRpb24KCnJlbW92ZV9hY3RpdmVfbG9hbl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9hY3RpdmVfbG9hbnMucHk6ODYKICAgIC8vIGlmIGxhc3RfcG9zaXRpb24gJSBBQ1RJVkVfTE9BTlNfUEVSX1BBR0UgPT0gMDoKICAgIGZyYW1lX2RpZyAxCiAgICBpbnQgMTI4CiAgICAlCiAgICBibnogcmVtb3ZlX2FjdGl2ZV9sb2FuX2Vsc2VfYm9keUA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9hY3RpdmVfbG9hbnMucHk6ODcKICAgIC8vIG9wLkJveC5kZWxldGUoYWN0aXZlX2xvYW5zX3BhZ2Vfa2V5KGxhc3RfcG9zaXRpb24pKQogICAgZnJhbWVfZGlnIDEKICAgIGNhbGxzdWIgYWN0aXZlX2xvYW5zX3BhZ2Vfa2V5CiAgICBib3hfZGVsCiAgICBwb3AKICAgIGIgcmVtb3ZlX2FjdGl2ZV9sb2FuX2FmdGVyX2lmX2Vsc2VANQoKcmVtb3ZlX2FjdGl2ZV9sb2FuX2Vsc2VfYm9keUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vYWN0aXZlX2xvYW5zLnB5OjkwCiAgICAvLyBhY3RpdmVfbG9hbnNfcGFnZV9rZXkobGFzdF9wb3NpdGlvbiksCiAgICBmcmFtZV9kaWcgMQogICAgZHVwCiAgICBjYWxsc3ViIGFjdGl2ZV9sb2Fuc19wYWdlX2tleQogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vYWN0aXZlX2xvYW5zLnB5OjkxCiAgICAvLyBhY3RpdmVfbG9hbl9zbG90X29mZnNldChsYXN0X3Bvc2l0aW9uKSwKICAgIGNhbGxzdWIgYWN0aXZlX2xvYW5fc2xvdF9vZmZzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2FjdGl2ZV9sb2Fucy5weTo5MgogICAgLy8gb3AuYnplcm8oUkVDT1JEX0tFWV9TSVpFKSwKICAgIGludCA4CiAgICBiemVybwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vYWN0aXZlX2xvYW5zLnB5Ojg5LTkzCiAgICAvLyBvcC5Cb3gucmVwbGFjZSgKICAgIC8vICAgICBhY3RpdmVfbG9hbnNfcGFnZV9rZXkobGFzdF9wb3NpdGlvbiksCiAgICAvLyAgICAgYWN0aXZlX2xvYW5fc2xvdF9vZmZzZXQobGFzdF9wb3NpdGlvbiksCiAgICAvLyAgICAgb3AuYnplcm8oUkVDT1JEX0tFWV9TSVpFKSwKICAgIC8vICkKICAgIGJveF9yZXBsYWNlCgpyZW1vdmVfYWN0aXZlX2xvYW5fYWZ0ZXJfaWZfZWxzZUA1OgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2xvYW4uc3RvcmFnZS5sb2FuX2FjdGl2ZV9wb3NpdGlvbihsb2FuX2tleTogYnl0ZXMpIC0+IHVpbnQ2NDoKbG9hbl9hY3RpdmVfcG9zaXRpb246CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9zdG9yYWdlLnB5OjI0My0yNDQKICAgIC8vIEBhcC5zdWJyb3V0aW5lCiAgICAvLyBkZWYgbG9hbl9hY3RpdmVfcG9zaXRpb24obG9hbl9rZXk6IGFwLkJ5dGVzKSAtPiBhcC5VSW50NjQ6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL3N0b3JhZ2UucHk6MjQ1CiAgICAvLyByZXR1cm4gcmVhZF91aW50NjQobG9hbl9rZXksIGFwLlVJbnQ2NChBQ1RJVkVfTE9BTl9QT1NJVElPTikpCiAgICBmcmFtZV9kaWcgLTEKICAgIGludCAxMTAKICAgIGNhbGxzdWIgcmVhZF91aW50NjQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLmFjdGl2ZV9sb2Fucy5yZWFkX2FjdGl2ZV9sb2FuKHBvc2l0aW9uOiB1aW50NjQpIC0+IGJ5dGVzOgpyZWFkX2FjdGl2ZV9sb2FuOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vYWN0aXZlX2xvYW5zLnB5OjM4LTM5CiAgICAvLyBAYXAuc3Vicm91dGluZQogICAgLy8gZGVmIHJlYWRfYWN0aXZlX2xvYW4ocG9zaXRpb246IGFwLlVJbnQ2NCkgLT4gYXAuQnl0ZXM6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2FjdGl2ZV9sb2Fucy5weTo0MQogICAgLy8gYWN0aXZlX2xvYW5zX3BhZ2Vfa2V5KHBvc2l0aW9uKSwKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBhY3RpdmVfbG9hbnNfcGFnZV9rZXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2FjdGl2ZV9sb2Fucy5weTo0MgogICAgLy8gYWN0aXZlX2xvYW5fc2xvdF9vZmZzZXQocG9zaXRpb24pLAogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIGFjdGl2ZV9sb2FuX3Nsb3Rfb2Zmc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9hY3RpdmVfbG9hbnMucHk6NDMKICAgIC8vIFJFQ09SRF9LRVlfU0laRSwKICAgIGludCA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9hY3RpdmVfbG9hbnMucHk6NDAtNDQKICAgIC8vIHJldHVybiBvcC5Cb3guZXh0cmFjdCgKICAgIC8vICAgICBhY3RpdmVfbG9hbnNfcGFnZV9rZXkocG9zaXRpb24pLAogICAgLy8gICAgIGFjdGl2ZV9sb2FuX3Nsb3Rfb2Zmc2V0KHBvc2l0aW9uKSwKICAgIC8vICAgICBSRUNPUkRfS0VZX1NJWkUsCiAgICAvLyApCiAgICBib3hfZXh0cmFjdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2xvYW4uYm9ycm93ZXJfbG9hbnMucmVtb3ZlX2JvcnJvd2VyX2xvYW4oYm9ycm93ZXI6IGJ5dGVzLCBsb2FuX2tleTogYnl0ZXMpIC0+IHZvaWQ6CnJlbW92ZV9ib3Jyb3dlcl9sb2FuOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vYm9ycm93ZXJfbG9hbnMucHk6NTAtNTEKICAgIC8vIEBhcC5zdWJyb3V0aW5lCiAgICAvLyBkZWYgcmVtb3ZlX2JvcnJvd2VyX2xvYW4oYm9ycm93ZXI6IGFwLkFjY291bnQsIGxvYW5fa2V5OiBhcC5CeXRlcykgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vYm9ycm93ZXJfbG9hbnMucHk6NTMKICAgIC8vIGJveF9rZXkgPSBib3Jyb3dlcl9sb2Fuc19rZXkoYm9ycm93ZXIpCiAgICBmcmFtZV9kaWcgLTIKICAgIGNhbGxzdWIgYm9ycm93ZXJfbG9hbnNfa2V5CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9ib3Jyb3dlcl9sb2Fucy5weTo1NAogICAgLy8gbGFzdF9pbmRleCA9IGJvcnJvd2VyX2xvYW5fY291bnQoYm9ycm93ZXIpIC0gMQogICAgZnJhbWVfZGlnIC0yCiAgICBjYWxsc3ViIGJvcnJvd2VyX2xvYW5fY291bnQKICAgIGludCAxCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9ib3Jyb3dlcl9sb2Fucy5weTo1NQogICAgLy8gaW5kZXggPSBhcC5VSW50NjQoMCkKICAgIGludCAwCgpyZW1vdmVfYm9ycm93ZXJfbG9hbl93aGlsZV90b3BAMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2JvcnJvd2VyX2xvYW5zLnB5OjU2CiAgICAvLyB3aGlsZSBib3Jyb3dlcl9sb2FuX2tleShib3Jyb3dlciwgaW5kZXgpICE9IGxvYW5fa2V5OgogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgMgogICAgY2FsbHN1YiBib3Jyb3dlcl9sb2FuX2tleQogICAgZnJhbWVfZGlnIC0xCiAgICAhPQogICAgYnogcmVtb3ZlX2JvcnJvd2VyX2xvYW5fYWZ0ZXJfd2hpbGVAMwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vYm9ycm93ZXJfbG9hbnMucHk6NTcKICAgIC8vIGluZGV4ICs9IDEKICAgIGZyYW1lX2RpZyAyCiAgICBpbnQgMQogICAgKwogICAgZHVwCiAgICBmcmFtZV9idXJ5IDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2JvcnJvd2VyX2xvYW5zLnB5OjU4CiAgICAvLyBhc3NlcnQgaW5kZXggPD0gbGFzdF9pbmRleCwgIlRoZSBsb2FuIHdhcyBub3QgZm91bmQgaW4gdGhlIGJvcnJvd2VyJ3MgbG9hbnMiCiAgICBmcmFtZV9kaWcgMQogICAgPD0KICAgIGFzc2VydCAvLyBUaGUgbG9hbiB3YXMgbm90IGZvdW5kIGluIHRoZSBib3Jyb3dlcidzIGxvYW5zCiAgICBiIHJlbW92ZV9ib3Jyb3dlcl9sb2FuX3doaWxlX3RvcEAxCgpyZW1vdmVfYm9ycm93ZXJfbG9hbl9hZnRlcl93aGlsZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vYm9ycm93ZXJfbG9hbnMucHk6NjAKICAgIC8vIGlmIGluZGV4ICE9IGxhc3RfaW5kZXg6CiAgICBmcmFtZV9kaWcgMgogICAgZnJhbWVfZGlnIDEKICAgICE9CiAgICBieiByZW1vdmVfYm9ycm93ZXJfbG9hbl9hZnRlcl9pZl9lbHNlQDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2JvcnJvd2VyX2xvYW5zLnB5OjYyCiAgICAvLyBib3hfa2V5LCBsYXN0X2luZGV4ICogUkVDT1JEX0tFWV9TSVpFLCBSRUNPUkRfS0VZX1NJWkUKICAgIGZyYW1lX2RpZyAxCiAgICBpbnQgOAogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vYm9ycm93ZXJfbG9hbnMucHk6NjEtNjMKICAgIC8vIGxhc3Rfc2xvdCA9IG9wLkJveC5leHRyYWN0KAogICAgLy8gICAgIGJveF9rZXksIGxhc3RfaW5kZXggKiBSRUNPUkRfS0VZX1NJWkUsIFJFQ09SRF9LRVlfU0laRQogICAgLy8gKQogICAgZnJhbWVfZGlnIDAKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9ib3Jyb3dlcl9sb2Fucy5weTo2MgogICAgLy8gYm94X2tleSwgbGFzdF9pbmRleCAqIFJFQ09SRF9LRVlfU0laRSwgUkVDT1JEX0tFWV9TSVpFCiAgICBpbnQgOAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vYm9ycm93ZXJfbG9hbnMucHk6NjEtNjMKICAgIC8vIGxhc3Rfc2xvdCA9IG9wLkJveC5leHRyYWN0KAogICAgLy8gICAgIGJveF9rZXksIGxhc3RfaW5kZXggKiBSRUNPUkRfS0VZX1NJWkUsIFJFQ09SRF9LRVlfU0laRQogICAgLy8gKQogICAgYm94X2V4dHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2JvcnJvd2VyX2xvYW5zLnB5OjY0CiAgICAvLyBvcC5Cb3gucmVwbGFjZShib3hfa2V5LCBpbmRleCAqIFJFQ09SRF9LRVlfU0laRSwgbGFzdF9zbG90KQogICAgZnJhbWVfZGlnIDIKICAgIGludCA4CiAgICAqCiAgICBzd2FwCiAgICBib3hfcmVwbGFjZQoKcmVtb3ZlX2JvcnJvd2VyX2xvYW5fYWZ0ZXJfaWZfZWxzZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vYm9ycm93ZXJfbG9hbnMucHk6NjUKICAgIC8vIGlmIGxhc3RfaW5kZXggPT0gMDoKICAgIGZyYW1lX2RpZyAxCiAgICBibnogcmVtb3ZlX2JvcnJvd2VyX2xvYW5fZWxzZV9ib2R5QDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2JvcnJvd2VyX2xvYW5zLnB5OjY2CiAgICAvLyBvcC5Cb3guZGVsZXRlKGJveF9rZXkpCiAgICBmcmFtZV9kaWcgMAogICAgYm94X2RlbAogICAgcG9wCiAgICBiIHJlbW92ZV9ib3Jyb3dlcl9sb2FuX2FmdGVyX2lmX2Vsc2VAOAoKcmVtb3ZlX2JvcnJvd2VyX2xvYW5fZWxzZV9ib2R5QDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9ib3Jyb3dlcl9sb2Fucy5weTo2OAogICAgLy8gb3AuQm94LnJlc2l6ZShib3hfa2V5LCBsYXN0X2luZGV4ICogUkVDT1JEX0tFWV9TSVpFKQogICAgZnJhbWVfZGlnIDEKICAgIGludCA4CiAgICAqCiAgICBmcmFtZV9kaWcgMAogICAgc3dhcAogICAgYm94X3Jlc2l6ZQoKcmVtb3ZlX2JvcnJvd2VyX2xvYW5fYWZ0ZXJfaWZfZWxzZUA4OgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2xvYW4uYm9ycm93ZXJfbG9hbnMuYm9ycm93ZXJfbG9hbl9rZXkoYm9ycm93ZXI6IGJ5dGVzLCBpbmRleDogdWludDY0KSAtPiBieXRlczoKYm9ycm93ZXJfbG9hbl9rZXk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9ib3Jyb3dlcl9sb2Fucy5weTozMS0zMgogICAgLy8gQGFwLnN1YnJvdXRpbmUKICAgIC8vIGRlZiBib3Jyb3dlcl9sb2FuX2tleShib3Jyb3dlcjogYXAuQWNjb3VudCwgaW5kZXg6IGFwLlVJbnQ2NCkgLT4gYXAuQnl0ZXM6CiAgICBwcm90byAyIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2JvcnJvd2VyX2xvYW5zLnB5OjM0CiAgICAvLyBib3Jyb3dlcl9sb2Fuc19rZXkoYm9ycm93ZXIpLCBpbmRleCAqIFJFQ09SRF9LRVlfU0laRSwgUkVDT1JEX0tFWV9TSVpFCiAgICBmcmFtZV9kaWcgLTIKICAgIGNhbGxzdWIgYm9ycm93ZXJfbG9hbnNfa2V5CiAgICBmcmFtZV9kaWcgLTEKICAgIGludCA4CiAgICAqCiAgICBpbnQgOAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vYm9ycm93ZXJfbG9hbnMucHk6MzMtMzUKICAgIC8vIHJldHVybiBvcC5Cb3guZXh0cmFjdCgKICAgIC8vICAgICBib3Jyb3dlcl9sb2Fuc19rZXkoYm9ycm93ZXIpLCBpbmRleCAqIFJFQ09SRF9LRVlfU0laRSwgUkVDT1JEX0tFWV9TSVpFCiAgICAvLyApCiAgICBib3hfZXh0cmFjdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2xvYW4uc3RvcmFnZS5kZWxldGVfbG9hbl9ib3hlcyhsb2FuX2tleTogYnl0ZXMpIC0+IHZvaWQ6CmRlbGV0ZV9sb2FuX2JveGVzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vc3RvcmFnZS5weToyOTgtMjk5CiAgICAvLyBAYXAuc3Vicm91dGluZQogICAgLy8gZGVmIGRlbGV0ZV9sb2FuX2JveGVzKGxvYW5fa2V5OiBhcC5CeXRlcykgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vc3RvcmFnZS5weTozMDAKICAgIC8vIG9wLkJveC5kZWxldGUobG9hbl9yZWNvcmRfa2V5KGxvYW5fa2V5KSkKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBsb2FuX3JlY29yZF9rZXkKICAgIGJveF9kZWwKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vc3RvcmFnZS5weTozMDEKICAgIC8vIG9wLkJveC5kZWxldGUobG9hbl9yZWNpcGllbnRzX2tleShsb2FuX2tleSkpCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgbG9hbl9yZWNpcGllbnRzX2tleQogICAgYm94X2RlbAogICAgcG9wCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfbG9hbi5jb250cmFjdC5aYWliYXRzdUxvYW4uZGVsZXRlX3JlcGF5bWVudChyZXBheW1lbnRfa2V5OiBieXRlcywgbG9hbl9rZXk6IGJ5dGVzKSAtPiB2b2lkOgpkZWxldGVfcmVwYXltZW50OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6OTc1LTk3NgogICAgLy8gQGFwLnN1YnJvdXRpbmUKICAgIC8vIGRlZiBkZWxldGVfcmVwYXltZW50KHNlbGYsIHJlcGF5bWVudF9rZXk6IGFwLkJ5dGVzLCBsb2FuX2tleTogYXAuQnl0ZXMpIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5Ojk3NwogICAgLy8gb3AuQm94LmRlbGV0ZShyZXBheW1lbnRfcmVjb3JkX2tleShyZXBheW1lbnRfa2V5KSkKICAgIGZyYW1lX2RpZyAtMgogICAgY2FsbHN1YiByZXBheW1lbnRfcmVjb3JkX2tleQogICAgYm94X2RlbAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo5NzktOTgyCiAgICAvLyBSZXBheW1lbnRDbG9zZWQoCiAgICAvLyAgICAgcmVwYXltZW50X2tleT1SZWNvcmRLZXkuZnJvbV9ieXRlcyhyZXBheW1lbnRfa2V5KSwKICAgIC8vICAgICBsb2FuX2tleT1SZWNvcmRLZXkuZnJvbV9ieXRlcyhsb2FuX2tleSksCiAgICAvLyApCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo5NzgtOTgzCiAgICAvLyBhNC5lbWl0KAogICAgLy8gICAgIFJlcGF5bWVudENsb3NlZCgKICAgIC8vICAgICAgICAgcmVwYXltZW50X2tleT1SZWNvcmRLZXkuZnJvbV9ieXRlcyhyZXBheW1lbnRfa2V5KSwKICAgIC8vICAgICAgICAgbG9hbl9rZXk9UmVjb3JkS2V5LmZyb21fYnl0ZXMobG9hbl9rZXkpLAogICAgLy8gICAgICkKICAgIC8vICkKICAgIG1ldGhvZCAiUmVwYXltZW50Q2xvc2VkKGJ5dGVbOF0sYnl0ZVs4XSkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2xvYW4uY29udHJhY3QuWmFpYmF0c3VMb2FuLmNsZWFuX3VwX2xvYW5fcmVwYXltZW50cyhyZXBheW1lbnRfa2V5czogYnl0ZXMpIC0+IGJ5dGVzOgpjbGVhbl91cF9sb2FuX3JlcGF5bWVudHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTozNDItMzQ2CiAgICAvLyBAYXAuYXJjNC5hYmltZXRob2QoKQogICAgLy8gZGVmIGNsZWFuX3VwX2xvYW5fcmVwYXltZW50cygKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIHJlcGF5bWVudF9rZXlzOiBSZWNvcmRLZXlBcnJheSwKICAgIC8vICkgLT4gYTQuRHluYW1pY0FycmF5W2E0LkJvb2xdOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTozNTkKICAgIC8vIHJlcGF5bWVudF9rZXlzLmxlbmd0aCA8PSBNQVhfQ0xFQU5fVVBfQkFUQ0hfU0laRQogICAgZnJhbWVfZGlnIC0xCiAgICBpbnQgMAogICAgZXh0cmFjdF91aW50MTYKICAgIGR1cG4gMgogICAgaW50IDEwCiAgICA8PQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MzU4LTM2MAogICAgLy8gYXNzZXJ0ICgKICAgIC8vICAgICByZXBheW1lbnRfa2V5cy5sZW5ndGggPD0gTUFYX0NMRUFOX1VQX0JBVENIX1NJWkUKICAgIC8vICksICJUb28gbWFueSByZXBheW1lbnRfa2V5cyBmb3Igb25lIGFwcCBjYWxsIgogICAgYXNzZXJ0IC8vIFRvbyBtYW55IHJlcGF5bWVudF9rZXlzIGZvciBvbmUgYXBwIGNhbGwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjM2MgogICAgLy8gcmVwYXltZW50X2tleXMubGVuZ3RoICogQ0xFQU5fVVBfT1BDT0RFX0JVREdFVF9QRVJfS0VZLAogICAgaW50IDM1MAogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MzYzCiAgICAvLyBhcC5PcFVwRmVlU291cmNlLkdyb3VwQ3JlZGl0LAogICAgaW50IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjM2MS0zNjQKICAgIC8vIGFwLmVuc3VyZV9idWRnZXQoCiAgICAvLyAgICAgcmVwYXltZW50X2tleXMubGVuZ3RoICogQ0xFQU5fVVBfT1BDT0RFX0JVREdFVF9QRVJfS0VZLAogICAgLy8gICAgIGFwLk9wVXBGZWVTb3VyY2UuR3JvdXBDcmVkaXQsCiAgICAvLyApCiAgICBjYWxsc3ViIGVuc3VyZV9idWRnZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjM2NQogICAgLy8gbG9hbnNfcmVwYWlkID0gYTQuRHluYW1pY0FycmF5W2E0LkJvb2xdKCkKICAgIGJ5dGUgMHgwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTozNjYKICAgIC8vIGZvciBpbmRleCBpbiBhcC51cmFuZ2UocmVwYXltZW50X2tleXMubGVuZ3RoKToKICAgIGludCAwCgpjbGVhbl91cF9sb2FuX3JlcGF5bWVudHNfZm9yX2hlYWRlckAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MzY2CiAgICAvLyBmb3IgaW5kZXggaW4gYXAudXJhbmdlKHJlcGF5bWVudF9rZXlzLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgMgogICAgZnJhbWVfZGlnIDAKICAgIDwKICAgIGJ6IGNsZWFuX3VwX2xvYW5fcmVwYXltZW50c19hZnRlcl9mb3JANQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MzY3CiAgICAvLyByZXBheW1lbnRfa2V5ID0gcmVwYXltZW50X2tleXNbaW5kZXhdLmNvcHkoKQogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDIKICAgIGR1cAogICAgY292ZXIgMgogICAgaW50IDgKICAgICoKICAgIGludCA4CiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjM2OAogICAgLy8gbG9hbl9rZXkgPSBzZWxmLnBhaWRfcmVwYXltZW50X2xvYW5fa2V5KHJlcGF5bWVudF9rZXkuYnl0ZXMpCiAgICBkdXAKICAgIGNhbGxzdWIgcGFpZF9yZXBheW1lbnRfbG9hbl9rZXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjM3MAogICAgLy8gc2VsZi5jbG9zZV9sb2FuX3JvdW5kKGxvYW5fa2V5LCBsb2FuX2JvcnJvd2VyKGxvYW5fa2V5KSkKICAgIGR1cAogICAgY2FsbHN1YiBsb2FuX2JvcnJvd2VyCiAgICBkaWcgMQogICAgc3dhcAogICAgY2FsbHN1YiBjbG9zZV9sb2FuX3JvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTozNjktMzcxCiAgICAvLyBsb2Fuc19yZXBhaWQuYXBwZW5kKAogICAgLy8gICAgIHNlbGYuY2xvc2VfbG9hbl9yb3VuZChsb2FuX2tleSwgbG9hbl9ib3Jyb3dlcihsb2FuX2tleSkpCiAgICAvLyApCiAgICBmcmFtZV9kaWcgMQogICAgc3dhcAogICAgaW50IDEKICAgIGludCAwCiAgICBjYWxsc3ViIGR5bmFtaWNfYXJyYXlfY29uY2F0X2JpdHMKICAgIGZyYW1lX2J1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6MzcyCiAgICAvLyBzZWxmLmRlbGV0ZV9yZXBheW1lbnQocmVwYXltZW50X2tleS5ieXRlcywgbG9hbl9rZXkpCiAgICBjYWxsc3ViIGRlbGV0ZV9yZXBheW1lbnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjM2NgogICAgLy8gZm9yIGluZGV4IGluIGFwLnVyYW5nZShyZXBheW1lbnRfa2V5cy5sZW5ndGgpOgogICAgaW50IDEKICAgICsKICAgIGZyYW1lX2J1cnkgMgogICAgYiBjbGVhbl91cF9sb2FuX3JlcGF5bWVudHNfZm9yX2hlYWRlckAxCgpjbGVhbl91cF9sb2FuX3JlcGF5bWVudHNfYWZ0ZXJfZm9yQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTozNzMKICAgIC8vIHJldHVybiBsb2Fuc19yZXBhaWQKICAgIGZyYW1lX2RpZyAxCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIGFsZ29weS5lbnN1cmVfYnVkZ2V0KHJlcXVpcmVkX2J1ZGdldDogdWludDY0LCBmZWVfc291cmNlOiB1aW50NjQpIC0+IHZvaWQ6CmVuc3VyZV9idWRnZXQ6CiAgICAvLyA8YWxnb3B5Pi9hbGdvcHkucHk6MTEtMTcKICAgIHByb3RvIDIgMAogICAgLy8gPGFsZ29weT4vYWxnb3B5LnB5OjE4CiAgICBmcmFtZV9kaWcgLTIKICAgIGludCAxMAogICAgKwoKZW5zdXJlX2J1ZGdldF93aGlsZV90b3BAMToKICAgIC8vIDxhbGdvcHk+L2FsZ29weS5weToxOQogICAgZnJhbWVfZGlnIDAKICAgIGdsb2JhbCBPcGNvZGVCdWRnZXQKICAgID4KICAgIGJ6IGVuc3VyZV9idWRnZXRfYWZ0ZXJfd2hpbGVANwogICAgLy8gPGFsZ29weT4vYWxnb3B5LnB5OjIwCiAgICBpdHhuX2JlZ2luCiAgICAvLyA8YWxnb3B5Pi9hbGdvcHkucHk6MjEKICAgIGludCBhcHBsCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyA8YWxnb3B5Pi9hbGdvcHkucHk6MjIKICAgIGludCBEZWxldGVBcHBsaWNhdGlvbgogICAgaXR4bl9maWVsZCBPbkNvbXBsZXRpb24KICAgIC8vIDxhbGdvcHk+L2FsZ29weS5weToyMwogICAgYnl0ZSAweDA2ODEwMQogICAgaXR4bl9maWVsZCBBcHByb3ZhbFByb2dyYW0KICAgIC8vIDxhbGdvcHk+L2FsZ29weS5weToyNAogICAgYnl0ZSAweDA2ODEwMQogICAgaXR4bl9maWVsZCBDbGVhclN0YXRlUHJvZ3JhbQogICAgLy8gPGFsZ29weT4vYWxnb3B5LnB5OjI1LTI5CiAgICBmcmFtZV9kaWcgLTEKICAgIHN3aXRjaCBlbnN1cmVfYnVkZ2V0X3N3aXRjaF9jYXNlXzBAMyBlbnN1cmVfYnVkZ2V0X3N3aXRjaF9jYXNlXzFANAogICAgYiBlbnN1cmVfYnVkZ2V0X3N3aXRjaF9jYXNlX25leHRANgoKZW5zdXJlX2J1ZGdldF9zd2l0Y2hfY2FzZV8wQDM6CiAgICAvLyA8YWxnb3B5Pi9hbGdvcHkucHk6MjcKICAgIGludCAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgYiBlbnN1cmVfYnVkZ2V0X3N3aXRjaF9jYXNlX25leHRANgoKZW5zdXJlX2J1ZGdldF9zd2l0Y2hfY2FzZV8xQDQ6CiAgICAvLyA8YWxnb3B5Pi9hbGdvcHkucHk6MjkKICAgIGdsb2JhbCBNaW5UeG5GZWUKICAgIGl0eG5fZmllbGQgRmVlCgplbnN1cmVfYnVkZ2V0X3N3aXRjaF9jYXNlX25leHRANjoKICAgIC8vIDxhbGdvcHk+L2FsZ29weS5weTozMAogICAgaXR4bl9zdWJtaXQKICAgIGIgZW5zdXJlX2J1ZGdldF93aGlsZV90b3BAMQoKZW5zdXJlX2J1ZGdldF9hZnRlcl93aGlsZUA3OgogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2xvYW4uY29udHJhY3QuWmFpYmF0c3VMb2FuLnJlcGF5X2xvYW5fcm91bmQobG9hbl9rZXk6IGJ5dGVzLCB0eG46IHVpbnQ2NCkgLT4gYnl0ZXM6CnJlcGF5X2xvYW5fcm91bmQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTozNzUtMzgwCiAgICAvLyBAYXAuYXJjNC5hYmltZXRob2QoKQogICAgLy8gZGVmIHJlcGF5X2xvYW5fcm91bmQoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICBsb2FuX2tleTogYXAuQnl0ZXMsCiAgICAvLyAgICAgdHhuOiBndHhuLkFzc2V0VHJhbnNmZXJUcmFuc2FjdGlvbiwKICAgIC8vICkgLT4gQ2xlYW5VcExvYW5SZXBheW1lbnRSZXNwb25zZToKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6Mzg3CiAgICAvLyBzZWxmLmVuc3VyZV9hcHBfcmVjaWV2ZXIodHhuKQogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIGVuc3VyZV9hcHBfcmVjaWV2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjM4OQogICAgLy8gW2xvYW5fYnl0ZXMsIGV4aXN0c10gPSBvcC5Cb3guZ2V0KGxvYW5fcmVjb3JkX2tleShsb2FuX2tleSkpCiAgICBmcmFtZV9kaWcgLTIKICAgIGNhbGxzdWIgbG9hbl9yZWNvcmRfa2V5CiAgICBib3hfZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTozOTAKICAgIC8vIGFzc2VydCBleGlzdHMsICJBIHJlY2NvcmQgd2l0aCB0aGUgbG9hbl9rZXkgcGFzc2VkIHdhcyBub3QgZm91bmQiCiAgICBhc3NlcnQgLy8gQSByZWNjb3JkIHdpdGggdGhlIGxvYW5fa2V5IHBhc3NlZCB3YXMgbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTozOTIKICAgIC8vIGFzc2VydCBsb2FuLnByaW5jaXBhbF9wYWlkLCAiVGhlIGxvYW4gcHJpbmNpcGFsIG11c3QgaGF2ZSBiZWVuIHBhaWQiCiAgICBkdXAKICAgIGludCA0MQogICAgZ2V0Yml0CiAgICBieXRlIDB4MDAKICAgIGludCAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgYnl0ZSAweDAwCiAgICAhPQogICAgYXNzZXJ0IC8vIFRoZSBsb2FuIHByaW5jaXBhbCBtdXN0IGhhdmUgYmVlbiBwYWlkCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTozOTMKICAgIC8vIGFzc2VydCBub3QgbG9hbi5wYXltZW50X2RlZmF1bHRlZCwgIlRoZSBsb2FuIGhhcyBhbHJlYWR5IGJlZW4gZGVmYXVsdGVkIgogICAgZHVwCiAgICBpbnQgNDIKICAgIGdldGJpdAogICAgYnl0ZSAweDAwCiAgICBpbnQgMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIGJ5dGUgMHgwMAogICAgPT0KICAgIGFzc2VydCAvLyBUaGUgbG9hbiBoYXMgYWxyZWFkeSBiZWVuIGRlZmF1bHRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6Mzk1CiAgICAvLyBsb2FuLmNvbXBsZXRlZF9wYXltZW50X3JvdW5kcy5uYXRpdmUgPCBsb2FuLnBheW1lbnRfcm91bmRzLm5hdGl2ZQogICAgZHVwCiAgICBleHRyYWN0IDQgMSAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgIHN3YXAKICAgIGR1cAogICAgZXh0cmFjdCAzIDEgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICB1bmNvdmVyIDIKICAgID4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjM5NC0zOTYKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgbG9hbi5jb21wbGV0ZWRfcGF5bWVudF9yb3VuZHMubmF0aXZlIDwgbG9hbi5wYXltZW50X3JvdW5kcy5uYXRpdmUKICAgIC8vICksICJBbGwgcGF5bWVudCByb3VuZHMgb2YgdGhpcyBsb2FuIGhhdmUgYmVlbiBjb21wbGV0ZWQiCiAgICBhc3NlcnQgLy8gQWxsIHBheW1lbnQgcm91bmRzIG9mIHRoaXMgbG9hbiBoYXZlIGJlZW4gY29tcGxldGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTozOTcKICAgIC8vIGFzc2VydCB0eG4uc2VuZGVyID09IGxvYW4uYm9ycm93ZXIubmF0aXZlLCAiVGhlIHNlbmRlciBtdXN0IGJlIHRoZSBib3Jyb3dlciIKICAgIGZyYW1lX2RpZyAtMQogICAgZ3R4bnMgU2VuZGVyCiAgICBkaWcgMQogICAgZXh0cmFjdCA3OCAzMiAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGRpZyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIFRoZSBzZW5kZXIgbXVzdCBiZSB0aGUgYm9ycm93ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjM5OQogICAgLy8gdHhuLnhmZXJfYXNzZXQuaWQgPT0gbG9hbi5wcmluY2lwYWxfYXNzZXRfaWQubmF0aXZlCiAgICBmcmFtZV9kaWcgLTEKICAgIGd0eG5zIFhmZXJBc3NldAogICAgZGlnIDIKICAgIGV4dHJhY3QgNiA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnRvaQogICAgZGlnIDEKICAgID09CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTozOTgtNDAwCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIHR4bi54ZmVyX2Fzc2V0LmlkID09IGxvYW4ucHJpbmNpcGFsX2Fzc2V0X2lkLm5hdGl2ZQogICAgLy8gKSwgIlRoZSBhc3NldCBiZWluZyB0cmFuc2ZlcmVkIG11c3QgYmUgdGhlIHByaW5jaXBhbCBhc3NldCIKICAgIGFzc2VydCAvLyBUaGUgYXNzZXQgYmVpbmcgdHJhbnNmZXJlZCBtdXN0IGJlIHRoZSBwcmluY2lwYWwgYXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjQwMgogICAgLy8gcGF5bWVudF9hbW91bnQgPSBzZWxmLmNhbGN1bGF0ZV9yb3VuZF9wYXltZW50X2Ftb3VudChsb2FuKQogICAgdW5jb3ZlciAyCiAgICBjYWxsc3ViIGNhbGN1bGF0ZV9yb3VuZF9wYXltZW50X2Ftb3VudAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo0MDMKICAgIC8vIHNlbGYuZW5zdXJlX3RyYW5zYWN0aW9uX2ZlZV9vbl9hbW91bnQodHhuLCBwYXltZW50X2Ftb3VudCwgYXAuVUludDY0KDEpKQogICAgZnJhbWVfZGlnIC0xCiAgICBkaWcgMQogICAgaW50IDEKICAgIGNhbGxzdWIgZW5zdXJlX3RyYW5zYWN0aW9uX2ZlZV9vbl9hbW91bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjQwOAogICAgLy8gYTQuVUludDY0KHBheW1lbnRfYW1vdW50KSwKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjQwNS00MTAKICAgIC8vIFtwZXJjZW50YWdlX3BhaWQsIF9wYWlkX3JlY2lwaWVudHNdID0gc2VsZi5wYXlfbG9hbl9yZWNpcGllbnRzKAogICAgLy8gICAgIGxvYW5fa2V5LAogICAgLy8gICAgIHR4bi54ZmVyX2Fzc2V0LAogICAgLy8gICAgIGE0LlVJbnQ2NChwYXltZW50X2Ftb3VudCksCiAgICAvLyAgICAgYXAuVUludDY0KDApLAogICAgLy8gKQogICAgZnJhbWVfZGlnIC0yCiAgICBjb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo0MDkKICAgIC8vIGFwLlVJbnQ2NCgwKSwKICAgIGludCAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo0MDUtNDEwCiAgICAvLyBbcGVyY2VudGFnZV9wYWlkLCBfcGFpZF9yZWNpcGllbnRzXSA9IHNlbGYucGF5X2xvYW5fcmVjaXBpZW50cygKICAgIC8vICAgICBsb2FuX2tleSwKICAgIC8vICAgICB0eG4ueGZlcl9hc3NldCwKICAgIC8vICAgICBhNC5VSW50NjQocGF5bWVudF9hbW91bnQpLAogICAgLy8gICAgIGFwLlVJbnQ2NCgwKSwKICAgIC8vICkKICAgIGNhbGxzdWIgcGF5X2xvYW5fcmVjaXBpZW50cwogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo0MTEtNDEzCiAgICAvLyBhc3NlcnQgcGVyY2VudGFnZV9wYWlkID09IGFwLlVJbnQ2NCgKICAgIC8vICAgICAxMDAwMAogICAgLy8gKSwgIlRoZSBwYXltZW50X3JlY2lwaWVudHMgb2YgdGhpcyBsb2FuIGRvIG5vdCBhZGQgdXAgdG8gMTAwIHBlcmNlbnQiCiAgICBpbnQgMTAwMDAKICAgID09CiAgICBhc3NlcnQgLy8gVGhlIHBheW1lbnRfcmVjaXBpZW50cyBvZiB0aGlzIGxvYW4gZG8gbm90IGFkZCB1cCB0byAxMDAgcGVyY2VudAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NDE2CiAgICAvLyBsb2FuX3JlcGF5bWVudF9jb21wbGV0ZT1zZWxmLmNsb3NlX2xvYW5fcm91bmQobG9hbl9rZXksIHR4bi5zZW5kZXIpCiAgICBmcmFtZV9kaWcgLTIKICAgIHN3YXAKICAgIGNhbGxzdWIgY2xvc2VfbG9hbl9yb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NDE1LTQxNwogICAgLy8gcmV0dXJuIENsZWFuVXBMb2FuUmVwYXltZW50UmVzcG9uc2UoCiAgICAvLyAgICAgbG9hbl9yZXBheW1lbnRfY29tcGxldGU9c2VsZi5jbG9zZV9sb2FuX3JvdW5kKGxvYW5fa2V5LCB0eG4uc2VuZGVyKQogICAgLy8gKQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2xvYW4uY29udHJhY3QuWmFpYmF0c3VMb2FuLmhhbmRsZV9wYXltZW50X2RlZmF1bHQobG9hbl9rZXk6IGJ5dGVzLCBwYXltZW50X3ByaW5jaXBhbF9hc3NldF9hbW91bnQ6IHVpbnQ2NCwgcGF5bWVudF9jb2xsYXRlcmFsX2Fzc2V0X2Ftb3VudDogdWludDY0KSAtPiBieXRlczoKaGFuZGxlX3BheW1lbnRfZGVmYXVsdDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjQxOS00MjUKICAgIC8vIEBhcC5hcmM0LmFiaW1ldGhvZCgpCiAgICAvLyBkZWYgaGFuZGxlX3BheW1lbnRfZGVmYXVsdCgKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIGxvYW5fa2V5OiBhcC5CeXRlcywKICAgIC8vICAgICBwYXltZW50X3ByaW5jaXBhbF9hc3NldF9hbW91bnQ6IGFwLlVJbnQ2NCwKICAgIC8vICAgICBwYXltZW50X2NvbGxhdGVyYWxfYXNzZXRfYW1vdW50OiBhcC5VSW50NjQsCiAgICAvLyApIC0+IFJlY29yZEtleToKICAgIHByb3RvIDMgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NDI3CiAgICAvLyBhc3NlcnQgbG9hbl9leGlzdHMobG9hbl9rZXkpLCAiQSByZWNjb3JkIHdpdGggdGhlIGxvYW5fa2V5IHBhc3NlZCB3YXMgbm90IGZvdW5kIgogICAgZnJhbWVfZGlnIC0zCiAgICBjYWxsc3ViIGxvYW5fZXhpc3RzCiAgICBhc3NlcnQgLy8gQSByZWNjb3JkIHdpdGggdGhlIGxvYW5fa2V5IHBhc3NlZCB3YXMgbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo0MjktNDMzCiAgICAvLyByZXBheW1lbnRfa2V5ID0gc2VsZi5yZWNvcmRfcGF5bWVudF9kZWZhdWx0KAogICAgLy8gICAgIGxvYW5fa2V5LAogICAgLy8gICAgIHBheW1lbnRfcHJpbmNpcGFsX2Fzc2V0X2Ftb3VudCwKICAgIC8vICAgICBwYXltZW50X2NvbGxhdGVyYWxfYXNzZXRfYW1vdW50LAogICAgLy8gKQogICAgZnJhbWVfZGlnIC0zCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiByZWNvcmRfcGF5bWVudF9kZWZhdWx0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo0MzQKICAgIC8vIHJldHVybiBSZWNvcmRLZXkuZnJvbV9ieXRlcyhyZXBheW1lbnRfa2V5KQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2xvYW4uY29udHJhY3QuWmFpYmF0c3VMb2FuLnJlY29yZF9wYXltZW50X2RlZmF1bHQobG9hbl9rZXk6IGJ5dGVzLCBwcmluY2lwYWxfYW1vdW50OiB1aW50NjQsIGNvbGxhdGVyYWxfYW1vdW50OiB1aW50NjQpIC0+IGJ5dGVzOgpyZWNvcmRfcGF5bWVudF9kZWZhdWx0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6ODcyLTg3OAogICAgLy8gQGFwLnN1YnJvdXRpbmUKICAgIC8vIGRlZiByZWNvcmRfcGF5bWVudF9kZWZhdWx0KAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgbG9hbl9rZXk6IGFwLkJ5dGVzLAogICAgLy8gICAgIHByaW5jaXBhbF9hbW91bnQ6IGFwLlVJbnQ2NCwKICAgIC8vICAgICBjb2xsYXRlcmFsX2Ftb3VudDogYXAuVUludDY0LAogICAgLy8gKSAtPiBhcC5CeXRlczoKICAgIHByb3RvIDMgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6ODg1CiAgICAvLyBsb2FuX2tleSwgbG9hbl9jb2xsYXRlcmFsX2Fzc2V0X2Ftb3VudChsb2FuX2tleSkgLSBjb2xsYXRlcmFsX2Ftb3VudAogICAgZnJhbWVfZGlnIC0zCiAgICBjYWxsc3ViIGxvYW5fY29sbGF0ZXJhbF9hc3NldF9hbW91bnQKICAgIGZyYW1lX2RpZyAtMQogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6ODg0LTg4NgogICAgLy8gc2V0X2xvYW5fY29sbGF0ZXJhbF9hc3NldF9hbW91bnQoCiAgICAvLyAgICAgbG9hbl9rZXksIGxvYW5fY29sbGF0ZXJhbF9hc3NldF9hbW91bnQobG9hbl9rZXkpIC0gY29sbGF0ZXJhbF9hbW91bnQKICAgIC8vICkKICAgIGZyYW1lX2RpZyAtMwogICAgc3dhcAogICAgY2FsbHN1YiBzZXRfbG9hbl9jb2xsYXRlcmFsX2Fzc2V0X2Ftb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6ODg3CiAgICAvLyBzZXRfbG9hbl9wYXltZW50X2RlZmF1bHRlZChsb2FuX2tleSwgVHJ1ZSkgICMgbm9xYTogRkJUMDAzCiAgICBmcmFtZV9kaWcgLTMKICAgIGludCAxCiAgICBjYWxsc3ViIHNldF9sb2FuX3BheW1lbnRfZGVmYXVsdGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo4ODkKICAgIC8vIHJlcGF5bWVudF9rZXkgPSBzZWxmLm5leHRfcmVjb3JkX2tleSgpCiAgICBjYWxsc3ViIG5leHRfcmVjb3JkX2tleQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6ODkyCiAgICAvLyByZXBheW1lbnRfYW1vdW50PWE0LlVJbnQ2NChwcmluY2lwYWxfYW1vdW50KSwKICAgIGZyYW1lX2RpZyAtMgogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6ODkwLTg5NQogICAgLy8gcm91bmRfcGF5bWVudCA9IFBlbmRpbmdMb2FuUm91bmRQYXltZW50KAogICAgLy8gICAgIGxvYW5fa2V5PVJlY29yZEtleS5mcm9tX2J5dGVzKGxvYW5fa2V5KSwKICAgIC8vICAgICByZXBheW1lbnRfYW1vdW50PWE0LlVJbnQ2NChwcmluY2lwYWxfYW1vdW50KSwKICAgIC8vICAgICBwZXJjZW50YWdlX3BhaWQ9YTQuVUludDY0KDApLAogICAgLy8gICAgIHBhaWRfcmVjaXBpZW50cz1hNC5VSW50NjQoMCksCiAgICAvLyApCiAgICBmcmFtZV9kaWcgLTMKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5Ojg5MwogICAgLy8gcGVyY2VudGFnZV9wYWlkPWE0LlVJbnQ2NCgwKSwKICAgIGJ5dGUgMHgwMDAwMDAwMDAwMDAwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo4OTAtODk1CiAgICAvLyByb3VuZF9wYXltZW50ID0gUGVuZGluZ0xvYW5Sb3VuZFBheW1lbnQoCiAgICAvLyAgICAgbG9hbl9rZXk9UmVjb3JkS2V5LmZyb21fYnl0ZXMobG9hbl9rZXkpLAogICAgLy8gICAgIHJlcGF5bWVudF9hbW91bnQ9YTQuVUludDY0KHByaW5jaXBhbF9hbW91bnQpLAogICAgLy8gICAgIHBlcmNlbnRhZ2VfcGFpZD1hNC5VSW50NjQoMCksCiAgICAvLyAgICAgcGFpZF9yZWNpcGllbnRzPWE0LlVJbnQ2NCgwKSwKICAgIC8vICkKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6ODk0CiAgICAvLyBwYWlkX3JlY2lwaWVudHM9YTQuVUludDY0KDApLAogICAgYnl0ZSAweDAwMDAwMDAwMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5Ojg5MC04OTUKICAgIC8vIHJvdW5kX3BheW1lbnQgPSBQZW5kaW5nTG9hblJvdW5kUGF5bWVudCgKICAgIC8vICAgICBsb2FuX2tleT1SZWNvcmRLZXkuZnJvbV9ieXRlcyhsb2FuX2tleSksCiAgICAvLyAgICAgcmVwYXltZW50X2Ftb3VudD1hNC5VSW50NjQocHJpbmNpcGFsX2Ftb3VudCksCiAgICAvLyAgICAgcGVyY2VudGFnZV9wYWlkPWE0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBwYWlkX3JlY2lwaWVudHM9YTQuVUludDY0KDApLAogICAgLy8gKQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo4OTcKICAgIC8vIG9wLkJveC5wdXQocmVwYXltZW50X3JlY29yZF9rZXkocmVwYXltZW50X2tleSksIHJvdW5kX3BheW1lbnQuYnl0ZXMpCiAgICBkaWcgMgogICAgY2FsbHN1YiByZXBheW1lbnRfcmVjb3JkX2tleQogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6OTAzCiAgICAvLyBjb2xsYXRlcmFsX3NlaXplZD1hNC5VSW50NjQoY29sbGF0ZXJhbF9hbW91bnQpLAogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo4OTktOTA0CiAgICAvLyBMb2FuRGVmYXVsdGVkKAogICAgLy8gICAgIGxvYW5fa2V5PVJlY29yZEtleS5mcm9tX2J5dGVzKGxvYW5fa2V5KSwKICAgIC8vICAgICByZXBheW1lbnRfa2V5PVJlY29yZEtleS5mcm9tX2J5dGVzKHJlcGF5bWVudF9rZXkpLAogICAgLy8gICAgIHByaW5jaXBhbF9vd2VkPWE0LlVJbnQ2NChwcmluY2lwYWxfYW1vdW50KSwKICAgIC8vICAgICBjb2xsYXRlcmFsX3NlaXplZD1hNC5VSW50NjQoY29sbGF0ZXJhbF9hbW91bnQpLAogICAgLy8gKQogICAgZnJhbWVfZGlnIC0zCiAgICBkaWcgMwogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6ODk4LTkwNQogICAgLy8gYTQuZW1pdCgKICAgIC8vICAgICBMb2FuRGVmYXVsdGVkKAogICAgLy8gICAgICAgICBsb2FuX2tleT1SZWNvcmRLZXkuZnJvbV9ieXRlcyhsb2FuX2tleSksCiAgICAvLyAgICAgICAgIHJlcGF5bWVudF9rZXk9UmVjb3JkS2V5LmZyb21fYnl0ZXMocmVwYXltZW50X2tleSksCiAgICAvLyAgICAgICAgIHByaW5jaXBhbF9vd2VkPWE0LlVJbnQ2NChwcmluY2lwYWxfYW1vdW50KSwKICAgIC8vICAgICAgICAgY29sbGF0ZXJhbF9zZWl6ZWQ9YTQuVUludDY0KGNvbGxhdGVyYWxfYW1vdW50KSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBtZXRob2QgIkxvYW5EZWZhdWx0ZWQoYnl0ZVs4XSxieXRlWzhdLHVpbnQ2NCx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjkwNgogICAgLy8gcmV0dXJuIHJlcGF5bWVudF9rZXkKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLnN0b3JhZ2Uuc2V0X2xvYW5fY29sbGF0ZXJhbF9hc3NldF9hbW91bnQobG9hbl9rZXk6IGJ5dGVzLCBhbW91bnQ6IHVpbnQ2NCkgLT4gdm9pZDoKc2V0X2xvYW5fY29sbGF0ZXJhbF9hc3NldF9hbW91bnQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9zdG9yYWdlLnB5OjE4Ni0xODcKICAgIC8vIEBhcC5zdWJyb3V0aW5lCiAgICAvLyBkZWYgc2V0X2xvYW5fY29sbGF0ZXJhbF9hc3NldF9hbW91bnQobG9hbl9rZXk6IGFwLkJ5dGVzLCBhbW91bnQ6IGFwLlVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vc3RvcmFnZS5weToxODgKICAgIC8vIHdyaXRlX3VpbnQ2NChsb2FuX2tleSwgYXAuVUludDY0KENPTExBVEVSQUxfQVNTRVRfQU1PVU5UKSwgYW1vdW50KQogICAgZnJhbWVfZGlnIC0yCiAgICBpbnQgMzgKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiB3cml0ZV91aW50NjQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLnN0b3JhZ2Uuc2V0X2xvYW5fcGF5bWVudF9kZWZhdWx0ZWQobG9hbl9rZXk6IGJ5dGVzLCBkZWZhdWx0ZWQ6IHVpbnQ2NCkgLT4gdm9pZDoKc2V0X2xvYW5fcGF5bWVudF9kZWZhdWx0ZWQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9zdG9yYWdlLnB5OjIzMS0yMzQKICAgIC8vIEBhcC5zdWJyb3V0aW5lCiAgICAvLyBkZWYgc2V0X2xvYW5fcGF5bWVudF9kZWZhdWx0ZWQoCiAgICAvLyAgICAgbG9hbl9rZXk6IGFwLkJ5dGVzLCBkZWZhdWx0ZWQ6IGJvb2wgICMgbm9xYTogRkJUMDAxCiAgICAvLyApIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL3N0b3JhZ2UucHk6MjM1CiAgICAvLyB3cml0ZV9mbGFnKGxvYW5fa2V5LCBhcC5VSW50NjQoUEFZTUVOVF9ERUZBVUxURURfQklUKSwgZGVmYXVsdGVkKQogICAgZnJhbWVfZGlnIC0yCiAgICBpbnQgMgogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIHdyaXRlX2ZsYWcKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLmNvbnRyYWN0LlphaWJhdHN1TG9hbi5oYW5kbGVfcGF5bWVudF9kZWZhdWx0cyhsb2FuX2tleXM6IGJ5dGVzKSAtPiBieXRlczoKaGFuZGxlX3BheW1lbnRfZGVmYXVsdHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo0MzYtNDQwCiAgICAvLyBAYTQuYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBoYW5kbGVfcGF5bWVudF9kZWZhdWx0cygKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIGxvYW5fa2V5czogUmVjb3JkS2V5QXJyYXksCiAgICAvLyApIC0+IGE0LkR5bmFtaWNBcnJheVtQYXltZW50RGVmYXVsdFJlc3BvbnNlXToKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NDUzCiAgICAvLyBzZWxmLmF1dGhvcmlzZV90eG4oKQogICAgY2FsbHN1YiBhdXRob3Jpc2VfdHhuCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo0NTUKICAgIC8vIGxvYW5fa2V5cy5sZW5ndGggKiBERUZBVUxUX09QQ09ERV9CVURHRVRfUEVSX0tFWSwKICAgIGZyYW1lX2RpZyAtMQogICAgaW50IDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBkdXAKICAgIGludCAzNTAKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjQ1NgogICAgLy8gYXAuT3BVcEZlZVNvdXJjZS5Hcm91cENyZWRpdCwKICAgIGludCAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo0NTQtNDU3CiAgICAvLyBhcC5lbnN1cmVfYnVkZ2V0KAogICAgLy8gICAgIGxvYW5fa2V5cy5sZW5ndGggKiBERUZBVUxUX09QQ09ERV9CVURHRVRfUEVSX0tFWSwKICAgIC8vICAgICBhcC5PcFVwRmVlU291cmNlLkdyb3VwQ3JlZGl0LAogICAgLy8gKQogICAgY2FsbHN1YiBlbnN1cmVfYnVkZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo0NTkKICAgIC8vIHBheW1lbnRfZGVmYXVsdHMgPSBhNC5EeW5hbWljQXJyYXlbUGF5bWVudERlZmF1bHRSZXNwb25zZV0oKQogICAgYnl0ZSAweDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjQ2MAogICAgLy8gZm9yIGluZGV4IGluIGFwLnVyYW5nZShsb2FuX2tleXMubGVuZ3RoKToKICAgIGludCAwCgpoYW5kbGVfcGF5bWVudF9kZWZhdWx0c19mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo0NjAKICAgIC8vIGZvciBpbmRleCBpbiBhcC51cmFuZ2UobG9hbl9rZXlzLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgMgogICAgZnJhbWVfZGlnIDAKICAgIDwKICAgIGJ6IGhhbmRsZV9wYXltZW50X2RlZmF1bHRzX2FmdGVyX2ZvckA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo0NjEKICAgIC8vIGxvYW5fa2V5ID0gbG9hbl9rZXlzW2luZGV4XS5ieXRlcwogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDIKICAgIGR1cAogICAgY292ZXIgMgogICAgaW50IDgKICAgICoKICAgIGludCA4CiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjQ2MgogICAgLy8gW2xvYW5fYnl0ZXMsIGV4aXN0c10gPSBvcC5Cb3guZ2V0KGxvYW5fcmVjb3JkX2tleShsb2FuX2tleSkpCiAgICBkdXAKICAgIGNhbGxzdWIgbG9hbl9yZWNvcmRfa2V5CiAgICBib3hfZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo0NjMKICAgIC8vIGFzc2VydCBleGlzdHMsICJBIHJlY2NvcmQgd2l0aCB0aGUgbG9hbl9rZXkgcGFzc2VkIHdhcyBub3QgZm91bmQiCiAgICBhc3NlcnQgLy8gQSByZWNjb3JkIHdpdGggdGhlIGxvYW5fa2V5IHBhc3NlZCB3YXMgbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo0NjcKICAgIC8vIGFwLkdsb2JhbC5sYXRlc3RfdGltZXN0YW1wID4gbG9hbi5wYXltZW50X2NvbXBsZXRpb25fdGltZXN0YW1wLm5hdGl2ZQogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgc3dhcAogICAgZHVwCiAgICBleHRyYWN0IDU0IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICB1bmNvdmVyIDIKICAgIDwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjQ2Ni00NjgKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgYXAuR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAgPiBsb2FuLnBheW1lbnRfY29tcGxldGlvbl90aW1lc3RhbXAubmF0aXZlCiAgICAvLyApLCAiVGhlIGxvYW4gaXMgbm90IG92ZXJkdWUiCiAgICBhc3NlcnQgLy8gVGhlIGxvYW4gaXMgbm90IG92ZXJkdWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjQ3MAogICAgLy8gbG9hbi5wYXltZW50X3JvdW5kcy5uYXRpdmUgLSBsb2FuLmNvbXBsZXRlZF9wYXltZW50X3JvdW5kcy5uYXRpdmUKICAgIGR1cAogICAgZXh0cmFjdCAzIDEgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICBzd2FwCiAgICBkdXAKICAgIGV4dHJhY3QgNCAxIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NDY5LTQ3MQogICAgLy8gb3V0c3RhbmRpbmdfcm91bmRzID0gKAogICAgLy8gICAgIGxvYW4ucGF5bWVudF9yb3VuZHMubmF0aXZlIC0gbG9hbi5jb21wbGV0ZWRfcGF5bWVudF9yb3VuZHMubmF0aXZlCiAgICAvLyApCiAgICB1bmNvdmVyIDIKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjQ3MAogICAgLy8gbG9hbi5wYXltZW50X3JvdW5kcy5uYXRpdmUgLSBsb2FuLmNvbXBsZXRlZF9wYXltZW50X3JvdW5kcy5uYXRpdmUKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjQ3MgogICAgLy8gYXNzZXJ0IG91dHN0YW5kaW5nX3JvdW5kcyA+IDAsICJUaGUgbG9hbiBoYXMgbm8gb3V0c3RhbmRpbmcgcGF5bWVudCByb3VuZHMiCiAgICBkdXAKICAgIGFzc2VydCAvLyBUaGUgbG9hbiBoYXMgbm8gb3V0c3RhbmRpbmcgcGF5bWVudCByb3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjQ3MwogICAgLy8gYXNzZXJ0IG5vdCBsb2FuLnBheW1lbnRfZGVmYXVsdGVkLCAiVGhlIGxvYW4gaGFzIGFscmVhZHkgYmVlbiBkZWZhdWx0ZWQiCiAgICBkaWcgMQogICAgaW50IDQyCiAgICBnZXRiaXQKICAgIGJ5dGUgMHgwMAogICAgaW50IDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBieXRlIDB4MDAKICAgID09CiAgICBhc3NlcnQgLy8gVGhlIGxvYW4gaGFzIGFscmVhZHkgYmVlbiBkZWZhdWx0ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjQ3NgogICAgLy8gc2VsZi5jYWxjdWxhdGVfcm91bmRfcGF5bWVudF9hbW91bnQobG9hbikgKiBvdXRzdGFuZGluZ19yb3VuZHMKICAgIHN3YXAKICAgIGNhbGxzdWIgY2FsY3VsYXRlX3JvdW5kX3BheW1lbnRfYW1vdW50CiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo0NzUtNDc3CiAgICAvLyBvdXRzdGFuZGluZ19hbW91bnQgPSAoCiAgICAvLyAgICAgc2VsZi5jYWxjdWxhdGVfcm91bmRfcGF5bWVudF9hbW91bnQobG9hbikgKiBvdXRzdGFuZGluZ19yb3VuZHMKICAgIC8vICkKICAgIHVuY292ZXIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NDc2CiAgICAvLyBzZWxmLmNhbGN1bGF0ZV9yb3VuZF9wYXltZW50X2Ftb3VudChsb2FuKSAqIG91dHN0YW5kaW5nX3JvdW5kcwogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NDc4CiAgICAvLyBjb2xsYXRlcmFsX2Ftb3VudCA9IHNlbGYuY29sbGF0ZXJhbF9zZWl6dXJlX2Ftb3VudChsb2FuLCBvdXRzdGFuZGluZ19hbW91bnQpCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGNhbGxzdWIgY29sbGF0ZXJhbF9zZWl6dXJlX2Ftb3VudAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo0NzktNDgxCiAgICAvLyByZXBheW1lbnRfa2V5ID0gc2VsZi5yZWNvcmRfcGF5bWVudF9kZWZhdWx0KAogICAgLy8gICAgIGxvYW5fa2V5LCBvdXRzdGFuZGluZ19hbW91bnQsIGNvbGxhdGVyYWxfYW1vdW50CiAgICAvLyApCiAgICBjb3ZlciAyCiAgICBkaWcgMgogICAgY2FsbHN1YiByZWNvcmRfcGF5bWVudF9kZWZhdWx0CiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo0ODItNDg3CiAgICAvLyBwYXltZW50X2RlZmF1bHRzLmFwcGVuZCgKICAgIC8vICAgICBQYXltZW50RGVmYXVsdFJlc3BvbnNlKAogICAgLy8gICAgICAgICByZXBheW1lbnRfa2V5PVJlY29yZEtleS5mcm9tX2J5dGVzKHJlcGF5bWVudF9rZXkpLAogICAgLy8gICAgICAgICBjb2xsYXRlcmFsX3NlaXplZD1hNC5VSW50NjQoY29sbGF0ZXJhbF9hbW91bnQpLAogICAgLy8gICAgICkKICAgIC8vICkKICAgIGZyYW1lX2RpZyAxCiAgICBleHRyYWN0IDIgMAogICAgY292ZXIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NDg1CiAgICAvLyBjb2xsYXRlcmFsX3NlaXplZD1hNC5VSW50NjQoY29sbGF0ZXJhbF9hbW91bnQpLAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NDgzLTQ4NgogICAgLy8gUGF5bWVudERlZmF1bHRSZXNwb25zZSgKICAgIC8vICAgICByZXBheW1lbnRfa2V5PVJlY29yZEtleS5mcm9tX2J5dGVzKHJlcGF5bWVudF9rZXkpLAogICAgLy8gICAgIGNvbGxhdGVyYWxfc2VpemVkPWE0LlVJbnQ2NChjb2xsYXRlcmFsX2Ftb3VudCksCiAgICAvLyApCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjQ4Mi00ODcKICAgIC8vIHBheW1lbnRfZGVmYXVsdHMuYXBwZW5kKAogICAgLy8gICAgIFBheW1lbnREZWZhdWx0UmVzcG9uc2UoCiAgICAvLyAgICAgICAgIHJlcGF5bWVudF9rZXk9UmVjb3JkS2V5LmZyb21fYnl0ZXMocmVwYXltZW50X2tleSksCiAgICAvLyAgICAgICAgIGNvbGxhdGVyYWxfc2VpemVkPWE0LlVJbnQ2NChjb2xsYXRlcmFsX2Ftb3VudCksCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgY29uY2F0CiAgICBkdXAKICAgIGxlbgogICAgaW50IDE2CiAgICAvCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9idXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjQ2MAogICAgLy8gZm9yIGluZGV4IGluIGFwLnVyYW5nZShsb2FuX2tleXMubGVuZ3RoKToKICAgIGludCAxCiAgICArCiAgICBmcmFtZV9idXJ5IDIKICAgIGIgaGFuZGxlX3BheW1lbnRfZGVmYXVsdHNfZm9yX2hlYWRlckAxCgpoYW5kbGVfcGF5bWVudF9kZWZhdWx0c19hZnRlcl9mb3JANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjQ4OAogICAgLy8gcmV0dXJuIHBheW1lbnRfZGVmYXVsdHMKICAgIGZyYW1lX2RpZyAxCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9iYXNlLmNvbnRyYWN0LlphaWJhdHN1QmFzZS5hdXRob3Jpc2VfdHhuKCkgLT4gdm9pZDoKYXV0aG9yaXNlX3R4bjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjEzOC0xMzkKICAgIC8vIEBhcC5zdWJyb3V0aW5lCiAgICAvLyBkZWYgYXV0aG9yaXNlX3R4bihzZWxmKSAtPiBOb25lOgogICAgcHJvdG8gMCAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToxNDEKICAgIC8vIGFwLlR4bi5zZW5kZXIKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjE0MC0xNDIKICAgIC8vIGFzc2VydCBzZWxmLmlzX2FkbWluKAogICAgLy8gICAgIGFwLlR4bi5zZW5kZXIKICAgIC8vICksICJZb3UgYXJlIG5vdCBhdXRob3Jpc2VkIHRvIHBlcmZvcm0gdGhpcyBhY3Rpb24iCiAgICBjYWxsc3ViIGlzX2FkbWluCiAgICBhc3NlcnQgLy8gWW91IGFyZSBub3QgYXV0aG9yaXNlZCB0byBwZXJmb3JtIHRoaXMgYWN0aW9uCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfYmFzZS5jb250cmFjdC5aYWliYXRzdUJhc2UuaXNfYWRtaW4oYWNjb3VudDogYnl0ZXMpIC0+IHVpbnQ2NDoKaXNfYWRtaW46CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToxNDgtMTQ5CiAgICAvLyBAYXAuc3Vicm91dGluZQogICAgLy8gZGVmIGlzX2FkbWluKHNlbGYsIGFjY291bnQ6IGFwLkFjY291bnQpIC0+IGJvb2w6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjE1MAogICAgLy8gaWYgYWNjb3VudCA9PSBvcC5HbG9iYWwuY3JlYXRvcl9hZGRyZXNzOgogICAgZnJhbWVfZGlnIC0xCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgID09CiAgICBieiBpc19hZG1pbl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjE1MQogICAgLy8gcmV0dXJuIFRydWUKICAgIGludCAxCiAgICByZXRzdWIKCmlzX2FkbWluX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjE1MgogICAgLy8gX2xlbmd0aCwgZXhpc3RzID0gb3AuQm94Lmxlbmd0aChzZWxmLmFkbWluX2tleShhY2NvdW50KSkKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBhZG1pbl9rZXkKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTUzCiAgICAvLyByZXR1cm4gZXhpc3RzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfYmFzZS5jb250cmFjdC5aYWliYXRzdUJhc2UuYWRtaW5fa2V5KGFjY291bnQ6IGJ5dGVzKSAtPiBieXRlczoKYWRtaW5fa2V5OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTQ0LTE0NQogICAgLy8gQGFwLnN1YnJvdXRpbmUKICAgIC8vIGRlZiBhZG1pbl9rZXkoc2VsZiwgYWNjb3VudDogYXAuQWNjb3VudCkgLT4gYXAuQnl0ZXM6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjE0NgogICAgLy8gcmV0dXJuIG9wLmNvbmNhdChBRE1JTl9LRVlfUFJFRklYLCBhY2NvdW50LmJ5dGVzKQogICAgYnl0ZSAweDQxCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2xvYW4uY29udHJhY3QuWmFpYmF0c3VMb2FuLmNvbGxhdGVyYWxfc2VpenVyZV9hbW91bnQobG9hbjogYnl0ZXMsIG91dHN0YW5kaW5nX2Ftb3VudDogdWludDY0KSAtPiB1aW50NjQsIGJ5dGVzOgpjb2xsYXRlcmFsX3NlaXp1cmVfYW1vdW50OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6ODQyLTg0NQogICAgLy8gQGFwLnN1YnJvdXRpbmUKICAgIC8vIGRlZiBjb2xsYXRlcmFsX3NlaXp1cmVfYW1vdW50KAogICAgLy8gICAgIHNlbGYsIGxvYW46IExvYW5SZWNvcmQsIG91dHN0YW5kaW5nX2Ftb3VudDogYXAuVUludDY0CiAgICAvLyApIC0+IGFwLlVJbnQ2NDoKICAgIHByb3RvIDIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6ODUyCiAgICAvLyBwcmluY2lwYWxfYXNzZXQgPSBhcC5Bc3NldChsb2FuLnByaW5jaXBhbF9hc3NldF9pZC5uYXRpdmUpCiAgICBmcmFtZV9kaWcgLTIKICAgIGV4dHJhY3QgNiA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6ODUzCiAgICAvLyBjb2xsYXRlcmFsX2Fzc2V0ID0gYXAuQXNzZXQobG9hbi5jb2xsYXRlcmFsX2Fzc2V0X2lkLm5hdGl2ZSkKICAgIGZyYW1lX2RpZyAtMgogICAgZXh0cmFjdCAxNCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6ODU0CiAgICAvLyBwcmluY2lwYWxfcHJpY2UgPSBzZWxmLmdldF9hc3NldF9wcmljZShwcmluY2lwYWxfYXNzZXQpCiAgICBkaWcgMQogICAgY2FsbHN1YiBnZXRfYXNzZXRfcHJpY2UKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5Ojg1NQogICAgLy8gY29sbGF0ZXJhbF9wcmljZSA9IHNlbGYuZ2V0X2Fzc2V0X3ByaWNlKGNvbGxhdGVyYWxfYXNzZXQpCiAgICBkdXAKICAgIGNhbGxzdWIgZ2V0X2Fzc2V0X3ByaWNlCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo4NTYKICAgIC8vIGFzc2VydCBjb2xsYXRlcmFsX3ByaWNlID4gMCwgIlRoZSBhc2EgaXMgb2Ygbm8gdmFsdWUgb3IgaXMgbm90IHN1cHBvcnRlZCIKICAgIGR1cAogICAgYXNzZXJ0IC8vIFRoZSBhc2EgaXMgb2Ygbm8gdmFsdWUgb3IgaXMgbm90IHN1cHBvcnRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6ODU4CiAgICAvLyBzZWl6dXJlX2Ftb3VudCA9IGxvYW4uY29sbGF0ZXJhbF9hc3NldF9hbW91bnQubmF0aXZlCiAgICBmcmFtZV9kaWcgLTIKICAgIGV4dHJhY3QgMzggOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgIGR1cAogICAgY292ZXIgNQogICAgY292ZXIgNQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6ODYwCiAgICAvLyBhcC5CaWdVSW50KG91dHN0YW5kaW5nX2Ftb3VudCkKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6ODYxCiAgICAvLyAqIGFwLkJpZ1VJbnQocHJpbmNpcGFsX3ByaWNlKQogICAgdW5jb3ZlciAzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo4NjAtODYxCiAgICAvLyBhcC5CaWdVSW50KG91dHN0YW5kaW5nX2Ftb3VudCkKICAgIC8vICogYXAuQmlnVUludChwcmluY2lwYWxfcHJpY2UpCiAgICBiKgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6ODYyCiAgICAvLyAqIGFwLkJpZ1VJbnQoYXAuVUludDY0KDEwKSAqKiBjb2xsYXRlcmFsX2Fzc2V0LmRlY2ltYWxzKQogICAgdW5jb3ZlciAyCiAgICBhc3NldF9wYXJhbXNfZ2V0IEFzc2V0RGVjaW1hbHMKICAgIGFzc2VydCAvLyBhc3NldCBleGlzdHMKICAgIGludCAxMAogICAgc3dhcAogICAgZXhwCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo4NjAtODYyCiAgICAvLyBhcC5CaWdVSW50KG91dHN0YW5kaW5nX2Ftb3VudCkKICAgIC8vICogYXAuQmlnVUludChwcmluY2lwYWxfcHJpY2UpCiAgICAvLyAqIGFwLkJpZ1VJbnQoYXAuVUludDY0KDEwKSAqKiBjb2xsYXRlcmFsX2Fzc2V0LmRlY2ltYWxzKQogICAgYioKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5Ojg2NAogICAgLy8gY29sbGF0ZXJhbF91bml0X3ZhbHVlID0gYXAuQmlnVUludChjb2xsYXRlcmFsX3ByaWNlKSAqIGFwLkJpZ1VJbnQoCiAgICBzd2FwCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo4NjUKICAgIC8vIGFwLlVJbnQ2NCgxMCkgKiogcHJpbmNpcGFsX2Fzc2V0LmRlY2ltYWxzCiAgICB1bmNvdmVyIDIKICAgIGFzc2V0X3BhcmFtc19nZXQgQXNzZXREZWNpbWFscwogICAgYXNzZXJ0IC8vIGFzc2V0IGV4aXN0cwogICAgaW50IDEwCiAgICBzd2FwCiAgICBleHAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5Ojg2NC04NjYKICAgIC8vIGNvbGxhdGVyYWxfdW5pdF92YWx1ZSA9IGFwLkJpZ1VJbnQoY29sbGF0ZXJhbF9wcmljZSkgKiBhcC5CaWdVSW50KAogICAgLy8gICAgIGFwLlVJbnQ2NCgxMCkgKiogcHJpbmNpcGFsX2Fzc2V0LmRlY2ltYWxzCiAgICAvLyApCiAgICBpdG9iCiAgICBiKgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6ODY3CiAgICAvLyBhbW91bnQgPSBvdXRzdGFuZGluZ192YWx1ZSAvLyBjb2xsYXRlcmFsX3VuaXRfdmFsdWUKICAgIGIvCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6ODY4CiAgICAvLyBpZiBhbW91bnQgPCBhcC5CaWdVSW50KHNlaXp1cmVfYW1vdW50KToKICAgIGl0b2IKICAgIGI8CiAgICBieiBjb2xsYXRlcmFsX3NlaXp1cmVfYW1vdW50X2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6ODY5CiAgICAvLyBzZWl6dXJlX2Ftb3VudCA9IG9wLmJ0b2koYW1vdW50LmJ5dGVzKQogICAgZnJhbWVfZGlnIDEKICAgIGJ0b2kKICAgIGZyYW1lX2J1cnkgMAoKY29sbGF0ZXJhbF9zZWl6dXJlX2Ftb3VudF9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo4NzAKICAgIC8vIHJldHVybiBzZWl6dXJlX2Ftb3VudAogICAgZnJhbWVfZGlnIDAKICAgIGZyYW1lX2RpZyAtMgogICAgdW5jb3ZlciAzCiAgICB1bmNvdmVyIDMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLmNvbnRyYWN0LlphaWJhdHN1TG9hbi5kZWxldGVfbG9hbihsb2FuX2tleTogYnl0ZXMpIC0+IHZvaWQ6CmRlbGV0ZV9sb2FuOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NDkwLTQ5MQogICAgLy8gQGFwLmFyYzQuYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBkZWxldGVfbG9hbihzZWxmLCBsb2FuX2tleTogYXAuQnl0ZXMpIC0+IE5vbmU6CiAgICBwcm90byAxIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjQ5MgogICAgLy8gYXNzZXJ0IGxvYW5fZXhpc3RzKGxvYW5fa2V5KSwgIkEgbG9hbiB3aXRoIHRoaXMga2V5IHdhcyBub3QgZm91bmQiCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgbG9hbl9leGlzdHMKICAgIGFzc2VydCAvLyBBIGxvYW4gd2l0aCB0aGlzIGtleSB3YXMgbm90IGZvdW5kCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo0OTMKICAgIC8vIHNlbGYucmVtb3ZlX2xvYW4obG9hbl9rZXkpCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgcmVtb3ZlX2xvYW4KICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLmNvbnRyYWN0LlphaWJhdHN1TG9hbi5taWdyYXRlX2xvYW5fcmVjb3JkKGxlZ2FjeV9sb2FuX2tleTogYnl0ZXMpIC0+IGJ5dGVzOgptaWdyYXRlX2xvYW5fcmVjb3JkOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NDk1LTQ5NgogICAgLy8gQGFwLmFyYzQuYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBtaWdyYXRlX2xvYW5fcmVjb3JkKHNlbGYsIGxlZ2FjeV9sb2FuX2tleTogYXAuQnl0ZXMpIC0+IFJlY29yZEtleToKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NTA2CiAgICAvLyBzZWxmLmF1dGhvcmlzZV90eG4oKQogICAgY2FsbHN1YiBhdXRob3Jpc2VfdHhuCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo1MDcKICAgIC8vIFtsZWdhY3lfYnl0ZXMsIGV4aXN0c10gPSBvcC5Cb3guZ2V0KGxlZ2FjeV9sb2FuX2tleSkKICAgIGZyYW1lX2RpZyAtMQogICAgYm94X2dldAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NTA4CiAgICAvLyBhc3NlcnQgZXhpc3RzLCAiQSByZWNjb3JkIHdpdGggdGhlIGxvYW5fa2V5IHBhc3NlZCB3YXMgbm90IGZvdW5kIgogICAgYXNzZXJ0IC8vIEEgcmVjY29yZCB3aXRoIHRoZSBsb2FuX2tleSBwYXNzZWQgd2FzIG5vdCBmb3VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NTEyCiAgICAvLyBkZXRhaWxzLnBheW1lbnRfcmVjaXBpZW50cy5sZW5ndGggPD0gTUFYX0xPQU5fUkVDSVBJRU5UUwogICAgZHVwCiAgICBpbnQgNjIKICAgIGV4dHJhY3RfdWludDE2CiAgICBzd2FwCiAgICBkdXAKICAgIGxlbgogICAgc3dhcAogICAgZHVwCiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgMwogICAgc3Vic3RyaW5nMwogICAgaW50IDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnQgNjQKICAgIDw9CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo1MTEtNTEzCiAgICAvLyBhc3NlcnQgKAogICAgLy8gICAgIGRldGFpbHMucGF5bWVudF9yZWNpcGllbnRzLmxlbmd0aCA8PSBNQVhfTE9BTl9SRUNJUElFTlRTCiAgICAvLyApLCAiQSBsb2FuIGNhbiBoYXZlIGF0IG1vc3QgNjQgcGF5bWVudF9yZWNpcGllbnRzIgogICAgYXNzZXJ0IC8vIEEgbG9hbiBjYW4gaGF2ZSBhdCBtb3N0IDY0IHBheW1lbnRfcmVjaXBpZW50cwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NTE0CiAgICAvLyByZWNvcmQgPSBzZWxmLmJ1aWxkX2xvYW5fcmVjb3JkKGRldGFpbHMpCiAgICBjYWxsc3ViIGJ1aWxkX2xvYW5fcmVjb3JkCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo1MTUKICAgIC8vIGxvYW5fa2V5ID0gc2VsZi5uZXh0X3JlY29yZF9rZXkoKQogICAgY2FsbHN1YiBuZXh0X3JlY29yZF9rZXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjUxNgogICAgLy8gb3AuQm94LmRlbGV0ZShsZWdhY3lfbG9hbl9rZXkpCiAgICBmcmFtZV9kaWcgLTEKICAgIGJveF9kZWwKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NTE3CiAgICAvLyBvcC5Cb3gucHV0KGxvYW5fcmVjb3JkX2tleShsb2FuX2tleSksIHJlY29yZC5ieXRlcykKICAgIGR1cAogICAgY2FsbHN1YiBsb2FuX3JlY29yZF9rZXkKICAgIGRpZyAyCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo1MTgKICAgIC8vIHB1dF9sb2FuX3JlY2lwaWVudHMobG9hbl9rZXksIGRldGFpbHMucGF5bWVudF9yZWNpcGllbnRzLmNvcHkoKSkKICAgIGRpZyAyCiAgICBpbnQgNjIKICAgIGV4dHJhY3RfdWludDE2CiAgICBzd2FwCiAgICBkaWcgMwogICAgbGVuCiAgICBzd2FwCiAgICB1bmNvdmVyIDQKICAgIHVuY292ZXIgMwogICAgdW5jb3ZlciAzCiAgICBzdWJzdHJpbmczCiAgICBkaWcgMQogICAgc3dhcAogICAgY2FsbHN1YiBwdXRfbG9hbl9yZWNpcGllbnRzCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjUxOQogICAgLy8gc2VsZi5hZGRfYWN0aXZlX2xvYW4obG9hbl9rZXkpCiAgICBkdXAKICAgIGNhbGxzdWIgYWRkX2FjdGl2ZV9sb2FuCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo1MjAKICAgIC8vIHNlbGYuZW1pdF9sb2FuX2luaXRpYXRlZChsb2FuX2tleSwgcmVjb3JkKQogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGNhbGxzdWIgZW1pdF9sb2FuX2luaXRpYXRlZAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo1MjEKICAgIC8vIHJldHVybiBSZWNvcmRLZXkuZnJvbV9ieXRlcyhsb2FuX2tleSkKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLmNvbnRyYWN0LlphaWJhdHN1TG9hbi5nZXRfYm9ycm93ZXJfbG9hbnMoYm9ycm93ZXI6IGJ5dGVzKSAtPiBieXRlczoKZ2V0X2JvcnJvd2VyX2xvYW5zOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NTIzLTUyNAogICAgLy8gQGE0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF9ib3Jyb3dlcl9sb2FucyhzZWxmLCBib3Jyb3dlcjogYXAuQWNjb3VudCkgLT4gUmVjb3JkS2V5QXJyYXk6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjUyOQogICAgLy8gbG9hbl9rZXlzID0gUmVjb3JkS2V5QXJyYXkoKQogICAgYnl0ZSAweDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjUzMAogICAgLy8gZm9yIGluZGV4IGluIGFwLnVyYW5nZShib3Jyb3dlcl9sb2FuX2NvdW50KGJvcnJvd2VyKSk6CiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgYm9ycm93ZXJfbG9hbl9jb3VudAogICAgaW50IDAKCmdldF9ib3Jyb3dlcl9sb2Fuc19mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo1MzAKICAgIC8vIGZvciBpbmRleCBpbiBhcC51cmFuZ2UoYm9ycm93ZXJfbG9hbl9jb3VudChib3Jyb3dlcikpOgogICAgZnJhbWVfZGlnIDIKICAgIGZyYW1lX2RpZyAxCiAgICA8CiAgICBieiBnZXRfYm9ycm93ZXJfbG9hbnNfYWZ0ZXJfZm9yQDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjUzMQogICAgLy8gbG9hbl9rZXlzLmFwcGVuZChSZWNvcmRLZXkuZnJvbV9ieXRlcyhib3Jyb3dlcl9sb2FuX2tleShib3Jyb3dlciwgaW5kZXgpKSkKICAgIGZyYW1lX2RpZyAwCiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIC0xCiAgICBmcmFtZV9kaWcgMgogICAgZHVwCiAgICBjb3ZlciAzCiAgICBjYWxsc3ViIGJvcnJvd2VyX2xvYW5fa2V5CiAgICBjb25jYXQKICAgIGR1cAogICAgbGVuCiAgICBpbnQgOAogICAgLwogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo1MzAKICAgIC8vIGZvciBpbmRleCBpbiBhcC51cmFuZ2UoYm9ycm93ZXJfbG9hbl9jb3VudChib3Jyb3dlcikpOgogICAgaW50IDEKICAgICsKICAgIGZyYW1lX2J1cnkgMgogICAgYiBnZXRfYm9ycm93ZXJfbG9hbnNfZm9yX2hlYWRlckAxCgpnZXRfYm9ycm93ZXJfbG9hbnNfYWZ0ZXJfZm9yQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo1MzIKICAgIC8vIHJldHVybiBsb2FuX2tleXMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLmNvbnRyYWN0LlphaWJhdHN1TG9hbi5nZXRfbG9hbl9zdGF0dXNlcyhsb2FuX2tleXM6IGJ5dGVzKSAtPiBieXRlczoKZ2V0X2xvYW5fc3RhdHVzZXM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo1MzQtNTM1CiAgICAvLyBAYTQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZ2V0X2xvYW5fc3RhdHVzZXMoc2VsZiwgbG9hbl9rZXlzOiBSZWNvcmRLZXlBcnJheSkgLT4gYTQuRHluYW1pY0FycmF5W2E0LlVJbnQ4XToKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NTM3CiAgICAvLyBzdGF0dXNlcyA9IGE0LkR5bmFtaWNBcnJheVthNC5VSW50OF0oKQogICAgYnl0ZSAweDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjUzOAogICAgLy8gZm9yIGluZGV4IGluIGFwLnVyYW5nZShsb2FuX2tleXMubGVuZ3RoKToKICAgIGZyYW1lX2RpZyAtMQogICAgaW50IDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnQgMAoKZ2V0X2xvYW5fc3RhdHVzZXNfZm9yX2hlYWRlckAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NTM4CiAgICAvLyBmb3IgaW5kZXggaW4gYXAudXJhbmdlKGxvYW5fa2V5cy5sZW5ndGgpOgogICAgZnJhbWVfZGlnIDIKICAgIGZyYW1lX2RpZyAxCiAgICA8CiAgICBieiBnZXRfbG9hbl9zdGF0dXNlc19hZnRlcl9mb3JANQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NTM5CiAgICAvLyBsb2FuX2tleSA9IGxvYW5fa2V5c1tpbmRleF0uY29weSgpCiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgMiAwCiAgICBmcmFtZV9kaWcgMgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnQgOAogICAgKgogICAgaW50IDgKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NTQwCiAgICAvLyBzdGF0dXNlcy5hcHBlbmQoYTQuVUludDgoc2VsZi5sb2FuX3N0YXR1cyhsb2FuX2tleS5ieXRlcykpKQogICAgZnJhbWVfZGlnIDAKICAgIGV4dHJhY3QgMiAwCiAgICBzd2FwCiAgICBjYWxsc3ViIGxvYW5fc3RhdHVzCiAgICBpdG9iCiAgICBleHRyYWN0IDcgMQogICAgY29uY2F0CiAgICBkdXAKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo1MzgKICAgIC8vIGZvciBpbmRleCBpbiBhcC51cmFuZ2UobG9hbl9rZXlzLmxlbmd0aCk6CiAgICBpbnQgMQogICAgKwogICAgZnJhbWVfYnVyeSAyCiAgICBiIGdldF9sb2FuX3N0YXR1c2VzX2Zvcl9oZWFkZXJAMQoKZ2V0X2xvYW5fc3RhdHVzZXNfYWZ0ZXJfZm9yQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo1NDEKICAgIC8vIHJldHVybiBzdGF0dXNlcwogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2xvYW4uY29udHJhY3QuWmFpYmF0c3VMb2FuLmxvYW5fc3RhdHVzKGxvYW5fa2V5OiBieXRlcykgLT4gdWludDY0Ogpsb2FuX3N0YXR1czoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjkzMy05MzQKICAgIC8vIEBhcC5zdWJyb3V0aW5lCiAgICAvLyBkZWYgbG9hbl9zdGF0dXMoc2VsZiwgbG9hbl9rZXk6IGFwLkJ5dGVzKSAtPiBhcC5VSW50NjQ6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjkzNQogICAgLy8gaWYgbm90IGxvYW5fZXhpc3RzKGxvYW5fa2V5KToKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBsb2FuX2V4aXN0cwogICAgYm56IGxvYW5fc3RhdHVzX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6OTM2CiAgICAvLyByZXR1cm4gYXAuVUludDY0KExPQU5fU1RBVFVTX05PVF9GT1VORCkKICAgIGludCAwCiAgICByZXRzdWIKCmxvYW5fc3RhdHVzX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjkzNwogICAgLy8gaWYgbm90IGxvYW5fcHJpbmNpcGFsX3BhaWQobG9hbl9rZXkpOgogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIGxvYW5fcHJpbmNpcGFsX3BhaWQKICAgIGJueiBsb2FuX3N0YXR1c19hZnRlcl9pZl9lbHNlQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjkzOAogICAgLy8gcmV0dXJuIGFwLlVJbnQ2NChMT0FOX1NUQVRVU19BV0FJVElOR19QUklOQ0lQQUwpCiAgICBpbnQgMQogICAgcmV0c3ViCgpsb2FuX3N0YXR1c19hZnRlcl9pZl9lbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo5MzkKICAgIC8vIGlmIGFwLkdsb2JhbC5sYXRlc3RfdGltZXN0YW1wID4gbG9hbl9wYXltZW50X2NvbXBsZXRpb25fdGltZXN0YW1wKGxvYW5fa2V5KToKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBsb2FuX3BheW1lbnRfY29tcGxldGlvbl90aW1lc3RhbXAKICAgID4KICAgIGJ6IGxvYW5fc3RhdHVzX2FmdGVyX2lmX2Vsc2VANgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6OTQwCiAgICAvLyByZXR1cm4gYXAuVUludDY0KExPQU5fU1RBVFVTX09WRVJEVUUpCiAgICBpbnQgMwogICAgcmV0c3ViCgpsb2FuX3N0YXR1c19hZnRlcl9pZl9lbHNlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo5NDEKICAgIC8vIHJldHVybiBhcC5VSW50NjQoTE9BTl9TVEFUVVNfQUNUSVZFKQogICAgaW50IDIKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLnN0b3JhZ2UubG9hbl9wcmluY2lwYWxfcGFpZChsb2FuX2tleTogYnl0ZXMpIC0+IHVpbnQ2NDoKbG9hbl9wcmluY2lwYWxfcGFpZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL3N0b3JhZ2UucHk6MjE2LTIxNwogICAgLy8gQGFwLnN1YnJvdXRpbmUKICAgIC8vIGRlZiBsb2FuX3ByaW5jaXBhbF9wYWlkKGxvYW5fa2V5OiBhcC5CeXRlcykgLT4gYm9vbDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vc3RvcmFnZS5weToyMTgKICAgIC8vIHJldHVybiByZWFkX2ZsYWcobG9hbl9rZXksIGFwLlVJbnQ2NChQUklOQ0lQQUxfUEFJRF9CSVQpKQogICAgZnJhbWVfZGlnIC0xCiAgICBpbnQgMQogICAgY2FsbHN1YiByZWFkX2ZsYWcKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLnN0b3JhZ2UubG9hbl9wYXltZW50X2NvbXBsZXRpb25fdGltZXN0YW1wKGxvYW5fa2V5OiBieXRlcykgLT4gdWludDY0Ogpsb2FuX3BheW1lbnRfY29tcGxldGlvbl90aW1lc3RhbXA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9zdG9yYWdlLnB5OjIwNi0yMDcKICAgIC8vIEBhcC5zdWJyb3V0aW5lCiAgICAvLyBkZWYgbG9hbl9wYXltZW50X2NvbXBsZXRpb25fdGltZXN0YW1wKGxvYW5fa2V5OiBhcC5CeXRlcykgLT4gYXAuVUludDY0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9zdG9yYWdlLnB5OjIwOAogICAgLy8gcmV0dXJuIHJlYWRfdWludDY0KGxvYW5fa2V5LCBhcC5VSW50NjQoUEFZTUVOVF9DT01QTEVUSU9OX1RJTUVTVEFNUCkpCiAgICBmcmFtZV9kaWcgLTEKICAgIGludCA1NAogICAgY2FsbHN1YiByZWFkX3VpbnQ2NAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2xvYW4uY29udHJhY3QuWmFpYmF0c3VMb2FuLmdldF9hbW91bnRzX2R1ZShsb2FuX2tleXM6IGJ5dGVzKSAtPiBieXRlczoKZ2V0X2Ftb3VudHNfZHVlOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NTQzLTU0NAogICAgLy8gQGE0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF9hbW91bnRzX2R1ZShzZWxmLCBsb2FuX2tleXM6IFJlY29yZEtleUFycmF5KSAtPiBhNC5EeW5hbWljQXJyYXlbYTQuVUludDY0XToKICAgIHByb3RvIDEgMQogICAgaW50IDAKICAgIGJ5dGUgIiIKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NTUwCiAgICAvLyBhbW91bnRzX2R1ZSA9IGE0LkR5bmFtaWNBcnJheVthNC5VSW50NjRdKCkKICAgIGJ5dGUgMHgwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo1NTEKICAgIC8vIGZvciBpbmRleCBpbiBhcC51cmFuZ2UobG9hbl9rZXlzLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgLTEKICAgIGludCAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgaW50IDAKCmdldF9hbW91bnRzX2R1ZV9mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo1NTEKICAgIC8vIGZvciBpbmRleCBpbiBhcC51cmFuZ2UobG9hbl9rZXlzLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgNQogICAgZnJhbWVfZGlnIDQKICAgIDwKICAgIGJ6IGdldF9hbW91bnRzX2R1ZV9hZnRlcl9mb3JAOQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NTUyCiAgICAvLyBsb2FuX2tleSA9IGxvYW5fa2V5c1tpbmRleF0uY29weSgpCiAgICBmcmFtZV9kaWcgLTEKICAgIGV4dHJhY3QgMiAwCiAgICBmcmFtZV9kaWcgNQogICAgaW50IDgKICAgICoKICAgIGludCA4CiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo1NTMKICAgIC8vIGFtb3VudF9kdWUgPSBhcC5VSW50NjQoMCkKICAgIGludCAwCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGZyYW1lX2J1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NTU0CiAgICAvLyBpZiBzZWxmLmxvYW5fcmVtYWluaW5nX3JvdW5kcyhsb2FuX2tleS5ieXRlcyk6CiAgICBjYWxsc3ViIGxvYW5fcmVtYWluaW5nX3JvdW5kcwogICAgc3dhcAogICAgZnJhbWVfYnVyeSAyCiAgICBieiBnZXRfYW1vdW50c19kdWVfYWZ0ZXJfaWZfZWxzZUA2CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo1NTUKICAgIC8vIGlmIGxvYW5fcHJpbmNpcGFsX3BhaWQobG9hbl9rZXkuYnl0ZXMpOgogICAgZnJhbWVfZGlnIDAKICAgIGNhbGxzdWIgbG9hbl9wcmluY2lwYWxfcGFpZAogICAgYnogZ2V0X2Ftb3VudHNfZHVlX2FmdGVyX2lmX2Vsc2VANQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NTU2CiAgICAvLyBhbW91bnRfZHVlID0gc2VsZi5sb2FuX3JvdW5kX3BheW1lbnRfYW1vdW50KGxvYW5fa2V5LmJ5dGVzKQogICAgZnJhbWVfZGlnIDAKICAgIGNhbGxzdWIgbG9hbl9yb3VuZF9wYXltZW50X2Ftb3VudAogICAgZnJhbWVfYnVyeSAxCgpnZXRfYW1vdW50c19kdWVfYWZ0ZXJfaWZfZWxzZUA1OgogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2J1cnkgMgoKZ2V0X2Ftb3VudHNfZHVlX2FmdGVyX2lmX2Vsc2VANjoKICAgIGZyYW1lX2RpZyAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo1NTcKICAgIC8vIGFtb3VudHNfZHVlLmFwcGVuZChhNC5VSW50NjQoYW1vdW50X2R1ZSkpCiAgICBmcmFtZV9kaWcgMwogICAgZXh0cmFjdCAyIDAKICAgIHN3YXAKICAgIGl0b2IKICAgIGNvbmNhdAogICAgZHVwCiAgICBsZW4KICAgIGludCA4CiAgICAvCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9idXJ5IDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjU1MQogICAgLy8gZm9yIGluZGV4IGluIGFwLnVyYW5nZShsb2FuX2tleXMubGVuZ3RoKToKICAgIGZyYW1lX2RpZyA1CiAgICBpbnQgMQogICAgKwogICAgZnJhbWVfYnVyeSA1CiAgICBiIGdldF9hbW91bnRzX2R1ZV9mb3JfaGVhZGVyQDEKCmdldF9hbW91bnRzX2R1ZV9hZnRlcl9mb3JAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjU1OAogICAgLy8gcmV0dXJuIGFtb3VudHNfZHVlCiAgICBmcmFtZV9kaWcgMwogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfbG9hbi5jb250cmFjdC5aYWliYXRzdUxvYW4ubG9hbl9yZW1haW5pbmdfcm91bmRzKGxvYW5fa2V5OiBieXRlcykgLT4gdWludDY0Ogpsb2FuX3JlbWFpbmluZ19yb3VuZHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo5NDMtOTQ0CiAgICAvLyBAYXAuc3Vicm91dGluZQogICAgLy8gZGVmIGxvYW5fcmVtYWluaW5nX3JvdW5kcyhzZWxmLCBsb2FuX2tleTogYXAuQnl0ZXMpIC0+IGFwLlVJbnQ2NDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6OTQ1CiAgICAvLyBpZiBub3QgbG9hbl9leGlzdHMobG9hbl9rZXkpOgogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIGxvYW5fZXhpc3RzCiAgICBibnogbG9hbl9yZW1haW5pbmdfcm91bmRzX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6OTQ2CiAgICAvLyByZXR1cm4gYXAuVUludDY0KDApCiAgICBpbnQgMAogICAgcmV0c3ViCgpsb2FuX3JlbWFpbmluZ19yb3VuZHNfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6OTQ3CiAgICAvLyByZXR1cm4gbG9hbl9wYXltZW50X3JvdW5kcyhsb2FuX2tleSkgLSBsb2FuX2NvbXBsZXRlZF9wYXltZW50X3JvdW5kcyhsb2FuX2tleSkKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBsb2FuX3BheW1lbnRfcm91bmRzCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgbG9hbl9jb21wbGV0ZWRfcGF5bWVudF9yb3VuZHMKICAgIC0KICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLmNvbnRyYWN0LlphaWJhdHN1TG9hbi5sb2FuX3JvdW5kX3BheW1lbnRfYW1vdW50KGxvYW5fa2V5OiBieXRlcykgLT4gdWludDY0Ogpsb2FuX3JvdW5kX3BheW1lbnRfYW1vdW50OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6OTQ5LTk1MAogICAgLy8gQGFwLnN1YnJvdXRpbmUKICAgIC8vIGRlZiBsb2FuX3JvdW5kX3BheW1lbnRfYW1vdW50KHNlbGYsIGxvYW5fa2V5OiBhcC5CeXRlcykgLT4gYXAuVUludDY0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo5NTItOTU0CiAgICAvLyBwcmluY2lwYWxfcGx1c19pbnRlcmVzdCA9IGxvYW5fcHJpbmNpcGFsX2Fzc2V0X2Ftb3VudCgKICAgIC8vICAgICBsb2FuX2tleQogICAgLy8gKSArIGxvYW5faW50ZXJlc3RfYXNzZXRfYW1vdW50KGxvYW5fa2V5KQogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIGxvYW5fcHJpbmNpcGFsX2Fzc2V0X2Ftb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6OTU0CiAgICAvLyApICsgbG9hbl9pbnRlcmVzdF9hc3NldF9hbW91bnQobG9hbl9rZXkpCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgbG9hbl9pbnRlcmVzdF9hc3NldF9hbW91bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5Ojk1Mi05NTQKICAgIC8vIHByaW5jaXBhbF9wbHVzX2ludGVyZXN0ID0gbG9hbl9wcmluY2lwYWxfYXNzZXRfYW1vdW50KAogICAgLy8gICAgIGxvYW5fa2V5CiAgICAvLyApICsgbG9hbl9pbnRlcmVzdF9hc3NldF9hbW91bnQobG9hbl9rZXkpCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo5NTUKICAgIC8vIHJldHVybiBwcmluY2lwYWxfcGx1c19pbnRlcmVzdCAvLyBsb2FuX3BheW1lbnRfcm91bmRzKGxvYW5fa2V5KQogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIGxvYW5fcGF5bWVudF9yb3VuZHMKICAgIC8KICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLnN0b3JhZ2UubG9hbl9pbnRlcmVzdF9hc3NldF9hbW91bnQobG9hbl9rZXk6IGJ5dGVzKSAtPiB1aW50NjQ6CmxvYW5faW50ZXJlc3RfYXNzZXRfYW1vdW50OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vc3RvcmFnZS5weToxNzEtMTcyCiAgICAvLyBAYXAuc3Vicm91dGluZQogICAgLy8gZGVmIGxvYW5faW50ZXJlc3RfYXNzZXRfYW1vdW50KGxvYW5fa2V5OiBhcC5CeXRlcykgLT4gYXAuVUludDY0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9zdG9yYWdlLnB5OjE3MwogICAgLy8gcmV0dXJuIHJlYWRfdWludDY0KGxvYW5fa2V5LCBhcC5VSW50NjQoSU5URVJFU1RfQVNTRVRfQU1PVU5UKSkKICAgIGZyYW1lX2RpZyAtMQogICAgaW50IDIyCiAgICBjYWxsc3ViIHJlYWRfdWludDY0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfbG9hbi5jb250cmFjdC5aYWliYXRzdUxvYW4uZ2V0X3JlbWFpbmluZ19yb3VuZHMobG9hbl9rZXlzOiBieXRlcykgLT4gYnl0ZXM6CmdldF9yZW1haW5pbmdfcm91bmRzOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NTYwLTU2MwogICAgLy8gQGE0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF9yZW1haW5pbmdfcm91bmRzKAogICAgLy8gICAgIHNlbGYsIGxvYW5fa2V5czogUmVjb3JkS2V5QXJyYXkKICAgIC8vICkgLT4gYTQuRHluYW1pY0FycmF5W2E0LlVJbnQ4XToKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NTY1CiAgICAvLyByZW1haW5pbmdfcm91bmRzID0gYTQuRHluYW1pY0FycmF5W2E0LlVJbnQ4XSgpCiAgICBieXRlIDB4MDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NTY2CiAgICAvLyBmb3IgaW5kZXggaW4gYXAudXJhbmdlKGxvYW5fa2V5cy5sZW5ndGgpOgogICAgZnJhbWVfZGlnIC0xCiAgICBpbnQgMAogICAgZXh0cmFjdF91aW50MTYKICAgIGludCAwCgpnZXRfcmVtYWluaW5nX3JvdW5kc19mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo1NjYKICAgIC8vIGZvciBpbmRleCBpbiBhcC51cmFuZ2UobG9hbl9rZXlzLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgMgogICAgZnJhbWVfZGlnIDEKICAgIDwKICAgIGJ6IGdldF9yZW1haW5pbmdfcm91bmRzX2FmdGVyX2ZvckA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo1NjcKICAgIC8vIGxvYW5fa2V5ID0gbG9hbl9rZXlzW2luZGV4XS5jb3B5KCkKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludCA4CiAgICAqCiAgICBpbnQgOAogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo1NjgtNTcwCiAgICAvLyByZW1haW5pbmdfcm91bmRzLmFwcGVuZCgKICAgIC8vICAgICBhNC5VSW50OChzZWxmLmxvYW5fcmVtYWluaW5nX3JvdW5kcyhsb2FuX2tleS5ieXRlcykpCiAgICAvLyApCiAgICBmcmFtZV9kaWcgMAogICAgZXh0cmFjdCAyIDAKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjU2OQogICAgLy8gYTQuVUludDgoc2VsZi5sb2FuX3JlbWFpbmluZ19yb3VuZHMobG9hbl9rZXkuYnl0ZXMpKQogICAgY2FsbHN1YiBsb2FuX3JlbWFpbmluZ19yb3VuZHMKICAgIGl0b2IKICAgIGV4dHJhY3QgNyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo1NjgtNTcwCiAgICAvLyByZW1haW5pbmdfcm91bmRzLmFwcGVuZCgKICAgIC8vICAgICBhNC5VSW50OChzZWxmLmxvYW5fcmVtYWluaW5nX3JvdW5kcyhsb2FuX2tleS5ieXRlcykpCiAgICAvLyApCiAgICBjb25jYXQKICAgIGR1cAogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjU2NgogICAgLy8gZm9yIGluZGV4IGluIGFwLnVyYW5nZShsb2FuX2tleXMubGVuZ3RoKToKICAgIGludCAxCiAgICArCiAgICBmcmFtZV9idXJ5IDIKICAgIGIgZ2V0X3JlbWFpbmluZ19yb3VuZHNfZm9yX2hlYWRlckAxCgpnZXRfcmVtYWluaW5nX3JvdW5kc19hZnRlcl9mb3JANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjU3MQogICAgLy8gcmV0dXJuIHJlbWFpbmluZ19yb3VuZHMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9sb2FuLmNvbnRyYWN0LlphaWJhdHN1TG9hbi5nZXRfcmVwYXltZW50X3Byb2dyZXNzKHJlcGF5bWVudF9rZXlzOiBieXRlcykgLT4gYnl0ZXM6CmdldF9yZXBheW1lbnRfcHJvZ3Jlc3M6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo1NzMtNTc2CiAgICAvLyBAYTQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZ2V0X3JlcGF5bWVudF9wcm9ncmVzcygKICAgIC8vICAgICBzZWxmLCByZXBheW1lbnRfa2V5czogUmVjb3JkS2V5QXJyYXkKICAgIC8vICkgLT4gYTQuRHluYW1pY0FycmF5W0V4ZWN1dGVMb2FuUmVwYXltZW50UmVzcG9uc2VdOgogICAgcHJvdG8gMSAxCiAgICBpbnQgMAogICAgYnl0ZSAiIgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NTgxCiAgICAvLyBwcm9ncmVzcyA9IGE0LkR5bmFtaWNBcnJheVtFeGVjdXRlTG9hblJlcGF5bWVudFJlc3BvbnNlXSgpCiAgICBieXRlIDB4MDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NTgyCiAgICAvLyBmb3IgaW5kZXggaW4gYXAudXJhbmdlKHJlcGF5bWVudF9rZXlzLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgLTEKICAgIGludCAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgaW50IDAKCmdldF9yZXBheW1lbnRfcHJvZ3Jlc3NfZm9yX2hlYWRlckAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NTgyCiAgICAvLyBmb3IgaW5kZXggaW4gYXAudXJhbmdlKHJlcGF5bWVudF9rZXlzLmxlbmd0aCk6CiAgICBmcmFtZV9kaWcgNAogICAgZnJhbWVfZGlnIDMKICAgIDwKICAgIGJ6IGdldF9yZXBheW1lbnRfcHJvZ3Jlc3NfYWZ0ZXJfZm9yQDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjU4MwogICAgLy8gcmVwYXltZW50X2tleSA9IHJlcGF5bWVudF9rZXlzW2luZGV4XS5jb3B5KCkKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyA0CiAgICBpbnQgOAogICAgKgogICAgaW50IDgKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NTg0CiAgICAvLyBwZXJjZW50YWdlX3BhaWQgPSBhcC5VSW50NjQoMCkKICAgIGludCAwCiAgICBmcmFtZV9idXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjU4NgogICAgLy8gcmVwYXltZW50X3JlY29yZF9rZXkocmVwYXltZW50X2tleS5ieXRlcykKICAgIGNhbGxzdWIgcmVwYXltZW50X3JlY29yZF9rZXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjU4NS01ODcKICAgIC8vIFtyZXBheW1lbnRfYnl0ZXMsIGV4aXN0c10gPSBvcC5Cb3guZ2V0KAogICAgLy8gICAgIHJlcGF5bWVudF9yZWNvcmRfa2V5KHJlcGF5bWVudF9rZXkuYnl0ZXMpCiAgICAvLyApCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjU4OAogICAgLy8gaWYgZXhpc3RzOgogICAgYnogZ2V0X3JlcGF5bWVudF9wcm9ncmVzc19hZnRlcl9pZl9lbHNlQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjU5MAogICAgLy8gcGVyY2VudGFnZV9wYWlkID0gcmVwYXltZW50LnBlcmNlbnRhZ2VfcGFpZC5uYXRpdmUKICAgIGZyYW1lX2RpZyAwCiAgICBleHRyYWN0IDE2IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBidG9pCiAgICBmcmFtZV9idXJ5IDEKCmdldF9yZXBheW1lbnRfcHJvZ3Jlc3NfYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NTkxLTU5NgogICAgLy8gcHJvZ3Jlc3MuYXBwZW5kKAogICAgLy8gICAgIEV4ZWN1dGVMb2FuUmVwYXltZW50UmVzcG9uc2UoCiAgICAvLyAgICAgICAgIGxvYW5fcmVwYXltZW50X2NvbXBsZXRlPWE0LkJvb2wocGVyY2VudGFnZV9wYWlkID09IDEwMDAwKSwKICAgIC8vICAgICAgICAgcGVyY2VudGFnZV9wYWlkPWE0LlVJbnQ2NChwZXJjZW50YWdlX3BhaWQpLAogICAgLy8gICAgICkKICAgIC8vICkKICAgIGZyYW1lX2RpZyAyCiAgICBleHRyYWN0IDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NTkzCiAgICAvLyBsb2FuX3JlcGF5bWVudF9jb21wbGV0ZT1hNC5Cb29sKHBlcmNlbnRhZ2VfcGFpZCA9PSAxMDAwMCksCiAgICBmcmFtZV9kaWcgMQogICAgZHVwCiAgICBpbnQgMTAwMDAKICAgID09CiAgICBieXRlIDB4MDAKICAgIGludCAwCiAgICB1bmNvdmVyIDIKICAgIHNldGJpdAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NTk0CiAgICAvLyBwZXJjZW50YWdlX3BhaWQ9YTQuVUludDY0KHBlcmNlbnRhZ2VfcGFpZCksCiAgICBzd2FwCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo1OTItNTk1CiAgICAvLyBFeGVjdXRlTG9hblJlcGF5bWVudFJlc3BvbnNlKAogICAgLy8gICAgIGxvYW5fcmVwYXltZW50X2NvbXBsZXRlPWE0LkJvb2wocGVyY2VudGFnZV9wYWlkID09IDEwMDAwKSwKICAgIC8vICAgICBwZXJjZW50YWdlX3BhaWQ9YTQuVUludDY0KHBlcmNlbnRhZ2VfcGFpZCksCiAgICAvLyApCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjU5MS01OTYKICAgIC8vIHByb2dyZXNzLmFwcGVuZCgKICAgIC8vICAgICBFeGVjdXRlTG9hblJlcGF5bWVudFJlc3BvbnNlKAogICAgLy8gICAgICAgICBsb2FuX3JlcGF5bWVudF9jb21wbGV0ZT1hNC5Cb29sKHBlcmNlbnRhZ2VfcGFpZCA9PSAxMDAwMCksCiAgICAvLyAgICAgICAgIHBlcmNlbnRhZ2VfcGFpZD1hNC5VSW50NjQocGVyY2VudGFnZV9wYWlkKSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBjb25jYXQKICAgIGR1cAogICAgbGVuCiAgICBpbnQgOQogICAgLwogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfbG9hbi9jb250cmFjdC5weTo1ODIKICAgIC8vIGZvciBpbmRleCBpbiBhcC51cmFuZ2UocmVwYXltZW50X2tleXMubGVuZ3RoKToKICAgIGZyYW1lX2RpZyA0CiAgICBpbnQgMQogICAgKwogICAgZnJhbWVfYnVyeSA0CiAgICBiIGdldF9yZXBheW1lbnRfcHJvZ3Jlc3NfZm9yX2hlYWRlckAxCgpnZXRfcmVwYXltZW50X3Byb2dyZXNzX2FmdGVyX2ZvckA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2xvYW4vY29udHJhY3QucHk6NTk3CiAgICAvLyByZXR1cm4gcHJvZ3Jlc3MKICAgIGZyYW1lX2RpZyAyCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy56YWliYXRzdV9iYXNlLmNvbnRyYWN0LlphaWJhdHN1QmFzZS5jcmVhdGUoKSAtPiB1aW50NjQ6CmNyZWF0ZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjI2LTI3CiAgICAvLyBAYTQuYWJpbWV0aG9kKGNyZWF0ZT0iYWxsb3ciKQogICAgLy8gZGVmIGNyZWF0ZShzZWxmKSAtPiBib29sOgogICAgcHJvdG8gMCAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToyOAogICAgLy8gcmV0dXJuIFRydWUKICAgIGludCAxCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfYmFzZS5jb250cmFjdC5aYWliYXRzdUJhc2UudXBkYXRlKCkgLT4gdWludDY0Ogp1cGRhdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTozMC0zMQogICAgLy8gQGE0LmFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiVXBkYXRlQXBwbGljYXRpb24iXSkKICAgIC8vIGRlZiB1cGRhdGUoc2VsZikgLT4gYm9vbDoKICAgIHByb3RvIDAgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MzIKICAgIC8vIHJldHVybiBzZWxmLmlzX2FkbWluKGFwLlR4bi5zZW5kZXIpCiAgICB0eG4gU2VuZGVyCiAgICBjYWxsc3ViIGlzX2FkbWluCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfYmFzZS5jb250cmFjdC5aYWliYXRzdUJhc2UuZGVsZXRlKCkgLT4gdWludDY0OgpkZWxldGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTozNC0zNQogICAgLy8gQGE0LmFiaW1ldGhvZChhbGxvd19hY3Rpb25zPVsiRGVsZXRlQXBwbGljYXRpb24iXSkKICAgIC8vIGRlZiBkZWxldGUoc2VsZikgLT4gYm9vbDoKICAgIHByb3RvIDAgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MzYKICAgIC8vIGlmIGFwLlR4bi5zZW5kZXIgPT0gb3AuR2xvYmFsLmNyZWF0b3JfYWRkcmVzczoKICAgIHR4biBTZW5kZXIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgPT0KICAgIGJ6IGRlbGV0ZV9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjM3CiAgICAvLyByZXR1cm4gVHJ1ZQogICAgaW50IDEKICAgIHJldHN1YgoKZGVsZXRlX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjM4CiAgICAvLyByZXR1cm4gRmFsc2UKICAgIGludCAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfYmFzZS5jb250cmFjdC5aYWliYXRzdUJhc2UuYWRkX2FkbWluKGFjY291bnQ6IGJ5dGVzKSAtPiB1aW50NjQ6CmFkZF9hZG1pbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjQwLTQxCiAgICAvLyBAYTQuYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBhZGRfYWRtaW4oc2VsZiwgYWNjb3VudDogYXAuQWNjb3VudCkgLT4gYm9vbDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6NDUKICAgIC8vIHNlbGYuYXV0aG9yaXNlX3R4bigpCiAgICBjYWxsc3ViIGF1dGhvcmlzZV90eG4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjQ2CiAgICAvLyBvcC5Cb3gucHV0KHNlbGYuYWRtaW5fa2V5KGFjY291bnQpLCBhNC5Cb29sKFRydWUpLmJ5dGVzKSAgIyBub3FhOiBGQlQwMDMKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBhZG1pbl9rZXkKICAgIGJ5dGUgMHg4MAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6NDcKICAgIC8vIHJldHVybiBUcnVlCiAgICBpbnQgMQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2Jhc2UuY29udHJhY3QuWmFpYmF0c3VCYXNlLnJlbW92ZV9hZG1pbihhY2NvdW50OiBieXRlcykgLT4gdWludDY0OgpyZW1vdmVfYWRtaW46CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo0OS01MAogICAgLy8gQGE0LmFiaW1ldGhvZCgpCiAgICAvLyBkZWYgcmVtb3ZlX2FkbWluKHNlbGYsIGFjY291bnQ6IGFwLkFjY291bnQpIC0+IGJvb2w6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjUxCiAgICAvLyBzZWxmLmF1dGhvcmlzZV90eG4oKQogICAgY2FsbHN1YiBhdXRob3Jpc2VfdHhuCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo1MgogICAgLy8gcmV0dXJuIG9wLkJveC5kZWxldGUoc2VsZi5hZG1pbl9rZXkoYWNjb3VudCkpCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgYWRtaW5fa2V5CiAgICBib3hfZGVsCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfYmFzZS5jb250cmFjdC5aYWliYXRzdUJhc2UubWlncmF0ZV9sZWdhY3lfYWRtaW5zKCkgLT4gdWludDY0OgptaWdyYXRlX2xlZ2FjeV9hZG1pbnM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo1NC01NQogICAgLy8gQGE0LmFiaW1ldGhvZCgpCiAgICAvLyBkZWYgbWlncmF0ZV9sZWdhY3lfYWRtaW5zKHNlbGYpIC0+IGFwLlVJbnQ2NDoKICAgIHByb3RvIDAgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6NjUKICAgIC8vIGFwLlR4bi5zZW5kZXIgPT0gb3AuR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgdHhuIFNlbmRlcgogICAgZ2xvYmFsIENyZWF0b3JBZGRyZXNzCiAgICA9PQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6NjQtNjYKICAgIC8vIGFzc2VydCAoCiAgICAvLyAgICAgYXAuVHhuLnNlbmRlciA9PSBvcC5HbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICAvLyApLCAiT25seSB0aGUgY3JlYXRvciBjYW4gbWlncmF0ZSB0aGUgYWRtaW5zIgogICAgYXNzZXJ0IC8vIE9ubHkgdGhlIGNyZWF0b3IgY2FuIG1pZ3JhdGUgdGhlIGFkbWlucwogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6NjgKICAgIC8vIEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2lkLCBMRUdBQ1lfQURNSU5TX0tFWQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbklECiAgICBieXRlIDB4NjE2NDZkNjk2ZTczCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo2Ny02OQogICAgLy8gW2FkbWluc19ieXRlcywgZXhpc3RzXSA9IG9wLkFwcEdsb2JhbC5nZXRfZXhfYnl0ZXMoCiAgICAvLyAgICAgR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25faWQsIExFR0FDWV9BRE1JTlNfS0VZCiAgICAvLyApCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgc3dhcAogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjcwCiAgICAvLyBhc3NlcnQgZXhpc3RzLCAiVGhlIGFkbWlucyBoYXZlIGFscmVhZHkgYmVlbiBtaWdyYXRlZCIKICAgIGFzc2VydCAvLyBUaGUgYWRtaW5zIGhhdmUgYWxyZWFkeSBiZWVuIG1pZ3JhdGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo3MgogICAgLy8gZm9yIGluZGV4IGluIGFwLnVyYW5nZShhZG1pbnMubGVuZ3RoKToKICAgIGludCAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgaW50IDAKCm1pZ3JhdGVfbGVnYWN5X2FkbWluc19mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo3MgogICAgLy8gZm9yIGluZGV4IGluIGFwLnVyYW5nZShhZG1pbnMubGVuZ3RoKToKICAgIGZyYW1lX2RpZyAyCiAgICBmcmFtZV9kaWcgMQogICAgPAogICAgYnogbWlncmF0ZV9sZWdhY3lfYWRtaW5zX2FmdGVyX2ZvckA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo3MwogICAgLy8gYWRtaW5fa2V5ID0gb3AuY29uY2F0KEFETUlOX0tFWV9QUkVGSVgsIGFkbWluc1tpbmRleF0uYnl0ZXMpCiAgICBmcmFtZV9kaWcgMAogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyAyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludCAzMgogICAgKgogICAgaW50IDMyCiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ5dGUgMHg0MQogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo3NAogICAgLy8gb3AuQm94LnB1dChhZG1pbl9rZXksIGE0LkJvb2woVHJ1ZSkuYnl0ZXMpICAjIG5vcWE6IEZCVDAwMwogICAgYnl0ZSAweDgwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo3MgogICAgLy8gZm9yIGluZGV4IGluIGFwLnVyYW5nZShhZG1pbnMubGVuZ3RoKToKICAgIGludCAxCiAgICArCiAgICBmcmFtZV9idXJ5IDIKICAgIGIgbWlncmF0ZV9sZWdhY3lfYWRtaW5zX2Zvcl9oZWFkZXJAMQoKbWlncmF0ZV9sZWdhY3lfYWRtaW5zX2FmdGVyX2ZvckA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6NzUKICAgIC8vIG9wLkFwcEdsb2JhbC5kZWxldGUoTEVHQUNZX0FETUlOU19LRVkpCiAgICBieXRlIDB4NjE2NDZkNjk2ZTczCiAgICBhcHBfZ2xvYmFsX2RlbAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6NzYKICAgIC8vIHJldHVybiBhZG1pbnMubGVuZ3RoCiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfYmFzZS5jb250cmFjdC5aYWliYXRzdUJhc2Uuc2V0X3ByaWNlX29yYWNsZShvcmFjbGU6IHVpbnQ2NCwgY2FjaGVfd2luZG93OiB1aW50NjQpIC0+IHVpbnQ2NDoKc2V0X3ByaWNlX29yYWNsZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5Ojc4LTc5CiAgICAvLyBAYTQuYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBzZXRfcHJpY2Vfb3JhY2xlKHNlbGYsIG9yYWNsZTogYXAuQXBwbGljYXRpb24sIGNhY2hlX3dpbmRvdzogYXAuVUludDY0KSAtPiBib29sOgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo4NQogICAgLy8gc2VsZi5hdXRob3Jpc2VfdHhuKCkKICAgIGNhbGxzdWIgYXV0aG9yaXNlX3R4bgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6ODcKICAgIC8vIG9yYWNsZT1hNC5VSW50NjQob3JhY2xlLmlkKSwKICAgIGZyYW1lX2RpZyAtMgogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6ODgKICAgIC8vIGNhY2hlX3dpbmRvdz1hNC5VSW50NjQoY2FjaGVfd2luZG93KSwKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6ODYtODkKICAgIC8vIGNvbmZpZyA9IFByaWNlT3JhY2xlQ29uZmlnKAogICAgLy8gICAgIG9yYWNsZT1hNC5VSW50NjQob3JhY2xlLmlkKSwKICAgIC8vICAgICBjYWNoZV93aW5kb3c9YTQuVUludDY0KGNhY2hlX3dpbmRvdyksCiAgICAvLyApCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjkwCiAgICAvLyBvcC5Cb3gucHV0KFBSSUNFX09SQUNMRV9LRVksIGNvbmZpZy5ieXRlcykKICAgIGJ5dGUgMHg0ZgogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6OTEKICAgIC8vIHJldHVybiBUcnVlCiAgICBpbnQgMQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2Jhc2UuY29udHJhY3QuWmFpYmF0c3VCYXNlLnJlZnJlc2hfYXNzZXRfcHJpY2VzKGFzc2V0czogYnl0ZXMpIC0+IHVpbnQ2NDoKcmVmcmVzaF9hc3NldF9wcmljZXM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weTo5My05NAogICAgLy8gQGE0LmFiaW1ldGhvZCgpCiAgICAvLyBkZWYgcmVmcmVzaF9hc3NldF9wcmljZXMoc2VsZiwgYXNzZXRzOiBhNC5EeW5hbWljQXJyYXlbYTQuVUludDY0XSkgLT4gYm9vbDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTAxCiAgICAvLyBvcmFjbGUgPSBhcC5BcHBsaWNhdGlvbihzZWxmLnByaWNlX29yYWNsZV9jb25maWcoKS5vcmFjbGUubmF0aXZlKQogICAgY2FsbHN1YiBwcmljZV9vcmFjbGVfY29uZmlnCiAgICBleHRyYWN0IDAgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjEwMgogICAgLy8gZm9yIGFzc2V0X2lkIGluIGFzc2V0czoKICAgIGZyYW1lX2RpZyAtMQogICAgaW50IDAKICAgIGV4dHJhY3RfdWludDE2CiAgICBpbnQgMAoKcmVmcmVzaF9hc3NldF9wcmljZXNfZm9yX2hlYWRlckAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTAyCiAgICAvLyBmb3IgYXNzZXRfaWQgaW4gYXNzZXRzOgogICAgZnJhbWVfZGlnIDIKICAgIGZyYW1lX2RpZyAxCiAgICA8CiAgICBieiByZWZyZXNoX2Fzc2V0X3ByaWNlc19hZnRlcl9mb3JANAogICAgZnJhbWVfZGlnIC0xCiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIDIKICAgIGR1cAogICAgY292ZXIgMgogICAgaW50IDgKICAgICoKICAgIGludCA4CiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjEwMwogICAgLy8gc2VsZi5yZWZyZXNoX2Fzc2V0X3ByaWNlKGFzc2V0X2lkLm5hdGl2ZSwgb3JhY2xlKQogICAgYnRvaQogICAgZnJhbWVfZGlnIDAKICAgIGNhbGxzdWIgcmVmcmVzaF9hc3NldF9wcmljZQogICAgcG9wCiAgICBpbnQgMQogICAgKwogICAgZnJhbWVfYnVyeSAyCiAgICBiIHJlZnJlc2hfYXNzZXRfcHJpY2VzX2Zvcl9oZWFkZXJAMQoKcmVmcmVzaF9hc3NldF9wcmljZXNfYWZ0ZXJfZm9yQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToxMDQKICAgIC8vIHJldHVybiBUcnVlCiAgICBpbnQgMQogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfYmFzZS5jb250cmFjdC5aYWliYXRzdUJhc2Uub3B0X2NvbnRyYWN0X2ludG9fYXNzZXQoYXNzZXQ6IHVpbnQ2NCkgLT4gdWludDY0OgpvcHRfY29udHJhY3RfaW50b19hc3NldDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjEwNi0xMDcKICAgIC8vIEBhNC5hYmltZXRob2QoKQogICAgLy8gZGVmIG9wdF9jb250cmFjdF9pbnRvX2Fzc2V0KHNlbGYsIGFzc2V0OiBhcC5Bc3NldCkgLT4gYm9vbDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTA4CiAgICAvLyBzZWxmLm9wdF9hcHBfaW50b19hc3NldChhc3NldCkKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBvcHRfYXBwX2ludG9fYXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjEwOQogICAgLy8gcmV0dXJuIFRydWUKICAgIGludCAxCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfYmFzZS5jb250cmFjdC5aYWliYXRzdUJhc2Uub3B0X2FwcF9pbnRvX2Fzc2V0KGFzc2V0OiB1aW50NjQpIC0+IHZvaWQ6Cm9wdF9hcHBfaW50b19hc3NldDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjEyNS0xMjkKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyAgIFN1YnJvdXRpbmVzICAgICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vICMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMjIyMKICAgIC8vIEBhcC5zdWJyb3V0aW5lCiAgICAvLyBkZWYgb3B0X2FwcF9pbnRvX2Fzc2V0KHNlbGYsIGFzc2V0OiBhcC5Bc3NldCkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTM0CiAgICAvLyBhc3NldF9yZWNlaXZlcj1hcC5HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjEzNgogICAgLy8gdHhuLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIGZyYW1lX2RpZyAtMQogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjEzMQogICAgLy8gYXNzZXRfYW1vdW50PTAsCiAgICBpbnQgMAogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTMwCiAgICAvLyB0eG4gPSBhcC5pdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBpbnQgYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjEzMgogICAgLy8gZmVlPTAsCiAgICBpbnQgMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjEzNgogICAgLy8gdHhuLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLnphaWJhdHN1X2Jhc2UuY29udHJhY3QuWmFpYmF0c3VCYXNlLnRyYW5zZmVyX2Fzc2V0KGFzc2V0OiB1aW50NjQsIGFzc2V0X2Ftb3VudDogdWludDY0LCByZWNpcGllbnQ6IGJ5dGVzKSAtPiB1aW50NjQ6CnRyYW5zZmVyX2Fzc2V0OgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTExLTExNAogICAgLy8gQGE0LmFiaW1ldGhvZCgpCiAgICAvLyBkZWYgdHJhbnNmZXJfYXNzZXQoCiAgICAvLyAgICAgc2VsZiwgYXNzZXQ6IGFwLkFzc2V0LCBhc3NldF9hbW91bnQ6IGFwLlVJbnQ2NCwgcmVjaXBpZW50OiBhcC5BY2NvdW50CiAgICAvLyApIC0+IGJvb2w6CiAgICBwcm90byAzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjExNQogICAgLy8gc2VsZi5hdXRob3Jpc2VfdHhuKCkKICAgIGNhbGxzdWIgYXV0aG9yaXNlX3R4bgogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MTIyCiAgICAvLyB0eG4uc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIGZyYW1lX2RpZyAtMgogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgZnJhbWVfZGlnIC0xCiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIGZyYW1lX2RpZyAtMwogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjExNgogICAgLy8gdHhuID0gYXAuaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgaW50IGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToxMTcKICAgIC8vIGZlZT0wLAogICAgaW50IDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvemFpYmF0c3VfYmFzZS9jb250cmFjdC5weToxMjIKICAgIC8vIHR4bi5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjEyMwogICAgLy8gcmV0dXJuIFRydWUKICAgIGludCAxCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuemFpYmF0c3VfYmFzZS5jb250cmFjdC5aYWliYXRzdUJhc2UuX19pbml0X18oKSAtPiB2b2lkOgpfX2luaXRfXzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9iYXNlL2NvbnRyYWN0LnB5OjIzCiAgICAvLyBkZWYgX19pbml0X18oc2VsZikgLT4gTm9uZToKICAgIHByb3RvIDAgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3phaWJhdHN1X2Jhc2UvY29udHJhY3QucHk6MjQKICAgIC8vIHNlbGYuc2VydmljZV9jb250cmFjdDogYTQuQWRkcmVzcyA9IGE0LkFkZHJlc3MoKQogICAgYnl0ZSAic2VydmljZV9jb250cmFjdCIKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1YgoKCi8vIGFsZ29weV9saWJfYXJjNC5keW5hbWljX2FycmF5X2NvbmNhdF9iaXRzKGFycmF5OiBieXRlcywgbmV3X2l0ZW1zX2J5dGVzOiBieXRlcywgbmV3X2l0ZW1zX2NvdW50OiB1aW50NjQsIGlzX3BhY2tlZDogdWludDY0KSAtPiBieXRlczoKZHluYW1pY19hcnJheV9jb25jYXRfYml0czoKICAgIC8vIDxhbGdvcHk+L2FsZ29weV9saWJfYXJjNC5weToxMjQtMTI3CiAgICBwcm90byA0IDEKICAgIGJ5dGUgIiIKICAgIGR1cG4gMgogICAgLy8gPGFsZ29weT4vYWxnb3B5X2xpYl9hcmM0LnB5OjE0MAogICAgZnJhbWVfZGlnIC00CiAgICBpbnQgMAogICAgZXh0cmFjdF91aW50MTYKICAgIGR1cG4gMgogICAgLy8gPGFsZ29weT4vYWxnb3B5X2xpYl9hcmM0LnB5OjE0MQogICAgZnJhbWVfZGlnIC0yCiAgICArCiAgICAvLyA8YWxnb3B5Pi9hbGdvcHlfbGliX2FyYzQucHk6MTQyCiAgICBkdXAKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAwCiAgICAvLyA8YWxnb3B5Pi9hbGdvcHlfbGliX2FyYzQucHk6MTQzCiAgICBmcmFtZV9kaWcgLTQKICAgIHN3YXAKICAgIHJlcGxhY2UyIDAKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICB1bmNvdmVyIDMKICAgIC8vIDxhbGdvcHk+L2FsZ29weV9saWJfYXJjNC5weToxNDQKICAgIGludCA3CiAgICArCiAgICBpbnQgOAogICAgLwogICAgZHVwCiAgICBjb3ZlciAzCiAgICAvLyA8YWxnb3B5Pi9hbGdvcHlfbGliX2FyYzQucHk6MTQ1CiAgICBzd2FwCiAgICBpbnQgNwogICAgKwogICAgaW50IDgKICAgIC8KICAgIGR1cAogICAgY292ZXIgMwogICAgLy8gPGFsZ29weT4vYWxnb3B5X2xpYl9hcmM0LnB5OjE0NgogICAgPAogICAgYnogZHluYW1pY19hcnJheV9jb25jYXRfYml0c19hZnRlcl9pZl9lbHNlQDIKICAgIC8vIDxhbGdvcHk+L2FsZ29weV9saWJfYXJjNC5weToxNDcKICAgIGZyYW1lX2RpZyA2CiAgICBmcmFtZV9kaWcgNQogICAgLQogICAgYnplcm8KICAgIGZyYW1lX2RpZyA0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2J1cnkgNwoKZHluYW1pY19hcnJheV9jb25jYXRfYml0c19hZnRlcl9pZl9lbHNlQDI6CiAgICBmcmFtZV9kaWcgNwogICAgZnJhbWVfYnVyeSA0CiAgICAvLyA8YWxnb3B5Pi9hbGdvcHlfbGliX2FyYzQucHk6MTQ5CiAgICBmcmFtZV9kaWcgMwogICAgaW50IDE2CiAgICArCiAgICBmcmFtZV9idXJ5IDIKICAgIC8vIDxhbGdvcHk+L2FsZ29weV9saWJfYXJjNC5weToxNTAKICAgIGZyYW1lX2RpZyAtMQogICAgYnogZHluYW1pY19hcnJheV9jb25jYXRfYml0c190ZXJuYXJ5X2ZhbHNlQDQKICAgIGludCAxCiAgICBmcmFtZV9idXJ5IDEKICAgIGIgZHluYW1pY19hcnJheV9jb25jYXRfYml0c190ZXJuYXJ5X21lcmdlQDUKCmR5bmFtaWNfYXJyYXlfY29uY2F0X2JpdHNfdGVybmFyeV9mYWxzZUA0OgogICAgLy8gPGFsZ29weT4vYWxnb3B5X2xpYl9hcmM0LnB5OjE1MAogICAgaW50IDgKICAgIGZyYW1lX2J1cnkgMQoKZHluYW1pY19hcnJheV9jb25jYXRfYml0c190ZXJuYXJ5X21lcmdlQDU6CiAgICAvLyA8YWxnb3B5Pi9hbGdvcHlfbGliX2FyYzQucHk6MTUwCiAgICBmcmFtZV9kaWcgMQogICAgYXNzZXJ0IC8vIFN0ZXAgY2Fubm90IGJlIHplcm8KICAgIGludCAwCiAgICBmcmFtZV9idXJ5IDAKCmR5bmFtaWNfYXJyYXlfY29uY2F0X2JpdHNfZm9yX2hlYWRlckA2OgogICAgLy8gPGFsZ29weT4vYWxnb3B5X2xpYl9hcmM0LnB5OjE1MAogICAgZnJhbWVfZGlnIDAKICAgIGZyYW1lX2RpZyAtMgogICAgPAogICAgYnogZHluYW1pY19hcnJheV9jb25jYXRfYml0c19hZnRlcl9mb3JAMTAKICAgIC8vIDxhbGdvcHk+L2FsZ29weV9saWJfYXJjNC5weToxNTEKICAgIGZyYW1lX2RpZyAtMwogICAgZnJhbWVfZGlnIDAKICAgIGR1cAogICAgY292ZXIgMgogICAgZ2V0Yml0CiAgICBmcmFtZV9kaWcgNAogICAgZnJhbWVfZGlnIDIKICAgIGR1cAogICAgY292ZXIgMwogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIGZyYW1lX2J1cnkgNAogICAgLy8gPGFsZ29weT4vYWxnb3B5X2xpYl9hcmM0LnB5OjE1MgogICAgaW50IDEKICAgICsKICAgIGZyYW1lX2J1cnkgMgogICAgLy8gPGFsZ29weT4vYWxnb3B5X2xpYl9hcmM0LnB5OjE1MAogICAgZnJhbWVfZGlnIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMAogICAgYiBkeW5hbWljX2FycmF5X2NvbmNhdF9iaXRzX2Zvcl9oZWFkZXJANgoKZHluYW1pY19hcnJheV9jb25jYXRfYml0c19hZnRlcl9mb3JAMTA6CiAgICAvLyA8YWxnb3B5Pi9hbGdvcHlfbGliX2FyYzQucHk6MTU0CiAgICBmcmFtZV9kaWcgNAogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIK",
+    "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCgpzbWFydF9jb250cmFjdHMuemFpYmF0c3VfbG9hbi5jb250cmFjdC5aYWliYXRzdUxvYW4uY2xlYXJfc3RhdGVfcHJvZ3JhbToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy96YWliYXRzdV9sb2FuL2NvbnRyYWN0LnB5OjkyCiAgICAvLyBjbGFzcyBaYWliYXRzdUxvYW4oWmFpYmF0c3VCYXNlKToKICAgIGludCAxCiAgICByZXR1cm4K"
+  },
+  "state": {
+    "global": {
+      "num_byte_slices": 1,
+      "num_uints": 0
+    },
+    "local": {
+      "num_byte_slices": 0,
+      "num_uints": 0
     }
   },
   "schema": {
     "global": {
       "declared": {
-        "admins": {
-          "type": "bytes",
-          "key": "admins"
-        },
         "service_contract": {
           "type": "bytes",
           "key": "service_contract"
@@ -527,19 +552,11 @@ export const APP_SPEC: AppSpec = {
   },
   "contract": {
     "name": "ZaibatsuLoan",
-    "desc": "\n    ATTENTIONS!!!! THIS IS NOT A DRILL\n    * All percentages comming into the smart contract must have been multiple\n      by 100. This is to account for the lack of support for floats on the AVM\n    ",
+    "desc": "\n    ATTENTIONS!!!! THIS IS NOT A DRILL\n    * All percentages comming into the smart contract must have been multiple\n      by 100. This is to account for the lack of support for floats on the AVM\n    * Inner transactions are sent with fee=0. The outer transaction must cover\n      their fees through fee pooling, see smart_contracts/helpers/fees.py\n    * Box names are prefixed by type, see smart_contracts/zaibatsu_loan/storage.py\n    * Every loan lifecycle transition logs an ARC-28 event, see\n      smart_contracts/zaibatsu_loan/types/events.py\n    ",
     "methods": [
       {
         "name": "initiate_loan_purchase",
         "args": [
-          {
-            "type": "byte[]",
-            "name": "loan_key"
-          },
-          {
-            "type": "application",
-            "name": "folks_feed_oracle"
-          },
           {
             "type": "(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64)",
             "name": "loan_details"
@@ -550,8 +567,22 @@ export const APP_SPEC: AppSpec = {
           }
         ],
         "returns": {
-          "type": "(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64)"
-        }
+          "type": "byte[8]"
+        },
+        "desc": "Returns the loan_key allocated to the new loan"
+      },
+      {
+        "name": "initiate_loan_purchases",
+        "args": [
+          {
+            "type": "(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64)[]",
+            "name": "loans"
+          }
+        ],
+        "returns": {
+          "type": "byte[8][]"
+        },
+        "desc": "Initiates several loans in one app call and returns their loan_keys.\n* The collateral transfer of loans[i] must be the i-th of the   loans.length transactions directly before this app call * Consecutive loans with the same collateral asset share one price   lookup, so loans should be sorted by collateral asset"
       },
       {
         "name": "complete_non_p2p_loan_purchase",
@@ -574,7 +605,7 @@ export const APP_SPEC: AppSpec = {
           }
         ],
         "returns": {
-          "type": "(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64)"
+          "type": "(uint8,uint8,uint8,uint8,uint8,bool,bool,bool,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,address,uint64)"
         }
       },
       {
@@ -602,7 +633,7 @@ export const APP_SPEC: AppSpec = {
           }
         ],
         "returns": {
-          "type": "(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64)"
+          "type": "(uint8,uint8,uint8,uint8,uint8,bool,bool,bool,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,address,uint64)"
         }
       },
       {
@@ -612,33 +643,47 @@ export const APP_SPEC: AppSpec = {
             "type": "byte[]",
             "name": "loan_key"
           },
-          {
-            "type": "string",
-            "name": "repayment_key"
-          },
           {
             "type": "axfer",
             "name": "txn"
           }
         ],
         "returns": {
-          "type": "void"
-        }
+          "type": "byte[8]"
+        },
+        "desc": "Returns the repayment_key allocated to the repayment round"
       },
       {
         "name": "execute_loan_repayment",
         "args": [
           {
-            "type": "string",
+            "type": "byte[]",
             "name": "repayment_key"
           },
+          {
+            "type": "uint64",
+            "name": "recipient_index"
+          },
           {
             "type": "account",
             "name": "recipient_account"
           },
           {
-            "type": "(uint64,address)",
-            "name": "payment_recipient"
+            "type": "asset",
+            "name": "principal_asset"
+          }
+        ],
+        "returns": {
+          "type": "(bool,uint64)"
+        },
+        "desc": "Pays the loan's payment_recipients[recipient_index] their share of a\npending repayment round"
+      },
+      {
+        "name": "execute_loan_repayment_batch",
+        "args": [
+          {
+            "type": "byte[]",
+            "name": "repayment_key"
           },
           {
             "type": "asset",
@@ -647,13 +692,14 @@ export const APP_SPEC: AppSpec = {
         ],
         "returns": {
           "type": "(bool,uint64)"
-        }
+        },
+        "desc": "Pays every recipient of a pending repayment round that has not been\npaid yet in a single app call. * The recipient accounts must be passed in the foreign accounts array"
       },
       {
         "name": "clean_up_loan_repayment",
         "args": [
           {
-            "type": "string",
+            "type": "byte[]",
             "name": "repayment_key"
           },
           {
@@ -666,15 +712,41 @@ export const APP_SPEC: AppSpec = {
         }
       },
       {
-        "name": "handle_payment_default",
+        "name": "clean_up_loan_repayments",
+        "args": [
+          {
+            "type": "byte[8][]",
+            "name": "repayment_keys"
+          }
+        ],
+        "returns": {
+          "type": "bool[]"
+        },
+        "desc": "Closes many repayment rounds in one app call. Returns, for every\nrepayment_key, whether its loan has been fully repaid. * Every recipient of every round must have been paid * Collateral of fully repaid loans is released to the stored borrower,   so the borrower accounts must be passed in the foreign accounts array * Opcode budget is topped up with OpUp inner transactions paid for by   the outer transaction fee * At most MAX_CLEAN_UP_BATCH_SIZE repayment_keys can be passed, so the   events of every key fit in the logs of one app call"
+      },
+      {
+        "name": "repay_loan_round",
         "args": [
           {
-            "type": "string",
+            "type": "byte[]",
             "name": "loan_key"
           },
           {
-            "type": "string",
-            "name": "repayment_key"
+            "type": "axfer",
+            "name": "txn"
+          }
+        ],
+        "returns": {
+          "type": "(bool)"
+        },
+        "desc": "Runs a whole repayment round in one app call: takes the borrower's\npayment, pays every recipient and closes the round without creating a PendingLoanRoundPayment box. * The recipient accounts must be passed in the foreign accounts array"
+      },
+      {
+        "name": "handle_payment_default",
+        "args": [
+          {
+            "type": "byte[]",
+            "name": "loan_key"
           },
           {
             "type": "uint64",
@@ -686,8 +758,22 @@ export const APP_SPEC: AppSpec = {
           }
         ],
         "returns": {
-          "type": "void"
-        }
+          "type": "byte[8]"
+        },
+        "desc": "Returns the repayment_key of the principal owed to the recipients"
+      },
+      {
+        "name": "handle_payment_defaults",
+        "args": [
+          {
+            "type": "byte[8][]",
+            "name": "loan_keys"
+          }
+        ],
+        "returns": {
+          "type": "(byte[8],uint64)[]"
+        },
+        "desc": "Defaults many overdue loans in one app call and returns, for each loan,\nthe repayment_key of the principal owed and the collateral seized. * A loan is overdue once its payment_completion_timestamp has passed   with payment rounds still outstanding. It can only be defaulted once * The seized collateral is worth the outstanding principal and interest   at the cached oracle prices, capped at the collateral of the loan * The \"O\" price oracle box and the price boxes of the principal and   collateral assets must be passed in the box references * The principal and collateral assets must be passed in the foreign   assets array, their decimals scale the seizure"
       },
       {
         "name": "delete_loan",
@@ -701,6 +787,84 @@ export const APP_SPEC: AppSpec = {
           "type": "void"
         }
       },
+      {
+        "name": "migrate_loan_record",
+        "args": [
+          {
+            "type": "byte[]",
+            "name": "legacy_loan_key"
+          }
+        ],
+        "returns": {
+          "type": "byte[8]"
+        },
+        "desc": "Rewrites a legacy LoanDetails box as a LoanRecord under a newly\nallocated loan_key, moving its payment_recipients into their own box. Returns the new loan_key * Loans with more than MAX_LOAN_RECIPIENTS payment_recipients cannot   be migrated, their paid recipients would not fit the bitmap * The new record, recipients and index boxes must be passed in the box   references"
+      },
+      {
+        "name": "get_borrower_loans",
+        "args": [
+          {
+            "type": "account",
+            "name": "borrower"
+          }
+        ],
+        "returns": {
+          "type": "byte[8][]"
+        },
+        "desc": "Returns the keys of the borrower's open loans.\n* The borrower box must be passed in the box references"
+      },
+      {
+        "name": "get_loan_statuses",
+        "args": [
+          {
+            "type": "byte[8][]",
+            "name": "loan_keys"
+          }
+        ],
+        "returns": {
+          "type": "uint8[]"
+        },
+        "desc": "Returns one LOAN_STATUS_* value per loan_key"
+      },
+      {
+        "name": "get_amounts_due",
+        "args": [
+          {
+            "type": "byte[8][]",
+            "name": "loan_keys"
+          }
+        ],
+        "returns": {
+          "type": "uint64[]"
+        },
+        "desc": "Returns the principal asset amount due for the current payment round of\nevery loan, 0 for loans that are not found, have no rounds left or whose principal has not been paid out yet"
+      },
+      {
+        "name": "get_remaining_rounds",
+        "args": [
+          {
+            "type": "byte[8][]",
+            "name": "loan_keys"
+          }
+        ],
+        "returns": {
+          "type": "uint8[]"
+        },
+        "desc": "Returns the payment rounds left on every loan, 0 when not found"
+      },
+      {
+        "name": "get_repayment_progress",
+        "args": [
+          {
+            "type": "byte[8][]",
+            "name": "repayment_keys"
+          }
+        ],
+        "returns": {
+          "type": "(bool,uint64)[]"
+        },
+        "desc": "Returns how much of every pending repayment round has been paid out to\nthe payment recipients. Rounds that are not found report nothing paid"
+      },
       {
         "name": "create",
         "args": [],
@@ -722,6 +886,69 @@ export const APP_SPEC: AppSpec = {
           "type": "bool"
         }
       },
+      {
+        "name": "add_admin",
+        "args": [
+          {
+            "type": "account",
+            "name": "account"
+          }
+        ],
+        "returns": {
+          "type": "bool"
+        },
+        "desc": "* The admin box of the account must be passed in the box references"
+      },
+      {
+        "name": "remove_admin",
+        "args": [
+          {
+            "type": "account",
+            "name": "account"
+          }
+        ],
+        "returns": {
+          "type": "bool"
+        }
+      },
+      {
+        "name": "migrate_legacy_admins",
+        "args": [],
+        "returns": {
+          "type": "uint64"
+        },
+        "desc": "Moves the admins of the legacy global AddressArray into admin boxes\nand deletes the global key, so it can only run once. Returns the number of admins migrated. * Only the creator can migrate the admins * The admin box of every legacy admin must be passed in the box   references, pooled across the group when there are more than 8"
+      },
+      {
+        "name": "set_price_oracle",
+        "args": [
+          {
+            "type": "application",
+            "name": "oracle"
+          },
+          {
+            "type": "uint64",
+            "name": "cache_window"
+          }
+        ],
+        "returns": {
+          "type": "bool"
+        },
+        "desc": "* cache_window is the number of seconds a cached price is used for\nbefore the oracle is read again * The \"O\" price oracle box must be passed in the box references"
+      },
+      {
+        "name": "refresh_asset_prices",
+        "args": [
+          {
+            "type": "uint64[]",
+            "name": "assets"
+          }
+        ],
+        "returns": {
+          "type": "bool"
+        },
+        "desc": "Reads the oracle price of every asset passed into the price cache.\n* The price_oracle must be passed in the foreign apps array * The \"O\" price oracle box and the price boxes must be passed in the   box references"
+      },
       {
         "name": "opt_contract_into_asset",
         "args": [
@@ -830,17 +1057,22 @@ export type ZaibatsuLoan = {
    * Maps method signatures / names to their argument and return types.
    */
   methods:
-    & Record<'initiate_loan_purchase(byte[],application,(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64),axfer)(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64)' | 'initiate_loan_purchase', {
+    & Record<'initiate_loan_purchase((string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64),axfer)byte[8]' | 'initiate_loan_purchase', {
       argsObj: {
-        loanKey: Uint8Array
-        folksFeedOracle: number | bigint
         loanDetails: [string, string, number, bigint | number, bigint | number, bigint | number, bigint | number, bigint | number, bigint | number, number, bigint | number, [bigint | number, string][], boolean, boolean, number, string, bigint | number, bigint | number]
         txn: TransactionToSign | Transaction | Promise<SendTransactionResult>
       }
-      argsTuple: [loanKey: Uint8Array, folksFeedOracle: number | bigint, loanDetails: [string, string, number, bigint | number, bigint | number, bigint | number, bigint | number, bigint | number, bigint | number, number, bigint | number, [bigint | number, string][], boolean, boolean, number, string, bigint | number, bigint | number], txn: TransactionToSign | Transaction | Promise<SendTransactionResult>]
-      returns: LoanDetails
+      argsTuple: [loanDetails: [string, string, number, bigint | number, bigint | number, bigint | number, bigint | number, bigint | number, bigint | number, number, bigint | number, [bigint | number, string][], boolean, boolean, number, string, bigint | number, bigint | number], txn: TransactionToSign | Transaction | Promise<SendTransactionResult>]
+      returns: Uint8Array
     }>
-    & Record<'complete_non_p2p_loan_purchase(byte[],(string,string,string,string),asset,account)(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64)' | 'complete_non_p2p_loan_purchase', {
+    & Record<'initiate_loan_purchases((string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64)[])byte[8][]' | 'initiate_loan_purchases', {
+      argsObj: {
+        loans: [string, string, number, bigint | number, bigint | number, bigint | number, bigint | number, bigint | number, bigint | number, number, bigint | number, [bigint | number, string][], boolean, boolean, number, string, bigint | number, bigint | number][]
+      }
+      argsTuple: [loans: [string, string, number, bigint | number, bigint | number, bigint | number, bigint | number, bigint | number, bigint | number, number, bigint | number, [bigint | number, string][], boolean, boolean, number, string, bigint | number, bigint | number][]]
+      returns: Uint8Array[]
+    }>
+    & Record<'complete_non_p2p_loan_purchase(byte[],(string,string,string,string),asset,account)(uint8,uint8,uint8,uint8,uint8,bool,bool,bool,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,address,uint64)' | 'complete_non_p2p_loan_purchase', {
       argsObj: {
         loanKey: Uint8Array
         completionArgs: [string, string, string, string]
@@ -848,9 +1080,9 @@ export type ZaibatsuLoan = {
         borrower: string | Uint8Array
       }
       argsTuple: [loanKey: Uint8Array, completionArgs: [string, string, string, string], principalAsset: number | bigint, borrower: string | Uint8Array]
-      returns: LoanDetails
+      returns: LoanRecord
     }>
-    & Record<'complete_p2p_loan_purchase(byte[],(string,string,string,string),asset,account,axfer)(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64)' | 'complete_p2p_loan_purchase', {
+    & Record<'complete_p2p_loan_purchase(byte[],(string,string,string,string),asset,account,axfer)(uint8,uint8,uint8,uint8,uint8,bool,bool,bool,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,address,uint64)' | 'complete_p2p_loan_purchase', {
       argsObj: {
         loanKey: Uint8Array
         completionArgs: [string, string, string, string]
@@ -859,44 +1091,72 @@ export type ZaibatsuLoan = {
         txn: TransactionToSign | Transaction | Promise<SendTransactionResult>
       }
       argsTuple: [loanKey: Uint8Array, completionArgs: [string, string, string, string], principalAsset: number | bigint, borrower: string | Uint8Array, txn: TransactionToSign | Transaction | Promise<SendTransactionResult>]
-      returns: LoanDetails
+      returns: LoanRecord
     }>
-    & Record<'initiate_loan_repayment(byte[],string,axfer)void' | 'initiate_loan_repayment', {
+    & Record<'initiate_loan_repayment(byte[],axfer)byte[8]' | 'initiate_loan_repayment', {
       argsObj: {
         loanKey: Uint8Array
-        repaymentKey: string
         txn: TransactionToSign | Transaction | Promise<SendTransactionResult>
       }
-      argsTuple: [loanKey: Uint8Array, repaymentKey: string, txn: TransactionToSign | Transaction | Promise<SendTransactionResult>]
-      returns: void
+      argsTuple: [loanKey: Uint8Array, txn: TransactionToSign | Transaction | Promise<SendTransactionResult>]
+      returns: Uint8Array
     }>
-    & Record<'execute_loan_repayment(string,account,(uint64,address),asset)(bool,uint64)' | 'execute_loan_repayment', {
+    & Record<'execute_loan_repayment(byte[],uint64,account,asset)(bool,uint64)' | 'execute_loan_repayment', {
       argsObj: {
-        repaymentKey: string
+        repaymentKey: Uint8Array
+        recipientIndex: bigint | number
         recipientAccount: string | Uint8Array
-        paymentRecipient: [bigint | number, string]
         principalAsset: number | bigint
       }
-      argsTuple: [repaymentKey: string, recipientAccount: string | Uint8Array, paymentRecipient: [bigint | number, string], principalAsset: number | bigint]
+      argsTuple: [repaymentKey: Uint8Array, recipientIndex: bigint | number, recipientAccount: string | Uint8Array, principalAsset: number | bigint]
       returns: ExecuteLoanRepaymentResponse
     }>
-    & Record<'clean_up_loan_repayment(string,account)(bool)' | 'clean_up_loan_repayment', {
+    & Record<'execute_loan_repayment_batch(byte[],asset)(bool,uint64)' | 'execute_loan_repayment_batch', {
       argsObj: {
-        repaymentKey: string
+        repaymentKey: Uint8Array
+        principalAsset: number | bigint
+      }
+      argsTuple: [repaymentKey: Uint8Array, principalAsset: number | bigint]
+      returns: ExecuteLoanRepaymentResponse
+    }>
+    & Record<'clean_up_loan_repayment(byte[],account)(bool)' | 'clean_up_loan_repayment', {
+      argsObj: {
+        repaymentKey: Uint8Array
         borrowerAccount: string | Uint8Array
       }
-      argsTuple: [repaymentKey: string, borrowerAccount: string | Uint8Array]
+      argsTuple: [repaymentKey: Uint8Array, borrowerAccount: string | Uint8Array]
+      returns: CleanUpLoanRepaymentResponse
+    }>
+    & Record<'clean_up_loan_repayments(byte[8][])bool[]' | 'clean_up_loan_repayments', {
+      argsObj: {
+        repaymentKeys: Uint8Array[]
+      }
+      argsTuple: [repaymentKeys: Uint8Array[]]
+      returns: boolean[]
+    }>
+    & Record<'repay_loan_round(byte[],axfer)(bool)' | 'repay_loan_round', {
+      argsObj: {
+        loanKey: Uint8Array
+        txn: TransactionToSign | Transaction | Promise<SendTransactionResult>
+      }
+      argsTuple: [loanKey: Uint8Array, txn: TransactionToSign | Transaction | Promise<SendTransactionResult>]
       returns: CleanUpLoanRepaymentResponse
     }>
-    & Record<'handle_payment_default(string,string,uint64,uint64)void' | 'handle_payment_default', {
+    & Record<'handle_payment_default(byte[],uint64,uint64)byte[8]' | 'handle_payment_default', {
       argsObj: {
-        loanKey: string
-        repaymentKey: string
+        loanKey: Uint8Array
         paymentPrincipalAssetAmount: bigint | number
         paymentCollateralAssetAmount: bigint | number
       }
-      argsTuple: [loanKey: string, repaymentKey: string, paymentPrincipalAssetAmount: bigint | number, paymentCollateralAssetAmount: bigint | number]
-      returns: void
+      argsTuple: [loanKey: Uint8Array, paymentPrincipalAssetAmount: bigint | number, paymentCollateralAssetAmount: bigint | number]
+      returns: Uint8Array
+    }>
+    & Record<'handle_payment_defaults(byte[8][])(byte[8],uint64)[]' | 'handle_payment_defaults', {
+      argsObj: {
+        loanKeys: Uint8Array[]
+      }
+      argsTuple: [loanKeys: Uint8Array[]]
+      returns: [Uint8Array, bigint][]
     }>
     & Record<'delete_loan(byte[])void' | 'delete_loan', {
       argsObj: {
@@ -905,6 +1165,48 @@ export type ZaibatsuLoan = {
       argsTuple: [loanKey: Uint8Array]
       returns: void
     }>
+    & Record<'migrate_loan_record(byte[])byte[8]' | 'migrate_loan_record', {
+      argsObj: {
+        legacyLoanKey: Uint8Array
+      }
+      argsTuple: [legacyLoanKey: Uint8Array]
+      returns: Uint8Array
+    }>
+    & Record<'get_borrower_loans(account)byte[8][]' | 'get_borrower_loans', {
+      argsObj: {
+        borrower: string | Uint8Array
+      }
+      argsTuple: [borrower: string | Uint8Array]
+      returns: Uint8Array[]
+    }>
+    & Record<'get_loan_statuses(byte[8][])uint8[]' | 'get_loan_statuses', {
+      argsObj: {
+        loanKeys: Uint8Array[]
+      }
+      argsTuple: [loanKeys: Uint8Array[]]
+      returns: number[]
+    }>
+    & Record<'get_amounts_due(byte[8][])uint64[]' | 'get_amounts_due', {
+      argsObj: {
+        loanKeys: Uint8Array[]
+      }
+      argsTuple: [loanKeys: Uint8Array[]]
+      returns: bigint[]
+    }>
+    & Record<'get_remaining_rounds(byte[8][])uint8[]' | 'get_remaining_rounds', {
+      argsObj: {
+        loanKeys: Uint8Array[]
+      }
+      argsTuple: [loanKeys: Uint8Array[]]
+      returns: number[]
+    }>
+    & Record<'get_repayment_progress(byte[8][])(bool,uint64)[]' | 'get_repayment_progress', {
+      argsObj: {
+        repaymentKeys: Uint8Array[]
+      }
+      argsTuple: [repaymentKeys: Uint8Array[]]
+      returns: [boolean, bigint][]
+    }>
     & Record<'create()bool' | 'create', {
       argsObj: {
       }
@@ -923,9 +1225,44 @@ export type ZaibatsuLoan = {
       argsTuple: []
       returns: boolean
     }>
-    & Record<'opt_contract_into_asset(asset)bool' | 'opt_contract_into_asset', {
+    & Record<'add_admin(account)bool' | 'add_admin', {
       argsObj: {
-        asset: number | bigint
+        account: string | Uint8Array
+      }
+      argsTuple: [account: string | Uint8Array]
+      returns: boolean
+    }>
+    & Record<'remove_admin(account)bool' | 'remove_admin', {
+      argsObj: {
+        account: string | Uint8Array
+      }
+      argsTuple: [account: string | Uint8Array]
+      returns: boolean
+    }>
+    & Record<'migrate_legacy_admins()uint64' | 'migrate_legacy_admins', {
+      argsObj: {
+      }
+      argsTuple: []
+      returns: bigint
+    }>
+    & Record<'set_price_oracle(application,uint64)bool' | 'set_price_oracle', {
+      argsObj: {
+        oracle: number | bigint
+        cacheWindow: bigint | number
+      }
+      argsTuple: [oracle: number | bigint, cacheWindow: bigint | number]
+      returns: boolean
+    }>
+    & Record<'refresh_asset_prices(uint64[])bool' | 'refresh_asset_prices', {
+      argsObj: {
+        assets: bigint | number[]
+      }
+      argsTuple: [assets: bigint | number[]]
+      returns: boolean
+    }>
+    & Record<'opt_contract_into_asset(asset)bool' | 'opt_contract_into_asset', {
+      argsObj: {
+        asset: number | bigint
       }
       argsTuple: [asset: number | bigint]
       returns: boolean
@@ -944,7 +1281,6 @@ export type ZaibatsuLoan = {
    */
   state: {
     global: {
-      admins?: BinaryState
       serviceContract?: BinaryState
     }
   }
@@ -1033,19 +1369,53 @@ export function CompleteLoanArgs([loanUnitName, lenderNftImageUrl, borrowerNftIm
   }
 }
 /**
- * Represents a PaymentReciepient result as a struct
+ * Represents a LoanRecord result as a struct
  */
-export type PaymentReciepient = {
-  paymentPercentage: bigint
-  recipientAddress: string
+export type LoanRecord = {
+  version: number
+  loanType: number
+  tenure: number
+  paymentRounds: number
+  completedPaymentRounds: number
+  collateralPaid: boolean
+  principalPaid: boolean
+  paymentDefaulted: boolean
+  principalAssetId: bigint
+  collateralAssetId: bigint
+  interestAssetAmount: bigint
+  principalAssetAmount: bigint
+  collateralAssetAmount: bigint
+  earlyPaymentPenaltyAmount: bigint
+  paymentCompletionTimestamp: bigint
+  lenderNftAsserId: bigint
+  borrowerNftAsserId: bigint
+  borrower: string
+  activeLoanPosition: bigint
 }
 /**
- * Converts the tuple representation of a PaymentReciepient to the struct representation
+ * Converts the tuple representation of a LoanRecord to the struct representation
  */
-export function PaymentReciepient([paymentPercentage, recipientAddress]: [bigint, string] ) {
+export function LoanRecord([version, loanType, tenure, paymentRounds, completedPaymentRounds, collateralPaid, principalPaid, paymentDefaulted, principalAssetId, collateralAssetId, interestAssetAmount, principalAssetAmount, collateralAssetAmount, earlyPaymentPenaltyAmount, paymentCompletionTimestamp, lenderNftAsserId, borrowerNftAsserId, borrower, activeLoanPosition]: [number, number, number, number, number, boolean, boolean, boolean, bigint, bigint, bigint, bigint, bigint, bigint, bigint, bigint, bigint, string, bigint] ) {
   return {
-    paymentPercentage,
-    recipientAddress,
+    version,
+    loanType,
+    tenure,
+    paymentRounds,
+    completedPaymentRounds,
+    collateralPaid,
+    principalPaid,
+    paymentDefaulted,
+    principalAssetId,
+    collateralAssetId,
+    interestAssetAmount,
+    principalAssetAmount,
+    collateralAssetAmount,
+    earlyPaymentPenaltyAmount,
+    paymentCompletionTimestamp,
+    lenderNftAsserId,
+    borrowerNftAsserId,
+    borrower,
+    activeLoanPosition,
   }
 }
 /**
@@ -1205,100 +1575,194 @@ export abstract class ZaibatsuLoanCallFactory {
   }
 
   /**
-   * Constructs a no op call for the initiate_loan_purchase(byte[],application,(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64),axfer)(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64) ABI method
+   * Constructs a no op call for the initiate_loan_purchase((string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64),axfer)byte[8] ABI method
+   *
+   * Returns the loan_key allocated to the new loan
    *
    * @param args Any args for the contract call
    * @param params Any additional parameters for the call
    * @returns A TypedCallParams object for the call
    */
-  static initiateLoanPurchase(args: MethodArgs<'initiate_loan_purchase(byte[],application,(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64),axfer)(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64)'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+  static initiateLoanPurchase(args: MethodArgs<'initiate_loan_purchase((string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64),axfer)byte[8]'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
     return {
-      method: 'initiate_loan_purchase(byte[],application,(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64),axfer)(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64)' as const,
-      methodArgs: Array.isArray(args) ? args : [args.loanKey, args.folksFeedOracle, args.loanDetails, args.txn],
+      method: 'initiate_loan_purchase((string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64),axfer)byte[8]' as const,
+      methodArgs: Array.isArray(args) ? args : [args.loanDetails, args.txn],
       ...params,
     }
   }
   /**
-   * Constructs a no op call for the complete_non_p2p_loan_purchase(byte[],(string,string,string,string),asset,account)(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64) ABI method
+   * Constructs a no op call for the initiate_loan_purchases((string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64)[])byte[8][] ABI method
+   *
+   * Initiates several loans in one app call and returns their loan_keys.
+   * * The collateral transfer of loans[i] must be the i-th of the   loans.length transactions directly before this app call * Consecutive loans with the same collateral asset share one price   lookup, so loans should be sorted by collateral asset
    *
    * @param args Any args for the contract call
    * @param params Any additional parameters for the call
    * @returns A TypedCallParams object for the call
    */
-  static completeNonP2pLoanPurchase(args: MethodArgs<'complete_non_p2p_loan_purchase(byte[],(string,string,string,string),asset,account)(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64)'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+  static initiateLoanPurchases(args: MethodArgs<'initiate_loan_purchases((string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64)[])byte[8][]'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
     return {
-      method: 'complete_non_p2p_loan_purchase(byte[],(string,string,string,string),asset,account)(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64)' as const,
+      method: 'initiate_loan_purchases((string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64)[])byte[8][]' as const,
+      methodArgs: Array.isArray(args) ? args : [args.loans],
+      ...params,
+    }
+  }
+  /**
+   * Constructs a no op call for the complete_non_p2p_loan_purchase(byte[],(string,string,string,string),asset,account)(uint8,uint8,uint8,uint8,uint8,bool,bool,bool,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,address,uint64) ABI method
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static completeNonP2pLoanPurchase(args: MethodArgs<'complete_non_p2p_loan_purchase(byte[],(string,string,string,string),asset,account)(uint8,uint8,uint8,uint8,uint8,bool,bool,bool,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,address,uint64)'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'complete_non_p2p_loan_purchase(byte[],(string,string,string,string),asset,account)(uint8,uint8,uint8,uint8,uint8,bool,bool,bool,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,address,uint64)' as const,
       methodArgs: Array.isArray(args) ? args : [args.loanKey, args.completionArgs, args.principalAsset, args.borrower],
       ...params,
     }
   }
   /**
-   * Constructs a no op call for the complete_p2p_loan_purchase(byte[],(string,string,string,string),asset,account,axfer)(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64) ABI method
+   * Constructs a no op call for the complete_p2p_loan_purchase(byte[],(string,string,string,string),asset,account,axfer)(uint8,uint8,uint8,uint8,uint8,bool,bool,bool,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,address,uint64) ABI method
    *
    * @param args Any args for the contract call
    * @param params Any additional parameters for the call
    * @returns A TypedCallParams object for the call
    */
-  static completeP2pLoanPurchase(args: MethodArgs<'complete_p2p_loan_purchase(byte[],(string,string,string,string),asset,account,axfer)(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64)'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+  static completeP2pLoanPurchase(args: MethodArgs<'complete_p2p_loan_purchase(byte[],(string,string,string,string),asset,account,axfer)(uint8,uint8,uint8,uint8,uint8,bool,bool,bool,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,address,uint64)'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
     return {
-      method: 'complete_p2p_loan_purchase(byte[],(string,string,string,string),asset,account,axfer)(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64)' as const,
+      method: 'complete_p2p_loan_purchase(byte[],(string,string,string,string),asset,account,axfer)(uint8,uint8,uint8,uint8,uint8,bool,bool,bool,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,address,uint64)' as const,
       methodArgs: Array.isArray(args) ? args : [args.loanKey, args.completionArgs, args.principalAsset, args.borrower, args.txn],
       ...params,
     }
   }
   /**
-   * Constructs a no op call for the initiate_loan_repayment(byte[],string,axfer)void ABI method
+   * Constructs a no op call for the initiate_loan_repayment(byte[],axfer)byte[8] ABI method
+   *
+   * Returns the repayment_key allocated to the repayment round
    *
    * @param args Any args for the contract call
    * @param params Any additional parameters for the call
    * @returns A TypedCallParams object for the call
    */
-  static initiateLoanRepayment(args: MethodArgs<'initiate_loan_repayment(byte[],string,axfer)void'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+  static initiateLoanRepayment(args: MethodArgs<'initiate_loan_repayment(byte[],axfer)byte[8]'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
     return {
-      method: 'initiate_loan_repayment(byte[],string,axfer)void' as const,
-      methodArgs: Array.isArray(args) ? args : [args.loanKey, args.repaymentKey, args.txn],
+      method: 'initiate_loan_repayment(byte[],axfer)byte[8]' as const,
+      methodArgs: Array.isArray(args) ? args : [args.loanKey, args.txn],
       ...params,
     }
   }
   /**
-   * Constructs a no op call for the execute_loan_repayment(string,account,(uint64,address),asset)(bool,uint64) ABI method
+   * Constructs a no op call for the execute_loan_repayment(byte[],uint64,account,asset)(bool,uint64) ABI method
+   *
+   * Pays the loan's payment_recipients[recipient_index] their share of a
+   * pending repayment round
    *
    * @param args Any args for the contract call
    * @param params Any additional parameters for the call
    * @returns A TypedCallParams object for the call
    */
-  static executeLoanRepayment(args: MethodArgs<'execute_loan_repayment(string,account,(uint64,address),asset)(bool,uint64)'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+  static executeLoanRepayment(args: MethodArgs<'execute_loan_repayment(byte[],uint64,account,asset)(bool,uint64)'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
     return {
-      method: 'execute_loan_repayment(string,account,(uint64,address),asset)(bool,uint64)' as const,
-      methodArgs: Array.isArray(args) ? args : [args.repaymentKey, args.recipientAccount, args.paymentRecipient, args.principalAsset],
+      method: 'execute_loan_repayment(byte[],uint64,account,asset)(bool,uint64)' as const,
+      methodArgs: Array.isArray(args) ? args : [args.repaymentKey, args.recipientIndex, args.recipientAccount, args.principalAsset],
       ...params,
     }
   }
   /**
-   * Constructs a no op call for the clean_up_loan_repayment(string,account)(bool) ABI method
+   * Constructs a no op call for the execute_loan_repayment_batch(byte[],asset)(bool,uint64) ABI method
+   *
+   * Pays every recipient of a pending repayment round that has not been
+   * paid yet in a single app call. * The recipient accounts must be passed in the foreign accounts array
    *
    * @param args Any args for the contract call
    * @param params Any additional parameters for the call
    * @returns A TypedCallParams object for the call
    */
-  static cleanUpLoanRepayment(args: MethodArgs<'clean_up_loan_repayment(string,account)(bool)'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+  static executeLoanRepaymentBatch(args: MethodArgs<'execute_loan_repayment_batch(byte[],asset)(bool,uint64)'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
     return {
-      method: 'clean_up_loan_repayment(string,account)(bool)' as const,
+      method: 'execute_loan_repayment_batch(byte[],asset)(bool,uint64)' as const,
+      methodArgs: Array.isArray(args) ? args : [args.repaymentKey, args.principalAsset],
+      ...params,
+    }
+  }
+  /**
+   * Constructs a no op call for the clean_up_loan_repayment(byte[],account)(bool) ABI method
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static cleanUpLoanRepayment(args: MethodArgs<'clean_up_loan_repayment(byte[],account)(bool)'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'clean_up_loan_repayment(byte[],account)(bool)' as const,
       methodArgs: Array.isArray(args) ? args : [args.repaymentKey, args.borrowerAccount],
       ...params,
     }
   }
   /**
-   * Constructs a no op call for the handle_payment_default(string,string,uint64,uint64)void ABI method
+   * Constructs a no op call for the clean_up_loan_repayments(byte[8][])bool[] ABI method
+   *
+   * Closes many repayment rounds in one app call. Returns, for every
+   * repayment_key, whether its loan has been fully repaid. * Every recipient of every round must have been paid * Collateral of fully repaid loans is released to the stored borrower,   so the borrower accounts must be passed in the foreign accounts array * Opcode budget is topped up with OpUp inner transactions paid for by   the outer transaction fee * At most MAX_CLEAN_UP_BATCH_SIZE repayment_keys can be passed, so the   events of every key fit in the logs of one app call
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static cleanUpLoanRepayments(args: MethodArgs<'clean_up_loan_repayments(byte[8][])bool[]'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'clean_up_loan_repayments(byte[8][])bool[]' as const,
+      methodArgs: Array.isArray(args) ? args : [args.repaymentKeys],
+      ...params,
+    }
+  }
+  /**
+   * Constructs a no op call for the repay_loan_round(byte[],axfer)(bool) ABI method
+   *
+   * Runs a whole repayment round in one app call: takes the borrower's
+   * payment, pays every recipient and closes the round without creating a PendingLoanRoundPayment box. * The recipient accounts must be passed in the foreign accounts array
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static repayLoanRound(args: MethodArgs<'repay_loan_round(byte[],axfer)(bool)'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'repay_loan_round(byte[],axfer)(bool)' as const,
+      methodArgs: Array.isArray(args) ? args : [args.loanKey, args.txn],
+      ...params,
+    }
+  }
+  /**
+   * Constructs a no op call for the handle_payment_default(byte[],uint64,uint64)byte[8] ABI method
+   *
+   * Returns the repayment_key of the principal owed to the recipients
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static handlePaymentDefault(args: MethodArgs<'handle_payment_default(byte[],uint64,uint64)byte[8]'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'handle_payment_default(byte[],uint64,uint64)byte[8]' as const,
+      methodArgs: Array.isArray(args) ? args : [args.loanKey, args.paymentPrincipalAssetAmount, args.paymentCollateralAssetAmount],
+      ...params,
+    }
+  }
+  /**
+   * Constructs a no op call for the handle_payment_defaults(byte[8][])(byte[8],uint64)[] ABI method
+   *
+   * Defaults many overdue loans in one app call and returns, for each loan,
+   * the repayment_key of the principal owed and the collateral seized. * A loan is overdue once its payment_completion_timestamp has passed   with payment rounds still outstanding. It can only be defaulted once * The seized collateral is worth the outstanding principal and interest   at the cached oracle prices, capped at the collateral of the loan * The "O" price oracle box and the price boxes of the principal and   collateral assets must be passed in the box references * The principal and collateral assets must be passed in the foreign   assets array, their decimals scale the seizure
    *
    * @param args Any args for the contract call
    * @param params Any additional parameters for the call
    * @returns A TypedCallParams object for the call
    */
-  static handlePaymentDefault(args: MethodArgs<'handle_payment_default(string,string,uint64,uint64)void'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+  static handlePaymentDefaults(args: MethodArgs<'handle_payment_defaults(byte[8][])(byte[8],uint64)[]'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
     return {
-      method: 'handle_payment_default(string,string,uint64,uint64)void' as const,
-      methodArgs: Array.isArray(args) ? args : [args.loanKey, args.repaymentKey, args.paymentPrincipalAssetAmount, args.paymentCollateralAssetAmount],
+      method: 'handle_payment_defaults(byte[8][])(byte[8],uint64)[]' as const,
+      methodArgs: Array.isArray(args) ? args : [args.loanKeys],
       ...params,
     }
   }
@@ -1316,6 +1780,106 @@ export abstract class ZaibatsuLoanCallFactory {
       ...params,
     }
   }
+  /**
+   * Constructs a no op call for the migrate_loan_record(byte[])byte[8] ABI method
+   *
+   * Rewrites a legacy LoanDetails box as a LoanRecord under a newly
+   * allocated loan_key, moving its payment_recipients into their own box. Returns the new loan_key * Loans with more than MAX_LOAN_RECIPIENTS payment_recipients cannot   be migrated, their paid recipients would not fit the bitmap * The new record, recipients and index boxes must be passed in the box   references
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static migrateLoanRecord(args: MethodArgs<'migrate_loan_record(byte[])byte[8]'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'migrate_loan_record(byte[])byte[8]' as const,
+      methodArgs: Array.isArray(args) ? args : [args.legacyLoanKey],
+      ...params,
+    }
+  }
+  /**
+   * Constructs a no op call for the get_borrower_loans(account)byte[8][] ABI method
+   *
+   * Returns the keys of the borrower's open loans.
+   * * The borrower box must be passed in the box references
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static getBorrowerLoans(args: MethodArgs<'get_borrower_loans(account)byte[8][]'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'get_borrower_loans(account)byte[8][]' as const,
+      methodArgs: Array.isArray(args) ? args : [args.borrower],
+      ...params,
+    }
+  }
+  /**
+   * Constructs a no op call for the get_loan_statuses(byte[8][])uint8[] ABI method
+   *
+   * Returns one LOAN_STATUS_* value per loan_key
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static getLoanStatuses(args: MethodArgs<'get_loan_statuses(byte[8][])uint8[]'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'get_loan_statuses(byte[8][])uint8[]' as const,
+      methodArgs: Array.isArray(args) ? args : [args.loanKeys],
+      ...params,
+    }
+  }
+  /**
+   * Constructs a no op call for the get_amounts_due(byte[8][])uint64[] ABI method
+   *
+   * Returns the principal asset amount due for the current payment round of
+   * every loan, 0 for loans that are not found, have no rounds left or whose principal has not been paid out yet
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static getAmountsDue(args: MethodArgs<'get_amounts_due(byte[8][])uint64[]'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'get_amounts_due(byte[8][])uint64[]' as const,
+      methodArgs: Array.isArray(args) ? args : [args.loanKeys],
+      ...params,
+    }
+  }
+  /**
+   * Constructs a no op call for the get_remaining_rounds(byte[8][])uint8[] ABI method
+   *
+   * Returns the payment rounds left on every loan, 0 when not found
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static getRemainingRounds(args: MethodArgs<'get_remaining_rounds(byte[8][])uint8[]'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'get_remaining_rounds(byte[8][])uint8[]' as const,
+      methodArgs: Array.isArray(args) ? args : [args.loanKeys],
+      ...params,
+    }
+  }
+  /**
+   * Constructs a no op call for the get_repayment_progress(byte[8][])(bool,uint64)[] ABI method
+   *
+   * Returns how much of every pending repayment round has been paid out to
+   * the payment recipients. Rounds that are not found report nothing paid
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static getRepaymentProgress(args: MethodArgs<'get_repayment_progress(byte[8][])(bool,uint64)[]'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'get_repayment_progress(byte[8][])(bool,uint64)[]' as const,
+      methodArgs: Array.isArray(args) ? args : [args.repaymentKeys],
+      ...params,
+    }
+  }
   /**
    * Constructs a no op call for the create()bool ABI method
    *
@@ -1330,6 +1894,87 @@ export abstract class ZaibatsuLoanCallFactory {
       ...params,
     }
   }
+  /**
+   * Constructs a no op call for the add_admin(account)bool ABI method
+   *
+   * * The admin box of the account must be passed in the box references
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static addAdmin(args: MethodArgs<'add_admin(account)bool'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'add_admin(account)bool' as const,
+      methodArgs: Array.isArray(args) ? args : [args.account],
+      ...params,
+    }
+  }
+  /**
+   * Constructs a no op call for the remove_admin(account)bool ABI method
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static removeAdmin(args: MethodArgs<'remove_admin(account)bool'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'remove_admin(account)bool' as const,
+      methodArgs: Array.isArray(args) ? args : [args.account],
+      ...params,
+    }
+  }
+  /**
+   * Constructs a no op call for the migrate_legacy_admins()uint64 ABI method
+   *
+   * Moves the admins of the legacy global AddressArray into admin boxes
+   * and deletes the global key, so it can only run once. Returns the number of admins migrated. * Only the creator can migrate the admins * The admin box of every legacy admin must be passed in the box   references, pooled across the group when there are more than 8
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static migrateLegacyAdmins(args: MethodArgs<'migrate_legacy_admins()uint64'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'migrate_legacy_admins()uint64' as const,
+      methodArgs: Array.isArray(args) ? args : [],
+      ...params,
+    }
+  }
+  /**
+   * Constructs a no op call for the set_price_oracle(application,uint64)bool ABI method
+   *
+   * * cache_window is the number of seconds a cached price is used for
+   * before the oracle is read again * The "O" price oracle box must be passed in the box references
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static setPriceOracle(args: MethodArgs<'set_price_oracle(application,uint64)bool'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'set_price_oracle(application,uint64)bool' as const,
+      methodArgs: Array.isArray(args) ? args : [args.oracle, args.cacheWindow],
+      ...params,
+    }
+  }
+  /**
+   * Constructs a no op call for the refresh_asset_prices(uint64[])bool ABI method
+   *
+   * Reads the oracle price of every asset passed into the price cache.
+   * * The price_oracle must be passed in the foreign apps array * The "O" price oracle box and the price boxes must be passed in the   box references
+   *
+   * @param args Any args for the contract call
+   * @param params Any additional parameters for the call
+   * @returns A TypedCallParams object for the call
+   */
+  static refreshAssetPrices(args: MethodArgs<'refresh_asset_prices(uint64[])bool'>, params: AppClientCallCoreParams & CoreAppCallArgs) {
+    return {
+      method: 'refresh_asset_prices(uint64[])bool' as const,
+      methodArgs: Array.isArray(args) ? args : [args.assets],
+      ...params,
+    }
+  }
   /**
    * Constructs a no op call for the opt_contract_into_asset(asset)bool ABI method
    *
@@ -1452,150 +2097,377 @@ export class ZaibatsuLoanClient {
   }
 
   /**
-   * Gets available update methods
+   * Gets available update methods
+   */
+  public get update() {
+    const $this = this
+    return {
+      /**
+       * Updates an existing instance of the ZaibatsuLoan smart contract using the update()bool ABI method.
+       *
+       * @param args The arguments for the smart contract call
+       * @param params Any additional parameters for the call
+       * @returns The update result
+       */
+      async update(args: MethodArgs<'update()bool'>, params: AppClientCallCoreParams & AppClientCompilationParams & CoreAppCallArgs = {}) {
+        return $this.mapReturnValue<MethodReturn<'update()bool'>, AppUpdateCallTransactionResult>(await $this.appClient.update(ZaibatsuLoanCallFactory.update.update(args, params)))
+      },
+    }
+  }
+
+  /**
+   * Gets available delete methods
+   */
+  public get delete() {
+    const $this = this
+    return {
+      /**
+       * Deletes an existing instance of the ZaibatsuLoan smart contract using the delete()bool ABI method.
+       *
+       * @param args The arguments for the smart contract call
+       * @param params Any additional parameters for the call
+       * @returns The delete result
+       */
+      async delete(args: MethodArgs<'delete()bool'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+        return $this.mapReturnValue<MethodReturn<'delete()bool'>>(await $this.appClient.delete(ZaibatsuLoanCallFactory.delete.delete(args, params)))
+      },
+    }
+  }
+
+  /**
+   * Makes a clear_state call to an existing instance of the ZaibatsuLoan smart contract.
+   *
+   * @param args The arguments for the bare call
+   * @returns The clear_state result
+   */
+  public clearState(args: BareCallArgs & AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.appClient.clearState(args)
+  }
+
+  /**
+   * Calls the initiate_loan_purchase((string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64),axfer)byte[8] ABI method.
+   *
+   * Returns the loan_key allocated to the new loan
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public initiateLoanPurchase(args: MethodArgs<'initiate_loan_purchase((string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64),axfer)byte[8]'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(ZaibatsuLoanCallFactory.initiateLoanPurchase(args, params))
+  }
+
+  /**
+   * Calls the initiate_loan_purchases((string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64)[])byte[8][] ABI method.
+   *
+   * Initiates several loans in one app call and returns their loan_keys.
+   * * The collateral transfer of loans[i] must be the i-th of the   loans.length transactions directly before this app call * Consecutive loans with the same collateral asset share one price   lookup, so loans should be sorted by collateral asset
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public initiateLoanPurchases(args: MethodArgs<'initiate_loan_purchases((string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64)[])byte[8][]'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(ZaibatsuLoanCallFactory.initiateLoanPurchases(args, params))
+  }
+
+  /**
+   * Calls the complete_non_p2p_loan_purchase(byte[],(string,string,string,string),asset,account)(uint8,uint8,uint8,uint8,uint8,bool,bool,bool,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,address,uint64) ABI method.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public completeNonP2pLoanPurchase(args: MethodArgs<'complete_non_p2p_loan_purchase(byte[],(string,string,string,string),asset,account)(uint8,uint8,uint8,uint8,uint8,bool,bool,bool,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,address,uint64)'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(ZaibatsuLoanCallFactory.completeNonP2pLoanPurchase(args, params), LoanRecord)
+  }
+
+  /**
+   * Calls the complete_p2p_loan_purchase(byte[],(string,string,string,string),asset,account,axfer)(uint8,uint8,uint8,uint8,uint8,bool,bool,bool,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,address,uint64) ABI method.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public completeP2pLoanPurchase(args: MethodArgs<'complete_p2p_loan_purchase(byte[],(string,string,string,string),asset,account,axfer)(uint8,uint8,uint8,uint8,uint8,bool,bool,bool,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,address,uint64)'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(ZaibatsuLoanCallFactory.completeP2pLoanPurchase(args, params), LoanRecord)
+  }
+
+  /**
+   * Calls the initiate_loan_repayment(byte[],axfer)byte[8] ABI method.
+   *
+   * Returns the repayment_key allocated to the repayment round
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public initiateLoanRepayment(args: MethodArgs<'initiate_loan_repayment(byte[],axfer)byte[8]'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(ZaibatsuLoanCallFactory.initiateLoanRepayment(args, params))
+  }
+
+  /**
+   * Calls the execute_loan_repayment(byte[],uint64,account,asset)(bool,uint64) ABI method.
+   *
+   * Pays the loan's payment_recipients[recipient_index] their share of a
+   * pending repayment round
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public executeLoanRepayment(args: MethodArgs<'execute_loan_repayment(byte[],uint64,account,asset)(bool,uint64)'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(ZaibatsuLoanCallFactory.executeLoanRepayment(args, params), ExecuteLoanRepaymentResponse)
+  }
+
+  /**
+   * Calls the execute_loan_repayment_batch(byte[],asset)(bool,uint64) ABI method.
+   *
+   * Pays every recipient of a pending repayment round that has not been
+   * paid yet in a single app call. * The recipient accounts must be passed in the foreign accounts array
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public executeLoanRepaymentBatch(args: MethodArgs<'execute_loan_repayment_batch(byte[],asset)(bool,uint64)'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(ZaibatsuLoanCallFactory.executeLoanRepaymentBatch(args, params), ExecuteLoanRepaymentResponse)
+  }
+
+  /**
+   * Calls the clean_up_loan_repayment(byte[],account)(bool) ABI method.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public cleanUpLoanRepayment(args: MethodArgs<'clean_up_loan_repayment(byte[],account)(bool)'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(ZaibatsuLoanCallFactory.cleanUpLoanRepayment(args, params), CleanUpLoanRepaymentResponse)
+  }
+
+  /**
+   * Calls the clean_up_loan_repayments(byte[8][])bool[] ABI method.
+   *
+   * Closes many repayment rounds in one app call. Returns, for every
+   * repayment_key, whether its loan has been fully repaid. * Every recipient of every round must have been paid * Collateral of fully repaid loans is released to the stored borrower,   so the borrower accounts must be passed in the foreign accounts array * Opcode budget is topped up with OpUp inner transactions paid for by   the outer transaction fee * At most MAX_CLEAN_UP_BATCH_SIZE repayment_keys can be passed, so the   events of every key fit in the logs of one app call
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public cleanUpLoanRepayments(args: MethodArgs<'clean_up_loan_repayments(byte[8][])bool[]'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(ZaibatsuLoanCallFactory.cleanUpLoanRepayments(args, params))
+  }
+
+  /**
+   * Calls the repay_loan_round(byte[],axfer)(bool) ABI method.
+   *
+   * Runs a whole repayment round in one app call: takes the borrower's
+   * payment, pays every recipient and closes the round without creating a PendingLoanRoundPayment box. * The recipient accounts must be passed in the foreign accounts array
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public repayLoanRound(args: MethodArgs<'repay_loan_round(byte[],axfer)(bool)'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(ZaibatsuLoanCallFactory.repayLoanRound(args, params), CleanUpLoanRepaymentResponse)
+  }
+
+  /**
+   * Calls the handle_payment_default(byte[],uint64,uint64)byte[8] ABI method.
+   *
+   * Returns the repayment_key of the principal owed to the recipients
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public handlePaymentDefault(args: MethodArgs<'handle_payment_default(byte[],uint64,uint64)byte[8]'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(ZaibatsuLoanCallFactory.handlePaymentDefault(args, params))
+  }
+
+  /**
+   * Calls the handle_payment_defaults(byte[8][])(byte[8],uint64)[] ABI method.
+   *
+   * Defaults many overdue loans in one app call and returns, for each loan,
+   * the repayment_key of the principal owed and the collateral seized. * A loan is overdue once its payment_completion_timestamp has passed   with payment rounds still outstanding. It can only be defaulted once * The seized collateral is worth the outstanding principal and interest   at the cached oracle prices, capped at the collateral of the loan * The "O" price oracle box and the price boxes of the principal and   collateral assets must be passed in the box references * The principal and collateral assets must be passed in the foreign   assets array, their decimals scale the seizure
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public handlePaymentDefaults(args: MethodArgs<'handle_payment_defaults(byte[8][])(byte[8],uint64)[]'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(ZaibatsuLoanCallFactory.handlePaymentDefaults(args, params))
+  }
+
+  /**
+   * Calls the delete_loan(byte[])void ABI method.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
+   */
+  public deleteLoan(args: MethodArgs<'delete_loan(byte[])void'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(ZaibatsuLoanCallFactory.deleteLoan(args, params))
+  }
+
+  /**
+   * Calls the migrate_loan_record(byte[])byte[8] ABI method.
+   *
+   * Rewrites a legacy LoanDetails box as a LoanRecord under a newly
+   * allocated loan_key, moving its payment_recipients into their own box. Returns the new loan_key * Loans with more than MAX_LOAN_RECIPIENTS payment_recipients cannot   be migrated, their paid recipients would not fit the bitmap * The new record, recipients and index boxes must be passed in the box   references
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
    */
-  public get update() {
-    const $this = this
-    return {
-      /**
-       * Updates an existing instance of the ZaibatsuLoan smart contract using the update()bool ABI method.
-       *
-       * @param args The arguments for the smart contract call
-       * @param params Any additional parameters for the call
-       * @returns The update result
-       */
-      async update(args: MethodArgs<'update()bool'>, params: AppClientCallCoreParams & AppClientCompilationParams & CoreAppCallArgs = {}) {
-        return $this.mapReturnValue<MethodReturn<'update()bool'>, AppUpdateCallTransactionResult>(await $this.appClient.update(ZaibatsuLoanCallFactory.update.update(args, params)))
-      },
-    }
+  public migrateLoanRecord(args: MethodArgs<'migrate_loan_record(byte[])byte[8]'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(ZaibatsuLoanCallFactory.migrateLoanRecord(args, params))
   }
 
   /**
-   * Gets available delete methods
+   * Calls the get_borrower_loans(account)byte[8][] ABI method.
+   *
+   * Returns the keys of the borrower's open loans.
+   * * The borrower box must be passed in the box references
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
    */
-  public get delete() {
-    const $this = this
-    return {
-      /**
-       * Deletes an existing instance of the ZaibatsuLoan smart contract using the delete()bool ABI method.
-       *
-       * @param args The arguments for the smart contract call
-       * @param params Any additional parameters for the call
-       * @returns The delete result
-       */
-      async delete(args: MethodArgs<'delete()bool'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
-        return $this.mapReturnValue<MethodReturn<'delete()bool'>>(await $this.appClient.delete(ZaibatsuLoanCallFactory.delete.delete(args, params)))
-      },
-    }
+  public getBorrowerLoans(args: MethodArgs<'get_borrower_loans(account)byte[8][]'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(ZaibatsuLoanCallFactory.getBorrowerLoans(args, params))
   }
 
   /**
-   * Makes a clear_state call to an existing instance of the ZaibatsuLoan smart contract.
+   * Calls the get_loan_statuses(byte[8][])uint8[] ABI method.
    *
-   * @param args The arguments for the bare call
-   * @returns The clear_state result
+   * Returns one LOAN_STATUS_* value per loan_key
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The result of the call
    */
-  public clearState(args: BareCallArgs & AppClientCallCoreParams & CoreAppCallArgs = {}) {
-    return this.appClient.clearState(args)
+  public getLoanStatuses(args: MethodArgs<'get_loan_statuses(byte[8][])uint8[]'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(ZaibatsuLoanCallFactory.getLoanStatuses(args, params))
   }
 
   /**
-   * Calls the initiate_loan_purchase(byte[],application,(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64),axfer)(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64) ABI method.
+   * Calls the get_amounts_due(byte[8][])uint64[] ABI method.
+   *
+   * Returns the principal asset amount due for the current payment round of
+   * every loan, 0 for loans that are not found, have no rounds left or whose principal has not been paid out yet
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The result of the call
    */
-  public initiateLoanPurchase(args: MethodArgs<'initiate_loan_purchase(byte[],application,(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64),axfer)(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64)'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
-    return this.call(ZaibatsuLoanCallFactory.initiateLoanPurchase(args, params), LoanDetails)
+  public getAmountsDue(args: MethodArgs<'get_amounts_due(byte[8][])uint64[]'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(ZaibatsuLoanCallFactory.getAmountsDue(args, params))
   }
 
   /**
-   * Calls the complete_non_p2p_loan_purchase(byte[],(string,string,string,string),asset,account)(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64) ABI method.
+   * Calls the get_remaining_rounds(byte[8][])uint8[] ABI method.
+   *
+   * Returns the payment rounds left on every loan, 0 when not found
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The result of the call
    */
-  public completeNonP2pLoanPurchase(args: MethodArgs<'complete_non_p2p_loan_purchase(byte[],(string,string,string,string),asset,account)(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64)'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
-    return this.call(ZaibatsuLoanCallFactory.completeNonP2pLoanPurchase(args, params), LoanDetails)
+  public getRemainingRounds(args: MethodArgs<'get_remaining_rounds(byte[8][])uint8[]'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(ZaibatsuLoanCallFactory.getRemainingRounds(args, params))
   }
 
   /**
-   * Calls the complete_p2p_loan_purchase(byte[],(string,string,string,string),asset,account,axfer)(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64) ABI method.
+   * Calls the get_repayment_progress(byte[8][])(bool,uint64)[] ABI method.
+   *
+   * Returns how much of every pending repayment round has been paid out to
+   * the payment recipients. Rounds that are not found report nothing paid
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The result of the call
    */
-  public completeP2pLoanPurchase(args: MethodArgs<'complete_p2p_loan_purchase(byte[],(string,string,string,string),asset,account,axfer)(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64)'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
-    return this.call(ZaibatsuLoanCallFactory.completeP2pLoanPurchase(args, params), LoanDetails)
+  public getRepaymentProgress(args: MethodArgs<'get_repayment_progress(byte[8][])(bool,uint64)[]'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(ZaibatsuLoanCallFactory.getRepaymentProgress(args, params))
   }
 
   /**
-   * Calls the initiate_loan_repayment(byte[],string,axfer)void ABI method.
+   * Calls the create()bool ABI method.
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The result of the call
    */
-  public initiateLoanRepayment(args: MethodArgs<'initiate_loan_repayment(byte[],string,axfer)void'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
-    return this.call(ZaibatsuLoanCallFactory.initiateLoanRepayment(args, params))
+  public create(args: MethodArgs<'create()bool'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(ZaibatsuLoanCallFactory.create(args, params))
   }
 
   /**
-   * Calls the execute_loan_repayment(string,account,(uint64,address),asset)(bool,uint64) ABI method.
+   * Calls the add_admin(account)bool ABI method.
+   *
+   * * The admin box of the account must be passed in the box references
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The result of the call
    */
-  public executeLoanRepayment(args: MethodArgs<'execute_loan_repayment(string,account,(uint64,address),asset)(bool,uint64)'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
-    return this.call(ZaibatsuLoanCallFactory.executeLoanRepayment(args, params), ExecuteLoanRepaymentResponse)
+  public addAdmin(args: MethodArgs<'add_admin(account)bool'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(ZaibatsuLoanCallFactory.addAdmin(args, params))
   }
 
   /**
-   * Calls the clean_up_loan_repayment(string,account)(bool) ABI method.
+   * Calls the remove_admin(account)bool ABI method.
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The result of the call
    */
-  public cleanUpLoanRepayment(args: MethodArgs<'clean_up_loan_repayment(string,account)(bool)'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
-    return this.call(ZaibatsuLoanCallFactory.cleanUpLoanRepayment(args, params), CleanUpLoanRepaymentResponse)
+  public removeAdmin(args: MethodArgs<'remove_admin(account)bool'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(ZaibatsuLoanCallFactory.removeAdmin(args, params))
   }
 
   /**
-   * Calls the handle_payment_default(string,string,uint64,uint64)void ABI method.
+   * Calls the migrate_legacy_admins()uint64 ABI method.
+   *
+   * Moves the admins of the legacy global AddressArray into admin boxes
+   * and deletes the global key, so it can only run once. Returns the number of admins migrated. * Only the creator can migrate the admins * The admin box of every legacy admin must be passed in the box   references, pooled across the group when there are more than 8
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The result of the call
    */
-  public handlePaymentDefault(args: MethodArgs<'handle_payment_default(string,string,uint64,uint64)void'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
-    return this.call(ZaibatsuLoanCallFactory.handlePaymentDefault(args, params))
+  public migrateLegacyAdmins(args: MethodArgs<'migrate_legacy_admins()uint64'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(ZaibatsuLoanCallFactory.migrateLegacyAdmins(args, params))
   }
 
   /**
-   * Calls the delete_loan(byte[])void ABI method.
+   * Calls the set_price_oracle(application,uint64)bool ABI method.
+   *
+   * * cache_window is the number of seconds a cached price is used for
+   * before the oracle is read again * The "O" price oracle box must be passed in the box references
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The result of the call
    */
-  public deleteLoan(args: MethodArgs<'delete_loan(byte[])void'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
-    return this.call(ZaibatsuLoanCallFactory.deleteLoan(args, params))
+  public setPriceOracle(args: MethodArgs<'set_price_oracle(application,uint64)bool'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(ZaibatsuLoanCallFactory.setPriceOracle(args, params))
   }
 
   /**
-   * Calls the create()bool ABI method.
+   * Calls the refresh_asset_prices(uint64[])bool ABI method.
+   *
+   * Reads the oracle price of every asset passed into the price cache.
+   * * The price_oracle must be passed in the foreign apps array * The "O" price oracle box and the price boxes must be passed in the   box references
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The result of the call
    */
-  public create(args: MethodArgs<'create()bool'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
-    return this.call(ZaibatsuLoanCallFactory.create(args, params))
+  public refreshAssetPrices(args: MethodArgs<'refresh_asset_prices(uint64[])bool'>, params: AppClientCallCoreParams & CoreAppCallArgs = {}) {
+    return this.call(ZaibatsuLoanCallFactory.refreshAssetPrices(args, params))
   }
 
   /**
@@ -1670,9 +2542,6 @@ export class ZaibatsuLoanClient {
   public async getGlobalState(): Promise<ZaibatsuLoan['state']['global']> {
     const state = await this.appClient.getGlobalState()
     return {
-      get admins() {
-        return ZaibatsuLoanClient.getBinaryState(state, 'admins')
-      },
       get serviceContract() {
         return ZaibatsuLoanClient.getBinaryState(state, 'service_contract')
       },
@@ -1685,51 +2554,131 @@ export class ZaibatsuLoanClient {
     let promiseChain:Promise<unknown> = Promise.resolve()
     const resultMappers: Array<undefined | ((x: any) => any)> = []
     return {
-      initiateLoanPurchase(args: MethodArgs<'initiate_loan_purchase(byte[],application,(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64),axfer)(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64)'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+      initiateLoanPurchase(args: MethodArgs<'initiate_loan_purchase((string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64),axfer)byte[8]'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
         promiseChain = promiseChain.then(() => client.initiateLoanPurchase(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
-        resultMappers.push(LoanDetails)
+        resultMappers.push(undefined)
+        return this
+      },
+      initiateLoanPurchases(args: MethodArgs<'initiate_loan_purchases((string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64)[])byte[8][]'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.initiateLoanPurchases(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
         return this
       },
-      completeNonP2pLoanPurchase(args: MethodArgs<'complete_non_p2p_loan_purchase(byte[],(string,string,string,string),asset,account)(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64)'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+      completeNonP2pLoanPurchase(args: MethodArgs<'complete_non_p2p_loan_purchase(byte[],(string,string,string,string),asset,account)(uint8,uint8,uint8,uint8,uint8,bool,bool,bool,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,address,uint64)'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
         promiseChain = promiseChain.then(() => client.completeNonP2pLoanPurchase(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
-        resultMappers.push(LoanDetails)
+        resultMappers.push(LoanRecord)
         return this
       },
-      completeP2pLoanPurchase(args: MethodArgs<'complete_p2p_loan_purchase(byte[],(string,string,string,string),asset,account,axfer)(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64)'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+      completeP2pLoanPurchase(args: MethodArgs<'complete_p2p_loan_purchase(byte[],(string,string,string,string),asset,account,axfer)(uint8,uint8,uint8,uint8,uint8,bool,bool,bool,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,address,uint64)'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
         promiseChain = promiseChain.then(() => client.completeP2pLoanPurchase(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
-        resultMappers.push(LoanDetails)
+        resultMappers.push(LoanRecord)
         return this
       },
-      initiateLoanRepayment(args: MethodArgs<'initiate_loan_repayment(byte[],string,axfer)void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+      initiateLoanRepayment(args: MethodArgs<'initiate_loan_repayment(byte[],axfer)byte[8]'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
         promiseChain = promiseChain.then(() => client.initiateLoanRepayment(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
         resultMappers.push(undefined)
         return this
       },
-      executeLoanRepayment(args: MethodArgs<'execute_loan_repayment(string,account,(uint64,address),asset)(bool,uint64)'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+      executeLoanRepayment(args: MethodArgs<'execute_loan_repayment(byte[],uint64,account,asset)(bool,uint64)'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
         promiseChain = promiseChain.then(() => client.executeLoanRepayment(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
         resultMappers.push(ExecuteLoanRepaymentResponse)
         return this
       },
-      cleanUpLoanRepayment(args: MethodArgs<'clean_up_loan_repayment(string,account)(bool)'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+      executeLoanRepaymentBatch(args: MethodArgs<'execute_loan_repayment_batch(byte[],asset)(bool,uint64)'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.executeLoanRepaymentBatch(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(ExecuteLoanRepaymentResponse)
+        return this
+      },
+      cleanUpLoanRepayment(args: MethodArgs<'clean_up_loan_repayment(byte[],account)(bool)'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
         promiseChain = promiseChain.then(() => client.cleanUpLoanRepayment(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
         resultMappers.push(CleanUpLoanRepaymentResponse)
         return this
       },
-      handlePaymentDefault(args: MethodArgs<'handle_payment_default(string,string,uint64,uint64)void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+      cleanUpLoanRepayments(args: MethodArgs<'clean_up_loan_repayments(byte[8][])bool[]'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.cleanUpLoanRepayments(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
+      repayLoanRound(args: MethodArgs<'repay_loan_round(byte[],axfer)(bool)'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.repayLoanRound(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(CleanUpLoanRepaymentResponse)
+        return this
+      },
+      handlePaymentDefault(args: MethodArgs<'handle_payment_default(byte[],uint64,uint64)byte[8]'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
         promiseChain = promiseChain.then(() => client.handlePaymentDefault(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
         resultMappers.push(undefined)
         return this
       },
+      handlePaymentDefaults(args: MethodArgs<'handle_payment_defaults(byte[8][])(byte[8],uint64)[]'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.handlePaymentDefaults(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
       deleteLoan(args: MethodArgs<'delete_loan(byte[])void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
         promiseChain = promiseChain.then(() => client.deleteLoan(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
         resultMappers.push(undefined)
         return this
       },
+      migrateLoanRecord(args: MethodArgs<'migrate_loan_record(byte[])byte[8]'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.migrateLoanRecord(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
+      getBorrowerLoans(args: MethodArgs<'get_borrower_loans(account)byte[8][]'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.getBorrowerLoans(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
+      getLoanStatuses(args: MethodArgs<'get_loan_statuses(byte[8][])uint8[]'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.getLoanStatuses(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
+      getAmountsDue(args: MethodArgs<'get_amounts_due(byte[8][])uint64[]'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.getAmountsDue(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
+      getRemainingRounds(args: MethodArgs<'get_remaining_rounds(byte[8][])uint8[]'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.getRemainingRounds(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
+      getRepaymentProgress(args: MethodArgs<'get_repayment_progress(byte[8][])(bool,uint64)[]'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.getRepaymentProgress(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
       create(args: MethodArgs<'create()bool'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
         promiseChain = promiseChain.then(() => client.create(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
         resultMappers.push(undefined)
         return this
       },
+      addAdmin(args: MethodArgs<'add_admin(account)bool'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.addAdmin(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
+      removeAdmin(args: MethodArgs<'remove_admin(account)bool'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.removeAdmin(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
+      migrateLegacyAdmins(args: MethodArgs<'migrate_legacy_admins()uint64'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.migrateLegacyAdmins(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
+      setPriceOracle(args: MethodArgs<'set_price_oracle(application,uint64)bool'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.setPriceOracle(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
+      refreshAssetPrices(args: MethodArgs<'refresh_asset_prices(uint64[])bool'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
+        promiseChain = promiseChain.then(() => client.refreshAssetPrices(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
+        resultMappers.push(undefined)
+        return this
+      },
       optContractIntoAsset(args: MethodArgs<'opt_contract_into_asset(asset)bool'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs) {
         promiseChain = promiseChain.then(() => client.optContractIntoAsset(args, {...params, sendParams: {...params?.sendParams, skipSending: true, atc}}))
         resultMappers.push(undefined)
@@ -1794,67 +2743,136 @@ export class ZaibatsuLoanClient {
 }
 export type ZaibatsuLoanComposer<TReturns extends [...any[]] = []> = {
   /**
-   * Calls the initiate_loan_purchase(byte[],application,(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64),axfer)(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64) ABI method.
+   * Calls the initiate_loan_purchase((string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64),axfer)byte[8] ABI method.
+   *
+   * Returns the loan_key allocated to the new loan
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  initiateLoanPurchase(args: MethodArgs<'initiate_loan_purchase((string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64),axfer)byte[8]'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuLoanComposer<[...TReturns, MethodReturn<'initiate_loan_purchase((string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64),axfer)byte[8]'>]>
+
+  /**
+   * Calls the initiate_loan_purchases((string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64)[])byte[8][] ABI method.
+   *
+   * Initiates several loans in one app call and returns their loan_keys.
+   * * The collateral transfer of loans[i] must be the i-th of the   loans.length transactions directly before this app call * Consecutive loans with the same collateral asset share one price   lookup, so loans should be sorted by collateral asset
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  initiateLoanPurchases(args: MethodArgs<'initiate_loan_purchases((string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64)[])byte[8][]'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuLoanComposer<[...TReturns, MethodReturn<'initiate_loan_purchases((string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64)[])byte[8][]'>]>
+
+  /**
+   * Calls the complete_non_p2p_loan_purchase(byte[],(string,string,string,string),asset,account)(uint8,uint8,uint8,uint8,uint8,bool,bool,bool,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,address,uint64) ABI method.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  completeNonP2pLoanPurchase(args: MethodArgs<'complete_non_p2p_loan_purchase(byte[],(string,string,string,string),asset,account)(uint8,uint8,uint8,uint8,uint8,bool,bool,bool,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,address,uint64)'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuLoanComposer<[...TReturns, MethodReturn<'complete_non_p2p_loan_purchase(byte[],(string,string,string,string),asset,account)(uint8,uint8,uint8,uint8,uint8,bool,bool,bool,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,address,uint64)'>]>
+
+  /**
+   * Calls the complete_p2p_loan_purchase(byte[],(string,string,string,string),asset,account,axfer)(uint8,uint8,uint8,uint8,uint8,bool,bool,bool,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,address,uint64) ABI method.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  completeP2pLoanPurchase(args: MethodArgs<'complete_p2p_loan_purchase(byte[],(string,string,string,string),asset,account,axfer)(uint8,uint8,uint8,uint8,uint8,bool,bool,bool,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,address,uint64)'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuLoanComposer<[...TReturns, MethodReturn<'complete_p2p_loan_purchase(byte[],(string,string,string,string),asset,account,axfer)(uint8,uint8,uint8,uint8,uint8,bool,bool,bool,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,uint64,address,uint64)'>]>
+
+  /**
+   * Calls the initiate_loan_repayment(byte[],axfer)byte[8] ABI method.
+   *
+   * Returns the repayment_key allocated to the repayment round
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  initiateLoanRepayment(args: MethodArgs<'initiate_loan_repayment(byte[],axfer)byte[8]'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuLoanComposer<[...TReturns, MethodReturn<'initiate_loan_repayment(byte[],axfer)byte[8]'>]>
+
+  /**
+   * Calls the execute_loan_repayment(byte[],uint64,account,asset)(bool,uint64) ABI method.
+   *
+   * Pays the loan's payment_recipients[recipient_index] their share of a
+   * pending repayment round
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
    */
-  initiateLoanPurchase(args: MethodArgs<'initiate_loan_purchase(byte[],application,(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64),axfer)(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64)'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuLoanComposer<[...TReturns, MethodReturn<'initiate_loan_purchase(byte[],application,(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64),axfer)(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64)'>]>
+  executeLoanRepayment(args: MethodArgs<'execute_loan_repayment(byte[],uint64,account,asset)(bool,uint64)'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuLoanComposer<[...TReturns, MethodReturn<'execute_loan_repayment(byte[],uint64,account,asset)(bool,uint64)'>]>
 
   /**
-   * Calls the complete_non_p2p_loan_purchase(byte[],(string,string,string,string),asset,account)(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64) ABI method.
+   * Calls the execute_loan_repayment_batch(byte[],asset)(bool,uint64) ABI method.
+   *
+   * Pays every recipient of a pending repayment round that has not been
+   * paid yet in a single app call. * The recipient accounts must be passed in the foreign accounts array
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
    */
-  completeNonP2pLoanPurchase(args: MethodArgs<'complete_non_p2p_loan_purchase(byte[],(string,string,string,string),asset,account)(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64)'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuLoanComposer<[...TReturns, MethodReturn<'complete_non_p2p_loan_purchase(byte[],(string,string,string,string),asset,account)(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64)'>]>
+  executeLoanRepaymentBatch(args: MethodArgs<'execute_loan_repayment_batch(byte[],asset)(bool,uint64)'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuLoanComposer<[...TReturns, MethodReturn<'execute_loan_repayment_batch(byte[],asset)(bool,uint64)'>]>
 
   /**
-   * Calls the complete_p2p_loan_purchase(byte[],(string,string,string,string),asset,account,axfer)(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64) ABI method.
+   * Calls the clean_up_loan_repayment(byte[],account)(bool) ABI method.
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
    */
-  completeP2pLoanPurchase(args: MethodArgs<'complete_p2p_loan_purchase(byte[],(string,string,string,string),asset,account,axfer)(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64)'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuLoanComposer<[...TReturns, MethodReturn<'complete_p2p_loan_purchase(byte[],(string,string,string,string),asset,account,axfer)(string,string,uint8,uint64,uint64,uint64,uint64,uint64,uint64,uint8,uint64,(uint64,address)[],bool,bool,uint8,address,uint64,uint64)'>]>
+  cleanUpLoanRepayment(args: MethodArgs<'clean_up_loan_repayment(byte[],account)(bool)'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuLoanComposer<[...TReturns, MethodReturn<'clean_up_loan_repayment(byte[],account)(bool)'>]>
 
   /**
-   * Calls the initiate_loan_repayment(byte[],string,axfer)void ABI method.
+   * Calls the clean_up_loan_repayments(byte[8][])bool[] ABI method.
+   *
+   * Closes many repayment rounds in one app call. Returns, for every
+   * repayment_key, whether its loan has been fully repaid. * Every recipient of every round must have been paid * Collateral of fully repaid loans is released to the stored borrower,   so the borrower accounts must be passed in the foreign accounts array * Opcode budget is topped up with OpUp inner transactions paid for by   the outer transaction fee * At most MAX_CLEAN_UP_BATCH_SIZE repayment_keys can be passed, so the   events of every key fit in the logs of one app call
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
    */
-  initiateLoanRepayment(args: MethodArgs<'initiate_loan_repayment(byte[],string,axfer)void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuLoanComposer<[...TReturns, MethodReturn<'initiate_loan_repayment(byte[],string,axfer)void'>]>
+  cleanUpLoanRepayments(args: MethodArgs<'clean_up_loan_repayments(byte[8][])bool[]'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuLoanComposer<[...TReturns, MethodReturn<'clean_up_loan_repayments(byte[8][])bool[]'>]>
 
   /**
-   * Calls the execute_loan_repayment(string,account,(uint64,address),asset)(bool,uint64) ABI method.
+   * Calls the repay_loan_round(byte[],axfer)(bool) ABI method.
+   *
+   * Runs a whole repayment round in one app call: takes the borrower's
+   * payment, pays every recipient and closes the round without creating a PendingLoanRoundPayment box. * The recipient accounts must be passed in the foreign accounts array
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
    */
-  executeLoanRepayment(args: MethodArgs<'execute_loan_repayment(string,account,(uint64,address),asset)(bool,uint64)'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuLoanComposer<[...TReturns, MethodReturn<'execute_loan_repayment(string,account,(uint64,address),asset)(bool,uint64)'>]>
+  repayLoanRound(args: MethodArgs<'repay_loan_round(byte[],axfer)(bool)'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuLoanComposer<[...TReturns, MethodReturn<'repay_loan_round(byte[],axfer)(bool)'>]>
 
   /**
-   * Calls the clean_up_loan_repayment(string,account)(bool) ABI method.
+   * Calls the handle_payment_default(byte[],uint64,uint64)byte[8] ABI method.
+   *
+   * Returns the repayment_key of the principal owed to the recipients
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
    */
-  cleanUpLoanRepayment(args: MethodArgs<'clean_up_loan_repayment(string,account)(bool)'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuLoanComposer<[...TReturns, MethodReturn<'clean_up_loan_repayment(string,account)(bool)'>]>
+  handlePaymentDefault(args: MethodArgs<'handle_payment_default(byte[],uint64,uint64)byte[8]'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuLoanComposer<[...TReturns, MethodReturn<'handle_payment_default(byte[],uint64,uint64)byte[8]'>]>
 
   /**
-   * Calls the handle_payment_default(string,string,uint64,uint64)void ABI method.
+   * Calls the handle_payment_defaults(byte[8][])(byte[8],uint64)[] ABI method.
+   *
+   * Defaults many overdue loans in one app call and returns, for each loan,
+   * the repayment_key of the principal owed and the collateral seized. * A loan is overdue once its payment_completion_timestamp has passed   with payment rounds still outstanding. It can only be defaulted once * The seized collateral is worth the outstanding principal and interest   at the cached oracle prices, capped at the collateral of the loan * The "O" price oracle box and the price boxes of the principal and   collateral assets must be passed in the box references * The principal and collateral assets must be passed in the foreign   assets array, their decimals scale the seizure
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
    */
-  handlePaymentDefault(args: MethodArgs<'handle_payment_default(string,string,uint64,uint64)void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuLoanComposer<[...TReturns, MethodReturn<'handle_payment_default(string,string,uint64,uint64)void'>]>
+  handlePaymentDefaults(args: MethodArgs<'handle_payment_defaults(byte[8][])(byte[8],uint64)[]'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuLoanComposer<[...TReturns, MethodReturn<'handle_payment_defaults(byte[8][])(byte[8],uint64)[]'>]>
 
   /**
    * Calls the delete_loan(byte[])void ABI method.
@@ -1865,6 +2883,76 @@ export type ZaibatsuLoanComposer<TReturns extends [...any[]] = []> = {
    */
   deleteLoan(args: MethodArgs<'delete_loan(byte[])void'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuLoanComposer<[...TReturns, MethodReturn<'delete_loan(byte[])void'>]>
 
+  /**
+   * Calls the migrate_loan_record(byte[])byte[8] ABI method.
+   *
+   * Rewrites a legacy LoanDetails box as a LoanRecord under a newly
+   * allocated loan_key, moving its payment_recipients into their own box. Returns the new loan_key * Loans with more than MAX_LOAN_RECIPIENTS payment_recipients cannot   be migrated, their paid recipients would not fit the bitmap * The new record, recipients and index boxes must be passed in the box   references
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  migrateLoanRecord(args: MethodArgs<'migrate_loan_record(byte[])byte[8]'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuLoanComposer<[...TReturns, MethodReturn<'migrate_loan_record(byte[])byte[8]'>]>
+
+  /**
+   * Calls the get_borrower_loans(account)byte[8][] ABI method.
+   *
+   * Returns the keys of the borrower's open loans.
+   * * The borrower box must be passed in the box references
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getBorrowerLoans(args: MethodArgs<'get_borrower_loans(account)byte[8][]'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuLoanComposer<[...TReturns, MethodReturn<'get_borrower_loans(account)byte[8][]'>]>
+
+  /**
+   * Calls the get_loan_statuses(byte[8][])uint8[] ABI method.
+   *
+   * Returns one LOAN_STATUS_* value per loan_key
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getLoanStatuses(args: MethodArgs<'get_loan_statuses(byte[8][])uint8[]'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuLoanComposer<[...TReturns, MethodReturn<'get_loan_statuses(byte[8][])uint8[]'>]>
+
+  /**
+   * Calls the get_amounts_due(byte[8][])uint64[] ABI method.
+   *
+   * Returns the principal asset amount due for the current payment round of
+   * every loan, 0 for loans that are not found, have no rounds left or whose principal has not been paid out yet
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getAmountsDue(args: MethodArgs<'get_amounts_due(byte[8][])uint64[]'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuLoanComposer<[...TReturns, MethodReturn<'get_amounts_due(byte[8][])uint64[]'>]>
+
+  /**
+   * Calls the get_remaining_rounds(byte[8][])uint8[] ABI method.
+   *
+   * Returns the payment rounds left on every loan, 0 when not found
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getRemainingRounds(args: MethodArgs<'get_remaining_rounds(byte[8][])uint8[]'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuLoanComposer<[...TReturns, MethodReturn<'get_remaining_rounds(byte[8][])uint8[]'>]>
+
+  /**
+   * Calls the get_repayment_progress(byte[8][])(bool,uint64)[] ABI method.
+   *
+   * Returns how much of every pending repayment round has been paid out to
+   * the payment recipients. Rounds that are not found report nothing paid
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getRepaymentProgress(args: MethodArgs<'get_repayment_progress(byte[8][])(bool,uint64)[]'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuLoanComposer<[...TReturns, MethodReturn<'get_repayment_progress(byte[8][])(bool,uint64)[]'>]>
+
   /**
    * Calls the create()bool ABI method.
    *
@@ -1874,6 +2962,62 @@ export type ZaibatsuLoanComposer<TReturns extends [...any[]] = []> = {
    */
   create(args: MethodArgs<'create()bool'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuLoanComposer<[...TReturns, MethodReturn<'create()bool'>]>
 
+  /**
+   * Calls the add_admin(account)bool ABI method.
+   *
+   * * The admin box of the account must be passed in the box references
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  addAdmin(args: MethodArgs<'add_admin(account)bool'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuLoanComposer<[...TReturns, MethodReturn<'add_admin(account)bool'>]>
+
+  /**
+   * Calls the remove_admin(account)bool ABI method.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  removeAdmin(args: MethodArgs<'remove_admin(account)bool'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuLoanComposer<[...TReturns, MethodReturn<'remove_admin(account)bool'>]>
+
+  /**
+   * Calls the migrate_legacy_admins()uint64 ABI method.
+   *
+   * Moves the admins of the legacy global AddressArray into admin boxes
+   * and deletes the global key, so it can only run once. Returns the number of admins migrated. * Only the creator can migrate the admins * The admin box of every legacy admin must be passed in the box   references, pooled across the group when there are more than 8
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  migrateLegacyAdmins(args: MethodArgs<'migrate_legacy_admins()uint64'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuLoanComposer<[...TReturns, MethodReturn<'migrate_legacy_admins()uint64'>]>
+
+  /**
+   * Calls the set_price_oracle(application,uint64)bool ABI method.
+   *
+   * * cache_window is the number of seconds a cached price is used for
+   * before the oracle is read again * The "O" price oracle box must be passed in the box references
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  setPriceOracle(args: MethodArgs<'set_price_oracle(application,uint64)bool'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuLoanComposer<[...TReturns, MethodReturn<'set_price_oracle(application,uint64)bool'>]>
+
+  /**
+   * Calls the refresh_asset_prices(uint64[])bool ABI method.
+   *
+   * Reads the oracle price of every asset passed into the price cache.
+   * * The price_oracle must be passed in the foreign apps array * The "O" price oracle box and the price boxes must be passed in the   box references
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  refreshAssetPrices(args: MethodArgs<'refresh_asset_prices(uint64[])bool'>, params?: AppClientComposeCallCoreParams & CoreAppCallArgs): ZaibatsuLoanComposer<[...TReturns, MethodReturn<'refresh_asset_prices(uint64[])bool'>]>
+
   /**
    * Calls the opt_contract_into_asset(asset)bool ABI method.
    *
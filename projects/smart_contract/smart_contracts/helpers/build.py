@@ -3,6 +3,7 @@ import subprocess
 from pathlib import Path
 from shutil import rmtree
 
+from smart_contracts.helpers.program_size import extra_program_pages, program_sizes
 from smart_contracts.helpers.util import find_app_spec_file
 
 logger = logging.getLogger(__name__)
@@ -32,6 +33,7 @@ def build(output_dir: Path, contract_path: Path) -> Path:
     )
     if build_result.returncode:
         raise Exception(f"Could not build contract:\n{build_result.stdout}")
+    report_program_size(output_dir)
 
     app_spec_file_name = find_app_spec_file(output_dir)
     if app_spec_file_name is None:
@@ -61,3 +63,13 @@ def build(output_dir: Path, contract_path: Path) -> Path:
                 f"Could not generate typed client:\n{generate_result.stdout}"
             )
     return output_dir / app_spec_file_name
+
+
+def report_program_size(output_dir: Path) -> None:
+    """Logs the assembled program sizes and extra pages of each contract."""
+    for contract_name, (approval_size, clear_size) in program_sizes(output_dir).items():
+        logger.info(
+            f"{contract_name}: approval program {approval_size} bytes, "
+            f"clear program {clear_size} bytes, "
+            f"{extra_program_pages(approval_size, clear_size)} extra page(s)"
+        )
@@ -0,0 +1,256 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+"""
+Default sweep for ZaibatsuLoan.
+
+Pages through the active loan index of the app for loans whose
+payment_completion_timestamp has passed with payment rounds still outstanding,
+and defaults them in packed handle_payment_defaults calls. The contract sizes
+the collateral seizure of every loan from the cached oracle prices and the
+decimals of its assets, so the sweep only has to find the overdue loans and
+pass their assets and boxes. The AVM pools the references of every app call
+in a group, so they are spread over the calls of the group, padded with empty
+get_loan_statuses calls when the handle_payment_defaults calls alone cannot
+carry them. A loan is only defaulted once, loans flagged payment_defaulted are
+skipped.
+"""
+import dataclasses
+import math
+import time
+from collections.abc import Sequence
+
+from algokit_utils import TransactionParameters
+from algosdk.atomic_transaction_composer import AtomicTransactionResponse
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.artifacts.zaibatsu_loan.client import ZaibatsuLoanClient
+from smart_contracts.helpers.fees import suggested_params_with_inner_fees
+from smart_contracts.helpers.loan_codec import LOAN_RECORD, LOAN_RECORD_VERSION
+from smart_contracts.helpers.loan_index import (
+    LOAN_COUNTERS_BOX_NAME,
+    PRICE_ORACLE_BOX_NAME,
+    active_loan_keys,
+    loan_box_name,
+    loan_counters,
+    next_record_keys,
+    read_box,
+    repayment_box_name,
+)
+from smart_contracts.helpers.origination import (
+    MAX_APP_CALL_REFERENCES,
+    MAX_GROUP_SIZE,
+    price_box_name,
+)
+
+# handle_payment_defaults logs a 36 byte LoanDefaulted event and a 16 byte
+# PaymentDefaultResponse per loan, and an app call can log at most 1024 bytes
+MAX_CALL_LOANS = 19
+
+
+@dataclasses.dataclass
+class OverdueLoan:
+    loan_key: bytes
+    principal_asset_id: int
+    collateral_asset_id: int
+    outstanding_rounds: int
+    payment_completion_timestamp: int
+
+
+def decode_overdue_loan(loan_key: bytes, value: bytes, now: int) -> OverdueLoan | None:
+    """Returns the loan if the box holds an overdue LoanRecord, otherwise None."""
+    if len(value) != LOAN_RECORD.head.size or value[0] != LOAN_RECORD_VERSION:
+        return None
+
+    (
+        _version,
+        _loan_type,
+        _tenure,
+        payment_rounds,
+        completed_payment_rounds,
+        _collateral_paid,
+        _principal_paid,
+        payment_defaulted,
+        principal_asset_id,
+        collateral_asset_id,
+        *_amounts,
+        payment_completion_timestamp,
+        _lender_nft_asser_id,
+        _borrower_nft_asser_id,
+        _borrower,
+        _active_loan_position,
+    ) = LOAN_RECORD.decode(value)
+    outstanding_rounds = payment_rounds - completed_payment_rounds
+    if (
+        payment_defaulted
+        or outstanding_rounds <= 0
+        or now <= payment_completion_timestamp
+    ):
+        return None
+    return OverdueLoan(
+        loan_key=loan_key,
+        principal_asset_id=principal_asset_id,
+        collateral_asset_id=collateral_asset_id,
+        outstanding_rounds=outstanding_rounds,
+        payment_completion_timestamp=payment_completion_timestamp,
+    )
+
+
+def find_overdue_loans(
+    algod_client: AlgodClient,
+    app_id: int,
+    active_loan_count: int,
+    now: int | None = None,
+) -> list[OverdueLoan]:
+    """Returns the overdue loans of the app, longest overdue first."""
+    now = int(time.time()) if now is None else now
+    overdue_loans = []
+    for loan_key in active_loan_keys(algod_client, app_id, active_loan_count):
+        value = read_box(algod_client, app_id, loan_box_name(loan_key))
+        loan = value and decode_overdue_loan(loan_key, value, now)
+        if loan:
+            overdue_loans.append(loan)
+    return sorted(overdue_loans, key=lambda loan: loan.payment_completion_timestamp)
+
+
+def loan_assets(loans: Sequence[OverdueLoan]) -> list[int]:
+    """The principal and collateral assets of the loans, in order."""
+    return list(
+        dict.fromkeys(
+            asset_id
+            for loan in loans
+            for asset_id in (loan.principal_asset_id, loan.collateral_asset_id)
+        )
+    )
+
+
+def group_reference_count(calls: Sequence[Sequence[OverdueLoan]]) -> int:
+    """
+    The oracle app, the price oracle box, the loan counters box, every asset
+    and its price box and two boxes per loan.
+    """
+    loans = [loan for call in calls for loan in call]
+    return 3 + 2 * len(loan_assets(loans)) + 2 * len(loans)
+
+
+def group_app_call_count(calls: Sequence[Sequence[OverdueLoan]]) -> int:
+    """The handle_payment_defaults calls and the padding calls their references need."""
+    reference_calls = math.ceil(group_reference_count(calls) / MAX_APP_CALL_REFERENCES)
+    return max(len(calls), reference_calls)
+
+
+def pack_payment_defaults(
+    loans: Sequence[OverdueLoan],
+) -> list[list[list[OverdueLoan]]]:
+    """
+    Sorts loans by asset pair, so calls share assets and price boxes, and
+    packs them into atomic groups of handle_payment_defaults calls.
+    """
+    groups: list[list[list[OverdueLoan]]] = []
+    calls: list[list[OverdueLoan]] = []
+    call: list[OverdueLoan] = []
+    for loan in sorted(
+        loans, key=lambda loan: (loan.principal_asset_id, loan.collateral_asset_id)
+    ):
+        if len(call) == MAX_CALL_LOANS:
+            calls.append(call)
+            call = []
+        if group_app_call_count([*calls, [*call, loan]]) > MAX_GROUP_SIZE:
+            groups.append([*calls, call] if call else calls)
+            calls, call = [], []
+        call.append(loan)
+
+    if call:
+        calls.append(call)
+    if calls:
+        groups.append(calls)
+    return groups
+
+
+def call_references(
+    price_oracle_id: int,
+    assets: Sequence[int],
+    box_references: Sequence[tuple[int, bytes]],
+    app_calls: int,
+) -> list[TransactionParameters]:
+    """
+    Spreads the oracle app, the assets and the boxes of a group over its app
+    calls, at most MAX_APP_CALL_REFERENCES references per call.
+    """
+    references = []
+    for start in range(0, MAX_APP_CALL_REFERENCES * app_calls, MAX_APP_CALL_REFERENCES):
+        end = start + MAX_APP_CALL_REFERENCES
+        # The oracle app is the first reference, the assets and boxes follow it
+        asset_start, asset_end = max(start - 1, 0), max(end - 1, 0)
+        box_start = max(asset_start - len(assets), 0)
+        box_end = max(asset_end - len(assets), 0)
+        references.append(
+            TransactionParameters(
+                foreign_apps=[price_oracle_id] if start == 0 else None,
+                foreign_assets=list(assets[asset_start:asset_end]),
+                boxes=list(box_references[box_start:box_end]),
+            )
+        )
+    return references
+
+
+def handle_payment_defaults(
+    zaibatsu_loan_client: ZaibatsuLoanClient,
+    loans: Sequence[OverdueLoan],
+    price_oracle_id: int,
+) -> list[AtomicTransactionResponse]:
+    """
+    Defaults all the loans, sending one atomic group per packed group. The
+    repayment boxes the contract allocates are named from its key_counter,
+    the padding calls return empty arrays.
+    """
+    app_id = zaibatsu_loan_client.app_id
+    responses = []
+    for calls in pack_payment_defaults(loans):
+        key_counter, _active_loan_count = loan_counters(
+            zaibatsu_loan_client.algod_client, app_id
+        )
+        group_loans = [loan for call in calls for loan in call]
+        repayment_keys = next_record_keys(key_counter, len(group_loans))
+        assets = loan_assets(group_loans)
+        box_names = [
+            *(loan_box_name(loan.loan_key) for loan in group_loans),
+            *(repayment_box_name(key) for key in repayment_keys),
+            PRICE_ORACLE_BOX_NAME,
+            LOAN_COUNTERS_BOX_NAME,
+            *(price_box_name(asset_id) for asset_id in assets),
+        ]
+        references = call_references(
+            price_oracle_id,
+            assets,
+            [(app_id, name) for name in box_names],
+            group_app_call_count(calls),
+        )
+
+        composer = zaibatsu_loan_client.compose()
+        for call, transaction_parameters in zip(calls, references, strict=False):
+            transaction_parameters.suggested_params = suggested_params_with_inner_fees(
+                zaibatsu_loan_client.algod_client,
+                "handle_payment_defaults",
+                loans=len(call),
+            )
+            composer.handle_payment_defaults(
+                loan_keys=[loan.loan_key for loan in call],
+                transaction_parameters=transaction_parameters,
+            )
+        for transaction_parameters in references[len(calls) :]:
+            composer.get_loan_statuses(
+                loan_keys=[], transaction_parameters=transaction_parameters
+            )
+        responses.append(composer.execute())
+    return responses
+
+
+def sweep_payment_defaults(
+    zaibatsu_loan_client: ZaibatsuLoanClient, price_oracle_id: int
+) -> list[OverdueLoan]:
+    """Finds and defaults every overdue loan, returning the defaulted loans."""
+    algod_client = zaibatsu_loan_client.algod_client
+    app_id = zaibatsu_loan_client.app_id
+    _key_counter, active_loan_count = loan_counters(algod_client, app_id)
+    loans = find_overdue_loans(algod_client, app_id, active_loan_count)
+    handle_payment_defaults(zaibatsu_loan_client, loans, price_oracle_id)
+    return loans
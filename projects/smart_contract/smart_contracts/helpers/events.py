@@ -0,0 +1,165 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+"""
+Decoder for the ARC-28 events logged by ZaibatsuLoan and ZaibatsuAuthAndDao.
+
+An event log is the first 4 bytes of the SHA-512/256 hash of the event
+signature followed by the ARC4 encoding of the event struct. The event specs
+here mirror the structs in zaibatsu_loan/types/events.py and
+zaibatsu_auth_and_dao/types/pool.py, so consumers can follow loans by reading
+block logs instead of polling boxes.
+"""
+import base64
+import dataclasses
+import functools
+from collections.abc import Iterable
+from typing import Any
+
+from algosdk import abi, encoding
+
+RECORD_KEY_TYPE = "byte[8]"
+
+
+@dataclasses.dataclass(frozen=True)
+class EventSpec:
+    name: str
+    fields: tuple[tuple[str, str], ...]
+
+    @property
+    def signature(self) -> str:
+        return f"{self.name}({','.join(type_ for _name, type_ in self.fields)})"
+
+    @functools.cached_property
+    def selector(self) -> bytes:
+        selector: bytes = encoding.checksum(self.signature.encode())[:4]
+        return selector
+
+    @functools.cached_property
+    def abi_type(self) -> abi.TupleType:
+        abi_type = abi.ABIType.from_string(self.signature[len(self.name) :])
+        assert isinstance(abi_type, abi.TupleType), "An event must be a struct"
+        return abi_type
+
+
+@dataclasses.dataclass
+class Event:
+    name: str
+    fields: dict[str, Any]
+
+
+EVENT_SPECS = (
+    EventSpec(
+        "LoanInitiated",
+        (
+            ("loan_key", RECORD_KEY_TYPE),
+            ("borrower", "address"),
+            ("principal_asset_id", "uint64"),
+            ("principal_asset_amount", "uint64"),
+            ("collateral_asset_id", "uint64"),
+            ("collateral_asset_amount", "uint64"),
+        ),
+    ),
+    EventSpec(
+        "LoanCompleted",
+        (
+            ("loan_key", RECORD_KEY_TYPE),
+            ("lender_nft_asset_id", "uint64"),
+            ("borrower_nft_asset_id", "uint64"),
+        ),
+    ),
+    EventSpec(
+        "RepaymentRoundInitiated",
+        (
+            ("loan_key", RECORD_KEY_TYPE),
+            ("repayment_key", RECORD_KEY_TYPE),
+            ("repayment_amount", "uint64"),
+        ),
+    ),
+    EventSpec(
+        "RecipientPaid",
+        (
+            ("loan_key", RECORD_KEY_TYPE),
+            ("recipient_index", "uint64"),
+            ("recipient", "address"),
+            ("amount", "uint64"),
+        ),
+    ),
+    EventSpec(
+        "RecipientsPaid",
+        (
+            ("loan_key", RECORD_KEY_TYPE),
+            ("paid_recipients", "uint64"),
+            ("percentage_paid", "uint64"),
+            ("amount_paid", "uint64"),
+        ),
+    ),
+    EventSpec(
+        "RepaymentClosed",
+        (
+            ("repayment_key", RECORD_KEY_TYPE),
+            ("loan_key", RECORD_KEY_TYPE),
+        ),
+    ),
+    EventSpec(
+        "RoundClosed",
+        (
+            ("loan_key", RECORD_KEY_TYPE),
+            ("completed_payment_rounds", "uint8"),
+            ("loan_repaid", "bool"),
+        ),
+    ),
+    EventSpec(
+        "LoanDefaulted",
+        (
+            ("loan_key", RECORD_KEY_TYPE),
+            ("repayment_key", RECORD_KEY_TYPE),
+            ("principal_owed", "uint64"),
+            ("collateral_seized", "uint64"),
+        ),
+    ),
+    EventSpec("LoanDeleted", (("loan_key", RECORD_KEY_TYPE),)),
+    EventSpec(
+        "PoolFunded",
+        (
+            ("asset_id", "uint64"),
+            ("depositor", "address"),
+            ("amount", "uint64"),
+        ),
+    ),
+    EventSpec(
+        "PoolVoteCast",
+        (
+            ("proposal_id", "uint64"),
+            ("voter", "address"),
+            ("approve", "bool"),
+            ("amount", "uint64"),
+        ),
+    ),
+)
+EVENT_SPECS_BY_SELECTOR = {spec.selector: spec for spec in EVENT_SPECS}
+
+
+def decode_event(log: bytes) -> Event | None:
+    """Decodes an event log, None for logs that are not a known event."""
+    spec = EVENT_SPECS_BY_SELECTOR.get(log[:4])
+    if spec is None:
+        return None
+
+    values = spec.abi_type.decode(log[4:])
+    fields = {
+        name: bytes(value) if type_ == RECORD_KEY_TYPE else value
+        for (name, type_), value in zip(spec.fields, values, strict=True)
+    }
+    return Event(name=spec.name, fields=fields)
+
+
+def decode_events(logs: Iterable[str | bytes]) -> list[Event]:
+    """
+    Decodes the events of a transaction's logs, as base64 strings from algod
+    or the indexer or as raw bytes, skipping ABI return values and other logs.
+    """
+    events = []
+    for log in logs:
+        event = decode_event(base64.b64decode(log) if isinstance(log, str) else log)
+        if event:
+            events.append(event)
+    return events
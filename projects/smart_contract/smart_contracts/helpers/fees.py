@@ -0,0 +1,63 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+"""
+Outer transaction fees for methods that send inner transactions.
+
+Every inner transaction sent by the contracts has fee=0, so the app call that
+triggers them must pay for them through fee pooling. The generated clients in
+smart_contracts/artifacts are overwritten on every build, so the fee helpers
+for them live here.
+"""
+from algosdk.transaction import SuggestedParams
+from algosdk.v2client.algod import AlgodClient
+
+# Worst case number of inner transactions sent by each ABI method
+INNER_TRANSACTION_COUNTS: dict[str, int] = {
+    "opt_contract_into_asset": 1,
+    "transfer_asset": 1,
+    "complete_p2p_loan_purchase": 3,
+    "complete_non_p2p_loan_purchase": 3,
+    "execute_loan_repayment": 1,
+    "clean_up_loan_repayment": 1,
+    "create_zaibatsu_token": 1,
+    "transfer_zai": 1,
+}
+
+# Methods that send one inner transaction per payment recipient, plus a fixed
+# number of other inner transactions
+PER_RECIPIENT_INNER_TRANSACTION_COUNTS: dict[str, int] = {
+    "execute_loan_repayment_batch": 0,
+    "repay_loan_round": 1,
+}
+
+# Methods that handle many loans per call, with the worst case number of inner
+# transactions (asset transfers and OpUp calls) sent per loan
+PER_LOAN_INNER_TRANSACTION_COUNTS: dict[str, int] = {
+    "clean_up_loan_repayments": 2,
+    "handle_payment_defaults": 1,
+}
+
+
+def inner_transaction_count(method: str, recipients: int = 0, loans: int = 0) -> int:
+    """Returns the worst case number of inner transactions a method sends."""
+    if method in PER_RECIPIENT_INNER_TRANSACTION_COUNTS:
+        return PER_RECIPIENT_INNER_TRANSACTION_COUNTS[method] + recipients
+    if method in PER_LOAN_INNER_TRANSACTION_COUNTS:
+        return PER_LOAN_INNER_TRANSACTION_COUNTS[method] * loans
+    return INNER_TRANSACTION_COUNTS.get(method, 0)
+
+
+def outer_fee(
+    method: str, min_fee: int = 1000, recipients: int = 0, loans: int = 0
+) -> int:
+    """Returns the fee an app call must pay to cover its inner transactions."""
+    return min_fee * (1 + inner_transaction_count(method, recipients, loans))
+
+
+def suggested_params_with_inner_fees(
+    algod_client: AlgodClient, method: str, recipients: int = 0, loans: int = 0
+) -> SuggestedParams:
+    """Returns suggested params whose flat fee covers the method's inner txns."""
+    sp = algod_client.suggested_params()
+    sp.flat_fee = True
+    sp.fee = outer_fee(method, sp.min_fee, recipients, loans)
+    return sp
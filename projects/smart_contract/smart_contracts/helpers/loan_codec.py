@@ -0,0 +1,226 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+"""
+Fast decoders for the ARC4 structs ZaibatsuLoan stores and returns.
+
+algosdk's ABIType.decode walks the type tree and slices the bytes of every
+field. The codecs here compile a struct layout once into a struct.Struct
+that reads the whole head with one unpack_from call. Dynamic fields are
+resolved from their head offsets, and payment recipients are returned as a
+RecipientsView over the original buffer, so nothing is copied until a
+recipient is read.
+
+The layouts mirror the structs in zaibatsu_loan/types/loan.py and are the one
+client side description of them: the byte offsets other helpers read a
+LoanRecord at are derived from LOAN_RECORD. LoanDetails and LoanRecord also
+match the struct hints of the ARC-32 app spec.
+Values decode as algosdk decodes them, except that byte[N] fields are
+returned as bytes instead of a list of ints.
+"""
+import functools
+import struct
+from collections.abc import Iterator
+from typing import Any
+
+from algosdk import encoding
+
+Fields = tuple[tuple[str, str], ...]
+
+# Mirrors RECORD_KEY_SIZE and LOAN_RECORD_VERSION in zaibatsu_loan/types/loan.py
+RECORD_KEY_SIZE = 8
+LOAN_RECORD_VERSION = 1
+
+LOAN_RECORD_FIELDS: Fields = (
+    ("version", "uint8"),
+    ("loan_type", "uint8"),
+    ("tenure", "uint8"),
+    ("payment_rounds", "uint8"),
+    ("completed_payment_rounds", "uint8"),
+    ("collateral_paid", "bool"),
+    ("principal_paid", "bool"),
+    ("payment_defaulted", "bool"),
+    ("principal_asset_id", "uint64"),
+    ("collateral_asset_id", "uint64"),
+    ("interest_asset_amount", "uint64"),
+    ("principal_asset_amount", "uint64"),
+    ("collateral_asset_amount", "uint64"),
+    ("early_payment_penalty_amount", "uint64"),
+    ("payment_completion_timestamp", "uint64"),
+    ("lender_nft_asser_id", "uint64"),
+    ("borrower_nft_asser_id", "uint64"),
+    ("borrower", "address"),
+    ("active_loan_position", "uint64"),
+)
+PENDING_LOAN_ROUND_PAYMENT_FIELDS: Fields = (
+    ("loan_key", f"byte[{RECORD_KEY_SIZE}]"),
+    ("repayment_amount", "uint64"),
+    ("percentage_paid", "uint64"),
+    ("paid_recipients", "uint64"),
+)
+PAYMENT_RECIEPIENT_FIELDS: Fields = (
+    ("payment_percentage", "uint64"),
+    ("recipient_address", "address"),
+)
+RECIPIENTS_TYPE = "(uint64,address)[]"
+LOAN_DETAILS_FIELDS: Fields = (
+    ("loan_key", "string"),
+    ("loan_type", "string"),
+    ("tenure", "uint8"),
+    ("principal_asset_id", "uint64"),
+    ("collateral_asset_id", "uint64"),
+    ("interest_asset_amount", "uint64"),
+    ("principal_asset_amount", "uint64"),
+    ("collateral_asset_amount", "uint64"),
+    ("early_payment_penalty_amount", "uint64"),
+    ("payment_rounds", "uint8"),
+    ("payment_completion_timestamp", "uint64"),
+    ("payment_recipients", RECIPIENTS_TYPE),
+    ("collateral_paid", "bool"),
+    ("principal_paid", "bool"),
+    ("completed_payment_rounds", "uint8"),
+    ("borrower", "address"),
+    ("lender_nft_asser_id", "uint64"),
+    ("borrower_nft_asser_id", "uint64"),
+)
+
+# How a field is read from the values unpacked from the head
+VALUE = 0
+BOOL = 1
+ADDRESS = 2
+STRING = 3
+RECIPIENTS = 4
+
+# The head format and plan kind of each field type, byte[N] and bool aside.
+# Dynamic fields are a uint16 offset in the head
+FIELD_FORMATS = {
+    "uint8": ("B", VALUE),
+    "uint16": ("H", VALUE),
+    "uint32": ("I", VALUE),
+    "uint64": ("Q", VALUE),
+    "address": ("32s", ADDRESS),
+    "string": ("H", STRING),
+    RECIPIENTS_TYPE: ("H", RECIPIENTS),
+}
+UINT16 = struct.Struct(">H")
+UINT64 = struct.Struct(">Q")
+RECIPIENT = struct.Struct(">Q32s")
+
+# Checksumming dominates decoding an address, and a portfolio repeats the
+# same borrower and recipient addresses across many loans
+encode_address = functools.lru_cache(maxsize=2**16)(encoding.encode_address)
+
+
+def type_string(fields: Fields) -> str:
+    """The ABI tuple type of a struct layout, as algosdk parses it."""
+    return f"({','.join(type_ for _name, type_ in fields)})"
+
+
+class RecipientsView:
+    """
+    A (uint64,address)[] read in place from a memoryview of its encoding.
+    Recipients are decoded when they are read, as
+    (payment_percentage, recipient_address) like algosdk decodes them.
+    """
+
+    def __init__(self, data: bytes | memoryview) -> None:
+        self.view = memoryview(data)
+        self.length: int
+        (self.length,) = UINT16.unpack_from(self.view)
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, index: int) -> tuple[int, str]:
+        percentage, address = RECIPIENT.unpack_from(self.view, self.offset(index))
+        return percentage, encode_address(address)
+
+    def __iter__(self) -> Iterator[tuple[int, str]]:
+        end = UINT16.size + self.length * RECIPIENT.size
+        for percentage, address in RECIPIENT.iter_unpack(self.view[UINT16.size : end]):
+            yield percentage, encode_address(address)
+
+    def offset(self, index: int) -> int:
+        assert 0 <= index < self.length, "Recipient index out of range"
+        return UINT16.size + index * RECIPIENT.size
+
+    def payment_percentage(self, index: int) -> int:
+        (percentage,) = UINT64.unpack_from(self.view, self.offset(index))
+        return int(percentage)
+
+    def recipient_address(self, index: int) -> memoryview:
+        """The raw 32 byte address of a recipient, without copying it."""
+        start = self.offset(index) + UINT64.size
+        return self.view[start : start + 32]
+
+
+class StructCodec:
+    """
+    Decoder for one ARC4 struct layout. The head, with dynamic fields as
+    their uint16 offsets, is described by one struct.Struct and every
+    field is then read from the unpacked values by its compiled plan.
+    """
+
+    def __init__(self, fields: Fields) -> None:
+        self.fields = fields
+        formats = [">"]
+        self.plan: list[tuple[int, int, int]] = []
+        # The byte offset of every field in the head, the head offset of
+        # dynamic fields and the byte holding bools
+        self.offsets: dict[str, int] = {}
+        bools = 0
+        for name, type_ in fields:
+            if type_ == "bool":
+                # Consecutive bools are packed into one byte, most
+                # significant bit first
+                if bools % 8 == 0:
+                    formats.append("B")
+                self.offsets[name] = struct.calcsize("".join(formats[:-1]))
+                self.plan.append((BOOL, len(formats) - 2, 0x80 >> bools % 8))
+                bools += 1
+                continue
+            bools = 0
+            if type_.startswith("byte["):
+                format_, kind = f"{type_[5:-1]}s", VALUE
+            else:
+                assert type_ in FIELD_FORMATS, f"Unsupported field type {type_}"
+                format_, kind = FIELD_FORMATS[type_]
+            self.offsets[name] = struct.calcsize("".join(formats))
+            formats.append(format_)
+            self.plan.append((kind, len(formats) - 2, 0))
+        self.head = struct.Struct("".join(formats))
+        # Layouts of plain values are returned as unpacked
+        self.unpacked = all(kind == VALUE for kind, _index, _mask in self.plan)
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        return tuple(name for name, _type in self.fields)
+
+    def decode(self, data: bytes | memoryview) -> tuple[Any, ...]:
+        """Decodes the struct at the start of data into a tuple of its fields."""
+        head = self.head.unpack_from(data)
+        if self.unpacked:
+            return head
+        values: list[Any] = []
+        for kind, index, mask in self.plan:
+            value = head[index]
+            if kind == BOOL:
+                value = bool(value & mask)
+            elif kind == ADDRESS:
+                value = encode_address(value)
+            elif kind == STRING:
+                (length,) = UINT16.unpack_from(data, value)
+                start = value + UINT16.size
+                value = str(data[start : start + length], "utf-8")
+            elif kind == RECIPIENTS:
+                value = RecipientsView(memoryview(data)[value:])
+            values.append(value)
+        return tuple(values)
+
+
+LOAN_RECORD = StructCodec(LOAN_RECORD_FIELDS)
+PENDING_LOAN_ROUND_PAYMENT = StructCodec(PENDING_LOAN_ROUND_PAYMENT_FIELDS)
+PAYMENT_RECIEPIENT = StructCodec(PAYMENT_RECIEPIENT_FIELDS)
+LOAN_DETAILS = StructCodec(LOAN_DETAILS_FIELDS)
+
+# Byte offsets of the LoanRecord fields read without decoding the record
+BORROWER_OFFSET = LOAN_RECORD.offsets["borrower"]
+ACTIVE_LOAN_POSITION_OFFSET = LOAN_RECORD.offsets["active_loan_position"]
@@ -0,0 +1,192 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+"""
+Client side view of the ZaibatsuLoan box layout.
+
+Box names carry a one byte type prefix (see zaibatsu_loan/storage.py) followed
+by an 8 byte key the contract allocates from its key_counter, kept with the
+active_loan_count in the "C" loan counters box. The keys of all
+active loans are kept in a paged index (see
+zaibatsu_loan/active_loans.py) and the keys of each borrower's loans in a
+borrower box (see zaibatsu_loan/borrower_loans.py). The helpers here name the
+boxes app calls must reference and read the indexes without listing every box.
+"""
+import base64
+import http
+from collections.abc import Iterator, Sequence
+
+from algosdk import encoding
+from algosdk.error import AlgodHTTPError
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.helpers.loan_codec import (
+    ACTIVE_LOAN_POSITION_OFFSET,
+    BORROWER_OFFSET,
+    RECORD_KEY_SIZE,
+)
+
+LOAN_COUNTERS_BOX_NAME = b"C"
+LOAN_KEY_PREFIX = b"L"
+RECIPIENTS_KEY_PREFIX = b"P"
+REPAYMENT_KEY_PREFIX = b"R"
+ACTIVE_LOANS_KEY_PREFIX = b"I"
+BORROWER_LOANS_KEY_PREFIX = b"B"
+# Boxes of zaibatsu_base/contract.py, "A" + address, "F" + itob(asset_id) and
+# the "O" price oracle box
+ADMIN_KEY_PREFIX = b"A"
+PRICE_KEY_PREFIX = b"F"
+PRICE_ORACLE_BOX_NAME = b"O"
+
+# Mirrors zaibatsu_loan/active_loans.py, a page is 1024 bytes of loan keys
+ACTIVE_LOANS_PER_PAGE = 1024 // RECORD_KEY_SIZE
+
+
+def record_key(counter: int) -> bytes:
+    """The loan or repayment key allocated when key_counter reaches counter."""
+    return counter.to_bytes(RECORD_KEY_SIZE, "big")
+
+
+def next_record_keys(key_counter: int, keys: int) -> list[bytes]:
+    """The keys the next calls allocating keys will be given, in order."""
+    return [record_key(key_counter + i) for i in range(1, keys + 1)]
+
+
+def loan_box_name(loan_key: bytes) -> bytes:
+    return LOAN_KEY_PREFIX + loan_key
+
+
+def recipients_box_name(loan_key: bytes) -> bytes:
+    return RECIPIENTS_KEY_PREFIX + loan_key
+
+
+def repayment_box_name(repayment_key: bytes) -> bytes:
+    return REPAYMENT_KEY_PREFIX + repayment_key
+
+
+def borrower_box_name(borrower: str) -> bytes:
+    public_key: bytes = encoding.decode_address(borrower)
+    return BORROWER_LOANS_KEY_PREFIX + public_key
+
+
+def active_loans_page_box_name(position: int) -> bytes:
+    """The page box holding an index position."""
+    page = position // ACTIVE_LOANS_PER_PAGE
+    return ACTIVE_LOANS_KEY_PREFIX + page.to_bytes(8, "big")
+
+
+def decode_loan_key_slots(value: bytes) -> list[bytes]:
+    """Returns the loan keys of the used slots of an index box."""
+    empty_slot = bytes(RECORD_KEY_SIZE)
+    slots = (
+        value[offset : offset + RECORD_KEY_SIZE]
+        for offset in range(0, len(value), RECORD_KEY_SIZE)
+    )
+    return [slot for slot in slots if slot != empty_slot]
+
+
+def read_box(algod_client: AlgodClient, app_id: int, name: bytes) -> bytes | None:
+    try:
+        box = algod_client.application_box_by_name(app_id, name)
+    except AlgodHTTPError as error:
+        if error.code == http.HTTPStatus.NOT_FOUND:
+            return None
+        raise
+    assert isinstance(box, dict), "Expected a JSON box response"
+    return base64.b64decode(box["value"])
+
+
+def loan_counters(algod_client: AlgodClient, app_id: int) -> tuple[int, int]:
+    """The key_counter and active_loan_count, both zero until the box is written."""
+    value = read_box(algod_client, app_id, LOAN_COUNTERS_BOX_NAME) or bytes(16)
+    return int.from_bytes(value[:8], "big"), int.from_bytes(value[8:16], "big")
+
+
+def active_loan_keys_page(
+    algod_client: AlgodClient, app_id: int, page: int
+) -> list[bytes]:
+    """Returns one page of active loan keys, empty past the last page."""
+    name = active_loans_page_box_name(page * ACTIVE_LOANS_PER_PAGE)
+    value = read_box(algod_client, app_id, name)
+    return decode_loan_key_slots(value) if value else []
+
+
+def active_loan_keys(
+    algod_client: AlgodClient, app_id: int, active_loan_count: int
+) -> Iterator[bytes]:
+    """Yields the keys of all active loans, one page box read at a time."""
+    pages = (active_loan_count + ACTIVE_LOANS_PER_PAGE - 1) // ACTIVE_LOANS_PER_PAGE
+    for page in range(pages):
+        yield from active_loan_keys_page(algod_client, app_id, page)
+
+
+def borrower_loan_keys(
+    algod_client: AlgodClient, app_id: int, borrower: str
+) -> list[bytes]:
+    """Returns the keys of the borrower's open loans from their borrower box."""
+    value = read_box(algod_client, app_id, borrower_box_name(borrower))
+    return decode_loan_key_slots(value) if value else []
+
+
+def active_loan_insert_box_names(active_loan_count: int, loans: int) -> list[bytes]:
+    """The page boxes written when loans are added to the index."""
+    positions = range(active_loan_count, active_loan_count + loans)
+    return list(dict.fromkeys(active_loans_page_box_name(p) for p in positions))
+
+
+def loan_removal_box_names(
+    algod_client: AlgodClient,
+    app_id: int,
+    active_loan_count: int,
+    loan_keys: Sequence[bytes],
+) -> list[bytes]:
+    """
+    The index boxes and loan records touched when the loans are removed in
+    order, each removal moving the last active loan into the removed slot.
+    """
+    pages: dict[bytes, list[bytes]] = {}
+
+    def loan_key_at(position: int) -> bytes:
+        name = active_loans_page_box_name(position)
+        if name not in pages:
+            pages[name] = decode_loan_key_slots(
+                read_box(algod_client, app_id, name) or b""
+            )
+        return pages[name][position % ACTIVE_LOANS_PER_PAGE]
+
+    records: dict[bytes, bytes] = {}
+
+    def record_of(loan_key: bytes) -> bytes:
+        if loan_key not in records:
+            record = read_box(algod_client, app_id, loan_box_name(loan_key))
+            assert record is not None, f"Loan {loan_key!r} was not found"
+            records[loan_key] = record
+        return records[loan_key]
+
+    def position_of(loan_key: bytes) -> int:
+        record = record_of(loan_key)
+        return int.from_bytes(
+            record[ACTIVE_LOAN_POSITION_OFFSET : ACTIVE_LOAN_POSITION_OFFSET + 8],
+            "big",
+        )
+
+    # Loans moved by earlier removals, by their new position
+    moved: dict[int, bytes] = {}
+    box_names = []
+    for removed, loan_key in enumerate(loan_keys):
+        borrower = record_of(loan_key)[BORROWER_OFFSET : BORROWER_OFFSET + 32]
+        box_names.append(BORROWER_LOANS_KEY_PREFIX + borrower)
+        moved_positions = {key: position for position, key in moved.items()}
+        position = moved_positions.get(loan_key)
+        if position is None:
+            position = position_of(loan_key)
+        last_position = active_loan_count - removed - 1
+        box_names += [
+            active_loans_page_box_name(position),
+            active_loans_page_box_name(last_position),
+        ]
+        if position == last_position:
+            moved.pop(position, None)
+            continue
+        last_loan_key = moved.pop(last_position, None) or loan_key_at(last_position)
+        moved[position] = last_loan_key
+        box_names.append(loan_box_name(last_loan_key))
+    return list(dict.fromkeys(box_names))
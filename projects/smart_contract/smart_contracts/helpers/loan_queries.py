@@ -0,0 +1,103 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+"""
+Batched reads of the ZaibatsuLoan readonly getters through simulate.
+
+Simulated calls need no fees to be paid and no signatures, and with unnamed
+resources allowed the box references are filled in by algod. Keys are split
+into calls of at most MAX_APP_CALL_REFERENCES keys, so every call stays within
+the resources a single app call may touch, and the calls are packed into one
+simulated group, answering up to MAX_GROUP_SIZE * MAX_APP_CALL_REFERENCES keys
+per algod request.
+"""
+from collections.abc import Sequence
+from typing import Any
+
+from algokit_utils import TransactionParameters
+from algosdk import encoding
+from algosdk.atomic_transaction_composer import EmptySigner
+from algosdk.v2client import models
+
+from smart_contracts.artifacts.zaibatsu_loan.client import ZaibatsuLoanClient
+from smart_contracts.helpers.origination import (
+    MAX_APP_CALL_REFERENCES,
+    MAX_GROUP_SIZE,
+)
+
+# Mirrors the LOAN_STATUS_* values in zaibatsu_loan/types/loan.py
+LOAN_STATUS_NOT_FOUND = 0
+LOAN_STATUS_AWAITING_PRINCIPAL = 1
+LOAN_STATUS_ACTIVE = 2
+LOAN_STATUS_OVERDUE = 3
+
+
+def simulate_readonly(
+    zaibatsu_loan_client: ZaibatsuLoanClient,
+    method: str,
+    arg_name: str,
+    keys: Sequence[Any],
+) -> list[Any]:
+    """Calls a readonly getter over all the keys and joins the results."""
+    sender = zaibatsu_loan_client.sender or encoding.encode_address(bytes(32))
+    transaction_parameters = TransactionParameters(sender=sender, signer=EmptySigner())
+    request = models.SimulateRequest(
+        txn_groups=[],
+        allow_empty_signatures=True,
+        allow_unnamed_resources=True,
+    )
+
+    calls = [
+        keys[start : start + MAX_APP_CALL_REFERENCES]
+        for start in range(0, len(keys), MAX_APP_CALL_REFERENCES)
+    ]
+    results = []
+    for start in range(0, len(calls), MAX_GROUP_SIZE):
+        composer = zaibatsu_loan_client.compose()
+        for call in calls[start : start + MAX_GROUP_SIZE]:
+            getattr(composer, method)(
+                **{arg_name: list(call)},
+                transaction_parameters=transaction_parameters,
+            )
+        response = composer.atc.simulate(zaibatsu_loan_client.algod_client, request)
+        results += [
+            value for result in response.abi_results for value in result.return_value
+        ]
+    return results
+
+
+def loan_statuses(
+    zaibatsu_loan_client: ZaibatsuLoanClient, loan_keys: Sequence[bytes]
+) -> list[int]:
+    return simulate_readonly(
+        zaibatsu_loan_client, "get_loan_statuses", "loan_keys", loan_keys
+    )
+
+
+def amounts_due(
+    zaibatsu_loan_client: ZaibatsuLoanClient, loan_keys: Sequence[bytes]
+) -> list[int]:
+    return simulate_readonly(
+        zaibatsu_loan_client, "get_amounts_due", "loan_keys", loan_keys
+    )
+
+
+def remaining_rounds(
+    zaibatsu_loan_client: ZaibatsuLoanClient, loan_keys: Sequence[bytes]
+) -> list[int]:
+    return simulate_readonly(
+        zaibatsu_loan_client, "get_remaining_rounds", "loan_keys", loan_keys
+    )
+
+
+def repayment_progress(
+    zaibatsu_loan_client: ZaibatsuLoanClient, repayment_keys: Sequence[bytes]
+) -> list[tuple[bool, int]]:
+    """(loan_repayment_complete, percentage_paid) per repayment_key"""
+    return [
+        tuple(progress)
+        for progress in simulate_readonly(
+            zaibatsu_loan_client,
+            "get_repayment_progress",
+            "repayment_keys",
+            repayment_keys,
+        )
+    ]
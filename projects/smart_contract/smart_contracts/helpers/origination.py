@@ -0,0 +1,199 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+"""
+Client side packing for ZaibatsuLoan.initiate_loan_purchases.
+
+Each initiate_loan_purchases app call reads the collateral transfers directly
+before it in the group and writes two boxes per loan. The AVM pools the
+references of every app call in a group, so the boxes of all the loans are
+spread over the app calls of the group, padded with empty get_loan_statuses
+calls when the initiate_loan_purchases calls alone cannot carry them. A call
+only ends where its arguments would outgrow the app call's argument limit.
+The contract allocates the loan keys from its key_counter, so the boxes of a
+group are named from the key_counter read before it is sent.
+"""
+import dataclasses
+import math
+from collections.abc import Sequence
+
+from algokit_utils import TransactionParameters
+from algosdk import abi
+from algosdk.atomic_transaction_composer import (
+    AtomicTransactionResponse,
+    TransactionWithSigner,
+)
+
+from smart_contracts.artifacts.zaibatsu_loan.client import (
+    LoanDetails,
+    ZaibatsuLoanClient,
+)
+from smart_contracts.helpers.loan_codec import LOAN_DETAILS_FIELDS, type_string
+from smart_contracts.helpers.loan_index import (
+    LOAN_COUNTERS_BOX_NAME,
+    PRICE_KEY_PREFIX,
+    PRICE_ORACLE_BOX_NAME,
+    active_loan_insert_box_names,
+    borrower_box_name,
+    loan_box_name,
+    loan_counters,
+    next_record_keys,
+    recipients_box_name,
+)
+
+MAX_GROUP_SIZE = 16
+MAX_APP_CALL_REFERENCES = 8
+# The app arguments of one app call, the method selector included
+MAX_APP_ARGS_SIZE = 2048
+METHOD_SELECTOR_SIZE = 4
+# A group appends at most 16 loans to the active loan index, so it writes to
+# at most two of its pages
+ACTIVE_LOANS_PAGE_REFERENCES = 2
+LOAN_DETAILS_TYPE = abi.ABIType.from_string(type_string(LOAN_DETAILS_FIELDS))
+
+
+@dataclasses.dataclass
+class LoanOrigination:
+    loan_details: LoanDetails
+    collateral_txn: TransactionWithSigner
+
+
+def loan_box_names(loan_key: bytes) -> list[bytes]:
+    """The loan record box and the payment recipients box of a loan."""
+    return [loan_box_name(loan_key), recipients_box_name(loan_key)]
+
+
+def price_box_name(asset_id: int) -> bytes:
+    return PRICE_KEY_PREFIX + asset_id.to_bytes(8, "big")
+
+
+def call_args_size(call: Sequence[LoanOrigination]) -> int:
+    """
+    The method selector and the loans array, a uint16 length followed by one
+    uint16 offset and one encoded LoanDetails per loan.
+    """
+    return (
+        METHOD_SELECTOR_SIZE
+        + 2
+        + sum(
+            2 + len(LOAN_DETAILS_TYPE.encode(dataclasses.astuple(loan.loan_details)))
+            for loan in call
+        )
+    )
+
+
+def group_reference_count(calls: Sequence[Sequence[LoanOrigination]]) -> int:
+    """
+    The oracle app, the price oracle box, the loan counters box, one price box
+    per collateral asset, two boxes per loan, one box per borrower and the
+    active loan index pages.
+    """
+    loans = [loan for call in calls for loan in call]
+    collateral_assets = {loan.loan_details.collateral_asset_id for loan in loans}
+    borrowers = {loan.loan_details.borrower for loan in loans}
+    return (
+        3
+        + len(collateral_assets)
+        + 2 * len(loans)
+        + len(borrowers)
+        + ACTIVE_LOANS_PAGE_REFERENCES
+    )
+
+
+def group_app_call_count(calls: Sequence[Sequence[LoanOrigination]]) -> int:
+    """The initiate_loan_purchases calls and the padding calls their references need."""
+    reference_calls = math.ceil(group_reference_count(calls) / MAX_APP_CALL_REFERENCES)
+    return max(len(calls), reference_calls)
+
+
+def group_transaction_count(calls: Sequence[Sequence[LoanOrigination]]) -> int:
+    """One collateral transfer per loan plus the app calls of the group."""
+    return sum(len(call) for call in calls) + group_app_call_count(calls)
+
+
+def pack_loan_originations(
+    loans: Sequence[LoanOrigination],
+) -> list[list[list[LoanOrigination]]]:
+    """
+    Sorts loans by collateral asset, so each call only prices every asset once,
+    and packs them into atomic groups of initiate_loan_purchases calls.
+    """
+    groups: list[list[list[LoanOrigination]]] = []
+    calls: list[list[LoanOrigination]] = []
+    call: list[LoanOrigination] = []
+    for loan in sorted(loans, key=lambda loan: loan.loan_details.collateral_asset_id):
+        if call and call_args_size([*call, loan]) > MAX_APP_ARGS_SIZE:
+            calls.append(call)
+            call = []
+        if group_transaction_count([*calls, [*call, loan]]) > MAX_GROUP_SIZE:
+            groups.append([*calls, call] if call else calls)
+            calls, call = [], []
+        call.append(loan)
+
+    if call:
+        calls.append(call)
+    if calls:
+        groups.append(calls)
+    return groups
+
+
+def initiate_loan_purchases(
+    zaibatsu_loan_client: ZaibatsuLoanClient,
+    loans: Sequence[LoanOrigination],
+    price_oracle_id: int,
+) -> list[AtomicTransactionResponse]:
+    """
+    Initiates all the loans, sending one atomic group per packed group. The
+    loan_keys allocated to the loans are the return values of the
+    initiate_loan_purchases calls, the padding calls return empty arrays.
+    """
+    responses = []
+    for calls in pack_loan_originations(loans):
+        key_counter, active_loan_count = loan_counters(
+            zaibatsu_loan_client.algod_client, zaibatsu_loan_client.app_id
+        )
+        group_loans = [loan for call in calls for loan in call]
+        loan_keys = next_record_keys(key_counter, len(group_loans))
+        box_names = [
+            *(name for key in loan_keys for name in loan_box_names(key)),
+            PRICE_ORACLE_BOX_NAME,
+            LOAN_COUNTERS_BOX_NAME,
+            *dict.fromkeys(
+                price_box_name(loan.loan_details.collateral_asset_id)
+                for loan in group_loans
+            ),
+            *dict.fromkeys(
+                borrower_box_name(loan.loan_details.borrower) for loan in group_loans
+            ),
+            *active_loan_insert_box_names(active_loan_count, len(group_loans)),
+        ]
+        # The oracle app takes the first reference of the first app call
+        box_references = [(zaibatsu_loan_client.app_id, name) for name in box_names]
+        call_boxes = [
+            box_references[max(start - 1, 0) : start + MAX_APP_CALL_REFERENCES - 1]
+            for start in range(
+                0,
+                MAX_APP_CALL_REFERENCES * group_app_call_count(calls),
+                MAX_APP_CALL_REFERENCES,
+            )
+        ]
+        references = [
+            TransactionParameters(
+                foreign_apps=[price_oracle_id] if index == 0 else None,
+                boxes=boxes,
+            )
+            for index, boxes in enumerate(call_boxes)
+        ]
+
+        composer = zaibatsu_loan_client.compose()
+        for call, transaction_parameters in zip(calls, references, strict=False):
+            for loan in call:
+                composer.atc.add_transaction(loan.collateral_txn)
+            composer.initiate_loan_purchases(
+                loans=[dataclasses.astuple(loan.loan_details) for loan in call],
+                transaction_parameters=transaction_parameters,
+            )
+        for transaction_parameters in references[len(calls) :]:
+            composer.get_loan_statuses(
+                loan_keys=[], transaction_parameters=transaction_parameters
+            )
+        responses.append(composer.execute())
+    return responses
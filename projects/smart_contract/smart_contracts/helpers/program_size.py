@@ -0,0 +1,213 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+"""
+Assembled sizes of the TEAL programs written by the build.
+
+puyapy 2.x only writes TEAL, so program sizes are worked out from the TEAL the
+way the algod assembler lays it out: int and byte constants referenced more
+than once are moved into an intcblock/bytecblock, most frequent first, and
+every other constant is pushed inline with pushint/pushbytes.
+"""
+
+import ast
+import math
+from collections import Counter
+from pathlib import Path
+
+from algosdk import encoding
+
+PROGRAM_PAGE_SIZE = 2048
+
+# Named int constants accepted by the assembler
+NAMED_INTS: dict[str, int] = {
+    "NoOp": 0,
+    "OptIn": 1,
+    "CloseOut": 2,
+    "ClearState": 3,
+    "UpdateApplication": 4,
+    "DeleteApplication": 5,
+    "unknown": 0,
+    "pay": 1,
+    "keyreg": 2,
+    "acfg": 3,
+    "axfer": 4,
+    "afrz": 5,
+    "appl": 6,
+}
+
+# Bytes taken by the immediates of every op that has any
+IMMEDIATE_SIZES: dict[str, int] = {
+    **dict.fromkeys(
+        [
+            "acct_params_get",
+            "app_params_get",
+            "arg",
+            "asset_holding_get",
+            "asset_params_get",
+            "base64_decode",
+            "block",
+            "bury",
+            "cover",
+            "dig",
+            "dupn",
+            "frame_bury",
+            "frame_dig",
+            "gaid",
+            "gloads",
+            "global",
+            "gtxns",
+            "gtxnsas",
+            "itxn",
+            "itxn_field",
+            "itxnas",
+            "json_ref",
+            "load",
+            "popn",
+            "replace2",
+            "store",
+            "txn",
+            "txnas",
+            "uncover",
+            "vrf_verify",
+        ],
+        1,
+    ),
+    **dict.fromkeys(
+        [
+            "extract",
+            "gitxn",
+            "gitxnas",
+            "gload",
+            "gtxn",
+            "gtxnas",
+            "gtxnsa",
+            "itxna",
+            "proto",
+            "substring",
+            "txna",
+        ],
+        2,
+    ),
+    **dict.fromkeys(["gitxna", "gtxna"], 3),
+    **dict.fromkeys(["b", "bnz", "bz", "callsub"], 2),
+}
+
+
+def varuint_size(value: int) -> int:
+    return max(math.ceil(value.bit_length() / 7), 1)
+
+
+def int_constant(argument: str) -> int:
+    if argument in NAMED_INTS:
+        return NAMED_INTS[argument]
+    return int(argument, 0)
+
+
+def bytes_constant(op: str, argument: str) -> bytes:
+    if op == "method":
+        # ARC-4 method and ARC-28 event selectors alike
+        selector: bytes = encoding.checksum(ast.literal_eval(argument).encode())[:4]
+        return selector
+    if argument.startswith("0x"):
+        return bytes.fromhex(argument[2:])
+    value: bytes = ast.literal_eval(f"b{argument}")
+    return value
+
+
+def constant_block_size(constant_sizes: list[int]) -> int:
+    """Size of an intcblock/bytecblock holding constants of the given sizes"""
+    if not constant_sizes:
+        return 0
+    return 1 + varuint_size(len(constant_sizes)) + sum(constant_sizes)
+
+
+def constant_reference_size(block_index: int) -> int:
+    """intc_0 to intc_3 have no immediate, intc/bytec take a one byte index"""
+    return 1 if block_index < 4 else 2
+
+
+def line_tokens(line: str) -> list[str]:
+    """The tokens of a TEAL line, keeping quoted strings whole and dropping comments"""
+    tokens: list[str] = []
+    token = ""
+    quoted = escaped = False
+    for index, char in enumerate(line):
+        if quoted:
+            token += char
+            quoted = escaped or char != '"'
+            escaped = not escaped and char == "\\"
+        elif char == '"':
+            token += char
+            quoted = True
+        elif char.isspace() or line.startswith("//", index):
+            if token:
+                tokens.append(token)
+                token = ""
+            if not char.isspace():
+                return tokens
+        else:
+            token += char
+    return [*tokens, token] if token else tokens
+
+
+def program_lines(teal: str) -> list[list[str]]:
+    """The tokens of every line that assembles to bytecode"""
+    return [
+        tokens
+        for tokens in map(line_tokens, teal.splitlines())
+        if tokens and not tokens[0].endswith(":")
+    ]
+
+
+def teal_program_size(teal: str) -> int:
+    """The size in bytes of the assembled TEAL program"""
+    size = 0
+    ints: Counter[int] = Counter()
+    byte_strings: Counter[bytes] = Counter()
+    for op, *arguments in program_lines(teal):
+        if op == "#pragma":
+            size += varuint_size(int(arguments[1]))
+        elif op == "int":
+            ints[int_constant(arguments[0])] += 1
+        elif op in ("byte", "method"):
+            byte_strings[bytes_constant(op, arguments[0])] += 1
+        elif op in ("match", "switch"):
+            size += 2 + 2 * len(arguments)
+        else:
+            size += 1 + IMMEDIATE_SIZES.get(op, 0)
+
+    int_block = [value for value, count in ints.most_common() if count > 1]
+    size += constant_block_size([varuint_size(value) for value in int_block])
+    for index, value in enumerate(int_block):
+        size += ints.pop(value) * constant_reference_size(index)
+    size += sum(1 + varuint_size(value) for value in ints)
+
+    bytes_block = [
+        constant for constant, count in byte_strings.most_common() if count > 1
+    ]
+    size += constant_block_size(
+        [varuint_size(len(constant)) + len(constant) for constant in bytes_block]
+    )
+    for index, constant in enumerate(bytes_block):
+        size += byte_strings.pop(constant) * constant_reference_size(index)
+    size += sum(
+        1 + varuint_size(len(constant)) + len(constant) for constant in byte_strings
+    )
+    return size
+
+
+def extra_program_pages(approval_size: int, clear_size: int) -> int:
+    """The extra pages an app needs for programs of the given sizes"""
+    return max(math.ceil((approval_size + clear_size) / PROGRAM_PAGE_SIZE) - 1, 0)
+
+
+def program_sizes(output_dir: Path) -> dict[str, tuple[int, int]]:
+    """The approval and clear program sizes of every contract in output_dir"""
+    sizes = {}
+    for approval_path in sorted(output_dir.glob("*.approval.teal")):
+        contract_name = approval_path.name.removesuffix(".approval.teal")
+        clear_path = output_dir / f"{contract_name}.clear.teal"
+        sizes[contract_name] = (
+            teal_program_size(approval_path.read_text()),
+            teal_program_size(clear_path.read_text()) if clear_path.exists() else 0,
+        )
+    return sizes
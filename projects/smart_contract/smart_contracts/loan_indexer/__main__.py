@@ -0,0 +1,43 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+"""
+Syncs a LoanStateStore from the algod configured in the environment.
+
+    python -m smart_contracts.loan_indexer loans.sqlite --app-id 1 --app-id 2 \
+        --start-round 40000000
+
+Without --stop-round the chain is followed until interrupted.
+"""
+
+import argparse
+import logging
+
+from algokit_utils import get_algod_client
+from dotenv import load_dotenv
+
+from smart_contracts.loan_indexer.follower import BlockFollower
+from smart_contracts.loan_indexer.store import LoanStateStore
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("db", help="path of the SQLite view")
+    parser.add_argument("--app-id", type=int, action="append", required=True)
+    parser.add_argument("--start-round", type=int, default=1)
+    parser.add_argument("--stop-round", type=int)
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s"
+    )
+    load_dotenv()
+    store = LoanStateStore(args.db)
+    try:
+        BlockFollower(get_algod_client(), store, args.app_id).sync(
+            args.start_round, args.stop_round
+        )
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
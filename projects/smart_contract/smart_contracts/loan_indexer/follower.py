@@ -0,0 +1,111 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+"""
+Follows algod blocks and feeds the contract events into a LoanStateStore.
+
+Blocks are fetched as msgpack, which keeps the log bytes intact, and every
+application call to one of the followed apps is searched for ARC-28 events,
+including calls made as inner transactions by other apps. Every event is
+paired with the id of the app that logged it. A sync resumes from the round
+after the store's checkpoint of the followed apps.
+"""
+import logging
+from collections.abc import Collection, Iterator
+from typing import Any
+
+import msgpack  # type: ignore[import-untyped]
+from algosdk.v2client.algod import AlgodClient
+
+from smart_contracts.helpers.events import Event, decode_events
+from smart_contracts.loan_indexer.store import LoanStateStore
+
+logger = logging.getLogger(__name__)
+
+
+def decode_block(block_response: bytes) -> dict[bytes, Any]:
+    """Decodes a msgpack block response, keeping map keys and strings as bytes."""
+    response = msgpack.unpackb(block_response, raw=True, strict_map_key=False)
+    block: dict[bytes, Any] = response[b"block"]
+    return block
+
+
+def transaction_events(
+    signed_txn: dict[bytes, Any], app_ids: Collection[int]
+) -> Iterator[tuple[int, Event]]:
+    """
+    Yields the events logged by a transaction and its inner transactions, as
+    (app_id, event) pairs.
+    """
+    txn: dict[bytes, Any] = signed_txn.get(b"txn", {})
+    apply_data: dict[bytes, Any] = signed_txn.get(b"dt", {})
+    # App creation calls have no app id, no followed app has id 0
+    app_id: int = txn.get(b"apid", 0)
+    if txn.get(b"type") == b"appl" and app_id in app_ids:
+        for event in decode_events(apply_data.get(b"lg", [])):
+            yield app_id, event
+    for inner_txn in apply_data.get(b"itx", []):
+        yield from transaction_events(inner_txn, app_ids)
+
+
+def block_events(
+    block: dict[bytes, Any], app_ids: Collection[int]
+) -> list[tuple[int, Event]]:
+    """The events logged by the followed apps in a block, in order."""
+    return [
+        event
+        for signed_txn in block.get(b"txns", [])
+        for event in transaction_events(signed_txn, app_ids)
+    ]
+
+
+def status_last_round(status: dict[str, Any] | bytes) -> int:
+    assert isinstance(status, dict), "Expected a JSON node status"
+    last_round: int = status["last-round"]
+    return last_round
+
+
+class BlockFollower:
+    def __init__(
+        self,
+        algod_client: AlgodClient,
+        store: LoanStateStore,
+        app_ids: Collection[int],
+    ) -> None:
+        self.algod_client = algod_client
+        self.store = store
+        self.app_ids = frozenset(app_ids)
+
+    def next_round(self, start_round: int) -> int:
+        """The round to apply next, start_round on a store that never synced."""
+        checkpoint = self.store.checkpoint(self.app_ids)
+        return start_round if checkpoint is None else checkpoint + 1
+
+    def apply_round(self, round_: int) -> None:
+        block_response = self.algod_client.block_info(
+            round_num=round_, response_format="msgpack"
+        )
+        assert isinstance(block_response, bytes), "Expected a msgpack block"
+        events = block_events(decode_block(block_response), self.app_ids)
+        self.store.apply_block(round_, self.app_ids, events)
+        if events:
+            logger.info(f"Applied {len(events)} events of round {round_}")
+
+    def wait_for_round(self, round_: int) -> None:
+        last_round = status_last_round(self.algod_client.status())
+        while last_round < round_:
+            last_round = status_last_round(
+                self.algod_client.status_after_block(last_round)
+            )
+
+    def sync(self, start_round: int, stop_round: int | None = None) -> int | None:
+        """
+        Applies every block from the checkpoint, or start_round, through
+        stop_round and returns the last round applied. Without a stop_round it
+        follows the chain, waiting for every new block.
+        """
+        round_ = self.next_round(start_round)
+        while stop_round is None or round_ <= stop_round:
+            if stop_round is None:
+                self.wait_for_round(round_)
+            self.apply_round(round_)
+            round_ += 1
+        return self.store.checkpoint(self.app_ids)
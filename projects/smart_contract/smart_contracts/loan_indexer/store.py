@@ -0,0 +1,382 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+"""
+SQLite materialized view of the loans, repayments and pool ledger.
+
+The view is built only from the ARC-28 events of the contracts (see
+smart_contracts/helpers/events.py), so it can be rebuilt from any round and
+kept up to date incrementally. Rows are keyed by the app that logged them,
+since every app allocates its loan and repayment keys from its own counter.
+Every block is applied in the same SQLite transaction as the checkpoints that
+record it, so a sync that stops halfway resumes from the last block that was
+fully applied. Each app has its own checkpoint, and a block is only applied
+to the apps that have not seen it yet, so apps can be followed from
+different rounds.
+"""
+
+import sqlite3
+from collections.abc import Callable, Collection, Iterable
+from pathlib import Path
+from typing import Any
+
+from smart_contracts.helpers.events import Event
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS checkpoints (
+    app_id INTEGER PRIMARY KEY,
+    round INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS loans (
+    app_id INTEGER NOT NULL,
+    loan_key BLOB NOT NULL,
+    borrower TEXT NOT NULL,
+    principal_asset_id INTEGER NOT NULL,
+    principal_asset_amount INTEGER NOT NULL,
+    collateral_asset_id INTEGER NOT NULL,
+    collateral_asset_amount INTEGER NOT NULL,
+    lender_nft_asset_id INTEGER NOT NULL DEFAULT 0,
+    borrower_nft_asset_id INTEGER NOT NULL DEFAULT 0,
+    completed_payment_rounds INTEGER NOT NULL DEFAULT 0,
+    amount_repaid INTEGER NOT NULL DEFAULT 0,
+    status TEXT NOT NULL,
+    initiated_round INTEGER NOT NULL,
+    updated_round INTEGER NOT NULL,
+    PRIMARY KEY (app_id, loan_key)
+);
+CREATE INDEX IF NOT EXISTS loans_borrower ON loans (app_id, borrower);
+CREATE TABLE IF NOT EXISTS repayments (
+    app_id INTEGER NOT NULL,
+    repayment_key BLOB NOT NULL,
+    loan_key BLOB NOT NULL,
+    kind TEXT NOT NULL,
+    repayment_amount INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    initiated_round INTEGER NOT NULL,
+    closed_round INTEGER,
+    PRIMARY KEY (app_id, repayment_key)
+);
+CREATE INDEX IF NOT EXISTS repayments_loan_key ON repayments (app_id, loan_key);
+CREATE TABLE IF NOT EXISTS pool_balances (
+    app_id INTEGER NOT NULL,
+    asset_id INTEGER NOT NULL,
+    amount INTEGER NOT NULL,
+    depositors INTEGER NOT NULL,
+    PRIMARY KEY (app_id, asset_id)
+);
+CREATE TABLE IF NOT EXISTS pool_deposits (
+    app_id INTEGER NOT NULL,
+    asset_id INTEGER NOT NULL,
+    depositor TEXT NOT NULL,
+    amount INTEGER NOT NULL,
+    PRIMARY KEY (app_id, asset_id, depositor)
+);
+CREATE TABLE IF NOT EXISTS vote_tallies (
+    app_id INTEGER NOT NULL,
+    proposal_id INTEGER NOT NULL,
+    votes_for INTEGER NOT NULL,
+    votes_against INTEGER NOT NULL,
+    votes_cast INTEGER NOT NULL,
+    PRIMARY KEY (app_id, proposal_id)
+);
+"""
+
+# loans.status values
+LOAN_AWAITING_PRINCIPAL = "awaiting_principal"
+LOAN_ACTIVE = "active"
+LOAN_DEFAULTED = "defaulted"
+LOAN_REPAID = "repaid"
+LOAN_DELETED = "deleted"
+
+# repayments.kind and repayments.status values
+REPAYMENT_ROUND = "round"
+REPAYMENT_DEFAULT = "default"
+REPAYMENT_PENDING = "pending"
+REPAYMENT_CLOSED = "closed"
+
+
+class LoanStateStore:
+    def __init__(self, path: str | Path = ":memory:") -> None:
+        self.connection = sqlite3.connect(path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.executescript(SCHEMA)
+        self.handlers: dict[str, Callable[[int, int, dict[str, Any]], None]] = {
+            "LoanInitiated": self.loan_initiated,
+            "LoanCompleted": self.loan_completed,
+            "RepaymentRoundInitiated": self.repayment_round_initiated,
+            "RecipientPaid": self.recipient_paid,
+            "RecipientsPaid": self.recipients_paid,
+            "RepaymentClosed": self.repayment_closed,
+            "RoundClosed": self.round_closed,
+            "LoanDefaulted": self.loan_defaulted,
+            "LoanDeleted": self.loan_deleted,
+            "PoolFunded": self.pool_funded,
+            "PoolVoteCast": self.pool_vote_cast,
+        }
+
+    def close(self) -> None:
+        self.connection.close()
+
+    def app_checkpoint(self, app_id: int) -> int | None:
+        """The last round applied for an app, None before its first sync."""
+        row = self.connection.execute(
+            "SELECT round FROM checkpoints WHERE app_id = ?", (app_id,)
+        ).fetchone()
+        return row["round"] if row else None
+
+    def checkpoint(self, app_ids: Collection[int]) -> int | None:
+        """
+        The last round applied for all the apps, None when one of them was
+        never synced.
+        """
+        checkpoints = [self.app_checkpoint(app_id) for app_id in app_ids]
+        if not checkpoints or None in checkpoints:
+            return None
+        return min(checkpoint for checkpoint in checkpoints if checkpoint is not None)
+
+    def apply_block(
+        self,
+        round_: int,
+        app_ids: Collection[int],
+        events: Iterable[tuple[int, Event]],
+    ) -> None:
+        """
+        Applies the events of a block, as (app_id, event) pairs, and
+        checkpoints it atomically. Apps that already applied the block are
+        left unchanged.
+        """
+        checkpoints = {app_id: self.app_checkpoint(app_id) for app_id in app_ids}
+        pending_app_ids = {
+            app_id
+            for app_id, checkpoint in checkpoints.items()
+            if checkpoint is None or checkpoint < round_
+        }
+        with self.connection:
+            for app_id, event in events:
+                if app_id in pending_app_ids:
+                    self.handlers[event.name](app_id, round_, event.fields)
+            self.connection.executemany(
+                "INSERT INTO checkpoints (app_id, round) VALUES (?, ?)"
+                " ON CONFLICT (app_id) DO UPDATE SET round = excluded.round",
+                [(app_id, round_) for app_id in pending_app_ids],
+            )
+
+    def loan(self, app_id: int, loan_key: bytes) -> sqlite3.Row | None:
+        row: sqlite3.Row | None = self.connection.execute(
+            "SELECT * FROM loans WHERE app_id = ? AND loan_key = ?",
+            (app_id, loan_key),
+        ).fetchone()
+        return row
+
+    def borrower_loans(self, app_id: int, borrower: str) -> list[sqlite3.Row]:
+        return self.connection.execute(
+            "SELECT * FROM loans WHERE app_id = ? AND borrower = ?"
+            " ORDER BY initiated_round",
+            (app_id, borrower),
+        ).fetchall()
+
+    def loan_repayments(self, app_id: int, loan_key: bytes) -> list[sqlite3.Row]:
+        return self.connection.execute(
+            "SELECT * FROM repayments WHERE app_id = ? AND loan_key = ?"
+            " ORDER BY initiated_round",
+            (app_id, loan_key),
+        ).fetchall()
+
+    def pool_balance(self, app_id: int, asset_id: int) -> sqlite3.Row | None:
+        row: sqlite3.Row | None = self.connection.execute(
+            "SELECT * FROM pool_balances WHERE app_id = ? AND asset_id = ?",
+            (app_id, asset_id),
+        ).fetchone()
+        return row
+
+    def pool_deposit(self, app_id: int, asset_id: int, depositor: str) -> int:
+        row = self.connection.execute(
+            "SELECT amount FROM pool_deposits"
+            " WHERE app_id = ? AND asset_id = ? AND depositor = ?",
+            (app_id, asset_id, depositor),
+        ).fetchone()
+        amount: int = row["amount"] if row else 0
+        return amount
+
+    def vote_tally(self, app_id: int, proposal_id: int) -> sqlite3.Row | None:
+        row: sqlite3.Row | None = self.connection.execute(
+            "SELECT * FROM vote_tallies WHERE app_id = ? AND proposal_id = ?",
+            (app_id, proposal_id),
+        ).fetchone()
+        return row
+
+    def update_loan(
+        self, app_id: int, round_: int, loan_key: bytes, assignments: str, *args: Any
+    ) -> None:
+        """Applies the SET assignments to a loan, with args as their parameters"""
+        self.connection.execute(
+            f"UPDATE loans SET {assignments}, updated_round = ?"
+            " WHERE app_id = ? AND loan_key = ?",
+            (*args, round_, app_id, loan_key),
+        )
+
+    def loan_initiated(self, app_id: int, round_: int, fields: dict[str, Any]) -> None:
+        self.connection.execute(
+            "INSERT OR REPLACE INTO loans (app_id, loan_key, borrower,"
+            " principal_asset_id, principal_asset_amount, collateral_asset_id,"
+            " collateral_asset_amount, status, initiated_round, updated_round)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                app_id,
+                fields["loan_key"],
+                fields["borrower"],
+                fields["principal_asset_id"],
+                fields["principal_asset_amount"],
+                fields["collateral_asset_id"],
+                fields["collateral_asset_amount"],
+                LOAN_AWAITING_PRINCIPAL,
+                round_,
+                round_,
+            ),
+        )
+
+    def loan_completed(self, app_id: int, round_: int, fields: dict[str, Any]) -> None:
+        self.update_loan(
+            app_id,
+            round_,
+            fields["loan_key"],
+            "status = ?, lender_nft_asset_id = ?, borrower_nft_asset_id = ?",
+            LOAN_ACTIVE,
+            fields["lender_nft_asset_id"],
+            fields["borrower_nft_asset_id"],
+        )
+
+    def repayment_round_initiated(
+        self, app_id: int, round_: int, fields: dict[str, Any]
+    ) -> None:
+        self.insert_repayment(
+            app_id,
+            round_,
+            fields["repayment_key"],
+            fields["loan_key"],
+            REPAYMENT_ROUND,
+            fields["repayment_amount"],
+        )
+
+    def recipient_paid(self, app_id: int, round_: int, fields: dict[str, Any]) -> None:
+        self.update_loan(
+            app_id,
+            round_,
+            fields["loan_key"],
+            "amount_repaid = amount_repaid + ?",
+            fields["amount"],
+        )
+
+    def recipients_paid(self, app_id: int, round_: int, fields: dict[str, Any]) -> None:
+        self.update_loan(
+            app_id,
+            round_,
+            fields["loan_key"],
+            "amount_repaid = amount_repaid + ?",
+            fields["amount_paid"],
+        )
+
+    def repayment_closed(
+        self, app_id: int, round_: int, fields: dict[str, Any]
+    ) -> None:
+        self.connection.execute(
+            "UPDATE repayments SET status = ?, closed_round = ?"
+            " WHERE app_id = ? AND repayment_key = ?",
+            (REPAYMENT_CLOSED, round_, app_id, fields["repayment_key"]),
+        )
+
+    def round_closed(self, app_id: int, round_: int, fields: dict[str, Any]) -> None:
+        self.update_loan(
+            app_id,
+            round_,
+            fields["loan_key"],
+            "completed_payment_rounds = ?, status = CASE WHEN ? THEN ? ELSE status END",
+            fields["completed_payment_rounds"],
+            fields["loan_repaid"],
+            LOAN_REPAID,
+        )
+
+    def loan_defaulted(self, app_id: int, round_: int, fields: dict[str, Any]) -> None:
+        self.update_loan(
+            app_id,
+            round_,
+            fields["loan_key"],
+            "status = ?, collateral_asset_amount = collateral_asset_amount - ?",
+            LOAN_DEFAULTED,
+            fields["collateral_seized"],
+        )
+        self.insert_repayment(
+            app_id,
+            round_,
+            fields["repayment_key"],
+            fields["loan_key"],
+            REPAYMENT_DEFAULT,
+            fields["principal_owed"],
+        )
+
+    def loan_deleted(self, app_id: int, round_: int, fields: dict[str, Any]) -> None:
+        """Deleted loans are kept in the view, repaid ones keep their status"""
+        self.update_loan(
+            app_id,
+            round_,
+            fields["loan_key"],
+            "status = CASE WHEN status = ? THEN status ELSE ? END",
+            LOAN_REPAID,
+            LOAN_DELETED,
+        )
+
+    def pool_funded(self, app_id: int, _round: int, fields: dict[str, Any]) -> None:
+        asset_id, depositor = fields["asset_id"], fields["depositor"]
+        new_depositor = not self.connection.execute(
+            "SELECT 1 FROM pool_deposits"
+            " WHERE app_id = ? AND asset_id = ? AND depositor = ?",
+            (app_id, asset_id, depositor),
+        ).fetchone()
+        self.connection.execute(
+            "INSERT INTO pool_deposits (app_id, asset_id, depositor, amount)"
+            " VALUES (?, ?, ?, ?) ON CONFLICT (app_id, asset_id, depositor)"
+            " DO UPDATE SET amount = amount + excluded.amount",
+            (app_id, asset_id, depositor, fields["amount"]),
+        )
+        self.connection.execute(
+            "INSERT INTO pool_balances (app_id, asset_id, amount, depositors)"
+            " VALUES (?, ?, ?, ?) ON CONFLICT (app_id, asset_id) DO UPDATE SET"
+            " amount = amount + excluded.amount,"
+            " depositors = depositors + excluded.depositors",
+            (app_id, asset_id, fields["amount"], int(new_depositor)),
+        )
+
+    def pool_vote_cast(self, app_id: int, _round: int, fields: dict[str, Any]) -> None:
+        votes_for = fields["amount"] if fields["approve"] else 0
+        votes_against = 0 if fields["approve"] else fields["amount"]
+        self.connection.execute(
+            "INSERT INTO vote_tallies"
+            " (app_id, proposal_id, votes_for, votes_against, votes_cast)"
+            " VALUES (?, ?, ?, ?, 1) ON CONFLICT (app_id, proposal_id) DO UPDATE SET"
+            " votes_for = votes_for + excluded.votes_for,"
+            " votes_against = votes_against + excluded.votes_against,"
+            " votes_cast = votes_cast + 1",
+            (app_id, fields["proposal_id"], votes_for, votes_against),
+        )
+
+    def insert_repayment(
+        self,
+        app_id: int,
+        round_: int,
+        repayment_key: bytes,
+        loan_key: bytes,
+        kind: str,
+        repayment_amount: int,
+    ) -> None:
+        self.connection.execute(
+            "INSERT OR REPLACE INTO repayments (app_id, repayment_key, loan_key,"
+            " kind, repayment_amount, status, initiated_round)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                app_id,
+                repayment_key,
+                loan_key,
+                kind,
+                repayment_amount,
+                REPAYMENT_PENDING,
+                round_,
+            ),
+        )
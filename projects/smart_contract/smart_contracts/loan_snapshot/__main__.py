@@ -0,0 +1,49 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+"""
+Snapshots every ZaibatsuLoan box through the algod and indexer configured in
+the environment.
+
+    python -m smart_contracts.loan_snapshot 1234 loans.json.gz --max-workers 32
+"""
+
+import argparse
+import logging
+import time
+
+from algokit_utils import get_algod_client, get_indexer_client
+from dotenv import load_dotenv
+
+from smart_contracts.loan_snapshot.loader import DEFAULT_MAX_WORKERS, snapshot_app
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("app_id", type=int)
+    parser.add_argument("path", help="path of the gzipped JSON snapshot")
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help="box values fetched in parallel",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s"
+    )
+    load_dotenv()
+    started = time.perf_counter()
+    rows = snapshot_app(
+        get_algod_client(),
+        get_indexer_client(),
+        args.app_id,
+        args.path,
+        args.max_workers,
+    )
+    logger.info(f"Wrote {rows} to {args.path} in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+"""
+Micro-benchmark of the helpers/loan_codec.py decoders against algosdk's
+generic ABIType.decode, over randomly generated boxes whose addresses are
+drawn from a pool of --addresses borrowers and recipients.
+
+    python -m smart_contracts.loan_snapshot.benchmark --boxes 10000
+"""
+import argparse
+import random
+import timeit
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from algosdk import abi, encoding
+
+from smart_contracts.helpers.loan_codec import (
+    LOAN_DETAILS,
+    LOAN_RECORD,
+    PENDING_LOAN_ROUND_PAYMENT,
+    StructCodec,
+    type_string,
+)
+
+RECIPIENTS_PER_LOAN = 8
+
+
+def random_loan_record(rng: random.Random, addresses: Sequence[str]) -> list[Any]:
+    flags = [rng.random() < 0.5 for _flag in range(3)]
+    amounts = [rng.getrandbits(64) for _amount in range(9)]
+    borrower = rng.choice(addresses)
+    return [1, 1, 6, 6, 2, *flags, *amounts, borrower, rng.getrandbits(16)]
+
+
+def random_pending_loan_round_payment(
+    rng: random.Random, _addresses: Sequence[str]
+) -> list[Any]:
+    return [list(rng.randbytes(8)), *(rng.getrandbits(64) for _value in range(3))]
+
+
+def random_loan_details(rng: random.Random, addresses: Sequence[str]) -> list[Any]:
+    recipients = [
+        [rng.getrandbits(64), rng.choice(addresses)]
+        for _recipient in range(RECIPIENTS_PER_LOAN)
+    ]
+    amounts = [rng.getrandbits(64) for _amount in range(6)]
+    return [
+        *(rng.randbytes(12).hex(), "P2P", 6, *amounts, 6, rng.getrandbits(64)),
+        *(recipients, True, False, 2, rng.choice(addresses), 700001, 700002),
+    ]
+
+
+def read_recipients(codec: StructCodec) -> Callable[[bytes], list[tuple[int, str]]]:
+    """Decodes with the codec and reads every recipient, like algosdk does."""
+    index = codec.names.index("payment_recipients")
+
+    def decode(data: bytes) -> list[tuple[int, str]]:
+        values = codec.decode(data)
+        return list(values[index])
+
+    return decode
+
+
+def seconds_per_box(
+    decode: Callable[[bytes], Any], boxes: Sequence[bytes], repeat: int
+) -> float:
+    timings = timeit.repeat(
+        lambda: [decode(box) for box in boxes], number=1, repeat=repeat
+    )
+    return min(timings) / len(boxes)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--boxes", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--addresses", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    addresses = [
+        encoding.encode_address(rng.randbytes(32)) for _address in range(args.addresses)
+    ]
+    cases = [
+        ("LoanRecord", LOAN_RECORD, random_loan_record, LOAN_RECORD.decode),
+        (
+            "PendingLoanRoundPayment",
+            PENDING_LOAN_ROUND_PAYMENT,
+            random_pending_loan_round_payment,
+            PENDING_LOAN_ROUND_PAYMENT.decode,
+        ),
+        ("LoanDetails", LOAN_DETAILS, random_loan_details, LOAN_DETAILS.decode),
+        (
+            "LoanDetails, recipients read",
+            LOAN_DETAILS,
+            random_loan_details,
+            read_recipients(LOAN_DETAILS),
+        ),
+    ]
+    print(f"{'struct':<32}{'algosdk':>12}{'codec':>12}{'speedup':>10}")
+    for name, codec, random_values, decode in cases:
+        abi_type = abi.ABIType.from_string(type_string(codec.fields))
+        boxes = [
+            abi_type.encode(random_values(rng, addresses)) for _box in range(args.boxes)
+        ]
+        generic = seconds_per_box(abi_type.decode, boxes, args.repeat)
+        fast = seconds_per_box(decode, boxes, args.repeat)
+        print(
+            f"{name:<32}{generic * 1e6:>10.2f}us{fast * 1e6:>10.2f}us"
+            f"{generic / fast:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
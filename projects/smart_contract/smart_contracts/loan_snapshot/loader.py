@@ -0,0 +1,274 @@
+# mypy: disable-error-code="no-untyped-call, misc"
+"""
+Bulk reader of every ZaibatsuLoan box, written out as a columnar snapshot.
+
+Box names are listed from the indexer a page at a time. The values are then
+fetched from algod by a bounded pool of worker threads, each reusing its own
+keep-alive connection, instead of one application_box_by_name call and one new
+connection per box. Values are decoded with the precompiled codecs of
+helpers/loan_codec.py and gathered into one column per field.
+"""
+import base64
+import gzip
+import http.client
+import json
+import logging
+import threading
+import urllib.parse
+from collections.abc import Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+from algosdk import constants
+from algosdk.error import AlgodHTTPError
+from algosdk.v2client.algod import AlgodClient
+from algosdk.v2client.indexer import IndexerClient
+
+from smart_contracts.helpers.loan_codec import (
+    LOAN_DETAILS,
+    LOAN_RECORD,
+    PAYMENT_RECIEPIENT,
+    PENDING_LOAN_ROUND_PAYMENT,
+    UINT16,
+    RecipientsView,
+)
+from smart_contracts.helpers.loan_index import (
+    ACTIVE_LOANS_KEY_PREFIX,
+    ADMIN_KEY_PREFIX,
+    BORROWER_LOANS_KEY_PREFIX,
+    LOAN_COUNTERS_BOX_NAME,
+    LOAN_KEY_PREFIX,
+    PRICE_KEY_PREFIX,
+    PRICE_ORACLE_BOX_NAME,
+    RECIPIENTS_KEY_PREFIX,
+    RECORD_KEY_SIZE,
+    REPAYMENT_KEY_PREFIX,
+)
+
+logger = logging.getLogger(__name__)
+
+# The indexer returns at most 1000 box names per page
+BOX_NAMES_PAGE_SIZE = 1000
+DEFAULT_MAX_WORKERS = 16
+SNAPSHOT_VERSION = 1
+# The name size of every typed box of the app, by prefix
+BOX_NAME_SIZES = {
+    LOAN_KEY_PREFIX: 1 + RECORD_KEY_SIZE,
+    RECIPIENTS_KEY_PREFIX: 1 + RECORD_KEY_SIZE,
+    REPAYMENT_KEY_PREFIX: 1 + RECORD_KEY_SIZE,
+    ACTIVE_LOANS_KEY_PREFIX: 1 + RECORD_KEY_SIZE,
+    BORROWER_LOANS_KEY_PREFIX: 1 + 32,
+    ADMIN_KEY_PREFIX: 1 + 32,
+    PRICE_KEY_PREFIX: 1 + 8,
+    PRICE_ORACLE_BOX_NAME: 1,
+    LOAN_COUNTERS_BOX_NAME: 1,
+}
+
+LOAN_DETAILS_RECIPIENTS = LOAN_DETAILS.names.index("payment_recipients")
+
+# The columns of each snapshot table. Loan and repayment keys are hex encoded,
+# legacy loans are keyed by their box name
+TABLE_COLUMNS = {
+    "loans": ("loan_key", *LOAN_RECORD.names),
+    "recipients": ("loan_key", "recipient_index", *PAYMENT_RECIEPIENT.names),
+    "repayments": ("repayment_key", *PENDING_LOAN_ROUND_PAYMENT.names),
+    "legacy_loans": (
+        "box_name",
+        *(name for name in LOAN_DETAILS.names if name != "payment_recipients"),
+    ),
+}
+
+
+def list_box_names(
+    indexer_client: IndexerClient,
+    app_id: int,
+    page_size: int = BOX_NAMES_PAGE_SIZE,
+) -> Iterator[bytes]:
+    """Yields the names of all the app's boxes, one indexer page at a time."""
+    next_page = None
+    while True:
+        response = indexer_client.application_boxes(
+            app_id, limit=page_size, next_page=next_page
+        )
+        for box in response["boxes"]:
+            yield base64.b64decode(box["name"])
+        next_page = response.get("next-token")
+        if not next_page or not response["boxes"]:
+            return
+
+
+class BoxFetcher:
+    """
+    Reads box values from algod's box endpoint over one keep-alive connection
+    per thread, so a pool of threads shares a fixed set of connections.
+    """
+
+    def __init__(self, algod_client: AlgodClient, app_id: int) -> None:
+        address = urllib.parse.urlsplit(algod_client.algod_address)
+        self.connection_class = (
+            http.client.HTTPSConnection
+            if address.scheme == "https"
+            else http.client.HTTPConnection
+        )
+        self.host = address.netloc
+        self.path = f"{address.path.rstrip('/')}/v2/applications/{app_id}/box"
+        self.headers = {
+            **(algod_client.headers or {}),
+            constants.algod_auth_header: algod_client.algod_token,
+        }
+        self.local = threading.local()
+        self.connections: list[http.client.HTTPConnection] = []
+        self.lock = threading.Lock()
+
+    def connection(self) -> http.client.HTTPConnection:
+        connection: http.client.HTTPConnection | None = getattr(
+            self.local, "connection", None
+        )
+        if connection is None:
+            connection = self.connection_class(self.host)
+            self.local.connection = connection
+            with self.lock:
+                self.connections.append(connection)
+        return connection
+
+    def close(self) -> None:
+        with self.lock:
+            for connection in self.connections:
+                connection.close()
+            self.connections.clear()
+
+    def request(self, name: bytes) -> tuple[int, bytes]:
+        encoded_name = base64.b64encode(name).decode()
+        query = urllib.parse.urlencode({"name": f"b64:{encoded_name}"})
+        url = f"{self.path}?{query}"
+        connection = self.connection()
+        try:
+            connection.request("GET", url, headers=self.headers)
+            response = connection.getresponse()
+        except ConnectionError:
+            # algod closed the idle connection, send the request again on a new one
+            connection.close()
+            connection.request("GET", url, headers=self.headers)
+            response = connection.getresponse()
+        return response.status, response.read()
+
+    def fetch(self, name: bytes) -> bytes | None:
+        """Returns a box value, None if the box does not exist."""
+        status, body = self.request(name)
+        if status == http.HTTPStatus.NOT_FOUND:
+            return None
+        if status != http.HTTPStatus.OK:
+            raise AlgodHTTPError(json.loads(body).get("message", body), status)
+        return base64.b64decode(json.loads(body)["value"])
+
+
+def fetch_boxes(
+    algod_client: AlgodClient,
+    app_id: int,
+    names: Sequence[bytes],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> dict[bytes, bytes]:
+    """
+    Fetches the box values with at most max_workers requests in flight,
+    leaving out boxes deleted since their names were listed.
+    """
+    fetcher = BoxFetcher(algod_client, app_id)
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            values = list(executor.map(fetcher.fetch, names))
+    finally:
+        fetcher.close()
+    return {
+        name: value
+        for name, value in zip(names, values, strict=True)
+        if value is not None
+    }
+
+
+def columns(table: str, rows: Sequence[Sequence[Any]]) -> dict[str, list[Any]]:
+    names = TABLE_COLUMNS[table]
+    values = list(zip(*rows, strict=True)) if rows else [() for _name in names]
+    return {name: list(column) for name, column in zip(names, values, strict=True)}
+
+
+def is_legacy_loan_details(value: bytes) -> bool:
+    """
+    Whether a value has the head of a LoanDetails, whose first field is the
+    offset of loan_key, right after the head.
+    """
+    return (
+        len(value) >= LOAN_DETAILS.head.size
+        and UINT16.unpack_from(value)[0] == LOAN_DETAILS.head.size
+    )
+
+
+def decode_boxes(boxes: Mapping[bytes, bytes]) -> dict[str, dict[str, list[Any]]]:
+    """
+    Decodes the loan records, recipients, pending repayments and legacy
+    LoanDetails boxes into the snapshot tables. Boxes are told apart by their
+    typed prefix and name size. The index, borrower, admin and price boxes are
+    left out, and boxes of no known layout are skipped with a warning.
+    """
+    rows: dict[str, list[Sequence[Any]]] = {table: [] for table in TABLE_COLUMNS}
+    unknown_boxes = 0
+    for name, value in boxes.items():
+        prefix, key = name[:1], name[1:].hex()
+        if BOX_NAME_SIZES.get(prefix) != len(name):
+            # Legacy LoanDetails boxes are named by their caller supplied loan_key
+            if not is_legacy_loan_details(value):
+                unknown_boxes += 1
+                continue
+            details = list(LOAN_DETAILS.decode(value))
+            recipients = details.pop(LOAN_DETAILS_RECIPIENTS)
+            rows["legacy_loans"].append((name.hex(), *details))
+            rows["recipients"] += (
+                (name.hex(), index, *recipient)
+                for index, recipient in enumerate(recipients)
+            )
+        elif prefix == LOAN_KEY_PREFIX:
+            rows["loans"].append((key, *LOAN_RECORD.decode(value)))
+        elif prefix == RECIPIENTS_KEY_PREFIX:
+            rows["recipients"] += (
+                (key, index, *recipient)
+                for index, recipient in enumerate(RecipientsView(value))
+            )
+        elif prefix == REPAYMENT_KEY_PREFIX:
+            loan_key, *payment = PENDING_LOAN_ROUND_PAYMENT.decode(value)
+            rows["repayments"].append((key, loan_key.hex(), *payment))
+    if unknown_boxes:
+        logger.warning(f"Skipped {unknown_boxes} boxes of an unknown layout")
+    return {table: columns(table, table_rows) for table, table_rows in rows.items()}
+
+
+def write_snapshot(
+    path: str | Path, app_id: int, tables: Mapping[str, Mapping[str, list[Any]]]
+) -> None:
+    """Writes the tables as gzipped JSON, one list of values per column."""
+    snapshot = {"version": SNAPSHOT_VERSION, "app_id": app_id, "tables": tables}
+    with gzip.open(path, "wt") as file:
+        json.dump(snapshot, file, separators=(",", ":"))
+
+
+def read_snapshot(path: str | Path) -> dict[str, Any]:
+    with gzip.open(path, "rt") as file:
+        snapshot: dict[str, Any] = json.load(file)
+    assert snapshot["version"] == SNAPSHOT_VERSION, "Unsupported snapshot version"
+    return snapshot
+
+
+def snapshot_app(
+    algod_client: AlgodClient,
+    indexer_client: IndexerClient,
+    app_id: int,
+    path: str | Path,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+) -> dict[str, int]:
+    """Snapshots every box of the app and returns the rows of each table."""
+    names = list(list_box_names(indexer_client, app_id))
+    tables = decode_boxes(fetch_boxes(algod_client, app_id, names, max_workers))
+    write_snapshot(path, app_id, tables)
+    return {
+        table: len(next(iter(table_columns.values())))
+        for table, table_columns in tables.items()
+    }
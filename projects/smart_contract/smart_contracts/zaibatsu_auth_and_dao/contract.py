@@ -4,40 +4,34 @@ from algopy import arc4 as a4
 from algopy import gtxn, op
 
 from smart_contracts.zaibatsu_auth_and_dao.types.pool import (
+    PoolAssetTotal,
+    PoolFunded,
     PoolFundResponse,
     PoolVoteApprovalResponse,
+    PoolVoteCast,
+    ProposalVoteTally,
 )
 from smart_contracts.zaibatsu_base.contract import ZaibatsuBase
 
+# Apps created before zai_token_asset_id was set kept the ZAI asset id in a box
+LEGACY_ZAI_TOKEN_KEY = b"ZAI"
+# Every proposal that has been voted on has a "V" + itob(proposal_id) box
+VOTE_TALLY_KEY_PREFIX = b"V"
+# The pool ledger keeps the total funded per asset in a "T" + itob(asset_id) box
+# and the amount funded by each depositor in a "D" + itob(asset_id) + address box
+POOL_TOTAL_KEY_PREFIX = b"T"
+POOL_DEPOSIT_KEY_PREFIX = b"D"
+
 
 class ZaibatsuAuthAndDao(ZaibatsuBase):
     def __init__(self) -> None:
+        super().__init__()
         self.zai_token_asset_id: a4.UInt64 = a4.UInt64()
 
     @a4.abimethod()
     def hello(self, name: a4.String) -> a4.String:
         return "Hello, " + name
 
-    @a4.abimethod(create="allow")
-    def create(self) -> bool:
-        self.admins.append(a4.Address(ap.Txn.sender))
-        return True
-
-    @a4.abimethod(allow_actions=["UpdateApplication"])
-    def update(self) -> bool:
-        if ap.Txn.sender == op.Global.creator_address:
-            return True
-        for index in ap.urange(self.admins.length):
-            if self.admins[index] == ap.Txn.sender:
-                return True
-        return False
-
-    @a4.abimethod(allow_actions=["DeleteApplication"])
-    def delete(self) -> bool:
-        if ap.Txn.sender == op.Global.creator_address:
-            return True
-        return False
-
     @a4.abimethod()
     def set_service_contract_address(self, address: a4.Address) -> bool:
         self.authorise_txn()
@@ -46,6 +40,12 @@ class ZaibatsuAuthAndDao(ZaibatsuBase):
 
     @a4.abimethod()
     def create_zaibatsu_token(self) -> a4.UInt64:
+        """
+        Creates the ZAI token, or moves its id out of the legacy ZAI box on
+        apps that still have one. Returns the ZAI asset id
+        * The ZAI box must be passed in the box references until the token id
+          has been set
+        """
         self.handle_create_zai_token()
         return self.get_zai_token()
 
@@ -56,7 +56,7 @@ class ZaibatsuAuthAndDao(ZaibatsuBase):
         self.authorise_txn()
         zai_asset_id = self.get_zai_token()
         txn = ap.itxn.AssetTransfer(
-            fee=1000,
+            fee=0,
             asset_receiver=to.native,
             asset_amount=asset_amount.native,
             xfer_asset=zai_asset_id.native,
@@ -69,11 +69,16 @@ class ZaibatsuAuthAndDao(ZaibatsuBase):
     def fund_pool(
         self,
         fund_amount: ap.UInt64,
-        folks_feed_oracle: ap.Application,
         txn: gtxn.AssetTransferTransaction,
     ) -> PoolFundResponse:
-
-        asset_dollar_price = self.get_asset_price(folks_feed_oracle, txn.xfer_asset)
+        """
+        Records fund_amount in the pool ledger, under the asset total and the
+        sender's deposit.
+        * The txn must transfer exactly fund_amount plus the 1% transaction fee,
+        so the ledger holds what was funded
+        * The total and deposit boxes must be passed in the box references
+        """
+        asset_dollar_price = self.get_asset_price(txn.xfer_asset)
         assert (
             txn.asset_receiver == self.service_contract_address.native
         ), "The asset_receiver mut be the ZaibatsuService account"
@@ -82,8 +87,28 @@ class ZaibatsuAuthAndDao(ZaibatsuBase):
             fund_amount, ap.UInt64(1)
         )
         assert (
-            txn.asset_amount >= amount_plus_transaction_fee
-        ), "The txn amount is insufficient"
+            txn.asset_amount == amount_plus_transaction_fee
+        ), "The txn amount must be fund_amount plus the transaction fee"
+
+        deposit_key = self.pool_deposit_key(txn.xfer_asset.id, txn.sender)
+        [deposit_bytes, is_depositor] = op.Box.get(deposit_key)
+        deposit = ap.UInt64(0)
+        if is_depositor:
+            deposit = op.btoi(deposit_bytes)
+        op.Box.put(deposit_key, op.itob(deposit + fund_amount))
+
+        total = self.pool_total(txn.xfer_asset.id)
+        total.amount = a4.UInt64(total.amount.native + fund_amount)
+        if not is_depositor:
+            total.depositors = a4.UInt64(total.depositors.native + 1)
+        op.Box.put(self.pool_total_key(txn.xfer_asset.id), total.bytes)
+        a4.emit(
+            PoolFunded(
+                asset_id=a4.UInt64(txn.xfer_asset.id),
+                depositor=a4.Address(txn.sender),
+                amount=a4.UInt64(fund_amount),
+            )
+        )
 
         response = PoolFundResponse(
             amount=a4.UInt64(fund_amount),
@@ -95,12 +120,40 @@ class ZaibatsuAuthAndDao(ZaibatsuBase):
     @a4.abimethod()
     def approve_pool_vote(
         self,
+        proposal_id: ap.UInt64,
+        approve: bool,  # noqa: FBT001
         txn: gtxn.AssetTransferTransaction,
     ) -> PoolVoteApprovalResponse:
+        """
+        Adds the ZAI transferred to the app to the tally of the proposal, for
+        or against it as approve says.
+        * Voting spends the ZAI: it stays in the app account and is not
+          returned to the voter when the vote ends
+        * The tally box of the proposal must be passed in the box references
+        """
         zai_asset_id = self.get_zai_token()
         assert (
             txn.xfer_asset.id == zai_asset_id.native
         ), "The asset transfered must be the pool token"
+        self.ensure_app_reciever(txn)
+
+        tally = self.vote_tally(proposal_id)
+        if approve:
+            tally.votes_for = a4.UInt64(tally.votes_for.native + txn.asset_amount)
+        else:
+            tally.votes_against = a4.UInt64(
+                tally.votes_against.native + txn.asset_amount
+            )
+        tally.votes_cast = a4.UInt64(tally.votes_cast.native + 1)
+        op.Box.put(self.vote_tally_key(proposal_id), tally.bytes)
+        a4.emit(
+            PoolVoteCast(
+                proposal_id=a4.UInt64(proposal_id),
+                voter=a4.Address(txn.sender),
+                approve=a4.Bool(approve),
+                amount=a4.UInt64(txn.asset_amount),
+            )
+        )
 
         response = PoolVoteApprovalResponse(
             multiplier=a4.UInt64(txn.asset_amount),
@@ -108,12 +161,100 @@ class ZaibatsuAuthAndDao(ZaibatsuBase):
         )
         return response
 
+    @a4.abimethod(readonly=True)
+    def get_vote_tallies(
+        self, proposal_ids: a4.DynamicArray[a4.UInt64]
+    ) -> a4.DynamicArray[ProposalVoteTally]:
+        """
+        Returns the tally of every proposal, all zero for proposals that have
+        not been voted on
+        * The tally boxes must be passed in the box references
+        """
+        tallies = a4.DynamicArray[ProposalVoteTally]()
+        for proposal_id in proposal_ids:
+            tallies.append(self.vote_tally(proposal_id.native))
+        return tallies
+
+    @a4.abimethod(readonly=True)
+    def get_pool_totals(
+        self, assets: a4.DynamicArray[a4.UInt64]
+    ) -> a4.DynamicArray[PoolAssetTotal]:
+        """
+        Returns the total funded into the pool and the number of depositors of
+        every asset
+        * The total boxes must be passed in the box references
+        """
+        totals = a4.DynamicArray[PoolAssetTotal]()
+        for asset_id in assets:
+            totals.append(self.pool_total(asset_id.native))
+        return totals
+
+    @a4.abimethod(readonly=True)
+    def get_pool_deposits(
+        self, depositor: ap.Account, assets: a4.DynamicArray[a4.UInt64]
+    ) -> a4.DynamicArray[a4.UInt64]:
+        """
+        Returns the amount of every asset funded into the pool by the depositor.
+        Its share of the pool is this amount over the asset total
+        * The deposit boxes must be passed in the box references
+        """
+        deposits = a4.DynamicArray[a4.UInt64]()
+        for asset_id in assets:
+            [deposit_bytes, exists] = op.Box.get(
+                self.pool_deposit_key(asset_id.native, depositor)
+            )
+            deposit = ap.UInt64(0)
+            if exists:
+                deposit = op.btoi(deposit_bytes)
+            deposits.append(a4.UInt64(deposit))
+        return deposits
+
+    ################################################################
+    #####################   Subroutines    #########################
+    ################################################################
+    @ap.subroutine
+    def pool_total_key(self, asset_id: ap.UInt64) -> ap.Bytes:
+        return op.concat(POOL_TOTAL_KEY_PREFIX, op.itob(asset_id))
+
+    @ap.subroutine
+    def pool_deposit_key(self, asset_id: ap.UInt64, depositor: ap.Account) -> ap.Bytes:
+        return op.concat(
+            op.concat(POOL_DEPOSIT_KEY_PREFIX, op.itob(asset_id)), depositor.bytes
+        )
+
+    @ap.subroutine
+    def pool_total(self, asset_id: ap.UInt64) -> PoolAssetTotal:
+        [total_bytes, exists] = op.Box.get(self.pool_total_key(asset_id))
+        if exists:
+            return PoolAssetTotal.from_bytes(total_bytes)
+        return PoolAssetTotal(amount=a4.UInt64(0), depositors=a4.UInt64(0))
+
+    @ap.subroutine
+    def vote_tally_key(self, proposal_id: ap.UInt64) -> ap.Bytes:
+        return op.concat(VOTE_TALLY_KEY_PREFIX, op.itob(proposal_id))
+
+    @ap.subroutine
+    def vote_tally(self, proposal_id: ap.UInt64) -> ProposalVoteTally:
+        [tally_bytes, exists] = op.Box.get(self.vote_tally_key(proposal_id))
+        if exists:
+            return ProposalVoteTally.from_bytes(tally_bytes)
+        return ProposalVoteTally(
+            votes_for=a4.UInt64(0),
+            votes_against=a4.UInt64(0),
+            votes_cast=a4.UInt64(0),
+        )
+
     @ap.subroutine
     def handle_create_zai_token(self) -> None:
-        box = op.Box.get(b"ZAI")
-        if not box[1]:
+        if self.zai_token_asset_id.native:
+            return
+        [box_data, exists] = op.Box.get(LEGACY_ZAI_TOKEN_KEY)
+        if exists:
+            self.zai_token_asset_id = a4.UInt64.from_bytes(box_data)
+            op.Box.delete(LEGACY_ZAI_TOKEN_KEY)
+        else:
             asset_txn = ap.itxn.AssetConfig(
-                fee=1000,
+                fee=0,
                 decimals=6,
                 total=1_000_000_000_000,
                 url="https://res.cloudinary.com/dev-media/image/upload/v1722011867/Zaibatsu_z_1234_Circle_yjt49c.png",
@@ -126,16 +267,11 @@ class ZaibatsuAuthAndDao(ZaibatsuBase):
             )
             asset_txn.submit()
             asset_id = op.ITxn.created_asset_id().id
-            op.Box.put(b"ZAI", a4.UInt64(asset_id).bytes)
+            self.zai_token_asset_id = a4.UInt64(asset_id)
 
     @ap.subroutine
     def get_zai_token(self) -> a4.UInt64:
-        box_data, exists = op.Box.get(b"ZAI")
-        zai_asset_id = a4.UInt64()
-        if not exists:
-            self.handle_create_zai_token()
-            box_data, exists = op.Box.get(b"ZAI")
-            zai_asset_id = a4.UInt64.from_bytes(box_data)
-        else:
-            zai_asset_id = a4.UInt64.from_bytes(box_data)
-        return zai_asset_id
+        assert (
+            self.zai_token_asset_id.native
+        ), "The ZAI token has not been created, call create_zaibatsu_token"
+        return self.zai_token_asset_id
@@ -1,4 +1,4 @@
-from algopy.arc4 import Bool, String, Struct, UInt64  # pyright: ignore
+from algopy.arc4 import Address, Bool, String, Struct, UInt64  # pyright: ignore
 
 
 class PoolFundResponse(Struct, kw_only=True):
@@ -10,3 +10,38 @@ class PoolFundResponse(Struct, kw_only=True):
 class PoolVoteApprovalResponse(Struct, kw_only=True):
     multiplier: UInt64
     txn_id: String
+
+
+class PoolAssetTotal(Struct, kw_only=True):
+    """Stored in a "T" + itob(asset_id) box"""
+
+    amount: UInt64
+    depositors: UInt64
+
+
+class ProposalVoteTally(Struct, kw_only=True):
+    """
+    Stored in a "V" + itob(proposal_id) box. votes_cast counts the votes, an
+    account that votes twice is counted twice
+    """
+
+    votes_for: UInt64
+    votes_against: UInt64
+    votes_cast: UInt64
+
+
+class PoolFunded(Struct, kw_only=True):
+    """ARC-28 event logged by fund_pool"""
+
+    asset_id: UInt64
+    depositor: Address
+    amount: UInt64
+
+
+class PoolVoteCast(Struct, kw_only=True):
+    """ARC-28 event logged by approve_pool_vote"""
+
+    proposal_id: UInt64
+    voter: Address
+    approve: Bool
+    amount: UInt64
@@ -1,31 +1,35 @@
-from typing import TypeAlias
-
 import algopy as ap
 from algopy import Global
 from algopy import arc4 as a4
 from algopy import gtxn, op
 
-AddressArray: TypeAlias = a4.DynamicArray[a4.Address]
+from smart_contracts.zaibatsu_base.types.price import (
+    AssetPriceSnapshot,
+    PriceOracleConfig,
+)
+
+# Every admin has an "A" + address box. The creator is always an admin
+ADMIN_KEY_PREFIX = b"A"
+# Global state key of the AddressArray admins were stored in before the boxes
+LEGACY_ADMINS_KEY = b"admins"
+# Every cached oracle price has an "F" + itob(asset_id) box
+PRICE_KEY_PREFIX = b"F"
+# The PriceOracleConfig box. It is a box rather than global state so the
+# global schema stays the one apps created before the price cache were given
+PRICE_ORACLE_KEY = b"O"
 
 
 class ZaibatsuBase(ap.ARC4Contract):
     def __init__(self) -> None:
-        self.admins: AddressArray = AddressArray()
         self.service_contract: a4.Address = a4.Address()
 
     @a4.abimethod(create="allow")
     def create(self) -> bool:
-        self.admins.append(a4.Address(ap.Txn.sender))
         return True
 
     @a4.abimethod(allow_actions=["UpdateApplication"])
     def update(self) -> bool:
-        if ap.Txn.sender == op.Global.creator_address:
-            return True
-        for index in ap.urange(self.admins.length):
-            if self.admins[index] == ap.Txn.sender:
-                return True
-        return False
+        return self.is_admin(ap.Txn.sender)
 
     @a4.abimethod(allow_actions=["DeleteApplication"])
     def delete(self) -> bool:
@@ -33,6 +37,72 @@ class ZaibatsuBase(ap.ARC4Contract):
             return True
         return False
 
+    @a4.abimethod()
+    def add_admin(self, account: ap.Account) -> bool:
+        """
+        * The admin box of the account must be passed in the box references
+        """
+        self.authorise_txn()
+        op.Box.put(self.admin_key(account), a4.Bool(True).bytes)  # noqa: FBT003
+        return True
+
+    @a4.abimethod()
+    def remove_admin(self, account: ap.Account) -> bool:
+        self.authorise_txn()
+        return op.Box.delete(self.admin_key(account))
+
+    @a4.abimethod()
+    def migrate_legacy_admins(self) -> ap.UInt64:
+        """
+        Moves the admins of the legacy global AddressArray into admin boxes
+        and deletes the global key, so it can only run once. Returns the
+        number of admins migrated.
+        * Only the creator can migrate the admins
+        * The admin box of every legacy admin must be passed in the box
+          references, pooled across the group when there are more than 8
+        """
+        assert (
+            ap.Txn.sender == op.Global.creator_address
+        ), "Only the creator can migrate the admins"
+        [admins_bytes, exists] = op.AppGlobal.get_ex_bytes(
+            Global.current_application_id, LEGACY_ADMINS_KEY
+        )
+        assert exists, "The admins have already been migrated"
+        admins = a4.DynamicArray[a4.Address].from_bytes(admins_bytes)
+        for index in ap.urange(admins.length):
+            admin_key = op.concat(ADMIN_KEY_PREFIX, admins[index].bytes)
+            op.Box.put(admin_key, a4.Bool(True).bytes)  # noqa: FBT003
+        op.AppGlobal.delete(LEGACY_ADMINS_KEY)
+        return admins.length
+
+    @a4.abimethod()
+    def set_price_oracle(self, oracle: ap.Application, cache_window: ap.UInt64) -> bool:
+        """
+        * cache_window is the number of seconds a cached price is used for
+          before the oracle is read again
+        * The "O" price oracle box must be passed in the box references
+        """
+        self.authorise_txn()
+        config = PriceOracleConfig(
+            oracle=a4.UInt64(oracle.id),
+            cache_window=a4.UInt64(cache_window),
+        )
+        op.Box.put(PRICE_ORACLE_KEY, config.bytes)
+        return True
+
+    @a4.abimethod()
+    def refresh_asset_prices(self, assets: a4.DynamicArray[a4.UInt64]) -> bool:
+        """
+        Reads the oracle price of every asset passed into the price cache.
+        * The price_oracle must be passed in the foreign apps array
+        * The "O" price oracle box and the price boxes must be passed in the
+          box references
+        """
+        oracle = ap.Application(self.price_oracle_config().oracle.native)
+        for asset_id in assets:
+            self.refresh_asset_price(asset_id.native, oracle)
+        return True
+
     @a4.abimethod()
     def opt_contract_into_asset(self, asset: ap.Asset) -> bool:
         self.opt_app_into_asset(asset)
@@ -44,7 +114,7 @@ class ZaibatsuBase(ap.ARC4Contract):
     ) -> bool:
         self.authorise_txn()
         txn = ap.itxn.AssetTransfer(
-            fee=1000,
+            fee=0,
             xfer_asset=asset,
             asset_receiver=recipient,
             asset_amount=asset_amount,
@@ -59,7 +129,7 @@ class ZaibatsuBase(ap.ARC4Contract):
     def opt_app_into_asset(self, asset: ap.Asset) -> None:
         txn = ap.itxn.AssetTransfer(
             asset_amount=0,
-            fee=1000,
+            fee=0,
             xfer_asset=asset,
             asset_receiver=ap.Global.current_application_address,
         )
@@ -67,37 +137,20 @@ class ZaibatsuBase(ap.ARC4Contract):
 
     @ap.subroutine
     def authorise_txn(self) -> None:
-        is_authorised = a4.Bool()
-        if ap.Txn.sender == op.Global.creator_address:
-            is_authorised = a4.Bool(True)  # noqa: FBT003
-        else:
-            for index in ap.urange(self.admins.length):
-                if self.admins[index] == ap.Txn.sender:
-                    is_authorised = a4.Bool(True)  # noqa: FBT003
-        assert is_authorised, "You are not authorised to perform this action"
+        assert self.is_admin(
+            ap.Txn.sender
+        ), "You are not authorised to perform this action"
 
     @ap.subroutine
-    def create_loan_nft(
-        self,
-        image_url: a4.String,
-        short_name: ap.Bytes,
-        logn_name: ap.Bytes,
-        loan_hash: a4.String,
-    ) -> ap.Asset:
-        txn = ap.itxn.AssetConfig(
-            total=1,
-            url=image_url.native,
-            unit_name=short_name,
-            asset_name=logn_name,
-            fee=1000,
-            metadata_hash=loan_hash.native.bytes,
-            manager=op.Global.current_application_address,
-            reserve=op.Global.current_application_address,
-            freeze=op.Global.current_application_address,
-            clawback=op.Global.current_application_address,
-        )
-        txn.submit()
-        return op.ITxn.created_asset_id()
+    def admin_key(self, account: ap.Account) -> ap.Bytes:
+        return op.concat(ADMIN_KEY_PREFIX, account.bytes)
+
+    @ap.subroutine
+    def is_admin(self, account: ap.Account) -> bool:
+        if account == op.Global.creator_address:
+            return True
+        _length, exists = op.Box.length(self.admin_key(account))
+        return exists
 
     @ap.subroutine
     def ensure_transaction_fee_on_amount(
@@ -114,16 +167,51 @@ class ZaibatsuBase(ap.ARC4Contract):
     def calculate_amt_plus_fee(self, amt: ap.UInt64, multiples: ap.UInt64) -> ap.UInt64:
         fee_percentage = ap.UInt64(10) * multiples
         multiplied = fee_percentage * amt
-        half_percent = multiplied // 1000
-        return half_percent
+        transaction_fee = multiplied // 1000
+        return amt + transaction_fee
 
     @ap.subroutine
-    def get_asset_price(
-        self, folks_feed_oracle: ap.Application, asa: ap.Asset
+    def get_asset_price(self, asa: ap.Asset) -> ap.UInt64:
+        """
+        Returns the cached price of the asset, only reading the price oracle
+        when the cached price is older than its cache_window.
+        * The "O" price oracle box and the price box of the asset must be
+          passed in the box references
+        """
+        config = self.price_oracle_config()
+        [snapshot_bytes, exists] = op.Box.get(self.price_key(asa.id))
+        if exists:
+            snapshot = AssetPriceSnapshot.from_bytes(snapshot_bytes)
+            if (
+                Global.latest_timestamp
+                <= snapshot.timestamp.native + config.cache_window.native
+            ):
+                return snapshot.price.native
+        return self.refresh_asset_price(asa.id, ap.Application(config.oracle.native))
+
+    @ap.subroutine
+    def price_oracle_config(self) -> PriceOracleConfig:
+        [config_bytes, exists] = op.Box.get(PRICE_ORACLE_KEY)
+        assert exists, "The price oracle has not been set"
+        return PriceOracleConfig.from_bytes(config_bytes)
+
+    @ap.subroutine
+    def refresh_asset_price(
+        self, asset_id: ap.UInt64, oracle: ap.Application
     ) -> ap.UInt64:
-        [value, exists] = op.AppGlobal.get_ex_bytes(folks_feed_oracle, op.itob(asa.id))
+        [value, exists] = op.AppGlobal.get_ex_bytes(oracle, op.itob(asset_id))
         assert exists, "This aset is not supported"
-        return op.extract_uint64(value, ap.UInt64(0))
+        price = op.extract_uint64(value, ap.UInt64(0))
+        snapshot = AssetPriceSnapshot(
+            price=a4.UInt64(price),
+            timestamp=a4.UInt64(Global.latest_timestamp),
+        )
+        op.Box.put(self.price_key(asset_id), snapshot.bytes)
+        return price
+
+    @ap.subroutine
+    def price_key(self, asset_id: ap.UInt64) -> ap.Bytes:
+        return op.concat(PRICE_KEY_PREFIX, op.itob(asset_id))
 
     @ap.subroutine
     def percentage(self, amount: a4.UInt64, percent: a4.UInt64) -> a4.UInt64:
@@ -0,0 +1,11 @@
+from algopy.arc4 import Struct, UInt64  # pyright: ignore
+
+
+class AssetPriceSnapshot(Struct, kw_only=True):
+    price: UInt64
+    timestamp: UInt64
+
+
+class PriceOracleConfig(Struct, kw_only=True):
+    oracle: UInt64
+    cache_window: UInt64
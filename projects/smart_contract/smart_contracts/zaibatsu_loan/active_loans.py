@@ -0,0 +1,93 @@
+# pyright: reportMissingModuleSource=false
+"""
+Paged index of the keys of all active loans.
+
+The index is a dense array of 8 byte loan keys split over "I" + itob(page)
+boxes, so clients can page through the live loans without listing and decoding
+every box of the app. A loan stores its position in the index, which makes
+insertion (append) and removal (swap with the last slot) O(1). Pages are sized
+to the 1KB box I/O budget a single box reference grants, so a page holds
+ACTIVE_LOANS_PER_PAGE = 1024 / RECORD_KEY_SIZE = 128 loan keys.
+"""
+import algopy as ap
+from algopy import op
+
+from smart_contracts.zaibatsu_loan.storage import (
+    loan_active_position,
+    set_loan_active_position,
+)
+from smart_contracts.zaibatsu_loan.types.loan import RECORD_KEY_SIZE
+
+ACTIVE_LOANS_KEY_PREFIX = b"I"
+ACTIVE_LOANS_PAGE_SIZE = 1024
+ACTIVE_LOANS_PER_PAGE = ACTIVE_LOANS_PAGE_SIZE // RECORD_KEY_SIZE
+
+
+@ap.subroutine
+def active_loans_page_key(position: ap.UInt64) -> ap.Bytes:
+    """The name of the page box holding an index position"""
+    page = position // ACTIVE_LOANS_PER_PAGE
+    return op.concat(ACTIVE_LOANS_KEY_PREFIX, op.itob(page))
+
+
+@ap.subroutine
+def active_loan_slot_offset(position: ap.UInt64) -> ap.UInt64:
+    return (position % ACTIVE_LOANS_PER_PAGE) * RECORD_KEY_SIZE
+
+
+@ap.subroutine
+def read_active_loan(position: ap.UInt64) -> ap.Bytes:
+    return op.Box.extract(
+        active_loans_page_key(position),
+        active_loan_slot_offset(position),
+        RECORD_KEY_SIZE,
+    )
+
+
+@ap.subroutine
+def write_active_loan(position: ap.UInt64, loan_key: ap.Bytes) -> None:
+    op.Box.replace(
+        active_loans_page_key(position),
+        active_loan_slot_offset(position),
+        loan_key,
+    )
+
+
+@ap.subroutine
+def insert_active_loan(loan_key: ap.Bytes, active_loan_count: ap.UInt64) -> None:
+    """
+    Appends a loan to the index, creating a new page when the last one is full.
+    * active_loan_count is the number of active loans before the insertion
+    """
+    if active_loan_count % ACTIVE_LOANS_PER_PAGE == 0:
+        _created = op.Box.create(
+            active_loans_page_key(active_loan_count), ACTIVE_LOANS_PAGE_SIZE
+        )
+    write_active_loan(active_loan_count, loan_key)
+    set_loan_active_position(loan_key, active_loan_count)
+
+
+@ap.subroutine
+def remove_active_loan(loan_key: ap.Bytes, active_loan_count: ap.UInt64) -> None:
+    """
+    Removes a loan from the index by moving the last active loan into its slot,
+    deleting the last page once it is empty.
+    * active_loan_count is the number of active loans before the removal
+    * The record box of the last active loan must be passed in the box
+      references when it is not the loan being removed
+    """
+    position = loan_active_position(loan_key)
+    last_position = active_loan_count - 1
+    if position != last_position:
+        last_loan_key = read_active_loan(last_position)
+        write_active_loan(position, last_loan_key)
+        set_loan_active_position(last_loan_key, position)
+
+    if last_position % ACTIVE_LOANS_PER_PAGE == 0:
+        op.Box.delete(active_loans_page_key(last_position))
+    else:
+        op.Box.replace(
+            active_loans_page_key(last_position),
+            active_loan_slot_offset(last_position),
+            op.bzero(RECORD_KEY_SIZE),
+        )
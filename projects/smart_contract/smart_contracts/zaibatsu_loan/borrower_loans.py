@@ -0,0 +1,68 @@
+# pyright: reportMissingModuleSource=false
+"""
+Per borrower index of open loan keys.
+
+Every borrower with open loans has a "B" + address box holding the 8 byte keys
+of those loans, so a borrower's loans can be read from a single box instead of
+scanning every loan record. The box grows and shrinks by one slot per loan and
+is deleted with the borrower's last loan.
+"""
+import algopy as ap
+from algopy import op
+
+from smart_contracts.zaibatsu_loan.types.loan import RECORD_KEY_SIZE
+
+BORROWER_LOANS_KEY_PREFIX = b"B"
+# Keeps a borrower box within the 1KB I/O budget of a single box reference
+MAX_BORROWER_LOANS = 128
+
+
+@ap.subroutine
+def borrower_loans_key(borrower: ap.Account) -> ap.Bytes:
+    return op.concat(BORROWER_LOANS_KEY_PREFIX, borrower.bytes)
+
+
+@ap.subroutine
+def borrower_loan_count(borrower: ap.Account) -> ap.UInt64:
+    length, _exists = op.Box.length(borrower_loans_key(borrower))
+    return length // RECORD_KEY_SIZE
+
+
+@ap.subroutine
+def borrower_loan_key(borrower: ap.Account, index: ap.UInt64) -> ap.Bytes:
+    return op.Box.extract(
+        borrower_loans_key(borrower), index * RECORD_KEY_SIZE, RECORD_KEY_SIZE
+    )
+
+
+@ap.subroutine
+def add_borrower_loan(borrower: ap.Account, loan_key: ap.Bytes) -> None:
+    box_key = borrower_loans_key(borrower)
+    count = borrower_loan_count(borrower)
+    assert count < MAX_BORROWER_LOANS, "A borrower can have at most 128 open loans"
+    if count == 0:
+        _created = op.Box.create(box_key, RECORD_KEY_SIZE)
+    else:
+        op.Box.resize(box_key, (count + 1) * RECORD_KEY_SIZE)
+    op.Box.replace(box_key, count * RECORD_KEY_SIZE, loan_key)
+
+
+@ap.subroutine
+def remove_borrower_loan(borrower: ap.Account, loan_key: ap.Bytes) -> None:
+    """Moves the borrower's last loan key into the slot of the removed one"""
+    box_key = borrower_loans_key(borrower)
+    last_index = borrower_loan_count(borrower) - 1
+    index = ap.UInt64(0)
+    while borrower_loan_key(borrower, index) != loan_key:
+        index += 1
+        assert index <= last_index, "The loan was not found in the borrower's loans"
+
+    if index != last_index:
+        last_slot = op.Box.extract(
+            box_key, last_index * RECORD_KEY_SIZE, RECORD_KEY_SIZE
+        )
+        op.Box.replace(box_key, index * RECORD_KEY_SIZE, last_slot)
+    if last_index == 0:
+        op.Box.delete(box_key)
+    else:
+        op.Box.resize(box_key, last_index * RECORD_KEY_SIZE)
@@ -4,56 +4,143 @@ from algopy import arc4 as a4
 from algopy import gtxn, op
 
 from smart_contracts.zaibatsu_base.contract import ZaibatsuBase
+from smart_contracts.zaibatsu_loan.active_loans import (
+    insert_active_loan,
+    remove_active_loan,
+)
+from smart_contracts.zaibatsu_loan.borrower_loans import (
+    add_borrower_loan,
+    borrower_loan_count,
+    borrower_loan_key,
+    remove_borrower_loan,
+)
+from smart_contracts.zaibatsu_loan.storage import (
+    active_loan_count,
+    delete_loan_boxes,
+    key_counter,
+    loan_borrower,
+    loan_collateral_asset_amount,
+    loan_collateral_asset_id,
+    loan_completed_payment_rounds,
+    loan_exists,
+    loan_interest_asset_amount,
+    loan_payment_completion_timestamp,
+    loan_payment_defaulted,
+    loan_payment_rounds,
+    loan_principal_asset_amount,
+    loan_principal_asset_id,
+    loan_principal_paid,
+    loan_recipient,
+    loan_recipients,
+    loan_record_key,
+    put_loan_recipients,
+    repayment_record_key,
+    set_active_loan_count,
+    set_key_counter,
+    set_loan_collateral_asset_amount,
+    set_loan_completed_payment_rounds,
+    set_loan_nft_asset_ids,
+    set_loan_payment_defaulted,
+    set_loan_principal_paid,
+)
+from smart_contracts.zaibatsu_loan.types.events import (
+    LoanCompleted,
+    LoanDefaulted,
+    LoanDeleted,
+    LoanInitiated,
+    RecipientPaid,
+    RecipientsPaid,
+    RepaymentClosed,
+    RepaymentRoundInitiated,
+    RoundClosed,
+)
 from smart_contracts.zaibatsu_loan.types.loan import (
+    LOAN_RECORD_VERSION,
+    LOAN_STATUS_ACTIVE,
+    LOAN_STATUS_AWAITING_PRINCIPAL,
+    LOAN_STATUS_NOT_FOUND,
+    LOAN_STATUS_OVERDUE,
+    LOAN_TYPE_DAO,
+    LOAN_TYPE_P2P,
+    LOAN_TYPE_ZAIBATSU,
     CleanUpLoanRepaymentResponse,
     CompleteLoanArgs,
     ExecuteLoanRepaymentResponse,
     LoanDetails,
-    PaymentReciepient,
+    LoanRecord,
+    PaymentDefaultResponse,
     PendingLoanRoundPayment,
+    RecordKey,
+    RecordKeyArray,
 )
 
+# The AVM allows at most 16 transactions in a single inner transaction group
+MAX_INNER_GROUP_SIZE = 16
+# PendingLoanRoundPayment.paid_recipients tracks one bit per recipient
+MAX_LOAN_RECIPIENTS = 64
+# Opcode budget reserved per repayment_key by clean_up_loan_repayments
+CLEAN_UP_OPCODE_BUDGET_PER_KEY = 350
+# An app call can log at most 32 times. clean_up_loan_repayments logs up to 3
+# events per repayment_key (RoundClosed, LoanDeleted and RepaymentClosed) and
+# one ARC4 return value. That binds before the box and account references,
+# which are pooled across the group, or the 256 inner transactions of a group
+MAX_CLEAN_UP_BATCH_SIZE = 10
+# Opcode budget reserved per loan_key by handle_payment_defaults
+DEFAULT_OPCODE_BUDGET_PER_KEY = 350
+
 
 class ZaibatsuLoan(ZaibatsuBase):
     """
     ATTENTIONS!!!! THIS IS NOT A DRILL
     * All percentages comming into the smart contract must have been multiple
       by 100. This is to account for the lack of support for floats on the AVM
+    * Inner transactions are sent with fee=0. The outer transaction must cover
+      their fees through fee pooling, see smart_contracts/helpers/fees.py
+    * Box names are prefixed by type, see smart_contracts/zaibatsu_loan/storage.py
+    * Every loan lifecycle transition logs an ARC-28 event, see
+      smart_contracts/zaibatsu_loan/types/events.py
     """
 
     @a4.abimethod()
     def initiate_loan_purchase(
         self,
-        loan_key: ap.Bytes,
-        folks_feed_oracle: ap.Application,
         loan_details: LoanDetails,
         txn: gtxn.AssetTransferTransaction,
-    ) -> LoanDetails:
-        self.ensure_app_reciever(txn)
-        collateral_price = self.get_asset_price(folks_feed_oracle, txn.xfer_asset)
+    ) -> RecordKey:
+        """Returns the loan_key allocated to the new loan"""
+        collateral_price = self.get_asset_price(txn.xfer_asset)
         assert collateral_price > 0, "The asa is of no value or is not supported"
 
-        if loan_details.loan_type == a4.String("P2P"):
-            assert loan_details.payment_recipients.length == ap.UInt64(
-                1
-            ), "Only one recipient is allowed in a P2P loan"
-
-        assert (
-            loan_details.borrower == txn.sender
-        ), "The sender must also be the borrower"
+        return RecordKey.from_bytes(self.initiate_loan(loan_details, txn))
 
-        assert (
-            loan_details.collateral_asset_id == txn.xfer_asset.id
-        ), "The asset being transfered must be the collateral asset"
-
-        assert txn.asset_amount >= self.calculate_amt_plus_fee(
-            loan_details.collateral_asset_amount.native, ap.UInt64(1)
-        ), "Insufficient txn asset_amount! Amount must be equal to collateral_asset_amount plus fees"
+    @a4.abimethod()
+    def initiate_loan_purchases(
+        self,
+        loans: a4.DynamicArray[LoanDetails],
+    ) -> RecordKeyArray:
+        """
+        Initiates several loans in one app call and returns their loan_keys.
+        * The collateral transfer of loans[i] must be the i-th of the
+          loans.length transactions directly before this app call
+        * Consecutive loans with the same collateral asset share one price
+          lookup, so loans should be sorted by collateral asset
+        """
+        first_txn_index = ap.Txn.group_index - loans.length
 
-        loan_details.collateral_paid = a4.Bool(True)  # noqa: FBT003
+        loan_keys = RecordKeyArray()
+        priced_asset_id = ap.UInt64(0)
+        for index in ap.urange(loans.length):
+            txn = gtxn.AssetTransferTransaction(first_txn_index + index)
+            if txn.xfer_asset.id != priced_asset_id:
+                collateral_price = self.get_asset_price(txn.xfer_asset)
+                assert (
+                    collateral_price > 0
+                ), "The asa is of no value or is not supported"
+                priced_asset_id = txn.xfer_asset.id
 
-        op.Box.put(loan_key, loan_details.bytes)
-        return loan_details
+            loan_key = self.initiate_loan(loans[index].copy(), txn)
+            loan_keys.append(RecordKey.from_bytes(loan_key))
+        return loan_keys
 
     @ap.arc4.abimethod()
     def complete_non_p2p_loan_purchase(
@@ -62,47 +149,14 @@ class ZaibatsuLoan(ZaibatsuBase):
         completion_args: CompleteLoanArgs,
         principal_asset: ap.Asset,
         borrower: ap.Account,
-    ) -> LoanDetails:
-        [loan_bytes, exists] = op.Box.get(loan_key)
-        assert exists, "A reccord with the loan_key passed was not found"
-        details = LoanDetails.from_bytes(loan_bytes)
-        assert (
-            details.collateral_paid
-        ), "The loan collateral must have been paid by this point"
-        assert not details.principal_paid, "The principal must not have been paid"
-        assert (
-            borrower == details.borrower.native
-        ), "The borrower must be the borrower in the loan details"
-        assert (
-            principal_asset.id == details.principal_asset_id.native
-        ), "The asset passed must be the same as the principal"
-
-        completion_txn = ap.itxn.AssetTransfer(
-            fee=1000,
-            xfer_asset=details.principal_asset_id.native,
-            asset_receiver=details.borrower.native,
-            asset_amount=details.principal_asset_amount.native,
-        )
-        completion_txn.submit()
-
-        details.principal_paid = a4.Bool(True)  # noqa: FBT003
-        details.completed_payment_rounds = a4.UInt8(0)
-        borrower_nft = self.create_loan_nft(
-            completion_args.borrower_nft_image_url,
-            op.concat(ap.Bytes(b"B"), completion_args.loan_unit_name.bytes),
-            op.concat(ap.Bytes(b"#B-"), completion_args.loan_unit_name.bytes),
-            completion_args.loan_hash,
-        )
-        lender_nft = self.create_loan_nft(
-            completion_args.lender_nft_image_url,
-            op.concat(ap.Bytes(b"L"), completion_args.loan_unit_name.bytes),
-            op.concat(ap.Bytes(b"#L-"), completion_args.loan_unit_name.bytes),
-            completion_args.loan_hash,
+    ) -> LoanRecord:
+        return self.complete_loan_purchase(
+            loan_key,
+            completion_args,
+            principal_asset,
+            borrower,
+            is_p2p=False,
         )
-        details.borrower_nft_asser_id = a4.UInt64(borrower_nft.id)
-        details.lender_nft_asser_id = a4.UInt64(lender_nft.id)
-        op.Box.put(loan_key, details.bytes)
-        return details
 
     @ap.arc4.abimethod()
     def complete_p2p_loan_purchase(
@@ -112,124 +166,117 @@ class ZaibatsuLoan(ZaibatsuBase):
         principal_asset: ap.Asset,
         borrower: ap.Account,
         txn: gtxn.AssetTransferTransaction,
-    ) -> LoanDetails:
+    ) -> LoanRecord:
         self.ensure_app_reciever(txn)
-
-        [loan_bytes, exists] = op.Box.get(loan_key)
-        assert exists, "A reccord with the loan_key passed was not found"
-        details = LoanDetails.from_bytes(loan_bytes)
-
-        completion_txn = ap.itxn.AssetTransfer(
-            fee=1000,
-            xfer_asset=details.principal_asset_id.native,
-            asset_receiver=details.borrower.native,
-            asset_amount=details.principal_asset_amount.native,
+        assert (
+            txn.xfer_asset == principal_asset
+        ), "The asset being transfered must be the principal asset"
+        self.ensure_transaction_fee_on_amount(
+            txn, loan_principal_asset_amount(loan_key), ap.UInt64(1)
         )
-        completion_txn.submit()
-
-        details.principal_paid = a4.Bool(True)  # noqa: FBT003
-        details.completed_payment_rounds = a4.UInt8(0)
-        borrower_nft = self.create_loan_nft(
-            completion_args.borrower_nft_image_url,
-            op.concat(ap.Bytes(b"B"), completion_args.loan_unit_name.bytes),
-            op.concat(ap.Bytes(b"#B-"), completion_args.loan_unit_name.bytes),
-            completion_args.loan_hash,
-        )
-        lender_nft = self.create_loan_nft(
-            completion_args.lender_nft_image_url,
-            op.concat(ap.Bytes(b"L"), completion_args.loan_unit_name.bytes),
-            op.concat(ap.Bytes(b"#L-"), completion_args.loan_unit_name.bytes),
-            completion_args.loan_hash,
+        return self.complete_loan_purchase(
+            loan_key,
+            completion_args,
+            principal_asset,
+            borrower,
+            is_p2p=True,
         )
-        details.borrower_nft_asser_id = a4.UInt64(borrower_nft.id)
-        details.lender_nft_asser_id = a4.UInt64(lender_nft.id)
-        op.Box.put(loan_key, details.bytes)
-        return details
 
     @ap.arc4.abimethod()
     def initiate_loan_repayment(
         self,
         loan_key: ap.Bytes,
-        repayment_key: ap.String,
         txn: gtxn.AssetTransferTransaction,
-    ) -> None:
+    ) -> RecordKey:
+        """Returns the repayment_key allocated to the repayment round"""
         self.ensure_app_reciever(txn)
 
-        [loan_bytes, exists] = op.Box.get(loan_key)
+        [loan_bytes, exists] = op.Box.get(loan_record_key(loan_key))
         assert exists, "A reccord with the loan_key passed was not found"
 
-        details = LoanDetails.from_bytes(loan_bytes)
-        principal_plus_interest = (
-            details.principal_asset_amount.native + details.interest_asset_amount.native
-        )
-        payment_amount = principal_plus_interest // details.payment_rounds.native
+        details = LoanRecord.from_bytes(loan_bytes)
+        payment_amount = self.calculate_round_payment_amount(details)
 
+        repayment_key = self.next_record_key()
         round_payment = PendingLoanRoundPayment(
-            repayment_key=a4.String(repayment_key),
-            loan_key=a4.String.from_bytes(loan_key),
+            loan_key=RecordKey.from_bytes(loan_key),
             repayment_amount=a4.UInt64(payment_amount),
             percentage_paid=a4.UInt64(0),
-            recipients=details.payment_recipients.copy(),
+            paid_recipients=a4.UInt64(0),
+        )
+        op.Box.put(repayment_record_key(repayment_key), round_payment.bytes)
+        a4.emit(
+            RepaymentRoundInitiated(
+                loan_key=RecordKey.from_bytes(loan_key),
+                repayment_key=RecordKey.from_bytes(repayment_key),
+                repayment_amount=a4.UInt64(payment_amount),
+            )
         )
-        op.Box.put(repayment_key.bytes, round_payment.bytes)
+        return RecordKey.from_bytes(repayment_key)
 
     @ap.arc4.abimethod()
     def execute_loan_repayment(
         self,
-        repayment_key: ap.String,
+        repayment_key: ap.Bytes,
+        recipient_index: ap.UInt64,
         recipient_account: ap.Account,
-        payment_recipient: PaymentReciepient,
         principal_asset: ap.Asset,
     ) -> ExecuteLoanRepaymentResponse:
-        [repayment_bytes, exists] = op.Box.get(repayment_key.bytes)
+        """
+        Pays the loan's payment_recipients[recipient_index] their share of a
+        pending repayment round
+        """
+        [repayment_bytes, exists] = op.Box.get(repayment_record_key(repayment_key))
         assert exists, "A PendingLoanRoundPayment with this repayment_key was not found"
         repayment = PendingLoanRoundPayment.from_bytes(repayment_bytes)
 
-        [loan_bytes, loan_exists] = op.Box.get(repayment.loan_key.bytes)
-        assert loan_exists, "A loan with this key was not found"
-        loan = LoanDetails.from_bytes(loan_bytes)
+        assert loan_exists(
+            repayment.loan_key.bytes
+        ), "A loan with this key was not found"
+        assert principal_asset.id == loan_principal_asset_id(
+            repayment.loan_key.bytes
+        ), "The principal_asset passed is invalid"
+
+        payment_recipient = loan_recipient(repayment.loan_key.bytes, recipient_index)
         assert (
             payment_recipient.recipient_address.native == recipient_account
         ), "The recipient_account does not match the payment_recipient"
 
-        assert (
-            principal_asset.id == loan.principal_asset_id.native
-        ), "The principal_asset passed is invalid"
-
-        recipient_is_valid = a4.Bool()
-
-        for index in ap.urange(repayment.recipients.length):
-            recipient = repayment.recipients[index].copy()
-            if recipient.recipient_address == payment_recipient.recipient_address:
-                assert (
-                    recipient.payment_percentage.native
-                    == payment_recipient.payment_percentage.native
-                ), "payment_recipient.payment_percentage is incorrect"
-                recipient_is_valid = a4.Bool(True)  # noqa: FBT003
-                break
-
-        assert (
-            recipient_is_valid
-        ), "payment_recipient passed is not a valid payment_recipient of the specified loan"
+        recipient_bit = ap.UInt64(1) << recipient_index
+        assert not (
+            repayment.paid_recipients.native & recipient_bit
+        ), "This payment_recipient has already been paid"
 
         new_percentage_paid = (
             payment_recipient.payment_percentage.native
             + repayment.percentage_paid.native
         )
 
+        recipient_amount = self.percentage(
+            repayment.repayment_amount,
+            payment_recipient.payment_percentage,
+        )
         repayment_txn = ap.itxn.AssetTransfer(
-            fee=1000,
-            xfer_asset=loan.principal_asset_id.native,
+            fee=0,
+            xfer_asset=principal_asset,
             asset_receiver=recipient_account,
-            asset_amount=self.percentage(
-                repayment.repayment_amount,
-                payment_recipient.payment_percentage,
-            ).native,
+            asset_amount=recipient_amount.native,
         )
         repayment_txn.submit()
+        a4.emit(
+            RecipientPaid(
+                loan_key=repayment.loan_key,
+                recipient_index=a4.UInt64(recipient_index),
+                recipient=payment_recipient.recipient_address,
+                amount=recipient_amount,
+            )
+        )
         repayment.percentage_paid = a4.UInt64(new_percentage_paid)
+        repayment.paid_recipients = a4.UInt64(
+            repayment.paid_recipients.native | recipient_bit
+        )
 
-        op.Box.put(repayment_key.bytes, repayment.bytes)
+        op.Box.put(repayment_record_key(repayment_key), repayment.bytes)
         repayment_response = ExecuteLoanRepaymentResponse(
             loan_repayment_complete=a4.Bool(new_percentage_paid == ap.UInt64(10000)),
             percentage_paid=a4.UInt64(new_percentage_paid),
@@ -237,72 +284,741 @@ class ZaibatsuLoan(ZaibatsuBase):
         return repayment_response
 
     @ap.arc4.abimethod()
-    def clean_up_loan_repayment(
+    def execute_loan_repayment_batch(
         self,
-        repayment_key: ap.String,
-        borrower_account: ap.Account,
-    ) -> CleanUpLoanRepaymentResponse:
-        [repayment_bytes, exists] = op.Box.get(repayment_key.bytes)
+        repayment_key: ap.Bytes,
+        principal_asset: ap.Asset,
+    ) -> ExecuteLoanRepaymentResponse:
+        """
+        Pays every recipient of a pending repayment round that has not been
+        paid yet in a single app call.
+        * The recipient accounts must be passed in the foreign accounts array
+        """
+        [repayment_bytes, exists] = op.Box.get(repayment_record_key(repayment_key))
         assert exists, "A PendingLoanRoundPayment with this repayment_key was not found"
         repayment = PendingLoanRoundPayment.from_bytes(repayment_bytes)
 
-        [loan_bytes, loan_exists] = op.Box.get(repayment.loan_key.bytes)
-        assert loan_exists, "A loan with this key was not found"
-        loan = LoanDetails.from_bytes(loan_bytes)
+        assert loan_exists(
+            repayment.loan_key.bytes
+        ), "A loan with this key was not found"
+        assert principal_asset.id == loan_principal_asset_id(
+            repayment.loan_key.bytes
+        ), "The principal_asset passed is invalid"
+
+        [percentage_paid, paid_recipients] = self.pay_loan_recipients(
+            repayment.loan_key.bytes,
+            principal_asset,
+            repayment.repayment_amount,
+            repayment.paid_recipients.native,
+        )
+        percentage_paid += repayment.percentage_paid.native
+        repayment.percentage_paid = a4.UInt64(percentage_paid)
+        repayment.paid_recipients = a4.UInt64(paid_recipients)
+
+        op.Box.put(repayment_record_key(repayment_key), repayment.bytes)
+        return ExecuteLoanRepaymentResponse(
+            loan_repayment_complete=a4.Bool(percentage_paid == ap.UInt64(10000)),
+            percentage_paid=a4.UInt64(percentage_paid),
+        )
 
+    @ap.arc4.abimethod()
+    def clean_up_loan_repayment(
+        self,
+        repayment_key: ap.Bytes,
+        borrower_account: ap.Account,
+    ) -> CleanUpLoanRepaymentResponse:
+        loan_key = self.paid_repayment_loan_key(repayment_key)
+        assert borrower_account == loan_borrower(
+            loan_key
+        ), "The borrower_account must be the borrower of the loan"
         clean_up_response = CleanUpLoanRepaymentResponse(
-            loan_repayment_complete=a4.Bool()
+            loan_repayment_complete=self.close_loan_round(loan_key, borrower_account)
         )
 
-        loan.completed_payment_rounds = a4.UInt8(
-            loan.completed_payment_rounds.native + ap.UInt64(1)
+        self.delete_repayment(repayment_key, loan_key)
+
+        return clean_up_response
+
+    @ap.arc4.abimethod()
+    def clean_up_loan_repayments(
+        self,
+        repayment_keys: RecordKeyArray,
+    ) -> a4.DynamicArray[a4.Bool]:
+        """
+        Closes many repayment rounds in one app call. Returns, for every
+        repayment_key, whether its loan has been fully repaid.
+        * Every recipient of every round must have been paid
+        * Collateral of fully repaid loans is released to the stored borrower,
+          so the borrower accounts must be passed in the foreign accounts array
+        * Opcode budget is topped up with OpUp inner transactions paid for by
+          the outer transaction fee
+        * At most MAX_CLEAN_UP_BATCH_SIZE repayment_keys can be passed, so the
+          events of every key fit in the logs of one app call
+        """
+        assert (
+            repayment_keys.length <= MAX_CLEAN_UP_BATCH_SIZE
+        ), "Too many repayment_keys for one app call"
+        ap.ensure_budget(
+            repayment_keys.length * CLEAN_UP_OPCODE_BUDGET_PER_KEY,
+            ap.OpUpFeeSource.GroupCredit,
         )
-        if loan.payment_rounds.native == loan.completed_payment_rounds.native:
-            complete_loan_repaymet_txn = ap.itxn.AssetTransfer(
-                fee=100,
-                xfer_asset=loan.collateral_asset_id.native,
-                asset_receiver=borrower_account,
-                asset_amount=loan.collateral_asset_amount.native,
-                note="Collateral repayment on completed loan",
+        loans_repaid = a4.DynamicArray[a4.Bool]()
+        for index in ap.urange(repayment_keys.length):
+            repayment_key = repayment_keys[index].copy()
+            loan_key = self.paid_repayment_loan_key(repayment_key.bytes)
+            loans_repaid.append(
+                self.close_loan_round(loan_key, loan_borrower(loan_key))
             )
-            complete_loan_repaymet_txn.submit()
-            op.Box.delete(repayment.loan_key.bytes)
-            clean_up_response.loan_repayment_complete = a4.Bool(True)  # noqa: FBT003
-        else:
-            op.Box.put(repayment.loan_key.bytes, loan.bytes)
+            self.delete_repayment(repayment_key.bytes, loan_key)
+        return loans_repaid
 
-        op.Box.delete(repayment_key.bytes)
+    @ap.arc4.abimethod()
+    def repay_loan_round(
+        self,
+        loan_key: ap.Bytes,
+        txn: gtxn.AssetTransferTransaction,
+    ) -> CleanUpLoanRepaymentResponse:
+        """
+        Runs a whole repayment round in one app call: takes the borrower's
+        payment, pays every recipient and closes the round without creating
+        a PendingLoanRoundPayment box.
+        * The recipient accounts must be passed in the foreign accounts array
+        """
+        self.ensure_app_reciever(txn)
 
-        return clean_up_response
+        [loan_bytes, exists] = op.Box.get(loan_record_key(loan_key))
+        assert exists, "A reccord with the loan_key passed was not found"
+        loan = LoanRecord.from_bytes(loan_bytes)
+        assert loan.principal_paid, "The loan principal must have been paid"
+        assert not loan.payment_defaulted, "The loan has already been defaulted"
+        assert (
+            loan.completed_payment_rounds.native < loan.payment_rounds.native
+        ), "All payment rounds of this loan have been completed"
+        assert txn.sender == loan.borrower.native, "The sender must be the borrower"
+        assert (
+            txn.xfer_asset.id == loan.principal_asset_id.native
+        ), "The asset being transfered must be the principal asset"
+
+        payment_amount = self.calculate_round_payment_amount(loan)
+        self.ensure_transaction_fee_on_amount(txn, payment_amount, ap.UInt64(1))
+
+        [percentage_paid, _paid_recipients] = self.pay_loan_recipients(
+            loan_key,
+            txn.xfer_asset,
+            a4.UInt64(payment_amount),
+            ap.UInt64(0),
+        )
+        assert percentage_paid == ap.UInt64(
+            10000
+        ), "The payment_recipients of this loan do not add up to 100 percent"
+
+        return CleanUpLoanRepaymentResponse(
+            loan_repayment_complete=self.close_loan_round(loan_key, txn.sender)
+        )
 
     @ap.arc4.abimethod()
     def handle_payment_default(
         self,
-        loan_key: ap.String,
-        repayment_key: ap.String,
+        loan_key: ap.Bytes,
         payment_principal_asset_amount: ap.UInt64,
         payment_collateral_asset_amount: ap.UInt64,
-    ) -> None:
-        [loan_bytes, exists] = op.Box.get(loan_key.bytes)
+    ) -> RecordKey:
+        """Returns the repayment_key of the principal owed to the recipients"""
+        assert loan_exists(loan_key), "A reccord with the loan_key passed was not found"
+
+        repayment_key = self.record_payment_default(
+            loan_key,
+            payment_principal_asset_amount,
+            payment_collateral_asset_amount,
+        )
+        return RecordKey.from_bytes(repayment_key)
+
+    @a4.abimethod()
+    def handle_payment_defaults(
+        self,
+        loan_keys: RecordKeyArray,
+    ) -> a4.DynamicArray[PaymentDefaultResponse]:
+        """
+        Defaults many overdue loans in one app call and returns, for each loan,
+        the repayment_key of the principal owed and the collateral seized.
+        * A loan is overdue once its payment_completion_timestamp has passed
+          with payment rounds still outstanding. It can only be defaulted once
+        * The seized collateral is worth the outstanding principal and interest
+          at the cached oracle prices, capped at the collateral of the loan
+        * The "O" price oracle box and the price boxes of the principal and
+          collateral assets must be passed in the box references
+        * The principal and collateral assets must be passed in the foreign
+          assets array, their decimals scale the seizure
+        """
+        self.authorise_txn()
+        ap.ensure_budget(
+            loan_keys.length * DEFAULT_OPCODE_BUDGET_PER_KEY,
+            ap.OpUpFeeSource.GroupCredit,
+        )
+
+        payment_defaults = a4.DynamicArray[PaymentDefaultResponse]()
+        for index in ap.urange(loan_keys.length):
+            loan_key = loan_keys[index].bytes
+            [loan_bytes, exists] = op.Box.get(loan_record_key(loan_key))
+            assert exists, "A reccord with the loan_key passed was not found"
+            loan = LoanRecord.from_bytes(loan_bytes)
+
+            assert (
+                ap.Global.latest_timestamp > loan.payment_completion_timestamp.native
+            ), "The loan is not overdue"
+            outstanding_rounds = (
+                loan.payment_rounds.native - loan.completed_payment_rounds.native
+            )
+            assert outstanding_rounds > 0, "The loan has no outstanding payment rounds"
+            assert not loan.payment_defaulted, "The loan has already been defaulted"
+
+            outstanding_amount = (
+                self.calculate_round_payment_amount(loan) * outstanding_rounds
+            )
+            collateral_amount = self.collateral_seizure_amount(loan, outstanding_amount)
+            repayment_key = self.record_payment_default(
+                loan_key, outstanding_amount, collateral_amount
+            )
+            payment_defaults.append(
+                PaymentDefaultResponse(
+                    repayment_key=RecordKey.from_bytes(repayment_key),
+                    collateral_seized=a4.UInt64(collateral_amount),
+                )
+            )
+        return payment_defaults
+
+    @ap.arc4.abimethod()
+    def delete_loan(self, loan_key: ap.Bytes) -> None:
+        assert loan_exists(loan_key), "A loan with this key was not found"
+        self.remove_loan(loan_key)
+
+    @ap.arc4.abimethod()
+    def migrate_loan_record(self, legacy_loan_key: ap.Bytes) -> RecordKey:
+        """
+        Rewrites a legacy LoanDetails box as a LoanRecord under a newly
+        allocated loan_key, moving its payment_recipients into their own box.
+        Returns the new loan_key
+        * Loans with more than MAX_LOAN_RECIPIENTS payment_recipients cannot
+          be migrated, their paid recipients would not fit the bitmap
+        * The new record, recipients and index boxes must be passed in the box
+          references
+        """
+        self.authorise_txn()
+        [legacy_bytes, exists] = op.Box.get(legacy_loan_key)
         assert exists, "A reccord with the loan_key passed was not found"
 
-        details = LoanDetails.from_bytes(loan_bytes)
+        details = LoanDetails.from_bytes(legacy_bytes)
+        assert (
+            details.payment_recipients.length <= MAX_LOAN_RECIPIENTS
+        ), "A loan can have at most 64 payment_recipients"
+        record = self.build_loan_record(details)
+        loan_key = self.next_record_key()
+        op.Box.delete(legacy_loan_key)
+        op.Box.put(loan_record_key(loan_key), record.bytes)
+        put_loan_recipients(loan_key, details.payment_recipients.copy())
+        self.add_active_loan(loan_key)
+        self.emit_loan_initiated(loan_key, record)
+        return RecordKey.from_bytes(loan_key)
+
+    @a4.abimethod(readonly=True)
+    def get_borrower_loans(self, borrower: ap.Account) -> RecordKeyArray:
+        """
+        Returns the keys of the borrower's open loans.
+        * The borrower box must be passed in the box references
+        """
+        loan_keys = RecordKeyArray()
+        for index in ap.urange(borrower_loan_count(borrower)):
+            loan_keys.append(RecordKey.from_bytes(borrower_loan_key(borrower, index)))
+        return loan_keys
+
+    @a4.abimethod(readonly=True)
+    def get_loan_statuses(self, loan_keys: RecordKeyArray) -> a4.DynamicArray[a4.UInt8]:
+        """Returns one LOAN_STATUS_* value per loan_key"""
+        statuses = a4.DynamicArray[a4.UInt8]()
+        for index in ap.urange(loan_keys.length):
+            loan_key = loan_keys[index].copy()
+            statuses.append(a4.UInt8(self.loan_status(loan_key.bytes)))
+        return statuses
+
+    @a4.abimethod(readonly=True)
+    def get_amounts_due(self, loan_keys: RecordKeyArray) -> a4.DynamicArray[a4.UInt64]:
+        """
+        Returns the principal asset amount due for the current payment round of
+        every loan, 0 for loans that are not found, have no rounds left or whose
+        principal has not been paid out yet
+        """
+        amounts_due = a4.DynamicArray[a4.UInt64]()
+        for index in ap.urange(loan_keys.length):
+            loan_key = loan_keys[index].copy()
+            amount_due = ap.UInt64(0)
+            if self.loan_remaining_rounds(loan_key.bytes):
+                if loan_principal_paid(loan_key.bytes):
+                    amount_due = self.loan_round_payment_amount(loan_key.bytes)
+            amounts_due.append(a4.UInt64(amount_due))
+        return amounts_due
 
-        details.collateral_asset_amount = a4.UInt64(
-            details.collateral_asset_amount.native - payment_collateral_asset_amount
+    @a4.abimethod(readonly=True)
+    def get_remaining_rounds(
+        self, loan_keys: RecordKeyArray
+    ) -> a4.DynamicArray[a4.UInt8]:
+        """Returns the payment rounds left on every loan, 0 when not found"""
+        remaining_rounds = a4.DynamicArray[a4.UInt8]()
+        for index in ap.urange(loan_keys.length):
+            loan_key = loan_keys[index].copy()
+            remaining_rounds.append(
+                a4.UInt8(self.loan_remaining_rounds(loan_key.bytes))
+            )
+        return remaining_rounds
+
+    @a4.abimethod(readonly=True)
+    def get_repayment_progress(
+        self, repayment_keys: RecordKeyArray
+    ) -> a4.DynamicArray[ExecuteLoanRepaymentResponse]:
+        """
+        Returns how much of every pending repayment round has been paid out to
+        the payment recipients. Rounds that are not found report nothing paid
+        """
+        progress = a4.DynamicArray[ExecuteLoanRepaymentResponse]()
+        for index in ap.urange(repayment_keys.length):
+            repayment_key = repayment_keys[index].copy()
+            percentage_paid = ap.UInt64(0)
+            [repayment_bytes, exists] = op.Box.get(
+                repayment_record_key(repayment_key.bytes)
+            )
+            if exists:
+                repayment = PendingLoanRoundPayment.from_bytes(repayment_bytes)
+                percentage_paid = repayment.percentage_paid.native
+            progress.append(
+                ExecuteLoanRepaymentResponse(
+                    loan_repayment_complete=a4.Bool(percentage_paid == 10000),
+                    percentage_paid=a4.UInt64(percentage_paid),
+                )
+            )
+        return progress
+
+    ################################################################
+    #####################   Subroutines    #########################
+    ################################################################
+    @ap.subroutine
+    def pay_loan_recipients(
+        self,
+        loan_key: ap.Bytes,
+        principal_asset: ap.Asset,
+        repayment_amount: a4.UInt64,
+        paid_recipients: ap.UInt64,
+    ) -> tuple[ap.UInt64, ap.UInt64]:
+        """
+        Submits one AssetTransfer per recipient of the loan whose bit is not yet
+        set in paid_recipients, grouped into inner transaction groups of
+        MAX_INNER_GROUP_SIZE. Returns the percentage paid by this call and the
+        updated paid_recipients bitmask
+        * The recipients are read from the loan's recipients box here, so
+          callers never pass a mutable ARC4 array that would need copying
+        * Logs a single RecipientsPaid event, as one event per recipient could
+          exceed the log limit of an app call
+        """
+        recipients = loan_recipients(loan_key)
+        percentage_paid = ap.UInt64(0)
+        amount_paid = ap.UInt64(0)
+        group_size = ap.UInt64(0)
+        for index in ap.urange(recipients.length):
+            recipient_bit = ap.UInt64(1) << index
+            if paid_recipients & recipient_bit:
+                continue
+
+            recipient = recipients[index].copy()
+            if group_size == MAX_INNER_GROUP_SIZE:
+                op.ITxnCreate.submit()
+                group_size = ap.UInt64(0)
+            if group_size == 0:
+                op.ITxnCreate.begin()
+            else:
+                op.ITxnCreate.next()
+            op.ITxnCreate.set_type_enum(ap.TransactionType.AssetTransfer)
+            op.ITxnCreate.set_fee(0)
+            op.ITxnCreate.set_xfer_asset(principal_asset)
+            op.ITxnCreate.set_asset_receiver(recipient.recipient_address.native)
+            amount = self.percentage(repayment_amount, recipient.payment_percentage)
+            op.ITxnCreate.set_asset_amount(amount.native)
+            group_size += 1
+            paid_recipients |= recipient_bit
+            percentage_paid += recipient.payment_percentage.native
+            amount_paid += amount.native
+
+        if group_size > 0:
+            op.ITxnCreate.submit()
+            a4.emit(
+                RecipientsPaid(
+                    loan_key=RecordKey.from_bytes(loan_key),
+                    paid_recipients=a4.UInt64(paid_recipients),
+                    percentage_paid=a4.UInt64(percentage_paid),
+                    amount_paid=a4.UInt64(amount_paid),
+                )
+            )
+        return percentage_paid, paid_recipients
+
+    @ap.subroutine
+    def initiate_loan(
+        self,
+        loan_details: LoanDetails,
+        txn: gtxn.AssetTransferTransaction,
+    ) -> ap.Bytes:
+        """
+        Validates the collateral transfer of a loan and stores the loan under a
+        newly allocated loan_key, which is returned
+        """
+        self.ensure_app_reciever(txn)
+        assert (
+            loan_details.payment_recipients.length <= MAX_LOAN_RECIPIENTS
+        ), "A loan can have at most 64 payment_recipients"
+        if loan_details.loan_type == a4.String("P2P"):
+            assert loan_details.payment_recipients.length == ap.UInt64(
+                1
+            ), "Only one recipient is allowed in a P2P loan"
+
+        assert (
+            loan_details.borrower == txn.sender
+        ), "The sender must also be the borrower"
+
+        assert (
+            loan_details.collateral_asset_id == txn.xfer_asset.id
+        ), "The asset being transfered must be the collateral asset"
+
+        assert txn.asset_amount >= self.calculate_amt_plus_fee(
+            loan_details.collateral_asset_amount.native, ap.UInt64(1)
+        ), "Insufficient txn asset_amount! Amount must be equal to collateral_asset_amount plus fees"
+
+        loan_key = self.next_record_key()
+        record = self.build_loan_record(loan_details)
+        record.collateral_paid = a4.Bool(True)  # noqa: FBT003
+        op.Box.put(loan_record_key(loan_key), record.bytes)
+        put_loan_recipients(loan_key, loan_details.payment_recipients.copy())
+        self.add_active_loan(loan_key)
+        self.emit_loan_initiated(loan_key, record)
+        return loan_key
+
+    @ap.subroutine
+    def complete_loan_purchase(
+        self,
+        loan_key: ap.Bytes,
+        completion_args: CompleteLoanArgs,
+        principal_asset: ap.Asset,
+        borrower: ap.Account,
+        is_p2p: bool,  # noqa: FBT001
+    ) -> LoanRecord:
+        """
+        Shared by the P2P and non P2P completion methods: validates the loan,
+        disburses the principal, mints the loan NFTs and records them
+        """
+        [loan_bytes, exists] = op.Box.get(loan_record_key(loan_key))
+        assert exists, "A reccord with the loan_key passed was not found"
+        details = LoanRecord.from_bytes(loan_bytes)
+        assert (
+            details.loan_type.native == LOAN_TYPE_P2P
+        ) == is_p2p, "The loan_type does not match the completion method"
+        assert (
+            details.collateral_paid
+        ), "The loan collateral must have been paid by this point"
+        assert not details.principal_paid, "The principal must not have been paid"
+        assert (
+            borrower == details.borrower.native
+        ), "The borrower must be the borrower in the loan details"
+        assert (
+            principal_asset.id == details.principal_asset_id.native
+        ), "The asset passed must be the same as the principal"
+
+        [borrower_nft, lender_nft] = self.disburse_principal_and_mint_loan_nfts(
+            details, completion_args
+        )
+
+        details.principal_paid = a4.Bool(True)  # noqa: FBT003
+        details.completed_payment_rounds = a4.UInt8(0)
+        details.borrower_nft_asser_id = a4.UInt64(borrower_nft.id)
+        details.lender_nft_asser_id = a4.UInt64(lender_nft.id)
+
+        set_loan_principal_paid(loan_key, True)  # noqa: FBT003
+        set_loan_completed_payment_rounds(loan_key, ap.UInt64(0))
+        set_loan_nft_asset_ids(loan_key, lender_nft, borrower_nft)
+        a4.emit(
+            LoanCompleted(
+                loan_key=RecordKey.from_bytes(loan_key),
+                lender_nft_asset_id=a4.UInt64(lender_nft.id),
+                borrower_nft_asset_id=a4.UInt64(borrower_nft.id),
+            )
+        )
+        return details
+
+    @ap.subroutine
+    def disburse_principal_and_mint_loan_nfts(
+        self, details: LoanRecord, completion_args: CompleteLoanArgs
+    ) -> tuple[ap.Asset, ap.Asset]:
+        """
+        Sends the principal to the borrower and mints the borrower and lender
+        loan NFTs in a single inner transaction group.
+        Returns the borrower and lender NFTs
+        """
+        principal_txn = ap.itxn.AssetTransfer(
+            fee=0,
+            xfer_asset=details.principal_asset_id.native,
+            asset_receiver=details.borrower.native,
+            asset_amount=details.principal_asset_amount.native,
+        )
+        borrower_nft_txn = ap.itxn.AssetConfig(
+            total=1,
+            url=completion_args.borrower_nft_image_url.native,
+            unit_name=op.concat(b"B", completion_args.loan_unit_name.bytes),
+            asset_name=op.concat(b"#B-", completion_args.loan_unit_name.bytes),
+            fee=0,
+            metadata_hash=completion_args.loan_hash.native.bytes,
+            manager=op.Global.current_application_address,
+            reserve=op.Global.current_application_address,
+            freeze=op.Global.current_application_address,
+            clawback=op.Global.current_application_address,
+        )
+        lender_nft_txn = borrower_nft_txn.copy()
+        lender_nft_txn.set(
+            url=completion_args.lender_nft_image_url.native,
+            unit_name=op.concat(b"L", completion_args.loan_unit_name.bytes),
+            asset_name=op.concat(b"#L-", completion_args.loan_unit_name.bytes),
+        )
+        [_principal, borrower_nft, lender_nft] = ap.itxn.submit_txns(
+            principal_txn, borrower_nft_txn, lender_nft_txn
+        )
+        return borrower_nft.created_asset, lender_nft.created_asset
+
+    @ap.subroutine
+    def build_loan_record(self, details: LoanDetails) -> LoanRecord:
+        return LoanRecord(
+            version=a4.UInt8(LOAN_RECORD_VERSION),
+            loan_type=self.loan_type_from_name(details.loan_type),
+            tenure=details.tenure,
+            payment_rounds=details.payment_rounds,
+            completed_payment_rounds=details.completed_payment_rounds,
+            collateral_paid=details.collateral_paid,
+            principal_paid=details.principal_paid,
+            payment_defaulted=a4.Bool(False),  # noqa: FBT003
+            principal_asset_id=details.principal_asset_id,
+            collateral_asset_id=details.collateral_asset_id,
+            interest_asset_amount=details.interest_asset_amount,
+            principal_asset_amount=details.principal_asset_amount,
+            collateral_asset_amount=details.collateral_asset_amount,
+            early_payment_penalty_amount=details.early_payment_penalty_amount,
+            payment_completion_timestamp=details.payment_completion_timestamp,
+            lender_nft_asser_id=details.lender_nft_asser_id,
+            borrower_nft_asser_id=details.borrower_nft_asser_id,
+            borrower=details.borrower,
+            active_loan_position=a4.UInt64(0),
+        )
+
+    @ap.subroutine
+    def emit_loan_initiated(self, loan_key: ap.Bytes, record: LoanRecord) -> None:
+        a4.emit(
+            LoanInitiated(
+                loan_key=RecordKey.from_bytes(loan_key),
+                borrower=record.borrower,
+                principal_asset_id=record.principal_asset_id,
+                principal_asset_amount=record.principal_asset_amount,
+                collateral_asset_id=record.collateral_asset_id,
+                collateral_asset_amount=record.collateral_asset_amount,
+            )
+        )
+
+    @ap.subroutine
+    def loan_type_from_name(self, loan_type: a4.String) -> a4.UInt8:
+        if loan_type == a4.String("P2P"):
+            return a4.UInt8(LOAN_TYPE_P2P)
+        if loan_type == a4.String("DAO"):
+            return a4.UInt8(LOAN_TYPE_DAO)
+        assert loan_type == a4.String("ZAIBATSU"), "The loan_type is not supported"
+        return a4.UInt8(LOAN_TYPE_ZAIBATSU)
+
+    @ap.subroutine
+    def calculate_round_payment_amount(self, loan: LoanRecord) -> ap.UInt64:
+        principal_plus_interest = (
+            loan.principal_asset_amount.native + loan.interest_asset_amount.native
+        )
+        return principal_plus_interest // loan.payment_rounds.native
+
+    @ap.subroutine
+    def collateral_seizure_amount(
+        self, loan: LoanRecord, outstanding_amount: ap.UInt64
+    ) -> ap.UInt64:
+        """
+        Converts an amount of the principal asset into the collateral asset at
+        the cached oracle prices, capped at the collateral of the loan.
+        Prices are per whole unit and amounts in base units, so the amount is
+        scaled by the decimals of both assets
+        """
+        principal_asset = ap.Asset(loan.principal_asset_id.native)
+        collateral_asset = ap.Asset(loan.collateral_asset_id.native)
+        principal_price = self.get_asset_price(principal_asset)
+        collateral_price = self.get_asset_price(collateral_asset)
+        assert collateral_price > 0, "The asa is of no value or is not supported"
+
+        seizure_amount = loan.collateral_asset_amount.native
+        outstanding_value = (
+            ap.BigUInt(outstanding_amount)
+            * ap.BigUInt(principal_price)
+            * ap.BigUInt(ap.UInt64(10) ** collateral_asset.decimals)
+        )
+        collateral_unit_value = ap.BigUInt(collateral_price) * ap.BigUInt(
+            ap.UInt64(10) ** principal_asset.decimals
         )
+        amount = outstanding_value // collateral_unit_value
+        if amount < ap.BigUInt(seizure_amount):
+            seizure_amount = op.btoi(amount.bytes)
+        return seizure_amount
 
+    @ap.subroutine
+    def record_payment_default(
+        self,
+        loan_key: ap.Bytes,
+        principal_amount: ap.UInt64,
+        collateral_amount: ap.UInt64,
+    ) -> ap.Bytes:
+        """
+        Seizes collateral from a loan, marks it as defaulted and leaves a
+        PendingLoanRoundPayment of the principal owed to the payment recipients.
+        Returns the repayment_key
+        """
+        set_loan_collateral_asset_amount(
+            loan_key, loan_collateral_asset_amount(loan_key) - collateral_amount
+        )
+        set_loan_payment_defaulted(loan_key, True)  # noqa: FBT003
+
+        repayment_key = self.next_record_key()
         round_payment = PendingLoanRoundPayment(
-            repayment_key=a4.String(repayment_key),
-            loan_key=a4.String.from_bytes(loan_key.bytes),
-            repayment_amount=a4.UInt64(payment_principal_asset_amount),
+            loan_key=RecordKey.from_bytes(loan_key),
+            repayment_amount=a4.UInt64(principal_amount),
             percentage_paid=a4.UInt64(0),
-            recipients=details.payment_recipients.copy(),
+            paid_recipients=a4.UInt64(0),
         )
 
-        op.Box.put(loan_key.bytes, details.bytes)
-        op.Box.put(repayment_key.bytes, round_payment.bytes)
+        op.Box.put(repayment_record_key(repayment_key), round_payment.bytes)
+        a4.emit(
+            LoanDefaulted(
+                loan_key=RecordKey.from_bytes(loan_key),
+                repayment_key=RecordKey.from_bytes(repayment_key),
+                principal_owed=a4.UInt64(principal_amount),
+                collateral_seized=a4.UInt64(collateral_amount),
+            )
+        )
+        return repayment_key
 
-    @ap.arc4.abimethod()
-    def delete_loan(self, loan_key: ap.Bytes) -> None:
-        op.Box.delete(loan_key)
+    @ap.subroutine
+    def next_record_key(self) -> ap.Bytes:
+        """Allocates the next loan or repayment key from the key_counter"""
+        counter = key_counter() + 1
+        set_key_counter(counter)
+        return op.itob(counter)
+
+    @ap.subroutine
+    def add_active_loan(self, loan_key: ap.Bytes) -> None:
+        """Adds a stored loan to the active loan and borrower indexes"""
+        count = active_loan_count()
+        insert_active_loan(loan_key, count)
+        set_active_loan_count(count + 1)
+        add_borrower_loan(loan_borrower(loan_key), loan_key)
+
+    @ap.subroutine
+    def remove_loan(self, loan_key: ap.Bytes) -> None:
+        """Removes a loan from the loan indexes and deletes its boxes"""
+        count = active_loan_count()
+        remove_active_loan(loan_key, count)
+        set_active_loan_count(count - 1)
+        remove_borrower_loan(loan_borrower(loan_key), loan_key)
+        delete_loan_boxes(loan_key)
+        a4.emit(LoanDeleted(loan_key=RecordKey.from_bytes(loan_key)))
+
+    @ap.subroutine
+    def loan_status(self, loan_key: ap.Bytes) -> ap.UInt64:
+        if not loan_exists(loan_key):
+            return ap.UInt64(LOAN_STATUS_NOT_FOUND)
+        if not loan_principal_paid(loan_key):
+            return ap.UInt64(LOAN_STATUS_AWAITING_PRINCIPAL)
+        if ap.Global.latest_timestamp > loan_payment_completion_timestamp(loan_key):
+            return ap.UInt64(LOAN_STATUS_OVERDUE)
+        return ap.UInt64(LOAN_STATUS_ACTIVE)
+
+    @ap.subroutine
+    def loan_remaining_rounds(self, loan_key: ap.Bytes) -> ap.UInt64:
+        if not loan_exists(loan_key):
+            return ap.UInt64(0)
+        return loan_payment_rounds(loan_key) - loan_completed_payment_rounds(loan_key)
+
+    @ap.subroutine
+    def loan_round_payment_amount(self, loan_key: ap.Bytes) -> ap.UInt64:
+        """calculate_round_payment_amount, read field by field from the box"""
+        principal_plus_interest = loan_principal_asset_amount(
+            loan_key
+        ) + loan_interest_asset_amount(loan_key)
+        return principal_plus_interest // loan_payment_rounds(loan_key)
+
+    @ap.subroutine
+    def paid_repayment_loan_key(self, repayment_key: ap.Bytes) -> ap.Bytes:
+        """
+        Returns the loan_key of a PendingLoanRoundPayment that has paid every
+        recipient. The PendingLoanRoundPayments left by payment defaults are
+        rejected, they do not close a round of the loan
+        """
+        [repayment_bytes, exists] = op.Box.get(repayment_record_key(repayment_key))
+        assert exists, "A PendingLoanRoundPayment with this repayment_key was not found"
+        repayment = PendingLoanRoundPayment.from_bytes(repayment_bytes)
+        assert repayment.percentage_paid == ap.UInt64(
+            10000
+        ), "Every payment_recipient of the repayment round must have been paid"
+        loan_key = repayment.loan_key.bytes
+        assert loan_exists(loan_key), "A loan with this key was not found"
+        assert not loan_payment_defaulted(loan_key), "The loan has been defaulted"
+        return loan_key
+
+    @ap.subroutine
+    def delete_repayment(self, repayment_key: ap.Bytes, loan_key: ap.Bytes) -> None:
+        op.Box.delete(repayment_record_key(repayment_key))
+        a4.emit(
+            RepaymentClosed(
+                repayment_key=RecordKey.from_bytes(repayment_key),
+                loan_key=RecordKey.from_bytes(loan_key),
+            )
+        )
+
+    @ap.subroutine
+    def close_loan_round(
+        self, loan_key: ap.Bytes, borrower_account: ap.Account
+    ) -> a4.Bool:
+        """
+        Advances completed_payment_rounds and, on the final round, releases the
+        collateral to the borrower and deletes the loan record
+        """
+        completed_payment_rounds = loan_completed_payment_rounds(loan_key) + 1
+        if completed_payment_rounds == loan_payment_rounds(loan_key):
+            complete_loan_repaymet_txn = ap.itxn.AssetTransfer(
+                fee=0,
+                xfer_asset=loan_collateral_asset_id(loan_key),
+                asset_receiver=borrower_account,
+                asset_amount=loan_collateral_asset_amount(loan_key),
+                note="Collateral repayment on completed loan",
+            )
+            complete_loan_repaymet_txn.submit()
+            self.emit_round_closed(loan_key, completed_payment_rounds, loan_repaid=True)
+            self.remove_loan(loan_key)
+            return a4.Bool(True)  # noqa: FBT003
+
+        set_loan_completed_payment_rounds(loan_key, completed_payment_rounds)
+        self.emit_round_closed(loan_key, completed_payment_rounds, loan_repaid=False)
+        return a4.Bool(False)  # noqa: FBT003
+
+    @ap.subroutine
+    def emit_round_closed(
+        self,
+        loan_key: ap.Bytes,
+        completed_payment_rounds: ap.UInt64,
+        loan_repaid: bool,  # noqa: FBT001
+    ) -> None:
+        a4.emit(
+            RoundClosed(
+                loan_key=RecordKey.from_bytes(loan_key),
+                completed_payment_rounds=a4.UInt8(completed_payment_rounds),
+                loan_repaid=a4.Bool(loan_repaid),
+            )
+        )
@@ -0,0 +1,301 @@
+# pyright: reportMissingModuleSource=false
+"""
+Field level access to LoanRecord boxes.
+
+LoanRecord is a static ARC4 struct, so every field sits at a fixed offset and
+can be read and written in place with op.Box.extract/op.Box.replace instead
+of decoding and re-encoding the whole record. The payment recipients of a loan
+are kept in a separate box that is only read when recipients are paid.
+
+Every box name starts with a one byte type prefix, so boxes can be told apart
+without decoding them:
+Loan and repayment keys are 8 byte ids allocated from the contract's
+key_counter, see types/loan.py.
+* "C": the key_counter and active_loan_count loan counters
+* "L" + loan_key: LoanRecord
+* "P" + loan_key: PaymentReciepientArray
+* "R" + repayment_key: PendingLoanRoundPayment
+* "I" + itob(page): page of the active loan index, see active_loans.py
+* "B" + borrower: loan keys of a borrower, see borrower_loans.py
+"""
+import algopy as ap
+from algopy import arc4 as a4
+from algopy import op
+
+from smart_contracts.zaibatsu_loan.types.loan import (
+    PaymentReciepient,
+    PaymentReciepientArray,
+)
+
+# Byte offsets of the LoanRecord fields inside the box
+VERSION = 0
+LOAN_TYPE = 1
+TENURE = 2
+PAYMENT_ROUNDS = 3
+COMPLETED_PAYMENT_ROUNDS = 4
+PAID_FLAGS = 5
+PRINCIPAL_ASSET_ID = 6
+COLLATERAL_ASSET_ID = 14
+INTEREST_ASSET_AMOUNT = 22
+PRINCIPAL_ASSET_AMOUNT = 30
+COLLATERAL_ASSET_AMOUNT = 38
+EARLY_PAYMENT_PENALTY_AMOUNT = 46
+PAYMENT_COMPLETION_TIMESTAMP = 54
+LENDER_NFT_ASSET_ID = 62
+BORROWER_NFT_ASSET_ID = 70
+BORROWER = 78
+ACTIVE_LOAN_POSITION = 110
+
+# Consecutive ARC4 Bools are packed into the PAID_FLAGS byte, most significant
+# bit first
+COLLATERAL_PAID_BIT = 0
+PRINCIPAL_PAID_BIT = 1
+PAYMENT_DEFAULTED_BIT = 2
+
+# The loan counters are kept in a box rather than global state, so the global
+# schema stays the one apps created before the counters were given. The box is
+# created by the first write, until then both counters read as zero
+LOAN_COUNTERS_KEY = b"C"
+LOAN_COUNTERS_SIZE = 16
+KEY_COUNTER = 0
+ACTIVE_LOAN_COUNT = 8
+
+LOAN_KEY_PREFIX = b"L"
+REPAYMENT_KEY_PREFIX = b"R"
+RECIPIENTS_KEY_PREFIX = b"P"
+# A recipients box is a uint16 length followed by 40 byte PaymentReciepients
+RECIPIENTS_LENGTH_SIZE = 2
+RECIPIENT_SIZE = 40
+
+
+@ap.subroutine
+def loan_record_key(loan_key: ap.Bytes) -> ap.Bytes:
+    return op.concat(LOAN_KEY_PREFIX, loan_key)
+
+
+@ap.subroutine
+def repayment_record_key(repayment_key: ap.Bytes) -> ap.Bytes:
+    return op.concat(REPAYMENT_KEY_PREFIX, repayment_key)
+
+
+@ap.subroutine
+def loan_exists(loan_key: ap.Bytes) -> bool:
+    _length, exists = op.Box.length(loan_record_key(loan_key))
+    return exists
+
+
+@ap.subroutine
+def read_uint64(loan_key: ap.Bytes, offset: ap.UInt64) -> ap.UInt64:
+    return op.btoi(op.Box.extract(loan_record_key(loan_key), offset, 8))
+
+
+@ap.subroutine
+def write_uint64(loan_key: ap.Bytes, offset: ap.UInt64, value: ap.UInt64) -> None:
+    op.Box.replace(loan_record_key(loan_key), offset, op.itob(value))
+
+
+@ap.subroutine
+def read_uint8(loan_key: ap.Bytes, offset: ap.UInt64) -> ap.UInt64:
+    return op.btoi(op.Box.extract(loan_record_key(loan_key), offset, 1))
+
+
+@ap.subroutine
+def write_uint8(loan_key: ap.Bytes, offset: ap.UInt64, value: ap.UInt64) -> None:
+    op.Box.replace(loan_record_key(loan_key), offset, a4.UInt8(value).bytes)
+
+
+@ap.subroutine
+def read_flag(loan_key: ap.Bytes, bit: ap.UInt64) -> bool:
+    flags = op.Box.extract(loan_record_key(loan_key), PAID_FLAGS, 1)
+    return op.getbit(flags, bit) == 1
+
+
+@ap.subroutine
+def write_flag(loan_key: ap.Bytes, bit: ap.UInt64, value: bool) -> None:  # noqa: FBT001
+    record_key = loan_record_key(loan_key)
+    flags = op.Box.extract(record_key, PAID_FLAGS, 1)
+    op.Box.replace(
+        record_key,
+        PAID_FLAGS,
+        op.setbit_bytes(flags, bit, ap.UInt64(1) if value else ap.UInt64(0)),
+    )
+
+
+@ap.subroutine
+def read_loan_counter(offset: ap.UInt64) -> ap.UInt64:
+    _length, exists = op.Box.length(LOAN_COUNTERS_KEY)
+    if not exists:
+        return ap.UInt64(0)
+    return op.btoi(op.Box.extract(LOAN_COUNTERS_KEY, offset, 8))
+
+
+@ap.subroutine
+def write_loan_counter(offset: ap.UInt64, value: ap.UInt64) -> None:
+    _created = op.Box.create(LOAN_COUNTERS_KEY, LOAN_COUNTERS_SIZE)
+    op.Box.replace(LOAN_COUNTERS_KEY, offset, op.itob(value))
+
+
+################################################################
+#####################   Accessors    ###########################
+################################################################
+@ap.subroutine
+def key_counter() -> ap.UInt64:
+    return read_loan_counter(ap.UInt64(KEY_COUNTER))
+
+
+@ap.subroutine
+def set_key_counter(counter: ap.UInt64) -> None:
+    write_loan_counter(ap.UInt64(KEY_COUNTER), counter)
+
+
+@ap.subroutine
+def active_loan_count() -> ap.UInt64:
+    return read_loan_counter(ap.UInt64(ACTIVE_LOAN_COUNT))
+
+
+@ap.subroutine
+def set_active_loan_count(count: ap.UInt64) -> None:
+    write_loan_counter(ap.UInt64(ACTIVE_LOAN_COUNT), count)
+
+
+@ap.subroutine
+def loan_principal_asset_id(loan_key: ap.Bytes) -> ap.UInt64:
+    return read_uint64(loan_key, ap.UInt64(PRINCIPAL_ASSET_ID))
+
+
+@ap.subroutine
+def loan_collateral_asset_id(loan_key: ap.Bytes) -> ap.UInt64:
+    return read_uint64(loan_key, ap.UInt64(COLLATERAL_ASSET_ID))
+
+
+@ap.subroutine
+def loan_interest_asset_amount(loan_key: ap.Bytes) -> ap.UInt64:
+    return read_uint64(loan_key, ap.UInt64(INTEREST_ASSET_AMOUNT))
+
+
+@ap.subroutine
+def loan_principal_asset_amount(loan_key: ap.Bytes) -> ap.UInt64:
+    return read_uint64(loan_key, ap.UInt64(PRINCIPAL_ASSET_AMOUNT))
+
+
+@ap.subroutine
+def loan_collateral_asset_amount(loan_key: ap.Bytes) -> ap.UInt64:
+    return read_uint64(loan_key, ap.UInt64(COLLATERAL_ASSET_AMOUNT))
+
+
+@ap.subroutine
+def set_loan_collateral_asset_amount(loan_key: ap.Bytes, amount: ap.UInt64) -> None:
+    write_uint64(loan_key, ap.UInt64(COLLATERAL_ASSET_AMOUNT), amount)
+
+
+@ap.subroutine
+def loan_payment_rounds(loan_key: ap.Bytes) -> ap.UInt64:
+    return read_uint8(loan_key, ap.UInt64(PAYMENT_ROUNDS))
+
+
+@ap.subroutine
+def loan_completed_payment_rounds(loan_key: ap.Bytes) -> ap.UInt64:
+    return read_uint8(loan_key, ap.UInt64(COMPLETED_PAYMENT_ROUNDS))
+
+
+@ap.subroutine
+def set_loan_completed_payment_rounds(loan_key: ap.Bytes, rounds: ap.UInt64) -> None:
+    write_uint8(loan_key, ap.UInt64(COMPLETED_PAYMENT_ROUNDS), rounds)
+
+
+@ap.subroutine
+def loan_payment_completion_timestamp(loan_key: ap.Bytes) -> ap.UInt64:
+    return read_uint64(loan_key, ap.UInt64(PAYMENT_COMPLETION_TIMESTAMP))
+
+
+@ap.subroutine
+def loan_collateral_paid(loan_key: ap.Bytes) -> bool:
+    return read_flag(loan_key, ap.UInt64(COLLATERAL_PAID_BIT))
+
+
+@ap.subroutine
+def loan_principal_paid(loan_key: ap.Bytes) -> bool:
+    return read_flag(loan_key, ap.UInt64(PRINCIPAL_PAID_BIT))
+
+
+@ap.subroutine
+def set_loan_principal_paid(loan_key: ap.Bytes, paid: bool) -> None:  # noqa: FBT001
+    write_flag(loan_key, ap.UInt64(PRINCIPAL_PAID_BIT), paid)
+
+
+@ap.subroutine
+def loan_payment_defaulted(loan_key: ap.Bytes) -> bool:
+    return read_flag(loan_key, ap.UInt64(PAYMENT_DEFAULTED_BIT))
+
+
+@ap.subroutine
+def set_loan_payment_defaulted(
+    loan_key: ap.Bytes, defaulted: bool  # noqa: FBT001
+) -> None:
+    write_flag(loan_key, ap.UInt64(PAYMENT_DEFAULTED_BIT), defaulted)
+
+
+@ap.subroutine
+def loan_borrower(loan_key: ap.Bytes) -> ap.Account:
+    return ap.Account(op.Box.extract(loan_record_key(loan_key), BORROWER, 32))
+
+
+@ap.subroutine
+def loan_active_position(loan_key: ap.Bytes) -> ap.UInt64:
+    return read_uint64(loan_key, ap.UInt64(ACTIVE_LOAN_POSITION))
+
+
+@ap.subroutine
+def set_loan_active_position(loan_key: ap.Bytes, position: ap.UInt64) -> None:
+    write_uint64(loan_key, ap.UInt64(ACTIVE_LOAN_POSITION), position)
+
+
+@ap.subroutine
+def set_loan_nft_asset_ids(
+    loan_key: ap.Bytes, lender_nft: ap.Asset, borrower_nft: ap.Asset
+) -> None:
+    op.Box.replace(
+        loan_record_key(loan_key),
+        LENDER_NFT_ASSET_ID,
+        op.concat(op.itob(lender_nft.id), op.itob(borrower_nft.id)),
+    )
+
+
+@ap.subroutine
+def loan_recipients_key(loan_key: ap.Bytes) -> ap.Bytes:
+    return op.concat(RECIPIENTS_KEY_PREFIX, loan_key)
+
+
+@ap.subroutine
+def loan_recipients(loan_key: ap.Bytes) -> PaymentReciepientArray:
+    [recipients_bytes, exists] = op.Box.get(loan_recipients_key(loan_key))
+    assert exists, "The payment recipients of this loan were not found"
+    return PaymentReciepientArray.from_bytes(recipients_bytes)
+
+
+@ap.subroutine
+def loan_recipient(loan_key: ap.Bytes, index: ap.UInt64) -> PaymentReciepient:
+    """Reads a single payment recipient without decoding the whole array"""
+    recipients_key = loan_recipients_key(loan_key)
+    recipients_length = op.btoi(
+        op.Box.extract(recipients_key, 0, RECIPIENTS_LENGTH_SIZE)
+    )
+    assert index < recipients_length, "The recipient_index is out of range"
+    return PaymentReciepient.from_bytes(
+        op.Box.extract(
+            recipients_key,
+            RECIPIENTS_LENGTH_SIZE + index * RECIPIENT_SIZE,
+            RECIPIENT_SIZE,
+        )
+    )
+
+
+@ap.subroutine
+def put_loan_recipients(loan_key: ap.Bytes, recipients: PaymentReciepientArray) -> None:
+    op.Box.put(loan_recipients_key(loan_key), recipients.bytes)
+
+
+@ap.subroutine
+def delete_loan_boxes(loan_key: ap.Bytes) -> None:
+    op.Box.delete(loan_record_key(loan_key))
+    op.Box.delete(loan_recipients_key(loan_key))
@@ -0,0 +1,73 @@
+# pyright: reportMissingModuleSource=false
+"""
+ARC-28 events logged by ZaibatsuLoan on every loan lifecycle transition.
+
+Keep smart_contracts/helpers/events.py in sync when an event changes, its
+signature is the selector clients match logs on.
+"""
+from algopy import arc4 as a4
+from algopy.arc4 import Address, Bool, Struct, UInt8
+
+from smart_contracts.zaibatsu_loan.types.loan import RecordKey
+
+
+class LoanInitiated(Struct, kw_only=True):
+    loan_key: RecordKey
+    borrower: Address
+    principal_asset_id: a4.UInt64
+    principal_asset_amount: a4.UInt64
+    collateral_asset_id: a4.UInt64
+    collateral_asset_amount: a4.UInt64
+
+
+class LoanCompleted(Struct, kw_only=True):
+    loan_key: RecordKey
+    lender_nft_asset_id: a4.UInt64
+    borrower_nft_asset_id: a4.UInt64
+
+
+class RepaymentRoundInitiated(Struct, kw_only=True):
+    loan_key: RecordKey
+    repayment_key: RecordKey
+    repayment_amount: a4.UInt64
+
+
+class RecipientPaid(Struct, kw_only=True):
+    loan_key: RecordKey
+    recipient_index: a4.UInt64
+    recipient: Address
+    amount: a4.UInt64
+
+
+class RecipientsPaid(Struct, kw_only=True):
+    """
+    Logged once per call that pays several recipients, an app call can only
+    log 32 times. Bit i of paid_recipients is set for payment_recipients[i]
+    """
+
+    loan_key: RecordKey
+    paid_recipients: a4.UInt64
+    percentage_paid: a4.UInt64
+    amount_paid: a4.UInt64
+
+
+class RepaymentClosed(Struct, kw_only=True):
+    repayment_key: RecordKey
+    loan_key: RecordKey
+
+
+class RoundClosed(Struct, kw_only=True):
+    loan_key: RecordKey
+    completed_payment_rounds: UInt8
+    loan_repaid: Bool
+
+
+class LoanDefaulted(Struct, kw_only=True):
+    loan_key: RecordKey
+    repayment_key: RecordKey
+    principal_owed: a4.UInt64
+    collateral_seized: a4.UInt64
+
+
+class LoanDeleted(Struct, kw_only=True):
+    loan_key: RecordKey
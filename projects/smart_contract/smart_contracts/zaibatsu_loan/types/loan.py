@@ -15,13 +15,20 @@ class PaymentReciepient(Struct, kw_only=True):
 
 PaymentReciepientArray: TypeAlias = DynamicArray[PaymentReciepient]
 
+# Loan and repayment keys are itob of an id taken from ZaibatsuLoan.key_counter
+RECORD_KEY_SIZE = 8
+RecordKey: TypeAlias = a4.StaticArray[a4.Byte, Literal[8]]
+RecordKeyArray: TypeAlias = DynamicArray[RecordKey]
+
 
 class PendingLoanRoundPayment(Struct, kw_only=True):
-    repayment_key: String
-    loan_key: String
+    """Stored in an "R" + repayment_key box"""
+
+    loan_key: RecordKey
     repayment_amount: a4.UInt64
     percentage_paid: a4.UInt64
-    recipients: PaymentReciepientArray
+    # Bit i is set once payment_recipients[i] of the loan has been paid
+    paid_recipients: a4.UInt64
 
 
 class ExecuteLoanRepaymentResponse(Struct, kw_only=True):
@@ -29,11 +36,17 @@ class ExecuteLoanRepaymentResponse(Struct, kw_only=True):
     percentage_paid: a4.UInt64
 
 
+class PaymentDefaultResponse(Struct, kw_only=True):
+    repayment_key: RecordKey
+    collateral_seized: a4.UInt64
+
+
 class CleanUpLoanRepaymentResponse(Struct, kw_only=True):
     loan_repayment_complete: Bool
 
 
 class LoanDetails(Struct, kw_only=True):
+    # Only read from legacy boxes, new loan keys are allocated by the contract
     loan_key: String
     loan_type: String  # "P2P" | "DAO" | "ZAIBATSU"
     tenure: UInt8
@@ -54,6 +67,52 @@ class LoanDetails(Struct, kw_only=True):
     borrower_nft_asser_id: a4.UInt64
 
 
+# LoanRecord.loan_type values
+LOAN_TYPE_P2P = 1
+LOAN_TYPE_DAO = 2
+LOAN_TYPE_ZAIBATSU = 3
+
+# Loan statuses returned by ZaibatsuLoan.get_loan_statuses. Fully repaid loans
+# are deleted, so they are reported as not found
+LOAN_STATUS_NOT_FOUND = 0
+LOAN_STATUS_AWAITING_PRINCIPAL = 1
+LOAN_STATUS_ACTIVE = 2
+LOAN_STATUS_OVERDUE = 3
+
+# Bumped whenever the LoanRecord layout changes. Legacy LoanDetails boxes always
+# start with a 0x00 byte (the high byte of the loan_key head offset)
+LOAN_RECORD_VERSION = 1
+
+
+class LoanRecord(Struct, kw_only=True):
+    """
+    Static, fixed size layout a loan is stored as. The box name is "L" + the
+    loan key and the payment recipients live in a separate box.
+    """
+
+    version: UInt8
+    loan_type: UInt8
+    tenure: UInt8
+    payment_rounds: UInt8
+    completed_payment_rounds: UInt8
+    collateral_paid: Bool
+    principal_paid: Bool
+    # Packed into the same byte as the two flags above, so records written
+    # before it was added read as not defaulted
+    payment_defaulted: Bool
+    principal_asset_id: a4.UInt64
+    collateral_asset_id: a4.UInt64
+    interest_asset_amount: a4.UInt64
+    principal_asset_amount: a4.UInt64
+    collateral_asset_amount: a4.UInt64
+    early_payment_penalty_amount: a4.UInt64
+    payment_completion_timestamp: a4.UInt64
+    lender_nft_asser_id: a4.UInt64
+    borrower_nft_asser_id: a4.UInt64
+    borrower: Address
+    active_loan_position: a4.UInt64
+
+
 class CompleteLoanArgs(Struct, kw_only=True):
     loan_unit_name: String
     lender_nft_image_url: String
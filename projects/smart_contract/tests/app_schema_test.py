@@ -0,0 +1,31 @@
+import json
+from pathlib import Path
+
+import pytest
+
+ARTIFACTS = Path(__file__).parent.parent / "smart_contracts" / "artifacts"
+
+# The state schemas the deployed apps were created with. UpdateApplication
+# cannot change them, so an update must fit the new program's state in them
+DEPLOYED_SCHEMAS = {
+    "zaibatsu_base/ZaibatsuBase.arc32.json": {
+        "global": {"num_byte_slices": 2, "num_uints": 0},
+        "local": {"num_byte_slices": 0, "num_uints": 0},
+    },
+    "zaibatsu_loan/ZaibatsuLoan.arc32.json": {
+        "global": {"num_byte_slices": 2, "num_uints": 0},
+        "local": {"num_byte_slices": 0, "num_uints": 0},
+    },
+    "zaibatsu_auth_and_dao/ZaibatsuAuthAndDao.arc32.json": {
+        "global": {"num_byte_slices": 4, "num_uints": 0},
+        "local": {"num_byte_slices": 0, "num_uints": 0},
+    },
+}
+
+
+@pytest.mark.parametrize("app_spec", sorted(DEPLOYED_SCHEMAS))
+def test_state_fits_the_deployed_schema(app_spec: str) -> None:
+    state = json.loads((ARTIFACTS / app_spec).read_text())["state"]
+    for scope, deployed_schema in DEPLOYED_SCHEMAS[app_spec].items():
+        for kind, deployed_limit in deployed_schema.items():
+            assert state[scope][kind] <= deployed_limit, f"{scope} {kind}"
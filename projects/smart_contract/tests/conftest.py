@@ -1,13 +1,19 @@
 from pathlib import Path
+from urllib.error import URLError
 
 import pytest
 from algokit_utils import (
     Account,
+    EnsureBalanceParameters,
+    ensure_funded,
     get_algod_client,
+    get_default_localnet_config,
     get_indexer_client,
+    get_localnet_default_account,
 )
 from algokit_utils.config import config
 from algosdk import mnemonic
+from algosdk.error import AlgodHTTPError
 from algosdk.v2client.algod import AlgodClient
 from algosdk.v2client.indexer import IndexerClient
 from dotenv import load_dotenv
@@ -17,7 +23,7 @@ from smart_contracts.artifacts.zaibatsu_auth_and_dao.client import (
     ZaibatsuAuthAndDaoClient,
 )
 from smart_contracts.artifacts.zaibatsu_loan.client import ZaibatsuLoanClient
-from tests.utils import unwrap_env_var
+from tests.utils import fund_app_account, unwrap_env_var
 
 
 @pytest.fixture(autouse=True, scope="session")
@@ -95,3 +101,47 @@ def zaibatsu_auth_client(
     #     delete_args=Deploy[DeleteArgs](args=DeleteArgs()),
     # )
     return client
+
+
+@pytest.fixture(scope="session")
+def localnet_algod_client() -> AlgodClient:
+    """Skips the tests that deploy their own apps when LocalNet is not running"""
+    client = get_algod_client(get_default_localnet_config("algod"))
+    try:
+        client.status()
+    except (AlgodHTTPError, URLError):
+        pytest.skip("LocalNet is not running, start it with `algokit localnet start`")
+    return client
+
+
+@pytest.fixture(scope="session")
+def localnet_creator(localnet_algod_client: AlgodClient) -> Account:
+    return get_localnet_default_account(localnet_algod_client)
+
+
+@pytest.fixture()
+def localnet_account(localnet_algod_client: AlgodClient) -> Account:
+    account = Account.new_account()
+    ensure_funded(
+        localnet_algod_client,
+        EnsureBalanceParameters(account_to_fund=account, min_spending_balance_micro_algos=10_000_000),
+    )
+    return account
+
+
+@pytest.fixture()
+def localnet_auth_client(localnet_algod_client: AlgodClient, localnet_creator: Account) -> ZaibatsuAuthAndDaoClient:
+    """A new ZaibatsuAuthAndDao app, funded for the boxes it creates"""
+    client = ZaibatsuAuthAndDaoClient(localnet_algod_client, creator=localnet_creator, signer=localnet_creator)
+    client.create_create()
+    fund_app_account(localnet_algod_client, client.app_address)
+    return client
+
+
+@pytest.fixture()
+def localnet_loan_client(localnet_algod_client: AlgodClient, localnet_creator: Account) -> ZaibatsuLoanClient:
+    """A new ZaibatsuLoan app, funded for the boxes it creates"""
+    client = ZaibatsuLoanClient(localnet_algod_client, creator=localnet_creator, signer=localnet_creator)
+    client.create_create()
+    fund_app_account(localnet_algod_client, client.app_address)
+    return client
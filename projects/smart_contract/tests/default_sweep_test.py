@@ -0,0 +1,120 @@
+from algosdk import abi, encoding
+
+from smart_contracts.helpers.default_sweep import (
+    MAX_CALL_LOANS,
+    OverdueLoan,
+    call_references,
+    decode_overdue_loan,
+    group_app_call_count,
+    group_reference_count,
+    pack_payment_defaults,
+)
+from smart_contracts.helpers.loan_codec import (
+    LOAN_RECORD_FIELDS,
+    LOAN_RECORD_VERSION,
+    type_string,
+)
+from smart_contracts.helpers.origination import (
+    MAX_APP_CALL_REFERENCES,
+    MAX_GROUP_SIZE,
+)
+
+LOAN_RECORD_TYPE = abi.ABIType.from_string(type_string(LOAN_RECORD_FIELDS))
+
+NOW = 1_700_000_000
+
+
+def encode_loan_record(
+    payment_rounds: int,
+    completed_payment_rounds: int,
+    completion_timestamp: int,
+    payment_defaulted: bool = False,  # noqa: FBT001, FBT002
+) -> bytes:
+    return bytes(
+        LOAN_RECORD_TYPE.encode(
+            [
+                LOAN_RECORD_VERSION,
+                3,
+                6,
+                payment_rounds,
+                completed_payment_rounds,
+                True,
+                True,
+                payment_defaulted,
+                10458941,
+                67395862,
+                200,
+                500,
+                16000,
+                20,
+                completion_timestamp,
+                0,
+                0,
+                encoding.encode_address(bytes(32)),
+                0,
+            ]
+        )
+    )
+
+
+def test_decode_overdue_loan() -> None:
+    value = encode_loan_record(4, 1, NOW - 1)
+    loan = decode_overdue_loan(b"loan", value, NOW)
+
+    assert loan == OverdueLoan(
+        loan_key=b"loan",
+        principal_asset_id=10458941,
+        collateral_asset_id=67395862,
+        outstanding_rounds=3,
+        payment_completion_timestamp=NOW - 1,
+    )
+
+
+def test_decode_overdue_loan_skips_current_and_repaid_loans() -> None:
+    assert decode_overdue_loan(b"loan", encode_loan_record(4, 1, NOW), NOW) is None
+    assert decode_overdue_loan(b"loan", encode_loan_record(4, 4, NOW - 1), NOW) is None
+    assert decode_overdue_loan(b"Ploan", bytes(42), NOW) is None
+
+
+def test_decode_overdue_loan_skips_defaulted_loans() -> None:
+    value = encode_loan_record(4, 1, NOW - 1, payment_defaulted=True)
+    assert decode_overdue_loan(b"loan", value, NOW) is None
+
+
+def test_pack_payment_defaults_respects_limits() -> None:
+    loans = [OverdueLoan(bytes([i]) * 8, 1 + i % 2, 3, 1, NOW - i) for i in range(100)]
+    groups = pack_payment_defaults(loans)
+
+    packed = [loan for calls in groups for call in calls for loan in call]
+    assert sorted(loan.loan_key for loan in packed) == sorted(
+        loan.loan_key for loan in loans
+    )
+    for calls in groups:
+        assert group_app_call_count(calls) <= MAX_GROUP_SIZE
+        assert group_reference_count(calls) <= (
+            MAX_APP_CALL_REFERENCES * group_app_call_count(calls)
+        )
+        for call in calls:
+            assert 0 < len(call) <= MAX_CALL_LOANS
+
+
+def test_pack_payment_defaults_shares_references_across_the_group() -> None:
+    loans = [OverdueLoan(bytes([i]) * 8, 1, 2, 1, NOW - i) for i in range(12)]
+    groups = pack_payment_defaults(loans)
+
+    # The 31 references of 12 loans are carried by 3 padding calls, so all
+    # the loans land in one handle_payment_defaults call
+    assert [[len(call) for call in calls] for calls in groups] == [[12]]
+    assert group_app_call_count(groups[0]) == 4
+
+
+def test_call_references_spreads_every_reference() -> None:
+    boxes = [(7, bytes([i])) for i in range(12)]
+    references = call_references(99, [1, 2], boxes, app_calls=2)
+
+    assert [reference.foreign_apps for reference in references] == [[99], None]
+    assert [reference.foreign_assets for reference in references] == [[1, 2], []]
+    assert [list(reference.boxes or []) for reference in references] == [
+        boxes[:5],
+        boxes[5:13],
+    ]
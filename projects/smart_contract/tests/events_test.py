@@ -0,0 +1,65 @@
+import base64
+
+from algosdk import encoding
+
+from smart_contracts.helpers.events import (
+    EVENT_SPECS,
+    EVENT_SPECS_BY_SELECTOR,
+    Event,
+    decode_event,
+    decode_events,
+)
+
+LOAN_KEY = (7).to_bytes(8, "big")
+REPAYMENT_KEY = (8).to_bytes(8, "big")
+BORROWER = encoding.encode_address(bytes(range(32)))
+
+
+def encode_event(name: str, values: list) -> bytes:
+    spec = next(spec for spec in EVENT_SPECS if spec.name == name)
+    return spec.selector + spec.abi_type.encode(values)
+
+
+def test_event_selectors() -> None:
+    # ARC-28 selectors hash the signature without a return type, unlike methods
+    assert len(EVENT_SPECS_BY_SELECTOR) == len(EVENT_SPECS)
+    selectors = {spec.signature: spec.selector.hex() for spec in EVENT_SPECS}
+    assert selectors["LoanDeleted(byte[8])"] == "87777b39"
+    assert selectors["PoolFunded(uint64,address,uint64)"] == "a7720d50"
+
+
+def test_decode_event() -> None:
+    log = encode_event(
+        "LoanDefaulted", [list(LOAN_KEY), list(REPAYMENT_KEY), 350, 1200]
+    )
+
+    assert decode_event(log) == Event(
+        name="LoanDefaulted",
+        fields={
+            "loan_key": LOAN_KEY,
+            "repayment_key": REPAYMENT_KEY,
+            "principal_owed": 350,
+            "collateral_seized": 1200,
+        },
+    )
+
+
+def test_decode_events_skips_other_logs() -> None:
+    abi_return = bytes.fromhex("151f7c75") + (1).to_bytes(8, "big")
+    logs = [
+        base64.b64encode(
+            encode_event("LoanInitiated", [list(LOAN_KEY), BORROWER, 1, 500, 2, 16000])
+        ).decode(),
+        encode_event("RoundClosed", [list(LOAN_KEY), 2, True]),
+        base64.b64encode(abi_return).decode(),
+    ]
+
+    events = decode_events(logs)
+
+    assert [event.name for event in events] == ["LoanInitiated", "RoundClosed"]
+    assert events[0].fields["borrower"] == BORROWER
+    assert events[1].fields == {
+        "loan_key": LOAN_KEY,
+        "completed_payment_rounds": 2,
+        "loan_repaid": True,
+    }
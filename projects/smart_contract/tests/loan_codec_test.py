@@ -0,0 +1,120 @@
+import json
+from pathlib import Path
+
+from algosdk import abi, encoding
+
+from smart_contracts.helpers.loan_codec import (
+    ACTIVE_LOAN_POSITION_OFFSET,
+    BORROWER_OFFSET,
+    LOAN_DETAILS,
+    LOAN_DETAILS_FIELDS,
+    LOAN_RECORD,
+    LOAN_RECORD_FIELDS,
+    PAYMENT_RECIEPIENT,
+    PAYMENT_RECIEPIENT_FIELDS,
+    PENDING_LOAN_ROUND_PAYMENT,
+    RECIPIENTS_TYPE,
+    RecipientsView,
+    StructCodec,
+    type_string,
+)
+
+APP_SPEC = json.loads(
+    (
+        Path(__file__).parent.parent
+        / "smart_contracts"
+        / "artifacts"
+        / "zaibatsu_loan"
+        / "ZaibatsuLoan.arc32.json"
+    ).read_text()
+)
+BORROWER = encoding.encode_address(bytes(range(32)))
+RECIPIENTS = [
+    [100 - 3 * index, encoding.encode_address(bytes([index]) * 32)]
+    for index in range(12)
+]
+LOAN_DETAILS_VALUES = [
+    *("legacy-loan", "ZAIBATSU", 6, 10458941, 67395862, 2**64 - 1, 10000, 16000),
+    *(50, 6, 1718000000, RECIPIENTS, False, True, 2, BORROWER, 700001, 0),
+]
+
+
+def abi_type(codec: StructCodec) -> abi.ABIType:
+    return abi.ABIType.from_string(type_string(codec.fields))
+
+
+def arc32_struct_fields(name: str) -> tuple[tuple[str, str], ...]:
+    for hints in APP_SPEC["hints"].values():
+        for struct_hint in hints.get("structs", {}).values():
+            if struct_hint["name"] == name:
+                return tuple(tuple(element) for element in struct_hint["elements"])
+    raise KeyError(name)
+
+
+def test_layouts_match_the_app_spec() -> None:
+    assert arc32_struct_fields("LoanDetails") == LOAN_DETAILS_FIELDS
+    assert arc32_struct_fields("LoanRecord") == LOAN_RECORD_FIELDS
+    assert RECIPIENTS_TYPE == f"{type_string(PAYMENT_RECIEPIENT_FIELDS)}[]"
+
+
+def test_loan_record_matches_the_generic_decoder() -> None:
+    values = [1, 2, 6, 6, 3, True, False, True, 10458941, 67395862, 200, 10000]
+    values += [16000, 50, 1718000000, 700001, 700002, BORROWER, 2**64 - 1]
+    encoded = abi_type(LOAN_RECORD).encode(values)
+
+    assert len(encoded) == LOAN_RECORD.head.size
+    assert list(LOAN_RECORD.decode(encoded)) == abi_type(LOAN_RECORD).decode(encoded)
+    assert list(LOAN_RECORD.decode(memoryview(encoded))) == values
+
+
+def test_loan_record_offsets() -> None:
+    values = [1, 2, 6, 6, 3, True, False, True, 10458941, 67395862, 200, 10000]
+    values += [16000, 50, 1718000000, 700001, 700002, BORROWER, 2**64 - 1]
+    encoded = abi_type(LOAN_RECORD).encode(values)
+
+    assert (BORROWER_OFFSET, ACTIVE_LOAN_POSITION_OFFSET) == (78, 110)
+    borrower = encoded[BORROWER_OFFSET : BORROWER_OFFSET + 32]
+    assert encoding.encode_address(borrower) == BORROWER
+    position = encoded[ACTIVE_LOAN_POSITION_OFFSET : ACTIVE_LOAN_POSITION_OFFSET + 8]
+    assert int.from_bytes(position, "big") == 2**64 - 1
+    assert LOAN_RECORD.offsets["payment_defaulted"] == 5
+    assert LOAN_RECORD.offsets["principal_asset_id"] == 6
+
+
+def test_pending_loan_round_payment_matches_the_generic_decoder() -> None:
+    loan_key = (7).to_bytes(8, "big")
+    encoded = abi_type(PENDING_LOAN_ROUND_PAYMENT).encode([list(loan_key), 350, 70, 5])
+
+    [generic_key, *generic_values] = abi_type(PENDING_LOAN_ROUND_PAYMENT).decode(
+        encoded
+    )
+    assert PENDING_LOAN_ROUND_PAYMENT.decode(encoded) == (
+        bytes(generic_key),
+        *generic_values,
+    )
+
+
+def test_loan_details_matches_the_generic_decoder() -> None:
+    encoded = abi_type(LOAN_DETAILS).encode(LOAN_DETAILS_VALUES)
+
+    decoded = list(LOAN_DETAILS.decode(encoded))
+    recipients_index = LOAN_DETAILS.names.index("payment_recipients")
+    recipients = decoded[recipients_index]
+    decoded[recipients_index] = [list(recipient) for recipient in recipients]
+    assert decoded == abi_type(LOAN_DETAILS).decode(encoded)
+    assert isinstance(recipients, RecipientsView)
+    assert recipients.view.obj is encoded
+
+
+def test_recipients_view_reads_in_place() -> None:
+    encoded = abi.ABIType.from_string(RECIPIENTS_TYPE).encode(RECIPIENTS)
+    recipients = RecipientsView(encoded)
+
+    assert len(recipients) == len(RECIPIENTS)
+    assert [list(recipient) for recipient in recipients] == RECIPIENTS
+    assert list(recipients[5]) == RECIPIENTS[5]
+    assert recipients.payment_percentage(11) == RECIPIENTS[11][0]
+    address = recipients.recipient_address(3)
+    assert address.obj is encoded
+    assert bytes(address) == encoding.decode_address(RECIPIENTS[3][1])
+    assert list(PAYMENT_RECIEPIENT.decode(encoded[2 + 40 * 3 :])) == RECIPIENTS[3]
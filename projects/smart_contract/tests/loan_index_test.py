@@ -0,0 +1,94 @@
+import base64
+import random
+from unittest.mock import Mock
+
+from algosdk import encoding
+from algosdk.error import AlgodHTTPError
+
+from smart_contracts.helpers.loan_index import (
+    ACTIVE_LOANS_PER_PAGE,
+    RECORD_KEY_SIZE,
+    active_loan_keys,
+    active_loans_page_box_name,
+    borrower_box_name,
+    borrower_loan_keys,
+    decode_loan_key_slots,
+    loan_box_name,
+    loan_removal_box_names,
+    next_record_keys,
+    record_key,
+)
+
+BORROWER = bytes(range(32))
+
+
+def encode_loan_key_slots(loan_keys: list[bytes]) -> bytes:
+    return b"".join(loan_keys)
+
+
+def mock_algod(loan_keys: list[bytes]) -> Mock:
+    """An algod client serving the index boxes and loan records of the keys"""
+    boxes = {b"B" + BORROWER: encode_loan_key_slots(loan_keys)}
+    for position, loan_key in enumerate(loan_keys):
+        record = bytes(78) + BORROWER + position.to_bytes(8, "big")
+        boxes[loan_box_name(loan_key)] = record
+    for start in range(0, len(loan_keys), ACTIVE_LOANS_PER_PAGE):
+        page = encode_loan_key_slots(loan_keys[start : start + ACTIVE_LOANS_PER_PAGE])
+        boxes[active_loans_page_box_name(start)] = page.ljust(1024, b"\0")
+
+    def application_box_by_name(_app_id: int, name: bytes) -> dict:
+        if name not in boxes:
+            raise AlgodHTTPError("box not found", 404)
+        return {"value": base64.b64encode(boxes[name]).decode()}
+
+    return Mock(application_box_by_name=application_box_by_name)
+
+
+def test_decode_loan_key_slots() -> None:
+    loan_keys = [record_key(1), record_key(2**40), bytes(range(1, 9))]
+    encoded = encode_loan_key_slots(loan_keys) + bytes(RECORD_KEY_SIZE)
+    assert decode_loan_key_slots(encoded) == loan_keys
+
+
+def test_next_record_keys() -> None:
+    assert next_record_keys(41, 2) == [record_key(42), record_key(43)]
+    assert record_key(42) == (42).to_bytes(8, "big")
+
+
+def test_active_loan_keys_pages_through_the_index() -> None:
+    loan_keys = next_record_keys(0, 300)
+    algod_client = mock_algod(loan_keys)
+
+    assert list(active_loan_keys(algod_client, 1, len(loan_keys))) == loan_keys
+
+
+def test_borrower_loan_keys() -> None:
+    loan_keys = next_record_keys(0, 5)
+    algod_client = mock_algod(loan_keys)
+    borrower = encoding.encode_address(BORROWER)
+
+    assert borrower_box_name(borrower) == b"B" + BORROWER
+    assert borrower_loan_keys(algod_client, 1, borrower) == loan_keys
+    assert borrower_loan_keys(algod_client, 1, encoding.encode_address(bytes(32))) == []
+
+
+def test_loan_removal_box_names_follows_swap_removal() -> None:
+    loan_keys = next_record_keys(0, 300)
+    algod_client = mock_algod(loan_keys)
+    removed = random.Random(7).sample(loan_keys, 40)
+
+    box_names = loan_removal_box_names(algod_client, 1, len(loan_keys), removed)
+
+    index = list(loan_keys)
+    expected = {b"B" + BORROWER}
+    for loan_key in removed:
+        position = index.index(loan_key)
+        expected |= {
+            active_loans_page_box_name(position),
+            active_loans_page_box_name(len(index) - 1),
+        }
+        if position != len(index) - 1:
+            expected.add(loan_box_name(index[-1]))
+        index[position] = index[-1]
+        index.pop()
+    assert set(box_names) == expected
@@ -0,0 +1,147 @@
+import base64
+import json
+from pathlib import Path
+from unittest.mock import Mock
+
+from algosdk import encoding
+
+from smart_contracts.helpers.events import Event
+from smart_contracts.loan_indexer.follower import BlockFollower
+from smart_contracts.loan_indexer.store import (
+    LOAN_ACTIVE,
+    LOAN_DEFAULTED,
+    REPAYMENT_CLOSED,
+    REPAYMENT_DEFAULT,
+    REPAYMENT_PENDING,
+    REPAYMENT_ROUND,
+    LoanStateStore,
+)
+
+# Blocks 40000000-40000004 in algod's msgpack block format, holding the logs of
+# a loan app, a DAO app and an unrelated app that calls the loan app
+FIXTURE = json.loads(
+    (Path(__file__).parent / "fixtures" / "loan_indexer_blocks.json").read_text()
+)
+FIRST_ROUND = 40000000
+BORROWER = encoding.encode_address(bytes(range(32)))
+DEPOSITOR = encoding.encode_address(bytes(range(32, 64)))
+USDC = 10458941
+LOAN_KEY = (1).to_bytes(8, "big")
+LOAN_APP_ID = FIXTURE["loan_app_id"]
+DAO_APP_ID = FIXTURE["dao_app_id"]
+
+
+def mock_algod() -> Mock:
+    """An algod client serving the fixture blocks and recording the rounds read"""
+
+    def block_info(round_num: int, response_format: str) -> bytes:
+        assert response_format == "msgpack"
+        return base64.b64decode(FIXTURE["blocks"][str(round_num)])
+
+    return Mock(block_info=Mock(side_effect=block_info))
+
+
+def follower(
+    store: LoanStateStore,
+    algod_client: Mock,
+    app_ids: tuple[int, ...] = (LOAN_APP_ID, DAO_APP_ID),
+) -> BlockFollower:
+    return BlockFollower(algod_client, store, app_ids)
+
+
+def loan_initiated(loan_key: bytes, principal_asset_amount: int) -> Event:
+    return Event(
+        name="LoanInitiated",
+        fields={
+            "loan_key": loan_key,
+            "borrower": BORROWER,
+            "principal_asset_id": USDC,
+            "principal_asset_amount": principal_asset_amount,
+            "collateral_asset_id": USDC,
+            "collateral_asset_amount": 16000,
+        },
+    )
+
+
+def test_sync_materializes_loans_repayments_and_pool(tmp_path: Path) -> None:
+    store = LoanStateStore(tmp_path / "loans.sqlite")
+
+    assert follower(store, mock_algod()).sync(FIRST_ROUND, FIRST_ROUND + 2) == (
+        FIRST_ROUND + 2
+    )
+
+    loan = store.loan(LOAN_APP_ID, LOAN_KEY)
+    assert loan["borrower"] == BORROWER
+    assert loan["status"] == LOAN_ACTIVE
+    assert loan["lender_nft_asset_id"] == 700001
+    assert loan["amount_repaid"] == 350
+    assert [
+        loan["loan_key"] for loan in store.borrower_loans(LOAN_APP_ID, BORROWER)
+    ] == [LOAN_KEY]
+    [repayment] = store.loan_repayments(LOAN_APP_ID, LOAN_KEY)
+    assert (repayment["kind"], repayment["status"]) == (
+        REPAYMENT_ROUND,
+        REPAYMENT_PENDING,
+    )
+    assert store.pool_balance(DAO_APP_ID, USDC)["amount"] == 2000
+    assert store.pool_deposit(DAO_APP_ID, USDC, DEPOSITOR) == 2000
+    assert store.pool_balance(LOAN_APP_ID, USDC) is None
+
+
+def test_sync_resumes_from_checkpoint(tmp_path: Path) -> None:
+    path = tmp_path / "loans.sqlite"
+    store = LoanStateStore(path)
+    follower(store, mock_algod()).sync(FIRST_ROUND, FIRST_ROUND + 2)
+    store.close()
+
+    store = LoanStateStore(path)
+    algod_client = mock_algod()
+    follower(store, algod_client).sync(FIRST_ROUND, FIRST_ROUND + 4)
+
+    rounds = [call.kwargs["round_num"] for call in algod_client.block_info.mock_calls]
+    assert rounds == [FIRST_ROUND + 3, FIRST_ROUND + 4]
+    assert store.checkpoint([LOAN_APP_ID, DAO_APP_ID]) == FIRST_ROUND + 4
+
+    loan = store.loan(LOAN_APP_ID, LOAN_KEY)
+    assert loan["status"] == LOAN_DEFAULTED
+    assert loan["completed_payment_rounds"] == 1
+    assert loan["collateral_asset_amount"] == 16000 - 700
+    repayments = store.loan_repayments(LOAN_APP_ID, LOAN_KEY)
+    assert [(r["kind"], r["status"]) for r in repayments] == [
+        (REPAYMENT_ROUND, REPAYMENT_CLOSED),
+        (REPAYMENT_DEFAULT, REPAYMENT_PENDING),
+    ]
+    pool_balance = store.pool_balance(DAO_APP_ID, USDC)
+    assert (pool_balance["amount"], pool_balance["depositors"]) == (2500, 1)
+    assert tuple(store.vote_tally(DAO_APP_ID, 1)) == (DAO_APP_ID, 1, 1000, 0, 1)
+
+
+def test_apps_with_the_same_loan_keys_are_kept_apart() -> None:
+    store = LoanStateStore()
+    other_app_id = LOAN_APP_ID + 100
+
+    store.apply_block(
+        FIRST_ROUND,
+        [LOAN_APP_ID, other_app_id],
+        [
+            (LOAN_APP_ID, loan_initiated(LOAN_KEY, 500)),
+            (other_app_id, loan_initiated(LOAN_KEY, 900)),
+        ],
+    )
+
+    assert store.loan(LOAN_APP_ID, LOAN_KEY)["principal_asset_amount"] == 500
+    assert store.loan(other_app_id, LOAN_KEY)["principal_asset_amount"] == 900
+    assert len(store.borrower_loans(other_app_id, BORROWER)) == 1
+
+
+def test_an_app_added_later_does_not_reapply_synced_blocks() -> None:
+    store = LoanStateStore()
+    follower(store, mock_algod(), (LOAN_APP_ID,)).sync(FIRST_ROUND, FIRST_ROUND + 2)
+
+    # The DAO app is synced from the first round without replaying the loan app
+    assert follower(store, mock_algod()).sync(FIRST_ROUND, FIRST_ROUND + 2) == (
+        FIRST_ROUND + 2
+    )
+
+    assert store.loan(LOAN_APP_ID, LOAN_KEY)["amount_repaid"] == 350
+    assert store.pool_deposit(DAO_APP_ID, USDC, DEPOSITOR) == 2000
@@ -0,0 +1,209 @@
+import base64
+import json
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest.mock import Mock
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from algosdk import abi, encoding
+
+from smart_contracts.helpers.loan_codec import (
+    LOAN_DETAILS_FIELDS,
+    LOAN_RECORD_FIELDS,
+    PENDING_LOAN_ROUND_PAYMENT_FIELDS,
+    RECIPIENTS_TYPE,
+    type_string,
+)
+from smart_contracts.helpers.loan_index import (
+    ADMIN_KEY_PREFIX,
+    PRICE_KEY_PREFIX,
+    active_loans_page_box_name,
+    loan_box_name,
+    next_record_keys,
+    recipients_box_name,
+    repayment_box_name,
+)
+from smart_contracts.loan_snapshot.loader import (
+    decode_boxes,
+    fetch_boxes,
+    list_box_names,
+    read_snapshot,
+    snapshot_app,
+)
+
+APP_ID = 1234
+BORROWER = encoding.encode_address(bytes(range(32)))
+RECIPIENT = encoding.encode_address(bytes(range(32, 64)))
+LOANS = 300
+LOAN_RECORD_TYPE = abi.ABIType.from_string(type_string(LOAN_RECORD_FIELDS))
+PENDING_LOAN_ROUND_PAYMENT_TYPE = abi.ABIType.from_string(
+    type_string(PENDING_LOAN_ROUND_PAYMENT_FIELDS)
+)
+RECIPIENTS_ABI_TYPE = abi.ABIType.from_string(RECIPIENTS_TYPE)
+LOAN_DETAILS_TYPE = abi.ABIType.from_string(type_string(LOAN_DETAILS_FIELDS))
+
+
+def loan_record(position: int) -> list:
+    return [
+        *(1, 1, 3, 3, 1, True, True, False, 10458941, 67395862),
+        *(200, 10000 + position, 16000, 50, 1718000000, 700001, 700002),
+        *(BORROWER, position),
+    ]
+
+
+def app_boxes() -> dict[bytes, bytes]:
+    loan_keys = next_record_keys(0, LOANS)
+    boxes = {active_loans_page_box_name(0): b"".join(loan_keys[:128])}
+    for position, loan_key in enumerate(loan_keys):
+        boxes[loan_box_name(loan_key)] = LOAN_RECORD_TYPE.encode(loan_record(position))
+        boxes[recipients_box_name(loan_key)] = RECIPIENTS_ABI_TYPE.encode(
+            [[70, RECIPIENT], [30, BORROWER]]
+        )
+    [repayment_key] = next_record_keys(LOANS, 1)
+    boxes[repayment_box_name(repayment_key)] = PENDING_LOAN_ROUND_PAYMENT_TYPE.encode(
+        [list(loan_keys[0]), 3500, 70, 1]
+    )
+    boxes[b"legacy-loan"] = LOAN_DETAILS_TYPE.encode(
+        [
+            *("legacy-loan", "P2P", 3, 10458941, 67395862, 200, 10000, 16000, 50, 3),
+            *(1718000000, [[100, RECIPIENT]], True, False, 0, BORROWER, 0, 0),
+        ]
+    )
+    # A cached price, (price, timestamp), and an admin of the base contract
+    price = (1_000_000).to_bytes(8, "big") + (1718000000).to_bytes(8, "big")
+    boxes[PRICE_KEY_PREFIX + (67395862).to_bytes(8, "big")] = price
+    boxes[ADMIN_KEY_PREFIX + encoding.decode_address(BORROWER)] = b"\x80"
+    return boxes
+
+
+@pytest.fixture()
+def algod_boxes() -> Iterator[tuple[Mock, dict[bytes, bytes], set]]:
+    """
+    An algod client pointed at a local server serving the box endpoint, with
+    the boxes it serves and the client ports it was connected from
+    """
+    boxes = app_boxes()
+    client_ports: set[int] = set()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self) -> None:  # noqa: N802
+            client_ports.add(self.client_address[1])
+            url = urlsplit(self.path)
+            assert url.path == f"/v2/applications/{APP_ID}/box"
+            assert self.headers["X-Algo-API-Token"] == "token"
+            name = base64.b64decode(parse_qs(url.query)["name"][0].removeprefix("b64:"))
+            if name in boxes:
+                status = 200
+                body = {"name": "", "round": 1, "value": base64.b64encode(boxes[name])}
+            else:
+                status, body = 404, {"message": "box not found"}
+            encoded = json.dumps(body, default=bytes.decode).encode()
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(encoded)))
+            self.end_headers()
+            self.wfile.write(encoded)
+
+        def log_message(self, *_args: object) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    algod_client = Mock(
+        algod_address=f"http://127.0.0.1:{server.server_port}",
+        algod_token="token",
+        headers=None,
+    )
+    yield algod_client, boxes, client_ports
+    server.shutdown()
+    server.server_close()
+
+
+def mock_indexer(names: list[bytes], page_size: int) -> Mock:
+    """An indexer client listing the box names page_size names at a time"""
+
+    def application_boxes(
+        _app_id: int, limit: int, next_page: str | None = None
+    ) -> dict:
+        start = int(next_page or 0)
+        page = names[start : start + page_size]
+        boxes = [{"name": base64.b64encode(name).decode()} for name in page]
+        response: dict = {"boxes": boxes}
+        if start + page_size < len(names):
+            response["next-token"] = str(start + page_size)
+        return response
+
+    return Mock(application_boxes=Mock(side_effect=application_boxes))
+
+
+def test_list_box_names_pages_through_the_indexer() -> None:
+    names = [loan_box_name(key) for key in next_record_keys(0, 25)]
+    indexer_client = mock_indexer(names, page_size=10)
+
+    assert list(list_box_names(indexer_client, APP_ID)) == names
+    assert indexer_client.application_boxes.call_count == 3
+
+
+def test_fetch_boxes_reuses_a_bounded_set_of_connections(algod_boxes: tuple) -> None:
+    algod_client, boxes, client_ports = algod_boxes
+    deleted = loan_box_name(next_record_keys(LOANS, 1)[0])
+
+    values = fetch_boxes(algod_client, APP_ID, [*boxes, deleted], max_workers=4)
+
+    assert values == boxes
+    assert len(client_ports) <= 4
+
+
+def test_decode_boxes() -> None:
+    tables = decode_boxes(app_boxes())
+
+    loans = tables["loans"]
+    assert loans["loan_key"][:2] == ["0000000000000001", "0000000000000002"]
+    assert loans["principal_asset_amount"][1] == 10001
+    assert loans["borrower"] == [BORROWER] * LOANS
+    assert loans["active_loan_position"] == list(range(LOANS))
+    assert tables["repayments"] == {
+        "repayment_key": [f"{LOANS + 1:016x}"],
+        "loan_key": ["0000000000000001"],
+        "repayment_amount": [3500],
+        "percentage_paid": [70],
+        "paid_recipients": [1],
+    }
+    assert tables["legacy_loans"]["box_name"] == [b"legacy-loan".hex()]
+    assert tables["legacy_loans"]["collateral_paid"] == [True]
+    recipients = tables["recipients"]
+    assert len(recipients["loan_key"]) == 2 * LOANS + 1
+    assert recipients["recipient_address"][-1] == RECIPIENT
+    assert recipients["recipient_index"][:2] == [0, 1]
+
+
+def test_decode_boxes_skips_unknown_boxes(caplog: pytest.LogCaptureFixture) -> None:
+    boxes = app_boxes()
+    # An unknown box whose value starts with a 0x00 byte, like a LoanDetails
+    boxes[b"unknown"] = bytes(16)
+
+    assert decode_boxes(boxes) == decode_boxes(app_boxes())
+    assert "Skipped 1 boxes of an unknown layout" in caplog.text
+
+
+def test_snapshot_app(algod_boxes: tuple, tmp_path: Path) -> None:
+    algod_client, boxes, _client_ports = algod_boxes
+    indexer_client = mock_indexer(list(boxes), page_size=100)
+    path = tmp_path / "loans.json.gz"
+
+    rows = snapshot_app(algod_client, indexer_client, APP_ID, path, max_workers=8)
+
+    assert rows == {
+        "loans": LOANS,
+        "recipients": 2 * LOANS + 1,
+        "repayments": 1,
+        "legacy_loans": 1,
+    }
+    snapshot = read_snapshot(path)
+    assert snapshot["app_id"] == APP_ID
+    assert snapshot["tables"] == decode_boxes(boxes)
@@ -0,0 +1,80 @@
+from unittest.mock import Mock
+
+from algosdk import encoding
+
+from smart_contracts.artifacts.zaibatsu_loan.client import LoanDetails
+from smart_contracts.helpers.origination import (
+    MAX_APP_ARGS_SIZE,
+    MAX_APP_CALL_REFERENCES,
+    MAX_GROUP_SIZE,
+    LoanOrigination,
+    call_args_size,
+    group_app_call_count,
+    group_reference_count,
+    group_transaction_count,
+    pack_loan_originations,
+)
+
+BORROWER = encoding.encode_address(bytes(range(32)))
+
+
+def make_origination(collateral_asset_id: int) -> LoanOrigination:
+    loan_details = LoanDetails(
+        loan_key="",
+        loan_type="P2P",
+        tenure=6,
+        principal_asset_id=10458941,
+        collateral_asset_id=collateral_asset_id,
+        interest_asset_amount=200,
+        principal_asset_amount=500,
+        collateral_asset_amount=16000,
+        early_payment_penalty_amount=20,
+        payment_rounds=2,
+        payment_completion_timestamp=1718000000,
+        payment_recipients=[(100, BORROWER)],
+        collateral_paid=False,
+        principal_paid=False,
+        completed_payment_rounds=0,
+        borrower=BORROWER,
+        lender_nft_asser_id=0,
+        borrower_nft_asser_id=0,
+    )
+    return LoanOrigination(loan_details=loan_details, collateral_txn=Mock())
+
+
+def test_pack_loan_originations_respects_limits() -> None:
+    loans = [make_origination(100 + i % 2) for i in range(40)]
+    groups = pack_loan_originations(loans)
+
+    packed = [loan for calls in groups for call in calls for loan in call]
+    assert sorted(map(id, packed)) == sorted(map(id, loans))
+    for calls in groups:
+        assert group_transaction_count(calls) <= MAX_GROUP_SIZE
+        assert group_reference_count(calls) <= (
+            MAX_APP_CALL_REFERENCES * group_app_call_count(calls)
+        )
+        for call in calls:
+            assert call
+            assert call_args_size(call) <= MAX_APP_ARGS_SIZE
+
+
+def test_pack_loan_originations_shares_references_across_the_group() -> None:
+    loans = [make_origination(100) for _loan in range(12)]
+    groups = pack_loan_originations(loans)
+
+    # The 29 references of 12 loans are carried by 3 padding calls, so all
+    # the loans land in one initiate_loan_purchases call
+    assert [[len(call) for call in calls] for calls in groups] == [[12]]
+    assert group_app_call_count(groups[0]) == 4
+    assert group_transaction_count(groups[0]) == MAX_GROUP_SIZE
+
+
+def test_pack_loan_originations_sorts_by_collateral_asset() -> None:
+    loans = [make_origination(100 + i % 2) for i in range(6)]
+    groups = pack_loan_originations(loans)
+
+    # Consecutive loans with the same collateral asset share one price lookup
+    for calls in groups:
+        for call in calls:
+            assets = [loan.loan_details.collateral_asset_id for loan in call]
+            assert assets == sorted(assets)
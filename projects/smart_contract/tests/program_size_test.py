@@ -0,0 +1,62 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from smart_contracts.helpers.program_size import (
+    extra_program_pages,
+    line_tokens,
+    teal_program_size,
+)
+
+# TEAL assembled by algod, with the pc to line source maps it returned
+ALGOD_SOURCES = Path(__file__).parent.parent / ".algokit" / "sources"
+
+
+def source_map_program_size(source_map_path: Path) -> int:
+    """A tok.map has one generated line per byte of the assembled program"""
+    mappings: str = json.loads(source_map_path.read_text())["mappings"]
+    return mappings.count(";") + 1
+
+
+@pytest.mark.parametrize(
+    "teal_path",
+    sorted(ALGOD_SOURCES.glob("*/*.teal")),
+    ids=lambda path: path.parent.name + "/" + path.name,
+)
+def test_teal_program_size_matches_algod(teal_path: Path) -> None:
+    source_map_path = teal_path.with_name(f"{teal_path.name}.tok.map")
+    assert teal_program_size(teal_path.read_text()) == source_map_program_size(
+        source_map_path
+    )
+
+
+def test_teal_program_size_constant_blocks() -> None:
+    teal = "\n".join(
+        [
+            "#pragma version 10",
+            "main:",
+            "    int 1 // intc_0",
+            "    int 1",
+            "    int 300 // pushint 300",
+            '    byte "a // b" // bytec_0',
+            "    byte 0x61202f2f2062",
+            '    method "create()void"',
+            "    return",
+        ]
+    )
+    # version, intcblock 1, 2 x intc_0, pushint 300, bytecblock "a // b",
+    # 2 x bytec_0, pushbytes selector, return
+    assert teal_program_size(teal) == 1 + 3 + 2 + 3 + 9 + 2 + 6 + 1
+
+
+def test_line_tokens() -> None:
+    assert line_tokens('    byte "a \\" // b" // comment') == ["byte", '"a \\" // b"']
+    assert line_tokens("    extract 2 8") == ["extract", "2", "8"]
+    assert line_tokens("    // comment") == []
+
+
+def test_extra_program_pages() -> None:
+    assert extra_program_pages(2044, 4) == 0
+    assert extra_program_pages(2045, 4) == 1
+    assert extra_program_pages(5545, 4) == 2
@@ -1,8 +1,67 @@
 import base64
 import math
 
+from algokit_utils import Account, EnsureBalanceParameters, ensure_funded
+from algosdk import transaction
+from algosdk.logic import get_application_address
+from algosdk.v2client.algod import AlgodClient
 from decouple import config
 
+# A stand in for an app deployed before an upgrade. The creator can write any
+# global key with [key, value] app args, create a box with
+# [b"create", name, size] and write to it with [b"replace", name, offset,
+# bytes], and can update it to the current program
+LEGACY_APPROVAL_PROGRAM = """#pragma version 10
+    txn ApplicationID
+    bz approve
+    txn Sender
+    global CreatorAddress
+    ==
+    assert
+    txn OnCompletion
+    int UpdateApplication
+    ==
+    bnz approve
+    txn NumAppArgs
+    int 3
+    ==
+    bnz create_box
+    txn NumAppArgs
+    int 4
+    ==
+    bnz replace_box
+    txna ApplicationArgs 0
+    txna ApplicationArgs 1
+    app_global_put
+    b approve
+create_box:
+    txna ApplicationArgs 1
+    txna ApplicationArgs 2
+    btoi
+    box_create
+    assert
+    b approve
+replace_box:
+    txna ApplicationArgs 1
+    txna ApplicationArgs 2
+    btoi
+    txna ApplicationArgs 3
+    box_replace
+approve:
+    int 1
+    return
+"""
+CLEAR_PROGRAM = """#pragma version 10
+    int 1
+    return
+"""
+# Legacy apps get every extra page, so any current program fits on update
+MAX_EXTRA_PROGRAM_PAGES = 3
+# Every box reference lets an app call read or write this many box bytes
+BOX_IO_BUDGET = 1024
+# App args are limited to 2048 bytes, so boxes are written in chunks
+BOX_WRITE_CHUNK_SIZE = 1024
+
 
 def unwrap_env_var(name: str) -> str:
     value = config(name)
@@ -39,3 +98,112 @@ def calc_amount_plus_fee(amount: int, multiples: int = 1) -> int:
     percent = (0.5 * multiples) * 100
     percentage = calc_contract_percentage(amount=amount, percent=percent)
     return int(math.ceil(percentage + amount))
+
+
+def price_box_reference(app_id: int, asset_id: int) -> tuple[int, bytes]:
+    """The box holding the cached oracle price of an asset"""
+    return (app_id, b"F" + asset_id.to_bytes(8, "big"))
+
+
+def price_oracle_box_reference(app_id: int) -> tuple[int, bytes]:
+    """The box holding the price oracle and its cache window"""
+    return (app_id, b"O")
+
+
+def fund_app_account(algod_client: AlgodClient, app_address: str) -> None:
+    """Funds an app account for the minimum balance of the boxes it creates"""
+    ensure_funded(
+        algod_client,
+        EnsureBalanceParameters(
+            account_to_fund=app_address, min_spending_balance_micro_algos=10_000_000
+        ),
+    )
+
+
+def compile_program(algod_client: AlgodClient, teal: str) -> bytes:
+    return base64.b64decode(algod_client.compile(teal)["result"])
+
+
+def send_transaction(
+    algod_client: AlgodClient, creator: Account, txn: transaction.Transaction
+) -> dict:
+    txid = algod_client.send_transaction(txn.sign(creator.private_key))
+    return transaction.wait_for_confirmation(algod_client, txid)
+
+
+def create_legacy_app(
+    algod_client: AlgodClient,
+    creator: Account,
+    global_byte_slices: int,
+    global_state: dict[bytes, bytes],
+    boxes: dict[bytes, bytes],
+) -> int:
+    """
+    Creates an app with the global schema of a legacy deployment and writes
+    its legacy global state and boxes, ready to be updated to the current
+    program.
+    """
+    create_txn = transaction.ApplicationCreateTxn(
+        sender=creator.address,
+        sp=algod_client.suggested_params(),
+        on_complete=transaction.OnComplete.NoOpOC,
+        approval_program=compile_program(algod_client, LEGACY_APPROVAL_PROGRAM),
+        clear_program=compile_program(algod_client, CLEAR_PROGRAM),
+        global_schema=transaction.StateSchema(
+            num_uints=0, num_byte_slices=global_byte_slices
+        ),
+        local_schema=transaction.StateSchema(num_uints=0, num_byte_slices=0),
+        extra_pages=MAX_EXTRA_PROGRAM_PAGES,
+    )
+    app_id: int = send_transaction(algod_client, creator, create_txn)[
+        "application-index"
+    ]
+    fund_app_account(algod_client, get_application_address(app_id))
+
+    calls: list[tuple[list[bytes | int], list[tuple[int, bytes]]]] = [
+        ([key, value], []) for key, value in global_state.items()
+    ]
+    for name, value in boxes.items():
+        box_references = [(app_id, name)] * max(
+            math.ceil(len(value) / BOX_IO_BUDGET), 1
+        )
+        calls.append(([b"create", name, len(value)], box_references))
+        calls.extend(
+            (
+                [
+                    b"replace",
+                    name,
+                    offset,
+                    value[offset : offset + BOX_WRITE_CHUNK_SIZE],
+                ],
+                box_references,
+            )
+            for offset in range(0, len(value), BOX_WRITE_CHUNK_SIZE)
+        )
+    for app_args, box_references in calls:
+        call_txn = transaction.ApplicationNoOpTxn(
+            sender=creator.address,
+            sp=algod_client.suggested_params(),
+            index=app_id,
+            app_args=app_args,
+            boxes=box_references,
+        )
+        send_transaction(algod_client, creator, call_txn)
+    return app_id
+
+
+def create_asset(
+    algod_client: AlgodClient, creator: Account, total: int, decimals: int
+) -> int:
+    """Creates a test asset held by the creator"""
+    create_txn = transaction.AssetCreateTxn(
+        sender=creator.address,
+        sp=algod_client.suggested_params(),
+        total=total,
+        decimals=decimals,
+        default_frozen=False,
+        unit_name="TEST",
+        asset_name="Test asset",
+    )
+    asset_id: int = send_transaction(algod_client, creator, create_txn)["asset-index"]
+    return asset_id
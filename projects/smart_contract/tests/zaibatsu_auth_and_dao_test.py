@@ -1,6 +1,7 @@
 import pytest
-from algokit_utils import Account, TransactionParameters
-from algosdk import atomic_transaction_composer, transaction
+from algokit_utils import Account, LogicError, TransactionParameters
+from algosdk import atomic_transaction_composer, encoding, transaction
+from algosdk.abi import ABIType
 from algosdk.v2client.algod import AlgodClient
 from folksfeedsdk.constants import TestnetAssetId
 
@@ -8,32 +9,168 @@ from smart_contracts.artifacts.zaibatsu_auth_and_dao.client import (
     ZaibatsuAuthAndDaoClient,
 )
 from smart_contracts.artifacts.zaibatsu_loan.client import ZaibatsuLoanClient
+from smart_contracts.helpers.events import decode_events
+from smart_contracts.helpers.fees import suggested_params_with_inner_fees
+from tests.utils import (
+    create_legacy_app,
+    price_box_reference,
+    price_oracle_box_reference,
+    send_transaction,
+)
 
 FOLKS_FEED_ORACLE_TESTNET_ID = 159512493
 
 
+def pool_ledger(
+    zaibatsu_auth_client: ZaibatsuAuthAndDaoClient,
+    depositor: str,
+    ledger_boxes: list[tuple[int, bytes]],
+) -> tuple[tuple[int, int], int]:
+    """The USDC pool total and the USDC deposit of the depositor"""
+    [total] = zaibatsu_auth_client.get_pool_totals(
+        assets=[TestnetAssetId.USDC],
+        transaction_parameters=TransactionParameters(boxes=ledger_boxes[:1]),
+    ).return_value
+    [deposit] = zaibatsu_auth_client.get_pool_deposits(
+        depositor=depositor,
+        assets=[TestnetAssetId.USDC],
+        transaction_parameters=TransactionParameters(boxes=ledger_boxes[1:]),
+    ).return_value
+    return total, deposit
+
+
+def pool_ledger_box_references(
+    zaibatsu_auth_client: ZaibatsuAuthAndDaoClient, asset_id: int, depositor: str
+) -> list[tuple[int, bytes]]:
+    """The asset total box and the depositor box of the pool ledger"""
+    asset = asset_id.to_bytes(8, "big")
+    deposit = asset + encoding.decode_address(depositor)
+    return [
+        (zaibatsu_auth_client.app_id, b"T" + asset),
+        (zaibatsu_auth_client.app_id, b"D" + deposit),
+    ]
+
+
 # @pytest.mark.skip()
 def test_update(zaibatsu_auth_client: ZaibatsuAuthAndDaoClient) -> None:
     zaibatsu_auth_client.update_update()
 
 
 @pytest.fixture(scope="session")
-def zai(zaibatsu_auth_client: ZaibatsuAuthAndDaoClient) -> int:
+def zai(
+    algod_client: AlgodClient, zaibatsu_auth_client: ZaibatsuAuthAndDaoClient
+) -> int:
     result = zaibatsu_auth_client.create_zaibatsu_token(
         transaction_parameters=TransactionParameters(
-            boxes=[(zaibatsu_auth_client.app_id, b"ZAI")]
+            suggested_params=suggested_params_with_inner_fees(
+                algod_client, "create_zaibatsu_token"
+            ),
+            boxes=[(zaibatsu_auth_client.app_id, b"ZAI")],
         )
     )
     return result.return_value
 
 
 # @pytest.mark.skip()
-def test_opt_contract_into_asset(zaibatsu_auth_client: ZaibatsuAuthAndDaoClient):
-    result1 = zaibatsu_auth_client.opt_contract_into_asset(asset=TestnetAssetId.USDC)
-    result2 = zaibatsu_auth_client.opt_contract_into_asset(asset=TestnetAssetId.USDt)
+def test_opt_contract_into_asset(
+    algod_client: AlgodClient, zaibatsu_auth_client: ZaibatsuAuthAndDaoClient
+):
+    transaction_parameters = TransactionParameters(
+        suggested_params=suggested_params_with_inner_fees(
+            algod_client, "opt_contract_into_asset"
+        )
+    )
+    result1 = zaibatsu_auth_client.opt_contract_into_asset(
+        asset=TestnetAssetId.USDC, transaction_parameters=transaction_parameters
+    )
+    result2 = zaibatsu_auth_client.opt_contract_into_asset(
+        asset=TestnetAssetId.USDt, transaction_parameters=transaction_parameters
+    )
     assert result1.return_value and result2.return_value
 
 
+def test_add_and_remove_admin(
+    localnet_auth_client: ZaibatsuAuthAndDaoClient,
+    localnet_account: Account,
+):
+    admin_box = (
+        localnet_auth_client.app_id,
+        b"A" + encoding.decode_address(localnet_account.address),
+    )
+    added = localnet_auth_client.add_admin(
+        account=localnet_account.address,
+        transaction_parameters=TransactionParameters(boxes=[admin_box]),
+    )
+    removed = localnet_auth_client.remove_admin(
+        account=localnet_account.address,
+        transaction_parameters=TransactionParameters(boxes=[admin_box]),
+    )
+    assert added.return_value and removed.return_value
+
+
+def test_migrate_legacy_admins(
+    localnet_algod_client: AlgodClient,
+    localnet_creator: Account,
+    localnet_account: Account,
+):
+    # An app deployed with the admins in a global AddressArray, then updated
+    legacy_admins = ABIType.from_string("address[]").encode([localnet_account.address])
+    app_id = create_legacy_app(
+        localnet_algod_client,
+        localnet_creator,
+        global_byte_slices=4,
+        global_state={b"admins": legacy_admins},
+        boxes={},
+    )
+    client = ZaibatsuAuthAndDaoClient(
+        localnet_algod_client, app_id=app_id, signer=localnet_creator
+    )
+    client.update_update()
+
+    admin_box = (app_id, b"A" + encoding.decode_address(localnet_account.address))
+    migrated = client.migrate_legacy_admins(
+        transaction_parameters=TransactionParameters(boxes=[admin_box]),
+    )
+    assert migrated.return_value == 1
+    assert localnet_algod_client.application_box_by_name(app_id, admin_box[1])
+
+    with pytest.raises(LogicError):
+        client.migrate_legacy_admins(
+            transaction_parameters=TransactionParameters(boxes=[admin_box]),
+        )
+
+
+# @pytest.mark.skip()
+def test_set_price_oracle(zaibatsu_auth_client: ZaibatsuAuthAndDaoClient):
+    result = zaibatsu_auth_client.set_price_oracle(
+        oracle=FOLKS_FEED_ORACLE_TESTNET_ID,
+        cache_window=5 * 60,
+        transaction_parameters=TransactionParameters(
+            boxes=[price_oracle_box_reference(zaibatsu_auth_client.app_id)]
+        ),
+    )
+    assert result.return_value
+
+
+# @pytest.mark.skip()
+def test_refresh_asset_prices(zaibatsu_auth_client: ZaibatsuAuthAndDaoClient):
+    assets = [TestnetAssetId.USDC, TestnetAssetId.USDt]
+    result = zaibatsu_auth_client.refresh_asset_prices(
+        assets=assets,
+        transaction_parameters=TransactionParameters(
+            foreign_apps=[FOLKS_FEED_ORACLE_TESTNET_ID],
+            boxes=[
+                price_oracle_box_reference(zaibatsu_auth_client.app_id),
+                *(
+                    price_box_reference(zaibatsu_auth_client.app_id, asset)
+                    for asset in assets
+                ),
+            ],
+        ),
+    )
+    assert result.return_value
+
+
 # @pytest.mark.skip()
 def test_set_service_contract_address(
     zaibatsu_auth_client: ZaibatsuAuthAndDaoClient,
@@ -53,9 +190,15 @@ def test_fund_pool(
 ):
     sp = algod_client.suggested_params()
     asset_amount = 2000
+    ledger_boxes = pool_ledger_box_references(
+        zaibatsu_auth_client, TestnetAssetId.USDC, creator_account.address
+    )
+    [(total_before, _depositors), deposit_before] = pool_ledger(
+        zaibatsu_auth_client, creator_account.address, ledger_boxes
+    )
     txn = transaction.AssetTransferTxn(
         sp=sp,
-        amt=asset_amount,
+        amt=asset_amount + asset_amount * 10 // 1000,
         sender=creator_account.address,
         receiver=zaibatsu_loan_client.app_address,
         index=TestnetAssetId.USDC,
@@ -67,9 +210,78 @@ def test_fund_pool(
     result = zaibatsu_auth_client.fund_pool(
         txn=txn,
         fund_amount=asset_amount,
-        folks_feed_oracle=FOLKS_FEED_ORACLE_TESTNET_ID,
         transaction_parameters=TransactionParameters(
-            boxes=[(zaibatsu_auth_client.app_id, b"ZAI")]
+            foreign_apps=[FOLKS_FEED_ORACLE_TESTNET_ID],
+            boxes=[
+                price_oracle_box_reference(zaibatsu_auth_client.app_id),
+                price_box_reference(zaibatsu_auth_client.app_id, TestnetAssetId.USDC),
+                *ledger_boxes,
+            ],
         ),
     )
-    print(result.return_value)
+    assert result.return_value.amount == asset_amount
+    [event] = decode_events(result.tx_info["logs"])
+    assert event.name == "PoolFunded" and event.fields["amount"] == asset_amount
+
+    [(total, _depositors), deposit] = pool_ledger(
+        zaibatsu_auth_client, creator_account.address, ledger_boxes
+    )
+    assert total - total_before == deposit - deposit_before == asset_amount
+
+
+def test_approve_pool_vote(
+    localnet_algod_client: AlgodClient,
+    localnet_auth_client: ZaibatsuAuthAndDaoClient,
+    localnet_creator: Account,
+):
+    zai = localnet_auth_client.create_zaibatsu_token(
+        transaction_parameters=TransactionParameters(
+            suggested_params=suggested_params_with_inner_fees(
+                localnet_algod_client, "create_zaibatsu_token"
+            ),
+            boxes=[(localnet_auth_client.app_id, b"ZAI")],
+        )
+    ).return_value
+    opt_in_txn = transaction.AssetOptInTxn(
+        sender=localnet_creator.address,
+        sp=localnet_algod_client.suggested_params(),
+        index=zai,
+    )
+    send_transaction(localnet_algod_client, localnet_creator, opt_in_txn)
+    localnet_auth_client.transfer_zai(
+        to=localnet_creator.address,
+        asset_amount=10_000,
+        note="Votes",
+        transaction_parameters=TransactionParameters(
+            suggested_params=suggested_params_with_inner_fees(
+                localnet_algod_client, "transfer_zai"
+            ),
+            foreign_assets=[zai],
+        ),
+    )
+
+    proposal_id = 1
+    tally_box = (localnet_auth_client.app_id, b"V" + proposal_id.to_bytes(8, "big"))
+    # The same account votes twice, both votes are counted
+    for approve, vote_amount in [(True, 1000), (False, 400)]:
+        txn = transaction.AssetTransferTxn(
+            sp=localnet_algod_client.suggested_params(),
+            amt=vote_amount,
+            sender=localnet_creator.address,
+            receiver=localnet_auth_client.app_address,
+            index=zai,
+        )
+        localnet_auth_client.approve_pool_vote(
+            proposal_id=proposal_id,
+            approve=approve,
+            txn=atomic_transaction_composer.TransactionWithSigner(
+                txn=txn, signer=localnet_creator.signer
+            ),
+            transaction_parameters=TransactionParameters(boxes=[tally_box]),
+        )
+
+    [tally] = localnet_auth_client.get_vote_tallies(
+        proposal_ids=[proposal_id],
+        transaction_parameters=TransactionParameters(boxes=[tally_box]),
+    ).return_value
+    assert tally == [1000, 400, 2]